@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from typing import Optional
+
+from PyQt5 import QtCore, QtWidgets
+
+from retcal.config import GcodeConfig
+from retcal.estimate import Estimate, estimate
+
+SIZE_UNITS = ("B", "kB", "MB", "GB", "TB")
+
+# Shown for the values of configs that cannot be estimated
+NO_VALUE = "\u2014"
+
+
+def format_duration(seconds: float) -> str:
+    minutes = round(seconds / 60)
+    if minutes < 60:
+        return f"{minutes} min"
+    return f"{minutes // 60} h {minutes % 60:02d} min"
+
+
+def format_size(size: float) -> str:
+    for unit in SIZE_UNITS[:-1]:
+        if size < 1000:
+            break
+        size /= 1000
+    else:
+        unit = SIZE_UNITS[-1]
+    return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+
+class EstimateThread(QtCore.QThread):
+    """Estimates a config off the main thread.
+
+    The size takes time in proportion to the number of tests, so a tall
+    tower must not hold up the window.
+    """
+
+    # The estimate, or None if the config cannot be estimated
+    estimated = QtCore.pyqtSignal(object)
+
+    def __init__(self, config: GcodeConfig, parent=None):
+        super().__init__(parent)
+        self.config = config
+
+    def run(self):
+        try:
+            values = estimate(self.config)
+        except (ValueError, ArithmeticError):
+            # A speed or the filament diameter is 0
+            values = None
+        self.estimated.emit(values)
+
+
+class EstimatesPanel(QtWidgets.QWidget):
+    """Print time, filament and file size of the config in the form.
+
+    The values are computed from the config without generating the file, on
+    a thread. Only the last config set while a thread runs is estimated next.
+    """
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        layout = QtWidgets.QFormLayout(self)
+        self._values = {}
+        for name, label in (
+            ("time", "Print time"),
+            ("filament", "Filament"),
+            ("lines", "Lines"),
+            ("size", "File size"),
+        ):
+            value = QtWidgets.QLabel(NO_VALUE)
+            value.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+            layout.addRow(label, value)
+            self._values[name] = value
+        self._values["time"].setToolTip(
+            "Moves at their feedrate, without acceleration, heating or homing"
+        )
+        self._thread = None
+        self._pending = None
+
+    def set_config(self, config: GcodeConfig):
+        if config.num_tests < 1 or config.layers_per_test < 1:
+            self._pending = None
+            self.show_estimate(None)
+            return
+        self._pending = config
+        if self._thread is None:
+            self._start()
+
+    def stop(self):
+        """Drop the pending config and wait for the running estimate."""
+        self._pending = None
+        if self._thread is not None:
+            self._thread.wait()
+
+    def _start(self):
+        self._thread = EstimateThread(self._pending, self)
+        self._pending = None
+        self._thread.estimated.connect(self._estimated)
+        self._thread.start()
+
+    def _estimated(self, values: Optional[Estimate]):
+        self._thread.wait()
+        self._thread.deleteLater()
+        self._thread = None
+        if self._pending is not None:
+            # The form changed meanwhile, this estimate is already stale
+            self._start()
+        else:
+            self.show_estimate(values)
+
+    def show_estimate(self, values: Optional[Estimate]):
+        if values is None:
+            for label in self._values.values():
+                label.setText(NO_VALUE)
+            return
+        self._values["time"].setText(format_duration(values.seconds))
+        self._values["filament"].setText(
+            f"{values.filament_mm / 1000:.2f} m, {values.filament_g:.1f} g"
+        )
+        self._values["lines"].setText(f"{values.lines:,}")
+        self._values["size"].setText(format_size(values.bytes))
@@ -1,24 +1,171 @@
 # -*- coding: utf-8 -*-
 
+import os
+import sys
+
 from PyQt5 import QtCore, QtGui, QtWidgets
+from RetCalEstimates import EstimatesPanel
+from RetCalPreview import ToolpathPreview
 from RetCalui import Ui_MainWindow
 
-from retcal.generate_ret_cal import GcodeConfig, generate_retraction_calibration
+from retcal import FrozenGcodeConfig
+from retcal.generate_ret_cal import GcodeConfig, iter_retraction_calibration_bytes
+from retcal.sinks import FileSink, GzipSink
+from retcal.stats import GenerationStats
 
+GCODE_FILTER = "Gcode (*.gcode)"
+GZIP_FILTER = "Compressed Gcode (*.gcode.gz)"
 
-def button_clicked(ui: Ui_MainWindow):
-    name = QtWidgets.QFileDialog.getSaveFileName(
-        ui.centralwidget, "Save Gcode", filter="(*.gcode)"
-    )
+# Wait after the last edit of the form before updating the preview and the
+# estimates, in ms
+DEBOUNCE_MS = 150
 
-    # Return if no file name
-    if len(name[0]) == 0:
-        return
+# Picture of the tower, next to this file or unpacked by PyInstaller
+TOWER_IMAGE = os.path.join(
+    getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))), "Capture.JPG"
+)
 
-    filename = name[0]
 
-    # Get config
-    config = GcodeConfig(
+class LazyPixmap(QtCore.QObject):
+    """Loads the image of a label the first time the label is painted.
+
+    The label is sized from the image header right away so the layout does
+    not move when the image arrives.
+    """
+
+    def __init__(self, label: QtWidgets.QLabel, path: str):
+        super().__init__(label)
+        self.path = path
+        size = QtGui.QImageReader(path).size()
+        if size.isValid():
+            margin = 2 * label.margin()
+            label.setMinimumSize(size + QtCore.QSize(margin, margin))
+        label.installEventFilter(self)
+
+    def eventFilter(self, label, event) -> bool:
+        if event.type() == QtCore.QEvent.Paint:
+            label.removeEventFilter(self)
+            label.setPixmap(QtGui.QPixmap(self.path))
+        return False
+
+
+class GenerationThread(QtCore.QThread):
+    """Generates and writes a file off the main thread.
+
+    Reports progress by tower layers done and stops, removing the partial
+    file, once an interruption is requested.
+    """
+
+    # Tower layers done, total
+    progressed = QtCore.pyqtSignal(int, int)
+    # Status message once the file is saved, cancelled or failed
+    ended = QtCore.pyqtSignal(str)
+
+    def __init__(self, config: FrozenGcodeConfig, filename: str, compress: bool, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.filename = filename
+        self.compress = compress
+        self._percent = -1
+
+    def run(self):
+        stats = GenerationStats()
+        try:
+            sink = FileSink(self.filename)
+        except OSError as error:
+            # Nothing was written, leave whatever is there alone
+            self.ended.emit(f"Failed to save {self.filename}: {error}")
+            return
+        try:
+            if self.compress:
+                sink = GzipSink(sink)
+            with sink:
+                chunks = iter_retraction_calibration_bytes(
+                    self.config, stats=stats, progress=self._progress
+                )
+                for chunk in chunks:
+                    if self.isInterruptionRequested():
+                        break
+                    sink.write(chunk)
+        except Exception as error:
+            self.ended.emit(f"Failed to save {self.filename}: {error}{self._remove()}")
+            return
+
+        if self.isInterruptionRequested():
+            self.ended.emit(f"Cancelled{self._remove()}")
+        else:
+            self.ended.emit(f"Saved {self.filename}: {stats.summary()}")
+
+    def _progress(self, done: int, total: int):
+        # Only signal when the percentage changes, tall towers have many layers
+        percent = done * 100 // total if total else 100
+        if percent != self._percent:
+            self._percent = percent
+            self.progressed.emit(done, total)
+
+    def _remove(self) -> str:
+        """Remove the partial file, returning a note if it could not be."""
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            return f" (could not remove the partial file: {error})"
+        return ""
+
+
+class GenerationProgress:
+    """Progress bar and Cancel button in the status bar."""
+
+    def __init__(self, ui: Ui_MainWindow):
+        self.ui = ui
+        self.thread = None
+        self.bar = QtWidgets.QProgressBar()
+        self.bar.setMaximumWidth(200)
+        self.cancel_button = QtWidgets.QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel)
+        ui.statusbar.addPermanentWidget(self.bar)
+        ui.statusbar.addPermanentWidget(self.cancel_button)
+        self._set_running(False)
+
+    def start(self, config: FrozenGcodeConfig, filename: str, compress: bool):
+        self.thread = GenerationThread(config, filename, compress)
+        self.thread.progressed.connect(self._progressed)
+        self.thread.ended.connect(self._ended)
+        self.bar.setValue(0)
+        self._set_running(True)
+        self.ui.statusbar.showMessage(f"Saving {filename}...")
+        self.thread.start()
+
+    def cancel(self):
+        if self.thread is not None:
+            self.thread.requestInterruption()
+
+    def stop(self):
+        """Cancel the generation and wait for it to end."""
+        if self.thread is not None:
+            self.thread.requestInterruption()
+            self.thread.wait()
+
+    def _progressed(self, done: int, total: int):
+        self.bar.setMaximum(total)
+        self.bar.setValue(done)
+
+    def _ended(self, message: str):
+        self.thread.wait()
+        self.thread = None
+        self._set_running(False)
+        self.ui.statusbar.showMessage(message)
+
+    def _set_running(self, running: bool):
+        self.bar.setVisible(running)
+        self.cancel_button.setVisible(running)
+        self.ui.genGcode.setEnabled(not running)
+
+
+def config_from_ui(ui: Ui_MainWindow) -> GcodeConfig:
+    """Build a GcodeConfig from the fields of the window"""
+    return GcodeConfig(
         # Start Gcode Retraction Distance
         retraction_dist_init=float(ui.startRetractiondistance.text()),
         retraction_dist_delta=float(ui.incrementRetractiondistance.text()),
@@ -45,24 +192,113 @@ def button_clicked(ui: Ui_MainWindow):
         custom_gcode=str(ui.customGcode.toPlainText()),
     )
 
-    with open(filename, "w") as file:
-        file.write("\n".join(generate_retraction_calibration(config)) + "\n")
 
+class ConfigWatcher(QtCore.QObject):
+    """Emits the config of the form once its fields stop changing."""
 
-def main():
-    import sys
+    changed = QtCore.pyqtSignal(object)
+
+    def __init__(self, ui: Ui_MainWindow, delay: int = DEBOUNCE_MS):
+        super().__init__(ui.centralwidget)
+        self.ui = ui
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._emit)
+        for edit in ui.centralwidget.findChildren(QtWidgets.QLineEdit):
+            edit.textChanged.connect(self.schedule)
+        ui.customGcode.textChanged.connect(self.schedule)
+
+    def schedule(self, *_):
+        self._timer.start()
+
+    def _emit(self):
+        try:
+            # Freezing computes the derived values, which fail on a field
+            # being edited through 0
+            config = config_from_ui(self.ui).freeze()
+        except (ValueError, ArithmeticError):
+            # A field is being edited
+            return
+        self.changed.emit(config)
 
+
+def add_preview(window: QtWidgets.QMainWindow) -> ToolpathPreview:
+    """Dock the toolpath preview to the right of the form"""
+    # The form has a fixed size, give it to the central widget instead
+    form = window.minimumSize()
+    window.centralWidget().setMinimumWidth(form.width())
+    window.setMinimumSize(0, form.height())
+    window.setMaximumSize(QtWidgets.QWIDGETSIZE_MAX, QtWidgets.QWIDGETSIZE_MAX)
+
+    preview = ToolpathPreview()
+    dock = QtWidgets.QDockWidget("Preview", window)
+    dock.setObjectName("previewDock")
+    dock.setWidget(preview)
+    window.addDockWidget(QtCore.Qt.RightDockWidgetArea, dock)
+    window.resize(form.width() + preview.minimumWidth(), form.height())
+    return preview
+
+
+def add_estimates(window: QtWidgets.QMainWindow) -> EstimatesPanel:
+    """Dock the estimates of the print below the preview"""
+    estimates = EstimatesPanel()
+    dock = QtWidgets.QDockWidget("Estimates", window)
+    dock.setObjectName("estimatesDock")
+    dock.setWidget(estimates)
+    window.addDockWidget(QtCore.Qt.RightDockWidgetArea, dock)
+    return estimates
+
+
+def button_clicked(ui: Ui_MainWindow, progress: GenerationProgress):
+    name = QtWidgets.QFileDialog.getSaveFileName(
+        ui.centralwidget, "Save Gcode", filter=f"{GCODE_FILTER};;{GZIP_FILTER}"
+    )
+
+    # Return if no file name
+    if len(name[0]) == 0:
+        return
+
+    filename = name[0]
+    compress = filename.endswith(".gz") or name[1] == GZIP_FILTER
+    if compress and not filename.endswith(".gz"):
+        filename += ".gz"
+
+    try:
+        # Freezing computes the derived values, failing before the file is
+        # opened
+        config = config_from_ui(ui).freeze()
+    except (ValueError, ArithmeticError) as error:
+        ui.statusbar.showMessage(f"Invalid settings: {error}")
+        return
+
+    # Generate in the background
+    progress.start(config, filename, compress)
+
+
+def main():
     app = QtWidgets.QApplication(sys.argv)
     MainWindow = QtWidgets.QMainWindow()
 
     ui = Ui_MainWindow()
     ui.setupUi(MainWindow)
+    LazyPixmap(ui.label_13, TOWER_IMAGE)
+    progress = GenerationProgress(ui)
+    preview = add_preview(MainWindow)
+    estimates = add_estimates(MainWindow)
+    watcher = ConfigWatcher(ui)
+    watcher.changed.connect(preview.set_config)
+    watcher.changed.connect(estimates.set_config)
+    watcher.schedule()
 
     def _button_clicked():
         """Wrapper for gen_gcode()"""
-        return button_clicked(ui)
+        return button_clicked(ui, progress)
 
     ui.genGcode.clicked.connect(_button_clicked)
+    # Don't quit with a thread still writing the file
+    app.aboutToQuit.connect(progress.stop)
+    app.aboutToQuit.connect(estimates.stop)
     MainWindow.show()
 
     sys.exit(app.exec_())
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+from typing import Optional
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from retcal.config import GcodeConfig
+from retcal.toolpath import SectionPath, toolpath
+
+# Colors of the extrusions of each section, and of travel moves
+SECTION_COLORS = {
+    "raft": QtGui.QColor(90, 140, 200),
+    "tower": QtGui.QColor(220, 110, 40),
+}
+TRAVEL_COLOR = QtGui.QColor(170, 170, 170)
+BACKGROUND = QtGui.QColor(250, 250, 250)
+
+# Space around each view, in pixels
+MARGIN = 12
+
+
+def _fit(rect: QtCore.QRectF, x0: float, y0: float, x1: float, y1: float) -> QtGui.QTransform:
+    """Map the box (x0, y0)-(x1, y1), Y up, into the middle of a rectangle."""
+    width = max(x1 - x0, 1e-6)
+    height = max(y1 - y0, 1e-6)
+    scale = min(rect.width() / width, rect.height() / height)
+    dx = rect.left() + (rect.width() - width * scale) / 2
+    dy = rect.bottom() - (rect.height() - height * scale) / 2
+    return QtGui.QTransform(scale, 0, 0, -scale, dx - x0 * scale, dy + y0 * scale)
+
+
+class ToolpathPreview(QtWidgets.QWidget):
+    """Top-down and side view of the toolpath.
+
+    Each section is rendered once per view into its own pixmap, and only
+    rendered again when its moves or the scale of the view change, so
+    painting the widget is a few pixmap copies however tall the tower is.
+    """
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        self.sections = {}
+        # (section name, view) -> (key, pixmap)
+        self._rendered = {}
+        self.setMinimumSize(360, 200)
+
+    def set_config(self, config: GcodeConfig):
+        if config.num_tests < 1 or config.layers_per_test < 1:
+            # No tower to draw, rather than the last one
+            self.sections = {}
+        else:
+            try:
+                self.sections = toolpath(config)
+            except ArithmeticError:
+                # A zero filament diameter, say, while the form is being edited
+                self.sections = {}
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), BACKGROUND)
+        if not self.sections:
+            return
+
+        top, side = self._views()
+        for name, section in self.sections.items():
+            painter.drawPixmap(0, 0, self._pixmap(name, "top", section, top))
+            painter.drawPixmap(0, 0, self._pixmap(name, "side", section, side))
+        painter.setPen(QtGui.QColor(90, 90, 90))
+        painter.drawText(MARGIN, MARGIN, "Top")
+        painter.drawText(self.width() // 2 + MARGIN, MARGIN, "Side")
+
+    def _views(self) -> tuple:
+        """Transforms of the top and side views for the current sections."""
+        half = self.width() / 2
+        area = QtCore.QRectF(MARGIN, MARGIN * 2, half - MARGIN * 2, self.height() - MARGIN * 3)
+
+        bounds = [section.bounds() for section in self.sections.values()]
+        x0 = min(b[0] for b in bounds)
+        y0 = min(b[1] for b in bounds)
+        x1 = max(b[2] for b in bounds)
+        y1 = max(b[3] for b in bounds)
+        z1 = max(section.z_max() for section in self.sections.values())
+
+        top = _fit(area, x0, y0, x1, y1)
+        side = _fit(area.translated(half, 0), x0, 0.0, x1, z1)
+        return top, side
+
+    def _pixmap(self, name: str, view: str, section: SectionPath, transform: QtGui.QTransform) -> QtGui.QPixmap:
+        ratio = self.devicePixelRatioF()
+        key = (section, self.size(), ratio, transform)
+        rendered = self._rendered.get((name, view))
+        if rendered is not None and rendered[0] == key:
+            return rendered[1]
+
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setTransform(transform)
+        color = SECTION_COLORS.get(name, QtGui.QColor(0, 0, 0))
+        if view == "top":
+            self._draw_top(painter, section, color)
+        else:
+            self._draw_side(painter, section, color, transform.m22())
+        painter.end()
+
+        self._rendered[(name, view)] = (key, pixmap)
+        return pixmap
+
+    def _draw_top(self, painter: QtGui.QPainter, section: SectionPath, color: QtGui.QColor):
+        travels = [QtCore.QLineF(m.x0, m.y0, m.x1, m.y1) for m in section.moves if not m.extruding]
+        extrusions = [QtCore.QLineF(m.x0, m.y0, m.x1, m.y1) for m in section.moves if m.extruding]
+        painter.setPen(_pen(TRAVEL_COLOR))
+        painter.drawLines(travels)
+        painter.setPen(_pen(color, 1.5))
+        painter.drawLines(extrusions)
+
+    def _draw_side(self, painter: QtGui.QPainter, section: SectionPath, color: QtGui.QColor, scale: float):
+        painter.setPen(_pen(color))
+        for stack in section.layers:
+            # Fill stacks whose layers are closer than two pixels
+            if stack.layers > 1 and abs(stack.dz * scale) < 2:
+                painter.fillRect(
+                    QtCore.QRectF(stack.x_min, stack.z, stack.x_max - stack.x_min, stack.top - stack.z),
+                    color,
+                )
+                continue
+            painter.drawLines([
+                QtCore.QLineF(stack.x_min, z, stack.x_max, z)
+                for z in (stack.z + n * stack.dz for n in range(stack.layers))
+            ])
+
+
+def _pen(color: QtGui.QColor, width: float = 1.0) -> QtGui.QPen:
+    # Cosmetic pens keep their width in pixels whatever the scale
+    pen = QtGui.QPen(color, width)
+    pen.setCosmetic(True)
+    return pen
@@ -1,7716 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.13.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x01\x24\xb3\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x78\x00\
-\x78\x00\x00\xff\xe1\x00\x22\x45\x78\x69\x66\x00\x00\x4d\x4d\x00\
-\x2a\x00\x00\x00\x08\x00\x01\x01\x12\x00\x03\x00\x00\x00\x01\x00\
-\x01\x00\x00\x00\x00\x00\x00\xff\xfe\x00\x1f\x4c\x45\x41\x44\x20\
-\x54\x65\x63\x68\x6e\x6f\x6c\x6f\x67\x69\x65\x73\x20\x49\x6e\x63\
-\x2e\x20\x56\x31\x2e\x30\x31\x00\xff\xdb\x00\x43\x00\x02\x01\x01\
-\x02\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x03\x05\x03\x03\x03\
-\x03\x03\x06\x04\x04\x03\x05\x07\x06\x07\x07\x07\x06\x07\x07\x08\
-\x09\x0b\x09\x08\x08\x0a\x08\x07\x07\x0a\x0d\x0a\x0a\x0b\x0c\x0c\
-\x0c\x0c\x07\x09\x0e\x0f\x0d\x0c\x0e\x0b\x0c\x0c\x0c\xff\xdb\x00\
-\x43\x01\x02\x02\x02\x03\x03\x03\x06\x03\x03\x06\x0c\x08\x07\x08\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\xff\xc0\x00\x11\x08\x01\xf3\x02\x34\x03\x01\x22\x00\x02\
-\x11\x01\x03\x11\x01\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\
-\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\
-\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\
-\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\
-\x11\x05\x12\x21\x31\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\
-\x91\xa1\x08\x23\x42\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\
-\x09\x0a\x16\x17\x18\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\
-\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\
-\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\
-\x77\x78\x79\x7a\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\
-\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\
-\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\
-\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\
-\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\
-\x1f\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\
-\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\
-\x00\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\
-\x01\x02\x77\x00\x01\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\
-\x07\x61\x71\x13\x22\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\
-\x33\x52\xf0\x15\x62\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\
-\x19\x1a\x26\x27\x28\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\
-\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\
-\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\
-\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\
-\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\
-\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\
-\xd8\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\
-\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\
-\x00\x3f\x00\xfd\xfc\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x64\x93\x88\xcf\x34\x00\xfa\x29\xbe\
-\x60\xa5\x56\xdd\x40\x0b\x45\x31\xa6\x08\xdc\xe7\x8a\x3c\xe1\x8a\
-\x00\x7d\x14\xdf\x37\x9a\x6f\xda\x06\x68\x02\x4a\x29\x9e\x77\xff\
-\x00\xaa\x86\x9b\x6f\x63\xf9\x50\x03\xe8\xa6\x19\xb8\xa4\xfb\x40\
-\xc5\x00\x49\x45\x46\x2e\x05\x28\x9b\x27\xa1\xa0\x07\xd1\x4d\x0f\
-\x91\x42\xcb\x9e\xc6\x80\x1d\x45\x37\x7f\xfb\x2d\x47\x9a\x28\x01\
-\xd4\x53\x7c\xda\x04\xbb\xbf\xcf\x4a\x00\x75\x14\xcf\x37\x8f\xba\
-\x69\x4c\xa0\x0a\x00\x75\x14\xdf\x36\x8f\x33\x8e\x86\x80\x1d\x45\
-\x37\xcd\xf6\x34\x09\x73\xff\x00\xeb\xa2\xe0\x3a\x8a\x8f\xed\x0b\
-\xfe\x4d\x2f\x9d\x40\x0f\xa2\x99\xe7\x51\xe7\x0a\x00\x7d\x14\xdf\
-\x35\x68\xf3\x96\x80\x1d\x45\x30\x4d\x9a\x5f\x34\x7b\xd0\x03\xa8\
-\xa6\x87\xc9\xe8\x68\xf3\x57\xdf\xf2\xa0\x07\x51\x4d\xf3\x86\x7a\
-\x1a\x04\x80\xff\x00\xf5\xe8\x01\xd4\x53\x77\xf1\x9e\xd4\x09\x73\
-\xeb\x40\x0e\xa2\x9b\xe6\xf3\xde\x8f\x33\x3d\x9b\xf2\xa0\x07\x51\
-\x4d\xf3\x3f\xc8\x34\xd3\x3e\x1b\x18\x34\x01\x25\x14\x03\x91\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x15\xcc\x7c\x67\xd5\x2e\x34\x2f\x84\x7e\x2a\
-\xbe\xb3\x9a\x4b\x6b\xeb\x3d\x1e\xee\x7b\x79\xa3\xfb\xd1\x3a\xc2\
-\xec\xac\x33\xc6\x41\x19\xae\x99\x86\x6b\x94\xf8\xe2\x33\xf0\x67\
-\xc5\xdf\xf6\x04\xbc\xe3\xd7\xf7\x0f\x4a\x52\x49\x5d\x86\xe7\xe3\
-\xa5\x97\xed\xf5\xf1\xd1\xa0\x46\x93\xe2\x97\x89\xb3\xb4\x12\x31\
-\x6f\xff\x00\xc6\xaa\x2b\x8f\xdb\xdf\xe3\xa1\xc9\x5f\x8a\x7e\x28\
-\x5e\x7f\xe9\x87\xff\x00\x1b\xaf\x35\xd4\xa6\xb5\xd1\x6d\x96\x49\
-\xa6\x55\xda\xb9\x23\xd0\x62\xb8\x1f\x17\xfc\x7d\xd2\x7c\x3c\x8d\
-\xb6\x48\xda\x45\xec\x0f\x22\xbe\x57\x15\xc5\x38\x7a\x7e\xed\x2b\
-\xc9\xf9\x1e\x8d\x3c\x0c\x9e\xb2\xd1\x1e\xdb\xe3\x3f\xf8\x28\x7f\
-\xc7\x4d\x1f\x4b\x92\x6f\xf8\x5b\x5e\x2a\x87\x60\xe3\x69\x83\x3f\
-\x5e\x62\xaf\x8f\x3e\x3b\x7f\xc1\x69\xff\x00\x69\xed\x03\xc4\x12\
-\x5a\xe9\x3f\x1d\x3c\x71\x0f\xcc\x46\xd4\xfb\x27\x1f\xf9\x00\xd7\
-\x1b\xf1\x8f\xf6\x94\xbb\xf1\x8d\xf3\xe9\xda\x6c\x6c\xd2\x48\x76\
-\x83\xb4\xf7\xf7\xcf\xd6\x8f\x82\xdf\xb1\xdf\xfc\x26\x17\xdf\xda\
-\x3a\xb2\xb3\xc9\x2f\xcc\x4b\x1c\xd6\x52\xe2\x28\x42\x97\xb4\xc4\
-\xfb\xaf\xa2\xea\x5c\x70\xee\x4e\xd4\xd1\x36\x81\xff\x00\x05\x79\
-\xfd\xb4\x3c\x4f\x20\x5b\x7f\x8f\x3f\x10\xb6\xb1\xe0\x91\x67\xcf\
-\xfe\x4b\xd7\xbb\x7c\x1d\xff\x00\x82\x97\xfe\xd5\xa9\x6e\xaf\xad\
-\x7c\x6e\xf1\x9d\xe7\x4c\xf9\x82\xd7\xff\x00\x8c\xd4\xda\x4f\xc0\
-\xed\x0f\xc1\x56\x4a\xa9\x1a\xb4\x80\x63\x81\xd3\xf4\xab\x36\x1e\
-\x06\xfb\x7c\x9b\x63\xb7\x09\x1b\x1c\x1d\xab\x5f\x07\xc4\x5c\x61\
-\x5a\x74\x1a\xa2\xdc\x57\x7b\xd9\x9e\xbe\x0f\x05\x15\x3f\xde\x24\
-\xcf\x45\xd2\x7f\xe0\xa9\xdf\x1e\x26\xbb\x58\x25\xf8\xa7\xe2\x82\
-\x7b\x9f\xf4\x7f\xfe\x35\x5b\x9e\x23\xff\x00\x82\x91\x7c\x79\xb4\
-\xb1\x59\x23\xf8\xa5\xe2\x94\xdc\x3a\x81\x01\xff\x00\xda\x55\xc1\
-\xf8\x7b\xe0\x2d\xbc\x57\x42\xe2\x4c\x2b\x2f\x38\x23\xa5\x5a\xf1\
-\x7f\x87\xec\xa1\xb0\xf2\x55\x94\xb4\x7c\x6d\x1d\xb8\xaf\xc9\x65\
-\xc5\x18\xd9\x54\x5c\x98\x8a\x96\xff\x00\x1c\xbf\xcc\xf7\xe9\xd1\
-\xc3\xc5\xdf\xd9\xc7\xee\x5f\xe4\x68\x2f\xfc\x14\xf3\xe3\xf1\x1f\
-\xf2\x56\xbc\x57\xff\x00\x92\xff\x00\xfc\x6a\xb3\xb5\x8f\xf8\x29\
-\xef\xed\x11\x1a\xfe\xe7\xe2\xf7\x8b\x17\x9e\x30\x2d\xbf\xf8\xd5\
-\x78\xff\x00\x89\xa1\x1a\x7d\xdc\x8b\xb9\x76\xe7\xd2\xb2\xae\x6e\
-\xa1\x68\x59\xda\x41\xd3\xb5\x7b\xd8\x4c\xf3\x30\x55\x23\x27\x5e\
-\x76\xff\x00\x14\xbf\xcc\x2b\x61\xe8\xbf\x79\x42\x2b\xe4\xbf\xc8\
-\xf6\x4d\x57\xfe\x0a\xa9\xfb\x43\x69\xda\x43\x48\x7e\x30\x78\xb0\
-\xc9\xd0\x1f\xf4\x7f\xfe\x35\x5e\x7b\xe1\xbf\xf8\x2c\x7f\xed\x35\
-\xa8\x78\xb7\xec\xd2\x7c\x64\xf1\x71\xb7\xcf\x42\x96\xbf\xcf\xc9\
-\xaf\x17\xf1\xdf\x8e\x52\xc8\x18\xd4\x64\x0e\x38\xf4\xaf\x3f\x87\
-\xc4\xc6\x0b\xcf\x36\x14\x3b\xb3\x9f\x97\xad\x7f\x42\x65\x78\xe8\
-\xba\x10\x69\xb6\xda\xea\xff\x00\xcc\xf8\x9c\x55\x37\x29\x3b\xa4\
-\xbd\x11\xfa\x71\xe0\x4f\xf8\x28\xbf\xc7\x2d\x66\xc2\x37\xb8\xf8\
-\xb1\xe2\x86\x66\xeb\x93\x00\xff\x00\xda\x75\xd7\x45\xff\x00\x05\
-\x13\xf8\xb1\xa7\xaf\xef\xfe\x2a\x78\x92\x4d\xbe\xad\x07\x3f\xf9\
-\x0e\xbf\x33\xf4\x7f\x8e\x1a\xc5\x8d\x9f\x97\x1c\x52\x1c\xf6\x20\
-\x9a\xad\xa8\xfc\x54\xf1\x36\xb4\xc4\x2e\xe8\xd5\xb8\x3d\x6b\xde\
-\xf6\x8a\xdb\x9e\x7f\x29\xfa\x4d\xad\xff\x00\xc1\x57\x3e\x25\xe8\
-\xca\xc3\xfe\x16\x47\x88\x1b\x1d\x3e\x68\x0e\x7f\xf1\xca\xe4\x35\
-\x7f\xf8\x2b\x9f\xc6\xad\x41\xca\xe9\xff\x00\x11\x3c\x43\xbb\x3d\
-\x15\x60\xe3\xff\x00\x21\xd7\xc1\x3a\x55\xdd\xd4\x8f\xe6\x5f\x4d\
-\x2c\x9c\x81\x8e\xd5\xe8\x1e\x15\xf8\x95\x67\xa0\x6d\xd9\x0c\x7c\
-\x01\x82\xcb\xfc\xea\x7d\xa1\x5c\x87\xd5\x87\xfe\x0a\x1d\xfb\x4a\
-\x6b\x16\xcd\x22\xfc\x56\xf1\x4d\x9a\xe3\xae\x2d\x87\xfe\xd2\xaf\
-\x26\xf8\xa9\xff\x00\x05\x6e\xfd\xa1\x3c\x00\xce\xb2\xfc\x72\xf1\
-\x82\x48\xa4\x90\x03\x5b\x74\xfa\x79\x35\xe6\x5f\x12\x3f\x68\xdb\
-\xab\x8d\x2d\xad\xb4\xf8\xda\x49\x98\x60\x2a\x29\x63\xf9\x0a\xf2\
-\x0d\x1f\xf6\x47\xf8\x85\xf1\xd7\x58\x6b\xcb\xeb\x6f\xec\xeb\x39\
-\x9b\x26\x5b\x96\x0b\xf2\xf5\xc8\x1c\xfe\x55\xe5\xe6\x59\xf6\x0b\
-\x01\x4f\xda\x63\x2a\xa8\x2f\x37\xfa\x6e\xca\xa7\x42\x75\x1d\xa1\
-\x16\xce\xfe\xf3\xfe\x0b\xb1\xfb\x4e\xb6\xb1\xe5\xc3\xf1\xd7\xc6\
-\xde\x5e\x47\xfc\xfa\x73\xff\x00\x90\x2b\xb8\xf0\x9f\xfc\x16\x77\
-\xf6\x9b\xba\xd9\x23\x7c\x6c\xf1\x94\xc3\x00\x91\x27\xd9\x48\xff\
-\x00\xd1\x35\x5f\xe1\x2f\xfc\x13\xa3\xc1\x9e\x08\xb8\x86\xf3\x5c\
-\x96\x6d\x6a\xf5\x70\xec\xa1\x82\xc2\x1b\xd3\x00\x64\xfe\x75\xee\
-\x37\xbf\xb3\xb7\xc3\x7f\x19\xe8\xe9\x6f\x27\x87\x61\xd3\x5e\x11\
-\xb4\x4d\x69\xf2\x37\x1e\xbd\x6b\xf2\xec\x57\x8c\xd9\x3d\x3c\x4f\
-\xb2\xa6\xa7\x28\xff\x00\x32\x5a\x7d\xdb\xb3\xd5\xa7\x92\xd7\x70\
-\xe6\x69\x2f\x21\x7e\x10\x7f\xc1\x5f\xbe\x3c\x78\x97\x54\x4b\x5b\
-\xef\x8a\x9e\x26\x6e\x70\x49\x5b\x7e\x7f\x11\x15\x7d\x2b\xe1\xef\
-\xdb\x9b\xe2\xf6\xa1\xa6\x47\x27\xfc\x2c\x8f\x11\x48\xcc\xb9\x3c\
-\xc3\xff\x00\xc6\xeb\xe3\x4d\x53\xf6\x13\x1a\x65\xd8\xbb\xf0\xa6\
-\xbc\xb2\x3a\x9d\xc2\x0b\xa1\xb4\xfa\xe3\x38\x15\xd3\xf8\x36\x6f\
-\x17\x7c\x38\x68\xed\xf5\xad\x32\xe3\xcb\x5c\xaf\x9d\x1e\x5d\x1b\
-\xdc\x10\x6b\xed\xb2\x5e\x3a\xca\x33\x1b\x7b\x0a\xca\xfd\x9e\x8f\
-\xee\x67\x05\x6c\x15\x5a\x6f\xde\x89\xef\x3f\x19\x3f\xe0\xa1\x3f\
-\x1a\xbc\x33\xa0\xcb\x25\xa7\xc4\xcf\x12\x41\x20\x19\x0c\xbe\x46\
-\x7f\x58\xeb\xe3\x8f\x16\x7f\xc1\x5f\x3f\x69\xf8\x75\xa7\x58\x3e\
-\x37\x78\xda\x28\xd4\xfd\xd5\x16\xb8\x1c\xff\x00\xd7\x1a\xee\x3e\
-\x3f\xf8\xbc\x6b\x5a\x03\xac\x21\xb7\xb2\x81\x8c\x1e\x6b\xe4\xdd\
-\x4b\xc2\xf7\x4f\xa8\x48\xcd\x1e\x77\x37\x39\xaf\x57\x34\xc6\x4f\
-\x92\xd4\x9b\xf9\x1a\x61\x29\xc5\xbf\x78\xfb\x27\xf6\x62\xff\x00\
-\x82\xa3\x7e\xd1\x9e\x29\xd6\xc8\xd5\xbe\x32\x78\xba\xf2\x23\x9c\
-\x24\xa2\xdb\xd7\xda\x1a\xfa\xe3\x4f\xfd\xbd\x3e\x29\xbd\x8a\x79\
-\x9e\x3e\xd7\x19\xb1\x9c\xe6\x1e\x7f\xf1\xca\xfc\xb1\xf8\x51\xad\
-\x5d\xf8\x3e\xf7\x7a\xc7\xf4\xaf\x68\xb0\xf8\xed\x78\x60\x40\xc3\
-\x3c\x74\xe7\x8f\xd6\xbe\x77\xfb\x53\x11\x0d\x1b\x7f\x7b\x3b\x65\
-\x85\x84\xb6\x47\xdc\x8f\xfb\x7b\x7c\x54\x1f\xf3\x3f\x6b\x83\xfe\
-\xfc\xff\x00\xf1\xba\x8c\xfe\xde\xbf\x15\x93\xaf\x8f\xb5\xdf\xaf\
-\xee\x7f\xf8\xdd\x7c\x52\xdf\x1d\x66\x3f\x7b\x70\xc7\x5e\xbc\xfe\
-\xb4\xf4\xf8\xeb\x26\xec\x33\x7d\x71\x9f\xf1\xaa\x8e\x73\x5b\x66\
-\xd9\x1f\x52\x8a\x3e\xd4\x5f\xdb\xe7\xe2\xb6\x7f\xe4\x7e\xd7\x3e\
-\x6f\xfa\xe3\xc7\xfe\x43\xa7\xff\x00\xc3\x7a\x7c\x57\x61\xc7\x8f\
-\x75\xdf\xae\x21\xff\x00\xe3\x75\xf1\x6a\xfc\x76\x08\x46\x59\xb1\
-\xfe\xf1\xab\x09\xf1\xd2\x17\xf9\x9a\x41\xff\x00\x7d\x56\xab\x3a\
-\xa9\xb3\x6c\x9f\xa9\x2e\xc7\xd8\xcf\xfb\x7a\x7c\x57\x8c\xff\x00\
-\xc8\xfd\xaf\x7f\xe4\x1e\x7f\xf2\x1d\x31\xbf\x6f\x8f\x8b\x0d\xf7\
-\x7c\x7d\xae\x8f\xfb\xf3\xff\x00\xc6\xeb\xe4\x24\xf8\xdb\x0c\x8b\
-\xf3\x49\xbb\xd3\x39\xff\x00\x1a\x70\xf8\xd1\x6d\xff\x00\x3d\x14\
-\x7f\xbc\x48\xfe\xb5\xbd\x3c\xda\xa3\xd2\xed\x99\xfd\x4e\xc7\xd7\
-\x13\x7e\xde\xbf\x16\x54\x7f\xc9\x40\xd7\x87\xe3\x0f\xff\x00\x1b\
-\xaa\x57\x3f\xf0\x50\x1f\x8b\x11\xff\x00\xcd\x44\xf1\x02\xff\x00\
-\xdf\x9f\xfe\x37\x5f\x28\x4f\xf1\xb6\xcd\x23\x3b\x66\x4c\xfb\x12\
-\x6b\x9c\xf1\x07\xc6\x89\x27\x52\xb6\xff\x00\xc5\xd3\xaf\xf8\xd7\
-\xa9\x85\xad\x8a\xa8\xf4\xb9\x85\x4a\x30\x8a\xd4\xfa\xf3\x54\xff\
-\x00\x82\x8e\xfc\x56\xb5\x43\xff\x00\x17\x23\xc4\x2b\x8f\xfa\xe1\
-\xff\x00\xc4\x57\x1b\xe2\x3f\xf8\x2a\xbf\xc5\xad\x38\x3a\xc3\xf1\
-\x33\xc4\x85\x97\xd0\xc1\xff\x00\xc6\xeb\xe4\x5d\x5b\xc5\x77\xda\
-\xb6\xef\x36\x56\x8d\x4f\x72\xdd\x3f\x5a\xe5\xbc\x43\xe3\x7d\x3f\
-\x41\x8d\xa4\xba\xba\x56\x65\xed\x8e\xb5\xee\x53\xa7\x38\xfb\xd5\
-\x19\xcb\x2e\x5e\x87\xd4\x7a\xff\x00\xfc\x15\x87\xe3\xed\xf3\x9f\
-\xb2\x7c\x54\xf1\x54\x2a\x3b\xa8\xb6\xc1\xff\x00\xc8\x55\x81\x75\
-\xff\x00\x05\x55\xfd\xa1\xac\x14\xc9\x71\xf1\xa7\xc5\xcb\x91\x9d\
-\xab\xf6\x6e\x3f\xf2\x0d\x7c\x73\xe2\x0f\x8f\x9f\x6d\x9d\xa1\xd3\
-\xd1\x80\x1d\x5f\x07\x1f\xce\x9f\xe1\xcb\xb3\xac\xdd\xac\xb7\xd3\
-\x19\x33\x8c\x02\x78\x15\xcd\x8a\xcc\xa9\x52\x56\xea\x5d\x3c\x3c\
-\xa7\xb2\x3e\xb3\x87\xfe\x0a\xcd\xfb\x49\xeb\x93\x88\xec\x3e\x2f\
-\x78\xc3\x6b\x7f\x19\x16\xdf\xfc\x66\xbb\x8f\x02\x7e\xde\xbf\xb4\
-\xa6\xb0\xb1\xbd\xef\xc6\xcf\x19\x36\xee\xa8\x3e\xcc\xb9\xe7\xfe\
-\xb8\xd7\xce\x3e\x03\x6b\x5b\x7d\x9b\x76\x2f\x1e\x95\xe9\xde\x1e\
-\xd6\xe1\xb7\x8d\x76\xc8\xbf\x80\xaf\x23\xfb\x62\x52\x7d\x8e\x8f\
-\xaa\xd8\xfa\x22\xc3\xf6\xd2\xf8\xee\xf1\x7e\xf3\xe3\x07\x8c\x73\
-\x9e\xe6\xdf\x9f\xfc\x85\x5f\x63\xff\x00\xc1\x20\xfe\x3a\xfc\x41\
-\xf8\xbb\xf1\x2f\xc6\xf6\xbe\x32\xf1\xae\xb5\xe2\xab\x5b\x1d\x2e\
-\xd6\x5b\x58\xaf\xbc\xbd\xb6\xd2\x19\xa4\x0c\xcb\xb5\x57\x92\x00\
-\x1c\xfa\x57\xe6\x95\xbf\x8a\xe3\x55\xff\x00\x58\xa7\x8e\x6b\xee\
-\xff\x00\xf8\x21\x16\xb6\xba\xbf\xc5\xff\x00\x88\x8a\x1b\x3e\x5e\
-\x8d\x64\x7f\xf2\x3c\xb5\xd5\x84\xcc\x1d\x4a\xaa\x0f\xa9\x95\x4a\
-\x29\x46\xe7\xe9\xa8\xa2\x81\xd2\x8a\xf7\x0e\x40\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xae\x1f\xf6\x8f\xbc\x6d\x3b\xf6\x7e\xf1\xd5\xc2\x6e\x2d\x6f\xe1\
-\xed\x42\x41\x8e\xb9\x5b\x69\x0f\xf4\xae\xe2\xb8\x8f\xda\x4a\x55\
-\x87\xf6\x7a\xf1\xe3\x30\xc8\x5f\x0f\x6a\x0c\x47\xa8\x16\xd2\x54\
-\x54\x8a\x71\x6a\x5b\x02\xdc\xfe\x68\x86\xb3\xe2\xaf\x89\xe6\x35\
-\xdb\x25\x9d\xbc\x80\x03\x9c\x9e\x0f\x1d\x38\xae\xcb\xc2\xff\x00\
-\xb2\xe5\xab\xd8\x35\xd6\xa5\x20\x92\x6c\x64\x79\x87\x8e\x7b\x75\
-\xae\x6f\x4b\xf8\x9b\x77\xe5\xc6\xba\x7d\xab\x46\xa5\x46\x0e\xdc\
-\xf6\xae\x93\x48\xb8\xf1\x37\x8a\xd0\xc6\xab\x31\x0d\xd9\x56\xbf\
-\x3a\xce\x6b\xe0\xa8\xd1\xf6\x18\x5b\x41\xff\x00\x5f\x33\xd9\xa3\
-\x4e\x4e\x5c\xf3\xd4\xf3\xdd\x53\xe1\xee\x8f\xa3\x7c\x42\x48\xe1\
-\xf2\x76\xa3\x75\x50\x3b\x57\xae\x78\x63\xc4\xb0\x59\x05\xb7\x8a\
-\x55\x55\x00\x0e\x0f\x4a\xf2\x7f\x88\xdf\x05\x3c\x4d\xa0\x5f\x1b\
-\xf5\x56\x5c\xfc\xc4\x9c\x9c\x57\x79\xf0\x0f\xe1\x35\xf7\x8d\x95\
-\x5a\xfa\x7f\x2a\x4e\x32\x43\x57\xcb\x63\x30\xb4\xe7\x4d\x55\x95\
-\x4b\xa4\xad\xdc\xef\xa3\x59\xab\xc5\x44\xf5\x5d\x12\xf3\x49\x44\
-\x59\x2e\xae\x22\xdc\x3a\x82\xd5\xaa\xde\x3f\xd0\xec\xc6\xdb\x51\
-\x1b\x3e\x3a\x01\x9e\x6b\x77\xc3\x5f\xb1\xc4\x37\x51\x46\xd2\xcf\
-\x24\xbc\x13\xcb\x74\xfd\x2b\x66\xe3\xf6\x62\xd2\x7c\x3f\x09\x90\
-\x47\xf3\x2f\x7c\x9a\xf9\x6c\xc6\x9e\x0b\xd9\x3e\x76\xd9\xd1\x4e\
-\xa5\x4b\xed\x63\x87\xd4\xfc\x5e\xd3\xe9\x6e\xd1\xe7\x9e\x78\x1d\
-\x6b\xcc\xe5\xbf\xbe\xd4\xb5\x79\x37\xf9\x9b\x77\x10\x2b\xd6\x7c\
-\x4d\xe1\x98\xf4\xb8\xca\x28\xda\xa0\x11\xf5\xae\x4d\x74\xf5\x57\
-\xfd\x3a\x57\xc1\x60\xe5\x4d\x36\xe0\xaf\xa9\xed\x47\x63\xc9\xfe\
-\x20\x78\x37\x53\xd6\xaf\x36\xc0\xac\xac\x79\xce\x29\x3c\x3d\xfb\
-\x3a\x6a\xd7\x96\xff\x00\xbe\x91\xb6\x9e\xa0\xe7\x8a\xf6\x4d\x2f\
-\x4a\x99\xae\xd7\x64\x1e\x67\x7c\x9a\xed\xb4\x7d\x06\xfa\xf5\x00\
-\xf2\x76\x8f\x41\xda\xbe\xa7\x0f\x88\xc5\x3a\x6a\x18\x6a\x77\xf9\
-\x1c\xb5\x23\x1b\xde\x52\x3e\x70\xbd\xfd\x92\xe2\x9c\xee\xb8\xc3\
-\xb7\x5f\x5a\x82\x2f\xd9\x76\xc6\xd6\x45\x55\xb7\x56\xe3\xaf\x97\
-\x8a\xfa\xe6\xc3\xe1\x35\xc6\xa2\x01\x65\x6e\x7d\x41\xc5\x6c\xdb\
-\xfc\x1a\xb7\xb4\x45\x79\xf6\x63\xae\x6b\xeb\x72\x5c\xbf\x3a\xf6\
-\xb1\xaf\x88\x97\x2c\x16\xfe\x87\x9f\x88\xad\x87\x50\x71\x8a\xd4\
-\xf9\x43\x47\xfd\x95\x92\xf6\xdb\xe4\xb7\x18\xf5\x29\x53\xc9\xfb\
-\x26\x79\x6b\x9f\x25\x54\x77\xf9\x7a\x57\xd6\x57\x32\xe8\xfe\x1d\
-\xb0\x6f\xde\x44\xad\x1a\x9f\x97\x3c\x9a\xf3\xdf\x10\xfc\x47\xfb\
-\x6c\x8e\xb0\xc6\x15\x3a\x0c\x0a\xfa\x9c\xe3\xc4\xec\x93\x2e\x8b\
-\xa6\xaa\xfb\x49\xae\x91\xd7\xf1\xd9\x1e\x5d\x1c\xbe\xbd\x57\x75\
-\x1b\x23\xc1\x4f\xec\xb5\x1b\x3e\x16\x30\x58\xf1\xc2\xff\x00\x5e\
-\x95\xd2\x78\x03\xf6\x65\xf0\xef\x87\x75\x37\x9f\x5c\x8e\x0d\x42\
-\x16\x8f\x67\xd9\xc6\x47\x3e\xb9\xf5\xae\xca\xe3\x5c\xb8\xbb\x25\
-\x55\xf6\x2f\x5c\x0a\x6c\x63\x3f\x78\x33\x13\xdf\xd6\xbf\x13\xe2\
-\x3f\x16\xb3\x4c\x72\x74\xb0\x8b\xd8\xc5\xf6\xd6\x56\xf5\xe9\xf2\
-\x3d\xdc\x2e\x49\x4d\x3b\xd4\xd4\xc1\x8b\xc0\x9e\x15\xf0\xc6\xa9\
-\x23\x68\xfa\x15\x9c\x7c\xfc\xae\xe9\xe6\x30\x3e\xc4\x8a\xd0\x79\
-\x64\xb8\xc0\x6d\xca\x17\xa2\x8e\x82\x9c\x63\xcd\xc1\x1d\x73\x9a\
-\xb5\x6d\x6b\x9e\xa0\x9a\xfc\xcf\x17\x8f\xad\x5e\x5e\xd3\x11\x37\
-\x29\x77\x6d\xb3\xd7\x8d\x0a\x74\xf4\x82\xb1\x0c\x56\xbe\x5c\x47\
-\x23\x27\x1c\x0a\xb7\xe1\xdb\x85\x8e\xe1\xe3\x65\x25\x4f\x6c\x52\
-\xce\x87\xc8\xf9\x46\x16\xaa\x69\xf2\x35\xb6\xa5\xf2\xe3\xe6\x19\
-\xe6\xb9\x69\xc9\xc9\x36\x5f\x2a\x7a\x1d\x31\x85\x44\x99\x8e\x46\
-\x8c\x8e\xde\xb5\x6e\xc3\x5c\xbe\xd3\x24\x1b\x64\x32\x47\xe8\x70\
-\xc3\x1e\x98\xa6\x02\xae\x81\x99\x32\x18\x75\x14\xb1\x5a\x6f\x97\
-\xf7\x2e\x33\x8e\x14\xf5\xad\xb0\xf5\xa4\x9d\xd1\xcd\x3a\x69\xe8\
-\xcd\x0b\xeb\x4f\x0f\x78\xbb\x47\xb8\x5d\x57\x43\xb3\x69\x24\xe0\
-\x3a\xa8\x47\x4f\xa7\x15\xc2\xea\x7f\xb2\x97\x87\xb5\x85\x2d\xa7\
-\xdd\xc5\x1b\x31\xce\xc9\x63\xe9\x9f\x7e\xf5\xd9\x93\x24\x1a\x6f\
-\xef\xa3\x25\x98\xfd\xea\x82\x29\x53\x7f\xee\xce\xd6\xef\xcf\x35\
-\xf6\x19\x7f\x17\xe6\xd8\x26\x9d\x0a\xce\xdd\x9e\xab\xf1\x38\x6a\
-\xe0\xa9\x4b\xa5\x8f\x9f\xbe\x32\x7e\xcf\xba\xb7\xc3\xcb\x79\x2e\
-\x21\xd2\x66\xbc\xb5\x4f\xf9\x6d\x6f\x19\x90\x7e\x38\x07\x15\xe1\
-\x57\x9f\x12\x24\xb4\xba\x78\xda\xde\x78\xf6\x1c\x6d\x65\xc3\x03\
-\xe9\x8c\x57\xe8\x25\xbe\xab\x7b\x65\xfe\xae\x4f\x31\x7b\x82\x7a\
-\xd6\x36\xb3\xe1\x2f\x09\x78\xe9\x0a\xeb\xde\x1f\xb1\x6b\x99\x08\
-\x5f\x3e\x34\xf2\xa4\x3f\x88\xe0\xfe\x35\xfa\x36\x59\xe2\x96\x8a\
-\x38\xfa\x37\xf3\x8f\xf9\x1e\x7c\xf2\xf9\xde\xf0\x67\xc1\xe7\xe2\
-\x94\x69\xfe\xb1\x66\x5c\x7a\x8c\x63\xf4\xa6\x9f\x8a\xf6\xea\x79\
-\x67\x53\xdf\x3f\xfe\xaa\xfb\x5b\xc6\x1f\xb1\x27\x81\xf5\x8b\x68\
-\xdb\x45\x99\xad\x65\x75\x25\x92\xe4\xee\x51\x91\xd9\xbe\xb5\xe0\
-\x5f\x1a\xbf\x61\x9d\x6b\xc3\xa8\xd3\x5b\xe9\x5f\x6e\xb5\xc6\x44\
-\xd6\xb9\x91\x40\xf7\xc7\x35\xfa\x76\x51\x9f\xe4\xf9\x85\x95\x3a\
-\x89\x49\xf4\x6e\xcf\xf1\xd0\xf3\xea\x42\xb5\x3f\x88\xf2\x75\xf8\
-\xb7\x65\x20\x38\x99\x77\x7b\xb5\x5c\xb1\xf8\x81\x6f\x76\xfb\x56\
-\x4d\xde\x9b\x7b\xd5\x5d\x3f\xf6\x63\x91\x6e\x73\x71\x13\x46\x73\
-\x9d\xa4\x15\xae\xc3\x42\xf8\x25\xa7\x68\x20\x33\x7f\x0e\x3e\xf3\
-\x75\xfa\x57\xdb\x52\xca\x70\xd6\xbc\x91\xc7\x2c\x54\xd1\x92\xfa\
-\xb5\xc5\xec\x43\xc8\x56\xf6\xe3\xa5\x2d\xa6\x85\xa9\x5f\x9f\xde\
-\x34\x8a\x08\xe4\x67\x00\x57\xa4\xeb\x1f\x0c\xae\x3c\x17\xe1\xbb\
-\x1d\x4a\x6b\x36\x5b\x2b\xef\xf5\x12\x02\x1b\x71\xf7\x03\xa7\xad\
-\x71\xfe\x28\xba\xd4\xae\x2c\x9b\xec\x16\xfe\x58\x51\xc3\x30\xc6\
-\x2b\xab\x0d\x47\x06\xd7\x35\x1b\x3b\x69\xde\xcd\x74\xf5\x31\x96\
-\x22\xa6\xcc\xa8\xda\x75\xae\x85\x1e\xeb\xab\xa5\x5c\x2e\x4f\xcc\
-\x39\xae\x73\x5d\xf8\xef\xa0\xe8\x85\xa3\x86\x48\xe6\x9b\xa6\x10\
-\x82\x4d\x71\x7e\x37\xf0\x5f\x88\xbc\x46\x48\x92\xe2\x52\x32\x46\
-\x01\xae\x46\x0f\xd9\xc7\x54\x92\xe1\x99\x3c\xc5\x6c\xe4\xe7\x3c\
-\xfe\x35\xbc\xeb\x72\xab\x24\x67\xca\xde\xac\xed\x35\x7f\x8a\x1a\
-\x87\x8b\x13\x6d\xaf\xfa\x2c\x2d\xfc\x5b\xba\xfe\x95\x85\x7b\xe0\
-\xd9\x35\x56\xf3\x2e\xae\x24\x99\x98\xf7\x39\xc7\xbf\x5a\xbf\xa3\
-\xfe\xce\xfe\x25\xda\xab\x14\x9c\x75\x0a\x41\xff\x00\x0a\xdb\x8f\
-\xf6\x7d\xf1\x6c\x09\xf2\xc8\x4f\xb1\x43\xfe\x15\xc5\x52\x35\x2a\
-\x6e\xf4\x37\x8f\x2c\x75\xb1\xc3\xb7\xc3\xe3\x0b\x65\x19\x86\xde\
-\xdf\xe4\xd5\xfd\x2f\x47\xb8\xd3\xd4\x6d\x91\xd9\xbb\xfb\xd7\x41\
-\x71\xf0\x6f\xc6\x16\x6d\xc2\x86\xef\xf7\x4d\x55\x9b\xe1\xff\x00\
-\x8b\x2d\x46\x5a\xdd\x1b\xd7\x83\xfe\x15\xc7\x53\x2e\xe7\x5e\xf3\
-\x36\x8e\x21\xad\x2c\x6b\x68\xbe\x23\xbc\xd3\x82\xfe\xf9\xba\x77\
-\x1d\x2b\xa2\xb3\xf8\x91\x7d\x08\x5f\xde\x1e\x3a\x73\xd2\xbc\xee\
-\x6d\x13\xc5\x56\xe3\x2d\x64\xbc\x7e\x1f\xd2\xa0\x7b\x8f\x11\x5a\
-\x2f\xcd\xa7\xb1\xfa\x57\x33\xc9\xd7\x46\x5f\xd6\xfb\xa3\xd7\x2d\
-\xbe\x29\xde\x0f\xf9\x69\xf2\xff\x00\xbd\xd3\xf4\xaf\xd2\xff\x00\
-\xf8\x36\xa3\xc6\x13\x78\x9b\xe3\xcf\xc5\x58\xe5\x6c\xac\x1e\x1f\
-\xd3\xd8\x7c\xd9\xce\x6e\x26\xff\x00\x0a\xfc\x6e\x93\xc5\x1a\xcd\
-\xb2\xfe\xf3\x4d\x98\xe0\xf2\x00\xff\x00\xeb\xd7\xea\x8f\xfc\x1a\
-\x8d\xe2\x6b\x8d\x6f\xf6\x8b\xf8\xc9\x15\xc5\xac\x96\xe6\x1f\x0d\
-\xe9\xa7\x2c\x3a\xff\x00\xa5\x4f\x5b\xe0\x72\xd9\x52\xad\x19\xb7\
-\xb1\x9d\x6c\x4c\x67\x07\x1b\x1f\xb8\x43\xa5\x14\x0e\x94\x57\xd2\
-\x1e\x68\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x66\xb9\x3f\x8e\x1a\x68\xd5\xfe\x0e\xf8\
-\xb6\xd4\xf4\xba\xd1\x6f\x22\x20\xfa\x34\x0e\x3f\xad\x75\x84\x64\
-\xd6\x1f\xc4\xb1\x9f\x87\xba\xf7\xfd\x83\xae\x3f\xf4\x5b\x52\x94\
-\x6e\xac\x35\xa1\xf8\x87\xa3\xfe\xca\xd6\x9a\x45\xa4\x6c\xb6\xe3\
-\x0a\xa2\xb6\xb4\x9f\x07\xa7\x85\x5f\x1f\x65\xf9\x73\xd4\x73\x8f\
-\xe9\x5f\x43\xd8\xd9\xc7\x3d\xa2\xab\x22\xfc\xcb\xc9\xdb\xd6\xa8\
-\x6b\x9f\x0e\xed\xf5\x18\x98\xc6\xb1\xe7\xae\x00\xaf\xca\x78\x9b\
-\x82\x5e\x26\xf5\x68\x49\xa9\x7a\x9f\x41\x84\xcc\x55\xb9\x64\x78\
-\xde\xb9\xe1\xad\x37\xc7\x3a\x5c\x90\x3c\x6a\x3f\x84\x8c\x63\x35\
-\xe2\x7e\x30\xf8\x7f\xab\x7c\x27\xd4\x5a\xeb\x48\x6c\xc3\x9d\xc5\
-\x32\x33\xc7\xa5\x7d\x43\x27\xc3\x59\x2c\xef\x19\x90\x15\xe7\x80\
-\x01\xac\x4f\x11\x7c\x31\xb8\xd5\xae\x19\x18\x48\xcb\x83\xfc\x3c\
-\x73\x5f\x9c\x50\xcb\x73\x9c\x3d\x4f\x62\xa3\x7f\xc8\xf4\x5f\xb1\
-\x9f\xbd\x73\xc1\xbc\x33\xfb\x66\x4f\xe1\x95\x5b\x7d\x49\x64\x8d\
-\xa3\xe0\x92\x0d\x74\xbf\xf0\xd5\xd6\x7e\x24\x8b\xfd\x67\xde\xe3\
-\x22\xba\x5f\x14\xfe\xc7\xd6\xde\x23\x4d\xd2\x5b\x2e\x78\x39\xf2\
-\xfa\xd7\x11\xaa\x7e\xc4\x87\x4f\x5f\xf4\x56\x96\x33\xd8\x63\xf9\
-\x57\xd5\x7f\xa8\xd2\xc6\xd2\x4f\x10\xdc\x1b\xfb\x8e\x7f\xae\x46\
-\x94\xbd\xdd\x4b\xcb\xe2\x6b\x7f\x17\xfc\xb1\xc8\xdc\xf5\xed\x8a\
-\xe9\xbc\x29\xf0\xa6\xda\xef\x0c\xcf\x8d\xdc\xe0\xf3\x5e\x53\x37\
-\xc1\x4f\x11\x78\x1d\x89\xb7\xb9\x62\xdc\xe1\x0e\x73\x9a\xde\xf0\
-\xad\xb7\x89\xad\x58\x36\xaf\xac\xc7\x63\x6e\xa3\x3e\x4c\x47\x7c\
-\xc7\xf1\xe8\x2b\x8e\x59\x5e\x41\xc3\xd4\xed\x8d\xad\x1b\xf6\xdd\
-\xfd\xcb\x52\x9e\x36\xbd\x77\x6a\x51\x3d\xdb\x40\xf8\x5f\xa5\xda\
-\xed\xdc\xca\xcd\xd8\x63\xad\x6d\x6a\x97\xfa\x1f\x83\x62\xdb\x33\
-\xaa\xc9\x8c\x85\x0b\x92\x7f\x2a\xf1\xf5\xf8\xa4\xfa\x4c\x5e\x55\
-\x99\x66\x65\x18\xf3\x1d\xc9\x66\xae\x5b\xc4\x3e\x29\xbc\xd7\x35\
-\x27\x92\xe2\x57\x66\xe9\x9c\xd7\xca\xe6\x3e\x2c\xd0\xa2\xdd\x3c\
-\xa3\x0f\xff\x00\x6f\x4f\x4f\xb9\x2f\xf3\x3a\x29\xe5\x55\xaa\x2e\
-\x6a\xd2\xb7\x91\xea\xbe\x25\xf8\xfb\x15\xb0\x68\xec\x62\x54\x51\
-\xfc\x64\x73\x5c\x1e\xb3\xf1\x3a\xfb\x59\x76\xdd\x2b\x64\xfd\x40\
-\x15\xcb\xaf\xf1\x1e\x4e\x0f\xad\x4d\x1a\xb4\x8b\xda\xbf\x2f\xce\
-\xb8\xb3\x35\xcc\xdf\xfb\x5d\x66\xd7\x64\xec\xbe\xe5\xfa\x9e\x9d\
-\x1c\xbe\x8d\x3d\x97\xcc\xb1\xa8\x5f\x4d\x73\x0b\x34\x92\x16\x38\
-\xe9\x59\x70\xc4\x19\x54\xe3\x2d\xdb\xde\xb4\x1d\x55\x6d\x24\xc7\
-\x2d\x8e\xf5\x5a\xda\x1e\x72\x4e\x3b\x57\xce\x53\x95\x91\xdf\x28\
-\xd9\x58\x58\xe1\x39\xf9\xba\xd5\xcb\x68\xb6\x92\xab\xf9\xd4\x71\
-\x2f\x1d\x8f\xe3\x57\x6d\xa3\x32\x2f\xf0\xa8\xf7\x15\x95\x49\x84\
-\x77\x32\xd2\xdc\xfd\xa5\xb3\x57\x52\x1c\xae\x17\x9a\x05\xbe\xcb\
-\x86\xc3\x6e\xfa\x0a\xb0\xa8\x56\x3c\x63\x9e\xf5\x33\x99\x4e\x2e\
-\xf7\x2b\xdd\xc5\xbd\x4b\x16\xff\x00\xeb\xd6\x52\x0d\x97\x7c\x36\
-\xde\x79\xf6\xad\x6b\xf1\xb9\x71\xcf\x3e\x95\x8f\x2a\xec\x9b\x1f\
-\x74\x67\xa9\x15\xb5\x1b\xb4\x1e\xa7\x6b\xa1\xb4\xd2\xc0\x3e\x55\
-\x95\x40\xfe\x1e\xa2\xa7\x58\xa1\x9a\xe3\x69\xdd\x1b\x63\xbe\x47\
-\x35\x95\xe1\x9b\xe7\x40\x02\xb3\x7e\x1d\xab\xa0\x8f\x53\x86\x6f\
-\x96\xe2\x30\xde\xe7\x83\x59\xc6\x4d\x3b\x1c\xf3\x8d\xb4\x41\x71\
-\xe7\x41\xa4\x85\x56\x0f\x1e\xee\x38\xeb\x54\x66\x58\xe4\x1f\xbc\
-\x56\x53\x9e\x48\xed\x5a\x97\x5a\x74\x67\x4e\x8d\xa1\xb9\x28\x09\
-\xe1\x09\xcd\x55\x9e\x19\x2d\xc7\xef\x63\xca\xf5\xca\xae\xea\xf4\
-\x3d\xa3\xba\x32\x91\x12\x5a\x90\x09\x86\x60\xdc\x73\x4e\xb7\x95\
-\xa2\x58\x63\x9a\x0d\xca\xcc\x39\x03\x2b\xfd\x69\x0c\x31\xcb\x1e\
-\xe4\x6d\xad\x9e\x9d\x30\x2a\xd5\xa3\x4d\x6b\x2c\x31\xb7\xef\x23\
-\x6e\x71\x5d\x94\xaa\x3d\x91\x9b\x45\x89\xad\x2d\x66\x99\x44\x4c\
-\xd0\x90\x3a\xaf\x15\x62\xd2\xe7\x50\xd2\xe4\x32\x41\x3e\xf6\xe9\
-\x9c\xed\x35\x0d\xd4\xf0\x4f\x75\xcc\x6d\x6e\xd8\x00\xed\x1d\x69\
-\xd0\x45\x20\x1b\xa3\x91\x64\xfa\xf5\xaf\x63\xda\x27\x2b\xaf\xc0\
-\xe6\x94\x75\xbd\x83\x5b\x9f\x47\xf1\x14\x0d\x16\xb9\xa4\xdb\xcc\
-\xc7\x83\x26\xcd\x8f\xf8\x32\xd7\x9f\xf8\x83\xf6\x53\xf0\xbf\x88\
-\xef\xa1\x93\x4a\xd6\xaf\x6c\xda\x43\xb8\xc1\x70\x37\xa2\x9e\xa3\
-\x07\xae\x05\x77\xd7\x37\x8c\xb6\xfb\x66\x87\x3b\x89\xe5\xd7\xa8\
-\xaa\x4f\x1d\xb5\xc6\xad\x0f\x91\xfb\x89\x15\x4a\xb1\x07\x8e\xc3\
-\x35\xf4\xd8\x1e\x2b\xcd\x30\x0b\x97\x0d\x5d\xa5\xd9\xea\xbf\x13\
-\x96\x78\x3a\x35\x1f\xbc\x8a\x7e\x39\xfd\x9f\xf5\x09\x7c\x24\x34\
-\xf3\xbb\xec\x30\xc6\xb2\x42\xd6\xea\xae\xac\xe3\x8e\x46\x49\x15\
-\xe6\x16\x7f\xb3\xf6\xa1\x38\xdb\x2c\x6c\x3b\x1c\xff\x00\x2a\xfa\
-\x02\x3b\xdd\x53\x47\xda\x61\xba\xf3\xbd\xf7\x15\x63\xf9\x55\xe8\
-\xbc\x79\x19\x38\xd4\xac\x55\xfd\x59\xd4\x64\xff\x00\xc0\x87\x3f\
-\x9d\x7e\x83\xc2\xbc\x65\x2c\xbb\x9a\x18\x98\xb9\x46\x6f\x99\xb4\
-\xf6\x6f\x73\xce\xc4\xe0\x79\xfe\x1e\x87\x82\xd8\x7e\xcc\x76\xee\
-\xdb\xa7\x55\xcf\x4c\x82\x2a\xd5\xcf\xec\xf9\x6d\x67\x0f\xc9\x1c\
-\x6f\xc7\x41\x5e\xf0\x83\x47\xd6\xd1\xbe\xcd\x75\xf6\x76\x07\x01\
-\x1d\x43\x2f\x4f\x50\x6a\x9d\xef\x87\xe4\xb6\xb7\x59\x55\x92\x48\
-\x58\xe0\x32\x38\x6f\xfe\xbd\x7e\xb3\x97\xf1\x76\x55\x8b\x4b\x92\
-\xaa\x4f\xb3\xd3\xf3\x3c\xaa\x98\x7a\xb0\xdd\x1e\x1b\x67\xf0\xea\
-\x2d\x12\x41\x9b\x7c\x2a\xfa\xe2\xb6\x2d\x6d\xec\x96\x35\x56\xb7\
-\x4c\xe3\xfb\xbd\x6b\xd2\xae\x34\xd8\xe7\x1b\x66\x8d\x4e\x3a\x86\
-\x15\xce\xea\x9a\x15\xac\xf3\x08\xe1\x68\xda\x42\x3e\x65\x5e\xab\
-\x5e\xb6\x2b\x32\xc1\xe1\xe9\xc6\xa5\x49\x2b\x49\xd9\x75\xbb\xec\
-\xac\x63\x15\x39\x68\x8e\x71\xfc\x37\xa6\xde\x2b\x7e\xe6\x32\x5b\
-\xa7\xcb\x8e\x6a\x29\xbe\x1e\xe9\xb2\xc4\x4b\x5a\xaf\x4e\xbd\x6b\
-\xa2\xff\x00\x84\x52\x6b\x67\xdc\xbf\x37\x3d\x3d\x2a\xe4\x1a\x73\
-\x2a\x0d\xc0\xe7\x1c\x8c\x74\xaf\x42\x2a\xe8\x8e\x66\x79\x9d\xcf\
-\xc3\x9d\x2a\x79\x99\x0d\xb4\x7f\x43\xff\x00\xea\xaa\xd7\x3f\x04\
-\xb4\x79\xbf\xe5\xd8\x7d\x6b\xd2\xcf\x87\x23\x32\x96\xc7\xcc\x7d\
-\x45\x58\x1a\x52\x08\x4a\xed\xc7\xbe\x29\xf2\xab\x87\x33\x3c\x5f\
-\x51\xfd\x9f\xf4\x5b\x82\x47\x92\xbc\x8c\x76\xe6\xbe\xe2\xff\x00\
-\x82\x02\xfc\x2c\xb1\xf8\x7f\xf1\xaf\xe2\x5d\xc5\x9a\x6c\x6b\xad\
-\x12\xc9\x1b\xf0\x9e\x63\x5f\x3c\xcf\xa1\xef\x3c\x73\xef\x5f\x61\
-\xff\x00\xc1\x18\x6c\x3e\xc9\xf1\x57\xc7\x9e\xfa\x4d\xa0\xc8\xff\
-\x00\xae\xd2\xd5\xc6\x2a\xe2\x93\xd0\xfd\x0b\x1d\x28\xa0\x70\x28\
-\xad\x0c\xc2\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8c\
-\xd0\x4e\x05\x31\x9d\x49\xa0\x07\xd1\x4c\x2e\x28\x59\x33\xf4\xa0\
-\x07\xd6\x1f\xc4\x7f\xf9\x10\xf5\xcf\x4f\xec\xeb\x8f\xfd\x16\xd5\
-\xb4\x8f\xbb\x3e\xd5\x87\xf1\x37\xfe\x49\xde\xbf\xb7\xef\x7f\x66\
-\xdc\xe3\xeb\xe5\x35\x00\x7e\x76\xc6\x56\x28\x17\xe6\x1d\x3a\x0e\
-\xd4\xd5\xd6\x16\xd4\x63\x71\x3d\xf3\x58\xf6\x76\x17\xb3\xa2\x2e\
-\xd6\xe4\x71\x55\xf5\x2b\x58\x74\xa8\xbc\xcb\xeb\xa8\xe1\x4e\xbf\
-\x33\x72\x7f\x2a\xc7\x11\x5a\x8d\x18\x39\xd7\x92\x8c\x7b\xb7\x6f\
-\xc5\x8e\x2e\x4d\xda\x28\xe8\x23\xf1\x0d\xbc\xd3\xed\xda\x19\x88\
-\xe0\xf7\x35\x62\x43\x6e\xaa\xb2\x6d\x45\xe3\xa9\xe9\x9a\xf2\x8d\
-\x7f\xe2\xce\x9b\xa0\x71\x6c\x15\xdb\xfb\xd2\x1e\xbe\xe0\x7f\x8d\
-\x70\x5e\x2a\xf8\xff\x00\x75\xa9\xee\x8d\x66\x63\xe9\x83\xc7\x7a\
-\xfc\x87\x88\xbc\x56\xc8\xf0\x2d\xc7\x07\xfb\xe9\xff\x00\x77\x45\
-\xf3\x97\xf9\x1e\xe6\x0f\x2b\xc5\xd5\xdd\x72\xa3\xde\x35\x8f\x1c\
-\x69\xfa\x72\xb2\xb4\xc8\x76\xf5\xda\xb9\x0a\x6b\xcb\x3e\x26\xfc\
-\x7a\x16\x93\x7d\x9e\xc6\x44\xda\x47\x2d\xb7\x27\xbf\x43\x5e\x4f\
-\x7f\xe2\x6d\x43\x5b\x7f\x99\xb6\xa9\xee\x4f\x4f\xa5\x63\x6a\x16\
-\xbf\x67\xb8\x56\x92\x56\x94\xf6\x19\xaf\xc5\x73\xbf\x13\xb3\xbc\
-\xce\x4d\x53\x9f\xb1\x87\xf2\xc3\x7f\x9b\xdc\xfa\x3c\x3e\x47\x4a\
-\x9a\xbc\xfd\xe6\x6e\xea\xde\x34\xbc\xd6\x24\x2c\x64\x65\xdd\xd4\
-\xfa\xd6\x63\xbc\x97\x07\x73\x36\x79\xa8\xe1\x1b\xcf\x1e\x95\x62\
-\x18\x82\x93\x91\xfa\x57\xe6\xf5\xaa\xca\x52\x73\x9b\x6d\xbe\xaf\
-\x56\x7a\x30\xa6\xa1\xa4\x47\xdb\x44\x64\x65\x0b\xd7\xd4\xf4\x15\
-\x05\xdc\x66\x1b\xc9\x37\x75\xcf\x3e\xd5\x7a\x1d\xce\xa0\x2f\xca\
-\x3a\x0a\xab\x7f\x0e\xcb\xac\x7a\x76\xae\x68\xcb\x53\x7b\x7b\xa3\
-\x57\x6e\x47\x1f\xfd\x7a\xb1\x14\x3b\x47\x5c\x6e\xe9\x4d\x4e\x17\
-\x18\xf9\x7a\x1a\x9e\x18\x46\xe3\xc7\x6a\x99\x48\x8b\x36\x29\x8f\
-\x74\x2e\xb8\xc7\x1d\x6a\xad\xac\x5b\xd3\x2d\xf7\x45\x68\x6f\x60\
-\x9b\x76\xf0\x2a\xbc\x69\xb7\xe6\xe9\xfe\x4d\x44\x65\xa1\xab\x8e\
-\x82\xc2\x14\x0e\x9f\x85\x5b\x89\x77\xb7\x4c\x0e\xc6\xa3\x89\x0b\
-\x72\x3d\x72\x2a\xe5\xbc\x03\x3b\x9b\x2c\xde\xdd\xeb\x0a\x92\x1c\
-\x4a\x6a\xb8\x98\xe3\xd6\xac\x6d\xc3\x65\xbe\xef\xf2\xa5\x2a\xc8\
-\xf8\x27\xb7\x1e\xd4\xf9\x14\x86\xff\x00\x39\xa8\x72\xb8\xa7\x64\
-\x51\xbd\x19\x8f\xe5\x5e\x30\x3f\x0a\xc4\x98\x30\x9f\xd4\x67\x9f\
-\x6a\xdd\xbb\x45\x31\x9c\xfc\xc7\xda\xb0\xee\xd3\x33\x70\x07\x5e\
-\x95\xdf\x87\x5d\x19\x9f\x33\x34\xbc\x3f\x32\xa3\xfd\xe2\x0f\xa8\
-\xae\x9a\xd9\xa6\x96\x1c\x6d\x59\x94\x0e\x95\xc9\xd9\x7c\x8c\x18\
-\x7a\xd7\x41\xa6\x5c\xec\xf9\x92\x4f\x2d\xb3\xcd\x15\x23\xcb\x2d\
-\x49\x94\x4d\x0b\x87\x54\x8e\x35\x57\x68\xd9\x47\x28\x7f\x86\x96\
-\xdf\x52\x9a\xdc\x8c\x9d\xcb\xdf\x1d\xe9\x97\x37\x9e\x72\x46\xb2\
-\xa2\xc9\xc7\x0c\x29\x91\xc3\xbb\xfd\x53\x8f\x5c\x31\xef\x57\x29\
-\x5e\x5a\x19\xc9\x17\x5e\xea\xd2\xf9\x76\xc8\x9b\x18\x9f\xbc\x99\
-\x04\x55\xab\x5d\x2e\x64\xba\x56\xb5\xb8\xfb\x52\xa8\xf9\x63\x93\
-\x86\xac\x6b\x92\x63\xff\x00\x59\x09\x5f\x56\x51\xc1\xa9\x74\x8b\
-\x86\x86\x57\x68\x26\x24\xe3\x1c\xf1\x8a\xec\xc3\xbf\x78\xc7\x95\
-\x1a\x17\x17\x4d\x04\xed\xf6\xc8\x5a\x37\xef\xe8\x29\xd0\x43\x0c\
-\xa9\x98\xa4\xc6\x4e\x45\x47\x6d\xe2\x49\xa3\x0c\xb2\xaa\xb2\xee\
-\xe8\x57\x38\xab\x0b\x16\x9f\xa8\xae\x7e\x6b\x79\x4f\x56\x8d\xbe\
-\x53\xf8\x57\xad\x4e\x4a\xf7\xfc\xce\x79\x27\xd0\x6c\x92\xdd\x5a\
-\xaa\x2e\x23\xb8\x03\x8d\xa7\x93\xd6\xab\xc1\xf6\x6d\x4f\x58\xfd\
-\xe4\x4d\x6b\x20\x01\x5b\x9c\x77\xab\x93\xe8\xba\x84\x4c\x1a\xd5\
-\xa2\xbe\x8f\xef\x6c\x2f\xf3\x55\x3b\x5b\xed\x97\xc5\xaf\xa3\x6b\
-\x76\x0c\x33\xbc\xf1\x5d\xd2\xe6\xd1\x3b\xee\xbc\xd5\x89\x81\xd0\
-\x45\xa7\xcc\x9f\x35\xbc\xcb\x32\xf4\x18\xea\x6a\x19\x35\x06\x80\
-\xff\x00\xa4\xc6\xc0\x63\xba\xff\x00\x3a\x2d\x6d\xe3\xbc\xfd\xe5\
-\xac\xa4\xf1\xd1\x4e\x69\xed\x73\x77\x04\x4c\x36\xad\xc4\x7d\xc3\
-\xae\x4d\x7d\x35\x2a\x8e\xd7\x57\xfc\xce\x46\xae\xec\x67\x5e\xda\
-\xe9\xf7\xf0\x49\x22\x29\x86\x4c\xb1\x56\x8f\xb0\xec\x6b\x1a\xfe\
-\xef\x52\xd2\x2f\xad\xfc\xbb\x83\x3d\xb9\xed\xd1\xbd\x7f\x2a\xd6\
-\xd4\xee\x6c\x6e\x62\xdb\x24\x4d\x6b\x29\x39\xca\x9e\x3e\xb5\x89\
-\x75\xa7\x6c\xd6\xb7\x59\xdc\x0b\xa8\x59\x3f\x10\x4f\x1f\xce\xb8\
-\x73\x2a\xa9\xd3\xb6\x8d\xfd\xcf\xee\x35\xa7\x1d\x75\x3d\x1b\x46\
-\xf8\x85\x1c\xda\x4d\xbc\x3a\xa6\x9b\x1c\x8b\x82\xc6\x46\x8f\x6b\
-\x63\xd4\x32\xe0\xd4\x96\x1e\x14\xf0\xee\xa9\x78\xf7\x3a\x7d\xfc\
-\xd6\x73\xdc\x7c\x85\x65\x3e\x64\x60\x9f\x71\xc8\xe7\xd4\x56\x4d\
-\x9d\xeb\xdb\xdb\xc7\x1d\xc4\x6c\x0f\x96\x14\x86\x5c\x81\xfe\x14\
-\xd9\xac\x6c\x6f\xe7\x56\xf9\xa1\x90\x8e\x1d\x1b\x04\x1a\xfb\x8c\
-\x0e\x32\xb5\x15\x4e\x50\x96\xb0\xb3\x49\xea\x93\xf9\x9e\x5d\x6a\
-\x31\x6d\xab\x5b\xd0\xd5\xd5\xbc\x05\xa8\x59\xaf\x98\x90\xad\xd4\
-\x23\x9d\xf0\x36\xf1\x8f\xa0\xe4\x7e\x35\x83\x2d\xbe\x1c\xfc\xbf\
-\x5c\xf6\xa9\xed\x35\x0d\x53\x43\xbb\x8e\x5b\x1b\xaf\x3f\x6e\x4e\
-\x19\xb0\xc3\x8f\x51\x51\xea\x7f\x18\xd5\x2d\xbc\xbd\x66\xce\x19\
-\x64\x5e\xaf\x24\x7f\xbd\x3d\xfe\xf2\xe0\xfe\x75\xf7\xf8\x5f\x11\
-\x25\x49\x5b\x1b\x4f\x4e\xe8\xf3\xe5\x97\x3f\xb0\xc8\x9d\x08\x53\
-\xf2\xfe\xb5\x13\x8f\x97\x95\x51\xbb\xde\xaa\xf8\x7b\xc5\x30\xf8\
-\xb1\xae\x25\xb6\x88\xc7\x14\x4d\x85\x2c\xd9\x3d\x33\xd7\xda\xb4\
-\x18\x14\xcf\xfb\x55\xfa\x46\x55\x99\x52\xc7\xe1\xa3\x8b\xa1\x7e\
-\x59\x6d\x75\x66\x79\xf5\x69\xca\x0f\x96\x5b\x95\xda\x0d\xa4\x12\
-\x3e\x56\xe2\xbe\xb8\xff\x00\x82\x3d\xa0\x8f\xe2\x57\x8e\x08\x5d\
-\xa7\xfb\x2a\xd3\xff\x00\x46\xcb\x5f\x22\x5c\x05\xdf\xcd\x7d\x73\
-\xff\x00\x04\x7a\x39\xf8\x99\xe3\xb1\xff\x00\x50\xbb\x5f\xfd\x1d\
-\x2d\x7a\x2b\x73\x36\xcf\xbf\x28\xa2\x8a\xd0\x90\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x01\xb2\x7d\xca\xf9\xc7\xf6\xb7\xf1\
-\x4f\xc4\x3f\x06\x7e\xd1\xdf\x01\x9f\x47\xf1\x65\xae\x93\xe0\x6d\
-\x73\xc6\x29\xa3\x6a\xda\x34\x1a\x77\x99\x79\xac\xb3\xe9\xda\x8c\
-\xdf\xbd\xba\x77\x21\x20\x46\x82\x22\x23\x8e\x30\xcc\xfc\xb4\x81\
-\x57\x69\xfa\x40\xf4\xae\x7f\xc6\x5f\x0f\x34\x0f\x88\x17\xfa\x0d\
-\xd6\xb1\xa7\x5b\xea\x17\x1e\x17\xd4\x86\xaf\xa5\xbc\x99\xcd\x95\
-\xda\xc5\x24\x22\x65\xc1\xfb\xc2\x39\xa5\x5e\x72\x30\xe6\xa5\xad\
-\x9f\xa0\x74\x68\xfc\xf9\xf8\x95\xfb\x41\x7c\x54\xfd\x9a\xbc\x71\
-\xe3\x8f\x88\x1e\x26\xbb\xf1\x26\xa9\x67\xe2\x09\xbc\x5f\x17\x80\
-\xcd\x87\x8d\xed\xb5\x3f\x0f\x25\xcd\x8e\x9f\x7f\x77\x6b\x6b\x73\
-\xa5\xc5\x00\x68\xd5\x6d\xb4\xf9\x9c\xc8\x27\x91\x96\x74\x65\x91\
-\x53\x72\xe3\xdd\x3f\x63\x6d\x67\xc5\xbe\x04\xfd\xa6\xf5\x6f\x87\
-\xda\xbf\xc4\x0f\x12\x7c\x4b\xd2\x75\x1f\x87\x7a\x1f\x8d\x86\xa3\
-\xad\x34\x2f\x35\x85\xfd\xc5\xcd\xe5\xbc\xe2\x26\x86\x34\x55\xb7\
-\xb8\x10\xa4\x89\x11\xc8\x8c\xc3\x26\xcc\xab\x61\x7d\x63\xc3\x3f\
-\xb1\x27\xc2\x5f\x09\x7c\x59\xd5\x3c\x71\xa7\xf8\x1f\x44\x83\xc4\
-\xba\xc7\xda\xbe\xd5\x72\x55\xe4\x8c\xb5\xd0\x02\xe9\xd2\x06\x63\
-\x0c\x6f\x38\x18\x95\xd1\x15\xa4\xe7\x71\x6c\x9c\xe9\x7c\x00\xfd\
-\x94\xfe\x1c\xfe\xcb\x76\xda\x9c\x3e\x01\xf0\xc5\x8f\x87\x57\x58\
-\x68\x8d\xe1\x86\x49\x65\x79\x56\x15\x2b\x0c\x7b\xa4\x66\x65\x8a\
-\x25\x66\x11\xc4\xa4\x24\x61\x88\x55\x50\x4d\x54\x74\x5f\x24\x12\
-\xd5\xdd\x77\x39\xcf\x89\x7f\xb1\xac\x9f\x13\x3c\x75\xa8\x6b\xbf\
-\xf0\xb6\x3e\x34\x78\x7f\xfb\x41\x91\xbf\xb3\xb4\x5f\x12\xad\xa5\
-\x85\xae\xd4\x54\xc4\x51\x79\x27\x68\x3b\x77\x1e\x4e\x58\x93\x5c\
-\x87\x8c\x3f\x60\x59\x6c\x7c\x25\xaa\xcc\x3e\x37\xfe\xd0\xad\xe4\
-\xd9\xca\xfb\x4f\x8c\x17\x0d\x84\x27\x1f\xea\x2b\xe9\x88\xce\x45\
-\x65\x78\xfc\x17\xf0\x36\xb4\xa0\x7d\xeb\x09\xff\x00\xf4\x5b\x50\
-\x07\xe5\x42\x7e\xcb\x77\x08\x83\xfe\x2e\xcf\xc6\xe5\xf9\x7a\x7f\
-\xc2\x52\x3f\xf8\xcd\x72\x3a\xcf\xd9\x74\x78\x0f\x87\x75\x4d\x47\
-\x56\xbd\xbc\xd3\x7f\x74\x75\x2b\xeb\xaf\x3e\xfa\xeb\x39\x21\xe5\
-\x7c\x0d\xed\x82\x39\x00\x67\xda\xbe\x8b\xb7\xb4\x67\x80\x7c\x8d\
-\xc8\xfe\xe9\xaf\x98\xff\x00\x69\xbd\x06\x38\xbe\x24\x5d\x3b\x5c\
-\xfd\x9e\xf2\x60\x24\x52\x0e\xd0\x06\x31\x8f\xd2\xbf\x33\xf1\x4b\
-\x0c\xaa\xe5\x51\xbd\xf4\x92\xfc\x53\xe8\x7a\x99\x4e\xb5\xac\x72\
-\x9e\x26\xf8\x5f\xa8\x46\xcf\x71\x6f\x70\xba\x8d\xb6\x33\xba\x23\
-\x87\xff\x00\xbe\x7f\xc2\xb9\x56\x81\x6c\xdc\xa9\x8e\x4d\xea\x70\
-\x77\x0c\x60\xfb\xd6\x8d\x8f\x8e\x35\x6f\x09\x5c\x7e\xfb\x73\x26\
-\x33\xbd\x40\xff\x00\x26\xba\x6b\x2f\x17\x68\xde\x38\x85\x57\x51\
-\x85\x7c\xd2\x3e\x59\xa3\xf9\x24\xcf\xbf\xad\x7f\x2d\xe3\x32\x79\
-\xa5\x7a\x7a\xaf\xeb\xee\x3e\xca\x96\x21\xc7\xe2\xd4\xe2\x8c\xae\
-\xc3\x2c\xdb\x41\xec\x3a\xd5\x5b\xbd\x91\x6c\x2b\x96\x6c\xf3\x93\
-\x9a\xf4\x4f\x12\x7c\x0e\x9a\x1d\x13\xed\xda\x45\xea\xea\xdf\x30\
-\x57\xb7\x55\xdb\x22\x0c\x13\x9f\x43\xd8\x71\x5e\x7b\x7b\x6e\xda\
-\x6d\xc1\x8e\x48\xdd\x1c\x1e\x43\x29\x04\x57\x87\x3c\x3c\xa9\x3b\
-\x4d\x1e\xb5\x1a\xd4\xea\x47\xdd\x65\x88\x86\xe5\x3f\xc3\xf4\xa9\
-\xe2\x52\x8d\xeb\xc7\x7e\xe2\xa2\x83\xe7\x03\xa2\xb7\xbd\x5a\x5c\
-\x63\x03\x8c\x57\x9b\x53\x46\x73\x93\x5b\xa7\x3c\xf0\xbd\x40\xf4\
-\xa8\x6f\x94\x09\xd5\xba\xee\xf6\xa9\xa3\x4f\x30\xfb\x74\xfa\xd3\
-\x6f\xa2\xdc\x91\x15\xea\x72\x2b\x18\xbf\x78\xda\x3b\x11\xaf\x20\
-\x82\x06\xdf\xe7\x53\x42\x36\x93\x51\x8b\x76\x76\x55\xfe\xef\x1f\
-\x4a\xb4\x91\x90\x7f\xad\x4c\xda\x25\x6e\x49\x04\x40\x96\xdc\x4f\
-\x43\xc0\xaa\xf1\xa6\xd6\x2b\xd4\x67\xbf\x6a\xbd\x12\x28\x3e\xbc\
-\x74\xf5\xaa\xe8\x8c\xce\xc7\xd0\xfe\x62\xb1\x8c\x99\xa7\xd9\x1d\
-\x1a\x60\xfa\x2f\x4a\xbd\x68\x99\x3f\x2f\xe3\x9f\xe9\x50\xc5\x1f\
-\xcd\xb8\x9a\xb3\x6e\x0b\xed\xe3\x6f\xa5\x63\x52\x57\x08\xeb\xa1\
-\x05\xc4\x1e\x5c\xe4\x12\x4e\xde\xc3\x9a\x8e\x52\x58\x7c\xb9\xfe\
-\xb5\x62\xea\x3f\xde\x67\xf8\xba\x9f\x7a\xaf\x39\xda\x3e\x5a\x22\
-\xc2\x5b\x94\xae\x54\xec\x3c\xe7\x8a\xc7\xb8\xf9\xb7\x76\x6c\xd6\
-\xd5\xd0\x38\xf5\xf7\xac\xab\xc8\xb6\x9c\x1f\xaf\xd2\xbb\xa8\x30\
-\xd8\x2c\xdd\x94\xf1\xd2\xb7\x74\xe9\xa3\x9e\x31\xbd\x71\xfe\xd0\
-\x1c\x8a\xc0\x81\xb6\x13\x8f\xc3\xda\xb5\x2c\x67\xda\x36\x91\xbb\
-\x8e\x83\xbd\x69\x32\x65\x14\x6d\x5c\xc6\xc2\x38\xf6\x32\xf9\x78\
-\xe3\x9c\x1a\xa7\xe7\xf9\x4f\x86\xdc\x39\xe2\xa4\x69\x17\xca\x8b\
-\x6b\x10\x7d\xfa\x1a\x8e\x6b\x8c\x9c\x32\xee\xa3\x9a\xfa\x99\x4a\
-\x24\x83\x51\x68\x90\x05\x22\x45\x5e\xc4\x75\xab\x56\x72\xc3\x7f\
-\xe6\x23\x2f\xd9\xa4\x5c\x72\x0f\x5a\xc9\x75\x57\x5f\x95\xbc\xb6\
-\xf7\xe8\x2a\x5c\x35\xac\x0e\xef\xf3\x16\x5c\x71\x5d\x98\x7b\xad\
-\x62\x67\xca\xb6\x66\x91\x8e\xe2\x05\xc0\x65\xb8\x8f\xaf\xfb\x54\
-\xc1\x34\x12\x3e\x0e\xe8\x5b\xb6\x4e\xde\x6b\x3a\xdb\x50\x92\x27\
-\xf9\x64\x6f\xa0\xef\x57\xe1\xd6\x92\x65\xdb\x71\x1f\x98\x01\xe4\
-\xf5\xae\xea\x35\x75\x31\x94\x5a\x2e\x45\x79\x73\x6d\x36\xf8\xe4\
-\x12\x2f\x5e\x0f\x5a\xd2\xf0\xb7\x89\x62\x9a\x46\xfb\x74\x0b\x2e\
-\xe2\x78\x95\x43\x28\xfc\xeb\x26\x0d\x36\xd6\xf5\xd8\xdb\xdc\xbd\
-\xbf\x19\xdb\x9c\x8f\xd6\xac\x5b\xc5\x35\xae\x3f\xd1\xda\xe6\x05\
-\x1f\x33\xa8\x1c\x7d\x6b\xd1\xa4\x9f\x3c\x66\x9f\x5d\xbf\xe0\x19\
-\x7a\xa3\xa7\x3a\x26\x95\xab\x29\x30\x33\xd9\x4c\x14\x9d\xf1\x9c\
-\xaf\xe5\x4b\xff\x00\x08\xf6\xa7\x6d\xa7\xa9\x8a\x6b\x7b\xf3\x8c\
-\x94\x2b\xb5\xcd\x62\x5b\x4f\x6f\x70\x3f\x75\x29\x86\x41\xdb\x24\
-\x1a\xb9\xf6\xdb\xdb\x18\xd5\x97\x6c\xaa\x3a\x10\x40\x63\x5f\x4f\
-\x47\x11\x04\xf9\xa5\x1b\xf9\xa3\x86\x54\xcc\xdd\x53\xc4\x70\xc5\
-\xb6\x1b\xeb\x59\x2d\xd9\x71\xb9\x65\x42\x47\xe0\x6b\x2a\xc6\xda\
-\x19\xb5\x66\x92\xd6\x4d\xaa\xe5\x54\x61\xb7\x63\xbf\x15\xd1\x6a\
-\x1e\x34\x8e\xe4\x79\x77\xb0\xf9\x8a\x06\x36\x4c\x81\x80\xfc\x71\
-\x58\xda\x6e\x8b\x67\xab\xde\x30\xb5\x93\xfb\x39\x59\xc9\xde\xa7\
-\x2a\x31\xf8\xd7\x9b\x8d\xa9\x1a\x8e\x31\x52\xbe\xbb\x5b\x5f\xbc\
-\xe8\xa4\x9a\x5b\x1d\x58\xb9\xbd\x09\xfb\xcf\x2e\xf1\x76\x80\x4f\
-\x7e\x3f\xae\x2a\xad\xd5\xee\x9f\x30\x3e\x60\x6b\x26\xc6\x4b\x67\
-\xe5\x1e\xd5\xcd\xeb\xbf\x10\xe4\xf0\xad\xc4\x96\xed\x75\x67\xa8\
-\xac\x63\xe5\x95\x3d\x7f\x21\xd2\xb9\x49\x7e\x2e\xdd\x4f\x24\x81\
-\x84\x77\x0b\x26\xef\xf5\x88\xac\x39\x1d\xb8\xaf\x62\xb6\x73\x0a\
-\x56\x84\x53\x72\xeb\xd9\x7f\x5e\x4c\xe4\x8d\x09\xcd\xdd\x1a\xbe\
-\x2c\xf8\x9c\xba\x4c\x92\xc3\x6d\x27\x98\xa4\x7c\xac\xff\x00\x7b\
-\xf0\xef\x5e\x77\xad\x78\xa2\xeb\x5c\x9f\x32\x4a\xed\xb8\xf2\x4b\
-\x13\xc5\x53\xbb\x99\xae\x66\xdc\xdf\x79\x8f\xa7\x4a\x42\x31\x8e\
-\x07\x1c\xe2\xb9\x7e\xb1\x3a\xaf\xdf\x7f\x2e\x87\x4c\x28\x28\xea\
-\x7b\x2f\xc1\x0d\x3d\xa1\xf0\x24\x72\xb2\xf3\x2c\xae\xf9\x3e\x99\
-\x22\xba\x89\x21\x56\x4e\xa7\x77\xbf\x19\xaa\xbf\x0f\x6c\x5b\x4c\
-\xf0\x36\x9b\x04\x98\x2c\xb0\x21\xe9\xd4\x91\x9a\xd0\x92\x22\xd2\
-\x1e\x7a\xf5\xe2\xbf\xac\xf8\x77\x0f\xec\x32\xda\x14\xbb\x45\x7e\
-\x47\xc5\xe2\xa5\xcd\x56\x4f\xcc\xce\xb8\x8b\x2d\xc6\xec\x9e\x2b\
-\xeb\x9f\xf8\x23\xf2\x08\xfe\x25\xf8\xe1\xba\xff\x00\xc4\xae\xd7\
-\xff\x00\x47\x4b\x5f\x27\xcb\x16\x3b\xf7\xeb\x5f\x59\x7f\xc1\x20\
-\xd7\x6f\xc4\x9f\x1c\xf7\xff\x00\x89\x5d\xa7\xfe\x8d\x96\xbd\xd4\
-\x72\x9f\x7b\x51\x45\x15\x40\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x36\x4f\xb8\x7e\x95\xf3\x67\xed\x77\xae\x78\xf3\xc2\
-\xbf\xb4\x87\xc0\x1b\x8d\x27\xc6\x5f\xd9\x3e\x09\xd6\x3c\x66\xba\
-\x36\xa5\xa0\xda\x58\x01\x3e\xb2\xf2\x69\xba\x94\xc4\xdc\x5c\xb3\
-\x9f\xdc\x27\x91\x19\x58\x63\x8d\x49\x7c\xb3\x3b\x00\xaa\x3e\x95\
-\xac\x3f\x17\x78\x07\x47\xf1\xb5\xe6\x8b\x73\xaa\xe9\x96\x5a\x85\
-\xc7\x87\x6f\x86\xa9\xa6\xbc\xd1\xef\x6b\x1b\xa1\x1c\x91\x09\xa3\
-\xf4\x71\x1c\xb2\x2e\x7d\x1c\xfa\xd4\xcb\xa7\xaa\x0f\x23\xf3\x77\
-\xe2\x1f\xfc\x15\x57\x56\xf1\x37\xed\x63\xe3\xab\xdf\x09\x78\xda\
-\xd6\x1d\x2b\xc3\xbf\x0d\x7c\x6f\x1f\x86\x3c\x1b\x25\xa4\xab\x3d\
-\xf6\xab\xa4\xb5\x9b\xae\xa9\x76\x92\x20\xe5\xd9\x6f\x04\x31\x74\
-\x16\xf6\xed\x21\x39\x9f\x6a\x7d\x0d\xfb\x17\xde\x6b\x9e\x01\xfd\
-\xa8\x35\x6f\x01\xb7\x8f\x3c\x55\xf1\x1b\xc3\xba\x87\xc3\x7d\x03\
-\xc6\x6d\x7d\xaf\x6a\x1f\x6f\x9a\xcf\x50\xb9\xb9\xbd\x82\x46\x8a\
-\x40\xa3\xcb\x86\xe9\x21\x59\x16\x20\x76\x21\x81\xcc\x61\x54\x90\
-\x3e\x98\xd5\x7e\x1d\xe8\xba\xef\x8b\x2d\x75\xeb\xdd\x2e\xc6\xeb\
-\x58\xb1\xb1\xb9\xd3\x20\xbc\x96\x10\xf2\x45\x6b\x70\xd1\x34\xf0\
-\x02\x7f\x82\x46\x82\x12\xcb\xd0\xf9\x6b\xe9\x5c\xdf\xc0\xaf\xd9\
-\x77\xe1\xe7\xec\xc1\x67\xa9\x5b\xfc\x3f\xf0\x5f\x87\x7c\x1f\x0e\
-\xb1\x3a\xcf\x7a\x9a\x5d\x9a\xdb\xfd\xa4\xa2\x95\x8c\x12\x39\xd9\
-\x1a\x92\xa8\x83\xe5\x40\x48\x50\xa0\x91\x4e\x3a\x7d\xc4\xbb\xdc\
-\xe7\xfe\x23\xfe\xc2\x7e\x01\xf8\xb3\xe3\x9d\x43\xc4\x5a\xc4\xdf\
-\x10\x97\x52\xd4\xd9\x1e\x71\xa7\xf8\xff\x00\x5d\xd3\x6d\xb2\xa8\
-\xa8\x36\x5b\xdb\xde\x47\x14\x63\x6a\x8c\x84\x40\x09\xc9\x39\x24\
-\x93\xc7\xf8\xdb\xfe\x09\xb5\xf0\xc6\xcf\xc1\xfa\xb4\x8b\x71\xf1\
-\x49\x9a\x2b\x29\x9d\x43\x7c\x50\xf1\x2b\x2e\x42\x37\x50\x6f\xf9\
-\x1e\xc7\xad\x7d\x22\xae\x5b\xa2\xfe\xb5\x95\xe3\xa5\x69\x7c\x19\
-\xac\x28\x53\xb9\xac\x66\x00\x01\x9c\xfc\x8d\x4c\xa3\xf2\xa9\x7f\
-\x62\x9f\x01\x84\x5f\x9f\xc7\x9f\xf8\x5f\x6b\xb8\xff\x00\xd2\xca\
-\xe3\x3e\x3f\xf8\x1e\xc3\xc0\xb1\x69\x7a\x6d\xb7\xda\x9b\x4e\xb5\
-\xb4\x58\xa3\x37\x57\x12\xde\x48\xa1\x4f\x1b\xe6\x99\x9e\x47\x63\
-\x9f\xbc\xcc\x4d\x7d\x21\x71\xa7\x4c\x82\x30\x96\xf3\x72\x3a\x6c\
-\x3e\x9f\x4a\xf1\xff\x00\xda\xc3\x4b\x74\xd1\xb4\xfb\xc5\x59\x16\
-\x78\xe4\x31\x32\xe3\x19\x1d\x79\xff\x00\x0a\xf8\xde\x3a\xc2\x7b\
-\x7c\xa2\xa2\xbe\xd6\x7f\x73\x3d\x0c\xba\x7c\xb5\xa2\x7c\xeb\x3c\
-\x32\xda\xa7\xee\x64\x59\x22\x6e\x16\x29\x4e\x46\x3d\x8d\x51\x36\
-\xd6\xb3\xdd\xfc\xd9\xb2\x9f\x39\xc1\x3c\x13\xec\x6a\xf3\x4d\x14\
-\xad\xb9\x7f\xd1\xe4\x63\xc9\x51\x95\x3f\x54\xff\x00\x0a\x8e\x71\
-\x88\xb1\x71\x12\xbc\x3d\x03\x2f\xcc\xa3\xfa\xaf\xe3\x5f\xcd\x32\
-\xbc\x4f\xb0\xe9\xa1\xdb\x5e\x7c\x60\xd1\xed\x12\xda\x08\xda\x7d\
-\x2b\x52\x8f\xe5\x79\xb0\xc6\x29\xfd\xc9\xfe\x13\xdf\x3c\xe7\xda\
-\xae\x49\xe3\x7b\x1f\x12\xdb\xaa\x6b\x96\x76\xf7\x4a\xfd\x2e\x63\
-\x3f\x38\x1e\xcc\x3b\xd7\x98\xf8\xcf\x47\xbc\xd3\x21\xd3\xee\x96\
-\x28\xe5\xb3\xb9\x88\x90\x08\xf4\x38\xe1\xbf\x0a\xa5\xa6\xde\x47\
-\x0c\x9b\xac\xee\x25\xd3\x65\xef\x0c\x87\x31\xb1\xfa\x1e\x3f\x4a\
-\xf1\xea\x60\xe3\x59\xb5\x2d\xff\x00\xad\xec\x69\xc8\x92\x4d\x1e\
-\x9f\x77\xf0\xbe\x1b\xe4\x33\x68\x97\xab\x78\xa7\x9f\x26\x52\x15\
-\xd4\x7a\x67\x80\x6b\x9b\xbd\xd2\x2e\x34\xab\xa6\x86\xe2\x19\x20\
-\x91\x3f\x85\xd7\x07\xfc\xfd\x2b\x3e\xc7\xc6\x17\x5a\x34\xeb\xf6\
-\xa8\xa4\xb6\x6c\x71\x34\x47\x2a\xde\xe4\x75\xfc\xbf\x2a\xf5\xbf\
-\x85\xbe\x27\x9b\xc5\x9a\x74\xd7\x1a\x86\x9f\x6b\xae\x69\x96\xe9\
-\xb0\x33\xba\xe7\x7b\x11\xf2\xf3\xdf\xbe\x0f\x35\xe1\x62\xb2\x56\
-\x9d\xe3\xa1\x7e\xda\x70\xdf\x53\xcd\xe0\x8d\x86\xdf\xa7\x6a\x7d\
-\xda\x96\x45\x6c\x2e\x14\xe2\xbd\x0f\xc4\x3f\x0e\xb4\xdd\x6e\xf2\
-\x69\xb4\x9b\x8f\xec\xfb\x96\x6c\x8b\x19\xcf\x0b\x9e\xc8\xf9\xe4\
-\x57\x1d\xae\xf8\x5e\xfb\x40\x8c\xc7\x7d\x6f\x24\x0d\x9c\x82\xc0\
-\xed\xfc\x0f\x7f\xc2\xbe\x7b\x11\x85\xa9\x49\xeb\xaa\xef\xfd\x6d\
-\xf3\x3b\x28\xe2\x23\x2f\x53\x26\x31\xd0\xb6\xea\x9a\x24\x67\xe3\
-\xee\xe6\x9b\xb7\xd4\x6e\xfd\x33\x52\xc4\xbe\x6f\xb7\xbd\x70\xcb\
-\xb9\xa9\x66\x05\x58\xf1\x9f\xe1\x18\xa8\x64\x1b\xa7\x38\x0b\x8e\
-\xf5\x34\x0a\x37\x2f\x1d\xb3\xf4\xa2\x44\x26\x50\x76\xd6\x3c\xd6\
-\x36\xe8\x22\x2f\xcd\x81\x9f\x5a\xb5\x1a\x60\xf3\xc7\xa6\x2a\x38\
-\x93\xd0\x63\xde\xac\xc0\xb8\xe7\x1b\xb1\x58\xce\x5a\x04\x77\x2b\
-\xdc\xaf\xef\x17\x6f\xf1\x7e\xb5\x0c\xcb\x8e\xbf\x7b\x3d\x05\x5b\
-\xd4\x13\xe6\x8d\x8e\x07\xe1\x55\x9a\x30\x83\x8a\xa8\xc9\x58\x72\
-\xd4\xcf\x99\x58\x9c\xd6\x6d\xe3\x0f\x30\xe3\xa8\xad\x6b\x9e\x63\
-\x6e\x31\xd4\xd6\x45\xc8\xf2\xe4\xcf\xde\xcd\x77\xd1\x20\x8d\x1b\
-\x23\xe6\x5d\xbe\xe2\xad\xd8\xf3\xfc\x78\xcf\x23\x35\x55\x65\xca\
-\xfd\xdc\x0e\xde\xe6\xac\x5a\x0d\xd2\x2e\xef\x96\xb6\x96\xc1\x6d\
-\x0d\x20\xaf\xf6\x78\xf2\xa0\xae\x3a\x8a\x09\x2b\xca\xe7\xe8\x4d\
-\x2c\x31\x19\x2d\x97\x6b\xf1\x9e\x14\x9e\x94\xff\x00\x2f\x2b\xb5\
-\xa3\x6c\x7b\x1a\x44\xc8\xab\x29\x52\xdf\x38\x1b\xbd\x45\x3a\xdc\
-\xc8\x12\x4d\x8c\x1b\x8e\x82\x9c\xd6\xf9\x3f\x29\x56\x0d\xd3\x70\
-\xeb\x50\xa8\xd9\xe6\x70\x63\x6d\xa3\x95\xe2\xb4\xa7\x23\x35\xe6\
-\x47\x2c\xb1\xb9\xf9\x94\xa4\x8b\xde\x81\xe6\x29\xfd\xdb\x2b\x7d\
-\x4e\x0d\x36\x46\x6f\x2c\xfc\xa2\x4f\xe6\x2a\xb9\x55\x2d\xf2\xb3\
-\x2b\x7a\x35\x77\x53\xa8\x9e\xe4\x4a\x2a\xe5\x94\xbe\x63\x3b\x2f\
-\x96\xca\xdb\x70\x0e\x30\x7f\x3a\xe8\x34\x2f\x11\xcd\xa6\x43\x1a\
-\x96\x56\x1b\x47\x0e\x31\xfa\xff\x00\x8d\x73\x90\xdf\xcf\x69\xb8\
-\xb2\x06\x5e\xa3\xbe\x6a\xd4\x62\x2b\xcf\x2d\xfc\xd6\x8d\xe4\x5c\
-\x9c\xf2\x01\xae\xea\x35\x22\x9a\x94\x1d\x9d\xcc\xa5\x4d\xb4\xee\
-\x76\x91\xeb\x76\x3a\x9c\x5b\x6f\x20\x55\x6f\xef\x1e\xdf\xf0\x21\
-\x53\xaf\x87\x55\xe3\x59\x34\xfd\x41\xa3\xc8\xfb\x8e\xdb\x94\x9f\
-\xad\x71\xcb\x71\x2e\x9e\xbb\x8b\xc7\x24\x67\xb8\x6c\xfe\x62\xb3\
-\xf5\x3f\x1c\x0b\x6d\xcb\x0b\x00\xc0\x7f\x03\x10\x05\x7a\x91\xcc\
-\x14\x23\xfb\xc5\x77\xfd\x76\x38\x65\x4e\xef\xdd\x3a\xcd\x65\x35\
-\x0b\x01\x24\x9a\x85\xac\x6f\x6e\xa3\x89\xd1\x83\x46\x47\xd4\x77\
-\xaf\x3f\xd6\x3c\x50\xb0\x33\x45\x6d\xbb\x6b\x1c\xb6\x33\xcd\x25\
-\xe7\x8d\x6e\xaf\x6c\x0c\x0c\xdb\xa1\x9b\xef\x23\x31\x2b\xf8\x55\
-\x9d\x4e\xce\xd6\x0f\x0c\xd8\xb3\x47\x0d\xbb\x34\x46\x41\x28\x1e\
-\x61\x90\x93\xf7\x59\xbb\x63\x1e\xe2\xb9\x65\x59\xd6\xd5\xe8\xfa\
-\x2f\xf8\x26\xde\xc7\x91\xae\x7f\xc0\xe5\xf5\xcb\x88\xee\xa7\xfd\
-\xcb\xce\xcb\xb4\x16\x0f\xc1\xc9\xf4\xc7\x6a\xaa\x7e\x78\xc0\xe7\
-\x8e\xbe\xf5\xd2\x5f\x78\x13\x50\x9b\x4c\x93\x50\x4f\x22\x68\xe3\
-\x18\x31\x23\x8f\x38\x27\x66\xd9\xd4\xa9\xf5\x1e\xf5\x82\xf1\x6d\
-\x4f\xe1\x1e\xc3\x9c\x7f\xf5\xfd\xab\xab\xd9\xca\x2a\x3c\xcb\x73\
-\x5a\x72\x83\x4f\x94\xae\xb6\xf9\x6e\x8b\x53\x58\x58\x7f\x68\xdf\
-\xc3\x00\x6d\xbe\x64\x8b\x1e\xe3\xfc\x39\x35\x34\x1a\x6b\x13\xba\
-\x5c\xc6\x9d\x8f\xaf\xd2\xb4\xfc\x25\x6c\x9a\x97\x8b\xb4\xbb\x38\
-\xd3\x0a\xd7\x2b\x9c\x8e\xb8\xe7\x26\xbd\xac\xb6\x9b\xad\x8a\xa7\
-\x49\x6b\x76\x97\xe2\x73\x56\x95\xa0\xda\x3d\xdf\x4c\xb2\xfb\x1e\
-\x9d\x04\x27\x91\x0c\x61\x07\x3d\x80\xc5\x36\xf6\x1c\x63\x6f\x42\
-\x09\xf7\xab\x52\x2e\xd6\xda\x54\x91\xef\x55\xa5\x8d\x88\x6e\x31\
-\x8e\x9c\x74\xaf\xec\xac\x3c\x54\x29\xc6\x0b\xa2\xb1\xf0\x32\xd5\
-\xb6\xca\xcc\xa3\x6e\x3d\xb8\xaf\xab\xbf\xe0\x91\x0b\x8f\x89\x7e\
-\x38\xff\x00\x6b\x4c\xb5\xc7\xfd\xfe\x96\xbe\x51\x96\x26\x41\xc8\
-\xe5\x47\x15\xf5\x97\xfc\x12\x28\x63\xe2\x57\x8d\x78\xc7\xfc\x4b\
-\x2d\x7f\xf4\x6c\x95\xd1\x1d\xc8\x67\xde\x14\x50\x06\x05\x15\x42\
-\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\
-\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\
-\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x1b\x21\xc2\x1a\
-\xf9\xa7\xf6\xc3\xbb\xf1\xa7\x86\xbf\x69\x3f\xd9\xf6\xfb\x4e\xf1\
-\xb5\xf6\x93\xe1\x2d\x43\xc6\xcb\xa3\xdf\xf8\x7a\xca\xdd\x63\x1a\
-\xc3\xbe\x99\xa9\x4a\x5e\xea\xe0\x92\xef\x12\x79\x31\xec\x85\x02\
-\x2e\xfc\xb3\x17\xda\x81\x7e\x98\x27\x68\xac\x7f\x12\xf8\x4b\x47\
-\xf1\x6d\xd6\x93\x71\xa9\x69\xb6\x7a\x84\xda\x15\xe0\xd4\x34\xf9\
-\x27\x84\x3b\x59\x5c\x08\xde\x21\x34\x79\x1f\x2b\xec\x96\x45\xdc\
-\x39\xc3\xb0\xef\x53\x25\xb0\x1f\x9e\xbf\xb5\x37\xc5\x0f\x18\x7e\
-\xcc\x7f\x14\xe4\xf8\x81\xe0\x9f\x88\xba\xc7\x8b\xb4\x9f\x18\x68\
-\xfe\x35\xb5\x8a\xf3\xfe\x12\x56\xd5\xa0\xb8\xd7\xec\xb4\xfb\xeb\
-\xcb\x5d\x38\xe8\xc5\x05\xad\x95\xad\x82\x69\xd3\x0f\xb4\xdb\x96\
-\x99\xe5\x4f\x2a\x74\xc4\xa6\x5a\xf6\x3f\xd8\x8d\xae\xfe\x1f\xfe\
-\xd4\x7a\xc7\x82\x74\xbf\x19\xf8\xab\xc7\x5e\x13\xd4\xbe\x1a\x78\
-\x7b\xc6\x53\xdd\xeb\xba\xe4\xfa\xcc\xb6\xda\x9d\xd5\xc5\xf4\x2f\
-\x3c\x73\x4a\xee\x63\x4b\xc8\xe0\x12\xf9\x2a\x44\x4a\xd6\xe4\xc4\
-\x88\xa5\x81\xf7\xbf\x0f\x7e\xcc\x7f\x0d\xfc\x21\xf1\x7b\x56\xf8\
-\x81\xa5\xf8\x17\xc2\x7a\x7f\x8d\xbc\x41\x13\x41\xa8\xeb\xb6\xfa\
-\x54\x51\xdf\x5e\xa3\x6d\xde\x1e\x50\xbb\x8e\xfd\x89\xbb\x9f\x9b\
-\x62\xee\xce\x05\x4d\xf0\x5b\xf6\x71\xf8\x7d\xfb\x37\xd8\xea\x16\
-\x7e\x01\xf0\x5f\x86\x7c\x17\x6b\xac\x5d\x7d\xb2\xf6\x2d\x1b\x4e\
-\x8e\xcd\x6e\xa5\xc6\xd0\xee\x11\x46\xe2\x07\xca\x07\x45\x1c\x00\
-\x07\x14\xe3\xa6\x82\x96\xba\xaf\xeb\x63\x93\xf8\x95\xff\x00\x04\
-\xf7\xf8\x4b\xf1\x87\xc7\x5a\x8f\x89\xbc\x45\xe1\x7b\xbb\xed\x6b\
-\x56\x65\x92\xea\x74\xd7\xb5\x1b\x75\x91\x95\x15\x06\x23\x8a\x75\
-\x45\xf9\x55\x47\xca\xa3\xa6\x7a\xe4\xd7\x21\xe3\x1f\xf8\x25\xaf\
-\xc0\xcb\x3f\x09\xea\x92\xaf\x83\x6f\x77\x47\x67\x2b\x8c\xf8\x9b\
-\x56\x23\x21\x09\x1f\xf2\xf3\xed\x5f\x40\x5f\x7c\x41\xd0\x34\x7b\
-\xd9\x2d\xae\xf5\xcd\x1e\xd6\xe2\x23\x87\x8a\x6b\xd8\xd2\x44\xcf\
-\x3c\xa9\x39\x1c\x1c\xf3\xeb\x58\xde\x38\xf8\x9b\xe1\xbb\x8f\x07\
-\x6a\xc8\x9e\x22\xd0\x59\x9a\xca\x60\x07\xf6\x84\x3c\x9d\x87\xfd\
-\xaa\x7d\x06\x7e\x63\x27\xec\x13\xf0\x9d\xc2\x33\x78\x4e\x40\xbc\
-\x70\x35\xcd\x4f\x23\xff\x00\x26\x6b\x4f\xe2\xe7\x80\xb4\xdf\x04\
-\x7c\x14\xb7\xd2\xf4\x7b\x31\x6d\x63\xa2\xa2\xc5\x69\x6e\x66\x92\
-\x63\x1c\x7e\x9b\x9d\x99\xdb\xaf\x56\x62\x7d\xeb\xd1\xa1\xf1\x4e\
-\x93\xe5\xaf\xfc\x4e\x34\x9e\x98\xcf\xdb\x62\xe4\xff\x00\xdf\x55\
-\x93\xf1\x3a\x25\xd5\xbe\x1e\xdf\x1b\x66\x8e\x75\x68\xb7\xc7\x24\
-\x6c\x1d\x5b\xa6\x08\x23\x82\x3d\xc5\x78\xf9\xd5\x1f\x6b\x80\xab\
-\x4d\xf5\x8b\xfc\x8e\x8a\x32\xe5\xa9\x17\xe6\x7c\x6b\x79\x05\x9e\
-\xaf\x33\x79\x7b\xad\xe7\xfe\xe9\xf5\xfa\xd5\x09\xec\xee\xb4\xa9\
-\x7b\xed\x53\xd4\x0c\xf1\x5b\xbe\x22\xb3\x8e\xe6\xe5\xfc\xe8\xca\
-\x36\x49\x0f\x18\xfe\x63\xfc\x2b\x35\x5a\xe7\x4c\x41\xb1\xbe\xd3\
-\x6c\xbf\x74\x13\x9f\xa6\x0f\xf4\xaf\xe5\x1a\x8d\xc5\xf2\xa3\xee\
-\x23\xb6\x83\xfc\x4b\xe3\xfd\x43\x51\xd0\xe0\xfb\x45\x9d\xad\xdd\
-\x9c\x3b\x60\x50\x17\x6f\x95\x81\x9e\x6a\x84\x2b\xa1\x78\x8e\x16\
-\x8d\x77\x69\xb3\x37\x44\x95\x77\x44\xc7\xaf\x0d\xdb\xf1\xad\xad\
-\x56\xc6\xeb\x55\xf8\x72\xd3\x58\xdb\x88\x62\x82\xef\x6b\x79\x89\
-\xf7\x98\x83\x91\x9e\xf8\x00\x57\x1f\x6f\x1a\xec\xdb\x71\x13\x5b\
-\xb1\xe3\x76\x32\xa7\xf0\xc5\x79\x71\xb4\x6a\xb8\xec\x6d\x05\x78\
-\x1a\x97\x9a\x06\xa1\xe1\xc8\xf7\x2e\x24\xb7\xc1\x18\x73\xba\x26\
-\x1e\xc4\x74\xfa\x7f\x3a\xe9\xbc\x2f\xa1\x6a\xed\xe0\x3b\xfd\x57\
-\x4d\x59\x74\xd8\xed\x66\xff\x00\x96\xcb\xfb\x89\xe5\x03\x9d\xad\
-\xdc\x80\xdd\x3d\xc5\x72\xfa\x75\xfd\xf6\x84\x99\xb5\x9b\x75\xbb\
-\x0c\x15\x3f\x3c\x67\xf0\xae\xa2\xdc\xdf\x7c\x4c\xf0\x65\xd5\x92\
-\xb0\xb1\xb5\xd2\x63\x37\x05\x7c\xd0\x21\x3b\x8e\x30\xa0\x9f\xbc\
-\x49\x3c\x0e\x7a\x9a\x9c\x5c\x5f\xb2\x7c\xd6\x7e\x6f\xa1\x36\x69\
-\xab\x98\xba\x6f\xc7\x7d\x5f\x48\x99\xa1\xd6\x6d\x63\xbd\xb7\x57\
-\xdc\xde\x58\xc8\x5f\x75\x3d\xbf\x03\x5e\x8d\xe1\x1f\x8c\x5a\x7f\
-\x8a\x2c\x9a\x28\x2e\xe3\x9a\x29\x08\x1f\x63\xbf\x39\xc7\xb0\x6e\
-\xd5\xe3\x36\x69\x79\xe1\xb6\x6b\x79\x2d\xd2\xee\xdd\x88\x25\x1d\
-\x7a\x0c\xf5\x56\xea\x3f\xfa\xf4\xf1\xa1\x69\xba\xcc\xc2\x4b\x39\
-\x4d\x9d\xc0\x3b\x96\x29\x70\xac\x0f\xb3\x63\x1f\xca\xb8\xa9\xe1\
-\xe9\xd5\xa7\x76\x6d\x5a\x9c\x6f\xb1\xed\xf7\xde\x06\xd2\x35\x77\
-\xc5\xab\xbe\x8d\x74\xdc\x08\xa5\xf9\xa0\x7f\x70\xdd\xab\x9d\xd5\
-\xfc\x13\xa8\xf8\x6d\x8f\xda\x20\x3b\x47\x02\x58\xce\xf8\xdb\xf1\
-\x1f\xd6\xb8\x8d\x1f\xc7\x5e\x20\xf0\x4f\xee\x2e\x57\xed\x96\xaa\
-\x31\xe5\xc8\xbc\xfe\x1e\xa3\xdc\x57\xad\xfc\x37\xf8\xce\x9a\x4f\
-\x87\x62\xd4\xa3\x55\x68\xae\x65\x65\x7b\x76\xff\x00\x5d\x12\x80\
-\x33\xb4\xb7\x1b\x49\xec\x0f\x38\x3c\xd7\x8d\x8e\xc9\xe1\xf1\xec\
-\xbb\xaf\x3f\x2e\xa4\xc2\xa5\x58\x68\xb5\x38\xf8\xa1\xe7\x72\xe3\
-\x00\x62\xa4\x9d\x16\x39\x57\xef\x70\x6b\xd2\xda\xe3\xc2\x3f\x15\
-\x37\x4b\x6f\x27\xf6\x5e\xa1\x23\x12\x48\x05\x55\x8f\xba\xf4\xfe\
-\x47\xeb\x5c\xef\x8b\xfe\x17\x6a\x5e\x1b\x0b\x32\xc2\x6e\xad\x40\
-\xcf\x9f\x0f\xcc\xa7\xea\x3a\x8f\xe5\x5f\x37\x8a\xcb\x6b\x52\x77\
-\x8f\xbd\x1e\xeb\xfc\xb7\x3b\xa8\xe2\xa3\x2f\x76\x5a\x33\x9a\x45\
-\xf3\x07\x1e\xb5\x2c\x0b\xb5\xdb\x14\x89\x1e\xde\x7e\xe8\xce\x4f\
-\xb1\xf4\xa9\xa2\x8f\x71\x0d\xf7\x6b\xc8\x9c\x91\xd1\x12\xb6\xa4\
-\xbf\x77\x9e\xbc\x7d\x2a\x0f\xbc\xde\xc3\xa5\x5c\xbe\x55\x44\x5c\
-\x74\xf5\xaa\xb2\x96\xe3\x1f\x7b\x35\x50\x7a\x1a\x49\x68\x51\xba\
-\x5d\xbb\x80\xe9\x8a\xc8\xb8\x5c\x38\xfc\xeb\x76\x6f\x99\x58\xd6\
-\x2d\xec\x79\x7f\xa1\xe6\xbd\x0c\x3b\x33\xea\x57\xd9\x96\x02\xac\
-\xda\x46\x4b\xf1\x51\x20\x28\x98\xc8\xfa\xd5\xa8\x8f\xcd\xf9\xd6\
-\xf2\x90\xec\x68\x5a\x47\x9b\x34\xf9\x7e\x86\xa7\x48\x9a\x35\xfe\
-\xf0\xfa\xf3\x4b\x69\x2e\xdb\x35\x00\xee\xe7\xd2\xad\x47\x1a\x3f\
-\x19\x65\x7c\x75\xac\x25\x27\x72\x24\x50\x9a\x08\xe5\x1c\xfc\xac\
-\x3f\x88\x54\x0b\x6d\x2c\x7b\xb7\x0f\x30\x15\xc0\xc7\x7a\xd7\x9b\
-\x4e\x93\x69\xda\x43\xaf\xb7\x6a\xac\xb6\xec\x97\x1b\x57\x86\xc6\
-\x7f\x9d\x74\xc6\x77\x31\x5b\x98\x86\x2d\xac\x31\xba\x36\xf4\x3d\
-\x4d\x43\x34\x67\x38\x91\x37\x8e\xc4\x56\xbc\xd1\xf9\xa0\xee\x5d\
-\xde\x86\xa8\xdc\xac\x1a\x72\x17\x92\x56\x1c\x7d\xdc\xe7\x35\xd9\
-\x0b\x6e\x67\x29\x28\xef\xb8\xcd\x07\xc3\xf7\xbe\x22\xd4\x3e\xcb\
-\xa6\x8f\x32\x66\x07\xe5\x62\x02\x9f\xc4\xf1\xf8\x55\xff\x00\x11\
-\x69\x6d\xe0\xd4\xb7\x5d\x4e\x17\x8e\xf3\xca\x0e\x23\x61\xb7\x20\
-\x8e\xde\xa3\xdc\x56\x3b\xf8\xc5\xad\x9b\x74\x2a\xd1\xaf\xb5\x75\
-\x7e\x1d\xf1\xc3\x6b\xbe\x07\x9a\xdf\x52\x89\xb5\x0b\x5b\x73\xf3\
-\x89\x93\x76\xdf\x40\xa7\xaa\x9f\x7c\xe2\xbd\x0c\x14\x23\x55\xb8\
-\xca\xf1\xec\xff\x00\xe0\x7e\xb7\x31\xad\xed\x12\xe6\xe9\xfd\x75\
-\x38\x0d\x57\x5f\x9e\xf9\xdb\x6e\x63\x8f\xb0\xf6\xaa\x11\x47\xb5\
-\x37\x72\xc6\xbb\x3b\x0f\x05\xe9\xfe\x26\xba\x59\xde\xf5\x74\x28\
-\x6f\x18\x88\x22\x74\x33\x02\x47\xa7\x39\xc1\xc1\xac\x3d\x6b\xc3\
-\x72\xe8\xba\x84\x96\x89\xfe\x95\x24\x63\x70\x78\x41\x60\xeb\xd9\
-\xb1\x8c\x8f\xc4\x0c\x57\x45\x6c\x2c\xe1\x05\x25\xaa\xf2\xdf\xe6\
-\xb7\x44\xd3\xab\x06\xf9\x56\x86\x1d\xd9\xdf\x1c\x7f\x29\x55\xce\
-\x2b\x63\x59\x56\x83\xc2\x16\x51\x9b\x88\xfc\xc9\xbe\x6d\x81\x7a\
-\x01\x91\xcf\xb9\xac\xb8\xad\x44\xec\xbb\x8c\x85\xf7\x61\x40\x19\
-\xad\xa7\xd1\x26\xf1\x0b\x5a\xd9\xdb\x79\x2f\x34\x79\xda\x85\xb6\
-\xb3\x63\xa8\x04\xf1\xc7\xa5\x18\x7a\x6e\x72\x51\x5b\x9b\x56\x92\
-\x4d\x1a\x7a\x35\xd6\x9f\x7b\xa3\xd8\xad\xd4\x91\xc5\x79\x1c\x8b\
-\xe4\x19\xd4\xf9\x72\x20\xfe\x12\xd9\xdb\xd0\x1e\x09\x42\x7a\xee\
-\xf4\xbf\xe2\x1d\x16\xc5\x34\xdb\xab\xcb\xbb\x18\x5a\x48\xf8\x8e\
-\x54\x9d\xbc\xcc\x76\x6c\x7f\x10\xff\x00\x7f\x9f\x76\xeb\x58\xf0\
-\x78\x6f\x54\xf0\xcc\x51\xf9\x96\xb2\x2c\xea\x3e\x40\x1d\x0f\x1c\
-\xe4\x1d\xd9\x4e\x40\x3c\x1e\xbc\x55\x9d\x40\xdb\xdd\x78\x46\xf4\
-\xc1\x31\x82\x35\xc0\x10\xc6\xca\x08\x7c\x1e\x1a\x36\xcb\x2f\xd5\
-\x3e\x42\x7d\x3a\x57\xd3\x61\xeb\x38\xe1\xe5\x4a\x68\xf2\x5c\x17\
-\x35\xe2\xce\x32\xe6\xe2\x4b\xe6\x66\x66\x3b\x73\x80\xb5\xd6\x7c\
-\x14\xd3\x23\x9b\xc7\xb0\xf9\xca\xdb\xa3\x8d\x99\x18\x7f\x09\xc7\
-\x7a\xe7\x99\x21\xb7\x89\x79\xf3\x25\x61\x93\x8f\xba\xbf\x4a\xef\
-\xff\x00\x67\x7d\x36\x4b\x8d\x6b\x50\xb8\x60\x36\xac\x62\x30\xc7\
-\xb1\xe6\xbe\x83\x82\x70\xae\xb6\x71\x42\x0b\x65\x24\xfd\x6c\x4e\
-\x61\x3b\x61\xe5\xe9\xf9\x9e\x9f\x3a\xee\x3d\xf3\x50\xcf\x08\xd9\
-\x9f\xc4\xd5\xd9\x20\xc0\xff\x00\x6b\xa6\x6a\xac\xb0\x93\xd2\xbf\
-\xad\x0f\x89\xe8\x53\x78\x32\x9b\xab\xea\xcf\xf8\x24\xa2\x79\x7f\
-\x13\x7c\x6b\xff\x00\x60\xcb\x6f\xfd\x1b\x25\x7c\xb6\xeb\xe4\xae\
-\xd0\x7f\x1f\x5a\xfa\xa3\xfe\x09\x34\x31\xf1\x2b\xc6\x7e\x9f\xd9\
-\x96\xd8\xff\x00\xbf\xb2\x55\x47\x70\x7d\xcf\xb9\xa8\xa2\x8a\xa2\
-\x42\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x04\x7f\xb8\x6b\
-\xe6\x4f\xdb\x26\xdf\xc5\x3a\x27\xed\x2f\xfb\x3c\xea\xd6\x7e\x38\
-\xd7\xb4\xaf\x0e\x5e\x78\xe1\x34\x8b\xbf\x0d\xd8\x85\xb7\xb5\xd5\
-\x4b\xe9\x7a\x9c\xad\x25\xdc\x83\xf7\x93\x22\xf9\x51\xed\x87\x22\
-\x30\xc3\x7b\x07\x60\x85\x3e\x9c\x23\x22\xb3\x75\xff\x00\x0a\x69\
-\xbe\x25\xb9\xd3\xa6\xd4\x34\xfb\x3b\xd9\xb4\x8b\xaf\xb6\xd9\x3c\
-\xf0\xac\x8d\x69\x38\x46\x41\x2c\x64\xfd\xd7\x09\x23\xae\xe1\xce\
-\x1d\x87\x73\x53\x25\xb5\xbc\x83\xa3\x3f\x3c\xfe\x2d\xea\x3a\xf7\
-\x86\xbe\x27\x7c\x4d\xf1\x8f\xc1\x7f\x1a\xfc\x44\xf1\x35\xdf\xc3\
-\xbd\x03\xc5\xb7\x9e\x32\xd7\xb5\x3f\x11\xdc\x5f\xe8\x9a\x86\xab\
-\xf6\x19\x9e\xc7\x43\xb1\xd3\xd9\xcd\xa1\x9e\xc6\x63\x14\x8c\xf6\
-\xf0\xaf\x92\xb6\xe6\x17\x77\x92\x69\x15\x7d\x5b\xf6\x12\x11\xf8\
-\x1b\xf6\xa5\xd7\xbc\x21\xe1\x9f\x19\xf8\xa7\xc7\x5e\x0e\xbe\xf8\
-\x69\xe1\xcf\x15\xde\xdc\xeb\x3e\x25\xbb\xf1\x01\xb6\xd5\x6e\xae\
-\x2f\xd0\xce\x93\xdc\x4b\x21\x8b\xed\x90\x44\xb2\xb4\x48\x44\x7f\
-\xb8\x0e\x88\xa1\x8e\xef\x78\xf0\x7f\xec\x5d\xf0\x97\xe1\xff\x00\
-\xc4\x71\xe3\x0d\x07\xe1\xaf\x81\xf4\x7f\x15\x79\xd3\xcf\xfd\xaf\
-\x67\xa2\xc1\x0d\xe0\x92\x7d\xfe\x7b\xf9\x8a\xa1\xb7\x49\xe6\x3e\
-\xe3\x9f\x9b\x7b\x67\x39\x35\xd0\x7c\x2d\xf8\x15\xe0\xbf\x81\x3a\
-\x7d\xf5\xb7\x82\xfc\x27\xe1\xcf\x08\xda\xea\x57\x2d\x7b\x79\x0e\
-\x8f\xa6\xc5\x65\x1d\xd4\xec\x30\x64\x71\x1a\x80\xcd\x8e\x32\x7b\
-\x71\xd2\x9c\x34\xfb\x82\x5a\xbb\xf9\xff\x00\x91\xcd\xf8\xe7\xf6\
-\x1a\xf8\x29\xf1\x57\xc5\xb7\xbe\x20\xf1\x47\xc1\xff\x00\x85\xbe\
-\x25\xd7\xb5\x26\x56\xbb\xd4\xf5\x5f\x0a\x58\x5e\x5e\x5d\x15\x55\
-\x45\x32\x4b\x24\x4c\xee\x42\xaa\xa8\x2c\x4e\x02\x81\xd0\x0a\xe5\
-\x7c\x67\xff\x00\x04\xe4\xfd\x9e\x6c\x3c\x29\xaa\x4f\x1f\xc0\x5f\
-\x82\xa9\x24\x36\x73\x3a\x9f\xf8\x41\xf4\xcf\x94\x84\x24\x1f\xf5\
-\x15\xea\x5a\xcf\xc7\x0f\x06\xf8\x5b\x56\x9b\x4f\xd5\x3c\x5d\xe1\
-\x7d\x36\xfe\xd8\x81\x35\xb5\xd6\xab\x04\x33\x44\x48\x04\x6e\x46\
-\x70\xc3\x82\x0f\x23\xa1\xac\x1f\x1c\x7e\xd0\xfe\x01\xbc\xf0\x66\
-\xb1\x14\x7e\x3a\xf0\x5b\x3c\x96\x53\x22\xff\x00\xc4\xf2\xdb\xa9\
-\x42\x07\xf1\xd3\x03\xe0\x1b\x5f\xd8\xe3\xe0\xd1\x8a\x36\xff\x00\
-\x85\x3f\xf0\x97\xe6\x1c\xff\x00\xc5\x1b\xa6\x73\xff\x00\x90\x2b\
-\xb2\xb4\xf0\x96\x9b\xe1\x6f\x07\xc7\xa2\xe8\x7a\x5e\x9b\xa3\xe9\
-\x76\x76\xe6\x1b\x5b\x1b\x0b\x54\xb5\xb5\xb5\x4c\x70\x91\xc5\x18\
-\x08\x8b\x92\x4e\xd5\x00\x73\x54\xec\x7e\x28\xf8\x4e\xda\xd6\x34\
-\x3e\x2e\xf0\x97\xca\x3f\xe8\x35\x6b\xff\x00\xc5\xd6\xf6\x9d\x7f\
-\x6f\xac\xd8\x43\x75\x67\x35\xbd\xe5\xad\xc2\xef\x8a\x78\x25\x12\
-\xc5\x2a\xff\x00\x78\x32\xe4\x1e\x7b\x8c\x8a\xc6\x51\xbc\x6c\xcd\
-\x16\x9b\x1f\x16\xf8\xa6\xc6\x7d\x2b\x52\x99\x5b\xf7\xb1\xc6\xe4\
-\x32\x93\xca\x1a\xc9\x83\x6d\xcb\x6e\xb7\x93\xc9\x91\xba\xaf\xf8\
-\x8a\xed\xbe\x2d\x78\x7e\x5d\x3f\xc6\x9a\x83\x41\x22\xb4\xab\x33\
-\x16\x40\x73\xc9\xf6\xae\x2e\xe2\x28\xa7\x62\x26\x5f\x26\x6f\xef\
-\x2f\x19\x35\xfc\x93\x9b\x52\x54\xf1\x55\x29\xf6\x6f\xd7\x7f\xc4\
-\xfb\x8a\x12\xbd\x35\x2f\x22\x65\xd3\xaf\x75\x1d\x1e\xea\x28\x66\
-\x5b\x5f\x25\x7c\xe3\x99\x3f\x74\xe7\xa7\x4e\xcd\xcd\x73\xba\x6e\
-\xb7\x71\x63\x1f\x97\x7f\x6a\xb7\x11\xe4\xa9\xdc\x3f\x3c\x57\x59\
-\xa7\xe8\x4d\x7b\xa6\x5e\x3d\xdd\xd2\x47\x6d\x1a\x6c\x0c\x0e\x19\
-\x98\xf4\xe3\xb8\xeb\x5c\xee\x9f\x63\x79\x63\x1e\x62\x6f\xb4\x43\
-\x9e\x55\x86\xf0\x47\xf4\xaf\x9a\x94\x92\xae\xe2\xbb\x1d\x94\xfe\
-\x17\x70\x83\x45\xb4\xbf\x5f\x37\x4b\xb8\x16\xf2\xf7\x89\xba\x1a\
-\xb3\xa4\x4b\x79\x6c\xd3\x69\xf2\x34\x96\x22\xe0\x17\x66\x45\xdc\
-\x92\x95\x52\x46\x47\xa7\x18\xfc\x6a\x01\xa6\x59\xea\x0f\xfb\xb2\
-\xda\x7d\xd7\x50\x18\xfc\x87\xe8\x6b\xa2\xf0\x1e\x95\x75\xa9\x6b\
-\xcb\x67\xa8\xcf\x05\xbd\xac\x6b\xe7\x49\x34\xd2\x60\x32\x2e\x32\
-\xab\x91\xf7\x8f\xa0\xf7\xad\x6a\x24\xe1\x67\xb7\x99\x32\x7d\xce\
-\x16\x0d\x5f\x54\xd2\xb5\x37\x32\x2d\xb6\xa9\x6c\xc3\x20\x05\xdd\
-\x9f\x4c\x1e\xa0\xd6\xa0\x7d\x1f\xc5\x44\x0d\xbf\x63\xba\x61\x8d\
-\xae\x02\xe0\xfa\x55\x5f\x12\xf8\x39\x74\x5f\x11\x5c\x5c\xf8\x7e\
-\xea\x46\x83\xcc\x3b\x70\x77\x1c\x64\xf0\xcb\xd3\xf3\xa1\x35\xc8\
-\x35\x15\xf2\x75\xcb\x1d\x92\x2f\x02\xe2\x11\xb5\x87\xb9\x03\xd2\
-\xb9\x30\xb5\x3d\xce\x54\x74\xd4\xd6\xd2\x45\xa9\x34\xdd\x4b\x46\
-\x8c\x2e\xd5\xbe\xb7\xce\x76\x4a\x37\x05\xff\x00\x3f\x85\x68\x5f\
-\xfc\x35\xfe\xd4\xf8\x6b\x26\xbc\x63\x93\x4d\xb6\x69\x4c\x30\xac\
-\xc3\x02\x52\xbf\x78\xa3\x67\x38\x19\xc7\x3d\x7b\x53\x6c\x6c\x6f\
-\xad\x20\x59\x74\xcb\xa5\xd4\xac\xff\x00\xe7\x9b\xf2\xc3\xfa\x8a\
-\xda\xbe\xb7\xb7\xf1\x37\xc3\xbb\xa1\x74\xd2\x09\x21\x95\x62\x86\
-\xc4\xb3\x07\x84\xf5\x32\x0c\x0c\x15\x3d\x39\xc7\x23\xa7\x15\x78\
-\x8a\xca\x34\x9f\xf5\xff\x00\x0f\xe4\x73\xdb\xde\x5e\xa7\x03\xe1\
-\xe7\xbc\xd3\x6d\x56\x5b\x7b\xa9\x17\x6b\xe1\x77\x36\x50\xf1\xfd\
-\xee\xa3\xf1\xaf\x44\xf0\x4f\xed\x0b\xad\x78\x3d\xa2\x86\xfb\xcc\
-\x36\xe4\x73\xb8\xe5\x5c\x7b\x1e\x84\x57\x1d\xa1\xe9\x73\x5b\xac\
-\x96\x96\xcd\x1f\xca\x4b\x7d\x9e\x65\xda\x72\x7f\xba\x7a\xfe\x59\
-\x14\xdb\x9b\xc9\x34\x5b\x93\x15\xcd\xbb\xdb\xac\x9f\xde\x4d\xca\
-\xfe\xbe\xc7\xea\x31\x5c\x74\xf9\x6a\x69\x38\xfc\xff\x00\xaf\xc8\
-\xda\xb4\x53\x76\x7a\x9e\xef\xa7\x78\x87\xc2\x3f\x14\x61\x12\x48\
-\xb1\xe9\x37\xec\x31\xe6\x46\x30\xbb\xbd\xc5\x53\xd7\x7e\x17\xea\
-\x3a\x37\xef\xa1\xd9\xa9\x5a\xb1\xf9\x24\xb7\x3b\x8f\xe2\x3b\x7d\
-\x2b\xc9\xbc\x29\xe1\x59\xbc\x49\xaa\x2c\x1a\x22\xb2\xdd\x48\x03\
-\x2c\x60\x96\x89\x40\xee\x4f\x55\x1e\xe7\x8a\xf4\x5f\x05\xf8\xa3\
-\x5c\xf0\x4e\xa3\x75\x6f\x7a\xcb\x75\x25\xb4\x2d\x37\x97\x0c\xa2\
-\x58\x40\x18\xe4\xb0\xe0\xf3\x8c\x01\xcf\x73\xe9\x5e\x7e\x3b\x25\
-\xa7\x51\x7b\x49\xab\x79\xad\x3f\xe0\x33\x28\xd6\x95\x37\x68\xbf\
-\x93\x32\xf5\x9b\x59\x2d\xce\xd9\x15\xa3\x2a\x79\x57\x5d\xa7\xf2\
-\xaa\x32\x2e\x13\xe6\xe3\xf0\xaf\x4c\x7f\x1e\x68\x1f\x18\x6c\xa1\
-\x4d\x49\x56\xd7\x50\x62\x76\xcf\x0c\x7b\x1a\x32\x3b\x7a\x38\xfd\
-\x6b\x9b\xf1\x07\xc2\xbb\xed\x36\xdd\xae\xec\xf6\x6a\x96\x78\x2d\
-\xe6\xc0\x77\x32\x0f\xf6\x97\xa8\x35\xf3\x75\xb2\x89\xc1\x73\x51\
-\xf7\x97\xe3\xf7\x7f\x91\xdd\x0c\x62\x7a\x54\xd1\x9c\x6d\xc1\xda\
-\x0f\xa7\xa7\xa5\x64\x5e\xae\x25\x3e\xe7\xf2\xad\x9b\x95\x28\x70\
-\xca\x47\x4a\xc7\xd4\x17\xf7\xdc\x7a\xe3\xeb\x5c\xf4\x15\x99\xb5\
-\xc8\x51\x37\xb6\x08\xe3\xae\x6a\xd5\xb8\x51\x51\xa7\x2a\xbd\xea\
-\x48\xd7\x27\xae\x3a\xf1\xe9\x5a\xc9\x9a\x2e\xe6\xb5\xac\x41\xad\
-\xa3\xe7\x69\xfa\xd5\xe8\x22\x65\x8f\xaa\xb2\xe7\x39\x3d\xaa\x95\
-\xb9\x63\x1c\x2b\xb5\xb9\xe0\x63\xbd\x79\xff\x00\xc4\xef\xda\xcb\
-\xc3\x9f\x0b\xf5\x2f\xec\x7b\x3f\x3f\xc4\x9e\x28\x63\xb1\x34\x8d\
-\x3b\xe7\x68\xdb\xfe\x9b\xc9\xf7\x62\x1e\xb9\xc9\xf4\x15\xae\x0f\
-\x2f\xc4\xe3\x2a\xfb\x2c\x34\x1c\x9f\xe4\xbb\xb7\xb2\x5e\x6c\xc6\
-\xb5\x48\xc5\x5e\x47\xa7\xde\xea\x96\xba\x46\x9d\x71\x75\x75\x73\
-\x6f\x67\x6d\x6e\xbb\xe6\x96\x79\x04\x71\xc2\xbd\xcb\x33\x10\x14\
-\x7b\x92\x3a\x8a\xf2\x9f\x11\x7e\xd7\x9a\x3e\xa5\xaf\xae\x93\xe0\
-\xdd\x39\xbc\x6b\x78\x24\x48\xa7\xbd\xb5\x97\xc9\xd3\x6c\x97\x39\
-\x62\xd7\x38\x21\xd8\x2f\x3b\x50\x1c\xf1\x92\x2b\xcb\xfc\x4f\xa0\
-\xf8\xb3\xf6\x8d\xba\x8e\x6f\x88\x1a\x84\x30\xe8\xb1\x48\x24\x83\
-\xc3\xba\x71\x29\x67\x19\x1d\x0c\xd2\x0c\x34\xcd\x8f\xef\x12\x3d\
-\x00\xc5\x7a\x97\xec\xf7\xf0\xdf\xc1\x7e\x0b\xd4\x2f\x22\x5d\x06\
-\xdd\x6d\x9c\x72\x96\xb3\x49\x0b\x12\x46\x33\xc3\x60\x91\xea\x41\
-\x35\xf7\x59\x6e\x43\x97\xd1\x5c\x98\xa9\xf3\xd5\xb6\x89\x5f\xd9\
-\xa7\xe6\xd5\x9b\xf9\x69\x7e\xac\xf3\x6a\xd6\xab\x6e\x78\xab\x2f\
-\xc4\xe8\xb5\x4f\x19\xee\xf9\x6d\xd7\x6b\x30\x07\x23\xf4\xac\x59\
-\x04\x97\xf3\x6e\x92\x46\x62\x4f\x39\x3d\x2b\xd2\xae\x3e\x05\x69\
-\xba\xf2\x99\xbc\x39\xac\x42\xd2\xb0\xdc\xb6\x37\xff\x00\xb9\x97\
-\x3f\xdd\x57\xfb\xa7\xfe\x05\x8c\xfa\xd7\x25\xaf\x78\x27\x51\xf0\
-\x95\xef\xd9\xf5\x7b\x29\xec\x66\xec\x24\x5c\x2b\x7b\xa9\xe8\x47\
-\xd0\x9a\xf2\xf1\xb9\x5d\x7c\x32\xe6\x94\x74\xee\xb5\x5f\xf0\x3e\
-\x65\x61\xeb\x52\x9e\x91\xdf\xcf\x73\x1a\xea\x55\x8d\x36\xaa\xee\
-\x3e\x80\x56\x97\x87\x31\x75\x67\x71\x6f\x24\x8d\x6f\x0e\x44\x8e\
-\x0c\x81\x77\x01\xda\xb3\xf5\x49\x0c\x41\x42\x7c\xbf\x4e\xa6\x8d\
-\x3a\x39\xae\x9d\x22\x4f\x9b\xcc\x24\xe0\x8c\x74\xff\x00\x3d\x6b\
-\xcf\xa3\x27\x73\xb2\xa4\x6f\x03\xa4\xb7\x30\xfd\xb3\x4d\xfb\x3f\
-\x99\x1c\x33\x10\x96\xd3\x4e\xc1\x7e\xce\xc4\xf3\x8c\x70\xd4\xb7\
-\x77\x73\x68\xfe\x25\xd4\x37\x2c\xcb\x21\x4d\x8c\x76\xec\x24\x03\
-\xd0\x7b\x71\xeb\x56\x34\x8b\x53\xa3\xc5\x1d\xba\xc3\x6b\x7f\x70\
-\xea\x5a\x68\xe4\xf9\xe3\x50\x4f\xca\xca\x7a\x02\x06\x0e\x78\x35\
-\x83\xac\xde\xc9\x7f\x3c\x91\x33\x37\xdb\x19\xce\xe6\x66\x18\x3f\
-\x4c\x0a\xf5\x65\x59\x7b\x35\x17\xdf\xa6\xde\x87\x9d\x1a\x6d\xcc\
-\x8b\xc3\x6c\xb0\xea\x2d\x34\x8a\x8f\x36\xf3\x22\x82\x7e\x55\x03\
-\x24\xf5\xef\x5b\x50\x6a\x50\xc1\xa6\x4b\x6c\xf0\xb4\x86\xee\x47\
-\x9a\x40\xab\xf3\x0e\xb8\xf9\xba\xf5\xe7\x8f\x5a\xe6\xee\x62\xfe\
-\xcc\x48\xe3\x46\xdd\x71\x9f\xde\x30\x3f\x28\xcf\x6a\x72\xc8\x97\
-\x4f\x1f\xda\x1b\x76\xf7\xf2\xd8\x02\x72\x3f\xda\xfa\x64\x0f\xce\
-\x9e\x1e\x4e\x9f\x36\xba\x97\x5a\x9f\x36\xbd\x0d\xab\x9d\x7e\x26\
-\xf0\xd3\x43\x24\xda\x84\x57\x31\xc6\xa9\x0a\x5c\x0c\xb2\xf3\x9e\
-\xb8\xc3\xaf\x6f\x9b\x06\xb2\xff\x00\xb6\x7f\xb4\xed\x7e\xcf\x36\
-\x9f\x6d\x24\x8e\x76\x87\x45\x2a\x84\x7a\xed\x1d\xfe\x9c\x7b\x50\
-\x35\x1b\x7b\xb9\x16\xda\xfd\xae\x19\x15\x88\xdc\x99\x6d\xd8\xfb\
-\xbc\x1e\x78\xad\xa5\xd2\xad\x7c\x3d\x61\x25\xe4\x57\x56\x77\x12\
-\x48\x9b\x21\x40\xcd\xbd\x33\xd5\x8f\xd3\xa6\x0f\x3d\x78\xaf\x4e\
-\x32\x93\x6d\xc6\x5a\x3e\xe7\x3f\x2a\x8a\xb3\x5a\x9c\xdb\xe9\x2b\
-\x1d\xec\x91\xee\x8f\x6a\xf1\xbc\x74\x1e\xd5\xea\x5f\xb3\xb5\xac\
-\x8f\xa2\x6a\x2c\x07\xee\x7c\xf1\xb0\x9f\x61\xcd\x79\x6d\xcc\xfb\
-\xc8\x5e\x8a\xbd\x78\xaf\x6c\xf8\x0f\xa7\xb5\x9f\xc3\xd8\x5b\x6f\
-\xcd\x71\x23\x3e\xe1\xdf\x24\x57\xe9\x5e\x17\xe1\xdd\x4c\xe5\x54\
-\x5b\x45\x37\xf8\x58\xf3\x33\x6b\xac\x3e\xbe\x47\x51\x34\x1c\xff\
-\x00\xf5\xb3\x51\xbc\x7e\x59\x1d\x1b\x8f\x4a\xb8\x60\xdc\x1b\x2b\
-\xd7\x91\xcf\x5a\xae\xf1\xb7\xcc\x48\xc6\xde\x2b\xfa\x4e\x29\xad\
-\x0f\x96\x29\xcf\x6f\xbf\xb0\xf5\xe9\x5f\x51\x7f\xc1\x28\x20\x68\
-\x3e\x24\x78\xcb\x3f\xf4\x0d\xb6\xff\x00\xd1\xb2\x57\xcc\xb2\x21\
-\x55\xce\x39\xc7\x35\xf5\x07\xfc\x12\xaf\x9f\x89\x3e\x32\xff\x00\
-\xb0\x6d\xb7\xfe\x8d\x92\xb4\x89\x2f\x63\xed\xca\x28\xa2\xa8\x90\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x01\xb2\x0d\xc8\x6b\
-\xe6\x1f\xdb\x57\x41\xd6\xf4\xbf\xda\x6b\xf6\x73\xd7\x21\xf1\xa7\
-\x89\x34\xfd\x1e\x6f\x1d\xa6\x93\x27\x87\x2c\xe6\x4b\x7d\x3a\xfd\
-\x9f\x4a\xd5\x24\x79\xae\x76\xaf\x9b\x70\xc3\xcb\x8c\x24\x6c\xfe\
-\x52\xed\x2d\xb1\x9b\x6b\x2f\xd3\xec\xdb\x57\x35\x43\x56\xd1\xec\
-\x35\xb9\xec\xe5\xbc\xb1\xb5\xbc\x93\x4f\x9b\xed\x36\xad\x34\x02\
-\x46\xb5\x97\x6b\x28\x91\x09\x1f\x23\xed\x76\x1b\x86\x0e\x19\x87\
-\x73\x53\x25\xb0\x74\x67\xc4\xff\x00\xb4\x8e\xa1\xe3\xcf\x84\xbf\
-\xb4\xff\x00\xc7\x1d\x5b\x41\xf1\xa7\x8b\x35\xcd\x66\x6f\x81\xda\
-\x96\xb7\xa0\xe9\x32\xc9\x1f\xd8\x74\x3b\x88\x6e\xa5\x10\x7d\x92\
-\xd6\x34\x55\x32\x03\xc9\x96\x4f\x32\x49\x0e\xd1\xb8\x28\x54\x1a\
-\x1f\xf0\x4f\x5f\xec\x3f\x0b\x7e\xd3\x9a\xf7\x87\x7e\x1d\xf8\xaf\
-\x54\xf1\x7f\x80\x6f\x3e\x1a\xf8\x73\xc4\x5a\x8c\xf7\x7e\x21\x9f\
-\x5c\x58\x35\xab\x89\xef\x97\xcf\x12\xcb\x2c\x9e\x5c\xb7\x56\xf1\
-\xac\x92\x22\x90\x1b\xc9\x8d\xf6\xae\x72\xdf\x62\x8d\x12\xc4\xeb\
-\x7f\xda\x7f\x61\xb5\xfe\xd0\x68\x3e\xc9\xf6\xbf\x21\x7c\xf3\x0e\
-\xed\xde\x5e\xfc\x6e\xd9\xbb\x9d\xb9\xc6\x79\xc5\x67\x78\x0f\xe1\
-\x87\x86\x3e\x14\xda\xdd\x5b\xf8\x63\xc3\x7a\x17\x86\xed\xef\xee\
-\x5a\xf6\xea\x2d\x2f\x4e\x8a\xce\x3b\xa9\xdb\xef\x4a\xe2\x35\x50\
-\xce\x7b\xb1\xe4\xd1\x0b\xc7\xee\xfd\x5b\xfd\x7f\x01\x4b\x5f\xbf\
-\xfc\x8e\x5f\xc6\x1f\xb1\xc7\xc2\x3f\x89\x3e\x28\xbc\xd7\x3c\x45\
-\xf0\xb3\xe1\xbe\xbf\xad\x6a\x0c\xad\x75\xa8\x6a\x5e\x19\xb2\xba\
-\xba\xb9\x2a\xa1\x41\x79\x64\x8c\xbb\x10\xaa\xa3\x92\x70\x00\x1d\
-\x05\x73\x7e\x30\xfd\x82\xbe\x05\xd9\x78\x5b\x53\x9a\x3f\x82\xbf\
-\x08\xd6\x58\x6d\x25\x91\x1b\xfe\x10\xed\x38\xed\x21\x09\x07\xfd\
-\x4d\x5e\xf8\x87\xff\x00\x05\x06\xf8\x0f\xf0\x7b\xc6\xba\x87\x86\
-\xbc\x59\xf1\x9b\xe1\x77\x86\x7c\x45\xa5\x32\xa5\xee\x97\xaa\xf8\
-\x9e\xca\xce\xf2\xd1\x99\x15\xd4\x49\x14\x92\x07\x52\x51\x95\x80\
-\x20\x64\x30\x3d\x08\xae\x4b\xc6\x5f\xf0\x54\x7f\xd9\xa6\xf7\xc2\
-\xba\xa4\x31\xfe\xd0\x5f\x05\xda\x49\xac\xe5\x44\x03\xc6\x5a\x79\
-\x2c\x4a\x90\x00\xfd\xed\x50\xcf\x97\x2d\xff\x00\x65\xff\x00\x85\
-\xa2\x15\xff\x00\x8b\x57\xf0\xbb\x76\x3f\xe8\x4f\xd3\x7f\xf8\xcd\
-\x75\xfa\x1f\x87\xac\x7c\x2f\xa4\x5a\xe9\xfa\x56\x9f\x61\xa5\xe9\
-\xb6\x48\x23\xb6\xb3\xb1\xb6\x8e\xda\xda\xd9\x06\x48\x58\xe3\x40\
-\x15\x17\x92\x70\xa0\x0c\x93\xeb\x5e\x5b\x07\xed\xf5\xf0\x2c\x22\
-\x8f\xf8\x5d\x1f\x0a\xf3\xff\x00\x63\x4d\x9f\x1f\xf9\x12\xbd\x37\
-\xc2\x1e\x2d\xd2\xbc\x7d\xe1\x6b\x1d\x73\x43\xd4\xec\x75\xad\x17\
-\x54\x8c\x4f\x65\x7f\x63\x3a\xdc\x5b\x5d\xc4\x4e\x37\xc7\x22\x92\
-\xac\xbc\x1e\x41\xc5\x4b\xbd\x8d\x19\xf3\x7f\xed\x13\xa6\xc7\x63\
-\xe3\xfb\xc6\x64\x68\x83\x90\xc2\x51\xeb\x81\xd7\xda\xbc\xee\xe8\
-\x2c\x89\xb6\xe0\x2b\x27\xf0\xcc\x9f\xd6\xbd\xa7\xf6\xab\xb1\x7b\
-\x0d\x76\xde\xe6\x38\xf7\xc7\x34\x38\x94\x11\xc3\x7f\x91\x5e\x3c\
-\x11\x65\xdc\x6d\x64\x0b\xdd\xa1\x61\x9a\xfe\x5b\xe3\x4c\x1b\xa3\
-\x9b\x56\x8b\xef\x7f\xbf\x53\xec\x32\xf9\xf3\x50\x89\x5e\xd3\x45\
-\x8a\x6f\x35\x65\x9d\x56\xd8\xc4\x48\x6d\xbb\x8e\x7b\x01\xfa\xd6\
-\x46\x9b\xa7\x5f\xe9\x90\xb4\xd6\xec\x65\x8c\x1e\xc7\x20\xfd\x71\
-\x5b\xba\x74\x39\xbc\x55\x87\x7c\x32\xb3\x73\x13\x0f\x95\xeb\x0d\
-\x2d\xae\x34\x5d\x52\x55\x85\xe4\xb3\x6d\xd9\x11\x3f\xdd\x6a\xf8\
-\x5a\xb1\xb5\x45\x3e\xbb\x1e\xa5\x39\x68\xd1\x70\x6a\x96\x3a\xae\
-\x62\xbc\x8b\xec\xf3\x74\x0c\x06\x41\xab\xda\x4e\x93\x26\x99\x7f\
-\x6e\x24\x9c\xc9\xa6\xc9\x22\xab\x71\xbf\x0b\x9e\x48\xf4\x3d\xb9\
-\xaa\x2d\x7d\x6f\xa8\x7e\xeb\x50\xb7\xfb\x0c\xcc\x78\x99\x46\x63\
-\x6f\xf0\xab\x16\xf6\x37\xda\x15\xc4\x6f\x03\xad\xc5\xb4\x84\x0e\
-\xb9\x46\x1f\x5a\x39\x5b\x5a\x69\xf9\x12\xfb\x1c\xff\x00\x8a\xbc\
-\x35\x0d\xbe\xbd\x24\x9a\x2d\xc1\xfb\xe7\x6c\x2e\xc0\x32\x0f\x4f\
-\xeb\xc5\x75\x3e\x00\xbe\xb5\xd7\xec\x2e\x53\x5c\xb1\x86\x4b\x8b\
-\x15\x08\x63\x75\x23\x78\x39\x19\x04\x11\xd3\x15\x85\xe3\x8b\x0d\
-\x2f\x55\xf1\x84\xcd\x6e\xd0\xd9\xdc\xb4\xb9\x41\x1b\x15\x5e\xbc\
-\x11\xf9\x56\x8f\x87\x63\xbf\xd2\x35\x08\x62\xbd\x87\xed\xd1\xcc\
-\xde\x52\xca\x40\x56\x1b\xbf\xbc\x7f\xad\x79\x31\xf6\x8e\x9c\xa3\
-\x07\x67\xd1\x9d\x35\x12\x70\x45\x9b\x4f\x86\x51\x9d\x57\xce\xd2\
-\xa6\x9b\x68\x3b\xda\x31\xf2\xb8\x1c\x9c\x63\xf2\xec\x4e\x3d\x2a\
-\xf6\xb7\x3c\x9a\xd7\x84\xaf\x85\xdc\x6b\x0d\xc5\xb8\xdd\x70\x53\
-\xe4\x8e\x20\x48\x55\x03\x2d\x96\x3c\x7b\xe2\xa1\xd6\xfc\x37\x71\
-\xa5\xea\x0d\xf6\x09\xe3\x86\xe6\x39\x19\xdc\x24\xa6\x46\x7e\xfd\
-\x7a\x60\x74\xc8\xa9\xa3\xf1\x52\xea\x9e\x16\xbe\x8f\x59\x8f\xec\
-\xf7\xac\xbb\x2d\xf3\x1f\x33\x2e\x79\x24\x9e\xc0\xfe\x74\x56\x97\
-\x3e\x1a\xef\xd4\xc2\x37\xe6\xbf\xa1\xe7\x76\xda\x04\xda\x85\xd7\
-\x97\x04\xf2\xcf\x1c\x0d\x94\x74\xe0\xa1\xeb\xc1\x38\xad\xe8\xf5\
-\x3d\x4f\x47\x43\x05\xf5\xba\xea\x56\xeb\xc3\x6f\x1f\xbc\x4f\x5d\
-\xc0\xf3\xf8\xe2\xa8\x69\x96\x96\x70\xea\x4f\xe4\xcc\xd6\x2e\x0e\
-\x49\x1c\xaf\x27\xf8\x87\x42\x3d\x88\xaf\x79\xf0\x27\xc2\x68\xb4\
-\xdf\x08\xb6\xa1\xaf\x18\x6e\xa6\x8d\x12\xe2\x05\x79\x0b\x42\x8a\
-\xc3\xe4\xc3\x0e\x4e\x7a\x95\x2c\x40\x3d\xab\x4c\x0b\xa9\x37\xc8\
-\x96\x9d\xfc\xbc\xff\x00\x43\x4c\x65\x48\xc3\x56\x72\xde\x03\xf1\
-\x05\xe6\x93\xe1\x8b\x5b\x7f\x0f\xdb\xda\x58\xad\xd1\x70\xa8\x62\
-\xc4\x97\x27\x39\x6c\xb8\xf9\x8e\x09\xc7\xcd\xc0\x1d\xfa\xd6\x36\
-\xb8\xfa\xa6\x97\xa9\xcf\xa7\xb4\xd0\xda\x39\x47\x9b\x99\x32\xa5\
-\xd7\x04\x83\x8e\x0f\x51\xc7\xb5\x74\xf7\xbe\x2a\x8f\xc6\x3e\x2b\
-\x82\xd3\x4b\xfb\x1b\x7d\x86\x13\x1a\xb2\x32\xc4\x91\x1f\xe2\x90\
-\x1c\x60\x82\xc7\x9c\x0f\x41\xcf\x5a\xf3\xfd\x47\x56\xd4\x20\xba\
-\x9a\xde\x40\xb7\x10\xb0\x64\xf3\x01\x2d\x83\xf5\xed\xd3\xe9\xef\
-\x5a\x66\x14\xd4\xa5\x75\xaa\x4b\xbd\xfa\x76\xdb\xe6\x8e\x3a\x37\
-\xe6\xbd\x8e\x7d\x3c\x57\xa9\x5a\x5e\x49\xf6\x8b\x7b\x79\x3c\xc1\
-\x9d\xd6\xe4\x86\x3f\x87\x4c\x7f\x9c\xd7\x57\xe1\x0f\x8e\x17\x9a\
-\x3b\xfe\xe6\x66\xfb\xa1\x0a\x48\xc4\x3a\x0f\x63\xd7\xf3\xc8\xae\
-\x22\xc9\x27\xb5\xbe\xf3\x19\x7e\xd4\xac\x3e\x58\xa7\x25\x1b\xf0\
-\x60\x78\xab\xb7\x76\x3a\x7e\xb4\x15\x6d\xcb\x5b\xdc\x46\xa3\xf7\
-\x13\x9d\xb2\xa9\xf4\x56\xe8\xc3\xeb\xc9\xa9\xc3\xc6\x32\x4b\xba\
-\xfe\xb4\x3d\x0a\xd0\x8e\xcc\x9b\xc5\x5e\x0c\x93\x54\xd6\xee\xb5\
-\x8f\x07\xeb\x6d\xa2\xea\x17\xf2\x19\xa6\xd2\xaf\x90\x4d\xa7\xde\
-\x3b\x12\x58\x85\xc8\x28\xcc\x4e\x4b\x44\xeb\x93\x9f\x90\x93\x5c\
-\xdd\xf7\xc5\x69\xfc\x27\xa8\xad\x9f\x8d\x34\x9b\x8f\x0c\xdc\x31\
-\xc2\xde\x6e\x37\x1a\x74\xa4\xfa\x4c\x00\x31\xe7\xd2\x50\xa7\xdc\
-\xd6\xa4\x91\x5f\x69\x2e\xe9\xcc\xdb\x79\x68\xdc\x6d\x7f\xc4\x74\
-\x6a\xe8\x34\x1f\x88\x56\x57\xd1\xfd\x87\x55\x8b\x74\x2d\xc3\x2c\
-\x8a\x65\xc0\xef\xf2\x9f\x9b\x1f\xee\x9c\x7b\x1a\xf7\x25\x86\xc1\
-\x62\xe3\xc9\x8d\x87\xbd\xfc\xd1\xd2\x5f\x3e\x8f\xe6\xbe\x68\xe1\
-\x52\xab\x4b\x5a\x4e\xeb\xb3\x2b\xd9\x5e\xc3\xa9\xc2\xb3\x5b\xc9\
-\x14\xf1\x48\x32\x8f\x13\x87\x57\xfa\x11\xc5\x73\x7f\x12\xfe\x37\
-\x78\x77\xe1\x25\xbc\x67\x54\xba\xf3\x2f\xae\x1b\x6d\xb5\x8d\xaa\
-\xf9\xd7\x57\x0d\x8c\xe1\x51\x79\x1f\x53\x81\x57\x3c\x7d\xf0\xd7\
-\xc1\x9a\xb3\xda\xdc\x5c\x5c\xea\xf0\xe9\xba\x75\xb4\x90\x58\x69\
-\xba\x0d\xd4\x96\x36\x8b\x31\x62\xfe\x73\xf9\x61\x4b\x3e\x3b\x1c\
-\x0c\x76\xeb\x5c\x2c\x5e\x08\xd2\x46\xbc\x35\x25\xb1\x8e\x4d\x4f\
-\xcb\x11\xb5\xcc\x83\x7c\xd2\x60\x75\x2c\x7b\xfa\x90\x39\xaf\x9e\
-\x96\x45\x80\xa1\x51\x4a\xb5\x49\x4e\x3a\xe8\x95\x9f\x95\xde\xab\
-\xd5\xab\x9d\x94\xf1\x55\x2a\xab\x46\x36\xf3\x67\x37\xae\x78\xc7\
-\xc7\xdf\x1d\x43\xc1\x2b\xdc\x78\x13\xc3\x0f\xf2\xfd\x9e\xd6\x5c\
-\xea\x57\x6b\xeb\x24\xb9\xfd\xd8\x3d\x36\xa8\x1f\x53\xd6\xb6\xbe\
-\x1e\x7c\x2a\xd2\x7e\x1f\xe9\x89\x6b\xa4\xd9\xad\xba\x75\x67\xc7\
-\xcf\x23\x7f\x79\x9b\xa9\x27\xaf\x3d\xeb\xa4\x8e\xc1\x63\x45\xdd\
-\xf2\xae\x73\xf8\xd5\xcb\x38\x1a\x5e\x23\xe0\x75\x27\x1c\x55\xe2\
-\x73\x57\xec\xbe\xaf\x42\x2a\x9d\x3f\xe5\x8e\x8b\xd5\xbd\xdb\xf3\
-\x6c\xda\x14\x55\xf9\xa5\xab\x21\x92\xda\x3b\x58\x58\xc9\x8f\x5c\
-\x67\x8a\xb9\xe0\xa6\x86\x7d\x50\xc6\xbd\x26\x38\x05\x06\xec\x1f\
-\xa7\x5a\x8a\xf6\x28\xed\x53\xee\xf9\xd2\x1e\xde\x95\x5a\xce\x45\
-\x17\x3e\x64\x63\xc9\x60\x78\xd9\xf2\xe0\xfe\x15\xc3\x86\xac\xe3\
-\xef\xf9\x9b\xce\x37\x8d\x8f\x48\xbe\xb5\xbd\xf0\xe8\x1e\x5d\xc2\
-\xdc\x2e\x54\x2f\x56\x2a\xa7\xaf\x3f\xc2\x7a\x0c\x60\x74\xae\xc3\
-\x49\xf8\xb7\x78\x2d\x3f\xb3\xef\xd9\x6e\xed\xb3\x93\x6f\x3a\x09\
-\x57\xe9\xcf\x4c\xfa\xfe\xb5\xcf\x43\x2e\xa3\x1e\x9d\x6f\x70\xab\
-\x1e\xae\x19\x57\x32\x27\xee\xe5\xc6\x07\x0d\xdb\x3d\x7d\x3a\x55\
-\x6d\x77\x52\xb1\xd7\x6d\xcd\xbc\x97\x53\xd9\xdc\x33\x00\xf1\xa4\
-\x64\x4c\xa3\xa6\x1b\x38\xce\x72\x39\xf6\xaf\xd0\x30\xb8\x88\xfb\
-\x3b\xa7\x6d\x36\x7f\x95\xf6\x3e\x72\xad\x3b\xca\xcf\xef\x2f\xea\
-\xff\x00\x0f\x34\xbf\x13\x41\x71\x36\x8f\x35\xc6\x9c\xca\xbe\x67\
-\x95\x77\x85\x81\xf0\x7e\x60\xaf\xd4\x60\xfa\x83\xd3\xad\x73\x9a\
-\xbf\x80\x35\xcf\x04\xdb\x2d\xd5\xe5\x9c\x8d\x6b\x20\x00\x4f\x03\
-\x89\xe3\xcf\x24\x02\xcb\x9c\x13\xe8\x6a\xad\xf2\xdc\x68\x3a\x5b\
-\x25\x95\xa4\xd7\x52\x46\x00\x59\xa7\x5f\x95\x41\x3e\xe7\x93\xce\
-\x31\xd0\x63\x19\xad\x5f\x03\xfc\x44\xd4\xbc\x2b\x6f\x2c\x6d\x77\
-\xf6\x30\xb9\x96\xe7\x72\x16\x87\xe5\x19\xc6\x0f\x52\x73\x80\x3d\
-\xfd\xab\xcb\xc4\x65\x38\x5a\xb2\x77\x8b\x8b\xb5\xf4\xef\xe9\x6b\
-\x7e\x5e\xa6\x90\xc4\xd6\x82\xb5\xee\x85\xf0\xad\xfc\x7a\x0e\xaa\
-\x26\x96\x09\x26\x86\x45\x26\x49\x0b\x15\x90\xab\x76\x19\xe0\xe0\
-\xd5\x14\x91\x4e\xa5\x79\x34\x91\x91\xbd\x70\x85\xbd\x33\x44\xfa\
-\xfb\x6a\xd3\xbd\xd5\xc9\x69\x20\x9e\x50\xf2\xdb\x86\xda\xa0\x1c\
-\xf4\x03\x81\x8a\xb3\xaa\x5d\x5b\x1d\x12\x36\x51\x23\x5d\x16\xfd\
-\xd2\xb0\xe5\x90\x75\xc9\xeb\xf8\x57\xc8\xd4\x6e\xfc\x97\xd1\x5e\
-\xdf\xd7\x99\xdc\xaf\x6e\x6b\x6e\x61\x02\x8d\x1d\xc4\x4c\xc5\x81\
-\x2c\xca\x47\x1b\x8d\x1a\xb6\x92\xb0\xe9\x31\x34\x71\xc8\x24\x93\
-\x9d\x84\xee\x3c\x55\xc8\xb4\xbf\xed\x59\x36\xba\xb5\xbc\x6d\x96\
-\x72\xa0\xe4\x7f\x3c\x7e\x35\x47\x54\xbe\x51\x78\x8a\x8d\xbb\x61\
-\xd8\xac\x5c\xee\x00\x7b\xd7\x45\x37\xa3\x6d\x14\xef\x7d\x07\x6a\
-\x32\x5c\x6a\xda\x3d\xaa\x25\xab\x3c\x91\xa1\xcb\xac\x79\x2b\xec\
-\x7f\x9f\xe3\x5a\xba\x3a\xd9\x6a\xcb\x65\x1c\x96\x09\x1b\xc8\x9f\
-\xbc\x9a\x29\x3e\x55\xc0\xff\x00\x96\x99\x38\x19\xc1\x39\x1d\xaa\
-\xa6\x8d\xe2\x88\xa3\xb8\x66\xba\x46\xdb\x13\x0d\xdb\x32\x3c\xcf\
-\x4c\xa8\x23\x3f\x50\x41\x1d\x47\x35\xb9\xe2\x1d\x0e\x3b\x3f\x0e\
-\xc7\xa8\x69\x50\xb7\xd8\xee\x83\x79\x97\x10\xcb\xe7\x42\x07\x74\
-\xc9\xf9\x94\x83\x90\x43\x73\x8e\xb5\xe9\x61\xe2\xa5\x4f\xda\xa7\
-\xf0\xe8\xd7\x97\x91\xcb\x56\xea\x5c\xac\xe4\xf5\x68\x62\x87\x50\
-\x99\x62\xe6\x35\x6f\x93\x27\xb5\x7d\x13\xf0\xf3\x49\x5d\x37\xc1\
-\x9a\x7c\x23\x76\xd1\x10\xce\x7d\xc6\x4d\x7c\xf9\x63\x6e\xb2\x5e\
-\x43\xbd\x19\x94\xc8\xa0\xa8\xee\x09\xaf\xa6\x74\xd4\x58\xec\x62\
-\x8d\x01\x55\x45\x00\x2f\xa0\xc5\x7e\xdd\xe1\x0d\x08\xba\xb5\xeb\
-\xf9\x25\xf7\xea\x78\x79\xe5\x4f\x76\x30\x62\x49\x26\xd9\x38\x1f\
-\x5a\x8a\x77\x1b\x07\x15\x33\xdb\xee\x3b\xba\x7e\x15\x13\x0c\xa9\
-\xf6\xe9\x5f\xba\x6d\xb9\xf3\xa5\x79\x9b\x78\x1b\x47\x7a\xfa\x73\
-\xfe\x09\x5d\x1e\xcf\x88\xbe\x30\x1f\xf5\x0d\xb6\x3f\xf9\x16\x4a\
-\xf9\x96\x6e\x57\x1f\x8d\x7d\x35\xff\x00\x04\xb0\x39\xf8\x91\xe3\
-\x0f\xfb\x06\x5b\x63\xfe\xfe\x3d\x69\x1d\xc9\x67\xdb\x54\x51\x45\
-\x51\x21\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x02\x3f\xdc\
-\x35\xf2\xe7\xed\xad\xe1\x8d\x42\xd3\xf6\x9a\xfd\x9c\x3c\x40\x3c\
-\x5d\xe2\x8b\x5d\x3f\xfe\x13\xd4\xd2\x97\xc3\xf0\x5c\xa5\xbe\x97\
-\x70\xcf\xa5\x6a\x92\x3c\xf3\xaa\xa0\x92\x79\x31\x1a\x2a\xac\x92\
-\x18\xd3\x69\x21\x37\x12\xc3\xea\x4a\xa9\xaa\x69\x76\xfa\x93\xdb\
-\xb4\xf0\x43\x33\x5a\xc9\xe7\x42\x64\x8c\x31\x89\xf0\x57\x72\xe4\
-\x70\xd8\x66\x19\x1c\xe0\x9e\xc4\xd4\xca\x37\xb3\xf3\x41\xd0\xfc\
-\x9e\xf1\x97\x8f\x6e\xfc\x39\x6e\xfe\x25\xf0\x3f\x88\xf5\x0b\x8f\
-\xda\x63\x52\xf1\x1f\xc4\x6b\x2f\x14\xd8\xdb\xea\x92\xdc\x6a\x11\
-\x69\x76\xb6\x1a\xdb\xda\x2c\xb6\x7b\x88\x8e\x2b\x79\x20\xd0\xcd\
-\xb9\xf2\xd4\x6e\x96\x2d\xb9\xf3\xdb\x7f\xd1\x5f\xf0\x4d\xb9\xfc\
-\x13\xa6\x7e\xd3\x9e\x22\xd2\x7e\x10\xeb\xd1\xf8\x87\xe1\xbc\xff\
-\x00\x0d\xbc\x37\xab\x6a\xf2\xc1\xac\xc9\xaa\x5b\xa6\xbb\x34\xf7\
-\xc0\x4a\xd2\x3c\x8f\xb2\xee\x7b\x55\x57\x99\x41\x0c\xde\x5c\x2e\
-\xe0\x16\x05\xbe\xc8\xb4\xf0\x76\x93\x65\xe2\x8b\xad\x62\x0d\x3b\
-\x4d\x87\x5a\xbb\x85\x20\xb9\xbe\x8e\xd9\x16\xee\x78\xd7\xee\x23\
-\xc8\x06\xf6\x51\x8e\x01\x24\x0a\x3c\x35\xe0\xfd\x1f\xc1\xb6\xf3\
-\x43\xa3\x69\xba\x6e\x95\x0d\xcd\xcb\xdd\x4f\x1d\x95\xb4\x70\x24\
-\xf3\xbf\xdf\x91\xc2\x00\x19\xce\x39\x63\xc9\xc7\x26\x88\x7b\xab\
-\xe5\x62\x5a\xbb\xb9\xb0\xa8\x3a\x7a\x74\xac\xbf\x1b\x8f\x2f\xc1\
-\xba\xb1\x18\xc8\xb1\x9b\x9c\x7f\xb0\x6b\xcc\x7e\x23\xff\x00\xc1\
-\x41\xbe\x09\xfc\x1d\xf1\xbe\xa1\xe1\xaf\x14\xfc\x4c\xf0\xae\x87\
-\xaf\x69\x6c\x89\x77\x61\x77\x78\x12\x6b\x72\xc8\xae\xa1\x86\x38\
-\xca\xb2\x9f\xa1\xae\x47\xc6\x3f\xf0\x54\x7f\xd9\xde\xf7\xc2\xba\
-\xa4\x71\xfc\x61\xf0\x3b\x34\xb6\x72\xa2\x8f\xb7\x8e\x49\x42\x07\
-\x6a\xa2\x8f\x17\xb7\x99\xd9\x15\x81\xfb\xb8\x3d\x28\x12\x1f\xbc\
-\xff\x00\x4c\xd7\x91\xc7\xfb\x7d\x7c\x13\x58\x55\x57\xe2\x8f\x83\
-\xf7\x63\xb5\xd3\x7f\xf1\x35\xe9\x1e\x12\xf1\x9e\x97\xf1\x03\xc2\
-\x96\x3a\xd6\x8b\x7d\x6b\xaa\x68\xfa\x9c\x5e\x7d\xa5\xdd\xbb\x6e\
-\x8a\xe2\x3e\x40\x65\x3e\x9c\x1a\x0b\x5e\x67\x9e\xfe\xd4\xf6\x8f\
-\x37\x87\xac\xe6\x8f\xef\x47\x21\xed\xed\x9a\xf9\xe6\x78\x56\x7b\
-\x8d\xcb\xfb\x89\xb3\x92\xa0\xf0\x7f\x1a\xfa\x6b\xf6\x83\xb3\x5b\
-\xbf\x03\xb4\x8c\xb9\xfb\x3b\x86\x1e\xe0\xf1\xfa\x75\xaf\x9b\xee\
-\xe0\x8e\x7d\xcc\xbb\x64\x52\x73\x91\xd4\x57\xf3\xbf\x89\x54\x9c\
-\x33\x4e\x6e\x8e\x28\xfa\x9c\xa2\x57\xa3\x6f\x31\x9a\x6d\xec\x89\
-\xa9\xdb\xa4\xc9\xfb\xc5\x90\x14\x6c\x75\xe4\x63\x9a\x67\x89\x75\
-\x85\xd5\xf5\xe9\xa3\xbf\xb3\xfb\x3c\x90\x9d\x8c\x57\x95\x38\xfe\
-\x2f\x6a\x92\xc2\x29\x8d\xe4\x31\xed\x69\xb7\x38\x09\x8e\x5b\x35\
-\x1f\x88\xee\xe7\xb0\xd7\xa7\x5b\xa8\x5a\xe1\x18\xff\x00\xad\x51\
-\xf3\x2f\xb3\x0e\xf5\xf9\x4e\x2e\x4a\xf1\x7e\x67\xb5\x45\x5e\x4c\
-\xab\x3e\x8c\x52\x22\x61\x65\xb8\x8b\xaf\x96\xdd\x87\xb7\xf8\xd5\
-\x7b\x29\x66\xd3\xe4\xff\x00\x42\x93\x6b\x75\x36\xf3\x0c\x83\xf4\
-\xab\xd6\xd0\x91\xfb\xeb\x39\x95\x57\xfb\xbf\x79\x7f\x2e\xa2\xac\
-\x47\x1c\x3a\xd5\xc2\x5a\xdd\x27\x93\x34\x87\x68\x6d\xd8\x27\xd3\
-\x07\xa1\xcd\x67\xed\x1a\xf3\x06\x8e\x77\xc5\xd3\x5a\x6a\xba\xea\
-\xc3\x75\x0a\xdb\xcc\xca\x30\x55\x30\xaa\x3d\x8f\xe7\x5b\xfe\x0d\
-\xf0\x4f\x88\xe6\x81\x5b\x4d\x58\xf5\x3b\x1c\x1d\xb1\x4e\xe1\x18\
-\xf3\xd1\x58\xf5\xfe\x55\x1f\xc5\x0d\x3d\xf4\xa9\xad\x6d\xb5\x1b\
-\x59\x06\xd8\xd5\x45\xc2\x28\xc6\x3d\xc0\xeb\xfc\xeb\xa1\xf8\x73\
-\xf1\x12\x6f\x0f\x43\x6f\x0c\xcd\x1d\xe6\x99\x12\x88\xad\xe6\x47\
-\x01\xed\x31\x8d\xa7\x3d\xc0\x3d\x9b\x90\x3b\x9a\xf3\x23\x29\x5d\
-\xaa\x5d\xff\x00\x03\x6a\x8d\xfb\x35\x62\x69\xfe\x1a\xdc\xe9\xb7\
-\x1f\x69\xba\xb0\x86\xcd\x93\x0a\x59\xc8\x7f\x2c\xe7\x9c\x63\xb7\
-\x3d\xba\xd5\x0b\x74\x17\x12\x5e\x0b\x98\x52\xfa\xde\xda\xdd\x9a\
-\x1b\xc6\x44\x8c\x29\x1c\x10\x57\xa1\xe0\x9c\x67\x9a\xa1\xe2\x6f\
-\x88\x17\x5e\x21\xd4\x2e\x21\xb8\x6f\x2e\xe9\xb1\x90\xb2\x31\x8d\
-\xb9\xec\x7f\x88\x7a\x7a\x55\x4d\x26\x66\xb6\xd0\xf5\x01\x24\xcb\
-\xc2\x61\x51\x94\xb3\x46\x78\x07\x18\xe6\xb8\x2b\x54\xad\x4a\x52\
-\x4f\x45\x2d\x96\xe4\xc2\x37\x57\x39\xab\xdb\x2b\x18\xef\x18\x46\
-\xd1\xe1\x98\x33\x18\xce\x43\x73\xcf\xd3\xf9\x57\xa5\x78\xd7\xe3\
-\xad\xee\xa9\xa6\xc7\x0d\x85\xb0\xb6\xb2\xc2\x87\x2a\xb9\x1c\x63\
-\x8c\x67\x3d\xbf\x0e\x6b\xcb\xad\xef\xb4\x9b\xcb\xad\x93\x0d\x8c\
-\x40\x2d\x34\x6a\x70\xbf\x51\xc7\xe3\x8a\xd9\x4f\x0f\xea\x9a\x14\
-\x5f\x6c\xb2\xff\x00\x4c\xb3\x3d\x5a\x3c\x38\x6f\xad\x69\x85\x94\
-\xad\xc8\xee\x91\xd1\x88\xa7\x19\x59\xc8\xd7\xd2\xbc\x47\x6b\x35\
-\x84\xcb\x00\x4b\x2b\xab\xec\x47\x2d\xd4\x4a\x0f\x19\xc8\xc8\xe3\
-\xbf\x52\x30\x4f\xbe\x2a\x7b\x7d\x35\x34\x69\xb3\x79\x35\x9d\xd2\
-\xf9\x0f\x8d\x85\x97\x69\xc7\x1b\x4f\x7c\xf7\x07\x23\xd2\xb1\x6d\
-\x56\xdb\xc4\xeb\x2b\x45\x14\xb6\xd3\xc6\x30\xe6\x35\xf9\x33\x83\
-\xf7\x87\x63\xcd\x6a\x69\x9a\x2f\xd9\x61\x90\x6a\x64\x46\x91\xa8\
-\x31\x46\x8a\x24\xdf\xb8\x13\x96\x39\x24\x7d\x38\xad\x25\x42\x51\
-\xf7\xa9\x49\x25\x6d\x6f\xa9\xcd\xee\xde\xc7\x0b\xa8\x98\x6d\x35\
-\x46\x28\xcd\x34\x2c\x7e\x64\x2b\xe5\xb2\x7f\x30\x6b\x42\x3b\x58\
-\x3c\x47\x12\xad\xbb\x2d\xc6\x07\x16\xd3\x1d\xb3\x2e\x7f\xbb\xdc\
-\xe3\xd8\xfe\x15\x4e\x6f\x3e\xc6\xee\x48\x51\xfc\xcb\x76\x27\xf7\
-\x52\xaf\xde\xf4\xc1\xa6\xd9\xd9\x5a\xeb\x12\x88\xd2\x4f\xb3\xdd\
-\x67\x3e\x54\xcc\x54\xb1\xff\x00\x65\xab\x5c\x2c\x92\x8f\x73\xae\
-\xa2\xba\xb9\x73\xce\xbb\xb2\x4f\x21\x5c\x5c\x42\xbc\x7d\x96\xf3\
-\x86\x5f\x64\x7e\xb9\xa4\x92\x0b\x1d\x5e\x66\x8e\x48\xda\xde\xe9\
-\x79\xf2\x2e\xbe\x57\xcf\xfb\x2e\x38\x34\xb7\x5a\x95\xe6\x9e\xbf\
-\x65\xd4\x61\x6b\xe5\x18\xff\x00\x5d\xf2\xcc\x83\xfd\x97\xfe\x21\
-\xec\x73\x56\xa1\x82\xd3\x5d\x8b\x65\xb4\xb1\xde\x2a\x8c\x1b\x5b\
-\x84\xd9\x34\x67\xdb\x9e\x7f\xe0\x27\xf0\xaf\x6e\x8c\xb4\xb2\x38\
-\xe5\xa6\xc7\x3f\xaa\xe8\x93\x5a\x5b\x36\xe9\x36\xf9\x6d\xf2\x24\
-\xa9\x92\x7f\x1e\xf5\x97\x65\xf2\x8f\x2d\x72\xcd\xd4\x1a\xde\xd4\
-\xac\xee\x13\x4b\x99\x05\xc5\xcc\x30\x2c\x99\x10\x38\x32\x63\x1c\
-\x60\x7a\x56\x15\x94\xfb\x11\x95\x7d\x48\x35\xe7\xe6\x32\xbc\x55\
-\x8e\xac\x3e\xc5\xc8\xad\x51\x58\x34\x98\x66\xec\x3b\x54\xeb\x2b\
-\x15\xc4\x63\x68\xf4\xed\x55\xe1\xb7\xfd\xe2\xc9\x26\x5b\xe8\x7a\
-\xd6\x9d\xae\x99\x34\xd1\xb3\x7c\xb0\xc6\x3f\x88\x8c\x7e\x55\xf3\
-\xb5\x24\x96\xe7\x64\x6c\x8c\x8d\x46\xdd\x4a\x85\x6d\xad\xed\xd4\
-\x55\x5b\x48\x91\x1b\x70\x01\x71\xfd\xde\x86\xb6\xae\x64\x8a\xc5\
-\xb6\xc3\xcb\x77\x66\xea\x6b\x35\xe7\x12\xcc\xdb\x82\xee\x27\x39\
-\x1d\x85\x6d\x46\x6f\x97\x6d\x0a\xd4\xee\xbc\x0d\xae\xad\xb4\x11\
-\xfe\xee\xe1\x08\x21\x4c\x89\xfb\xc4\x04\x74\x25\x7a\xfb\xf0\x4e\
-\x3d\x2b\xa4\xf1\x2d\xd0\xd6\x74\x79\xa7\x90\xd8\xb4\xb8\x02\x3b\
-\xd8\xd8\x6d\x0d\xec\x48\xe3\xe8\x70\x7a\xf5\xae\x13\xc1\x57\xa6\
-\x1b\xf8\x63\xc2\x31\x9a\x55\xcc\x8a\xc1\x24\x8f\x9c\x70\x49\xc6\
-\x3e\xbf\x98\xae\xe7\xc6\x5a\x54\xfa\x75\xd4\x71\xda\xfd\x96\x6b\
-\xd9\x98\x02\xef\x1e\xc7\x95\x7b\x12\x84\x90\xde\x99\x19\xf6\xeb\
-\x5f\x5d\x95\xe2\x64\xe8\x38\xbd\x6d\xa5\xbd\x7e\x7f\xd7\x91\xe1\
-\xe2\xa8\xa5\x52\xe7\x35\x7b\x6c\xc8\x64\x7b\xcb\xc8\xf5\x19\xa4\
-\x41\xe6\x2a\x2b\x48\xd0\x0f\xe1\x6e\xd8\xf9\xbf\x42\x6b\x37\x4b\
-\xfb\x3d\xe7\x87\xe6\xf3\x2e\x22\x8d\x11\x32\xf1\xcd\x1e\xd7\xef\
-\xb7\x69\xfe\x22\xdf\xa6\x2a\xce\xbf\x7f\x3c\x0f\x24\x36\xb7\xd6\
-\xb1\xaf\x59\x1e\xd2\x33\x1c\xbd\x38\xdc\x3b\x67\x27\x81\x51\xc5\
-\x79\xfd\xab\xe1\x36\x12\x47\x1b\xc3\x66\x08\x59\x24\x03\xcc\x0d\
-\x80\x17\x3d\xc6\x4e\x38\xf6\x35\xd9\x4e\xb4\x14\x25\x18\x3b\x69\
-\xd6\xef\xe5\xbd\xce\x59\x45\xde\xec\x8f\x47\xb1\x32\x41\xe4\xa6\
-\xed\xcc\x06\x72\x40\xe4\x63\x23\x26\xb5\xb5\x5d\x5f\x48\xd3\xf5\
-\xab\x3b\x75\xb5\x92\x7b\x58\x5b\x33\xc5\x30\x0c\xcc\xc7\x39\xef\
-\xfc\x88\xac\x98\x21\xfb\x1e\x9d\xf7\xa4\x45\xce\xec\x95\xdd\xb8\
-\x9f\xe5\xf5\xa9\xdf\x42\x6f\x10\xc9\x1d\xf5\x9e\xe9\x36\xb8\x13\
-\xc7\x92\xd2\x27\x3f\x78\xf1\xca\xe3\x92\x46\x71\xde\xbe\x2e\x2f\
-\x99\xbe\x5d\xfc\x8f\x56\xda\x7b\xc7\x47\x6f\x6b\xa1\xde\x78\x86\
-\x6b\x09\xf5\x2b\xed\x3a\x3b\x88\x94\x41\x2b\x44\xaf\x1a\x13\xce\
-\x5c\xa9\xce\xd1\xed\x5c\x9f\x8c\x3c\x31\x2f\x84\xf5\x19\x2c\x26\
-\x96\xd6\xe2\x48\x50\x4a\xb3\xdb\x96\x29\x22\x9e\xe3\x70\x07\x1f\
-\x85\x6f\x5d\x6b\x32\x78\x6e\xe5\xa5\xbc\x5b\x72\xb7\x27\x08\x9e\
-\x56\xd7\x91\x41\xf9\xb6\x1c\x10\x07\x6c\x8e\x2b\x97\xd4\x75\xf9\
-\x35\x7d\x62\xeb\xe4\x8e\xdf\x6c\x61\x62\x40\x49\x54\x4e\xc3\x27\
-\xad\x75\xc2\x56\x86\xaa\xcf\xd0\xc2\x11\x97\x36\x9b\x15\x52\xe9\
-\x2e\xad\xda\x48\xd8\x2a\xed\xda\x5b\x19\x29\xc8\xad\x2b\xf9\xd7\
-\x40\xd1\xa3\x8e\x19\xed\xdf\xed\x12\x6e\x68\xe3\x91\x8e\xf1\xd8\
-\xe0\xf1\x93\x5c\xee\x87\x65\x31\x33\x47\x1c\x82\x35\xcf\x5f\xef\
-\x64\xf3\x46\xa3\x64\xda\x6e\xab\x09\xb8\x8e\x44\x8e\x46\x05\x0b\
-\xff\x00\x17\x3d\x45\x76\xe1\x62\x97\xba\xba\x95\x52\x37\x3b\x4f\
-\x04\xda\x36\xb3\xe3\x1b\x08\xc0\x6d\xbe\x66\x48\x6f\x41\x5f\x48\
-\x45\x1a\xa2\xb6\x0a\xfc\xbf\xa5\x78\x4f\xc1\x0d\x3f\xed\xde\x3b\
-\x8c\xf3\x88\xa3\x66\xfe\x95\xee\xd1\xc6\xc1\xfa\xd7\xf4\x6f\x84\
-\xf8\x75\x0c\xba\x75\x52\xf8\xa5\xf8\x23\xe4\xf3\xb9\x5e\xb5\x91\
-\x05\xcc\xdb\xf8\xe9\xdf\xe9\x55\xdc\x1e\xbf\x7b\x23\x1c\x55\x99\
-\xa2\x24\x66\xa1\x71\xe5\x64\x9f\xc7\xeb\x5f\xab\x23\xc5\x2b\xb4\
-\x65\xce\x31\x5f\x4e\xff\x00\xc1\x2d\xa3\xf2\xfe\x23\xf8\xc3\xfe\
-\xc1\xb6\xdf\xfa\x36\x4a\xf9\xa0\x4b\xb4\xf2\xa3\xbd\x7d\x33\xff\
-\x00\x04\xbb\x90\x49\xf1\x13\xc5\xd8\xff\x00\xa0\x75\xb7\xfe\x8d\
-\x7a\xd6\x3b\x92\xcf\xb4\xe8\xa0\x74\xa2\xa8\x90\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa8\xe6\x5d\xcc\xbf\x5c\xd4\x94\
-\xd9\x57\x76\x28\x03\xf1\xd7\xc4\xfe\x2b\xf1\x07\x87\xbe\x32\xf8\
-\xa3\x49\xf8\x69\x67\xa6\xdf\x7c\x6b\xb6\xd6\xfe\x20\x5c\x78\x87\
-\xc5\xba\x2e\xbb\x25\xc7\x89\x35\x7d\x34\x69\x5a\xab\xd9\xc1\x79\
-\xa7\xec\x17\x36\xc9\x6f\x76\x74\x98\xa1\x59\xc0\x84\x49\x0d\xab\
-\x5b\x34\x8b\x70\x71\xf5\x17\xfc\x13\x35\xbe\x1d\xdb\xfe\xd2\xde\
-\x24\xb7\xf8\x1d\x7f\xa4\xdf\x7c\x31\x93\xe1\xc7\x87\x2e\x75\xb3\
-\xa4\xde\x0b\xab\x31\xe2\x06\x9e\xf8\x6f\x95\x83\x30\x1a\x8c\x96\
-\xa1\x5a\xe7\x3f\xbd\x6c\x40\xd2\xfc\xc5\x49\xfb\x62\xdf\x4e\xd3\
-\xed\x75\xab\xab\xa8\x6d\x2d\x53\x51\xb9\x54\x5b\x99\xa3\x8d\x44\
-\xf2\xa8\xc8\x4d\xed\xf7\x88\x1c\xe3\x27\xd7\x14\x9a\x3e\x9d\xa7\
-\xe9\x11\x4a\xb6\x16\xb6\xb6\xb1\xcd\x3b\xcd\x28\xb7\x89\x63\x59\
-\x25\x63\xf3\xb3\x6d\xea\xe4\x8e\x49\xe7\xd6\x94\x74\x5a\x84\xb5\
-\x77\x2f\xaa\xb6\x3e\xf7\xe9\x59\x9e\x38\x2d\x17\x83\x35\x86\xdd\
-\xc8\xb2\x98\x8f\xfb\xe0\xd7\x98\x7c\x45\xfd\xbb\x7c\x07\xf0\x9f\
-\xc7\x3a\x8f\x87\x75\x6b\x5f\x88\x72\x6a\x3a\x63\xaa\x4c\xda\x77\
-\x80\x75\xcd\x46\xd4\x96\x45\x71\xb2\xe2\xde\xd1\xe2\x93\x86\x19\
-\x28\xe7\x07\x20\xf2\x08\xae\x4f\xc6\x1f\xf0\x52\x5f\x86\x97\xde\
-\x13\xd5\x22\x5b\x3f\x8a\x8a\xd2\x59\xca\x80\xb7\xc3\x1f\x12\x2a\
-\xe4\xa1\xea\x4d\x8d\x30\x3c\x4a\x1b\xe9\x80\x5f\xde\x36\x7f\xdf\
-\x35\x29\xc6\xcd\xcd\xcb\x36\x0f\x5a\xf1\xf4\xfd\xb5\xbc\x0b\x85\
-\xff\x00\x45\xf8\x85\xff\x00\x84\x06\xbb\x8f\xfd\x24\xaf\x47\xf0\
-\x97\x8b\x2c\xfc\x67\xe1\xad\x3f\x58\xb2\xfb\x6a\xd9\xea\x31\x79\
-\xd0\x8b\xbb\x49\x6c\xe7\x0b\xfe\xdc\x33\x2a\xc9\x19\xff\x00\x65\
-\xd4\x11\xdc\x0a\x3c\xc6\x65\xfc\x5b\xd3\xbe\xdb\xe0\xcb\xc2\x57\
-\x77\x94\xa1\xc0\x03\x96\xc1\x15\xf3\x25\xed\xba\xcd\x33\x4b\x6a\
-\x76\xb3\x12\x59\x3b\x7e\x55\xf5\x97\x88\xa1\x4d\x4b\x47\xb8\x87\
-\xb4\x91\x11\x8a\xf9\x3b\x5f\x87\xfb\x3f\x59\x99\x17\xe5\x78\xdc\
-\xaf\xd3\x9a\xfc\x57\xc5\x4c\x17\xef\xa9\x62\x23\xd5\x34\x7d\x1e\
-\x49\x53\xdd\x71\x2a\x5a\xce\xcb\x76\x9b\x77\x43\x70\xac\x38\xce\
-\x30\x7d\xaa\xbe\xb5\x61\x79\xe1\x9f\x14\x3a\xc5\x23\x5e\x46\xea\
-\x19\xd1\x8e\xec\x13\xd4\x67\xbf\xff\x00\x5e\xad\x09\x92\xfc\x7e\
-\xf1\x76\xc9\xfd\xe0\x7a\xd5\x2f\x12\xd8\x5e\x78\x7b\x57\xb7\xd9\
-\x3e\xf7\xda\x1f\x0a\x73\x8e\xd5\xf8\x5e\x32\x9a\xf7\x5b\xef\xf9\
-\x9f\x49\x45\xd9\xd9\x0b\x04\x36\xba\x94\xde\x75\x9c\x8d\x67\x72\
-\x3a\xc4\x4f\xca\xdf\x85\x58\xb2\xd5\x46\x99\xa8\xc3\xfd\xa1\x6a\
-\xad\xe5\xb8\x7d\xa4\x7e\xee\x4c\x7f\x2f\xc2\xab\x99\xad\x75\xb9\
-\x3f\xd2\x14\xda\x5c\xff\x00\x0c\xa9\xd1\x8f\xbd\x4e\x1e\xea\xc6\
-\x48\xed\x6f\x21\x37\xb1\x3b\x6c\x8c\xa7\xcc\x58\x9e\x80\x7b\xd7\
-\x3b\x4e\xd6\x61\xd6\xc2\x78\xc7\xc6\x57\xda\xdf\x89\x63\x6d\x4a\
-\x0f\x32\xc6\x44\xca\x2c\x7f\xf2\xcd\x73\xfc\x3e\xb8\xa9\x21\xf0\
-\x32\x5e\x59\xb6\xa1\xe1\xfb\xc1\x22\xaf\xdf\x44\xe2\x44\x1e\x8e\
-\x9f\xd6\x9b\xe3\x8d\x32\xf3\xc2\x57\xf6\xad\x79\x6a\xb7\x56\xfb\
-\x06\xe8\xb7\xe2\x44\x19\x23\x19\x1d\xea\x85\xbb\x5b\xde\xdc\x9b\
-\xed\x12\xf2\x6b\x7b\x98\xf9\xda\x0e\xc9\x63\xf6\x61\xd0\xd7\x9f\
-\x46\x11\x4e\x51\x5d\x1f\xcc\xdb\x7a\x69\xad\x88\x2f\xa7\x58\xdd\
-\x56\xfa\xdd\x61\x75\x39\x12\x28\xcc\x47\xe9\xdd\x0f\xd0\xd5\xad\
-\x23\x50\xb8\xd3\x22\x9b\xc8\xdd\x72\x97\x04\x94\x2d\x18\x3e\x7f\
-\x5f\x97\x39\xf7\xed\x9c\xd6\x95\xb6\xaa\x7c\x4b\x6b\x78\x75\x8b\
-\x7b\x48\xa6\xb3\x8f\xcc\x17\x2b\xf2\x7d\xa3\x9c\x60\xaf\x20\x91\
-\xc9\x27\x8e\x05\x1e\x1a\xd1\x6d\xdc\xcd\x77\xa6\xc7\x71\x0a\xda\
-\xc5\xb9\x94\x1d\xea\xec\x7f\x88\xff\x00\x77\x03\xd2\xa7\x18\xa2\
-\xd2\x85\x4b\xdf\x75\x65\x7f\x97\x91\x11\x95\xb6\x47\x9e\xdb\xea\
-\x36\xef\x7f\x22\xc9\x0c\x91\xc9\x92\xae\x24\x5f\xe6\x3a\xfe\x35\
-\xd4\x78\x27\x57\x7f\x07\xeb\x11\xdd\xdb\x9f\xb4\x5b\x15\x61\x25\
-\xa8\x9f\x6c\x52\x82\xa7\xf9\x75\xc1\xc1\xe2\xb0\x2f\x24\x8a\xf3\
-\x56\x9b\xed\x6b\xbc\x2b\x9f\xf4\x80\x3a\x93\xcd\x69\xc3\xe1\x1b\
-\xeb\x5b\x65\xbc\xd3\x66\x37\x11\x91\xf7\x54\x8c\x1f\x6c\x77\xfc\
-\x6b\x97\x0f\xbd\xe3\xa1\xd7\x5b\x58\xab\x9b\x37\x5e\x2a\x87\x5a\
-\xd5\x76\xc8\xd1\x69\xf2\x4c\xe3\x06\x64\x0b\x1b\x11\x80\x72\x40\
-\xe3\xb7\x50\x3a\xf5\x15\x3e\xbe\xf6\xf6\x4d\x03\x46\x5f\x75\xc1\
-\x64\x65\xc7\xca\xed\x8c\x02\xa4\xf5\x18\xe7\xf1\xac\xdf\x0f\xdb\
-\x7f\xc2\x69\x78\xb6\x27\x4f\x9b\xed\x67\x82\xa9\x19\x29\x9f\x73\
-\xd5\x3f\x1e\x28\xf1\x2f\x83\xa4\xd3\xa1\xdb\x7d\xa9\x4c\xdf\x67\
-\x60\xd0\xdb\x46\xc0\xe0\x7a\x16\xe8\x3e\x83\x9f\x7a\xd2\xa5\x0a\
-\x74\xed\x38\xca\xcd\xe9\xea\x71\xdd\x5c\xe6\xf5\x2d\x45\xf4\xdb\
-\xe8\xc5\xe4\x46\xe2\x36\xca\x6d\xc8\x57\x51\xed\xd8\xe3\xdf\xd6\
-\xad\x69\x3a\x25\xb7\x88\x95\x96\xce\x45\xba\xdd\xf3\x7d\x9a\x4f\
-\x96\x45\x03\xb8\x03\x9f\xc4\x64\x57\x1b\xa8\xcb\x35\xfe\xb7\x34\
-\x9b\x99\x64\x39\x03\x77\x2a\x47\xb7\xa5\x4f\x6c\xb2\x40\xf1\xb6\
-\xe6\x82\x54\xc1\x57\xce\xde\x7d\x41\xad\xe8\xa4\x9a\xec\x7a\x1c\
-\x8f\x93\xcc\xed\xe7\xd1\xae\xad\x07\x90\xad\xbe\x35\xe5\x6d\x2f\
-\x78\x27\xfd\xc7\xef\xf8\x7e\x55\x9a\xf6\x36\x77\x32\x88\x6e\x3c\
-\xcd\x3e\xe9\x5b\x85\xba\xf9\x53\xdb\x12\x76\x3f\x5a\xb5\xa2\x7c\
-\x50\xba\xb5\x8d\x6d\xf5\x7b\x58\xf5\x3b\x72\x30\x59\x86\xd9\x80\
-\xfa\xf4\x6f\xe7\x5d\x25\xbf\xd8\x3c\x51\x66\xcd\xa7\xcb\x1d\xf4\
-\x4a\xbf\x35\xa5\xd7\xfa\xc8\xfd\x87\xf1\x0f\xc7\x22\xbd\x9a\x71\
-\x4f\xe1\x7f\x7f\xf5\xf9\x7d\xc7\x9f\x2b\xad\xd1\xc4\xeb\xfa\x6e\
-\xa1\xa6\xdb\x98\xae\x9a\x5d\xa5\xbf\x76\xce\xa5\x83\x7d\x1f\xa3\
-\x76\xe7\x9e\xb5\x8d\xa3\x58\xc9\x38\xf9\x57\xf8\xb9\x73\xd0\x73\
-\x5d\x3e\xb0\x26\xd3\x74\x5b\x88\x2d\xaf\x2f\xad\x2d\x77\x95\x36\
-\xd2\x7c\xc8\xbd\xf0\xbd\x41\xcf\xb6\x2b\x99\xb5\xd4\x5a\x28\x95\
-\x15\x99\xb9\x35\xe6\xe3\xf9\xb9\x12\x48\xea\xc3\xdd\xa3\x72\x08\
-\x20\xd3\x58\x49\xf2\xcb\x26\x38\x66\xe9\xf9\x54\x77\x1a\x93\x4c\
-\xbf\x2e\x5f\xdc\x0a\xa0\xb2\xb4\xc4\x16\x6c\x6e\xfe\x0a\xbd\x06\
-\x9c\xf2\x42\x59\xbf\x77\x1a\xfa\xf5\x35\xf3\x93\x8a\x5a\xc8\xec\
-\x5a\x18\x5a\xc3\x29\x39\x95\x95\xd5\xbb\x1e\x95\x5e\xc6\xdb\x38\
-\x10\x9d\xb8\xe4\xe3\xee\xfe\x55\xa5\xa8\xdf\xc3\x6c\x59\x63\x45\
-\xcf\xf7\x8a\xee\x27\xf0\xa8\xf4\xcb\xdf\x25\xd6\x4f\x2d\x5b\xb1\
-\x6c\x71\x5d\xf4\xe4\xd4\x36\x29\xb6\x91\x36\x93\x7c\xd6\x3a\x94\
-\x06\x4d\xd1\x80\xdc\xb2\x8c\x0f\xa5\x7a\x4d\x9f\x87\xad\x75\x7d\
-\x22\xdf\xcc\x99\x60\x85\x97\x31\x98\x57\xcc\xdc\xc7\x3c\xec\xfe\
-\x10\x48\xed\x5e\x5f\x71\x38\xfb\x46\x36\x8d\xac\x49\x53\x83\xfa\
-\xd7\x47\xe1\xe9\xef\x0a\xc2\xb6\x7f\xe8\xed\x1f\x2c\x14\xee\xf9\
-\x7d\x7d\xbf\xe0\x35\xea\x65\xf5\xa3\x06\xd4\xe3\x74\xfa\x1e\x6e\
-\x2a\x0e\x5a\x9a\xde\x25\xd0\xf5\x4b\x7b\x26\x16\x36\x0e\xd0\xcc\
-\x30\xf2\xc7\x6f\xb5\x88\xce\x48\xe9\xce\x08\x1f\xaf\x4e\x95\x8a\
-\xd1\xdb\xdb\x69\x49\x6f\x24\xad\x75\x7c\x30\xef\x11\x05\x0c\x24\
-\x7f\x78\x77\x6e\xde\xd5\xaf\xad\x78\xd2\xde\xf2\xe0\x2d\xc7\xda\
-\x6d\x67\x56\xd8\x5e\x29\x0b\x46\x7d\x73\xcd\x2f\x8c\x51\x53\x44\
-\x8e\xf2\xde\x38\x26\x69\x80\xdf\x71\x10\xda\x01\x1d\x07\xbb\x1f\
-\x41\x9a\xf5\xb1\x14\xd4\xa9\x4e\x74\xa5\xa2\xd9\x7f\x5f\xf0\x4e\
-\x18\x6e\x94\xbb\x99\x3a\x7e\xa5\x1c\xf0\xac\x3b\xb6\x4b\x9d\xae\
-\x0b\x7c\xaf\xec\x7f\x0f\x4a\xec\x7c\x23\x65\xa2\xe8\x50\xb5\xf4\
-\xd7\x72\x5a\xdd\x2a\x7f\xaa\x0f\x92\x8d\x91\x8d\x87\xb9\x3c\x8e\
-\x41\xaf\x2d\xb9\xd3\x7f\xb4\xb4\xf9\xa6\x5c\xee\x59\x00\x67\x1d\
-\xb3\xfd\x6a\xca\xdf\xcb\x6e\xbf\x34\x92\x4d\x13\x26\xdd\xd8\xfb\
-\x84\x74\x27\xf5\xaf\x95\xa3\x16\x9d\xa2\x7a\x55\x21\xcc\xac\x68\
-\x78\xe6\xfe\x2b\xcb\xdb\xa6\x92\x49\xa4\xb8\x91\xcc\x91\x87\x20\
-\xba\xfb\x92\x38\xcf\xd0\x57\x3e\xd7\xef\x77\x7a\x8e\xd8\x52\xb1\
-\x6d\x62\x7b\xfd\x7f\x2a\xbb\x7b\x62\xb6\x88\xb7\x5b\x8d\xd1\x90\
-\x0d\xf2\x31\xf5\xaa\x70\x16\x6b\x89\x24\x45\xdd\x1e\x08\x1e\xf5\
-\xb4\x6e\x10\x49\x24\x8b\xba\x0a\xec\xbd\xdb\x26\xe1\x1c\xd1\x87\
-\x03\x3f\x7b\x3f\xfe\xaa\x4b\xfb\xb8\xee\x6f\xe3\x8a\x6f\x33\xec\
-\xec\xc5\x23\x07\x92\x87\xb6\x2a\x33\x1c\x92\xb5\xba\xb3\x6d\xdc\
-\xb8\x3c\x7d\xd0\x2a\x7b\xdd\x0d\x6d\x25\x86\x65\x69\x1c\x42\xfb\
-\xb0\x7b\x57\xa1\x47\x44\x9b\x31\xa8\xb5\xd4\xf5\x6f\xd9\x76\xd9\
-\x5b\x55\xd4\x26\x90\x33\x4d\x0a\x85\x1c\xf4\x15\xed\x71\x95\x24\
-\x1f\xe2\x3f\xad\x78\x97\xec\xbd\x7a\xb2\x78\x8b\x54\xdb\x86\x0d\
-\x1a\x9c\x0f\x63\x5e\xcf\x23\xae\xed\xc0\xf1\xbb\x1e\xff\x00\x85\
-\x7f\x54\xf8\x6e\xd7\xf6\x2c\x2d\xdd\xfe\x67\xc4\x66\xd7\xfa\xc3\
-\xb8\xf2\x33\xfc\x3e\xd8\xaa\xb3\x44\x32\xdd\x87\xf2\xa9\x9e\x46\
-\x49\x3a\x81\xb7\xa8\x15\x1c\xf3\x19\x32\x31\xea\x2b\xef\x8f\x30\
-\xaf\x3c\x1b\xb9\x1f\x53\xc7\x4a\xfa\x5f\xfe\x09\x73\x09\x4f\x88\
-\x7e\x2e\x6f\xef\x69\xd6\xff\x00\xfa\x36\x4a\xf9\xa9\x5c\x2c\x3f\
-\xed\x1e\xd5\xf4\xe7\xfc\x13\x09\x36\x78\xf7\xc5\x9f\xf6\x0f\xb7\
-\xff\x00\xd1\xb2\x55\xc6\xf7\xd4\x4f\x63\xec\xca\x28\x07\x8a\x2b\
-\x42\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x82\x71\x45\x66\xf8\xa7\
-\xc5\x16\x3e\x0d\xf0\xf6\xa1\xab\x6a\x97\x76\xf6\x1a\x5e\x93\x6b\
-\x25\xed\xe5\xcc\xcd\xb6\x3b\x68\x63\x42\xef\x23\x1e\xca\xaa\x09\
-\x27\xd0\x50\x06\x81\x91\x41\xeb\x40\x91\x4f\x7a\xfc\x4f\xf1\x67\
-\xfc\x1c\x53\xfb\x4f\x7e\xdc\xbf\x11\x7c\x51\xa7\xfe\xc5\x3f\xb3\
-\x84\x9e\x34\xf0\x4f\x86\xee\x1e\xc4\xf8\xaf\x5b\xb5\x96\x51\x78\
-\xf8\xf9\x64\x0b\xe6\x43\x0c\x1b\xbe\xf0\x89\xe4\x79\x0a\x15\x66\
-\x09\x92\xa2\x8d\x8f\xfc\x17\xdf\xf6\xd8\xfd\x81\xe5\xd2\x75\x9f\
-\xda\xeb\xf6\x5e\xfb\x2f\xc3\x5b\xab\xb4\xb4\xbf\xf1\x0e\x83\x6a\
-\xf6\xb3\x58\x99\x1b\x0a\xdb\x84\xd3\x5b\x96\xc6\x71\x13\x98\xcb\
-\x91\x80\xe2\x80\x3f\x70\x28\xae\x67\xe0\xdf\xc5\xff\x00\x0f\x7c\
-\x7c\xf8\x57\xe1\xdf\x1a\x78\x4f\x52\x83\x58\xf0\xcf\x8a\xb4\xf8\
-\x75\x4d\x32\xfa\x2c\xed\xb9\x82\x54\x0e\x8d\x83\xc8\x38\x3c\xa9\
-\xc1\x04\x10\x40\x20\xd7\x4d\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x05\x47\x31\x39\x5c\x7a\xd4\x95\x1c\xfc\xe2\x80\x3f\x19\x26\xd0\
-\x35\x48\xff\x00\x69\x0f\x1a\x6b\xde\x09\xba\xd1\xdf\xe2\xbe\xbb\
-\x7d\xf1\x2e\xcb\xfe\x11\xfd\x17\x4e\x96\x3f\x88\x3a\x19\x6b\x0b\
-\xb6\xb3\xba\xd6\x6f\x83\x6e\xbb\xd3\xf7\xdb\xc2\x2d\x21\x30\xc4\
-\x23\x7b\xdd\x3f\xcb\x96\x7f\x2c\x83\xf5\x9f\xfc\x13\x1b\x4c\xf8\
-\x6d\x63\xfb\x4b\xf8\x9b\xfe\x14\x4d\xbe\x85\x07\xc3\x06\xf8\x73\
-\xe1\xa5\xd7\x0e\x8b\x1a\xc7\x64\xfe\x21\x13\x5f\x1f\xde\x81\xd7\
-\x51\x16\xa5\x3e\xd2\x4f\xef\x79\x80\x4d\xf3\x6d\xaf\xb1\xb4\xef\
-\x1b\xf8\x5f\x51\xf1\x24\x96\x96\x7a\xde\x85\x36\xb1\x23\x18\x5e\
-\x18\x2f\x21\x6b\xa6\x64\xc9\x28\x40\x3b\x8e\xdc\x1e\x0f\x4c\x1a\
-\xd0\xd0\xef\xb4\xdb\xd8\xa6\x93\x4c\x9a\xc6\x68\xe2\x9d\xd2\x53\
-\x6a\xe8\xca\xb2\xe7\xe7\x0d\xb7\xf8\xbd\x41\xe7\xd6\x88\xe8\xad\
-\xe4\x12\xd5\xdf\xe6\x6a\x20\xc5\x65\xf8\xe9\x99\x3c\x1d\xab\xb2\
-\x9f\xbb\x63\x31\x1c\xf7\xd8\x6b\xcb\xfe\x24\x7e\xda\xfa\x3f\xc2\
-\xef\x1c\x6a\x1a\x0d\xd7\x81\x7e\x32\x6a\xd7\x1a\x73\x2a\xbd\xde\
-\x8d\xe0\x1d\x53\x52\xb1\x98\xb2\x2b\xfe\xea\xe2\x18\x9a\x39\x00\
-\xdc\x01\x2a\x4e\x18\x11\xd4\x1a\xe4\x7c\x5f\xff\x00\x05\x0b\xf0\
-\xfd\xe7\x85\xb5\x48\xbf\xe1\x5b\xfe\xd0\x11\x89\x2d\x25\x42\xcd\
-\xf0\xbf\x59\xda\xb9\x43\xce\x7c\x8a\x00\xf1\x08\xef\xe4\x75\x4f\
-\x99\xf6\xf1\xdf\xad\x45\x75\x21\x91\xf9\xea\x7b\xf5\xaf\x2c\x4f\
-\xda\xeb\x43\x08\xad\xff\x00\x08\x67\xc6\x4d\xbc\x74\xf8\x7d\xaa\
-\x7f\xf1\x9a\xf4\x8f\x0b\x6b\xb0\xf8\xc3\xc3\x56\x1a\xac\x36\xba\
-\x95\x9c\x57\xf1\x79\xa9\x06\xa3\x64\xf6\x77\x50\x8c\x91\xb6\x58\
-\x64\x01\xe3\x6e\x3a\x30\x07\x91\x41\x7b\x96\x1e\x20\x51\xc3\x64\
-\x2e\xdc\x67\xd3\x8a\xf9\x87\xe2\x8e\x9e\xb6\xbe\x2e\xbc\x50\xbb\
-\x71\x29\xc1\x27\xef\x0a\xfa\x89\xd5\x87\xd1\xb8\xc5\x7c\xf5\xf1\
-\xd2\xd5\x2d\xbc\x5b\x70\x92\x46\x36\xbb\x6f\x0f\xdd\x4d\x7e\x61\
-\xe2\x6d\x17\x2c\x04\x2a\x7f\x2c\xbf\x33\xd7\xc9\xe5\x6a\xb6\x3c\
-\xe9\x02\x24\xea\xb2\x2b\x3c\x7b\x81\x60\x0f\x24\x7b\x1a\x97\xc6\
-\x5a\xed\x86\xab\xa8\x47\xe6\x47\x24\x0a\xab\xe5\x46\xfd\xff\x00\
-\x13\x4d\xb9\x8b\xc8\xfb\xd8\x78\xcf\x00\xaf\x7a\x67\x88\xe3\x97\
-\x57\xd1\xa2\x95\x2d\x63\xf2\x6c\x80\x47\x29\x8c\x9f\x7a\xfe\x76\
-\xc7\x53\x73\x82\x92\xe9\xfd\x6a\x7d\x5d\x17\xef\x11\x4f\x62\xf0\
-\x44\xa6\x6f\x9a\x17\xfb\xb3\x46\x38\xfc\x68\xb1\xd4\x6e\x34\x71\
-\xb9\x5b\xcc\x87\xa8\x5c\xfc\xb9\xfe\x94\x69\x4f\x25\xb5\x97\x99\
-\x61\x37\xda\x20\xe3\xcd\xb7\x94\x54\x91\x2c\x3a\x93\x31\xb3\xfd\
-\xcc\xdd\x5e\xd9\xfb\x8e\xf8\xcd\x73\xe9\x6f\x23\x57\x6d\x8a\xff\
-\x00\x11\x6c\x2e\xa1\xfb\x0d\xc5\xbd\xd8\x2d\x73\x1f\x9a\xd0\x3b\
-\x79\x85\x79\xe9\xf8\xd5\x4b\x2d\x5b\x4d\xd7\x15\x63\xd4\x61\x7b\
-\x2b\xd8\xff\x00\xd5\x5c\xc6\x76\xe0\xfb\xff\x00\x90\x6a\xdf\xc4\
-\x2d\x0a\xdf\x4b\xb7\xb7\x51\x78\xbf\x6e\x5c\x33\x2a\x31\x20\x03\
-\x8c\x00\x7b\xd5\x2d\x26\xfe\xd2\xf2\x21\x6b\xab\x5a\xb2\xb3\x1f\
-\x96\xea\x35\xf9\x87\xb9\x1d\x2b\xcd\xa1\x67\x52\x4a\x3f\x71\xae\
-\xbe\xcd\x1d\x3f\x86\xf4\x16\x82\x49\x26\xd5\xa3\x6d\x4f\x49\x86\
-\x13\x28\x96\x06\xc3\x33\x7f\x0a\x31\xf4\x2c\x4e\x7d\xbf\x3a\xa7\
-\xa6\xf8\x8e\x69\x23\x91\xa3\xb4\x32\x86\x88\xb9\x10\xfc\x9d\x7e\
-\x5c\x91\xed\xdb\xd2\xa1\x5d\x36\xfb\xc2\xf0\xac\xda\x75\xc2\xdf\
-\x58\xb1\xcf\xca\x77\x21\x1d\x08\x61\xfe\x35\xa9\x61\x79\xfd\xa7\
-\xf6\x59\x2c\x2d\x45\x9d\xf4\x96\xee\xa4\x0c\x9e\x39\xf4\xe8\x31\
-\xf8\x71\x53\x8e\xa7\xee\xa7\x77\xa7\x45\xa3\xd7\xcc\xc6\x3b\x9e\
-\x78\x9a\xc7\xcf\x2c\x77\x56\xf2\xa9\xeb\xe6\xaf\xcc\xa7\xea\x3f\
-\xa8\xab\x7a\x43\x5e\xe9\x92\xfd\xa7\x4b\xb8\x2a\xad\xf7\x95\x79\
-\x8d\xc7\xb8\xe9\xfd\x6a\xac\x76\x73\x0d\x46\xe8\x36\x55\x94\x95\
-\x1b\x49\x61\x9c\xf5\xa4\xb6\x79\x6d\x2f\x07\x92\xe6\xde\x4c\x8c\
-\xa8\xf9\xa3\x90\xfb\x8e\x95\xe7\xe1\xe4\xb9\xbd\xd3\xbe\xa5\x9c\
-\x6c\x7a\x1e\x85\xf1\x03\x52\xd6\xec\xa3\x8e\x30\x74\x76\xb8\xb9\
-\x8e\x0b\xb9\xd4\xe2\x19\x40\xf9\xbf\x1d\xa3\x9e\xf8\xcf\xbd\x62\
-\xcd\x65\x14\x57\xb7\x42\x4b\x89\x27\xfb\x3a\xb2\x16\xdb\x9f\x31\
-\x8f\xa7\xa6\x00\xff\x00\x3c\xd4\xda\x36\xa2\xbe\x22\xb1\xb8\x8e\
-\xf2\xcb\xcb\x9a\xde\x1d\xeb\x2a\x90\x55\xf2\x71\x85\x3f\xde\x63\
-\x80\x07\x53\x5a\xb6\xda\x1e\x9f\xe1\x6b\x74\x9a\xe5\x7c\xc9\x61\
-\x8b\x64\xd0\xaa\xee\xcb\x11\xd4\x31\xc6\x39\xc7\x18\xe9\x8e\x6b\
-\xab\x19\x08\x3b\x4e\x3f\x13\xd9\xf9\x5b\xb1\xe7\xaf\x76\x56\xe9\
-\xd8\xf2\x62\x65\xb7\xbd\x66\xb5\x0f\x20\xfe\x34\x95\x15\x80\xa7\
-\xc3\xa8\x47\x23\x98\xe4\x55\x52\x7a\xac\xa3\x31\xb7\xd0\xf6\xad\
-\x16\xb6\x86\xea\xf5\x99\x56\x4b\x79\x18\x92\xa7\x68\x20\x8f\x7a\
-\xcf\xd5\xac\x9a\x10\x7c\xf8\xf2\xbd\x9d\x7a\x57\x2d\x3a\xcb\xe1\
-\x67\xa9\x24\x9c\x52\x34\x2d\xfc\x3a\xb7\x51\x85\xb7\x95\x61\x76\
-\xe4\x5a\xdd\x73\x1b\xff\x00\xbb\x27\x41\xf8\xe3\xeb\x55\xef\x34\
-\x79\x34\xeb\xcd\xb2\x47\x35\x8d\xe4\x7c\xaa\x38\x2a\xeb\xee\xae\
-\x3b\x7a\x7a\xd5\x1d\x2a\x6b\xad\x3d\x3f\xd1\xe5\x59\x23\x07\xe6\
-\x8d\x86\xe5\xfc\xbb\x7d\x45\x75\x5a\x57\x8c\x20\xbe\xb3\xfb\x1d\
-\xe4\x70\xb4\x6c\x70\x2d\xee\x86\xe8\x47\xfb\x8e\x79\x53\xf9\x7d\
-\x6b\xde\xc3\xbb\xad\x3f\x13\x86\xa3\x94\x5e\x9a\x98\xba\xef\x8b\
-\x35\x0b\x8d\x0f\xec\x77\xfe\x4c\xfb\x1b\x2b\x2c\xd1\x15\xb8\x1e\
-\xdb\x97\xaf\xe3\x5c\xe6\x95\x14\x97\x53\xfc\xb8\xe7\x39\x2d\xd3\
-\xad\x75\x1e\x2d\xd2\xe3\xb1\xd3\x0b\x24\xd3\xd9\x46\xc7\x2b\x6f\
-\x34\x7b\xf7\x27\xaa\x3f\x71\xfe\x73\x5c\xc6\x9f\x70\xee\x02\xaf\
-\xc8\xaa\x4f\x4e\xf5\x86\x3e\x4d\xc4\xdb\x0d\x6b\x33\x7e\xdf\xc9\
-\xd3\xe4\x1f\xf2\xd6\x43\xc7\xd2\x96\xe0\x49\x76\x37\x4a\xc5\x57\
-\xae\x17\xa9\xff\x00\xeb\x54\x16\x91\xae\xe5\x55\xfd\xe4\x8c\x38\
-\x18\xcb\x1a\xd7\x16\x71\x69\x31\x79\xb7\x4c\xb2\x48\x46\x56\x31\
-\xf7\x54\xfb\xd7\xcc\x54\x76\x95\xf7\x67\x4f\x32\x47\x3f\x77\x64\
-\xd3\x83\xe5\x42\xec\x3d\x8e\x31\x45\xaa\x4f\xa1\x8c\x05\x59\x14\
-\xae\x18\x0f\x98\x1a\x6e\xb3\xe2\x3b\x89\xa7\x26\x21\x22\xa8\xe0\
-\x6d\xe1\x6a\x3b\x1d\x71\xa2\xf9\x5c\x16\x5f\xad\x75\xc5\x4f\x91\
-\x5c\xb7\x16\xd6\xa4\x4b\x23\x4d\x7a\x7e\x5f\x2d\x30\x4e\x43\x73\
-\xf9\x56\xbe\x8d\x72\x6e\xed\x63\xb5\x5e\x64\xdf\xf2\x3a\xaf\x0c\
-\x3b\xa9\x1d\x79\xac\x79\x95\x99\x8b\xc3\xb5\xf7\x1e\x41\x38\x7f\
-\xc2\xac\xdb\xb4\xd6\x93\x9d\xbb\x91\x9d\x86\xd9\x77\xed\xf2\xfd\
-\x79\x1d\x3f\x95\x77\xe1\xe4\x94\x93\x67\x2d\x68\xb7\xa2\x3a\x19\
-\x1a\xf3\xc8\x5b\x78\x6c\x7e\xcf\x1c\x85\x44\xd2\x70\xca\xb8\xe9\
-\x92\x07\x03\xb1\x26\xb3\xfc\x49\x35\x8d\x8d\xbc\x6b\x6b\x38\x9a\
-\xe2\xde\x5c\x33\x42\xdf\xb9\x41\xe8\x07\x72\x71\xd4\x71\x56\xae\
-\x35\x9f\xec\xb5\x87\xcd\xf3\xbe\xdf\x21\x1f\x35\xbc\x99\xf2\xd7\
-\xb8\x31\x9e\xa7\xa8\xf4\xef\x54\x7c\x62\x96\x9a\x4c\x50\xdb\xc3\
-\x25\xad\xc3\x4c\x4c\xce\x6d\xce\x7c\xbc\x8e\x14\x9e\x99\x00\xe4\
-\xe3\xa7\x4a\xf5\xab\x69\x45\xf2\xbf\xf8\x0b\xfc\xce\x28\x2f\xde\
-\x2b\x99\x37\x17\x92\x7d\x86\x66\xdd\xfe\xba\x62\x5b\x1e\xb8\xc6\
-\x6a\x5b\xa9\x24\xd3\x6c\x96\x16\x56\xda\xdb\x5f\x04\x7d\xec\xd4\
-\x10\x5c\xc7\x06\x83\xfb\xcf\xbf\x23\x92\x0f\xa7\x35\x54\x2c\xd7\
-\x76\xf0\xc9\x24\x9f\x79\xd9\x46\xe3\xd9\x7a\x57\x8f\x4e\x3a\xff\
-\x00\x5a\x9d\xf2\x8d\x8d\x8b\x0d\x41\x6f\x74\x59\xed\xa4\x46\xf3\
-\x15\x42\xc7\x8e\x9c\x0c\x9c\xfd\x2a\xa9\xb9\x37\x16\xea\xa1\x4c\
-\x6d\x0f\xca\xca\x3b\x52\x69\xf7\x1f\x63\xbb\x8f\x90\xcd\xc8\xe0\
-\xe7\x14\xeb\xc7\xf2\x6e\xb7\x1c\xe1\xb8\x38\x1d\x7d\x2b\x49\x2e\
-\x8b\xd4\xca\x3d\xc9\xe2\xb3\x5b\xcb\xe7\xdb\x27\xf0\x11\xb4\x7f\
-\x0d\x5c\xd0\x87\xfc\x4a\xb1\x23\xee\x60\x4a\x9c\xf3\x9c\x53\xb4\
-\xfb\x45\xd2\xac\x1a\x56\x8c\x19\x98\x16\x6c\x76\xcd\x51\xd1\x12\
-\xe2\x5b\xa9\x26\x86\x1d\xd6\xee\xc0\xb2\x13\xd7\x9a\xea\xa5\xef\
-\x49\x41\x7a\x7e\x26\x15\x1e\x97\x3a\xdf\x86\xd6\xfa\x8f\x87\xfc\
-\x6b\x2a\xd8\xc6\xad\x24\x96\xde\x66\xd6\x3f\xeb\x17\xd0\x7b\xe6\
-\xbd\x73\xe1\x06\xa7\x79\xaa\xf8\x76\x6b\xcb\xcb\xa6\x9a\x69\xa6\
-\x65\x64\x23\x88\x71\xc6\x2b\x81\xf1\xed\xe4\x12\x78\x7f\x45\x92\
-\xcc\xb5\x8e\xa3\x1b\x2c\x6a\xea\x76\xb2\xe7\xa8\x27\xd3\xeb\x5e\
-\x9f\xe0\xcf\x0e\x8f\x09\xe8\x49\x6a\x92\x79\xae\xcd\xe6\x48\xe7\
-\x8d\xec\x7a\xd7\xf4\xb7\x06\x65\xef\x0d\x56\x38\x6a\x52\x6e\x11\
-\x5c\xcf\x5d\x3d\xe4\xad\xa6\xf7\x56\x67\xc8\xe6\x35\x39\xe3\xce\
-\xf7\x7a\x7d\xc6\xf4\x6f\xb8\x9e\xfb\xb9\xcd\x35\x1d\x56\x56\x1d\
-\x6a\x15\xb8\x6b\x73\xfe\x34\xd3\x30\x76\xce\x79\xaf\xd4\x2e\x78\
-\xa5\x8b\x88\x3e\x6e\x3f\x03\xf8\x57\xd2\xdf\xf0\x4c\x1d\xdf\xf0\
-\xb1\x3c\x5c\x1b\xfe\x81\xf6\xe7\xff\x00\x23\x49\x5f\x30\xbc\xe4\
-\x0c\x31\xe9\x5f\x4e\xff\x00\xc1\x2e\xa5\xf3\x7e\x21\x78\xb9\xbf\
-\xea\x1d\x6e\x3f\xf2\x2c\x95\xa7\x52\x64\x7d\xa3\x45\x14\x56\x84\
-\x85\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x05\x14\x51\x40\x05\x14\x51\x40\x05\x7c\xb3\xff\x00\x05\xb7\xd6\
-\x6e\x7c\x39\xff\x00\x04\x90\xfd\xa2\x2f\x2c\xe4\xf2\x6e\x07\x81\
-\xb5\x18\x83\x63\x3f\x2b\xc4\x51\x86\x0f\x1c\xab\x11\xf8\xd7\xd4\
-\xd5\xe3\x3f\xf0\x50\xaf\x03\x78\x07\xe2\x77\xec\x57\xf1\x33\xc3\
-\xff\x00\x15\x3c\x45\x77\xe1\x2f\x87\x3a\xc6\x81\x71\x6b\xe2\x1d\
-\x66\xda\x54\x86\x6d\x36\xd1\x80\x0f\x2a\xbb\xc7\x22\xa9\x1e\xa5\
-\x18\x7b\x1a\x00\xf8\xa7\xfe\x0d\xbc\xfd\xa5\x7e\x0f\xfc\x1c\xff\
-\x00\x82\x33\x7c\x1d\xd2\x75\x7f\x88\x5f\x0d\xbc\x31\xad\xc9\x1e\
-\xa9\x73\xa8\xd9\x5f\x6b\xf6\x76\x77\x46\x56\xd5\x6f\x30\xf2\xc6\
-\xf2\x06\xdc\x63\x11\xe0\xb0\xc9\x50\xbd\xb1\x5e\xad\xff\x00\x05\
-\x7a\xfd\xac\x7e\x0b\xfc\x4b\xff\x00\x82\x5e\x7c\x7a\xd0\xed\x7e\
-\x27\xfc\x30\xd7\x2e\xef\xbc\x15\xa8\xad\xad\x8d\xbf\x89\x2c\x6e\
-\x66\x9e\x65\x85\x9a\x30\x88\x24\x25\x9c\x38\x52\xa0\x02\x72\x06\
-\x39\xaf\x8b\x7e\x18\x7f\xc1\xaa\x5f\xb0\x9f\xc6\x6f\x81\xd6\x3f\
-\x13\x3c\x33\xf1\xa3\xe2\xee\xa7\xf0\xff\x00\x52\x49\x25\xb7\xd7\
-\xc7\x89\xb4\x88\x6c\x24\x54\x99\xa0\x73\xe6\x49\xa7\x28\x00\x4a\
-\x8c\x9c\xe3\xe6\x5c\x55\xbf\x88\x3f\xf0\x69\x9f\xec\x4b\xf0\xbf\
-\xe0\x9e\xb1\xf1\x1f\x58\xf8\xaf\xf1\xba\x3f\x03\xe8\x5a\x64\xba\
-\xc5\xe6\xb1\x6b\xae\x69\x97\xb6\xf1\xda\x44\xa5\x9e\x55\xf2\x74\
-\xd7\x69\x00\x00\x9c\x20\x62\x71\xc0\x26\x80\x3e\xb1\xff\x00\x83\
-\x63\x35\xeb\xaf\x10\xff\x00\xc1\x14\x7e\x0c\xbd\xd4\xbe\x6b\x59\
-\xa6\xa5\x69\x17\x00\x6d\x8d\x35\x1b\x90\xab\xc7\xa0\xf5\xaf\xbf\
-\x2b\xe5\x9f\xf8\x23\x5f\x82\x7e\x0c\xfc\x3b\xff\x00\x82\x7b\x78\
-\x0f\x49\xfd\x9f\xfc\x59\xaf\x78\xe3\xe1\x4d\xb3\xdf\x1d\x1f\x59\
-\xd6\x63\x68\xef\x6e\x8b\x5d\xcc\xd3\x07\x56\xb7\xb7\x23\x6c\xc6\
-\x45\x1f\xba\x5e\x14\x75\xea\x7e\xa6\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x99\x31\xc0\xa7\xd3\x64\x38\xa0\x0f\xcf\x9f\x8c\xbf\
-\xb2\xfe\x9d\xf1\x4b\xf6\x84\xfd\xa3\x7c\x5d\xe0\x1f\x87\xfe\x1d\
-\xd0\xfc\x51\xf0\xa3\xc1\x17\xbe\x1c\xf0\x9d\xfe\x95\xa1\xc1\x67\
-\xa8\xdf\x78\x9f\x55\xd3\x1e\xf6\xfa\xf1\x27\x8e\x35\x92\x49\x7e\
-\xcf\x3d\x84\x08\xfb\x89\x0d\x35\xd7\x39\x73\x5b\xdf\xf0\x4c\xeb\
-\x0f\x87\xf3\xfe\xd3\x1e\x24\xbe\xf8\x27\xa4\x58\xe8\xff\x00\x0c\
-\xa3\xf8\x73\xe1\xcd\x3b\x59\x4b\x0d\x39\xac\xad\x5f\x5f\x8a\x7b\
-\xe3\xe5\xba\xb2\x29\x6b\xd8\xad\x59\x56\xe0\x9f\x9c\x6f\x85\x64\
-\x25\x82\x81\xf6\x6d\xa7\xc4\x6f\x0f\xea\x1e\x31\xba\xf0\xec\x1a\
-\xd6\x8f\x71\xe2\x0b\x18\x45\xc5\xce\x99\x1d\xec\x4d\x79\x6f\x11\
-\xc0\x12\x3c\x21\xb7\xaa\x9c\x8e\x48\x03\x9a\x4f\x09\xfc\x43\xd0\
-\xbe\x20\x5b\x5c\xcf\xa0\xeb\x1a\x4e\xb7\x0d\x9d\xc3\x5a\x4f\x2e\
-\x9f\x7b\x15\xd2\x41\x32\xfd\xe8\xdc\xc6\xc7\x6b\x8e\xea\x79\x14\
-\x47\x47\x7f\x2f\xf3\x07\xaf\xf5\xe9\xfe\x46\xe4\x63\x15\x95\xe3\
-\xdf\xf9\x12\x75\x8f\xfa\xf1\x9f\xff\x00\x40\x35\xe6\x5f\x11\x7f\
-\x69\xff\x00\x15\x78\x07\xc6\xfa\x86\x93\xa7\xfc\x07\xf8\xbd\xe2\
-\xdb\x3b\x36\x55\x8f\x57\xd2\x26\xd0\x56\xca\xf7\x28\xac\x4c\x62\
-\xe7\x53\x86\x6c\x02\x4a\x9d\xf1\xaf\x2a\x71\x91\x82\x79\x3f\x18\
-\x7e\xd8\xde\x34\xbb\xf0\x9e\xab\x1b\x7e\xcc\xff\x00\x1d\xa3\x57\
-\xb3\x95\x4b\x19\xfc\x33\xc0\x28\x79\xe3\x57\x27\x8f\xce\x80\x3c\
-\x36\x09\x99\x91\x17\x9c\x62\x9f\x32\x97\x0a\x07\x27\x02\xbc\x8a\
-\x2f\xda\x47\xc4\xc1\x57\xfe\x2c\x4f\xc6\x23\xc7\x1f\x36\x85\xff\
-\x00\xcb\x2a\xf4\xcf\x08\xeb\x97\x1e\x23\xf0\xcd\x8e\xa1\x75\xa4\
-\xea\x5a\x0d\xd5\xe4\x5e\x64\x9a\x75\xf9\x84\xdd\x59\x1e\x9b\x24\
-\xf2\x64\x92\x3d\xdd\x0f\xc8\xec\x39\x1c\xe7\x35\x37\x34\x2e\xcc\
-\xd9\x3e\x87\x8c\x7b\xf4\xaf\x12\xfd\xa5\xb4\x8d\xba\xa5\xbd\xc2\
-\x9e\x64\x8c\xf0\x7b\xd7\xb6\xb2\x12\x48\x63\x5e\x65\xfb\x4a\xe9\
-\x89\x3e\x83\x6f\x70\xca\xcc\x23\x62\x99\x1d\x85\x7c\x7f\x1c\x61\
-\x7d\xbe\x51\x55\x25\xaa\xd7\xf1\x3b\xb2\xf9\xf2\xd7\x47\x80\x97\
-\x92\x29\x59\x40\xf9\x47\x25\x29\x66\xb4\x59\xb4\x6b\xa9\x63\xb8\
-\xf2\x32\x3e\x58\xf3\xf7\x8f\xd2\x96\x66\xf9\xba\x6e\xf4\x71\xda\
-\xaf\x1d\x0e\xd6\xcf\x4e\x13\x4d\x37\x9c\xd3\x47\x92\x8a\x36\xe3\
-\x3d\x33\x5f\xcb\xb8\xae\x5e\x46\x99\xf6\x51\x92\xba\x67\x27\x67\
-\x30\xde\xbb\xbf\xd1\xee\x00\x18\x91\x78\x53\xf5\xab\x8d\x72\xac\
-\xea\x6e\x17\xcb\x93\xf8\x6e\x23\x1f\x29\xfc\xaa\x9a\x44\xd0\x6e\
-\x2b\xb6\x78\xd4\xe0\xa9\xab\x2b\x16\x60\xdd\x00\x12\x2f\xf1\x44\
-\x4f\x4a\xe2\xc3\x4e\xf1\xb9\xb5\x48\xd9\xe8\x4b\xe2\xd9\x44\xbe\
-\x18\xb5\x6b\xc8\x9a\x69\xd6\x43\x8b\x84\x1d\x57\x1c\x66\xaa\xe9\
-\x57\x8c\xb6\x6b\xbe\x18\xf5\x0b\x5c\x72\x9f\xc5\x0f\xd0\xf5\x06\
-\xad\xdf\x4f\xb3\xc1\x93\x43\x6f\x14\x26\x38\xe7\x05\x84\x87\x6b\
-\x0c\xfa\x7e\x55\x8d\xa2\x2c\x84\xe6\x09\x1a\x2b\x85\xe0\xc7\xbb\
-\xff\x00\x41\xfe\xf0\xfa\x57\x2b\x92\xf6\xed\x33\x48\xc6\xf4\xcd\
-\xfd\x2a\x19\x20\xdd\x71\xa1\x5d\x3b\x32\xf3\x25\xb3\x0c\x48\x3d\
-\x77\x29\xe1\x87\xb8\xad\x1b\x6f\x15\x34\xd7\xfe\x5b\xcc\xb6\x6f\
-\x32\x6d\x65\x44\xef\xd0\x8f\x6a\xa7\xe1\x2f\x11\xd8\xe9\xba\xc7\
-\xda\x2f\xb4\xd8\xe6\xba\xda\x56\x2d\xd9\x08\x1b\xfb\xc4\x0f\xa1\
-\xe0\xd6\xda\x78\xc9\x75\xbd\x42\x31\xf6\x6b\x4b\x74\x40\x03\x3f\
-\x94\x81\x86\x33\xdc\x8e\x72\x4f\xe5\xc5\x73\x66\x15\x29\x2e\x58\
-\x54\x4f\x56\xad\xdb\xef\x33\x51\x7d\x8f\x3c\x48\x2e\x62\xd5\xe4\
-\x92\x39\x56\x58\xb2\x55\xb8\xf9\x98\x7f\x8d\x6b\x69\x9a\x3d\x86\
-\xb5\xa9\x7f\xc4\xc2\x66\xb5\x85\x50\xb7\x99\x1a\x6e\x77\x23\x18\
-\x42\x3d\x4f\xaf\x35\x8f\x7b\x02\xc7\xac\x5d\x3c\x33\x48\x24\x69\
-\x19\x86\x78\x05\x49\xf4\xa9\xa2\xd5\x94\xb6\xdb\xa5\xd8\xeb\xc2\
-\xb8\xaf\x22\x30\x9f\x37\xb8\x77\x54\xd6\x3a\xf6\x3a\xcf\xf8\x49\
-\xb4\xf8\xa6\x82\xdf\x4d\xb2\xf2\x74\xbb\x47\x12\x38\x21\x99\xa6\
-\x71\x9d\xa5\xd8\xf5\xc7\x5f\x43\x8e\x95\x76\xda\x6b\x18\x6d\xee\
-\xaf\xd2\x4b\x95\xbc\x62\x4a\xee\x93\xf7\x31\x0c\x60\x2e\xdf\x46\
-\xf7\xcd\x73\x9a\x2d\xc5\xe6\x8f\x12\xcd\x08\x13\x47\x27\xcd\x22\
-\x81\xb9\x5b\xd9\x85\x58\xb9\xd6\xed\xf5\x09\xee\x2c\xd6\xc6\x0b\
-\x54\x8e\x3f\xb4\x4a\x40\xe5\xdf\x69\x0a\xb9\xfe\xee\x4e\x7f\x0a\
-\xde\xa5\x39\x39\xa9\xa9\x34\xd7\xf5\xf7\x1c\x51\x8d\x91\xcf\xea\
-\x90\xdb\xdc\xdd\xb5\xd5\xba\xb4\x51\xbb\x67\xfb\xd1\xb1\x3f\x8f\
-\x15\x93\x79\x73\x25\x80\x2a\x47\xcb\x9c\x61\xb9\x42\x7e\xb5\xce\
-\xbd\xc5\xc6\x8b\xa9\xb3\xdb\xc8\xd1\xab\x9e\x42\x36\xe5\x23\xdc\
-\x56\x95\xb6\xb5\xf6\x88\xf7\x49\xfb\xa2\x7a\xe3\xee\x1f\xad\x6b\
-\x1c\x35\x9d\xf7\x3d\x4f\xb3\xa9\x7b\x4f\xb2\xb7\xd4\xa7\xdb\x1c\
-\xbf\x61\xbc\x53\xf2\x86\x38\x57\x3f\x51\x57\xf5\x1b\x79\xb4\xb6\
-\x11\xea\x96\x85\x19\x86\x56\xe2\x30\x7e\x71\xdb\xd8\xfe\x1c\xd6\
-\x0b\x47\xe5\xce\xad\x1e\xc5\xe7\x21\x49\xf9\x3f\x0f\x4a\xe9\xfc\
-\x31\xe3\x99\xb4\xbb\x65\xb3\xba\x8e\x3b\x8b\x76\xe4\xdb\x5d\xfc\
-\xe8\xde\xe8\x7b\x7e\x15\xeb\x61\xe9\xf2\xab\x27\x63\x82\xb4\x5e\
-\xe8\xe7\xf5\xd8\x6e\x2d\xf4\xad\xd0\xcd\x1c\x96\xa0\xe7\x71\xc7\
-\xe4\x47\xf8\xd6\x76\x87\x64\xd3\x9f\x98\x88\x63\x27\x3b\x98\xf5\
-\xfa\x0a\xdb\xf8\xab\xac\x78\x57\xc2\xdf\x0f\xf5\x4f\x10\x5e\x5d\
-\x5e\x69\x76\xba\x5c\x52\xdc\xcd\x1b\xaa\xf9\x71\x2a\x2e\xe6\x39\
-\xc7\x23\x19\x18\xeb\x92\x2b\xcd\x7e\x0d\x7c\x6f\xd3\x7e\x3b\xfc\
-\x37\xd2\xbc\x49\xa2\xc8\x7e\xc1\xa8\xa3\x7e\xee\x4c\x79\x96\xce\
-\xac\x55\xe3\x7c\x7f\x12\x91\xf4\xc1\x04\x70\x45\x69\x8c\xc0\x62\
-\x25\x86\xfa\xc4\x61\xee\x26\x93\x97\x44\xdd\xda\x5f\x34\x8a\xc3\
-\xd4\x8f\x37\xb3\xbe\xaf\x5b\x75\x3d\x46\x1d\x6e\x1d\x21\x0c\x36\
-\x79\xf3\x1b\x86\x6c\x65\x89\xfa\xd5\x3b\xa9\x7c\xe5\xdd\x2b\x6e\
-\xf4\x5c\xf3\x54\x2c\xa4\x2a\x00\x8b\xe6\x76\xef\xed\x56\x5c\x88\
-\xb8\x51\xe6\x49\x82\x47\xfb\x35\xf2\xd2\xa5\x67\x73\xbe\x31\x4b\
-\xd4\xca\xd4\x26\x95\xcb\x04\x01\x7a\x00\x0f\x7a\x73\xda\x18\xed\
-\x95\xbe\x56\x63\xc9\x19\xc1\xa8\x6f\xe1\x63\x2b\x33\x3c\x60\xf7\
-\x4e\xbf\xad\x0d\x19\xf2\x7d\xbf\xa5\x77\x47\x64\x5c\xb6\x1f\x1e\
-\xe5\x6e\x0f\x3e\x9e\x95\x72\xdf\x56\x18\xf2\xee\x03\x34\x3c\xe7\
-\x67\x55\xed\x59\xf0\x7c\x8b\xfe\xce\x38\x3d\xc5\x2c\x45\xa2\xda\
-\x24\x1b\x63\x1c\x8e\xf5\xad\x38\xa6\xec\xce\x7a\x86\x9d\xc5\xea\
-\xdb\x5e\xc3\x2c\xcd\x25\xc2\x28\xdd\x19\x4c\x09\x48\x5e\x70\x4f\
-\x40\x6a\x0d\x5e\xea\x3b\xed\x4e\xdc\xc9\x6f\xe4\x43\x16\x14\xc5\
-\xfd\xdc\xf7\xcf\x73\x9e\xa6\xa8\xe9\xaf\xb6\xfd\x7e\xf2\xa3\x36\
-\x41\xfe\xef\xbf\xf5\xab\xfe\x23\xbf\x8f\x50\x21\xa3\x93\x31\xdb\
-\x6d\x8c\x65\x36\x16\x4e\x99\xc7\xe1\x5d\xf5\xa1\x6a\x5a\x33\x92\
-\x0a\xd3\x33\xb5\x18\x1a\x2b\xe6\xb3\xda\xcd\x0c\x6d\xbf\x81\xd8\
-\xd4\xda\xbe\xa9\xe7\xaa\xc2\x15\x51\x30\x3e\x50\x3a\x53\xb5\x1b\
-\x8f\xf4\xa4\xba\x55\x3e\x5c\xd8\x45\x27\xaf\x1d\xaa\xbd\xcd\x8f\
-\xf6\x86\xa0\xd8\x1e\x4b\x33\x74\x07\x8a\xe1\xa7\xad\xae\x74\x4b\
-\x6b\xb2\x6b\x2b\x59\x9a\x28\xe4\x86\x3d\xc0\xa9\x39\xff\x00\x3d\
-\xea\xc5\x94\x0d\x2d\xec\x6b\x26\x08\xdd\xce\x7d\x7a\xd5\xd8\xa4\
-\x87\x4c\xb5\x55\x66\xf9\x94\xfc\xcb\xf4\xa9\xf4\xe5\x8e\xeb\x50\
-\x85\x9b\x98\xe4\x07\x6a\x0e\xe6\x8a\xd2\x69\xf3\x58\xca\x32\xd2\
-\xc6\xca\x5a\x2f\x92\x1d\x9b\x11\xe3\x9e\x3e\xf5\x67\x68\x36\x8d\
-\xa8\xda\xcd\x6b\x6e\x70\xf2\x4c\x55\x40\x3c\x8e\xf5\x3e\xb3\x03\
-\x59\x40\xcc\x92\x32\xb4\x63\x20\x0e\xd4\x9f\x0c\x65\x16\x9a\xb0\
-\xbc\x93\x73\x05\x6f\x37\xf1\x15\xea\x64\xd4\x15\x7c\x4c\x29\xc9\
-\xe8\xda\xfb\x8e\x2c\x44\x9a\xa6\xe4\x75\x3a\xa6\xa7\x0e\xa1\xe0\
-\xeb\x5b\x49\xe3\x2d\xaa\x5a\xca\x21\x39\x18\x70\xe3\x9f\xcb\xa7\
-\x35\xec\x3a\x54\x92\xae\x9f\x00\x97\xfd\x71\x8d\x43\xfb\x9c\x0c\
-\xd7\x97\x7c\x32\xd0\x1b\xc6\x9e\x2f\xbb\xf1\x05\xd2\x2a\xc7\x1b\
-\x95\x8a\x35\x5c\x06\x23\x8c\x9a\xf5\x13\x2a\xaf\x50\x41\xfa\xd7\
-\xf5\x67\x08\xe1\xe6\xe2\xf1\x2f\xe1\x69\x46\x2f\xbc\x63\xb4\x9f\
-\xad\xf4\x3e\x33\x1f\x35\x75\x05\xf3\xf5\x7d\x0b\x44\x79\x8b\x9f\
-\x4e\xbe\xf5\x08\x3b\x25\x3f\x5c\x8a\x23\xba\x53\x1f\xe3\x55\x8f\
-\x32\xb1\xaf\xb4\xd4\xf3\xee\x5b\x76\x59\x0f\x3c\xff\x00\x4a\xfa\
-\x7b\xfe\x09\x69\x22\xff\x00\xc2\xc3\xf1\x86\x38\x5f\xec\xeb\x6f\
-\xfd\x1b\x25\x7c\xb2\xa4\x30\xdc\x4b\x71\xd3\x3d\xab\xea\x2f\xf8\
-\x25\x69\x56\xf8\x8b\xe3\x1d\xbf\xf4\x0e\xb7\xcf\xfd\xfd\x92\xab\
-\xa9\x27\xdb\x54\x51\x45\x68\x48\x51\x45\x14\x00\x51\x45\x14\x00\
-\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\
-\x57\xc9\xff\x00\xf0\x5d\x11\x8f\xf8\x23\xff\x00\xed\x13\xff\x00\
-\x62\x55\xf7\xfe\x82\x2b\xeb\x0a\xf0\xdf\xf8\x29\x2f\xec\xe5\xae\
-\xfe\xd8\x3f\xb0\x9f\xc5\x5f\x85\xbe\x19\xba\xd2\x6c\xb5\xff\x00\
-\x1d\x78\x76\xe7\x49\xd3\xe7\xd4\xe4\x92\x2b\x38\xa6\x90\x00\x1a\
-\x56\x8d\x1d\xc2\xfa\x95\x46\x3e\xd4\x01\xf9\x43\xe1\xc8\xf7\xff\
-\x00\xc1\x91\x72\x6e\x50\x7f\xe2\x9d\xb8\xea\x3f\xea\x6c\x73\x5e\
-\xfb\xf0\x55\x71\xff\x00\x06\x8d\xe3\x1f\xf3\x45\xf5\x13\xff\x00\
-\x90\xa7\xaf\x8d\x21\xff\x00\x83\x6a\xff\x00\xe0\xa1\x96\xdf\xb3\
-\x4f\xfc\x29\xb4\xfd\xa2\xbe\x18\x47\xf0\xb3\xc9\x6b\x63\xe1\x71\
-\xe2\x7d\x5f\xfb\x37\xcb\x37\x06\xe4\xaf\x95\xfd\x9b\x8c\x19\x89\
-\x93\xfd\xe3\x5a\xda\x67\xfc\x1b\xc7\xff\x00\x05\x24\xd1\xfe\x02\
-\xff\x00\xc2\xad\xb5\xfd\xa7\x3e\x1e\x41\xf0\xeb\xfb\x31\xf4\x6f\
-\xf8\x47\x93\xc5\x7a\xc0\xb0\xfb\x1b\x82\x1a\x0f\x2f\xfb\x3b\x1b\
-\x08\x62\x31\xef\x40\x1f\xa0\x1f\xf0\x6b\x88\xff\x00\x8d\x25\xfc\
-\x21\xff\x00\xae\xba\xb7\xfe\x9c\xae\xab\xf4\x22\xbe\x57\xff\x00\
-\x82\x32\xfe\xc4\xfe\x2c\xff\x00\x82\x77\x7f\xc1\x3c\x7c\x07\xf0\
-\x8f\xc6\xda\x87\x87\xf5\x4f\x12\x78\x65\xef\x9a\xea\xe3\x44\x9e\
-\x59\xac\x64\x13\x5d\xcd\x3a\x6c\x79\x63\x89\xce\x16\x45\x07\x28\
-\x39\xcf\x51\xcd\x7d\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x47\x37\xde\x5f\xad\x49\x51\xdc\x73\xb6\x80\x3f\x1c\xf4\x6f\x84\
-\xbe\x32\x93\xc5\x5a\xd6\x87\xa5\x45\xa9\xeb\x1f\x1d\x26\xbb\xf8\
-\x8e\x9a\xb6\x98\xde\x0d\x36\x17\x3e\x1b\xb7\xbc\xb6\xd5\x4d\x8e\
-\xad\x1e\xb2\xb1\xac\x93\xb5\xc3\x1d\x3a\x08\xc4\xb3\xcb\x14\xab\
-\x72\x9e\x5c\x71\x35\xa6\xe4\xfa\xc7\xfe\x09\xc3\x0f\x84\xfc\x41\
-\xfb\x4d\x78\x8b\x5c\xf8\x53\xe1\xb9\xfc\x2f\xf0\xe6\xd3\xe1\xbf\
-\x87\x34\x0d\x56\x1f\xec\x29\xb4\x78\x64\xd7\x2d\xe7\xbe\x6f\x20\
-\xc7\x2c\x48\xcf\x73\x6b\x6d\x22\xa4\xcd\xc9\x5f\x36\x24\x62\x4a\
-\xe1\x7e\xa3\xb1\xfd\xa4\x7e\x1c\xea\xdf\x16\x25\xf8\x7f\x6b\xe3\
-\xff\x00\x05\xdd\x78\xea\x0d\xc6\x5f\x0e\x45\xae\x5b\x3e\xad\x16\
-\xc4\xf3\x1b\x75\xa8\x7f\x34\x6d\x4c\x31\xca\xf0\x0e\x7a\x56\x87\
-\xc3\x9f\x8c\x7e\x10\xf8\xcb\x67\x79\x75\xe1\x0f\x16\x78\x6f\xc5\
-\x96\xfa\x5d\xd3\x59\x5e\x4d\xa3\xea\x90\xdf\xc7\x69\x70\xbf\x7e\
-\x19\x0c\x4c\xc1\x24\x1c\x65\x4e\x08\xf4\xa2\x2e\xc1\x2d\xee\x75\
-\x29\x12\x81\xd2\xb2\xbc\x78\xa1\x7c\x15\xac\x7a\xfd\x86\x6c\x63\
-\xfd\xc3\x5e\x65\xf1\x1f\xf6\x96\xf1\xe7\x82\x7c\x6f\xa8\x69\x7a\
-\x4f\xec\xf3\xf1\x5b\xc6\x5a\x7d\x9b\x28\x87\x59\xd2\xb5\x6f\x0c\
-\x41\x67\x7c\x0a\x2b\x13\x1a\x5d\xea\xd0\x5c\x00\x09\x2a\x7c\xc8\
-\x90\xe5\x4e\x01\x5c\x13\xc9\x78\xc7\xf6\xb8\xf8\x95\x75\xe1\x3d\
-\x51\x24\xfd\x95\xfe\x37\x42\xad\x67\x2a\x97\x3a\xe7\x83\x70\x80\
-\xa1\xe4\xff\x00\xc4\xf3\x3c\x75\xff\x00\x1a\x00\xf0\xb8\xa5\x2f\
-\x1a\x93\xc7\xbd\x49\x6f\xc9\x3d\x78\xc8\x1f\x4a\xf2\x7b\x5f\xda\
-\x03\xc7\x01\x17\x77\xec\xfb\xf1\x53\xff\x00\x07\x3e\x17\xff\x00\
-\xe5\xb5\x7a\x6f\x86\xb5\x8b\xad\x7b\xc3\x96\x3a\x85\xf6\x8f\xa8\
-\x78\x76\xea\xf2\x31\x24\xda\x6d\xfc\x96\xf2\x5c\x58\x36\x7f\xd5\
-\xc8\xd6\xf2\x4b\x13\x36\x39\xcc\x72\x3a\xf3\xd4\xd4\x9a\x17\xa6\
-\x3f\xb8\x61\xdf\xd6\xb8\xcf\x8d\x9a\x67\xda\x7c\x0b\x75\xc7\xcd\
-\x10\xdd\xd2\xbb\x40\x3c\xdc\xf6\x1e\xf5\x95\xe3\xbb\x4f\xed\x0f\
-\x0d\x5e\x47\xc6\xe6\x85\xbf\x91\xaf\x3b\x35\xa3\xed\x70\x75\x29\
-\xf7\x8b\x5f\x81\xa5\x19\x72\xcd\x3f\x33\xe4\x6b\x88\xda\x09\x5b\
-\x6f\xdd\xeb\x8a\x69\x32\x5d\xdb\x49\xb6\x4f\x2f\xcb\x1d\x09\xf4\
-\xed\x57\x35\xa8\x0c\x17\x92\x2f\xde\x21\x88\x23\xd6\xb3\xd6\x46\
-\xf2\x99\x17\xe5\x59\x0f\xcc\x31\x5f\xc8\xd8\xcc\x3a\x92\x95\x37\
-\xbe\xab\xe7\xb1\xf7\x14\xe5\xa2\x91\x83\xa7\xa7\x95\x7f\x28\x59\
-\x3f\x78\x1b\xe6\x43\xdf\xe9\x5a\x26\x35\xbb\x25\xb2\xb0\xdc\x2f\
-\x5c\x75\x15\x05\xed\xa4\x56\xd3\xfc\xcd\xfb\xc9\x0e\x41\x03\xa5\
-\x49\x28\x3c\x79\x99\xcf\xf0\xc8\xa7\xe6\x15\xe0\xe0\xe3\x52\x1e\
-\xe4\x96\xc7\x74\xda\x92\xb9\xad\x67\xe1\xd6\xd6\x34\x2b\xeb\x8b\
-\x99\x23\xb6\x8a\xdd\x7f\xd6\x67\xef\xbf\x61\x8f\x5a\xe5\xac\x25\
-\x5b\x4d\xab\x75\x1b\xb2\xff\x00\x0c\xc3\x8f\xcf\xb8\xae\xaa\xd7\
-\x4d\xb7\x7b\x1b\xcf\xb7\x48\xd3\xc5\x0a\x82\x81\x0e\x3c\xd2\x7f\
-\x96\x2b\x8a\xd3\x24\x6d\x36\xf6\x45\x83\x73\x46\x4f\x31\x4b\xd1\
-\x87\xb5\x67\x88\x9f\xfb\x45\xbf\xaf\x9f\xfc\x00\xa3\xac\x5a\x3a\
-\x68\xb2\xd0\xab\x6e\xfb\x5c\x3c\x15\x91\x3f\xd6\x27\xd3\xfb\xc2\
-\xb4\xcf\x85\x61\x87\x41\x1a\x95\xd5\xf2\x3d\xbd\xcf\xcd\x04\x71\
-\x2f\xef\x1c\x67\x19\x3f\xdd\xe7\xb7\x7a\xc1\xd3\xe1\xf3\xcb\x36\
-\x9f\x27\x93\x36\xef\x9e\xd6\x5e\x9f\x87\xf9\xcd\x6b\xe8\x7a\xa5\
-\x93\xb5\xd7\xda\xa1\x94\x6a\x6b\x18\x16\xc9\xb8\x84\xdc\x4f\x2c\
-\x7d\x40\x1f\xe4\xd6\x98\xca\x4e\x74\xf4\xdf\xd2\xff\x00\x71\x9e\
-\xcc\xe6\xe4\xb7\xb3\xff\x00\x84\xa2\x78\xd7\x75\xbb\x64\xe3\x71\
-\x3c\x8f\x42\x29\xda\x85\x8f\x97\x2e\xdf\xbd\xb4\x6e\x20\x1f\x97\
-\xdb\x9a\x2f\xf5\x85\x97\x5e\x96\x1d\x46\x06\x8e\x6d\xc7\x32\x04\
-\xdc\x33\xef\xdf\xf2\xae\x9b\x48\xf8\x7c\xd7\xfa\x2d\xb5\xdd\xae\
-\xa1\x6d\x23\x5d\x31\x02\xdd\xf1\xfb\xb1\x92\x06\xe6\x27\x1e\x87\
-\xb9\xe7\xa5\x78\xf4\x69\xb8\xfb\xfd\x57\xe7\xd1\x33\xa6\xb4\xd2\
-\x8a\x4c\xc9\xf0\x2d\xaf\x97\xae\xc6\xc6\x4b\xaf\xb2\xa1\xc4\xcb\
-\x17\xfa\xc0\x0f\x00\x00\x7f\xda\x20\x57\x40\xd7\x16\x37\xb7\x17\
-\xff\x00\x63\xb5\x56\x93\x69\x92\x77\x9f\x92\x80\x74\x1e\xd9\x1c\
-\x64\x0e\xb5\xbb\x77\xe1\x4b\x5f\x86\xa2\x38\x63\xbf\x46\xd5\x2f\
-\xa1\x0d\x2c\xb1\x1d\xf1\xd9\xb1\xdc\x36\xab\x10\x32\xd8\x27\x9c\
-\x71\x92\x07\x35\xcf\x5e\x6a\x73\x58\x58\x5d\x59\xd9\xdb\xad\xdc\
-\x91\xc6\xca\xd3\x85\x2b\xe6\x6e\xef\x9e\xb8\xef\x8e\xdd\xeb\xaa\
-\xb4\x65\x1b\x29\xdd\x5b\x74\xbf\xcc\xe2\xf6\x8a\x52\xba\x3c\x23\
-\x57\x95\xae\xfc\x41\x31\x86\x36\xb5\x56\x72\x56\x30\x7e\xed\x69\
-\xd8\x44\xde\x42\x86\x56\x66\x51\xce\x07\x6f\x71\x51\xcf\xa6\x45\
-\x7f\xab\x32\xcb\xba\x1b\x8c\xf3\x9f\xba\x4f\xd6\xaf\xde\x69\x53\
-\xe9\x71\xc7\xbd\x37\xae\x78\x24\xe4\xfe\x04\x7f\x4a\xda\x32\x4d\
-\x24\x7b\x12\x97\xba\x92\x22\x8d\x7c\xb5\x3e\x53\x6d\xff\x00\x63\
-\xef\x29\xfa\xf7\xab\xda\x6e\xa5\x19\x26\x19\x70\x8c\xdf\xf2\xce\
-\x60\x3c\xb3\xf4\x3d\xbf\x9d\x53\x8a\x58\x6e\xdf\x39\x3b\xc1\xe7\
-\xa0\x61\xfd\x0f\xf3\xa7\xf9\x38\x52\x64\x55\x92\x31\xd5\x82\xfd\
-\xdf\xa8\xed\x5e\x8d\x24\xf7\x47\x2c\xbc\xcf\x26\xfd\xb6\x3e\x16\
-\x78\x83\xe2\xb7\x85\x34\xad\x0d\x99\xac\x7c\x0c\x8b\x73\xaa\x6b\
-\xed\xf6\x8f\xdf\x5e\x08\x23\xdf\x6f\x6b\x18\xfb\xdb\x1d\xc1\x66\
-\x60\x78\xd8\x3a\x71\x9f\x25\xff\x00\x82\x7d\x7c\x33\xd6\xfe\x1c\
-\xf8\x57\x45\xbe\xb3\x92\x39\xfc\x19\xe3\x0d\x02\x1d\x4e\xe5\x1a\
-\x6f\x9b\x4e\xd4\x94\xec\x6d\x8a\x79\x2b\x2a\x00\x4f\x60\x57\xe9\
-\x9f\xa6\x3e\x29\xdb\xde\x5a\x7c\x2a\xd7\x55\x66\xba\x36\x6b\xa6\
-\xdd\x48\xa8\xad\xbd\x40\xf2\x5c\x82\x3f\x5a\xf3\x5f\xd8\xfa\x2d\
-\x9f\xb2\xef\xc3\xed\xd8\xd9\xfd\x87\x6c\x42\xfa\xe5\x6b\xec\xe7\
-\x9b\xd5\x87\x0d\x4f\x0c\x92\xe4\xe7\x51\xb5\xb7\xbc\x65\x2b\xef\
-\xf1\x26\x95\x9f\x64\x96\xc7\x9d\x4f\x0f\x17\x8c\x53\x7b\xd9\xbf\
-\xc5\x69\xe8\x7a\xe6\x98\x77\x47\xb5\x7f\xd5\xf7\x63\x57\x7e\xd6\
-\x16\x26\x8e\x15\x66\xf5\x73\xd4\xd5\x3d\x35\x1a\xe6\x2c\xb3\x79\
-\x70\xaf\xe0\x5a\xa7\xbb\xb8\x51\x6e\x04\x7f\xbb\x8d\x73\x93\xeb\
-\x5f\x93\x54\x57\x9d\x8f\x7e\x3b\x94\x2e\x2d\xa3\xdd\xb9\xb7\x75\
-\xce\xed\xbf\xd7\x35\x2d\xae\x93\x2d\xd7\xdd\x99\x1f\xbe\x3a\x71\
-\xf4\xac\xb9\x1c\x3c\xdb\xb7\x36\x7a\xe7\x35\x6e\xde\xe9\xe0\x3b\
-\x95\x87\xae\x54\xf3\x5d\x32\x8c\x92\x56\x2a\x5e\x45\xa6\xd2\xa4\
-\xb5\xb7\xcb\x0f\x94\x36\x77\x63\x81\xf8\xd5\x7d\xd2\x24\x4c\xeb\
-\x96\x56\x19\x25\x47\x02\xae\x26\xae\xd7\x76\xad\x1b\x6f\x2a\xfd\
-\x47\xa5\x66\x07\x92\xde\x46\x55\x63\xb1\x8e\x3f\x4a\xda\x8d\xdb\
-\xd4\xe5\x9d\xfa\x91\x69\x77\xb1\xda\xce\xd2\x3c\x2d\x71\x86\xc8\
-\x50\xfb\x72\x7d\xcf\xa7\xd2\xac\xea\x2b\xe6\x4f\xe6\x49\x1a\xc6\
-\xae\x7e\xe2\x1c\xa8\xf6\xa8\x2c\xbc\xc8\x2e\xf7\x46\xbe\x5b\x13\
-\xd5\xd7\x38\x1f\x4e\x95\x3a\x44\xfa\x86\xa9\x0d\xb4\x92\x7e\xed\
-\x77\x32\xb9\xee\x0f\x53\xef\x5d\x98\x99\x7e\xec\xca\x1f\x15\xcb\
-\x7a\x94\xd1\xde\x5b\xc2\xb1\x8f\x95\x94\x6d\x1e\x86\xb3\xa3\x32\
-\x4b\x75\x1c\x3b\x4e\xf6\xe0\x92\x7a\x1f\x5a\x9a\xe3\xf7\x41\xa1\
-\x50\xde\x65\xa0\x24\x1e\xc4\x54\xf6\x96\xf9\xbf\x81\x57\xca\xdc\
-\xf0\xe3\x7a\x0c\x64\x1e\xb9\xed\x5c\x34\x57\x2a\x2e\xa4\xaf\xa9\
-\xab\xa5\xf8\x69\xa6\x2c\xd7\x6e\xb7\x1c\x8d\xbb\x7a\x20\xfa\xd4\
-\xd0\xc0\xb6\xfa\xca\x79\x6c\xdf\x2a\xf7\xed\xf4\xac\x9b\x4d\x72\
-\x4d\x3d\xa4\x87\x73\x6d\xdd\x83\xf4\xad\x0d\x32\x7f\x32\xfb\x2a\
-\x7e\x5d\xbf\x95\x67\x2e\x76\xef\x23\x3e\x5d\x0d\x2d\x4c\xef\xb4\
-\x98\xe7\xa8\xea\x6b\x43\xe1\x65\x84\x97\xb6\x17\x3f\x67\x65\xf3\
-\x21\x43\x80\xc3\xef\xfb\x57\x38\xae\xf7\x7a\x4d\xd2\xee\x25\xa3\
-\x63\xf5\xae\xf3\xe0\xc6\x9f\xe4\x78\x7a\xe2\x46\x90\x47\xe6\xfc\
-\xa1\xb3\xeb\xff\x00\xeb\xaf\xb9\xe0\x7c\x1f\xb7\xcc\xe1\x07\xb6\
-\xb7\xe9\xd3\xbf\xcc\xf3\x31\xf3\xe4\xa2\xda\xf2\x3a\x9f\x82\x9a\
-\xaf\xdb\x3c\x3f\x32\xed\xda\x63\x99\xd5\x86\x38\xcd\x75\xdb\x5a\
-\x56\xae\x0b\xe1\x1d\xc4\x5a\x2e\xa1\xa9\x69\x4d\x26\xe9\xd6\x56\
-\x94\x37\x66\x53\x8a\xee\x60\xbc\x62\xb9\xc8\x1d\xb8\xaf\xe9\xbe\
-\x17\x92\x8e\x5d\x0a\x4d\xeb\x1b\xa7\xf2\x67\xc6\xe3\xa3\xfb\xe6\
-\xff\x00\xad\x49\xcd\xc2\xc2\x9e\xb4\xb0\x6a\x11\xb8\x3f\x4e\xd5\
-\x03\x8f\x30\x38\xee\x30\x45\x32\xda\x00\x25\x03\x1f\x2b\x0e\xd5\
-\xf4\xb7\x6b\x63\x8e\xd7\x26\x69\xbc\xc5\xfc\x38\xaf\xa8\x3f\xe0\
-\x94\x4c\xc7\xe2\x6f\x8d\x57\xa2\xff\x00\x66\xdb\x63\xfe\xfe\xc9\
-\x5f\x31\xec\x5d\xab\xf5\x35\xf5\x27\xfc\x12\xa9\x40\xf8\x89\xe3\
-\x2f\x5f\xec\xdb\x7f\xfd\x1b\x25\x5a\xdc\x5b\x23\xed\xc1\xd2\x8a\
-\x28\xaa\x24\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x2b\xe5\x9f\xf8\x2d\
-\xa6\xb9\x7d\xe1\x6f\xf8\x24\xc7\xed\x01\xa9\x69\x77\xd7\x7a\x6e\
-\xa1\x67\xe0\xdb\xc9\x2d\xee\xad\x66\x68\x66\x81\xc2\x8c\x32\x3a\
-\x90\xca\x47\xa8\x35\xf5\x35\x7c\xc7\xff\x00\x05\x99\xf0\x3e\xb9\
-\xf1\x3f\xfe\x09\x63\xf1\xe3\xc3\xbe\x1a\xd1\x75\x6f\x11\x6b\xda\
-\xb7\x83\xef\x2d\xec\x74\xdd\x32\xd2\x4b\xbb\xcb\xd9\x59\x46\xd8\
-\xe2\x8a\x30\x5d\xd8\xf6\x0a\x09\x3e\x94\x01\xf0\x1f\xc1\x6f\xda\
-\x57\xe2\x07\xc2\x7f\xf8\x33\xe6\xcf\xe2\x57\x87\xfc\x61\xaf\x58\
-\x78\xfb\x4b\xd0\xee\xa7\xb5\xd7\xcd\xd3\x4f\x7f\x13\x9f\x13\xcb\
-\x11\x6f\x32\x4d\xc4\xfe\xed\x8a\x73\x9c\x29\xc0\xc6\x2b\xda\x2c\
-\x7e\x2f\xf8\xa3\xe3\xb7\xfc\x1a\xd3\xac\x78\xd3\xc5\xfa\xdd\xf6\
-\xbd\xe2\xad\x7f\xe0\xfe\xa5\x77\xa8\x6a\x77\x4c\x3e\xd1\x77\x29\
-\x8a\x61\xbd\x88\xc7\x38\x00\x64\x57\xe4\xee\x9f\xfb\x43\x7e\xdb\
-\x5a\x7f\xfc\x12\x29\xbf\x64\x05\xfd\x8d\xbe\x27\xb7\x84\xda\xc2\
-\x4b\x0f\xed\xd3\xe0\x5d\x77\xfb\x4b\x6b\xea\x6d\xa8\x16\xdb\xe5\
-\x79\x7f\x7c\xec\xc6\x3a\x73\xd6\xbb\x4f\x08\xfe\xde\x7f\xb7\x47\
-\x84\x3f\xe0\x99\x3f\xf0\xcc\x10\xfe\xc5\x3f\x11\x26\xf0\xcf\xfc\
-\x22\x53\xf8\x47\xfb\x5d\xfc\x0b\xe2\x0f\xb7\x79\x52\xab\xa9\x9b\
-\x68\x8f\x66\xf1\xbc\xf1\x8c\x64\x7e\x14\x01\xfa\xb1\xff\x00\x06\
-\xbb\xca\xd3\xff\x00\xc1\x14\x3e\x11\x33\xb3\x48\xde\x6e\xad\x96\
-\x66\x24\xff\x00\xc8\x4a\xe6\xbf\x41\xab\xe1\x6f\xf8\x37\x07\xe1\
-\x57\x8a\x7e\x08\xff\x00\xc1\x20\xfe\x16\xf8\x67\xc6\x9e\x19\xf1\
-\x07\x84\x3c\x47\x63\x2e\xa6\x6e\xb4\xad\x6f\x4f\x97\x4f\xbe\xb7\
-\x0d\xa8\x5c\xba\x6f\x86\x55\x57\x5d\xca\x43\x0c\x81\x90\x41\xe9\
-\x5f\x74\xd0\x01\x45\x14\x50\x01\x45\x14\x50\x01\x51\xcd\xc3\x2d\
-\x49\x4c\x98\x6e\xa0\x0f\xcc\x5f\x1e\x78\x77\xc5\xcf\xe2\xef\x88\
-\xde\x02\xf8\x49\xa8\x7c\x60\xd4\xbc\x51\xe3\x49\xbc\x6d\xff\x00\
-\x09\x77\x87\xfc\x4b\xe1\x78\xac\xb4\xed\x15\x6e\xac\x75\x07\xb4\
-\xd4\x2c\xf5\x44\xb6\x8d\x0b\xcb\x79\xf6\x08\x6d\xf6\xdd\x4c\x64\
-\x82\xe0\xee\x54\x30\xbb\x47\xed\xbf\xf0\x4f\xd6\xd2\x7c\x71\xfb\
-\x4f\x6b\x9e\x2a\xf0\x2f\x85\x75\xbf\x08\xf8\x17\x4f\xf8\x6b\xe1\
-\xcf\x0a\x5f\xc3\x7f\xe1\xdb\x9d\x08\x4d\xac\x5a\x5c\x5f\xb7\xd9\
-\x84\x33\xc5\x13\x48\xf6\x76\xf2\xac\x6f\x22\x82\x83\xcf\x54\x0c\
-\x4a\xb0\x5f\xad\x2e\xbc\x73\xa3\x58\x78\xba\xd7\xc3\xf3\xeb\x1a\
-\x5c\x3a\xe5\xe5\xa4\xd7\xf6\xda\x6c\x97\x88\xb7\x97\x16\xd0\xb4\
-\x69\x34\xe9\x11\x3b\xda\x38\xda\x68\x95\x9c\x02\xaa\x64\x40\x48\
-\x2c\x33\x87\xf0\x87\xf6\x86\xf0\x1f\xed\x0b\x63\xa8\x5d\x78\x0b\
-\xc6\xde\x13\xf1\xb5\x9e\x93\x72\x6c\xaf\x67\xd0\x75\x8b\x7d\x4a\
-\x3b\x39\xc0\xc9\x8a\x53\x0b\xb0\x47\xc6\x0e\xd6\xc1\x20\x83\xc8\
-\xe6\x94\x6e\xb4\xf2\x09\x6a\xef\xe7\x73\xb6\x4e\x49\xac\x9f\x1e\
-\xff\x00\xc8\x99\xac\x7f\xd7\x8c\xdf\xfa\x03\x57\x95\x7c\x4d\xf8\
-\x9d\xf1\xe3\x42\xf1\xde\xa1\x69\xe1\x1f\x83\xfe\x00\xf1\x27\x87\
-\x61\x64\xfb\x16\xa5\xa8\x7c\x47\x9b\x4b\xb9\xba\x05\x14\xb1\x7b\
-\x65\xd2\xe6\x11\xe1\x8b\x2e\x3c\xd6\xc8\x50\x78\xce\x07\x25\xe2\
-\xcf\x8b\xff\x00\xb4\xb4\xde\x16\xd4\xd6\x7f\x80\xff\x00\x0b\xe3\
-\x85\xad\x25\x12\x32\xfc\x5b\xb8\xdc\xab\xb4\xe4\x8f\xf8\x92\xfa\
-\x53\x03\xc5\x6c\x83\x4a\x8a\x7d\x86\x47\xa5\x49\x24\x8c\x25\xdb\
-\xf9\x57\x91\x5b\x7c\x43\xf8\xdb\x0c\x6a\x57\xe1\x0f\x80\x88\xc7\
-\x6f\x89\xef\xc7\xfe\x52\x6b\xd2\x7c\x1f\x77\xa9\xea\x9e\x1d\xb1\
-\xba\xd7\x34\xfb\x3d\x27\x58\x9a\x30\xd7\x76\x36\xb7\xff\x00\x6e\
-\x86\xd6\x4c\x9c\xa2\x4e\x63\x8b\xcd\x18\xc7\xcd\xe5\xaf\x5e\x95\
-\x3a\xdb\x42\xfa\x9a\xc2\xe7\x21\xb8\xe8\x3a\xd3\x6e\xed\x16\xf6\
-\xca\x75\x62\x06\xe8\xd9\x71\xeb\x52\x08\xd5\x23\x27\xd4\x75\xf5\
-\xa6\xfc\xab\x1b\x67\xe6\xdd\xc5\x67\x2b\x34\xd4\x87\xd6\xe7\xc9\
-\x9e\x38\xb0\x3a\x7f\x89\x6e\xe3\xfe\xe4\x87\x8e\xc2\xb0\x65\x8b\
-\x70\xf9\x7f\x2a\xee\x3e\x34\xe9\x7f\x61\xf1\xbd\xe2\x90\x3f\x78\
-\xc1\xb8\xfc\x2b\x88\x23\x6f\xf9\xed\x5f\xc9\xb9\xed\x0f\x63\x8f\
-\xab\x0e\xd2\x67\xdb\xe1\x65\x7a\x69\xf9\x15\xee\x61\x33\x58\xfd\
-\xd5\x3b\x5f\x77\x35\x55\x5d\x8b\xed\x3d\xcf\x4c\x70\x2b\x48\xa6\
-\xf4\x90\x0e\x7d\xab\x3e\x55\x5c\xf7\xda\x7b\xd7\xcf\xd4\x4b\xda\
-\x5c\xed\x8e\xd6\x2d\x49\x79\x2d\xbd\x8c\x8a\xb2\x37\x96\xb8\xc2\
-\xed\xc9\x6e\x7a\x57\x2b\xa9\x4b\x9d\x51\xb7\x06\x86\x69\x5b\x38\
-\x2a\x45\x74\x2b\x3b\x23\x06\x0d\xb9\x57\x1f\x86\x3a\x55\x2d\x6b\
-\x4f\x5d\x4a\x58\xee\xbc\xcd\xb3\x72\x58\x9e\x9e\xc2\xbc\xcc\x66\
-\x1d\x7b\x4f\x6b\x1d\x8d\x28\xce\xcf\x95\x97\xbc\x33\xe0\xfd\x4b\
-\xc4\x91\x86\x8e\x01\xe5\x45\x8c\x5c\xbc\x81\x15\x4f\xb3\x74\x3f\
-\x4e\xb5\xbd\xe2\x6b\x0b\x38\xed\x2d\xf4\xe5\x8a\xe2\xea\x6b\x75\
-\xff\x00\x4a\x9b\x1f\x3b\x37\x5e\x31\xd8\x7e\xbd\x6b\x9e\xb3\xf1\
-\x1d\xe5\x86\x9d\x1d\xaa\x39\x58\xe3\x93\xcc\xd9\xc8\xe7\xd4\x1a\
-\xbf\xa1\xc3\xa9\x5f\x5d\x5e\x5d\xd9\xcd\x22\xac\x99\x2f\x23\x64\
-\x63\xd4\x64\xd3\xc4\x4b\x10\x92\x95\x14\xb9\x74\xbf\x7f\xf8\x06\
-\x72\xf8\xbd\xe3\x07\xc6\x16\x17\x16\xda\xcc\x73\x3c\x09\x1a\xcd\
-\x0a\xb2\xaa\x9e\x5c\x63\xa9\xcf\x43\x5a\x7a\x16\xa5\x71\xe1\xcd\
-\x11\x2e\xa3\xb8\x92\xd5\xe4\x76\x8c\x05\x6d\x99\x1c\x0c\x67\x07\
-\x20\xf3\x5a\xba\x34\xd6\xba\xbd\xcd\xc2\xea\x51\xc3\x7d\x33\x10\
-\x88\xef\x2f\xcc\xbb\x06\x4e\xc0\x3b\x12\x40\xcf\xb5\x43\xac\xeb\
-\x0b\xa5\xd9\xfd\x86\x3b\x3f\xf4\x55\x39\x01\x47\xca\xcc\x4f\xae\
-\x3f\xaf\x6a\xe1\x95\x48\x29\x59\xe8\xff\x00\x5e\xed\x95\xcc\xe4\
-\xac\x35\x2e\x87\x89\xe7\x2c\x62\x53\xe5\xa7\x56\x1b\x97\xf0\x19\
-\xce\x7a\x74\xfc\xaa\xe7\x8a\xbc\x3f\x7b\xe1\xcd\x0e\xd6\x4b\x9d\
-\x42\x36\xb8\x90\x33\xb5\xb4\x5f\x23\x5a\x8c\xe3\xe7\x3d\x32\x79\
-\xf9\x7a\x81\x8c\xf5\x04\xe3\xda\xc7\x74\x59\x7c\xcb\x6b\xc8\xe3\
-\x94\x6e\x8b\xec\xf0\x2e\x24\x3d\x01\x24\xe3\x8a\x43\x15\xce\x92\
-\xd3\xad\xec\x77\x06\xd1\x63\x32\x34\x6e\xd9\xcb\x76\x39\xc6\x09\
-\xfa\x64\xd7\xa3\x1a\x2a\x54\x65\x19\x7b\xcd\xad\x35\xeb\xde\xdd\
-\x4c\xd5\xd3\xb2\x3c\xe6\xf2\xe6\x53\xa8\x4c\xa0\xa5\xc4\x25\xb8\
-\x6c\xfc\xc0\xfa\x90\x6a\x78\xef\x65\x8a\xd3\x6c\x2d\xbe\x1c\xfc\
-\xd1\x3e\x48\xcf\xa8\xf4\xaa\xf3\x5c\xc8\xda\x8c\x8a\xb0\xf9\x7e\
-\x5b\x9f\x9c\x0d\xac\x45\x5a\x8a\x78\x6f\x08\x12\xaf\x97\x2e\x30\
-\x24\x5e\x1b\xf1\x1d\x1a\xb8\xe9\xc5\xad\xcf\x52\x52\x56\x4c\x86\
-\x3b\x7b\x6d\x46\x66\xdb\xfb\x99\x98\xf3\x1c\x87\x01\xbe\x8c\x6a\
-\xc3\x5a\x5c\x69\xce\x46\xd6\x6d\xbd\x98\xed\x65\x1e\xc6\xaa\xde\
-\x69\xa5\x63\xdc\xc0\x48\x87\xf8\x87\xf8\x54\xd6\x1a\xac\xf6\x09\
-\xb5\x82\xde\xda\x0e\x4c\x72\x93\xbb\xf0\x6e\xa3\xf5\xaf\x42\x86\
-\xda\x33\x19\x4b\xb1\xcd\x7c\x6a\x8d\x20\xf8\x49\xe2\x69\xa3\x96\
-\x3c\x7f\x65\x5d\xb9\x02\x4d\x8c\x31\x03\x9e\x57\xa1\xfc\x2b\x81\
-\xfd\x92\x80\x87\xf6\x64\xf8\x7a\x5b\x91\xff\x00\x08\xfd\xa1\x03\
-\xfe\xd9\x8a\xed\xfe\x3f\x4d\xa7\x49\xf0\x2f\xc5\xb3\xc0\x24\x8e\
-\x58\xb4\x4b\xd2\x52\x4f\x9b\x07\xc8\x90\xf0\x78\xae\x2f\xf6\x51\
-\x46\x7f\xd9\xb7\xe1\xf2\x6d\x3b\x97\xc3\xf6\x58\xcf\x6f\xdd\x2f\
-\x5a\xf7\xf1\x1f\xf2\x22\x95\xff\x00\xe7\xec\x7f\xf4\x89\x1c\xf4\
-\x2f\xf5\xa5\xfe\x17\xf9\xa3\xd4\x2d\xae\x1e\x52\x03\x6e\xf9\xbf\
-\x84\x55\xab\xab\x61\x6f\x6d\xba\xe3\x3e\x61\x19\x11\xa9\xe9\xf5\
-\xa6\xd8\x14\xb2\x21\x63\xfd\xe4\xc7\x82\x4f\x3b\x69\x6e\xd3\xcc\
-\xe1\x77\x4d\x26\x30\xcc\x4f\x03\xf1\xaf\xcf\xa4\xfd\xe3\xd6\x46\
-\x64\x77\x32\x1b\x85\xfd\xca\x6d\x5e\x52\xae\x33\x5b\xdf\xe3\x6f\
-\xfa\x3c\x85\x80\x38\x1c\x63\xd6\xab\x45\xa5\xb4\x92\x73\x32\xf5\
-\xcd\x35\xe0\x10\x92\xad\xb9\x48\xe0\x71\xd6\xb7\xd2\xfa\x0a\x43\
-\xdb\x30\xb9\xcb\x06\xea\x01\x02\x9b\x7e\x1a\xde\xd3\xcc\xf9\x57\
-\xb7\x1d\xea\x58\x9a\x48\x59\x58\xaa\xb2\xf2\xa3\xdb\x34\x6a\x82\
-\x34\xb6\xcf\x3b\xfa\x95\x23\x8f\xa8\x35\xd5\x47\xe2\x49\x9c\xf5\
-\x19\x53\x4b\x99\x66\xbd\x8d\xa7\x32\x49\x1c\x68\xca\x80\x73\xb7\
-\x23\x9a\x92\xec\xcd\x63\x79\x0a\xed\x0c\xd1\x91\x32\x1c\xf5\x5e\
-\x08\x07\xfc\x2a\xaa\x42\xb1\x23\x96\x2f\xca\xef\x65\x5e\x98\xf7\
-\x35\xa3\xa0\xdb\x40\xc7\xcf\xb8\x6d\xed\xb0\x88\xa3\x0d\xd3\x35\
-\xb6\x29\xc5\x6a\xc8\x85\xc9\x3e\xd4\xb2\xea\xad\x74\xc3\x6d\xbd\
-\xc2\x9d\xfb\x57\x80\x47\x1f\x95\x41\xa5\x5d\xb4\x57\xca\xdb\x4b\
-\xaf\x2b\x19\x5e\xe0\xfa\x0f\x4a\x70\x47\x67\x8e\x15\x61\xb7\x76\
-\xd2\x0f\x75\xf4\x15\x7a\x18\x55\x35\x69\x19\x57\x6a\xdb\xa0\x0a\
-\xa3\xd3\x15\xc7\xcd\xcb\x1f\x91\x52\x21\xf1\x35\x80\x89\x63\xb8\
-\x5c\x29\x93\xef\x8a\xb3\xe1\x99\x19\x6e\x72\xd1\xf0\xc9\xc6\x3f\
-\xad\x56\x93\x52\xfe\xd3\x91\x61\x91\x7e\x42\x78\xe7\xa1\xab\x50\
-\x6a\x03\x4d\x0e\x1b\xef\x01\xb4\x1c\x7d\xe1\x45\x3b\xf2\xa8\x3d\
-\xcc\xde\xc5\xab\x1f\xdc\xd8\x5c\xf3\x9c\xb1\xc9\xf5\xae\x9f\x43\
-\x8d\xa1\xf8\x77\x0a\x6e\x3b\x66\x9d\x4b\x30\x38\xd8\x3f\xc2\xb9\
-\x20\xec\x34\xd8\xd9\x5b\xe5\x91\xb0\xd9\xad\x4f\x0f\x6a\xf3\xd9\
-\x78\x62\xeb\xed\x27\x75\xaf\x2b\x18\xe8\x4f\xb8\xaf\xd0\xb8\x26\
-\x70\xa7\x89\x9c\xaa\x27\xf0\xbd\x56\xcb\xd4\xf1\xf1\xd1\x72\x82\
-\xb7\x7f\xea\xc7\x59\x79\x7f\x17\x87\x3c\x67\x63\x73\x6e\x7c\xc9\
-\x26\x02\x37\x00\x75\x04\x8a\xf4\xc8\xd4\x05\xf9\x47\xeb\x5e\x5b\
-\xf0\xb7\x4b\x5d\x54\xc7\xa9\x5e\x37\x9b\xb5\x7f\x70\xad\xfc\x3c\
-\xf5\xaf\x45\x8a\xe4\x7c\xd8\x3c\x1e\x3e\xb5\xfb\xe7\x09\xfb\x49\
-\x52\x9e\x2a\x4a\xd0\xa8\xd3\x8a\xed\xa6\xaf\xe6\x7c\xce\x3a\xdc\
-\xca\x3d\x56\xe5\xd1\x77\xb1\xd9\x7b\xf6\x35\x24\x4e\x65\x6f\x97\
-\xd3\xf2\xaa\x91\x2a\x09\x0e\xef\xbc\x2a\xd4\x13\x2d\xb9\x5e\xff\
-\x00\x8d\x7d\x84\x64\x79\xee\x24\xc5\xf0\xa0\x7d\xee\x6b\xea\x7f\
-\xf8\x25\x4e\x7f\xe1\x63\xf8\xc7\x3f\xf4\x0d\xb6\xff\x00\xd1\xb2\
-\x57\xca\x92\x4f\xbd\xff\x00\xbb\xdf\x15\xf5\x47\xfc\x12\xa6\x6c\
-\xfc\x4a\xf1\x92\xff\x00\x10\xd3\x2d\xb3\xff\x00\x7f\x64\xad\xa2\
-\xd5\xc9\x92\xd0\xfb\x7e\x8a\x28\xad\x8c\xc2\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\xb8\x7f\xda\x37\xe3\x66\x97\xfb\x36\x7c\x08\xf1\xa7\
-\xc4\x3d\x6d\x66\x93\x49\xf0\x46\x87\x79\xae\x5e\x47\x0f\xfa\xc9\
-\x62\xb7\x89\xe5\x65\x5f\xf6\x9b\x66\x07\xb9\xae\xe2\xbe\x4f\xff\
-\x00\x82\xe8\xc9\xb7\xfe\x09\x03\xfb\x44\xe0\xe1\xbf\xe1\x09\xbe\
-\xe8\x71\xc6\xd1\x40\x1f\x93\xbe\x1a\xff\x00\x82\xb5\x7f\xc1\x51\
-\xff\x00\x6a\x6f\x84\xda\xd7\xed\x29\xf0\xcf\xc0\xbe\x15\xb1\xf8\
-\x1d\xa3\xb5\xe5\xdc\x5a\x42\x58\x69\xf3\xc7\x73\x69\x6a\x4f\x9c\
-\x40\x9a\x41\x7f\x73\xe5\x84\x60\xcf\x09\x40\xcc\xb2\x6c\x50\x54\
-\xaa\xfe\xbf\x7f\xc1\x26\xbf\xe0\xa1\x16\x7f\xf0\x53\xbf\xd8\x6f\
-\xc2\x3f\x16\xe0\xd2\x7f\xb0\x35\x0d\x5b\xcf\xb2\xd5\xf4\xc5\x90\
-\xc9\x1d\x8d\xed\xbc\x86\x39\x55\x18\xf2\xd1\xb6\x16\x44\xcf\x21\
-\x64\x50\x79\x06\xbf\x21\x7f\xe0\x97\x3f\xf0\x71\x4f\xec\xe3\xfb\
-\x25\x7f\xc1\x20\xbc\x23\xf0\x47\xc6\x32\xf8\xeb\xfe\x13\x2d\x1f\
-\x42\xd6\x34\xfb\xa5\xb2\xd1\x04\xf6\x9e\x65\xd5\xdd\xec\xb1\xe2\
-\x4f\x30\x64\x6c\x9d\x32\x71\xc1\xc8\xed\x5c\x4f\xfc\x1b\xb1\xff\
-\x00\x05\xf4\xf8\x0f\xff\x00\x04\xc8\xfd\x84\x35\x7f\x87\x9f\x14\
-\x2e\x3c\x69\xff\x00\x09\x05\xe7\x8c\xaf\x75\xa8\x13\x4b\xd2\x05\
-\xe4\x09\x6b\x2d\xad\x94\x6b\xf3\x19\x17\x07\x7c\x32\x9d\xa0\x7b\
-\xf7\xa0\x0f\xe9\x0f\x60\xdd\xbb\xbd\x2d\x79\x1f\xec\x49\xfb\x65\
-\x78\x3b\xf6\xfb\xfd\x9c\xfc\x3f\xf1\x53\xc0\x2d\xab\x1f\x0a\xf8\
-\x8d\xae\x12\xd3\xfb\x4a\xdb\xec\xd7\x39\x86\x67\x85\xf7\x46\x0b\
-\x01\xf3\xc6\xd8\xe7\x91\x83\x5e\xb9\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x47\x38\xcb\x2f\xa7\x4a\x92\x9b\x21\x03\xad\x00\x7e\
-\x5f\xfc\x51\xfd\x9b\x3f\x68\x2f\x1f\x7e\xd6\xbe\x3a\xd5\xf5\xcf\
-\x87\xda\x4b\x78\x9b\xe2\x0f\xc3\x0f\x1c\xf8\x66\xcf\xc4\x7a\x77\
-\x8a\xda\xe6\xdf\x4c\xb1\x77\xb1\x1a\x46\x9f\x14\x6f\x6d\x1a\xc0\
-\x4b\x26\xf2\xa5\xf3\x24\xb7\x77\x52\x97\xdb\x12\xa8\xf7\xef\xd8\
-\x59\x57\xe2\x17\xed\x45\xad\x78\xc7\xc3\xbe\x0f\xf1\x2f\x82\xfc\
-\x1b\xa6\xfc\x35\xf0\xef\x83\x6e\xad\xf5\x8d\x0a\xe3\x45\x7b\x8d\
-\x52\xd2\x7b\xe9\x0d\xba\x43\x32\x21\x90\x59\x43\x32\xc4\x65\x50\
-\x63\x26\x7d\xb1\xbb\x85\x6d\xbf\x41\x68\x1f\xb5\x1f\xc3\x2f\x15\
-\xfc\x54\xd6\x3c\x0b\xa6\xf8\xfb\xc1\xfa\x87\x8c\xbc\x3f\x1b\xcb\
-\xa9\x68\x90\x6a\xd0\x49\x7d\x62\xa9\xb7\xcc\x32\x44\x1b\x72\xec\
-\xde\x9b\xf2\x3e\x4d\xeb\xbb\x19\x19\x97\xe0\xbf\xed\x2d\xf0\xeb\
-\xf6\x94\xb3\xd4\xae\x7e\x1e\xf8\xe3\xc2\xbe\x36\x87\x46\x9c\x5b\
-\x5f\x49\xa1\xea\xb0\xdf\x2d\xa4\x84\x12\xa1\xcc\x6c\x76\xee\x00\
-\x95\x27\x86\x00\x91\x91\x44\x74\xdb\xb7\xf9\xff\x00\x99\x2d\x5d\
-\xff\x00\x5e\x47\x76\x89\xb4\x9e\x3a\xd6\x4f\x8f\x3f\xe4\x4b\xd6\
-\x3f\xeb\xc6\x6f\xfd\x00\xd7\x99\xfc\x45\xf1\xd7\xc7\x8d\x1f\xc6\
-\xfa\x85\xb7\x84\xfe\x18\xfc\x32\xd7\xbc\x3b\x1b\x2f\xd8\xaf\xf5\
-\x3f\x88\x17\x7a\x6d\xdd\xc2\x94\x52\xc6\x4b\x74\xd2\x67\x58\xc8\
-\x72\xc0\x01\x2b\x64\x00\x78\xce\x07\x27\xe2\xef\x89\x3f\xb4\xac\
-\x9e\x15\xd5\x16\x5f\x84\x1f\x07\x61\x8d\xad\x25\xdc\xc3\xe2\x85\
-\xf3\x6d\x1b\x0e\x4e\x3f\xb1\x06\x7f\x31\xf5\xa0\xa3\xc2\xc1\xdb\
-\x0a\xa6\xdd\xdf\x5a\x93\xaa\x7d\x3f\x9d\x79\x4c\x3e\x33\xf8\xe4\
-\xf6\xf9\x1f\x0e\x3e\x16\x6e\x20\x73\xff\x00\x0b\x02\xf3\xff\x00\
-\x95\x55\xe9\x5e\x11\xb8\xd5\x2f\x7c\x33\x63\x26\xb9\x67\x63\xa5\
-\xeb\x12\x45\xba\xf2\xd2\xca\xf1\xaf\x2d\xa0\x93\x3f\x76\x39\x9a\
-\x38\xda\x45\xc7\x73\x1a\x9c\xe7\x8a\xcc\xd0\xb8\x53\x74\x7b\x72\
-\x7d\xb9\xa6\x4c\x09\x7c\xed\xf9\x6a\x7d\xbb\x76\xa2\xb0\xdd\x53\
-\x34\x2c\x8b\xb9\xb6\xf1\xd8\x77\xa8\x92\x0b\xd8\xf9\xef\xf6\x8c\
-\xd3\x16\x1f\x15\x79\x89\xcf\x98\x80\xff\x00\x2a\xf2\xf6\x8f\x2e\
-\x7d\x71\xc5\x7b\xa7\xed\x35\xa5\x6e\x8a\xce\xe3\x6f\x5f\x94\x8f\
-\x6a\xf0\xf7\x4c\x93\xcf\x63\xcd\x7f\x35\x71\xd6\x17\xd9\x66\xd5\
-\x3c\xec\xcf\xae\xcb\xe7\xcd\x49\x10\xc1\xd0\x8e\x72\xdd\x71\xf4\
-\xaa\xb3\x5b\xe6\x2f\xf7\x49\xfa\xd5\xc8\x5f\x13\x75\xdb\x93\x51\
-\xdc\x44\x23\xb8\x71\x8e\xf9\x35\xf0\x75\x6c\x9a\x68\xf5\x22\x67\
-\x85\x2b\xdb\x1e\x86\xa3\xbb\xd3\x52\xf6\xd6\x48\xdb\x77\x4c\xfa\
-\x64\x8a\xb3\x3a\x10\xfc\x7c\xc5\xb9\x34\xfb\x78\xfc\xc3\xb7\xfb\
-\xc0\x82\x7d\x6a\xae\xf9\x6c\x3d\x99\x92\x91\xee\x85\x55\xb2\x7e\
-\x5c\x1e\x79\x15\xa5\xa9\x78\x8e\xe3\xfb\x06\x1b\x58\x66\xd9\x0c\
-\x6c\x72\x98\xe4\x93\xd7\xfa\x55\x31\x11\xd8\xde\xc7\x15\x13\xf1\
-\x27\xba\x8c\x93\xe9\xe9\xfe\x7d\xeb\x08\xc6\x33\x8b\x85\x45\xa7\
-\xf9\x0a\xa1\x5f\x58\xd3\xaf\x3c\x3b\x71\x67\xa9\x2e\xd8\xdd\xc6\
-\xe4\x46\x1f\x31\x42\x39\x23\xeb\x5d\x0f\x84\xfc\x67\xfd\xb9\x77\
-\x1c\x13\xda\xc7\x37\x25\x82\x90\x15\x47\xb9\x19\xac\xdf\x12\x41\
-\x36\xa5\xa7\xdb\xc9\x25\xc6\xeb\x88\xe3\xc4\x40\x1c\x80\xa3\x80\
-\x0d\x60\xd9\x99\xd5\xfc\xab\xd8\xfc\xb7\x6e\x92\x28\x20\x1f\xad\
-\x78\xd5\xb9\x1d\x57\x06\x74\xc2\xd2\xa7\x7e\xa7\x79\xa8\x8d\x53\
-\xc4\x0f\x71\x70\x93\x47\x63\x69\x1c\x64\xa2\x73\x1c\x65\x7b\x2a\
-\xff\x00\x9c\x56\x1e\xad\x35\xad\xa5\xba\xc5\x97\xbd\xbc\x6d\xac\
-\x5d\xdb\x0b\x17\x3d\x00\xe8\x78\xc7\x35\x9d\xa8\x6b\x57\x72\x5b\
-\xac\x33\xcf\x23\x2a\xa8\x44\x93\x7e\x70\x07\x41\xc7\x6a\x41\xab\
-\xcb\x88\x62\x92\xdd\x6f\x3c\x90\x4c\x59\x1b\xb6\x1f\x6a\xd3\x92\
-\x74\x92\x94\x56\x9e\x5b\x99\x46\x36\xdc\xe6\xb5\x29\x9a\xef\x55\
-\x9e\x49\x64\x55\x05\xcf\xc9\x4c\x0a\x17\x8c\x06\x5c\xf4\x3d\x07\
-\xd2\x9d\x7b\x25\xbc\xfa\xcc\x9e\x62\xc9\x1d\xc6\xec\xc8\x84\x7c\
-\xbf\x81\x1d\x29\xd3\x40\x6d\xb6\xb6\x59\x86\x7e\xf0\xfb\xdf\x8f\
-\x63\x4e\x9a\xf7\x8e\xed\x14\x51\x0e\xc6\xb7\x25\xa3\x2c\xc7\x3f\
-\x75\x8e\x18\x7f\x43\x52\x5a\xfd\x9e\xf4\x37\xcc\x2d\xe4\xe7\x25\
-\x57\x20\xfd\x57\xb5\x38\xc2\xb2\x45\xb8\x36\xe0\x3a\x32\xf2\x3f\
-\x2e\xab\x50\xcd\x6f\x92\xbb\xf1\xc7\x42\x0e\x1b\xea\x0f\xf1\x57\
-\xa6\xa9\xad\xe4\x73\x9c\x6f\xed\x20\xad\x07\xec\xfb\xe3\x46\x30\
-\xa8\x55\xd0\x35\x12\x5d\x3e\x65\x38\xb6\x93\xf1\xae\x7f\xf6\x61\
-\x7f\x27\xf6\x76\xf0\x2c\x6a\x36\x81\xa0\x59\x06\x6f\xfb\x62\x95\
-\xab\xfb\x53\x5d\x34\x7f\xb3\x87\x8f\x59\x9a\x36\xdb\xe1\xcd\x44\
-\xb6\xe5\xda\xdf\xf1\xeb\x2e\x2a\x97\xec\xe5\x02\xc3\xf0\x1f\xc1\
-\x3e\x61\x38\x5d\x0a\xc8\x85\xee\x7f\x70\x95\xec\x63\x15\xb2\x3e\
-\xff\x00\xbd\xfc\xa1\xff\x00\x04\xcf\x0f\xfe\xf3\xff\x00\x6e\xfe\
-\xa7\xa2\x69\xd0\x79\xd1\xfc\xbf\xbb\x89\x4f\xcc\xe7\xa9\xa7\x6a\
-\x37\x40\x40\xd1\xdb\xa9\x55\x61\xc7\x3d\x4f\xa9\xaa\xf1\xdd\x9b\
-\xa0\x07\x3b\x47\x4a\x99\xad\x7c\xd8\x37\xc8\xdb\x17\xdc\x65\x9a\
-\xbe\x06\x4b\xde\xbb\x3d\x65\xb9\x8c\xb2\xb2\xb9\xe7\x77\xba\xd5\
-\xd3\x7c\x66\x87\x6b\xe1\x86\x32\x07\xff\x00\x5e\xab\xed\x8e\x49\
-\xff\x00\x72\xb2\x2e\xd1\x92\x58\xe7\x07\xd8\x55\x86\xd2\xda\x48\
-\xb7\x2b\x23\xff\x00\xb2\x3a\xfd\x6b\xaa\x56\x09\x35\xd4\xb9\xa3\
-\xc1\x0d\xdb\x0c\xbf\x93\x8e\xb9\x39\x18\xaa\x9a\xf9\xdd\x36\xdc\
-\x82\xbb\x8e\x0f\xf7\x80\xe0\x52\xbd\xab\xd8\x1d\xb2\x2b\x2b\x74\
-\x53\x8c\x67\xde\xab\xde\xde\x2b\x79\x6b\xb7\x79\x5c\x8c\x9e\xb5\
-\xd1\x87\x8b\xe6\xbf\x43\x96\x7a\xec\x24\x12\x30\xf3\x63\x4f\xde\
-\x19\x17\x19\xec\xa2\xa6\xbf\xd1\x18\x69\x49\x34\x2f\xbb\x62\x7c\
-\xe4\xf7\x14\x58\xcd\x14\x36\x53\xc8\xd2\x2f\xef\x1f\x62\xa8\xe3\
-\xcb\xfc\x3f\x2a\x66\x99\x71\x35\xb4\x77\x10\x6d\xf3\x15\x7e\x66\
-\xe7\x80\x3d\xa8\xc5\x4a\x57\x5c\xbd\x09\xa7\x7b\x5c\x5b\x2b\x86\
-\xf3\x6d\xbc\xbd\xcc\xb2\x60\x9c\xf6\x3e\xf5\x7e\x73\xe5\xea\x57\
-\x41\x59\x87\xc8\x33\xef\x59\xf0\xc6\xd2\xdd\x42\x91\x32\x88\xcb\
-\x6e\xf4\x2b\x57\x84\xe9\x2e\xbd\x22\x2e\x4a\xc8\xa5\x4e\x7d\x47\
-\x7a\xe7\x9e\xcb\xe6\x0d\xbb\x85\xb2\x43\x65\xa7\x24\xec\xdf\xbd\
-\x90\x02\xa3\x1d\xea\x40\xe9\x79\x60\x5c\xfd\xe5\x70\x73\xef\x54\
-\x11\x56\xe2\xf6\x28\xff\x00\xe7\x99\x39\x3e\xa2\xac\xdb\x3c\x7e\
-\x45\xdc\x7b\x99\x7e\x6e\x02\xf6\x35\x50\x8a\x4e\xe4\xca\xf6\x2d\
-\x4a\x1e\x0d\x3f\x95\xda\x8f\xd3\x3d\xab\x4f\x51\x88\x3f\x86\x55\
-\x3f\xe7\x8e\x31\x8e\x98\xac\x3b\x5b\x86\x7d\x3a\x68\xdb\xef\x28\
-\xca\xe6\xac\xae\xa8\x5f\x45\x2b\xf7\x98\xaf\x3d\xb2\x6b\xf4\xbe\
-\x0c\x8d\x37\x4f\x15\x4a\x6b\x59\x41\xdb\xe5\xb9\xe4\xe3\xb9\xb9\
-\xa0\xd7\x73\xb2\xf8\x69\xac\xb1\xd3\xc4\x6b\xf7\x23\x38\x07\x3d\
-\x45\x76\xd6\x1a\xa7\x98\x57\x77\x4e\xf5\xe4\xfe\x07\xd5\xd6\xca\
-\xc1\x97\x3c\x31\xe9\x5d\x65\x87\x88\x55\x8a\x0c\xf7\x1f\x85\x7e\
-\xcb\xc2\x18\x89\x3c\xaa\x8b\x7d\x91\xf3\xb8\xea\x7f\xbe\x91\xdf\
-\x4b\x7d\x97\xf4\xf5\x3e\xb5\x6a\xde\xf3\x70\x41\xeb\xc7\x35\xc8\
-\xae\xb3\xb9\xf1\xc6\xdf\x4a\xbd\xa6\xea\xde\x64\xc8\xb9\xfb\xbe\
-\xf5\xf6\x11\xac\x79\xee\x07\x44\xce\xd8\x66\x5f\xe1\x38\xf7\xaf\
-\xac\x7f\xe0\x93\xb2\x17\xf8\x9f\xe3\x42\x7a\xff\x00\x65\xdb\x67\
-\xfe\xfe\xc9\x5f\x1d\x0b\xdf\x3a\x47\xf9\xb1\xf3\x57\xd7\x9f\xf0\
-\x48\xcb\x83\x71\xf1\x33\xc6\xbe\xda\x5d\xa9\xc9\xff\x00\xae\xb2\
-\x57\x55\x19\x27\x33\x39\xaf\x74\xfb\xc0\x74\xa2\x81\xd2\x8a\xee\
-\x39\xc2\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\xb9\xbf\x8a\xde\x17\xf0\
-\xbf\x8c\xbe\x1d\x6b\x9a\x6f\x8d\x74\xfd\x0f\x54\xf0\x8d\xd5\x8c\
-\xab\xac\x5a\xeb\x50\xc5\x3e\x9d\x35\xa8\x5c\xc8\x27\x49\x41\x43\
-\x18\x50\x49\xde\x31\x81\xcd\x74\x95\xf1\xcf\xfc\x17\xf2\x6d\x7a\
-\x0f\xf8\x23\x8f\xed\x08\xde\x1b\xdd\xfd\xa5\xff\x00\x08\xb3\xac\
-\xb8\xce\x7e\xc6\x67\x88\x5e\x74\xff\x00\xa7\x63\x3f\xf5\xe3\x34\
-\x01\xe3\x1f\xb1\xd7\x8b\x3f\xe0\x9c\x7f\xb7\x4d\xef\xc5\xf9\x3e\
-\x1f\x7c\x0d\xf8\x23\x79\xe1\xef\x82\x36\xf6\xf7\x7e\x23\xf1\x15\
-\xe7\xc3\x4d\x2e\xd7\x4b\x68\x66\x5b\xc6\xf3\x60\x77\x87\xcc\x78\
-\xd1\x6c\x66\x66\x76\x45\x1b\x4a\x15\x2c\x09\xc7\xc1\x1a\xef\xfc\
-\x17\xa7\xfe\x09\xef\x61\xf1\x9a\xe3\x4f\xd3\xff\x00\x61\x0f\x03\
-\xea\xbf\x0e\xed\x6e\x3c\x89\x3c\x51\x1f\x82\xb4\x38\xae\x58\x6f\
-\xc0\x91\x6c\x5a\xdf\x1b\x18\x6e\x60\x1e\x74\x7c\x00\x0a\x82\x48\
-\x18\xff\x00\x19\x7f\x6a\xaf\x81\xbf\xb2\x77\xfc\x1a\xc5\xe1\x3f\
-\x0b\x7c\x29\xbf\xf0\x75\xaf\xc4\xcf\x8e\x36\x36\x7a\x1f\x89\xe3\
-\xd3\x65\x89\xb5\xbb\xa9\xa3\x9e\x49\x75\x16\xbd\xda\x7c\xed\x89\
-\xfb\xd8\x50\x4b\xf2\xaa\x5c\xa8\x41\xb5\x85\x7d\x81\xfb\x19\xfe\
-\xce\x9e\x0b\xfd\x84\xff\x00\xe0\xd5\xbf\x11\x5b\x7c\x4c\x87\x46\
-\xd1\xff\x00\xe1\x60\x78\x23\x57\xf1\x2e\xac\xba\xa2\xae\xdb\xdb\
-\xfd\x42\x09\x0e\x9d\x18\x56\xfb\xd3\x08\xd6\xc5\x51\x47\xcc\x1e\
-\x30\x46\x08\xcd\x00\x7e\x95\xfe\xc6\xb7\xff\x00\x0b\x75\xdf\xd9\
-\xab\xc1\xfa\xb7\xc1\x5d\x3b\xc3\x3a\x5f\xc3\x1d\x6e\xc4\x6a\x5a\
-\x15\xbf\x87\xf4\xe8\xf4\xfb\x05\x8a\x62\xd2\x31\x58\x23\x55\x58\
-\xd8\xbb\x36\xf5\xda\x18\x3e\xe0\xc3\x20\xd7\xa8\xd7\xe6\xf7\xfc\
-\x1a\x93\x6f\xad\x5b\xff\x00\xc1\x17\x7e\x1d\xff\x00\x6b\x29\x58\
-\x5f\x55\xd6\x1f\x4c\xdc\x08\x6f\xb2\x9b\xd9\x71\xff\x00\x91\x3c\
-\xdc\x7b\x62\xbf\x48\x68\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa6\
-\xc8\x70\x56\x9d\x51\xcc\x33\xb7\xeb\x40\x1f\x9c\x3f\xb5\x27\xc1\
-\xaf\x13\x7e\xd1\xdf\x18\x25\xd1\x3e\x1f\xfc\x39\xf1\xe7\x83\xf5\
-\x8d\x2f\x46\xf1\x9e\x85\x7d\xa7\xea\x5a\x2d\xbd\x97\x84\xec\xd7\
-\x51\xd3\xef\x95\x75\xab\x2b\xe8\xd5\x52\x6b\xfb\xdb\xa7\xb3\x5c\
-\x89\x25\x22\x29\xee\x7c\xc8\xe2\x75\x66\x3e\xcf\xfb\x11\xd8\xea\
-\x5e\x3b\xfd\xa7\xb5\x6f\x1c\x59\xf8\x1f\xc5\x5f\x0e\xfc\x2b\xa7\
-\x7c\x37\xf0\xff\x00\x83\x24\xb1\xd7\x74\x87\xd2\x65\xbc\xd4\x6d\
-\x6e\x2f\x66\x78\xe3\x85\xb1\xe6\x45\x69\x1c\xcb\x10\x98\x03\x1b\
-\x19\xd8\x46\xcc\xaa\x4d\x7b\x2f\x86\xbf\x6c\xff\x00\x85\x7e\x33\
-\xf8\xaf\xaa\x78\x1f\x4d\xf1\xe7\x86\xef\x3c\x55\xa3\x2d\xcb\x5d\
-\xd8\x2d\xd6\x0c\x7f\x66\x20\x5c\x80\xe4\x04\x76\x87\x70\xf3\x15\
-\x58\x98\xf3\xf3\x05\xab\xdf\x02\x7f\x6a\xaf\x87\xbf\xb4\xfd\x96\
-\xa9\x3f\xc3\xff\x00\x17\x68\xde\x2a\x87\x47\x92\x38\xef\x0d\x8c\
-\xa5\x8c\x1e\x62\x96\x89\xc8\x20\x13\x1c\x8a\x09\x49\x06\x51\xc0\
-\x25\x58\x80\x4d\x28\xe9\xb0\x49\x5d\xea\x7a\x32\x77\xac\x9f\x1e\
-\x7f\xc8\x99\xac\x7f\xd7\x8c\xdf\xfa\x03\x57\x96\x7c\x49\xb1\xfd\
-\xa1\x66\xf1\xce\xa0\xde\x0d\xd7\x3e\x0b\xda\xf8\x61\x99\x7e\xc1\
-\x16\xb5\xa2\xea\x77\x17\xe8\xbb\x17\x77\x9a\xf1\x5d\x24\x6c\x77\
-\xee\x23\x6a\x8e\x30\x3a\xe4\xd7\x27\xe2\xbd\x27\xf6\xa6\x6f\x0c\
-\xea\x46\x6f\x11\x7e\xcf\x6d\x08\xb4\x97\xcd\xdb\xe1\xcd\x63\x76\
-\xdd\x87\x38\xff\x00\x4d\xeb\x8a\x60\x78\xc4\x4b\xfb\xa4\x01\xbf\
-\x3e\xd4\xae\x8c\xab\xdb\xd0\x9f\x43\x5e\x4f\x16\x97\xf1\xd9\x11\
-\x7f\xe2\x7d\xf0\x57\x9f\xfa\x80\x6a\xc7\xff\x00\x6f\x2b\xd2\x7c\
-\x2f\x69\xab\x37\x86\x2c\x17\x5e\x9b\x4b\xba\xd6\xd6\x11\xf6\xc9\
-\x34\xe8\xa4\x86\xd2\x49\x32\x72\x63\x49\x19\x9d\x57\xa7\x0c\xcc\
-\x73\x9e\x7b\x56\x52\xec\x68\x5c\x19\x8c\x8d\xcd\xf3\x74\x15\x37\
-\xda\x49\x38\x3b\xb6\xaf\xf3\xaa\xf3\x5a\xb4\x48\xc7\x6f\x6e\x3d\
-\xea\x4b\x1b\x69\x19\x7e\x6c\xfc\xdd\xea\x35\xb8\xf4\x38\x1f\xda\
-\x22\xd3\xed\x5e\x14\x59\x08\xff\x00\x56\xe0\xe6\xbe\x7a\x9d\x41\
-\xe0\xe3\xae\x6b\xea\x5f\x8c\x5a\x57\xdb\xbc\x19\x70\xbf\x2b\x6d\
-\x19\xfa\x1a\xf9\x76\xf2\x31\x14\xad\x9f\x5a\xfc\x23\xc4\xcc\x2b\
-\x8e\x3e\x35\x7f\x99\x7e\x47\xd1\xe5\x12\xbd\x36\x8a\xbb\x4a\xb6\
-\x7b\x66\x8b\x81\xba\x79\x38\xe5\x85\x2c\x9c\xb0\xf6\xe4\x9f\x5a\
-\x5b\x93\xfb\xe5\xf5\x71\xf9\x57\xe5\x15\xac\x96\xa7\xb9\x02\x95\
-\xc2\xfd\xd3\xfd\xea\x65\xab\x37\x9e\xac\x3a\x7d\x38\xab\x13\x2f\
-\xfb\x3f\x77\x8a\x84\x7c\xbb\x7f\xbb\xe9\xf8\x56\x77\x28\xae\xe3\
-\x60\x93\x8f\xe2\x27\x9e\xd5\x4f\x61\x51\xbb\x8e\x7a\x66\xaf\xde\
-\xc7\x9b\x99\x23\x19\xcc\x98\xc0\x1f\x4c\x9a\x82\xee\x30\x0f\xe3\
-\xc5\x4d\x39\x34\xac\x54\xd6\xa4\x2c\x9e\x63\x05\xfc\x2b\x12\x0b\
-\x29\xec\xee\x67\x12\x4c\xf2\x8d\xe7\xe4\x6c\x9e\x2b\xa1\x40\x57\
-\x0d\xd8\x73\x54\xaf\xa0\x2d\xa9\xcc\xa5\xb6\xee\x00\x8f\xca\xa2\
-\xb2\xba\x56\x1c\x65\x63\x39\x0b\x46\x54\xae\xd6\x5c\xfd\xdc\x7f\
-\x9f\x7a\xd8\xd4\xfc\x43\x63\x1d\x92\xdb\xe8\xf0\xf9\x2c\xb9\x63\
-\x23\x0f\xde\xbf\xd7\xf1\xed\x59\x92\xc3\xb8\xfb\x9e\x41\x1d\xaa\
-\xc6\x8f\xe1\xb1\xac\x34\xcd\x34\xd1\xdb\x47\x6a\x9e\x6b\xc9\x9c\
-\x31\xe4\x70\x3f\xda\xac\xab\x53\x84\xa3\x69\x74\xdf\xcc\x5c\xc7\
-\x29\xa9\xc7\x71\x6f\xad\x2b\xca\xc7\xf7\xd1\xf9\x9b\x5b\x1f\x31\
-\xcf\x39\xf4\xab\x44\x6e\x8f\x9c\x67\x3c\x29\xed\xf4\xab\x9e\x2f\
-\xd6\x74\xfd\x63\xc4\x4a\xdf\x67\x65\x56\x5d\xa9\x33\xf0\x64\x3e\
-\xbc\x7d\x29\xc9\x69\x24\x31\x9f\xdd\xf9\x90\xe3\x3d\x2b\x8e\x15\
-\xa1\xcd\x6b\x59\x1d\x6f\xe1\x46\x5b\xc6\xc8\x77\x65\xa3\x6f\xef\
-\x0e\xa7\xf0\xe8\x69\xa6\xe3\x61\xf9\x88\x55\xfe\xfa\x2e\x54\xfd\
-\x45\x5c\x9e\x1f\x35\x77\x2e\xd2\x07\xde\x1f\xc4\x3e\x95\x4e\x58\
-\xb2\x58\xab\x7c\xd8\xc6\xd6\xf4\xaf\x52\x12\xd2\xc6\x5c\xc7\x9e\
-\xfe\xd6\x57\x2c\xbf\xb2\xf7\x8f\xbe\x63\xb7\xfe\x11\x9d\x49\x70\
-\x08\x2a\x73\x6b\x28\xfa\xfe\x15\x4f\xe0\x50\x6f\xf8\x53\x3e\x0f\
-\x5e\x77\x0d\x0e\xc5\x40\x1e\xbf\x67\x4a\x97\xf6\xb6\xb5\x51\xfb\
-\x30\xf8\xf9\x95\x97\x3f\xf0\x8f\xdf\x26\x39\x0c\x33\x03\x8e\x9d\
-\x3b\xd4\xff\x00\x06\x21\x30\x7c\x2b\xf0\xb4\x68\x06\xe4\xd2\x2d\
-\x06\x7f\xbb\xfb\x84\xe2\xbd\x4c\x6b\x4b\x24\x8a\x5f\xf3\xf1\xff\
-\x00\xe9\x08\x9c\x37\xfb\xc7\xfd\xbb\xfa\xb3\xb2\xb1\x85\x61\x65\
-\xdf\xcc\x9d\x95\x6b\x4b\xec\xcd\x3a\x96\x72\xad\x23\x70\x17\xf8\
-\x56\xab\xe8\xd6\x05\xfe\xef\x1c\x65\x89\xab\x97\x12\xc8\xfb\x6d\
-\xed\x55\x9a\x66\xe0\x6d\x19\xeb\xde\xbf\x3f\xab\x2e\x69\xd9\x1e\
-\x9f\x31\x0f\xf6\x5a\xd9\x5d\xb4\x8f\xb2\x4c\xa6\x08\x53\xc0\x26\
-\xa8\xad\xb1\x54\x2c\xb3\x6d\x91\x4f\xdd\x6f\x4a\xb5\x65\xe1\xcb\
-\xe8\xe7\x56\xb8\xbc\xf2\x94\x8f\x98\x3b\x65\xb3\xf8\x54\xd7\x8b\
-\x6b\x14\x7e\x5b\x09\x64\xdc\x39\x92\x4f\x97\x27\xd8\x75\xae\x8a\
-\x70\x92\x76\xdc\x89\x4d\x19\xf3\xbb\xdf\xdb\xf9\x72\x31\x73\x1e\
-\x30\xde\x95\x97\x78\x3e\xcd\x2e\xe7\x5d\xd8\x3c\x10\x73\xba\xb5\
-\xa3\x80\xa4\x6f\x1c\x7f\xbc\x56\xcf\x03\xe5\x20\x56\x7d\xf3\x5c\
-\x59\xa9\x59\x33\x1c\x6d\xc6\x36\x72\xdf\x85\x77\xe1\xef\x7e\x54\
-\x61\x26\x91\x1c\x31\x49\xf6\x66\x07\x1b\x53\xe6\xe9\xcd\x5a\xb4\
-\xb8\xfb\x1e\x87\x24\xca\xbb\xa4\x91\xf6\xee\xf4\x15\x52\x3d\xb8\
-\x32\xfe\xf1\xb1\xf7\x89\xfe\x23\xdb\x8a\x96\xda\x55\x6d\x2a\xf6\
-\x3f\xef\x0f\x31\x33\xdb\xd6\xa3\x13\x2e\x69\x69\xe4\x5c\x6f\x61\
-\xfa\x7e\x9a\xf1\x4e\xad\x24\xc0\xef\x3b\xb0\x07\x3f\x9d\x4f\x2c\
-\x79\x6b\x8d\x9f\xeb\x21\x7c\x83\xec\x6a\x2b\x89\x0b\x8b\x78\x95\
-\xb6\xee\x19\x62\x29\xf0\x4a\x55\x18\xf4\x60\x36\x93\xea\x3b\x56\
-\x7e\xf3\x57\x7e\x62\x6a\xdb\x0d\x89\x3e\xcd\x74\x93\x2f\xdd\x93\
-\xaf\xb5\x22\x1f\xb1\xea\x32\x6e\xce\xd7\x1b\xc7\x14\x96\xa7\xfd\
-\x1a\x48\xd8\x7d\xcf\x98\x53\x75\x0b\xb1\x7c\x23\xdb\xf2\xe1\x71\
-\x8a\xd6\x9e\xf6\x22\x57\xb0\xdb\xab\xf6\x84\x33\x7d\xe2\xdd\xbb\
-\x1a\x64\x7a\x8e\xd9\x17\x77\x0b\x20\xe8\x3b\x54\x5a\xc4\x8a\x2c\
-\xd7\x6f\x5c\x70\x05\x47\x65\xb6\xe6\xd6\x36\xff\x00\x96\x8a\x30\
-\x6b\xf4\xce\x1a\xa9\x4e\x96\x19\x55\xab\xf6\x64\xef\xe8\xd5\xbe\
-\xe6\x79\x18\xc4\xdc\xad\x1f\xea\xcc\xda\xd2\x6e\x0d\x91\xdb\xfc\
-\x3d\x72\x2b\x76\xdf\x55\x8d\x61\x5f\x98\x8c\x9e\xbe\x95\xc9\x5b\
-\xdc\xbc\x6e\xcb\xdd\x47\xe7\x56\xac\x6f\xcc\x8c\x15\xb1\xe9\x9f\
-\x5a\xfd\x57\x86\x67\xc9\x80\x84\x76\x5d\x3d\x2e\xed\xf8\x1e\x26\
-\x33\x5a\x8d\x9d\xd6\x9b\xa9\x2c\x8f\xbb\xcd\x3e\xb8\xad\x6b\x4d\
-\x47\xfd\x25\x76\xb7\x24\x7d\x2b\x89\xb4\xbd\x68\x9b\x76\x57\xa6\
-\x0e\x6a\xf6\x9d\xad\xe1\x86\x4d\x7d\x54\x6a\x25\xa3\x38\xe5\x13\
-\xb8\xb7\xbe\x98\x5e\xc9\xb5\xbe\xbc\xd7\xda\x1f\xf0\x47\x59\xda\
-\x5f\x89\x7e\x38\x56\xcf\x1a\x55\xa7\x53\xff\x00\x4d\x65\xaf\x85\
-\x34\xbd\x67\xcc\x4c\xff\x00\x16\x3f\x2a\xfb\x73\xfe\x08\xbf\x7d\
-\xf6\x9f\x8a\x7e\x3d\x5e\xeb\xa5\x59\xf3\xff\x00\x6d\xa5\xaf\x4b\
-\x0b\x34\xe6\x8e\x5a\xd1\xf7\x4f\xd0\xda\x28\x1d\x28\xaf\x58\xe3\
-\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\
-\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\xa1\xe2\x3f\x0f\x59\x78\xb3\
-\x44\xbd\xd3\x35\x2b\x3b\x5d\x43\x4d\xd4\xad\xe4\xb4\xbb\xb5\xb8\
-\x8c\x49\x0d\xcc\x4e\xa5\x1e\x37\x53\xc3\x2b\x29\x20\x82\x30\x41\
-\xab\xf5\xc4\xfe\xd0\xbf\x1e\x7c\x37\xfb\x2f\xfc\x18\xf1\x37\xc4\
-\x2f\x18\xde\xcd\xa7\xf8\x57\xc1\xf6\x12\x6a\x7a\x9d\xcc\x76\xef\
-\x70\xd0\xc0\x83\xe6\x61\x1a\x02\xcc\x7d\x94\x13\x40\x1f\x03\xf8\
-\x77\xfe\x0d\x3c\xfd\x90\xfc\x37\xfb\x44\x2f\x8f\x93\xc3\xbe\x2a\
-\xbc\xb3\x8a\xed\x6f\xa1\xf0\x8d\xde\xae\xb3\x78\x7e\x39\x03\xef\
-\x0a\x62\x31\xf9\xcf\x16\x78\xf2\x9e\x66\x42\xbf\x29\x04\x71\x5e\
-\xaf\xff\x00\x05\x4f\xff\x00\x82\x23\x78\x0f\xfe\x0a\xcb\xe2\x8f\
-\x85\xef\xe3\x6f\x12\x78\x87\xc3\xbe\x1d\xf8\x72\x6e\x83\xe9\x9a\
-\x14\x71\x44\xfa\xaa\x4d\xe4\xed\x8c\xca\xe1\x96\x25\x41\x11\x1f\
-\x2c\x64\xe2\x42\x01\x5e\xb5\xf4\x97\xec\xa1\xfb\x51\xf8\x37\xf6\
-\xd0\xf8\x05\xe1\xff\x00\x89\x9f\x0f\x75\x2b\x8d\x5b\xc1\xbe\x28\
-\x8e\x69\x34\xeb\xc9\xad\x64\xb5\x79\x84\x53\xcb\x03\xe6\x39\x00\
-\x75\xc4\x91\x38\xf9\x80\xe9\x9e\xf5\xe8\xb4\x01\xcc\xfc\x1e\xf8\
-\x45\xe1\xdf\x80\x9f\x0c\x7c\x3f\xe0\xbf\x08\x68\xf6\x7a\x07\x85\
-\xfc\x31\x63\x1e\x9d\xa6\xe9\xf6\xcb\x88\xed\x60\x8d\x76\xaa\x8e\
-\xe4\xf7\x2c\x49\x2c\x49\x24\x92\x49\x3d\x35\x14\x50\x01\x45\x14\
-\xd2\xf8\x5c\xfe\x34\x00\xea\x2b\x95\x9f\xe3\x7f\x84\xad\xbe\x30\
-\xc1\xf0\xfd\xbc\x41\xa5\xff\x00\xc2\x6d\x71\xa4\xcb\xaf\x26\x8a\
-\x26\x0d\x78\x2c\x23\x96\x38\x5e\xe5\x90\x7d\xd8\xfc\xc9\x51\x43\
-\x36\x03\x12\x71\x9d\xa7\x1c\xdf\xc0\x9f\xdb\x23\xe1\xaf\xed\x33\
-\xa9\xea\x96\x7e\x07\xf1\x45\xbe\xbd\x73\xa3\xc5\x1d\xc4\xe8\xb6\
-\xd3\xc1\xe6\xdb\xc8\xce\x91\xdc\xc0\x65\x44\x17\x16\xee\xd1\xc8\
-\xab\x3c\x3b\xe2\x66\x46\x01\x89\x06\x80\x3d\x3a\xa3\xb8\x6d\xa5\
-\x7f\x9d\x2f\x9d\xcf\xdd\x6f\xca\x98\xd2\x79\x98\x3b\x5b\x8f\x6a\
-\x00\xfc\xe2\xf8\x9d\xe1\xcf\x12\x7e\xd9\xff\x00\x12\x7c\x71\xe1\
-\x46\xf8\x65\xe3\xff\x00\x86\xf6\x1e\x1d\xd2\x3c\x5b\xe1\xff\x00\
-\x87\x7a\x7b\x78\x42\x5b\x2d\x1e\xeb\x52\xbd\xb2\xba\xb7\x9b\x5c\
-\xbe\xd4\x14\x08\x50\x5c\x89\xa7\x48\x62\x4e\x82\xe5\xe5\x91\x9e\
-\x49\x55\x62\xf6\xdf\xd8\xaf\x4c\xf1\x17\xc4\x0f\xda\x73\x58\xf1\
-\xfd\xdf\xc3\xff\x00\x15\x7c\x33\xd0\x74\xef\x87\x7a\x17\x82\x3f\
-\xb3\xb5\xdb\x54\xb3\x9a\xfa\xfe\xd6\xe6\xf6\xe2\x6f\x2e\x34\x76\
-\x0d\x6f\x6c\xb3\xa4\x69\x37\xdd\x73\x34\x9e\x59\x2a\x09\x3f\x4c\
-\x78\xc7\xc7\x1a\x47\xc3\xdd\x2e\x0b\xcd\x6a\xf2\x3d\x3e\xd6\xea\
-\xf2\xdb\x4e\x85\xa4\x56\x3e\x65\xc5\xc4\xcb\x04\x31\xa8\x00\x92\
-\xcf\x23\xaa\x8e\x3b\xe4\xe0\x64\xd6\xb6\xd5\x0d\xb4\x2b\x29\xfa\
-\x7a\x52\x8d\x93\xd0\x24\xaf\xa9\x32\xf3\x9a\xc9\xf1\xe7\xfc\x89\
-\x9a\xc7\xfd\x78\xcd\xff\x00\xa0\x1a\xf3\x1f\x89\x1e\x05\xf8\xf9\
-\xaa\xf8\xe3\x50\xb8\xf0\x8f\xc4\x9f\x85\xfa\x1f\x87\x25\x75\x36\
-\x56\x3a\xa7\x80\xef\x35\x1b\xcb\x75\xd8\xa1\x84\x93\xa6\xa9\x0a\
-\xc8\x4b\x86\x20\x88\x97\x00\x81\xce\x32\x79\x3f\x16\xfc\x39\xfd\
-\xa6\x63\xf0\xae\xa6\x67\xf8\xb9\xf0\x66\x48\x85\xa4\xa5\xd4\x7c\
-\x32\xbf\x05\x97\x61\xc8\x1f\xf1\x3a\xa6\x07\x88\xc5\x02\x34\x71\
-\xb1\xc8\xda\x06\x39\xef\x40\x57\x67\xca\x3e\x49\x39\xc6\x6b\xca\
-\x47\x83\xbe\x39\x1c\x2a\xfc\x44\xf8\x5f\xb7\x1c\xe3\xe1\xfd\xe1\
-\xcf\xfe\x55\x6b\xd0\x7c\x2b\x16\xad\xa4\xf8\x7a\xce\x3d\x72\xf2\
-\xc7\x52\xd6\x16\x2c\x5d\xdd\xd9\x59\x35\x9d\xac\xf2\x73\x96\x8e\
-\x16\x92\x46\x8d\x4f\x1f\x29\x91\xbb\xf3\x58\x48\xd0\xdb\x8a\x59\
-\x25\x71\x95\xe9\xc1\xe7\xaf\xd2\xa6\xb8\x9a\x58\x90\x6d\x53\xec\
-\x6b\x38\x5e\x2a\xba\xa8\x6c\x77\x27\xfb\xb5\x64\xdc\x79\x8f\x83\
-\x26\x15\x46\x47\xbd\x35\x2d\x00\xcb\xf1\x6d\xbf\xdb\xfc\x3d\x70\
-\x8c\x3e\xf2\x91\xfa\x57\xca\xfa\xf4\x1e\x4e\xa5\x2a\xe0\xae\xd7\
-\x38\x1e\xf5\xf5\x95\xe6\xd9\xad\xd9\x09\x38\x65\x24\xf3\x5f\x2f\
-\xfc\x42\xb5\xfb\x17\x89\xae\xa3\xfe\xec\x87\x93\x5f\x92\xf8\x9d\
-\x86\xe6\xa7\x4e\xaf\x67\x63\xdc\xca\x67\x69\x34\x73\xb3\x72\x7f\
-\xbb\xef\x44\x8f\x98\xe1\xcd\x46\xb7\x31\xbc\x85\x77\x02\xc3\xb0\
-\xea\x2a\x42\x55\xad\xa3\xef\xb7\x3f\x85\x7e\x1f\x5a\x16\x8b\xb9\
-\xf4\x31\xd7\x62\x37\xf9\x97\x07\xa1\xaa\xef\xc9\xce\x3d\xaa\xc1\
-\x65\xdb\x8e\x78\xa8\x27\x76\x44\x3e\x9c\xf3\x5c\xf1\x4f\x4b\x16\
-\x32\x75\x0d\xa9\xb6\x3a\x05\x5c\xfd\x4d\x36\xe6\x3c\x8c\xff\x00\
-\x17\xaf\xf7\xa9\xd1\x29\xdc\xac\xdc\x79\x80\xb1\xf6\xee\x05\x4d\
-\x2a\xee\x41\xfe\xc9\xfc\xab\x2f\xb4\xd2\x29\x6c\x67\xb0\xdb\xf5\
-\xe7\x8a\x8f\x51\x85\x4e\xa8\xbd\x7e\x65\x1f\xca\xac\x48\x98\x73\
-\xdf\x8f\x4a\x86\xf7\x9b\xbb\x76\xff\x00\x67\x19\xa2\xad\xf9\x7e\
-\xe2\xa3\xb9\x46\xe2\x11\x0b\x0f\x97\xe5\xa8\x5b\x82\xdf\x33\x6d\
-\x61\x82\x05\x68\x5f\x46\xbb\x7f\x4a\xcf\x6f\xdd\x0a\xbe\x4b\xe8\
-\x06\x76\xb1\x09\xb6\x96\x19\x23\x89\x64\x5c\xed\x60\x57\x38\xab\
-\xf6\x1a\x93\x59\x20\x58\xd7\x74\x5f\xc5\x19\x3c\x8f\xc6\x93\x54\
-\x63\x1e\x98\x19\x77\x63\xcc\x00\xfa\x73\x54\x22\x87\x74\x9b\x43\
-\x11\xdc\x03\xfe\x35\xc7\x5a\x9c\x67\x3b\x6d\xe6\xbf\x53\x48\xc9\
-\xa8\xea\x69\x4f\xa5\xdb\xea\xf1\xf9\x96\xec\xb1\xc9\xfc\x49\xfd\
-\xda\xc5\xbd\xb3\x78\xa5\x65\xb8\x56\x56\x1d\x1b\xbf\xff\x00\x5e\
-\xac\xa4\xfb\x67\xc3\x65\x1d\x7a\x30\xef\xf5\xab\xa9\x77\xfb\xb0\
-\xb7\x2a\x24\x8d\xb9\x57\x03\x81\xf4\x3d\xbe\x94\x43\x9a\x9e\x92\
-\xfe\xbe\x7d\x09\x7d\xcf\x19\xfd\xad\x15\x9f\xf6\x72\xf1\xaa\xf9\
-\x8b\xb6\x4d\x12\xe9\x3a\xfc\xc7\x28\x46\x31\x5d\x07\xc2\x1d\x00\
-\x2f\xc3\x7f\x0f\x49\x2b\x2c\x11\x2e\x9b\x6e\x81\x73\x92\xd8\x89\
-\x79\xf5\xa8\xff\x00\x6b\x2d\x1e\xdd\x7f\x67\x7f\x18\x48\x24\x56\
-\x97\xfb\x2e\x74\x55\xc7\xf7\x97\x19\xad\x1f\x07\xaa\x69\xde\x10\
-\xd2\x5a\xe1\x9a\x59\x16\xc2\x00\x14\x1f\x95\x3f\x76\xb5\xec\x63\
-\x25\x17\x94\xc1\xbd\xbd\xa4\xbc\xbe\xcc\x48\xa3\x27\xed\xda\x5d\
-\x97\xe6\xce\xaa\xd1\x2d\x8d\xbe\xd6\xde\xb1\xc7\xdc\x36\xdc\xff\
-\x00\x5a\xa1\xa9\x78\x91\x2d\x53\xcb\xb3\x8f\xc9\x5e\x72\x53\xe5\
-\xdd\xf9\x73\x59\xf2\x5f\x49\x7c\x7e\x63\xb5\x5b\x9c\x0e\xf4\xcb\
-\xd4\xdb\x6e\x79\x01\xbb\x7b\xd7\xc7\x5d\x27\x64\xac\x7a\x71\xa7\
-\xd6\x45\x78\xb5\xdb\x84\x9b\x21\x9b\x0d\xc9\x23\xa9\xfc\x7a\x9f\
-\xc6\x9f\x35\xfa\xea\x9b\x4c\x83\x2f\x1f\x21\xbf\x88\xd6\x62\xce\
-\xc4\xed\xe9\x8e\x95\x72\x38\x36\xec\x75\xf4\x24\xfe\x55\xd4\xd2\
-\xbd\xcb\x92\x49\x1b\xfa\x6e\x9c\xd2\xda\x03\xb9\x92\x48\xd7\xcc\
-\x55\x63\xf3\x60\x77\x06\xb1\x75\x68\xda\xf2\xeb\xce\xdd\xe6\x3b\
-\xf7\xc6\x08\xad\x0f\xed\x19\x21\x58\x43\x6e\x55\xc0\xc1\xfc\x2a\
-\xad\xda\x4b\xf6\x91\xf6\x79\x06\xe6\xfb\xf8\xed\x5a\xc6\x0d\xab\
-\xed\xe8\x73\x73\x59\xdc\xa2\xf2\x08\xad\x4e\xe3\xc9\xe3\x61\xfe\
-\x75\x2e\x8d\x0b\x6a\x37\x5b\x7e\x55\x58\xd0\x86\xdb\xfc\x59\x1c\
-\x54\x17\x10\xbe\xe6\x69\x77\x7c\xa7\x18\xef\x9a\xb1\xa5\xea\x11\
-\xe9\xfa\x65\xc1\x50\x7c\xe9\x0f\xca\x33\xd0\x57\x2c\xae\x97\xbb\
-\xb9\xbc\xb5\x21\x8a\x59\x10\x60\xf2\xd6\x6d\x82\x7d\x41\xe2\xa6\
-\x8c\x85\xb3\x91\xce\xed\xdb\xf2\x3d\xa9\xb6\x6f\xe5\xd9\x49\x3c\
-\x8c\xcd\x24\xc0\xaf\x5e\xde\xf4\x69\xa7\xcd\xb2\x68\x9b\xe6\xdc\
-\xd9\x04\x77\xad\xb6\x8b\x30\x7b\x8f\x4d\xb1\xdc\x37\xde\x0a\x70\
-\xc4\x0e\xf5\x13\xb2\x82\x7c\xbf\x5c\xf3\xd6\xa7\x59\x76\xca\xac\
-\xc0\xe5\x46\xd6\x18\xfd\x6a\x36\x71\x0b\xbb\x3a\xfc\xc3\x25\x4e\
-\xde\xd5\xa5\x2d\x5e\x84\xb2\x8e\xa0\xea\x5d\xa4\xc3\x7c\xa3\x04\
-\x7a\x57\x35\xe3\x89\xbc\x49\xa0\xe8\x4b\x7b\xe1\x5b\x7d\x37\x53\
-\xba\x5c\xbc\x96\x77\x65\x91\xa7\x1d\x71\x1b\xab\x0c\x30\xe8\x01\
-\x07\x3e\xdd\xf7\x24\xb9\x5f\xb5\xee\xea\xb2\x71\xcf\x6a\x92\xce\
-\x16\x0e\xdb\x5f\xe6\x5c\x90\x0d\x7e\x93\x92\xd4\x58\x3a\x2e\xac\
-\xa1\x1a\x89\xa4\xf9\x64\xbd\xd6\x93\xd6\x2f\x54\xf4\xf2\xb3\x47\
-\x93\x5e\x3c\xf2\xb5\xed\xe7\xfa\x9f\x3c\xff\x00\xc3\x7a\xea\x1a\
-\x6d\xd4\xf1\xea\x9e\x0d\x8a\x39\xa1\xc8\x9a\x38\xef\x1a\x36\x8d\
-\xbd\x0a\xb2\x12\x0f\xd6\xbe\x82\xf0\x0f\x8b\x21\xf1\xaf\x86\x6c\
-\x75\x5b\x76\xb7\xff\x00\x4e\x89\x64\x78\xe1\xb8\x59\x84\x2c\x46\
-\x4a\x16\x1c\x64\x77\xaf\x3d\xf8\xbb\xf0\x6f\xc2\x7e\x2e\x71\xe2\
-\x0f\x10\x79\x3a\x7b\x69\xb2\xac\x93\xdd\x16\xda\x26\x8c\x1e\x63\
-\x93\x9f\x98\x1e\x9d\xdb\xd3\xd2\xbc\xbf\xe1\x47\xc3\xf9\xbc\x7b\
-\xf1\x5b\xfb\x63\xe1\xfc\x7a\x97\x84\x7c\x27\x6b\x28\xf3\xae\xa4\
-\x99\xca\xde\x95\x39\x65\x8e\x36\x24\x30\x6c\x63\x0c\x48\x00\xf6\
-\xe9\x5f\xd4\x38\x5c\x0e\x47\x98\xe5\x30\xad\x81\xa5\xf5\x67\x08\
-\xde\x4d\xdd\xc1\x3b\x7c\x29\xb7\x77\x7d\xd5\x93\x7d\xcf\x94\x94\
-\xf1\x14\xaa\xb8\xcd\xf3\xdd\xe9\xdf\xd4\xfa\xda\xdd\xb2\x1f\x9d\
-\xdc\x70\x73\x56\x34\xd9\x56\x02\x3c\xc5\xdc\xa3\xbf\xa0\xac\x1b\
-\x59\xdb\x7b\x1f\x98\xed\xef\xe9\x57\xa2\xba\x71\x1c\x7f\x33\x13\
-\x9f\xd2\xbe\x36\x9d\x46\x77\x38\x9d\x24\x3a\xb8\x4d\xcb\x19\xfb\
-\xb5\xf7\x4f\xfc\x10\xea\xf0\xdd\xfc\x52\xf1\xf6\xe3\xf7\x74\x8b\
-\x3f\xfd\x1d\x2d\x7c\x01\x6d\x75\xe6\xc8\xc3\xbf\xa1\xaf\xbc\xff\
-\x00\xe0\x84\xd7\x6b\x75\xf1\x5b\xe2\x12\x8e\xda\x3d\x9f\xfe\x8f\
-\x96\xbd\x5c\x0c\xef\x5a\x3f\xd7\x43\x8b\x11\x1f\x70\xfd\x2f\x1d\
-\x28\xa0\x74\xa2\xbe\x8c\xf3\x42\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\xbe\x4f\xff\x00\x82\xe9\x2e\x3f\xe0\x8f\xff\x00\xb4\x47\xfd\x89\
-\x57\xa3\xff\x00\x1d\x15\xf5\x85\x78\x5f\xfc\x14\xbf\xf6\x78\xd7\
-\xbf\x6b\x8f\xd8\x27\xe2\xcf\xc3\x2f\x0b\xcb\xa7\xc3\xe2\x0f\x1b\
-\x78\x6e\xe7\x4a\xd3\xe4\xbf\x95\xa2\xb6\x59\xa4\x18\x5f\x31\x94\
-\x31\x55\xf5\x21\x4f\xd0\xd0\x07\xe1\x1f\xfc\x12\xd7\xfe\x0b\xe9\
-\xfb\x41\x7e\xc6\xdf\xb0\x47\xc3\xbf\x86\xfe\x0b\xfd\x92\xfc\x4b\
-\xf1\x13\xc3\x3e\x1a\xb7\xbc\x4b\x2f\x11\xdb\xc5\xa9\x34\x3a\xa0\
-\x96\xfe\xe6\x76\x65\x31\x5a\xba\x61\x5e\x57\x8f\xe5\x66\xe6\x33\
-\xd0\xe4\x0f\xa0\x3f\xe2\x29\x1f\xda\xab\xfe\x8c\x5f\xc5\xdf\xf7\
-\xe3\x57\xff\x00\xe4\x2a\xfd\x2c\xff\x00\x82\x35\xfe\xcb\x5a\xef\
-\xec\x2d\xff\x00\x04\xed\xf8\x77\xf0\x6b\xc5\xda\x96\x83\x7d\xe3\
-\x0f\x01\x5b\xdd\xc5\xab\x2e\x93\x76\x6e\x21\x88\xdc\xdf\xdd\x5d\
-\x45\xc9\x0a\xc3\x31\xca\xbf\x79\x46\x48\x38\xf5\xaf\xa5\xa6\xd7\
-\x2d\x6d\xf5\x48\x2c\xa4\xba\xb7\x5b\xcb\xa5\x79\x20\x81\xa6\x02\
-\x59\x95\x31\xb8\xaa\x67\x2c\x17\x72\xe4\x81\xc6\x46\x7a\xd0\x07\
-\x88\xff\x00\xc1\x34\xbf\x6a\xef\x16\xfe\xda\xbf\xb1\xdf\x84\xfe\
-\x23\x78\xe3\xc0\x77\x9f\x0d\x7c\x4b\xaf\x3d\xda\xdd\xf8\x7a\xe5\
-\x66\x59\x2c\x84\x37\x32\xc4\x84\x89\x92\x39\x3e\x75\x45\x7e\x54\
-\x7d\xee\x32\x39\xaf\x7c\xa8\xe2\x19\x2a\xdf\x36\xee\xf5\x25\x00\
-\x14\xd6\xf9\x87\xd6\x9d\x45\x00\x7c\xc7\xf1\x73\xf6\x59\x9b\xc4\
-\x7f\xb6\xbc\x3e\x22\xd0\x7c\x3f\x67\xa3\xda\xf8\x9b\xe1\xc7\x89\
-\xf4\x5d\x73\xc4\x56\x96\xd1\xc5\x2b\xdf\xdc\xcd\xa3\xc7\x69\xe7\
-\xba\xe1\xe4\x71\x0d\xbc\xbb\x09\xc8\x55\x88\x81\x8c\x8a\xe1\xff\
-\x00\x60\x3f\x86\xbe\x3a\x6f\x8b\x5e\x03\xd4\x3c\x4b\xf0\xef\x5b\
-\xf8\x7b\x67\xf0\xa7\xe1\x45\xbf\xc3\xbb\xdf\xed\x17\xb6\x31\xeb\
-\x1a\x90\x9e\xcd\xdd\xac\xfc\x89\x64\xf3\x2c\xe2\x5b\x32\x52\x67\
-\x09\xbb\xed\x20\x05\x04\x38\x1f\x6a\x62\x8a\x51\x56\xdb\xfa\xd5\
-\xbf\xd4\x4d\x5f\xfa\xf4\xff\x00\x23\xf3\x97\xc1\x9f\xf0\x4f\x1d\
-\x7b\xc4\xff\x00\x15\xfc\x23\x7d\xe2\x8d\x1b\xc7\x92\x58\xf8\x83\
-\xc4\xdf\x10\x65\xf1\x88\x93\xc5\x37\xb1\xc3\x77\x61\x2e\xa5\x73\
-\x36\x87\x1c\xc8\x97\x00\x08\x42\xb4\x6f\x0a\x26\x36\x1c\x67\x1c\
-\x83\xc6\xcb\xfb\x13\x7c\x63\xf1\xf7\xec\xf5\x79\xaa\x78\x83\x4f\
-\xf8\x95\xff\x00\x0b\x27\x45\xf0\x3f\x80\x6c\xb4\x29\xa3\xf1\x3d\
-\xc4\x17\x16\xba\x84\x17\x73\x2e\xad\x24\x7b\x2e\x02\x1b\x91\x6c\
-\xc0\x4b\x2b\xe5\x99\x4e\x32\x79\xcf\xea\x65\x18\xa6\xb4\x56\xf2\
-\xb7\xfc\x1f\x52\xf9\xb5\xbf\x9d\xff\x00\xaf\x23\xe1\xaf\x86\x1f\
-\xb2\x6f\x8c\xbc\x33\xf1\xe7\xc5\x5e\x13\xb4\xd1\xbc\x47\xa7\xfc\
-\x2b\xf0\xef\x8e\xaf\xbc\x65\xe1\xb7\x9f\x55\x6b\x85\x73\xff\x00\
-\x08\xd6\x9d\x6b\x6f\x6f\x6d\x2c\xf2\x48\xf1\xa1\xd4\xae\xb5\x2b\
-\x90\x1d\x4a\xa4\xd6\xa1\xb0\x01\xf9\x8f\xf8\x23\xff\x00\xc3\x0f\
-\x88\xdf\x07\xaf\xfc\x67\xa3\xf8\xb3\xc2\x3e\x22\xd2\x7c\x3f\x1d\
-\x8e\x9a\xb0\x6b\x7e\x26\x59\x2d\x75\xad\x5b\x51\x43\x72\x97\x0b\
-\x71\x10\xd4\x6f\x6d\xae\x1d\x50\xc4\xcf\x7d\x6e\x2d\x52\x77\x90\
-\x62\x26\x0b\xf2\x7d\xcb\x8a\x6c\x8b\xb9\x0d\x1d\x6e\x4b\xd4\x03\
-\x00\x7a\xd6\x4f\x8e\xc8\xff\x00\x84\x2f\x59\xff\x00\xaf\x19\xbf\
-\xf4\x06\xaf\x2d\xf8\x99\xf0\x13\xe2\x8f\x8b\x7c\x75\xa8\x6a\x5a\
-\x07\xc7\x6f\x10\x78\x4b\x47\xba\x64\x6b\x6d\x22\x0f\x0b\x69\x17\
-\x91\xd9\x00\x8a\xa4\x2c\xb3\x42\xd2\x36\x58\x16\xf9\x89\x23\x76\
-\x3a\x00\x2b\x93\xf1\x5f\xec\xcf\xf1\x9a\xdf\xc2\xba\x9c\x92\x7e\
-\xd2\xde\x26\x74\x4b\x49\x59\x94\xf8\x2b\x42\xf9\x80\x53\x91\xfe\
-\xa0\x75\xe7\xf3\xa0\x0f\x10\x89\x9a\x34\x8d\x43\x72\x47\x38\xef\
-\xc5\x2c\xd3\x8f\x3f\x1b\x81\x55\x18\x03\x3c\x57\x96\xa7\xc1\x0f\
-\x89\x4d\x06\x7f\xe1\x7a\x6b\xea\xcc\x3a\x0f\x07\x68\xc3\xff\x00\
-\x69\xd2\x5b\xfc\x03\xf8\x95\x2f\xfc\xd7\x6d\x7d\x7d\x7f\xe2\x8f\
-\xd1\xff\x00\xf8\xd5\x64\xe2\xde\xc6\x9b\x1e\xa6\xb1\x04\x4f\xbb\
-\xcb\x74\xcd\x48\x8d\x1c\x71\x32\xe0\x70\x32\x0d\x79\x4d\xf7\xc0\
-\xcf\x89\x31\x46\xc4\x7c\x7a\xf1\x03\x2f\x4c\x7f\xc2\x1f\xa3\x7f\
-\xf1\xba\xab\x6f\xf0\x47\xe2\x64\xa9\xc7\xc7\x7d\x79\x7a\xf0\x7c\
-\x1f\xa3\xff\x00\xf1\xba\x89\xfb\xae\xc5\x6e\x7a\xe9\x08\x62\x19\
-\xfe\x21\xd8\x75\x15\xf3\xd7\xc7\x7d\x1f\xfb\x3f\xc5\xb2\x30\xc6\
-\xd9\x39\x15\xd7\x43\xf0\x33\xe2\x79\x1b\x9b\xe3\xb6\xbd\xf2\x82\
-\x38\xf0\x7e\x8f\xff\x00\xc6\xeb\x99\xbc\xfd\x9b\x7c\x71\x6f\xaa\
-\xdd\xde\xeb\x9e\x3f\xd4\x3c\x61\x0b\x47\xb6\x18\x67\xd1\x2c\xac\
-\x44\x67\x39\xdc\x0d\xba\xa9\x3e\x98\x3c\x73\xeb\x5f\x13\xc7\x38\
-\x1a\x98\x9c\xb9\xfb\x28\xde\x49\xde\xdf\xe4\x77\x65\xf5\x14\x2a\
-\x6a\x7c\xdb\xe3\x18\xaf\xfc\x2b\xe2\xd8\xaf\xa0\x32\x4d\x6f\x29\
-\xc4\x88\x0e\x42\x8c\xf3\x5d\xf6\x89\xab\xc7\xac\x68\xeb\x34\x67\
-\xa0\xf9\x81\xe3\x9a\xd4\xf1\x57\x85\xa4\xd3\xe5\x68\x6e\x2d\xf6\
-\xc8\xa3\xf8\xd7\x19\xc5\x72\x7e\x15\xb6\xb8\xb5\xd4\x2f\xd6\x48\
-\x8c\x70\xe3\xe5\x1d\x8d\x7e\x0b\x8c\xb5\x5a\x16\x9a\xb4\xa0\x8f\
-\xa8\xa7\x2d\x6e\x9e\x87\x41\xd5\x3e\xef\x0d\xe8\x6a\x1b\x84\xdd\
-\x10\x41\x8f\xde\x10\x99\xcf\xaf\xf8\x54\x88\x77\x2f\xf7\x57\xd0\
-\xf6\xa8\xdc\x79\x92\xaf\x6c\x0d\xdf\xe7\xf5\xaf\x12\x9a\xbb\x36\
-\x93\x09\xce\xd3\x13\x7f\x0b\x0e\x2a\x40\x32\xd4\xcb\xbf\x95\x21\
-\xf6\x38\xfa\x53\xd4\x92\xc7\x39\x03\x3c\x7b\xd7\x24\x97\xbe\xcd\
-\x16\xc4\x13\xc3\xc6\x7d\x2a\xb5\xea\xee\x6b\x72\x5b\x1b\x41\x1f\
-\x5e\x6a\xf4\xc8\x4a\x64\x74\xc7\x7a\xab\x7e\x99\x48\x0a\xe0\xf5\
-\x1c\xfb\xd1\x55\xae\x41\xc7\x72\x39\x53\xcc\x8a\xb3\xee\x63\xc6\
-\xef\xc8\x56\xa6\xdc\x9d\xbd\xaa\x9d\xe2\x15\x3d\x05\x6b\x10\xb9\
-\x95\xaa\x2b\x2e\x94\xdd\x94\x4a\xa4\xaf\xad\x36\x78\x56\x58\xd5\
-\xb2\x41\xf6\xa9\xf5\x65\xff\x00\x89\x54\xd9\xf5\x5f\xce\x99\x1c\
-\x7b\xad\x53\xd5\x45\x44\xa3\xfb\xcd\x3b\x17\xf6\x4a\x52\x8e\x00\
-\x6f\xbd\x9e\x58\x7f\x5a\x62\x4f\x25\x9a\xb6\xd6\xf3\x23\x3f\x78\
-\x1e\x82\xad\x30\x0c\xbb\x5b\x6a\xe2\xa0\x96\x2f\x29\x78\xf9\x87\
-\x5c\x76\x35\xa2\x4a\xd6\x66\x77\xea\x79\xef\xed\x27\x0d\xbb\xfc\
-\x0f\xf1\x22\xab\xc9\xe6\x4d\x62\xea\xb1\x9e\x55\x73\x8f\xc6\xa6\
-\xf0\xf4\x6c\x74\x8b\x15\x6c\xfc\xb6\xf1\x2e\x3d\x70\xaa\x29\x7f\
-\x68\x1b\x74\xbc\xf8\x6f\xaa\xaa\xfd\xe9\x2d\x8a\xed\xfa\x95\xff\
-\x00\x0a\x7e\x94\xac\x6c\xad\xc7\x45\xf2\xd4\x1f\xae\x05\x75\x63\
-\xa2\xa3\x95\x53\x4b\xfe\x7e\x4b\xff\x00\x49\x89\xa6\x1f\xf8\xd2\
-\xf4\x5f\x9b\x35\x2d\x9c\x2c\x78\xe3\x9e\xf4\xdb\xdc\x47\x19\x66\
-\xeb\xfc\xa8\x86\x5d\x9f\x2a\x85\xff\x00\x78\xf5\xaa\xfa\x83\xef\
-\x89\xb2\xdd\x7b\xfa\xd7\xc7\x72\xde\x67\xa5\x1d\x6c\x51\x49\xb7\
-\xca\x41\x5c\x60\xd6\x84\x89\xb4\x6e\x4c\x6d\x5e\x4f\x3d\x73\xfe\
-\x45\x67\x46\xbf\x37\xbf\x4c\x62\xae\x96\xda\xb1\xf5\xe7\xb5\x75\
-\x5b\x5b\x0e\x7b\x17\x17\xfd\x2e\x65\xdc\xd9\xf9\x79\xc1\xe0\xe2\
-\xaa\x4f\x26\x35\x06\xff\x00\x77\x3c\x7e\x15\x66\x1c\x48\xc9\x8f\
-\x95\x58\x1c\x8a\xaa\x89\xff\x00\x13\x36\xfd\xe6\x57\x1f\xfd\x7a\
-\xe9\xa7\x14\xb5\x39\x24\x43\xa8\xcc\xd7\xac\xd2\xe7\x68\x4e\x38\
-\x1d\x69\x62\x02\x0d\x4e\x1f\x95\x7e\xef\xe1\xd0\x53\x25\x8f\x6c\
-\x6d\xb4\xfc\xbd\x00\x3c\x66\xa4\xb5\x85\xa6\xd4\x94\xff\x00\x0c\
-\x7e\xbd\x85\x61\x5b\xe2\x66\xd0\x5e\xea\x22\xbd\x6f\x33\x50\x95\
-\x33\x88\xfa\x81\xea\x6a\x7b\x35\x61\x6e\xab\xbb\x69\xcf\x04\x53\
-\xae\xa3\xdf\xa8\x31\xdc\xad\xb5\x72\x71\x44\x72\x6e\x2a\x07\xa6\
-\x73\xd8\x1a\x6b\x58\x10\xf7\x1d\x79\x72\xc8\xc6\x4d\xa3\x2d\xc1\
-\x06\xab\xdc\xdd\x33\xda\x48\x59\xbe\x6c\x74\xc7\x4a\xb5\x71\x73\
-\x6f\x71\xa3\xc2\xaa\xb8\xb8\x43\x96\x63\xde\xa8\xdd\x41\x88\x43\
-\x6e\x04\x36\x0e\x3d\x6b\xb3\x0f\x4d\x46\x71\xbb\x33\x95\xda\x66\
-\x6a\xa1\x9e\xca\x36\x55\x39\xcf\x4c\x72\x2b\x17\xe2\x3f\xc5\x4d\
-\x1f\xe1\x3f\x87\xbf\xb4\x75\x6b\x83\x1b\x32\x98\xe0\x82\x3e\x66\
-\xbb\x7e\xca\x8b\xf5\xc0\x2c\x78\x19\xe6\xb0\xfe\x2d\xfc\x79\xb6\
-\xf8\x75\x75\x1e\x8b\xa4\x5a\xbe\xbd\xe2\x8b\xff\x00\x96\xdb\x4e\
-\x87\xe6\xd8\x48\xe1\xa4\xc7\x4e\x84\xe3\xa9\x1d\xc0\xc9\xac\x9f\
-\x86\x7f\x02\x2e\x27\xd7\x17\xc5\x7e\x37\xb8\x5d\x63\xc4\xb2\x90\
-\xf0\xc0\xf8\x7b\x7d\x34\x70\x42\xa8\xe8\x58\x7e\x43\xb6\x4f\x35\
-\xfb\xbe\x4d\xc3\x98\x4a\x78\x4a\x78\x9c\xe1\xb8\x52\x9b\x52\x84\
-\x17\xf1\x2a\x3e\xb6\x5f\x66\x1d\xe6\xf4\xb6\xd7\x67\xcf\x62\x31\
-\x53\x73\x70\xa3\xab\x5a\x37\xd1\x7f\xc1\xf2\x30\xf4\x3f\x87\xba\
-\xf7\xed\x15\xa9\xdb\xeb\x7e\x36\x59\xb4\xdf\x0d\x46\xc1\xf4\xed\
-\x12\x27\x2a\xd2\x8e\xcf\x29\xea\x3b\xf2\x70\xc7\xb0\x51\xd7\xda\
-\x34\xfb\x68\x74\xa8\x63\xb7\xb7\x89\x2d\xed\x61\x8c\x24\x71\x46\
-\x81\x56\x25\x1d\x00\x03\x80\x2a\xe7\x90\xd2\xaa\x36\xe5\xf9\x8e\
-\x48\x34\xe9\xac\x1b\xed\x03\x8c\xa8\x5e\x31\xde\xbe\xdf\x30\xce\
-\x2a\xe3\x39\x60\x92\x85\x38\xe9\x18\x2f\x86\x2b\xf5\x7d\xdb\xd5\
-\x9e\x75\x3a\x2a\x0e\xef\x56\xf7\x61\x6b\xfb\xb8\xa4\xda\xdf\x29\
-\xe4\x7d\x6b\x42\xc2\xe5\x84\xc3\xee\xb6\x45\x57\x10\x6d\xb6\x6c\
-\xc6\x40\x63\xd6\x9d\x1a\xac\x01\x76\xee\x56\xf5\xae\x7e\x6b\x2d\
-\x0a\x7a\xec\x69\x45\x70\xaa\xb2\x16\x1f\x39\x3d\x7d\xab\xee\xef\
-\xf8\x20\xc4\xcb\x27\xc6\x0f\x88\x9b\x7f\x87\x45\xb3\xff\x00\xd2\
-\x89\xab\xf3\xfd\x2e\x32\x92\x65\x86\xe5\x38\xfa\x8a\xfb\xef\xfe\
-\x08\x20\xbe\x5f\xc5\xff\x00\x88\xc3\xfe\xa0\x96\x3d\x3f\xeb\xbc\
-\xd5\xea\x65\x95\x1b\xaf\x15\xeb\xf9\x1c\xb8\xa5\x6a\x6c\xfd\x3f\
-\x1d\x28\xa0\x74\xa2\xbe\xb0\xf2\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\xbe\x77\xff\x00\x82\xae\x7e\xd5\xda\x97\xec\x3f\xff\x00\x04\
-\xee\xf8\xb7\xf1\x4b\x46\x58\x4e\xb9\xe1\x3d\x05\xdf\x4c\x32\xa6\
-\xf4\x8e\xf2\x69\x12\xde\xdd\xd9\x7f\x88\x2c\xb2\xa3\x10\x78\x38\
-\xc1\xe2\xbe\x88\xaf\x2d\xfd\xb5\x3f\x66\x1d\x2f\xf6\xcf\xfd\x94\
-\xbe\x20\x7c\x2b\xd6\xae\x25\xb3\xd3\xfc\x75\xa2\x5c\x69\x6d\x73\
-\x1f\x2d\x69\x23\x8c\xc5\x30\x1d\xca\x48\x11\xf1\xdf\x6e\x28\x03\
-\xe1\x1f\xf8\x36\x07\xf6\x2a\xf1\x47\xc2\x2f\xd9\x53\x5a\xf8\xf1\
-\xe3\x8f\x1e\xeb\x9e\x30\xf1\xb7\xed\x33\x1d\x97\x89\x35\x38\xaf\
-\xa4\xf3\x96\xd6\x38\x5a\xeb\xec\xd2\x19\x5b\x2e\xf3\x49\x1c\xe5\
-\x9c\x92\x14\x0d\x8a\x07\xc9\x93\x93\xff\x00\x07\x30\x7f\xc1\x3a\
-\x3c\x65\xf1\x93\xe1\x4d\xa7\xed\x29\xf0\xef\xe2\x77\x88\x3c\x1f\
-\xe3\x6f\xd9\xe7\x48\x97\x52\xb2\xd3\xa0\x9c\xdb\xdb\x3d\xba\x39\
-\x9a\xe6\x68\x65\x8f\x12\x47\x75\xb4\x26\x09\x25\x1c\x42\x10\x85\
-\xce\xe1\xf2\xf7\xec\xdd\xff\x00\x05\x74\xfd\xa1\x3f\xe0\xdf\xdf\
-\x85\x70\xfc\x03\xfd\xa2\xbe\x00\xf8\x93\xc6\x3e\x1b\xf0\x21\x96\
-\xdb\xc3\x1e\x2e\xd1\x6e\x0c\x76\xb7\x5a\x78\x76\x75\x02\x73\x1b\
-\xc3\x34\x6a\x1b\xe5\x3b\x92\x48\xd7\x08\xea\x19\x4e\x1b\xfb\x46\
-\x7f\xc1\x6e\x7e\x3e\xff\x00\xc1\x73\xfe\x11\xea\x5f\x01\xff\x00\
-\x66\x8f\xd9\xdf\xc4\x9a\x0d\xaf\xc4\x08\x3e\xc3\xaf\x78\x9f\x56\
-\xbb\xf3\xad\xec\xf4\xf7\x3b\x66\x1e\x77\x96\x90\x42\x8c\x30\x1a\
-\x46\x76\x62\xbb\x95\x10\xbb\x29\x00\x1f\xac\x5f\xf0\x48\x3f\xdb\
-\x17\x52\xfd\xbd\x7f\xe0\x9d\x1f\x0a\xbe\x29\x6b\xbf\x67\x3e\x23\
-\xf1\x16\x94\x62\xd6\x5a\xde\x2f\x2a\x29\x2f\x6d\xe5\x7b\x79\xdd\
-\x53\xa2\x87\x78\xcb\xe0\x70\x37\xe0\x70\x2b\xe9\x7a\xf1\x8f\xf8\
-\x27\xe7\xec\x8d\xa6\xfe\xc1\xff\x00\xb1\xd7\xc3\xbf\x84\x7a\x65\
-\xe7\xf6\x94\x5e\x09\xd2\x12\xce\x7b\xdd\x9b\x3e\xdb\x72\xc5\xa4\
-\x9e\x60\xbf\xc2\x1e\x67\x91\x80\x39\x20\x10\x33\xc5\x7b\x3d\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x00\x62\xb1\xfc\x78\x33\xe0\xdd\x63\xfe\xbc\x26\xff\x00\xd0\x0d\
-\x6c\x56\x47\x8f\x7f\xe4\x49\xd6\x3f\xeb\xc6\x7f\xfd\x00\xd0\x07\
-\xc2\x51\xca\xd3\xbb\x6d\x65\xc2\x0e\x3d\xaa\xda\xb4\x91\x40\x1b\
-\x2b\x86\xe2\xa9\x59\xdb\xc7\x31\x45\xda\xcb\xc6\x7e\xbf\x5a\xbf\
-\x0d\xbc\x6c\x57\x73\x32\xaa\xf1\x58\x46\xe6\x9d\x06\x34\xca\xce\
-\x11\x95\x58\x75\x20\x8e\xb4\xad\x6e\x8d\xce\xdd\x9c\x70\x7d\x7d\
-\xaa\xb5\xca\x2d\x9c\xdb\x56\x4d\xdb\xb9\xeb\xd3\xe9\x42\x4c\xc6\
-\x7d\xbe\x66\x55\x46\x40\x22\xb3\x95\x4b\x6e\x69\x18\x96\x45\xb6\
-\xe7\x55\x0d\xb7\x6e\x49\xc0\xa7\xa0\xdd\xc6\xe0\x7b\x73\x51\x94\
-\x92\x00\x1b\x8d\xcc\x3d\x73\x8a\x6a\xcc\x08\xda\x63\x6c\x31\xe7\
-\x1d\x45\x73\xd4\xb3\x5a\x95\x1d\x35\x39\x1f\x89\xdf\x08\x2d\xfc\
-\x55\x6c\xcc\xaa\x8b\x71\x8c\x82\x07\x5a\xf9\xef\xc5\x1e\x07\xba\
-\xf0\xbd\xf5\xc4\x37\x11\xe3\x6f\x46\x03\x83\x5f\x5c\x33\xc3\x2c\
-\x9f\xc6\xbb\x7b\xfa\x57\x1b\xf1\x2f\xe1\xd4\x5e\x31\xd2\x64\x48\
-\xce\x27\x6c\xe0\x8a\xfc\xe3\x8a\xb8\x3e\x96\x2e\x9c\xab\x61\xd7\
-\x2c\xed\xd3\xa9\xea\x61\x71\x6e\x9b\x4a\x5b\x1f\x2c\x84\x3b\x47\
-\xf7\xba\x56\x40\xf1\x7d\xac\x1a\xa3\xdb\xdc\x4b\xe4\xcd\x85\x00\
-\x31\xc1\xe7\xa5\x7a\x1f\x8b\x7e\x18\x5e\x78\x3a\xe9\xa3\x75\xf3\
-\x17\xae\x47\x6a\xf1\x7f\x8b\xfe\x09\xfe\xd1\x86\x1d\x52\x12\xc2\
-\x6b\x56\x2c\xfb\x47\x51\x9a\xfc\x5f\x0f\x83\xe4\xae\xf0\xf8\x9b\
-\xc5\xad\x35\xee\x7b\xce\xa2\x97\xbd\x03\xba\xba\x22\x6b\x44\x6c\
-\xfd\xd6\xfc\xea\x40\xc0\x91\xf5\xc8\xae\x5f\xe1\xaf\x88\x24\xf1\
-\x17\x84\x96\x49\x56\x40\xb1\xc9\xb4\x16\x1c\x91\xeb\x5d\x40\x1f\
-\x28\xeb\x8f\x5a\xf3\x71\x34\x5d\x1a\xf2\x84\xba\x1b\xa9\x68\x81\
-\x8e\x63\xfa\x77\xf4\xaa\x7a\x87\x11\x44\x7b\x87\xc9\xab\x8c\x54\
-\x26\x33\xf7\x8e\x79\xaa\xfa\x9c\x7f\xe8\x6a\x57\xfb\xc3\x39\xae\
-\x7a\x9f\x0b\x2e\x3b\x8d\x11\x06\x6c\x7e\x3f\x5a\x82\xea\x1d\xc7\
-\xd7\x3e\x9d\xaa\xc8\xf9\x1b\xd6\x9b\x36\x18\x37\xb7\x7a\xba\x7b\
-\x21\x33\x0f\x56\x1f\xf1\x2e\x9b\xfd\xac\x1f\xd6\xa1\xb3\x1b\xed\
-\x93\x1c\xe4\x62\xaf\x6a\xb1\x2f\xd8\x26\x3d\x7a\x55\x5b\x35\xc5\
-\xbc\x6d\xed\x53\x2f\xe2\x5f\xcb\xf5\x2d\x7c\x05\x7b\xb8\x9b\x3e\
-\xb8\xee\x3a\x55\x7f\x33\x6a\xb6\xef\x98\x7a\x56\x85\xca\x6e\x5e\
-\x0f\x5e\x3f\x4a\xce\xb9\x8f\x68\x6c\x7e\x35\xd4\xa3\x74\x42\x38\
-\xcf\x8b\xf6\xbf\x68\xf0\xad\xd0\x1d\x1d\x02\x6d\xee\xdf\x30\x3f\
-\xe7\xe9\x55\xec\xa5\xdb\x14\x61\x78\x55\x45\x18\xf4\xe2\xb1\x7f\
-\x69\xdf\x89\x36\xbf\x0a\xfc\x07\x26\xa7\x73\x6f\x2d\xd3\x4b\x22\
-\x5b\xc3\x0a\xfc\xbb\xe4\x39\x20\x6e\xec\x30\xa4\x93\xc9\xe3\xde\
-\xb9\xff\x00\x80\x9f\x1b\x2d\xfe\x35\xe8\x57\x57\x31\x59\xc9\xa7\
-\xdd\x58\x4a\x22\x9e\x16\x7f\x31\x46\x46\x54\xab\x60\x67\x23\xd4\
-\x0c\x10\x7e\xb5\xf4\xb8\xde\x1b\xcc\x2a\x70\xca\xcd\xa1\x49\xfb\
-\x08\x54\x92\x72\xe8\x9b\x51\x4b\xce\xd7\xd2\xfb\x5c\x8a\x18\xaa\
-\x4b\x15\xec\x5b\xf7\x9a\x5a\x7c\xd9\xe9\x11\x7d\xd1\xc7\xeb\x51\
-\x5f\x7c\xd1\xb6\x6a\x4b\x76\xc4\x5c\x9a\x82\xf2\x5d\xea\xdc\xfb\
-\x73\x5f\x98\xbf\x88\xf7\x22\x42\x83\xe5\x5d\xdd\x78\xfc\x6a\xc4\
-\xe4\x3b\x29\xfe\xef\x5a\xaf\x6e\x76\xa2\x9f\xa5\x58\x90\x2a\x3e\
-\x0d\x74\x75\xd0\x99\x58\xb0\x8c\x41\xca\xa9\xdc\x8b\xd7\xd0\x55\
-\x78\xca\xb4\x92\x37\xca\x3f\xd9\xf4\xf7\xa9\xd6\x7f\x22\x45\x50\
-\xbb\x8b\x29\x27\xe9\x55\x12\x4e\x2e\x1b\x6f\x52\x31\xed\x5d\xd4\
-\x7c\xfc\x8e\x39\xb6\x49\x23\x62\xd8\x63\xe6\x62\xdd\xfb\xd5\xc2\
-\xb1\xe9\xb6\xfb\x99\xbf\x79\x26\x09\xe7\xf4\xaa\x44\x2c\x6f\x10\
-\x04\x9e\xed\xf5\xc5\x24\x63\xed\x37\x6c\xcd\xf7\x57\x23\xe9\x9a\
-\xf3\x6a\x2e\x69\xbf\x53\xa3\x9a\xc8\x6c\x97\x0d\x73\x24\x92\x60\
-\x2a\xe7\x1c\x76\xab\xd6\xb6\x8b\x71\x69\xe6\x6d\x3b\xa1\x6c\x38\
-\x03\xb7\xad\x50\x86\x33\x2c\x91\x47\x17\xcc\x59\x88\x5f\x7e\x6b\
-\x4f\xc5\xfe\x2d\xd3\x7c\x13\xa5\x4d\x7d\x7d\x34\x7a\x75\xac\x71\
-\x62\xe9\xa6\x3b\x42\x11\xdf\x9e\x49\x3d\x80\xeb\x5e\xe6\x57\x97\
-\x4b\x15\x2e\x48\x26\xde\xc9\x25\x76\xde\xc9\x58\xe3\xad\x55\x43\
-\x56\x41\xa8\xad\xac\xd7\xbf\xb9\xe2\x32\xa7\xaf\x1d\x3b\xfe\x15\
-\xe2\x7f\x11\x7e\x3f\x6a\x1e\x32\xd7\x66\xf0\x8f\xc3\x75\x5b\xcd\
-\x51\x41\xfb\x66\xb0\xc0\x1b\x5b\x04\xe8\x4a\x1e\x41\x6c\x9c\x6e\
-\xc1\x1d\x40\xcf\x5a\xcc\xbc\xf1\x1f\x88\xbf\x6b\x3d\x4a\x6d\x37\
-\x43\x69\xfc\x3b\xe0\x18\xa4\xd9\x75\xa8\xb4\x78\xb8\xd4\xc6\x79\
-\x54\x07\xb7\x19\xc0\xc0\xe4\x6e\x39\x18\xaf\x66\xf8\x79\xf0\xbb\
-\x43\xf8\x77\xe1\xb8\xf4\xbd\x22\xd3\xec\xf6\xb1\x90\xcd\xce\x5e\
-\x77\xfe\xfb\xb7\x52\xde\xff\x00\xfe\xaa\xfd\xa7\x25\xe1\x9c\xb7\
-\x25\xa9\xed\x73\x38\xc6\xae\x2b\x4b\x51\xde\x34\xdb\xd9\xd5\x6b\
-\x47\x2e\xaa\x0b\x6f\xb4\xfa\x1e\x1d\x6c\x55\x5a\xeb\x96\x93\x71\
-\x87\xf3\x75\x7e\x9e\x5e\x7f\x71\xc6\xfc\x18\xf8\x2d\xa4\xfc\x2a\
-\x86\x49\x04\x8d\xaa\x6b\xd7\x79\x6b\xbd\x4e\x7f\x9a\x59\x09\xea\
-\x17\x39\x2a\xa7\x9f\x73\xdc\xf6\x1d\xdc\x76\x3e\x79\x6d\xaa\x77\
-\x72\xd5\xa3\x3e\x8b\x66\x92\xf0\xdb\x64\xfa\xd2\x2d\xb4\x76\x0a\
-\x5d\x1f\x71\xcf\x02\xbd\x5a\xd5\x2a\x62\xb1\x0f\x17\x89\x7c\xd3\
-\x7b\xbf\x2e\x89\x76\x4b\xa2\x5a\x23\x08\xc6\x31\x8f\x2c\x34\x45\
-\x48\xac\x41\x2b\xb9\x5c\x77\xc7\x7a\x9a\x40\xa8\xdb\x54\xb7\x03\
-\xb8\xa9\xa5\xbf\x92\x1f\x29\x94\x06\xe7\x9f\x5a\x6a\x4d\x34\xe5\
-\xa4\x31\xae\x2b\x7f\xac\x42\x3a\x5f\xe4\x2b\x3d\xd9\x1c\x40\xcb\
-\x04\x9b\x9b\x0b\x9e\x28\x97\x22\x75\x51\xb5\x86\x30\x0d\x57\x99\
-\xe4\x91\x1b\xb2\xb7\x61\xde\xae\x23\x43\x08\x8f\x2a\xcb\xf2\xe7\
-\xfc\xfb\xd7\x4d\x1a\xdc\xfa\x34\x66\xe3\x6d\x8a\xe2\xc3\xcc\x13\
-\x63\xa8\x39\xaf\xbe\x7f\xe0\x81\x99\x6f\x8b\xbf\x11\xbb\x63\x45\
-\xb1\x1f\xf9\x31\x35\x7c\x1a\x67\x8c\x2c\xa3\x3f\x2b\x1c\xf3\xe9\
-\x5f\x78\xff\x00\xc1\x02\x1f\xfe\x2e\xc7\xc4\x6c\x67\xfe\x40\xd6\
-\x5d\x7f\xeb\xbc\xd5\xed\x65\x7f\xef\x31\xb7\x9f\xe4\x72\xe2\xef\
-\xec\x99\xfa\x84\x3a\x51\x40\xe9\x45\x7d\x91\xe2\x85\x14\x51\x40\
-\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x05\x14\x51\x40\x05\x35\xa5\x50\x3a\xf6\xcd\x3a\xbc\x87\xf6\xf4\
-\xfd\x9f\x75\x8f\xda\xb3\xf6\x3a\xf8\x95\xf0\xdf\xc3\xda\xe2\x78\
-\x67\x5c\xf1\xa6\x81\x73\xa5\x59\x6a\xae\x64\xd9\x65\x2c\x8b\x85\
-\x73\xe5\x90\xf8\xec\x76\xf3\x83\xd0\xf4\x20\x1e\x53\xfb\x6b\xff\
-\x00\xc1\x6c\x7f\x66\x3f\xd8\x36\xd2\xe6\xd7\xc7\x9f\x14\xbc\x3f\
-\x73\xae\x5b\xee\x57\xf0\xee\x89\x20\xd5\xf5\x62\xc0\x67\x63\xc1\
-\x09\x6f\x24\x9c\xf0\x67\x31\xa9\xf5\xaf\xcc\xff\x00\x18\xff\x00\
-\xc1\xd3\x9f\x1a\xbf\x6e\x8f\x8c\x16\xff\x00\x0a\x7f\x63\x4f\x81\
-\x29\x2f\x88\x75\x48\xde\x4b\x4b\xef\x12\xcb\x1d\xc5\xe3\x42\x80\
-\x97\x99\x6d\x95\xe3\xb7\x81\x57\xe5\x3b\xe5\x9a\x45\xc6\x41\x5c\
-\x91\x5f\x29\xfc\x3b\xff\x00\x82\x65\xfc\x52\xff\x00\x82\x22\x7c\
-\x51\xd4\x3c\x5d\xf1\xd3\xf6\x39\xf0\xcf\xed\x3f\xe0\xfb\x79\xc4\
-\xcb\xe2\x0d\x3f\x51\xba\xd4\xac\xf4\xd8\x93\x3b\xe4\xf2\x42\xb4\
-\x41\x58\xb0\x62\x6f\x6d\x32\x0a\x70\xca\x09\x27\xd3\xff\x00\x60\
-\xff\x00\xf8\x29\xf7\xc1\x2f\xda\x07\xfe\x0e\x4f\xd2\x3e\x32\x69\
-\xf7\x16\x3f\x09\xfe\x1c\xea\x5e\x07\x1a\x1d\xac\x1e\x24\x36\xba\
-\x4c\x1a\x7d\xd2\x69\xd1\xc1\xf6\x7c\xa3\x98\x15\x4c\x8a\x42\x1d\
-\xc0\x30\xc7\x0a\x4e\x28\x03\xf7\x17\xfe\x09\xa9\xe1\x1f\x8d\x7e\
-\x0c\xfd\x8f\x7c\x29\x67\xfb\x42\xeb\x16\xba\xe7\xc5\xa6\x7b\xbb\
-\x8d\x72\xe6\xd6\x48\xa4\x88\x79\x97\x32\xbc\x31\x03\x12\x2c\x7f\
-\x24\x4c\x8b\xf2\x0c\x0d\xb8\xc9\xeb\x5e\xf9\x55\x34\x5d\x56\xdf\
-\x59\xd3\x2d\xee\xac\xe7\x86\xee\xd2\xe6\x31\x2c\x33\xc3\x20\x92\
-\x39\x54\xf2\x19\x58\x1c\x10\x41\xea\x2a\xdd\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x15\x8f\xe3\xf1\
-\xff\x00\x14\x4e\xb3\xff\x00\x5e\x13\xff\x00\xe8\x0d\x5b\x15\x91\
-\xe3\xe3\xff\x00\x14\x4e\xb1\xff\x00\x5e\x33\xff\x00\xe8\x06\x80\
-\x3e\x13\xb3\x0d\x1d\xba\xee\xf9\x99\xb0\x0f\xbd\x5a\x9a\xf6\x38\
-\xd7\x0d\xf4\xac\xe3\x2b\xca\x9b\x92\x6f\xe1\xe2\x9b\x1b\x4b\x22\
-\x32\xb6\xd6\x66\xf5\xf5\xac\x79\xad\xb1\xaf\x29\x68\x95\xb8\x2d\
-\x26\x1b\xe5\x1f\x29\xa7\xc3\x65\x19\xc2\xb3\x6d\xcf\x27\x06\xa0\
-\x86\xe9\xa4\x0b\x1b\x47\xf7\x78\xe2\xa6\x78\x9e\x60\xcd\xb2\xb1\
-\xe5\xbe\xb6\x2e\x25\xcb\x44\x8c\x48\xc4\xc8\xcc\xab\xf2\xf5\xa8\
-\xc9\x91\x43\x3e\x57\x19\xeb\x51\xdb\x6c\x8e\x1d\xbb\x4f\xcd\xf7\
-\xaa\x4f\xdd\xbe\x53\xcc\xc7\x1c\x81\x50\xfc\x8a\x07\x99\x98\x46\
-\xbb\x3e\x6e\xa4\x8e\xc2\x9d\x24\xeb\xf6\x66\x6f\x2c\x71\xc7\xff\
-\x00\x5e\xa2\xb7\x32\xc6\xcc\xd1\xb8\x6e\x30\x3d\xaa\xe2\xc7\x24\
-\xd1\x24\x6d\x18\xc8\xfd\x6b\x9f\x97\x76\x68\x72\x9e\x3b\xd0\x2d\
-\xae\xfc\x31\x79\x71\x24\x68\xcd\x1c\x0e\xea\x36\x83\x93\x8e\x32\
-\x7f\x1a\xf1\x7f\x88\x9f\x03\x66\xd3\x6c\xd5\xad\xc7\x9d\x17\x97\
-\xf3\x2e\xde\xbc\x73\x5e\xed\xe3\xd4\x96\x3f\x0e\xde\x7e\xec\x6d\
-\x2a\xb1\x8f\xf8\x13\x2a\xff\x00\x5a\x93\x53\xb6\x86\xe2\xd1\xbc\
-\xc8\xb7\x16\xe3\xda\xbe\x4b\x3c\xe1\x7c\x36\x61\xcd\x75\x69\xf4\
-\x6b\x46\x75\x51\xc5\x4a\x9e\xc7\xc7\x27\x42\xfe\xc9\xb2\x68\xe3\
-\x41\x0e\xd7\xfb\xb8\xc6\x28\x2d\xb2\x16\x73\xf3\x6d\x19\xaf\x63\
-\xf8\xd3\xf0\x95\xa5\x8b\xce\xd3\xe3\x55\x66\x6c\x95\xdb\x8c\x57\
-\x95\x5d\x68\xb3\x69\xb1\xf9\x73\x45\xb5\xb1\xb7\x39\xe2\xbf\x03\
-\xce\xb2\x8c\x46\x03\x18\xe9\xd7\x5a\x69\x67\xdc\xfa\x3c\x3e\x22\
-\x15\x29\xdd\x6e\x65\xe9\xda\x8c\x3a\xb4\x3b\xe0\x6d\xc1\x58\xa9\
-\xc1\xce\x0f\x4e\x69\xda\x9f\x16\x04\xfb\x8c\x8f\x5a\xe1\xf5\xef\
-\x10\x8f\x84\x9a\xb4\xf2\x49\x1b\xb5\x95\xe3\xee\x50\xbd\x8d\x75\
-\xd6\xda\xb4\x3a\xff\x00\x87\x23\xba\xb7\x6d\xc9\x26\x08\xae\x3c\
-\x6e\x06\x50\xa5\xed\x63\xf0\xbd\x9f\xdd\xb9\xad\x19\x7b\xda\x93\
-\xc4\xe6\x54\x39\xf9\x7d\x0d\x24\x91\x9c\xfb\x9e\xfe\x95\x24\x27\
-\x29\xc8\xe7\xad\x24\x84\xae\xea\xe1\xa6\xaf\x62\xd9\x9d\xaa\xc7\
-\xba\xc6\xe3\xf8\x7d\xea\x8e\x9e\x7f\xd1\xa3\xff\x00\x64\x62\xb5\
-\x75\x48\x76\xe9\xd3\x7f\xba\x2b\x2a\xc5\x77\x42\xbf\xca\x89\xc9\
-\xf3\xab\xf6\xfd\x4b\x8f\xc0\x12\x29\x65\xf4\xe7\xad\x61\x78\xc3\
-\xc5\x36\x3e\x0e\xd3\x3e\xd5\xa8\x4d\xb5\x64\x7f\x2a\x18\xd1\x4b\
-\xcf\x71\x21\xfb\xb1\xc5\x18\xf9\x9d\xcf\xa0\x07\xb9\xe0\x0c\x87\
-\xf8\xb3\xc7\xeb\xa1\xdf\xc3\xa5\xe9\xd6\xbf\xda\xfe\x20\xba\x4f\
-\x32\x1b\x28\x9f\x60\x85\x3a\x79\xb3\xc9\x83\xe5\x44\x0f\x1b\xb9\
-\x66\xc1\x0a\x09\xaa\x3a\x27\x80\x1e\xc6\xf9\xb5\x6d\x5e\xe9\x75\
-\x6f\x10\x3a\x14\x17\x7b\x3c\xb8\x6c\xd0\xf5\x8a\xda\x3c\xe2\x38\
-\xf9\x39\x3f\x7d\x88\xf9\x89\xc0\x03\xe8\x70\xd8\x2a\x74\xa0\xab\
-\xe2\xf4\x4f\x68\xaf\x8a\x5e\x9d\xa3\x7f\xb4\xd7\xf8\x53\x39\xe5\
-\x52\xef\x96\x1b\x9e\x7f\xe3\x3f\x86\x52\x7c\x6a\x0b\x17\x8b\x60\
-\x6b\x5b\x19\x46\x6d\xf4\x98\x26\xf9\xad\xc8\x07\x12\x4d\x22\x9f\
-\x9a\x60\x3f\x85\x7e\x44\xe4\x7c\xc7\x9a\xab\xf0\xd7\xe1\xa6\x8b\
-\xf0\xaf\x47\x6d\x3f\x45\xb5\xfb\x3c\x32\x3f\x9d\x29\x66\xdf\x24\
-\xad\xd0\x16\x63\xd7\x03\xa7\xa5\x7a\x72\xc1\xf6\xcf\x16\x5a\xc7\
-\xfe\xcb\xf4\x1e\x8a\xd5\xc9\x44\xbb\xa4\xcf\xf0\xfb\x7e\x15\xd7\
-\x9d\x67\x98\xca\x99\x24\x30\x51\x9b\x8d\x17\x39\x3e\x44\xed\x1d\
-\x14\x6d\xa7\x57\xd6\xee\xec\xd7\x07\x87\x87\xb7\x73\x6a\xf2\xb2\
-\xd7\xe6\xcb\xb0\xb1\x0b\x9c\xfe\x9d\x6a\xb6\xa2\xd9\xe8\x7b\x8e\
-\x2a\x78\xdb\xe5\xe3\xf0\xf6\xaa\x9a\x83\xf2\xbf\x51\x5f\x9b\xaf\
-\x8c\xf6\xa3\x7d\x87\xdb\x75\xf5\xc9\xe9\xe9\x56\x9e\x3d\xf7\x67\
-\xdc\x8a\xad\x66\x3e\x75\xf6\x22\xad\x86\xdf\x76\xdf\xa5\x6b\xbc\
-\x89\x96\xc3\xa4\x4c\xce\xdf\x37\xcd\xb3\x18\xfe\xb5\x4d\x54\xc7\
-\x04\x9e\xac\xdf\xa5\x5c\x9f\x6c\x11\xc8\xcc\xdb\x9d\xb8\xe3\xad\
-\x55\x86\x2c\xc7\x1a\xff\x00\xcf\x46\xc5\x7a\x34\xa3\x65\x7b\x1c\
-\x92\x6a\xe0\xca\xc9\x3f\xca\x0b\x6c\x4a\xb4\x34\xf9\x6c\xf4\xc9\
-\x1f\x72\x86\x50\x0b\x03\xe8\xdd\x08\xa2\x08\x8b\x5b\x5f\x48\xbf\
-\xf2\xcd\x02\x0c\x7a\x9e\xdf\x5a\xf9\x83\xf6\xa5\xf8\x93\xf1\x17\
-\x45\xfd\xa2\x22\xd3\x2c\xf5\x0d\x51\x21\xb5\x4b\x71\xa2\xda\x59\
-\xf3\x15\xcc\x45\x47\x2c\x8b\xc3\x96\x60\xd9\xdf\x9e\x84\x70\x05\
-\x7d\x77\x87\xfe\x1f\xd7\xe2\x8c\x55\x4c\x3d\x3a\xb1\xa7\xc9\x07\
-\x3b\xcb\x44\xed\xd3\xfc\xde\xc9\x1c\x79\x9e\x64\xb0\x90\x8c\x9c\
-\x5b\xbb\x4b\x43\xd8\x3e\x36\x6b\x1a\x7e\x91\xe0\xb3\xfd\xa3\xac\
-\x6a\x7a\x2f\x99\x2a\x98\x8e\x9f\x20\x4b\xab\xa6\x1f\xf2\xc9\x3b\
-\x90\x73\x92\x3d\xb3\x5e\x21\xe1\x3f\x83\x93\xfc\x40\xf8\xb9\x63\
-\xa7\xf8\x8a\x3d\x43\xec\xf1\xdb\x9d\x52\x7b\x4b\x8b\xd7\x9a\x64\
-\x84\x92\x23\x8e\x56\x3c\x86\x63\x82\x40\x00\xe0\x9e\x99\xaf\x53\
-\xf8\x45\xe0\xdf\xf8\x49\xee\xa3\xf1\x7e\xb9\x7b\x0e\xbd\xae\xc8\
-\x4a\x24\x4a\x3f\x71\xa3\xe3\x8f\x2d\x10\x81\xb5\xc0\xc6\x72\x01\
-\x19\xfc\x4f\xa0\x8d\x3a\xca\xcb\x58\x9e\xf5\x6d\xe1\x4b\xfb\xa4\
-\x44\x9a\x70\x3f\x79\x2a\xaf\xdd\x05\xbb\xe3\x35\xfa\x9e\x4f\xc5\
-\xf2\xe1\x0c\x0d\x7c\x93\x2c\x4e\xb4\xe5\x19\x29\x54\x49\x28\xc6\
-\xa4\xac\xbf\x77\x74\xa5\xcb\x1d\x5f\x3b\xd6\x4e\xdc\xa9\x47\x7f\
-\x26\xb6\x09\x63\x6a\x47\x11\x57\xdd\x57\x5a\x77\x4b\xbf\x4b\xb2\
-\xce\x9b\x14\x3a\x54\x50\xdb\x5b\x43\x05\xad\xb5\xb2\x08\xa3\x8a\
-\x15\x09\x1c\x6a\x38\x01\x40\xe0\x01\x5a\xd1\x79\x86\x20\xc3\x3c\
-\x71\xfa\xd6\x76\x9e\xb0\xdc\xab\x36\x7e\x6f\xa5\x6f\x58\xd9\x46\
-\xb1\xaa\xee\xe1\xb0\x71\xef\x5f\x15\x90\x60\xab\xd3\x94\xb1\x18\
-\x8f\x8a\x7e\x77\x7f\x33\xb7\x15\x52\x2e\xd1\x8f\x42\xa4\xd6\x2c\
-\x6e\xfe\x60\x06\x46\x41\xab\x50\xe9\xd1\xc3\x16\xe9\x54\xb0\x6e\
-\x31\xeb\x56\xae\x40\x0e\x17\x86\x6c\x71\xc7\x7a\x73\x79\xff\x00\
-\x61\x1b\xb8\x50\x78\xaf\xad\xf6\x53\xa8\xd4\x5e\x8b\xcb\x73\x83\
-\x44\x56\xba\x8a\xdf\xc9\x8f\x6f\xcb\x8f\x6a\xa5\x71\x1f\x99\x31\
-\x55\x90\xaa\xed\xfc\xab\x4e\xfe\xdb\x74\x71\x7c\xbb\xbb\x9f\x7a\
-\x85\x2d\xa3\x8e\xe3\x98\xcf\x2b\xdf\xb5\x7a\x34\xa9\x42\x9e\x90\
-\x56\x32\x94\xae\x53\x5b\x37\x6b\x7c\x2e\xcd\xab\x56\x67\xb5\x66\
-\x68\xfe\x55\x6f\x5c\x77\xa9\xdf\x4f\x89\xd1\x59\x59\x97\x27\xa5\
-\x36\x4c\xc7\x2a\xaf\x9b\xb4\xe3\xf3\xae\xea\x69\x23\x29\x79\x15\
-\xdb\x4a\x42\xb2\x6e\x5f\x97\x1e\x95\xf7\x47\xfc\x10\x55\x16\x3f\
-\x8c\x3f\x11\xb6\xab\x0c\x68\xd6\x7d\x47\xfd\x37\x96\xbe\x24\x87\
-\x7b\x39\x57\x65\x6f\x53\x5f\x72\xff\x00\xc1\x09\x55\x87\xc5\xff\
-\x00\x88\x8c\xc1\x7e\x6d\x1e\xcc\x71\xff\x00\x5d\xe5\xaf\x63\x2d\
-\xff\x00\x78\x8d\xbc\xff\x00\x23\x97\x15\x7f\x66\xcf\xd3\x21\xd2\
-\x8a\x07\x4a\x2b\xec\x0f\x1c\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x2a\
-\x1b\xab\x95\xb4\x89\xa4\x91\x95\x23\x45\x2c\xcc\xc4\x05\x50\x3a\
-\x9c\xfb\x75\xcd\x4d\x5f\x33\x7f\xc1\x64\xbc\x6f\x7f\xf0\xd7\xfe\
-\x09\x59\xfb\x41\x6b\x5a\x64\x8d\x0d\xf5\xaf\x81\x75\x38\xe1\x91\
-\x5c\xc6\xd1\x99\x20\x68\xcb\x02\xb8\x20\x80\xe4\x8c\x1e\xa2\x80\
-\x3c\xd2\xf3\xfe\x0e\x36\xfd\x8d\xf4\xff\x00\x8f\x2d\xf0\xf2\x4f\
-\x8d\x1a\x4a\xeb\x0b\x77\xf6\x07\xbf\x5d\x3a\xf1\xb4\x75\xb8\xdd\
-\xb7\x61\xbe\x11\x79\x1b\x73\xff\x00\x2d\x37\xf9\x40\x75\x7a\xe7\
-\xff\x00\xe0\xae\xff\x00\xf0\x4f\xbf\xd8\x6f\xc7\xdf\x09\x35\x1f\
-\x88\xbf\xb4\x46\x95\xe0\xff\x00\x03\x25\xc0\x2e\x9e\x30\xd2\xee\
-\x3f\xb2\xf5\x6b\xb9\x59\x4b\x0f\x28\xc2\x09\xbd\x94\x8c\x90\x8d\
-\x1c\xc5\xba\xed\x38\xaf\xcf\x6f\xd9\xab\xfe\x09\x67\xf0\x27\xc7\
-\x5f\xf0\x6a\x96\xb5\xf1\x5b\x50\xf8\x77\xa1\xcf\xf1\x31\xbc\x21\
-\xaf\xf8\x98\x78\xa1\xa3\x3f\xda\x71\x5d\xd9\x5f\x5d\xac\x21\x25\
-\xce\x56\x3f\x2e\xd9\x10\xc6\x3e\x52\x37\x12\x32\x49\xac\xcf\xf8\
-\x23\x77\xfc\x11\x9f\xc5\x9f\xf0\x59\xcf\x87\xde\x05\xf8\xed\xfb\
-\x53\x78\xe3\x5f\xd7\xbe\x17\xf8\x6f\x4c\x8f\xc3\x5e\x06\xf0\x94\
-\x17\xaf\x19\xbe\xb4\xd3\xf6\xda\x6f\x91\xf2\x7c\x9b\x72\xf0\x48\
-\xac\x23\xc4\xb3\x38\x67\x2e\x8a\x06\xf0\x0f\xd4\xaf\xf8\x37\xde\
-\xcb\xe1\xee\x9b\xff\x00\x04\xb7\xf0\x1d\xbf\xc2\x9b\xef\x16\x6a\
-\x9f\x0f\xe1\xd4\x35\x94\xd1\xae\xbc\x4b\x04\x10\xea\x73\xc3\xfd\
-\xa5\x73\xf3\x4a\x90\x93\x1a\xe5\xb7\x63\x18\x24\x60\x90\xa4\x90\
-\x3e\xd6\xae\x67\xe1\x3f\xc2\x2f\x0c\xfc\x0b\xf0\x1e\x97\xe1\x5f\
-\x06\x68\x1a\x3f\x85\xbc\x33\xa2\xc3\xe4\x58\xe9\x7a\x5d\xa2\x5a\
-\xda\x5a\xa6\x49\x21\x23\x40\x00\xcb\x12\xc4\xe3\x24\x92\x4e\x49\
-\xcd\x3b\xe3\x0f\xc4\xed\x2f\xe0\xa7\xc2\x8f\x13\xf8\xcb\x5b\x37\
-\x03\x45\xf0\x8e\x91\x77\xad\x6a\x1f\x67\x8f\xcd\x9b\xec\xf6\xd0\
-\xbc\xd2\xec\x4f\xe2\x6d\x88\xd8\x1d\xce\x05\x0a\xed\xd9\x01\xd2\
-\x51\x5f\x39\xc5\xff\x00\x05\x0d\x49\x6d\xe3\x75\xf8\x35\xf1\xa5\
-\x96\x45\x0e\xa7\xfb\x3f\x4d\xe4\x11\x91\xff\x00\x2f\xde\xf4\xff\
-\x00\xf8\x78\x3a\xff\x00\xd1\x19\xf8\xd1\xff\x00\x82\xfd\x33\xff\
-\x00\x93\xab\x6f\xab\xd4\xed\xf8\xaf\xf3\x15\xd1\xf4\x4d\x15\xf3\
-\xb7\xfc\x3c\x1d\x7f\xe8\x8c\xfc\x68\xff\x00\xc0\x0d\x33\xff\x00\
-\x93\xa9\x3f\xe1\xe1\x0b\x9f\xf9\x23\x3f\x1a\x3f\xf0\x03\x4c\xff\
-\x00\xe4\xea\x3e\xaf\x53\xb7\xe2\xbf\xcc\x77\x47\xd1\x54\x57\xce\
-\xdf\xf0\xf0\x75\xff\x00\xa2\x33\xf1\xa3\xff\x00\x05\xfa\x67\xff\
-\x00\x27\x51\xff\x00\x0f\x07\x5f\xfa\x23\x3f\x1a\x3f\xf0\x5f\xa6\
-\x7f\xf2\x75\x1f\x57\xa9\xdb\xf1\x5f\xe6\x17\x47\xd1\x34\x57\xce\
-\xdf\xf0\xf0\x75\xff\x00\xa2\x33\xf1\xa3\xff\x00\x00\x34\xcf\xfe\
-\x4e\xa3\xfe\x1e\x0e\xbf\xf4\x46\x7e\x34\x7f\xe0\xbf\x4c\xff\x00\
-\xe4\xea\x3e\xaf\x3e\xdf\x8a\xff\x00\x30\xba\x3e\x89\xac\x7f\x1f\
-\xae\x7c\x13\xad\x7b\xd8\x4f\xff\x00\xa2\xda\xbc\x34\xff\x00\xc1\
-\x42\x14\x7f\xcd\x19\xf8\xd1\xff\x00\x80\x1a\x67\xff\x00\x27\x55\
-\x1f\x14\x7e\xde\xb2\x6b\x1e\x1a\xd4\x2d\x60\xf8\x33\xf1\xa3\xcd\
-\xba\xb6\x96\x18\xc9\xb0\xd3\x36\x86\x64\x20\x64\xfd\xbb\xde\x8f\
-\xab\xcf\xfa\x6b\xfc\xc2\xe8\xf0\x5b\x78\xe3\x58\x62\x55\x91\x7e\
-\x51\xf3\x73\xde\xa4\x86\x02\x09\xda\xfb\x9b\x27\x15\xc7\x1f\x13\
-\x78\xc1\xed\xb6\x7f\xc2\x97\xf8\xa0\xac\x70\x49\x11\xe9\x9d\x7f\
-\xf0\x36\x88\xfc\x43\xe3\x14\x70\xdf\xf0\xa7\xfe\x2c\x12\xa7\xb4\
-\x3a\x67\xff\x00\x26\xd6\x32\xc1\x55\xbe\xdf\x8a\xff\x00\x32\xd4\
-\xd5\xac\x76\xeb\x6d\x35\xb3\x2b\x6e\x0d\xb8\x8c\xe3\xbd\x6c\x59\
-\x5e\xab\x5b\xb2\x9d\xa3\x0b\xc9\xc7\x7a\xf3\x5f\xf8\x4d\x7c\x72\
-\x65\x63\xff\x00\x0a\x77\xe2\xae\xee\x8b\xfb\x8d\x37\x1f\xfa\x5b\
-\x4d\xb6\xf1\xc7\x8e\xed\xd0\x83\xf0\x77\xe2\x8b\x73\xff\x00\x3c\
-\xb4\xcf\xfe\x4d\xaa\x8e\x16\xaa\x7b\x2f\xbd\x7f\x98\xf9\x91\xe8\
-\x97\x57\x51\x24\xac\xa0\x71\xd0\x91\xda\xab\xc8\x62\x31\x8e\x79\
-\x6e\x38\xed\x5c\x48\xf8\x81\xe3\x64\x1f\xf2\x45\xfe\x28\x37\xae\
-\x63\xd3\x39\xff\x00\xc9\xda\x91\x7c\x79\xe2\xf6\x7f\x9b\xe0\xbf\
-\xc5\x30\x30\x7a\x45\xa6\x71\xff\x00\x93\xb5\x9c\xf0\x75\x5f\x45\
-\xf7\xaf\xf3\x2a\x32\x48\xed\xe1\x58\x61\x7f\x95\x98\xed\xf5\xef\
-\x53\xda\x4c\xf1\xa7\x9b\xb9\x4e\xee\x14\x57\x0f\x1f\x8f\x3c\x51\
-\xb0\xab\x7c\x17\xf8\xad\x82\x7b\x41\xa6\x7f\xf2\x6d\x5a\x97\xe2\
-\x27\x89\xa5\x86\x38\xd7\xe0\xd7\xc5\x65\xd9\xcf\x10\x69\x9f\xfc\
-\x9b\x59\x47\x2f\xae\x9d\xec\xbe\xf5\xfe\x65\x7b\x48\xec\xcd\xef\
-\x1b\xdd\x48\xda\x20\x88\xaa\x9f\x32\x7b\x75\x39\xff\x00\xae\xf1\
-\x9f\xe9\x56\x2f\x2e\x9a\xdd\x7e\x78\x37\x6c\x1e\x9c\x57\x1b\xe2\
-\x0f\x1c\xf8\xb7\x55\xb4\x54\x8f\xe0\xdf\xc5\x4d\xcb\x3c\x32\x02\
-\xd0\x69\x9f\x75\x25\x57\x3f\xf2\xfb\xe8\xa6\xac\xc9\xf1\x1b\xc5\
-\x86\x07\x4f\xf8\x53\x9f\x15\x9f\x71\xe3\x74\x1a\x66\x3f\xf4\xb6\
-\xb2\x79\x7d\x77\x26\xda\xfc\x57\xf9\x94\xaa\x45\x6c\xcd\xf9\x4c\
-\x3a\x84\x2d\xe6\xc6\x17\x8e\x32\x3a\xd7\x15\xe3\x9f\x85\xf6\x7a\
-\xfe\x9c\xc6\x18\xdb\xce\x93\x95\xc3\x0e\xd5\x63\x57\xf8\x95\xe2\
-\x6d\x37\x4a\xba\xbb\xb9\xf8\x3b\xf1\x52\x3b\x6b\x38\x64\xb8\x9d\
-\xcd\xbe\x98\x44\x71\xa2\x96\x76\xe2\xf7\x38\x0a\x09\xe3\xd2\xb7\
-\x7c\x35\xe2\x6b\x4f\x17\xf8\x63\x4e\xd6\x2c\xd5\x9e\xc7\x56\xb2\
-\x82\xfa\xd5\x99\x76\xb3\x45\x34\x6b\x22\x12\x3b\x1d\xac\x32\x3b\
-\x1a\xf1\xf3\x6c\x86\x18\x8a\x5c\x98\xa8\x26\x9e\x9d\x1f\xe5\x73\
-\x7a\x55\xac\xef\x07\xa9\xf2\x1f\xed\x01\xf0\x8a\xe9\xf4\x99\xad\
-\xda\x39\x3f\x77\x20\x64\x23\xdb\xf0\xae\x63\xe1\xbe\x87\x79\xe1\
-\xff\x00\x0c\xc9\x6d\x77\xb5\x8a\xc8\x59\x08\xec\xbd\xab\xed\x0f\
-\x16\xf8\x3e\xd7\xc4\xd6\x2e\x93\x43\xb6\x47\xe8\xc5\x73\x8a\xf0\
-\x4f\x8b\x7e\x01\xff\x00\x84\x1f\x72\xa9\xdd\x0b\x9c\xf1\xda\xbf\
-\x0d\xe2\xae\x1c\xc4\x65\xb8\x69\x46\x9f\xbd\x49\xbb\xf9\xa3\xde\
-\xc1\x62\xd5\x46\xa2\xf7\x39\x38\x97\x11\x74\xc1\xa1\xf9\xf4\x1c\
-\x75\xa6\xd9\x36\xeb\x45\xdb\xf3\x63\xbf\xb5\x66\xf8\xbf\xc6\x1a\
-\x7f\x81\xf4\x89\xb5\x1d\x4a\xe2\x3b\x5b\x2b\x71\xbe\x59\xa4\x60\
-\xa1\x17\xd7\x3f\x85\x7c\x16\x17\x0f\x3a\xae\x30\x82\xbb\x7a\x2b\
-\x75\x3d\x39\x4a\xd7\x2e\x5f\xa6\xfd\x3a\x55\xc1\xe8\x31\xef\x5e\
-\x74\xfe\x31\xbe\xf1\x9d\xc4\xba\x67\x85\x5e\x11\x1c\x0e\x61\xbd\
-\xd7\x25\x4f\x32\xda\xcd\xba\x14\x81\x7a\x4d\x3f\xfe\x38\x87\x1b\
-\x89\x3f\x29\xb7\x24\xfa\x87\xc6\xad\x25\xe7\x6f\xb6\xe8\x9e\x0f\
-\x92\x3c\xa4\x79\x68\xaf\xf5\x95\xff\x00\x68\x82\x1a\xde\x0f\xf6\
-\x78\x91\xc1\xc1\xda\xa7\x07\xa0\xd1\x34\xe8\x34\x9d\x2e\x1b\x5b\
-\x58\x21\xb5\xb5\xb7\x41\x1c\x71\x44\x82\x38\xe2\x51\xd0\x2a\xaf\
-\x00\x7b\x0a\xf5\x2a\x53\xa3\x81\xa8\xbd\xb2\x52\xab\xfc\xae\xce\
-\x31\xff\x00\x17\x47\x2f\xee\xec\xba\xdd\xe8\x67\x17\x29\xc6\xd1\
-\xd1\x7e\x7f\xf0\x0a\x7e\x17\xf0\x65\x8f\x82\xb4\xe9\x21\xb1\x59\
-\x99\xae\x5f\xce\xb9\xb9\x9a\x43\x25\xc5\xe4\x98\xe6\x49\x5c\xf2\
-\xcd\xdb\xd0\x00\x00\x00\x55\xbb\xb1\xf2\x31\x51\xf5\xf7\xab\x3e\
-\x62\xca\xbc\x75\x07\x91\x50\x4c\x99\xdf\xef\xfa\xd7\x34\xab\x54\
-\xab\x2f\x69\x55\xb7\x27\xbb\x65\x72\xa8\xab\x23\x2f\xc3\xb6\xbf\
-\x69\xf8\x83\x66\x9e\x90\x4c\xde\xe7\x11\xb5\x79\xfc\x0d\xfc\xb3\
-\xf4\xaf\x4f\xf8\x7d\x6f\xf6\xbf\x8a\x76\xab\x8e\x56\xc6\xe8\xf1\
-\xed\x0b\x57\x97\x5b\x1d\xfb\x7d\xd7\x8c\x7e\x15\xae\x69\xa6\x5b\
-\x47\xfc\x53\xfc\xa2\x74\x61\x3f\x8b\x2f\x45\xfa\x9a\x0a\x01\x46\
-\xf6\xff\x00\xeb\xd5\x1b\xe2\x77\xaf\xfb\xc2\xaf\x45\xf2\x8d\xde\
-\xc7\x18\xef\xd6\xa8\x5c\x8c\xb8\xf7\x39\xaf\x8e\x8f\xc6\x7a\xb1\
-\xec\x5d\xd2\xf0\x67\xf9\x87\xf0\xe7\xeb\x4f\xb4\x3e\x6d\xc1\x6f\
-\x7e\x3f\x3a\x4d\x31\x41\x8d\x9b\xdb\xfa\x53\xec\xfa\x64\xf4\x51\
-\x93\x5b\x43\x73\x29\xbb\x6c\x36\x63\xbe\x19\x9b\xee\xe5\x88\xcd\
-\x3b\x45\x7f\x2f\x50\xb7\x64\xda\xdb\x32\xe3\x77\x43\xc5\x3a\xf6\
-\x03\x06\x99\x0b\xee\xff\x00\x59\x97\x20\xff\x00\x0f\x3f\xca\xb8\
-\x7f\x12\x6b\x7a\x87\x89\x65\x6d\x2f\x41\x94\xdb\xc7\x18\x29\x3e\
-\xa1\xfc\x31\x7a\x84\xf5\x6f\x70\x7b\x57\xd9\x64\x5c\x3b\x89\xcc\
-\x2a\xb5\x1b\x42\x10\x57\x94\xe5\xa4\x62\xbb\xb7\xe7\xd1\x2b\xb6\
-\xf6\x47\x99\x88\xc4\x42\x97\x9b\x7b\x25\xbb\xfe\xbb\xec\x53\xf8\
-\x8d\xf1\x72\xf9\x35\x79\xbc\x3b\xe1\x38\xe3\xd4\xbc\x45\x78\x72\
-\xee\xdf\x35\xa6\x9e\xb9\xfb\xf2\x9e\x99\x03\x27\x1c\xf4\xe7\xd0\
-\xc9\xf0\xef\xe1\x65\xbf\x81\xa5\x97\x50\x9e\xe6\x4d\x5b\xc4\x9a\
-\x89\xdf\x7f\xa9\x4e\x77\x3c\x8c\x7a\xa2\x7f\x75\x3d\x87\xa0\xf4\
-\xc5\x6c\x78\x2b\xc2\x3a\x6f\x81\xac\x1a\xda\xc6\x0f\xf5\x84\xb4\
-\xb2\xb9\xcc\x93\xb7\xf7\x99\xbb\x9a\xd2\x96\x68\xfc\xbd\xb8\x0a\
-\xd9\xcf\x07\x93\x5e\xa6\x3b\x88\xb0\xb4\x30\x92\xca\x32\x5b\xc2\
-\x93\xf8\xe6\xd5\xa7\x55\xaf\xe6\xfe\x58\x76\x82\xd3\xac\xae\xc8\
-\xa5\x85\x9b\xa9\xed\xb1\x1a\xbe\x8b\xa4\x7f\xe0\xf9\x91\x1f\x00\
-\xc7\xad\xea\x1f\xda\x56\xd7\x52\x69\x3a\xc8\x01\x16\xf6\x10\x0f\
-\x9c\x07\x45\x99\x0f\xcb\x2a\x75\xe1\xb0\x47\x66\x1d\x6a\x7b\x3f\
-\x11\x36\x9f\xa8\x2e\x9f\xe2\x6b\x38\x34\xbb\xe9\x9b\x65\xbd\xdc\
-\x79\x36\x17\xc7\x90\x02\x48\x7f\xd5\xb9\xc7\xfa\xb9\x30\x7d\x0b\
-\x56\xb6\x8c\x8b\xe4\x26\xe6\x51\xb7\x24\xe4\xd5\xcb\xc7\xb1\xbe\
-\xd2\xa5\xb3\xba\x5b\x7b\xab\x5b\xa5\xd9\x24\x52\xaa\xba\x48\x3d\
-\x0a\x9c\x83\x5e\x86\x51\x9f\xe1\x68\xe0\xe3\x43\x19\x79\x24\xba\
-\x7c\x4b\xd1\xbd\xd7\x93\xd3\xb5\x8c\x6b\x61\xe6\xe6\xe5\x4f\x42\
-\xf5\xbf\x87\xa0\xb0\xb5\xc7\x96\x37\xb6\x32\x3b\x54\xc6\xd9\x37\
-\xc6\xbb\x4f\xcd\xed\xd7\xda\xb8\x75\x5d\x5b\xe1\xd0\xdb\xa5\xb4\
-\xda\xe6\x90\xbc\xff\x00\x66\x4f\x36\x6e\xad\x87\xa5\xb4\xad\x9d\
-\xcb\xe9\x1c\x84\x9e\x98\x61\xd2\xba\x7f\x0d\xfc\x41\xd3\x3c\x5b\
-\x69\xe7\x59\xce\xd2\xf9\x4d\xb2\x58\x5d\x4c\x73\xc0\xc3\xaa\x49\
-\x1b\x7c\xc8\x47\x1d\x7d\x46\x33\x91\x5e\xf5\x1c\x66\x11\xd3\xf6\
-\xf4\x27\xcd\x4f\xbd\xb6\xff\x00\x12\xdd\x3f\xc1\xf4\x67\x2b\x8c\
-\xaf\xcb\x25\x67\xfd\x6c\x6a\x36\x9b\x13\x5d\x30\xdc\xc6\xa5\x6b\
-\x56\x6d\x3f\x6e\x40\x19\x1d\x7b\x55\x51\xad\xc2\x8c\xcd\xf2\xee\
-\x23\x71\xe6\x9a\xde\x2b\x8a\x38\x36\xb2\xf4\xf4\x19\xae\xaa\x79\
-\xe6\x0b\x77\x32\x1d\x19\xb3\x42\x5b\x39\x11\x22\x0b\xb7\xa7\x14\
-\xb1\x42\xc8\xb2\x79\x8a\xad\xb4\x7f\xdf\x55\x4a\x6d\x58\x9b\x58\
-\x64\x4f\xba\x3d\x7b\x50\x7c\x47\x04\xd1\x32\x89\x0e\xec\x72\x3d\
-\xeb\xa2\x8e\x7b\x82\xa9\xf0\xd4\x44\x4e\x84\xd6\xe8\x96\x54\x6b\
-\xbb\x45\x0a\xbb\x70\x33\xc5\x56\xd4\x2d\x16\x53\x1f\xc9\xf7\x48\
-\xe4\x54\x89\x7a\xad\x64\xa0\x4d\x86\xfe\x75\x24\xe9\x21\x8e\x1f\
-\x98\x31\x5a\xf6\xb0\xf5\xe9\xd4\x57\x83\xb9\xcf\x2b\xad\xcc\xd7\
-\xda\x1e\x4c\xf1\x9e\x7a\xf4\xaf\xba\x3f\xe0\x83\x8c\xbf\xf0\xb5\
-\xfe\x21\x2a\xb6\xef\xf8\x93\x59\x9f\xfc\x8f\x2d\x7c\x3e\x91\x34\
-\xb3\x49\xbd\x17\xae\x46\x6b\xee\x2f\xf8\x21\x20\x51\xf1\x8b\xe2\
-\x2a\xac\x7e\x59\x1a\x3d\x9e\x78\xeb\xfb\xf9\x6b\xdc\xca\xee\xf1\
-\x11\x7f\xd6\xc7\x2e\x2a\x5f\xbb\x68\xfd\x34\x1d\x28\xa0\x70\x28\
-\xaf\xb2\x3c\x50\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xaf\x9f\x7f\xe0\
-\xa9\xff\x00\x04\x75\xaf\xda\x57\xfe\x09\xe1\xf1\x8b\xc0\x3e\x1d\
-\x93\x4c\x87\x5c\xf1\x67\x85\xee\xb4\xeb\x27\xd4\x6e\x85\xad\xaa\
-\x4a\xe0\x01\xe6\x4a\xdc\x22\xfb\x9e\x95\xf4\x15\x7c\x9d\xff\x00\
-\x05\xd2\x8d\x7f\xe1\xcf\xff\x00\xb4\x4f\x00\xff\x00\xc5\x15\x7b\
-\xd7\xfd\xdc\xd0\x07\xe4\x47\xc3\xaf\xf8\x25\x0f\xfc\x15\x23\x41\
-\xfd\x8b\x7f\xe1\x47\x78\x6f\xe2\x17\xc3\x7f\xf8\x53\x37\x9a\x55\
-\xe6\x8b\xfd\x8d\x6d\xa9\x69\x53\x43\x2d\x9d\xd4\xb2\xbd\xc4\x62\
-\xe7\xec\x86\x63\xbd\xe5\x97\xe6\xf3\x37\x0c\x90\x08\x00\x01\xd5\
-\xfe\xcd\x9f\xf0\x4d\xff\x00\xf8\x2b\xa7\xec\x87\xf0\x4b\x43\xf8\
-\x73\xf0\xe7\xe2\x57\x80\xbc\x35\xe0\xbf\x0d\xac\xc9\xa6\xe9\xa9\
-\x71\xa4\xdc\x8b\x51\x2c\xd2\x4f\x20\x12\x4d\x64\xf2\x36\x64\x95\
-\xdb\xe6\x63\x8d\xd8\x18\x00\x01\xbd\xff\x00\x04\x57\xff\x00\x83\
-\x8d\x3f\x66\x1f\xd8\x67\xfe\x09\x8b\xf0\xaf\xe1\x6f\x8e\xb5\xaf\
-\x15\x5a\xf8\xb7\xc2\xb6\xf7\xe9\xa8\xc3\x65\xe1\xe9\xae\x21\x8d\
-\xa6\xd4\xae\xee\x17\x12\x2e\x03\x65\x26\x42\x71\xdc\x9e\xf9\xaf\
-\xa9\x7f\xe2\x2e\x8f\xd8\xd3\xfe\x86\x2f\x1d\x7f\xe1\x2d\x3f\xf8\
-\xd0\x07\xd8\x1f\xf0\x4d\x5f\x0d\x7c\x70\xf0\x7f\xec\x7f\xe1\x6d\
-\x3f\xf6\x8a\xd7\x2c\x7c\x45\xf1\x72\x19\x2e\xce\xb3\x7f\x68\x6d\
-\xcc\x33\x29\xb9\x94\xc0\x17\xc8\x8a\x28\xfe\x58\x4c\x63\xe5\x41\
-\xd3\x92\x4f\x27\x4b\xfe\x0a\x3e\x3f\xe3\x5e\x9f\x1e\x3f\xec\x9d\
-\x78\x84\x7f\xe5\x32\xe2\xb4\x3f\x62\xff\x00\xdb\x0f\xc1\x7f\xb7\
-\x97\xec\xfb\xa1\xfc\x50\xf8\x7b\x71\xa8\xdd\x78\x4b\xc4\x4f\x70\
-\x96\x72\xdf\x59\xb5\xa4\xec\x61\x99\xe1\x7c\xc6\xdc\x81\xbe\x36\
-\xc1\xee\x39\xac\xff\x00\xf8\x28\xff\x00\xfc\xa3\xcf\xe3\xc7\xfd\
-\x93\xbf\x10\x7f\xe9\xb2\xe2\xb4\xa3\xfc\x48\xfa\xa0\x67\x0b\xa5\
-\x8c\xe9\x56\x7f\xf5\xef\x1f\xfe\x80\x2a\xce\xdf\xaf\xe7\x55\xf4\
-\x9f\xf9\x05\xd9\xff\x00\xd7\x08\xff\x00\xf4\x01\x56\x68\xa9\xa4\
-\xdf\xab\x12\x1a\xff\x00\x2a\xb1\xe4\x05\x04\x93\xe9\x8f\xc6\xbe\
-\x60\xf0\xc7\xfc\x16\x1b\xe0\x57\x8a\x74\x3d\x3f\x58\x8f\x53\xf1\
-\xe6\x9f\xe1\xbd\x4d\x12\x58\x75\xfd\x4b\xc0\x7a\xd5\x96\x88\xb1\
-\x39\x01\x65\x7b\xd9\x2d\x84\x29\x19\x24\x7e\xf1\x98\x27\x3c\x91\
-\x5f\x4f\x4f\xfe\xa6\x4f\xfa\xe6\xf9\xfa\x6d\x35\xf9\x3b\xf0\xdf\
-\x53\xf8\xe1\xe1\xbf\xf8\x24\x6f\xc1\x3d\x3f\xc5\x7e\x3b\xf0\x36\
-\x99\xfb\x37\x78\xeb\xc2\xf6\x5e\x19\xf1\x7e\xa7\xa2\xf8\x52\x66\
-\xf1\x0f\x83\xf4\x7b\xc8\xbc\x94\x9d\xde\x7b\xb6\x82\x44\x67\x65\
-\x86\x5b\x85\x87\xf7\x22\x51\x27\x96\x40\xc8\xcc\x67\xeb\x1a\xe2\
-\x41\xf2\x1f\x30\x11\xb8\x15\x3b\x81\x07\xa1\x04\x1e\x87\x3d\x6b\
-\x21\x7c\x7b\xa2\x3f\xc4\x1f\xf8\x44\xd7\x54\xb3\x6f\x13\x7f\x65\
-\xb6\xb6\x74\xc1\x2e\x6e\x56\xc4\x4c\xb0\x1b\x82\xbd\x44\x7e\x6b\
-\xaa\x64\xff\x00\x16\x47\x63\x5f\x01\x7e\xd6\xfe\x33\xf8\x8f\xe2\
-\x1f\xdb\x13\xc6\x1f\x0f\x74\x29\x3c\x41\xa4\xf8\x47\xe1\x47\x84\
-\x74\x3b\xaf\x0f\x45\xa6\x7c\x5f\xb0\xf0\x20\x48\xa5\x82\x7f\x33\
-\x55\x97\xcf\x8a\x46\xd4\x15\x1a\x14\x8b\xe6\x3e\x4a\x79\x24\x3c\
-\x6c\x64\xcd\x79\xee\x9f\xa2\x6a\x1e\x36\xfd\xa3\xb5\x0f\x8a\x9e\
-\x26\xf1\xc7\x89\x2d\x7e\x23\x5e\x7e\xca\x73\x78\xc4\xbe\x87\xe2\
-\xf9\xa1\xd2\x6f\x75\x48\x5d\xad\x93\xec\xd1\x23\x2a\x35\xab\x2a\
-\x2d\xcf\x92\x83\x67\x9e\xcd\x2e\x37\x73\x40\x1f\xaa\xc1\x58\xff\
-\x00\x0b\x67\x19\xc7\x34\x11\x86\x2b\x86\xdc\x0e\x31\x5f\x9f\x5a\
-\xc5\xa5\xc7\xc3\xcf\xd9\x5f\xe0\x26\x97\x71\xf1\x2b\xe3\xd7\x8a\
-\x3c\x59\xf1\xb2\xc6\xcb\x57\xbc\xd3\x34\xdf\x16\x5a\xe9\xfa\x8f\
-\x88\xe6\x8b\x41\x59\xe5\x86\x3d\x52\xf2\x48\x60\xd2\x6c\xe3\xca\
-\xcb\x22\xc4\x7c\xc9\xca\xaa\x8c\xb1\x62\x78\x2f\xd9\xff\x00\xf6\
-\x92\xf1\x7f\xc4\x8b\x1b\x0f\x85\xde\x20\xf8\x89\xe2\xaf\x08\xf8\
-\x1e\xe3\xe3\x36\xab\xe0\xab\xaf\x10\x27\x8d\x2d\x75\x4d\x6e\xca\
-\xc6\xdf\x43\x8b\x50\xb5\xd1\xff\x00\xb7\xa3\x53\x1b\x3c\xd7\x6d\
-\x24\x5e\x7a\x7e\xf3\x6a\x34\x41\xf7\xfc\xc4\x03\xf4\xaf\xc5\xfe\
-\x3a\xd1\xbc\x07\x6d\x61\x26\xb5\xa9\x5a\xe9\x71\xea\xda\x85\xbe\
-\x91\x64\xd7\x0f\xb3\xed\x57\x77\x0d\xb2\x18\x13\xd6\x47\x6e\x00\
-\xa8\xfc\x1d\xe3\xcb\x1f\x1e\x4f\xae\x43\x63\x0e\xa8\x8d\xa0\xea\
-\xb2\xe8\xf7\x5f\x6c\xd3\xa7\xb5\x12\xcf\x1a\xa3\x31\x84\xc8\xa0\
-\x4f\x16\x24\x5c\x4b\x1e\xe4\x62\x18\x03\x95\x20\x7e\x78\xfe\xd8\
-\x5f\x08\x3c\x1d\xe3\x1f\x0d\x78\x53\xc3\xb1\xfc\x76\xf8\xa1\xe3\
-\x3d\x1b\xc1\x3f\x1c\x7c\x35\xa0\xb4\xcf\xe2\x6b\x8b\x79\x7c\x35\
-\xf6\xd8\x91\xe6\xb6\x93\x54\x4d\x89\x7d\x2c\x78\x59\x62\x9c\xb3\
-\x4b\x68\x67\x68\xcb\x16\xcd\x5f\xf0\xef\xc4\xcf\x11\x78\xc3\xe3\
-\x8e\xa9\xf0\xa7\x5e\xf8\xa3\xe3\x6f\x0d\xfc\x3b\xd7\x3e\x38\xf8\
-\xb3\xc3\xb3\x6b\xd0\xf8\x88\xdb\xea\x8f\x6f\xa7\x68\x3a\x7d\xc6\
-\x9f\xa3\xc3\xa8\xc9\x93\x6e\xb3\xca\xd2\xc8\xcc\x85\x5a\x4f\x2e\
-\x45\x56\x06\x42\x48\x07\xe8\xd6\x33\xbb\xe5\x6f\x97\xaf\x1d\x29\
-\x19\x76\x37\x4e\x54\x90\x41\xeb\x5f\x9b\x6b\xe3\x4f\x16\x78\xeb\
-\xe3\x1f\x84\xfe\x12\xe9\x7f\x17\x3e\x21\xdd\x78\x1f\x4a\xf8\xe3\
-\x77\xe1\x0b\x1f\x17\x58\x6b\x91\xb6\xb1\xaa\xe9\x9f\xf0\x8a\xdc\
-\x5f\x5c\xe9\xd2\xde\xaa\x15\x9d\xad\xee\x4b\x42\x26\x64\x2e\xbf\
-\x29\xdd\xe6\x47\xbc\x7d\x27\xfb\x0b\x4b\xab\x78\x2f\xe3\x7f\xed\
-\x03\xf0\xc6\xeb\xc5\x5e\x2a\xf1\x67\x87\xbe\x1b\xf8\x87\x47\x4f\
-\x0f\xdc\x78\x93\x50\x6d\x4b\x52\xb5\x82\xff\x00\x46\xb7\xbd\x96\
-\xde\x4b\xa6\x01\xe5\x45\x99\xdc\xa1\x93\x2c\x15\xb0\x49\xc5\x00\
-\x77\xdf\xb5\x47\xed\xa9\xf0\xbf\xf6\x2b\xf0\xd6\x9f\xaa\xfc\x4b\
-\xf1\x4d\xbf\x87\xe1\xd5\xe6\x7b\x7d\x3a\xd9\x60\x96\xee\xf3\x51\
-\x91\x46\xe6\x10\xdb\xc2\xad\x23\xed\x04\x64\x81\x81\x91\x93\xc8\
-\xad\x6f\xd9\xb7\xf6\x9d\xf0\x0f\xed\x7d\xf0\xed\x3c\x55\xf0\xdf\
-\xc4\x96\x7e\x2a\xd1\x7e\xd2\xd6\x72\x4b\x6e\x8e\x92\xda\xce\xa0\
-\x16\x86\x68\x9c\x07\x8e\x40\x19\x4e\xd7\x50\x70\xc0\xf2\x39\xaf\
-\x93\x3f\xe0\xa9\x30\x78\x4e\xe7\xf6\xd6\xf8\x07\x34\x7f\x13\x35\
-\xef\x81\x3f\x18\xb4\xab\x1d\x56\xeb\xc1\x1e\x3d\xba\xb0\xb4\xba\
-\xf0\xa9\x0c\x85\x6e\xb4\xdb\xcf\x3e\x55\xdb\x34\x89\xf7\x4e\x31\
-\xb6\x5c\x12\x49\x50\xbf\x3b\x5e\x7e\xd1\x9a\xce\xb9\xfb\x0e\xff\
-\x00\xc1\x41\xf4\xdf\x2f\xc0\x32\x78\xcf\xc1\xa6\xc2\xf7\x54\xf8\
-\x93\xf0\xe3\xed\x16\x7a\x77\x8d\x2f\x2e\x5f\x2d\x3b\x1f\x31\x95\
-\x6f\x13\x0f\xe6\x18\x0a\xa1\xf3\x1b\x23\x8d\xcc\x01\xfa\xf8\x61\
-\x64\x2b\xba\x39\x01\x6e\x9f\x21\xe7\xe9\xfe\x7a\x8a\x46\x85\x92\
-\x35\x91\xa3\x70\xad\xd1\x8a\xf0\x7d\xc1\xaf\xc7\x6f\x84\x7f\x1c\
-\xf5\xbf\x82\x5f\x1c\x7e\x11\x6a\x7f\x03\x7e\x29\x78\xb7\xe3\x46\
-\xbf\xf1\x33\xe0\xe6\xb7\xe2\x2f\x1d\x69\x1a\xb7\x89\x7f\xb7\xa1\
-\x87\x54\xb4\xd3\x7c\xfb\x59\xcc\x2d\xc5\xa4\x8b\x74\x04\x42\x3e\
-\x09\x54\x09\x8f\x9c\x83\x97\xff\x00\x04\xc5\xf8\x83\xf1\x6b\x58\
-\xf1\xf7\xc1\x5f\x88\x9e\x1a\xf1\x9d\xbe\xbf\xaa\xf8\xba\xcf\x50\
-\x9b\xc6\xfa\x67\x88\x7e\x36\x58\xeb\x13\x78\xd1\xde\xde\x66\x41\
-\x0e\x88\xca\xb3\x59\xcd\x04\xc0\x15\x8d\x32\xc0\x20\x07\x2b\x92\
-\x40\x3f\x67\x5e\x36\x8d\x37\x32\xb2\xa6\x4f\xcf\x83\x83\x8e\xb8\
-\x3d\x3f\xfa\xd5\xe7\xdf\xb4\xf7\xed\x35\xe0\xcf\xd8\xe7\xe1\x1c\
-\xde\x3a\xf8\x87\xa9\x5c\x68\xbe\x18\x86\xf2\xdf\x4f\x7b\xa8\xed\
-\x25\xba\x6f\x3a\x76\x29\x1a\xec\x8d\x59\xb9\x23\x93\x8c\x0e\xf8\
-\xaf\xc8\xef\xf8\x27\x7f\xc5\x4f\x8c\x9f\x15\x7c\x7f\xf0\x6f\xe2\
-\x6d\xaf\x8d\xa1\x6f\x1e\xf8\x9b\xc7\x6f\x07\x8e\xed\x7c\x47\xf1\
-\xa2\xc9\x63\xf1\x0e\x9e\xd7\xd2\x45\x36\x99\x17\x86\xe5\x09\x25\
-\xac\xb1\x46\x73\x00\x52\x48\x3c\xaa\x9d\xc8\x07\x91\x7e\xd8\x3e\
-\x31\xd3\x7e\x2e\xff\x00\xc1\x36\x3c\x75\xf1\x0b\xc7\x1f\x18\xfc\
-\x59\x75\xf1\xd3\x5a\xf8\xbe\xda\x26\xaf\xe0\x8b\xaf\x13\x07\xb2\
-\xb5\xb4\xb6\xba\x93\xca\xb6\x4d\x28\x8f\xdd\x2c\x29\x1a\xc8\xb3\
-\x00\x08\x39\x4c\xe1\xca\x90\x0f\xe8\x42\xe6\xd1\xec\xae\xa4\xb7\
-\x90\x15\x92\x06\x28\xe3\x3d\x18\x1c\x1a\x6e\xca\xd0\xf1\x38\xc7\
-\x8a\x35\x4f\xfa\xfb\x97\xff\x00\x43\x35\x46\x8d\x40\xc2\xf8\x98\
-\xa1\x7e\x18\xf8\xa3\x27\xfe\x60\xb7\xdc\x8f\xfa\xf6\x92\xbc\x17\
-\xf6\x77\xba\x64\xfd\x9f\xfe\x1e\xc3\xb7\x25\xbc\x2b\xa4\x92\x7a\
-\xf1\xf6\x18\x6b\xde\xbe\x28\x8c\xfc\x2e\xf1\x47\xfd\x81\x6f\xbf\
-\xf4\x9a\x4a\xf0\x0f\xd9\xb8\xcc\x3e\x03\xf8\x0c\x9e\x42\xf8\x57\
-\x4a\xdb\xff\x00\x80\x30\xd4\xe2\x15\xe8\xaf\xf1\x7e\x86\x94\xbe\
-\x23\xab\xbc\x98\xc5\x71\xb6\x48\xfe\x5f\xa6\x6b\x03\xc4\x9e\x1a\
-\xd3\x7c\x54\xf2\x7d\xaa\x35\x75\x41\x81\x91\xc7\xe7\x5d\x35\xdd\
-\xc4\x91\x0f\x31\x93\x71\xf5\xaf\x34\xf8\x8d\xf1\x81\x60\xf1\x0b\
-\x78\x4f\xc2\xba\x7c\x3e\x20\xf1\xa3\x05\x96\x68\x25\x73\x1d\x8e\
-\x8d\x1b\x7d\xd9\xef\x65\x5f\xb8\x3a\x15\x89\x73\x2c\x9f\xc2\xa1\
-\x72\xe3\xc6\xaf\x81\x58\x8b\xd2\x92\x4d\x75\xbe\xd6\xee\x75\x46\
-\xa7\x2e\xa7\x9b\x7c\x7d\xf0\x8e\x95\xf0\xa2\xca\xde\xe5\x64\x9a\
-\xe2\xef\x52\x97\xc8\xd3\xf4\xbb\x44\xf3\xaf\x75\x39\x47\x25\x21\
-\x8c\x1c\xb6\x01\xcb\x31\xc2\xa0\xc9\x62\x07\x35\xf3\x9f\x8a\x3e\
-\x09\xeb\xde\x3c\xf1\x3d\x9e\xa9\xe2\xb7\x87\xec\xf6\xef\xe6\x43\
-\xa2\xc2\xc5\xed\xb4\xf6\xec\x59\x88\x1e\x74\xa3\x07\x2d\x8d\xa0\
-\xe4\x20\xfe\x23\xf6\xc7\x81\xbe\x0e\x5a\x78\x47\x56\x9b\x55\xbe\
-\xd4\x2e\x3c\x49\xe2\xed\x52\x2f\x2f\x50\xd6\xae\xe3\x0a\xc1\x3a\
-\x9b\x7b\x78\xfa\x5b\xdb\x03\xc8\x89\x7a\xe0\x17\x2e\xd9\x63\x9d\
-\xf1\x13\xe0\xec\x3a\xe4\x57\x17\x16\xe2\x34\x68\xfe\x6c\x8f\x5c\
-\x7f\xfa\xab\xf3\x4c\xf3\x85\xde\x5f\xcd\x88\xc9\x23\xef\x3b\xf3\
-\x3e\xbb\x6a\xa1\x7d\x97\xe2\xfc\x96\x87\xa5\x87\xc6\x39\x59\x55\
-\xfe\xbd\x4f\x97\x7c\x2f\x6f\x37\x87\x24\xbd\xd2\xe4\xdc\xd0\xaa\
-\x19\x21\xcf\x65\xf4\xfe\x75\xa7\xa7\x8d\xd1\x0e\xfe\x82\xb5\x3c\
-\x5f\xe1\x8b\x8d\x23\x57\xdd\x22\x05\xf2\xe3\x2a\x5b\x3d\x6b\x33\
-\x4c\x39\x87\x1d\xb2\x73\x5f\x8c\x63\xe4\xe5\x5d\x39\x6f\x6d\x7d\
-\x4f\xa0\xa6\xd7\x26\x82\xc8\x98\x93\x23\xef\x7d\x3a\xd4\x17\x04\
-\xb2\x1c\x9e\x7f\x95\x59\x93\x76\x33\xf2\xf4\xaa\xd3\x27\x2c\x7d\
-\x73\xf8\xd3\x88\x13\xfc\x1a\x84\x5d\xfc\x62\x89\x71\xf7\x34\x9b\
-\xf7\x3f\x85\xb3\xd7\x8e\x58\x36\x21\x8f\xfd\xa1\xc1\xaf\x71\xfd\
-\x9e\x6d\xbc\xff\x00\x8d\x73\x7f\xd3\x3f\x0f\x6a\xaf\x8f\xa5\xab\
-\xd7\x85\xe9\x8d\x8b\x68\x7d\x76\x8a\xec\xcd\x15\xb2\xea\x2b\xfb\
-\xd3\xff\x00\xdb\x4d\xb0\x8f\xf7\xb2\xf4\x5f\xa9\xa8\x8d\x98\x4f\
-\xd3\x8a\xaf\x34\x79\xb8\xfa\x71\x56\xad\xd3\xcc\x1e\xd8\xa9\xe2\
-\xd3\x3c\xc5\x69\x33\x85\xee\x4d\x7c\x66\xd2\xd0\xf5\xa3\x22\x3b\
-\x75\xf2\xad\x24\xc7\xcb\xd0\x7d\x28\x88\x6c\x85\xfd\xc7\x03\xd6\
-\xaf\x69\xba\x05\xde\xad\x2f\xd9\xed\xa3\x69\xa4\x7e\x70\x3b\x0f\
-\x5c\xfb\x54\xba\xdc\x96\xbe\x16\x89\xe0\x8e\x45\xb9\xba\x5e\x25\
-\x97\x1f\x22\x1e\xe0\x7d\x2b\xeb\x72\x1c\x85\x62\x29\xfd\x7b\x1b\
-\x2f\x67\x87\x8e\xf2\xeb\x27\xfc\xb0\x5f\x6a\x4f\xee\x8e\xed\xa4\
-\x79\xb8\xac\x53\x8c\xbd\x9d\x3d\x66\xfe\xe5\xe6\xfc\xbf\x13\x07\
-\x5f\x86\x6d\x62\x18\xe1\x66\x68\xad\x57\x0a\x46\x70\xcf\xff\x00\
-\xd6\xaa\xb3\x79\x3a\x5c\x31\xc0\x88\x91\xc4\xa0\x80\xa0\x63\x1f\
-\xe7\xd6\xae\x4d\x77\xf6\x9d\xad\xcb\x29\x39\x07\xd6\xaa\x5d\xec\
-\x9a\x53\xb9\x72\xcb\xc0\xaf\xa0\xc6\x67\x33\xcc\xb9\x70\x18\x78\
-\xfb\x2c\x3c\x7e\x18\x27\xff\x00\x93\x4d\xfd\xa9\x77\x6f\x6d\x95\
-\x91\xc9\x4a\x8a\xa4\xfd\xa4\xfd\xe9\xbe\xbf\xa2\xec\x86\xcb\x67\
-\xf6\xc8\xdb\xca\x93\xaf\x38\x3d\xaa\x92\x68\x93\x1b\xe5\xf3\x43\
-\x15\x15\xa5\xa7\x42\xa1\xb8\x66\xc8\x3d\x3d\x2b\x73\x4f\xb5\xf3\
-\x26\x5c\xed\xc2\xf4\x07\xa5\x18\x3c\xa6\x4a\x77\x8a\x56\x2a\x75\
-\xb4\x33\xe1\xf0\xfa\x5e\x42\x13\x32\x47\xc6\x48\xcf\x5a\x92\xdf\
-\xe1\xdd\xba\xe9\xca\xe6\x49\x55\xb3\x91\x92\x72\x6b\xa8\xb0\xb2\
-\x31\x5a\xbb\x15\x03\xae\x2a\xc0\x81\x66\xb5\x8d\x9b\xef\x11\xf4\
-\xcd\x7d\x45\x0c\xa5\x7d\xb4\xad\xe8\x72\xcb\x10\x61\x69\x1e\x13\
-\x6b\xbb\xb0\xd2\xc8\x55\x57\x80\x0f\x5a\x7e\xb3\xf0\x57\x4e\xf1\
-\x1e\xad\xf6\xe8\x66\xb8\xd2\xf5\xa8\x46\xd8\xb5\x0b\x62\x04\xaa\
-\x3f\xba\xea\x7e\x59\x13\xfd\x86\x04\x7a\x60\xe0\x8d\x88\xc0\x37\
-\xb1\xb2\xb6\x71\xc1\xf6\xab\x56\xf7\x9e\x4c\xf2\x36\x4f\xcb\x5e\
-\xb6\x5f\x96\xd2\xc1\xeb\x49\x5b\xfa\xdb\xcd\x77\x5b\x1c\xd5\xaa\
-\x4a\xa7\xc4\x71\x3a\x7c\xff\x00\xf0\x8a\x5e\x2d\x8f\x8c\x61\x5b\
-\x16\x99\xc4\x70\xea\xd6\xe4\xff\x00\x66\xdd\x13\xd0\x33\x37\x30\
-\x48\x4e\x06\xc7\xf9\x49\x23\x6b\xb7\x4a\xea\x35\x6f\x87\xd6\x8d\
-\x6f\x95\x69\xa3\x66\x00\x82\x5b\xfc\xfa\xd6\x85\xcd\xdf\xf6\x8d\
-\x9c\xd1\xcf\x14\x57\x16\xf3\x46\x63\x92\x19\x54\x3a\x4c\xa7\xa8\
-\x65\x3d\x47\xb1\xae\x4e\x5d\x17\x57\xf0\x14\x2a\x7c\x37\xbb\x52\
-\xd2\x73\x99\x34\x4b\xa9\xb6\xf9\x03\xfe\x9d\x25\x6f\xb9\x91\x9f\
-\xdd\x48\x76\x03\x8c\x18\xc0\xe7\xd5\xfe\xc9\xc1\x62\x55\x92\x50\
-\x97\x6f\xb2\xfd\x3f\x97\xd3\x6f\x34\x73\xc6\xb5\x48\x3d\x75\x2d\
-\x2f\x86\xa6\xd3\xd2\x3b\x52\xd2\x34\x6c\x79\x6c\xd5\xe8\xf4\x2b\
-\x35\x91\x96\x3d\xde\xf9\xa6\xf8\x67\xc7\x96\x3e\x36\x96\x43\x6a\
-\x65\xfb\x45\xb8\xc5\xcd\xac\xf1\x98\xae\x6d\x1b\xfb\xaf\x19\xe5\
-\x7e\xbc\x83\xd4\x12\x39\xa2\x7b\xc6\x8a\xfa\x46\x41\x91\x82\x07\
-\x15\xc1\x87\xe1\xfa\x18\x49\x49\x4a\x16\x6d\xdd\xdc\xd2\x58\x87\
-\x3d\x6e\x5e\x4d\x12\xd6\x4b\x46\x2a\x7d\xc1\xe9\x55\x6e\x74\xd6\
-\xb3\x8d\x7c\x97\x3e\xdb\x8f\x5a\x6c\xf7\xa1\x2c\x5b\x82\x30\x7d\
-\x6a\x29\x6e\x52\x5b\x84\x3b\x99\x7f\xc6\xbd\x5a\x38\x2c\x35\x37\
-\xcd\x08\xa4\xcc\x5b\x93\xdc\x7c\x3f\x68\x84\xb6\xe0\x37\x63\x3c\
-\xf7\xaf\xb7\x3f\xe0\x84\x33\xcb\x37\xc5\xdf\x88\xcd\x22\xfd\xdd\
-\x1e\xcc\x0f\xfb\xff\x00\x2d\x7c\x43\x1c\x92\x4f\x33\xb7\x9a\x0e\
-\x78\x07\x35\xf6\xff\x00\xfc\x10\x8d\x59\x7e\x2d\xfc\x46\xdc\xdb\
-\x87\xf6\x3d\x9e\x39\xe9\xfb\xf9\x6b\xdd\xcb\x6f\xf5\x88\x7f\x5d\
-\x0e\x3c\x4f\xf0\xdd\xcf\xd3\x51\xd2\x8a\x28\xaf\xb0\x3c\x70\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xaf\x98\xff\x00\xe0\xb3\x1e\x05\xd7\
-\x7e\x28\x7f\xc1\x2d\x3e\x3c\x78\x77\xc3\x3a\x2e\xad\xe2\x2d\x7b\
-\x58\xf0\x7d\xe5\xb5\x86\x99\xa5\xd9\xc9\x79\x79\x7d\x33\x28\x0b\
-\x1c\x50\xc6\x0b\xbb\x1f\xee\xa8\x26\xbe\x9c\xaf\x9c\xff\x00\xe0\
-\xad\xff\x00\x17\xbc\x4b\xfb\x3e\xff\x00\xc1\x34\xfe\x35\xf8\xdf\
-\xc1\xba\xb4\xda\x17\x8a\xbc\x31\xe1\x5b\xab\xed\x2f\x50\x86\x34\
-\x79\x2d\x27\x41\x95\x70\x1d\x59\x4e\x3d\x08\x22\x80\x3e\x49\xff\
-\x00\x82\x1f\xff\x00\xc1\x20\xbe\x0f\x6a\x5f\xf0\x4b\x4f\x84\xf2\
-\x7c\x68\xfd\x9b\x7c\x10\xbf\x13\x3e\xcd\xa8\x0d\x68\x78\xbf\xc1\
-\x30\xc5\xad\xee\xfe\xd3\xbc\xf2\xbe\xd0\xb7\x10\x89\xb3\xe4\xf9\
-\x5b\x4b\xff\x00\x06\xcc\x7c\xb8\xaf\xab\xbf\xe1\xce\x5f\xb2\x6f\
-\xfd\x1b\x7f\xc1\x3f\xfc\x23\xac\x7f\xf8\xdd\x7c\x7b\xf0\x93\xfe\
-\x0a\x59\xf1\x7b\xc2\x1f\xf0\x6b\xcd\xaf\xed\x25\x75\xe2\x0b\x6f\
-\x12\x7c\x5a\xb3\xd2\x2e\x6f\x0e\xa9\xab\xd9\x47\x24\x77\x32\x0f\
-\x10\xc9\x66\x3c\xc8\xa2\x11\xa1\xdb\x01\x08\x30\x07\xdd\x52\x72\
-\x73\x9f\x56\x6f\xdb\x23\xc7\xdf\x1c\x3f\xe0\xdd\x0d\x5f\xe3\x75\
-\xe6\xad\xfd\x89\xf1\x17\x58\xf8\x5b\xa8\x6b\x87\x52\xd1\x03\x58\
-\xb5\x9d\xda\xc5\x2e\xd9\x60\xc3\x13\x1b\x2e\xd0\x41\x07\x20\xf3\
-\xc5\x00\x7d\xa9\xf0\x6f\xe0\xb7\x84\x7f\x67\xef\x01\xd8\xf8\x53\
-\xc0\xbe\x1b\xd1\x7c\x21\xe1\x9d\x34\xbb\x5a\x69\x3a\x45\x9a\x59\
-\xd9\xdb\x17\x76\x77\xd9\x1a\x00\xab\xb9\xd9\x98\xe0\x72\x49\x3d\
-\xeb\x83\xff\x00\x82\x8f\xff\x00\xca\x3c\xfe\x3c\x7f\xd9\x3b\xf1\
-\x07\xfe\x9b\x2e\x2b\xc1\x7f\xe0\xdd\x2f\x8c\xde\x2f\xfd\xa0\xff\
-\x00\xe0\x91\xbf\x0b\xfc\x59\xe3\xaf\x13\x6b\x9e\x2e\xf1\x36\xa5\
-\x2e\xa6\x2e\xf5\x5d\x5e\xed\xee\xef\x2e\x42\x6a\x17\x08\x9b\xe4\
-\x72\x59\xb6\xaa\x85\x19\x27\x00\x0a\xf7\xaf\xf8\x28\xff\x00\xfc\
-\xa3\xcf\xe3\xc7\xfd\x93\xbf\x10\x7f\xe9\xb2\xe2\xb4\xa3\xf1\xaf\
-\x54\x29\x6c\x70\xda\x4f\xfc\x82\xec\xff\x00\xeb\x84\x7f\xfa\x00\
-\xab\x35\x5b\x49\xff\x00\x90\x5d\x9f\xfd\x70\x8f\xff\x00\x40\x15\
-\x66\x8a\xbf\x1b\xf5\x60\x84\x2b\xbd\x82\xe3\x3b\xb8\xc7\xaf\x5e\
-\x2b\x9c\xb3\xf8\x47\xe1\x5d\x2f\xe1\x6f\xfc\x20\xb0\x78\x6f\x43\
-\x87\xc1\x4b\xa7\xb6\x91\xfd\x80\x2c\xa3\xfe\xcd\xfb\x1b\x2e\xc3\
-\x6c\x60\xc1\x4f\x2f\x69\xc6\xdc\x60\x82\x6b\x95\xfd\xb5\xbc\x71\
-\x6b\xf0\xcb\xf6\x38\xf8\xb1\xe2\x4b\xeb\x1b\xcd\x52\xc7\xc3\xfe\
-\x10\xd5\x35\x1b\x8b\x3b\x4d\x4a\x5d\x36\xe2\xee\x38\xad\x64\x76\
-\x8e\x3b\xa8\xbf\x79\x03\xb0\x18\x12\xa7\xcc\x84\xe4\x72\x2b\xc3\
-\xee\xff\x00\xe0\xa0\x9e\x3f\xff\x00\x84\x93\xe2\x36\x83\xe0\x3f\
-\x82\x6b\xe2\xcd\x2f\xe0\xe6\x8d\xa1\xea\x3a\xb5\xfd\xf7\x8d\x21\
-\xd3\xda\xe2\xd2\xf7\x41\xb5\xd5\x5a\x18\x04\xb0\xbb\xcf\x76\x8b\
-\x2b\x2e\x1c\xaa\xb8\x40\xc6\x40\xcf\xb0\x66\x33\xdf\xbe\x21\x7e\
-\xca\xdf\x0b\xfe\x2d\xe9\xbe\x1e\xb2\xf1\x5f\xc3\x9f\x03\x78\xa2\
-\xd7\xc2\x31\x24\x3a\x1c\x5a\xc6\x89\x6f\x7c\x34\x88\xd0\x2a\xa2\
-\x41\xe6\xa3\x18\xd0\x04\x51\xb4\x7c\xbf\x28\xe0\xe2\xaf\x7c\x42\
-\xfd\x9f\xbc\x03\xf1\x6b\x5a\xd2\xb5\x2f\x14\xf8\x23\xc2\x3e\x24\
-\xd4\x34\x38\x26\xb6\xd3\x6e\x75\x2d\x26\x0b\x89\xac\x21\x9a\x33\
-\x1c\xb1\x44\xec\xb9\x44\x78\xce\xd6\x41\x85\x23\xb5\x78\xc5\xb7\
-\xed\xf3\xe2\x1f\x8c\x9a\x9d\x85\xbf\xc1\x3f\x85\xcd\xf1\x1a\x18\
-\x7c\x29\xa2\xf8\xc7\x5b\xb9\xd5\x7c\x47\x0e\x81\x16\x99\x6d\xab\
-\xda\x9b\xbb\x1b\x28\xf7\x47\x31\x9a\xf9\xe0\x53\x21\x4c\x24\x68\
-\x08\x06\x4c\xb7\x16\x7c\x3b\xfb\x6a\xf8\xcb\xe2\x2f\xed\x12\xbe\
-\x05\xf0\xf7\xc2\x5b\x9b\x3b\x5b\x3f\x0d\x68\x3e\x2c\xd7\xef\xbc\
-\x4d\xad\xa6\x91\x71\xe1\xbb\x2d\x46\x4b\xb8\xe6\x8a\x6b\x70\x92\
-\xef\xba\x83\xec\xb9\x11\xa3\x15\x90\x09\x49\x74\x0a\xbb\xc0\x3d\
-\x6f\xc7\xbf\xb3\xa7\xc3\xdf\x8a\xbf\x0d\xac\x3c\x1b\xe2\x7f\x03\
-\x78\x3f\xc4\x9e\x12\xd2\xc4\x29\x61\xa3\xea\x7a\x4c\x37\x96\x36\
-\x22\x14\x11\xc2\x22\x8a\x45\x2a\x9b\x13\xe4\x5d\xb8\x21\x72\x3a\
-\x13\x55\xff\x00\xe1\x97\xbe\x18\xaf\x81\x75\xaf\x0b\x2f\xc3\x9f\
-\x02\x27\x86\x7c\x48\xd1\x3e\xa9\xa3\x2e\x85\x6c\xba\x7d\xfb\x45\
-\x1a\x47\x13\x49\x06\xcf\x2d\x99\x12\x38\xd5\x49\x5c\xa8\x8d\x70\
-\x78\x15\xf3\x27\xc1\xcf\xf8\x2d\x4f\x83\x7e\x2c\xfc\x50\xf0\xa5\
-\xaf\x91\xe0\x7b\x2f\x04\xfc\x40\xd6\x53\x42\xd0\x2e\xed\x7e\x20\
-\xe9\xb7\xfe\x27\x49\xe6\x67\x4b\x69\xaf\x74\x48\xbf\x7d\x6d\x04\
-\xcc\xa0\x65\x64\x79\x23\xf3\x63\xf3\x11\x41\x25\x7a\xcb\x1f\xf8\
-\x28\xcf\x88\x34\x2f\x8e\x5e\x05\xf0\xdf\x8d\x7e\x18\xe9\xfe\x09\
-\xd0\x7e\x27\x6b\xe9\xe1\xad\x0d\x2e\xbc\x67\x69\x71\xe2\xcb\x7b\
-\x89\x7c\xd1\x6d\x2d\xf6\x8a\x89\xbe\xde\x29\x4c\x60\x65\x65\x76\
-\x8f\xcd\x4d\xe3\x93\x80\x0f\x71\x97\xf6\x62\xf8\x6b\x71\xf0\x68\
-\x7c\x3a\x6f\x87\xbe\x09\x3f\x0f\x54\x8c\x78\x67\xfb\x1a\xdf\xfb\
-\x27\x87\xde\x0f\xd9\xb6\x79\x7b\xb7\xfc\xfb\xb6\xee\xdc\x33\x9c\
-\xf3\x45\xff\x00\xec\xc3\xf0\xd7\x54\xf8\x7f\xac\xf8\x4e\xeb\xe1\
-\xff\x00\x82\xee\xbc\x2b\xe2\x2b\xc1\xa8\xea\xba\x34\xda\x34\x12\
-\x58\x6a\x17\x41\x63\x41\x3c\xb0\xb2\x94\x69\x02\xc5\x10\x0f\x8d\
-\xc3\xcb\x4c\x11\xb4\x1a\xf0\x0f\xd9\x3f\xfe\x0a\x7d\x79\xfb\x5b\
-\xfc\x4c\xb0\xb1\xd0\x7c\x13\xe1\x99\xbc\x39\xa9\x5f\xc9\x62\xf1\
-\xda\x78\xfa\xc2\x7f\x17\x78\x7d\x51\xe5\x4f\xb4\x6a\x9a\x23\x22\
-\x49\x6d\x10\x68\xbe\x7f\x2e\x49\x1e\x3d\xeb\x95\x60\x4e\x30\x7c\
-\x0f\xff\x00\x05\xab\xf0\x67\x8c\xbe\x28\xe8\xf0\xac\x5e\x01\x83\
-\xc0\x3e\x20\xf1\x04\x5e\x18\xb0\xbf\x5f\x88\x7a\x6c\xbe\x28\x49\
-\xe5\xbb\xfb\x24\x37\x53\x68\x4b\xfb\xe8\xed\x1e\x72\xb9\x22\x46\
-\x9a\x38\xdb\xcd\x78\xc2\x06\x00\x03\xea\xcd\x0f\xe0\x57\x81\xfc\
-\x31\xa4\xf8\x63\x4f\xd2\xfc\x1f\xe1\x7d\x33\x4f\xf0\x4c\xcd\x73\
-\xe1\xeb\x5b\x3d\x36\x1b\x78\x34\x39\x5a\x37\x89\xa5\xb6\x44\x50\
-\xb1\x3b\x47\x24\xaa\x59\x40\x24\x48\xd9\x27\x35\xad\xa2\xf8\x1f\
-\x45\xf0\xdf\x88\xf5\xad\x63\x4f\xd2\x74\xeb\x1d\x5b\xc4\x92\xc3\
-\x3e\xad\x79\x05\xba\xc7\x3e\xa6\xf0\xc4\x21\x89\xa6\x71\xcc\x85\
-\x22\x55\x45\x27\xa2\xa8\x03\x8a\xf9\x63\xf6\x70\xff\x00\x82\xa4\
-\xdd\xfe\xd3\x7f\x18\xa3\xd1\xfc\x3f\xe0\x5f\x0e\x4d\xe1\xf9\x35\
-\xa9\xb4\x59\xa0\x4f\x1e\xd9\x7f\xc2\x65\xa2\x79\x57\x12\xc0\xd7\
-\x77\xfa\x13\xaa\x4b\x0c\x21\xa3\x2c\xca\xb2\xbc\x88\x8c\x1b\x61\
-\xe4\x0f\xa1\x7f\x68\xff\x00\x8f\xba\x07\xec\xb3\xf0\x27\xc5\x1f\
-\x10\xbc\x50\xd7\x03\x42\xf0\x9d\x93\x5e\x5d\x2d\xb8\x43\x34\xff\
-\x00\x32\xa2\x46\x9b\xd9\x57\x73\xc8\xc8\x80\xb9\x0a\x0b\x72\x40\
-\xc9\xa0\x0f\x13\xfd\xbc\xbe\x03\xfc\x76\xfd\xa0\x75\xf5\xd0\xfc\
-\x23\xa6\xfe\xcc\x1e\x23\xf8\x66\xd6\x70\xcb\x26\x97\xf1\x3b\xc3\
-\xf7\xda\xad\xd7\xdb\xc3\x38\x92\x44\x11\x83\x1a\xa6\xdf\x2f\x69\
-\x18\x71\xf3\x73\x8a\xf0\x5f\x8a\x3f\xb0\x4f\xed\x73\xf1\x23\xf6\
-\x50\xf1\x37\xc1\x7b\x2b\x8f\xd8\xcf\xc1\x1e\x05\xf1\x55\x91\xb2\
-\xba\xb5\xf0\xaf\x87\x75\x6d\x34\xc0\xa5\x91\x8b\xc6\x15\x0a\x09\
-\x0f\x96\xa0\xbb\x2b\x12\x07\x7a\xf4\x2f\x0d\x7f\xc1\x61\xe3\xd4\
-\x74\xbf\x17\x59\xdc\x78\x6f\xe1\xee\xad\xe2\xdd\x07\xc3\x77\x1e\
-\x31\xb1\xd3\x7c\x15\xf1\x2a\xc3\xc5\x50\x5f\xe9\xd6\x92\xc5\xf6\
-\xf8\x65\x9a\xd9\x01\x82\xf6\x1b\x77\x69\x56\x32\x8d\x1c\xa2\x32\
-\x12\x4e\x18\x8f\x53\xfd\xa2\xff\x00\xe0\xa3\x1e\x17\xfd\x9f\x35\
-\x2d\x42\xee\x4b\x13\xad\x78\x57\xc3\xfe\x06\x83\xc6\xfa\xb6\xab\
-\x6f\x7b\x1c\x02\xdd\x6f\xee\xe3\xb5\xd1\xad\x13\xcc\x22\x3d\xf7\
-\xb2\x1b\x86\xdf\x24\x88\x91\x47\x0e\xf6\x24\x13\x80\x0f\x02\xf8\
-\x0f\xfb\x1e\x7e\xd7\xdf\xb3\x5d\xbc\x6f\xe0\xe8\x7f\x62\x1d\x1f\
-\x58\x93\x4b\xb4\xd2\x6f\xf5\xbb\x6f\x0b\xea\xd0\xea\xba\xc4\x36\
-\xd1\xa4\x71\x9b\xa9\xe3\x55\x69\x5b\xf7\x6a\xc4\x9e\x0b\x00\x71\
-\x9c\x54\x9e\x0c\xfd\x8d\xff\x00\x6a\xcf\x86\xff\x00\x11\xae\xbc\
-\x65\xe1\xdf\x0c\xfe\xc0\x5e\x1f\xf1\x75\xf6\xff\x00\xb4\x6b\x7a\
-\x77\x82\x75\x3b\x5d\x42\x52\xf9\xde\x4c\xc8\xa1\xc1\x6c\x9d\xc4\
-\x10\x5b\x27\x24\x8a\xdb\x6f\xf8\x2d\x3e\x97\xa1\xfc\x36\xf8\x9d\
-\x79\xa9\xe8\x7e\x01\xd4\x7c\x55\xf0\xff\x00\xc2\x52\xf8\xd6\xd3\
-\x4f\xf0\x77\xc4\x7b\x2f\x14\x69\xfa\xa5\x94\x57\x76\xf6\xb2\xc3\
-\x25\xd5\xb2\x06\xb7\xba\x8d\xee\x22\x25\x1a\x32\xae\xa4\xb2\x3b\
-\x00\xd8\xf7\x7d\x03\xf6\xa0\xf1\x67\x87\x7e\x2f\x78\x0b\xc2\x7f\
-\x12\xbc\x07\xa7\xf8\x13\xfe\x16\x33\xeb\x4b\xa6\x5c\x41\xe2\x15\
-\xd5\x05\xab\xd8\x5b\x47\x79\x14\x57\x05\x62\x8d\x12\x69\xad\x45\
-\xdb\x95\x56\x60\x8d\x68\xca\x19\xf7\x66\x80\x3e\x6d\xd3\xbf\x63\
-\x9f\xda\xb3\x46\xf8\xb9\x37\xc4\x0b\x3f\x0c\xfe\xc0\x76\xbe\x3a\
-\xb8\x91\xa5\x93\xc4\x50\xf8\x27\x54\x8f\x54\x69\x58\x92\xd2\xfd\
-\xa0\x2e\xff\x00\x30\xf7\x7c\xee\x38\xe4\x9a\xaf\xe3\x7f\xd8\x27\
-\xf6\xa2\xf8\xa3\xe2\x2d\x6f\x5c\xd7\xfc\x0f\xff\x00\x04\xff\x00\
-\xd7\xb5\x8f\x12\x42\x90\x6a\xba\x8d\xe7\x81\x35\x59\xee\xb5\x24\
-\x46\x46\x55\x96\x52\xbb\xdf\x0d\x14\x67\x93\x9c\xa2\xe7\xa0\xaf\
-\xb1\x3f\x65\x4f\x8e\xd2\x7e\xd3\x7f\xb3\xe7\x87\xfe\x20\x36\x8e\
-\xda\x05\x97\x8b\x12\x6b\xfd\x32\xd6\x49\xbc\xd7\x93\x4e\x33\xca\
-\xb6\x97\x0c\x76\x8d\xad\x3d\xba\xc5\x31\x41\x9d\xbe\x68\x5c\x9c\
-\x03\x5f\x15\xfc\x7d\xf0\x7e\xb3\xa9\xfc\x6b\xf8\xd9\xf1\x1b\xe2\
-\x7f\xc2\x7f\xda\x3f\x55\xf0\x0e\x8f\xae\x48\xb6\xda\x9f\x85\xfe\
-\x21\xbe\x83\x6b\xa3\x78\x7e\xc3\x4e\xb6\x8d\xae\xad\xf4\xd8\xaf\
-\xa1\x96\xf0\x3c\x91\xdc\xdc\x3b\x88\xc1\xda\x7e\x5d\xe4\x11\x40\
-\x1f\x7f\xfc\x39\x6f\x13\x1f\x02\x69\x0d\xe3\x49\xf4\x7b\xaf\x17\
-\xb5\xa4\x67\x5a\x9b\x49\x49\x12\xc2\x5b\xbc\x66\x56\x81\x64\x25\
-\xc4\x65\xb2\x54\x37\x38\xad\xba\xcf\xf0\xd6\xa9\x63\xae\xf8\x77\
-\x4f\xbd\xd2\xee\xe3\xbe\xd2\xef\x2d\x21\x9e\xce\xe6\x39\x0c\x8b\
-\x71\x03\xc6\xad\x1c\x81\x9b\x96\xdc\xa5\x4e\x4f\x27\x39\xad\x0a\
-\x00\xc3\xf8\x9c\x33\xf0\xcb\xc5\x1f\xf6\x05\xbe\xeb\xff\x00\x5e\
-\xd2\x57\xce\x9f\x02\x25\x97\x4d\xfd\x9d\x7c\x02\x44\xca\x55\xbc\
-\x2d\xa5\x31\x24\xfd\xd1\xf6\x28\x49\x27\xd8\x0e\xf5\xf4\x5f\xc4\
-\xe1\x9f\x86\x3e\x28\x19\xdb\x9d\x16\xf8\x67\xfe\xdd\xa4\xaf\x85\
-\x7e\x0a\xf8\x73\x59\xf8\xe5\xf0\x73\xc0\xb1\x78\xaa\xde\xe3\x45\
-\xf0\x3d\xb7\x87\x74\xd4\x8f\xc3\xe9\x27\xfa\x56\xbd\xb2\xd6\x25\
-\x12\x5e\xba\x1c\x2d\xbb\x10\x0a\xdb\x21\x25\x97\x1e\x63\x10\x4c\
-\x63\x4a\x94\xd4\xb0\xf7\x93\xb2\xe6\xfd\x3a\x77\xfe\xae\x54\x7e\
-\x23\xbe\xd4\xfe\x28\xeb\xbf\x1b\x2e\x9b\x4b\xf0\x25\xe1\xd3\x7c\
-\x37\x1c\x86\x1b\xef\x17\xf9\x61\xc5\xc6\x0e\x1e\x1d\x31\x58\x15\
-\x99\xb8\x2a\x6e\x0e\x62\x42\x3e\x51\x23\x7d\xde\xcb\xe1\xc7\x82\
-\x34\x3f\x86\xba\x02\xe9\x1a\x2d\x88\xb3\xb4\x8e\x46\x96\x56\x77\
-\x32\xcd\x75\x33\x72\xf3\x4b\x23\x12\xf2\xca\xc7\x96\x77\x25\x8f\
-\xd3\x00\x5a\xb4\x6b\x5b\x74\x82\x1b\x78\xe3\x82\x0b\x78\xd6\x18\
-\xe3\x8d\x02\x47\x0a\xaf\x01\x55\x47\x0a\x07\x4c\x0f\x4a\x51\x70\
-\xd1\xa3\x3f\xc8\xdb\x8e\x4f\x35\xe6\xe2\x2b\x73\x7b\x91\xd2\x3f\
-\x9f\x9b\x7d\xce\x88\x46\xde\xa5\xa1\x3a\x99\x24\x97\x6f\x1d\x8f\
-\xad\x36\xf8\xaa\xda\x85\x5f\x95\x64\xe4\xab\x77\xe6\x91\xef\xcf\
-\x93\x14\x7b\x55\xb7\x7a\x53\x6e\x6e\x95\xef\x55\x64\x45\xc0\x1f\
-\x9d\x70\xd4\x8a\x48\xd2\x27\x9c\x7c\x61\xf8\x79\x16\xbd\xa5\x15\
-\x83\x6f\x9a\x47\x65\xe9\x5e\x21\x37\x82\x2f\xbc\x3d\x13\x3c\x91\
-\xb4\xa8\x01\xe5\x7b\x57\xd4\x5a\xc5\xe5\xad\xd5\xdc\x91\xc4\xbb\
-\x98\x0e\x80\x56\x0c\x5e\x06\x59\xec\x6e\x1a\x6d\x8c\x26\xce\xd5\
-\xda\x38\xaf\xcc\x78\xa3\x82\x63\x8d\xab\xf5\x9c\x2b\xe5\x9d\xb6\
-\xe8\xcf\x53\x07\x8f\x95\x35\xcb\x2d\x8f\x9a\x99\x08\x5e\x9f\x85\
-\x57\x9d\x8a\xa9\xe9\xf3\x0e\x2b\xbf\xf8\x89\xf0\xd2\x6d\x1e\xf6\
-\x46\x8a\x3d\xab\xd7\x67\xa5\x79\xf5\xf2\x35\xb1\xc3\x29\x53\x9c\
-\x10\x47\xeb\x5f\x94\x54\xc2\x55\xc3\xcd\xd2\xad\x16\xa4\x8f\x62\
-\x35\x63\x35\x74\x74\x3f\xb2\xec\x3e\x7f\xc6\x9d\x5f\xfe\x99\xf8\
-\x47\x5a\x94\x9f\x40\x2d\x1e\xbc\x07\x43\x5d\xd6\x90\xf1\xfc\x03\
-\xf9\x7f\xf5\xcd\x7d\x15\xfb\x21\x41\xe7\xfc\x59\xf1\x73\x60\xfe\
-\xe3\xc0\x5a\xf4\xa3\xdf\x16\x8d\x5f\x3f\x68\xd0\x2c\x16\xb1\xbb\
-\x7d\xe0\xa3\xf2\xc5\x6f\x98\xd2\x94\xf0\x34\x23\x15\xad\xe7\xff\
-\x00\xb6\x9d\x18\x59\x5a\x72\x7e\x4b\xf5\x36\xf4\xed\x3c\x79\x5b\
-\x9b\x0a\xb8\xf4\xae\x9f\xc1\x1f\x0f\xb5\x3f\x1d\xdf\x32\x5a\xaa\
-\xdb\xd8\x5a\x8d\xf7\x77\xb2\xfc\xb0\x5b\xa7\xa9\x6f\x5e\xa7\x19\
-\xfd\x2b\xa0\xf8\x3b\xf0\x2a\x4f\x1a\xf8\x76\x6f\x14\x78\x82\xeb\
-\xfb\x07\xc1\x3a\x7b\x11\x36\xa1\x27\x06\xe5\x81\xff\x00\x55\x00\
-\x3f\x7d\x8f\x23\x38\x23\xea\x72\x2a\x5f\x88\x7f\x15\xad\x7c\x4d\
-\x68\xba\x1e\x83\x69\xfd\x8b\xe1\x7b\x31\x88\x6d\x57\x89\x2e\xbd\
-\x24\x98\x83\x92\xc7\xae\x33\xdc\xf5\xaf\x7b\x24\xe0\xaa\x34\x69\
-\xac\x6e\x69\x7b\x3d\x63\x05\xa3\x97\xf9\x47\xcf\xaf\x43\x2c\x46\
-\x3e\x72\x97\xb3\xa1\xbf\x57\xdb\xfc\xd9\x81\xe3\x5f\x11\xdb\xe8\
-\x5a\x5f\xf6\x5f\x85\x76\x9b\x44\x6c\x5c\xdd\xb0\xfd\xf5\xe6\x07\
-\x6e\xe1\x79\x3f\xfd\x6e\xfe\x7c\xd7\xf0\x96\xf2\xe4\x55\x45\x1c\
-\x72\x30\x2b\xaa\xbc\x8a\x3d\xed\xb7\xb9\xe4\x81\xd6\xb1\x75\x9d\
-\x32\x21\xfc\x2a\x7b\x12\x45\x4e\x71\x0a\x98\xda\x89\xe2\xb4\x8c\
-\x74\x8a\x8a\xb4\x62\xbb\x25\xfa\xee\xfa\x8f\x0f\x6a\x69\xa8\xee\
-\xf7\xf3\xf5\x66\x2d\xf5\xe4\x71\x3a\x81\x24\x64\x2f\x00\x29\xe9\
-\x54\xfe\xd3\xe7\x4a\x76\xff\x00\x17\x7a\xbc\x74\x08\xfc\xce\x9f\
-\xad\x47\x7b\xa6\xc3\xa6\x46\xd3\x4d\x34\x50\xdb\xc4\xa5\xdd\xe4\
-\x70\x8b\x18\x03\x25\x98\x9c\x00\x07\xa9\xad\x32\x9c\x99\x53\x92\
-\xa9\x06\xe5\x7d\x89\xa9\x5a\xfa\x32\x6b\x34\x2a\xca\xde\xb5\xab\
-\x6b\x23\x01\xb8\x7c\xbf\x4a\xe2\xed\xbe\x33\x78\x2e\x31\xff\x00\
-\x23\x6f\x86\x54\x77\xce\xa7\x08\xcf\xe1\xbb\x8a\xbf\x6d\xf1\xaf\
-\xc1\x38\x3f\xf1\x57\x78\x5f\xff\x00\x06\xb0\x7f\xf1\x55\xf6\x14\
-\xf2\xbc\x4a\x5a\x53\x97\xdc\xce\x59\x56\x83\xea\x8f\x45\xd3\xaf\
-\x24\x92\xcb\x6e\xed\xc7\x8e\x33\xd6\xaf\x5f\x5a\xba\xd9\xc3\xf2\
-\x81\xef\xdf\xf0\xaf\x37\xb3\xf8\xf7\xe0\xbb\x79\x57\x1e\x32\xf0\
-\xba\x85\x1c\xff\x00\xc4\xd6\x0f\xfe\x2a\xba\x58\xbf\x68\x7f\x03\
-\xdc\x43\x0e\x3c\x6b\xe1\x13\xc7\x57\xd5\xa0\x1b\x7f\xf1\xea\xf5\
-\xe8\xe5\xf8\x86\xad\x28\x4b\xee\x67\x2c\xea\x45\x6c\xce\xa2\xce\
-\xea\x30\xe5\x4c\x5b\x76\x8c\x50\x2d\x60\xbd\x49\x19\x72\xb8\xea\
-\x4f\xf1\x57\x20\x7f\x68\x3f\x02\xc5\x23\x33\x78\xc3\xc2\x8d\xce\
-\x32\x35\x58\x39\xff\x00\xc7\xa9\x0f\xc7\xff\x00\x02\xc9\x03\x6d\
-\xf1\x97\x85\x7e\x6e\xdf\xda\xb0\x7f\xf1\x55\xd7\x4f\x03\x5e\xd6\
-\x70\x7f\x73\x33\xf6\x91\xee\x75\x56\xf6\xab\x15\x9b\x28\x75\xc7\
-\x34\xb3\xac\x81\x90\x79\x8b\x8d\xa4\xfb\x9a\xe1\xe2\xf8\xff\x00\
-\xe0\x41\x6d\x87\xf1\x8f\x85\xf9\xe3\x03\x55\x83\x8f\xfc\x7a\x95\
-\xbe\x3d\x78\x1a\x66\x5d\xde\x33\xf0\xaa\xed\x18\x07\xfb\x56\x0e\
-\x3f\xf1\xea\xda\x38\x0a\xfd\x60\xfe\xe6\x0e\x71\xbe\xe6\x9f\x8b\
-\x7c\x1d\x0f\x89\xef\xe3\xba\x76\x9a\xc3\x54\xb5\x5d\x96\xda\x8d\
-\xa9\x09\x75\x08\x3d\x57\x76\x30\xe8\x7b\xa3\x65\x4f\xa6\x6b\x2a\
-\x0f\x1b\x6a\x1e\x0c\x73\x0f\x8a\xe2\x89\x6d\xd8\xec\x8f\x5a\xb7\
-\x42\x96\x4e\x4f\x03\xce\x07\x26\xdd\x8f\xab\x12\x84\xff\x00\x10\
-\xe0\x53\x57\xe3\xbf\x81\xc5\xd4\x98\xf1\xa7\x85\xf6\x91\x8c\x9d\
-\x56\x0e\x7f\xf1\xea\xaf\xff\x00\x0b\xcf\xc1\x32\xdb\xcd\x1c\x9e\
-\x31\xf0\x9b\x47\x26\x55\x92\x4d\x52\x06\x47\x07\xa8\x20\xb7\x22\
-\xbd\x0a\x34\xeb\xf2\xfb\x2a\xd4\xdc\xa3\xd3\x47\x75\xe8\xed\xf8\
-\x6c\x63\x2e\x5b\xde\x2d\x5c\xeb\x2e\x6f\x58\xd8\x47\x84\xdc\xb2\
-\xa8\x60\xcb\xc8\x60\x7d\x2a\xad\xbd\xc6\x6e\x15\x5a\x30\x36\xf7\
-\xcd\x79\xcc\xde\x3e\xf0\xcf\x83\xe2\x37\x1e\x1b\xf1\xcf\x83\xde\
-\xc8\x31\x79\x74\x59\xf5\xa8\x16\xdd\xb3\xd7\xec\xef\xb8\x98\x5b\
-\xfd\x9f\xf5\x64\x9e\x8b\xd6\xaf\xf8\x7f\xf6\x99\xf0\x3f\x88\x91\
-\x6e\x17\xc4\xba\x0d\x9b\x29\x31\xcd\x05\xd5\xf4\x31\xc9\x13\x8e\
-\xa3\xef\x6d\x6f\xf7\x94\x95\x3d\x41\x35\x55\xb2\xaa\xd1\x5e\xd2\
-\x9a\x6e\x3e\x8d\x35\xea\xbf\xa4\x4f\xd6\x23\xb3\x7a\x9d\xe2\x18\
-\x5e\xe9\x94\x0e\x57\xd0\xf1\x5f\x73\x7f\xc1\x08\x20\x58\xbe\x2c\
-\xfc\x44\x60\x73\xbb\x47\xb3\xcf\xaf\xfa\xf9\x6b\xf3\xc2\xdf\xe3\
-\x8f\x81\xdb\xcd\x3f\xf0\x97\x78\x55\x77\x1e\x7f\xe2\x6b\x07\x1f\
-\xf8\xf5\x7d\x9d\xff\x00\x04\x59\xfd\xad\xfe\x12\xfc\x35\xf8\x9d\
-\xe3\xeb\x8f\x10\x7c\x50\xf8\x7b\xa1\x43\x75\xa5\x5a\x24\x2f\xa8\
-\xf8\x8a\xd2\xd5\x66\x61\x34\x85\x82\x97\x90\x64\x8c\x8e\x06\x7a\
-\x8a\xea\xcb\xb0\x95\x95\x78\xb7\x17\xd7\xa3\xec\x73\xe2\x2a\x45\
-\xc1\xa4\xcf\xd7\x61\xd2\x8a\xf1\x71\xff\x00\x05\x1c\xfd\x9e\xf1\
-\xff\x00\x25\xd7\xe0\xe7\xfe\x16\x7a\x77\xff\x00\x1e\xa5\xff\x00\
-\x87\x8e\x7e\xcf\x7f\xf4\x5d\x7e\x0e\x7f\xe1\x67\xa7\x7f\xf1\xea\
-\xfa\xaf\x63\x53\xf9\x5f\xdc\x79\x77\x47\xb3\xd1\x5e\x31\xff\x00\
-\x0f\x1c\xfd\x9e\xff\x00\xe8\xba\xfc\x1c\xff\x00\xc2\xcf\x4e\xff\
-\x00\xe3\xd4\x7f\xc3\xc7\x3f\x67\xbf\xfa\x2e\xbf\x07\x3f\xf0\xb3\
-\xd3\xbf\xf8\xf5\x1e\xc6\xa7\xf2\xbf\xb8\x2e\x8f\x67\xa2\xbc\x63\
-\xfe\x1e\x39\xfb\x3d\xff\x00\xd1\x75\xf8\x39\xff\x00\x85\x9e\x9d\
-\xff\x00\xc7\xa8\xff\x00\x87\x8e\x7e\xcf\x7f\xf4\x5d\x7e\x0e\x7f\
-\xe1\x67\xa7\x7f\xf1\xea\x3d\x8d\x4f\xe5\x7f\x70\x5d\x1e\xcf\x45\
-\x78\xc7\xfc\x3c\x73\xf6\x7b\xff\x00\xa2\xeb\xf0\x73\xff\x00\x0b\
-\x3d\x3b\xff\x00\x8f\x51\xff\x00\x0f\x1c\xfd\x9e\xff\x00\xe8\xba\
-\xfc\x1c\xff\x00\xc2\xcf\x4e\xff\x00\xe3\xd4\x7b\x1a\x9f\xca\xfe\
-\xe0\xba\x3d\x9e\x8a\xf1\x76\xff\x00\x82\x8f\x7e\xcf\x80\x7f\xc9\
-\x74\xf8\x39\xff\x00\x85\x9e\x9d\xff\x00\xc7\x6b\xd8\x34\x9d\x5a\
-\xdf\x5d\xd3\x6d\xef\x2c\xee\x21\xba\xb3\xbc\x89\x66\x82\x78\x64\
-\x12\x47\x34\x6c\x01\x57\x56\x1c\x32\x90\x41\x04\x70\x41\xa9\x95\
-\x39\x47\xe2\x40\x58\xa2\x8a\x2a\x40\x28\xa2\x8a\x00\x2b\xe4\xff\
-\x00\xf8\x2e\x93\x67\xfe\x09\x03\xfb\x44\x8f\xfa\x92\xaf\x7f\xf4\
-\x11\x5f\x58\x57\x39\xf1\x57\xc7\x1a\x27\xc3\x1f\x87\x3a\xf7\x89\
-\x3c\x4d\x75\x6f\x65\xe1\xdf\x0f\xe9\xd3\xea\x5a\x9d\xc4\xeb\xba\
-\x38\x2d\xa1\x8d\xa4\x95\xd8\x73\x90\x15\x49\xc7\x39\xc5\x00\x7f\
-\x2c\x5a\x57\xfc\x17\x8f\xc1\xfa\x7f\xfc\x10\x31\xbf\x63\xf6\xf0\
-\x1f\x89\x9b\xc4\xcd\xa5\xcb\x61\xff\x00\x09\x00\xbb\x83\xec\x3b\
-\xdf\x59\x6d\x40\x1f\x2f\xfd\x66\x02\x10\x9e\xbb\xbd\xb9\xaf\x46\
-\xf0\x2f\xfc\x1c\xa1\xe0\x4f\x09\x7f\xc1\x18\x7f\xe1\x97\xa5\xf8\
-\x67\xe2\xe9\xf5\xcf\xf8\x40\xee\x7c\x23\xfd\xb4\x9a\x85\xba\xd9\
-\x99\xa5\x49\x14\x4d\xb3\x1b\xf6\x02\xe0\xe3\xaf\x18\xaf\xac\x9f\
-\xfe\x0e\xee\xd0\xe6\xf1\xad\xc6\xbb\x69\xfb\x29\xf8\xaa\xeb\xe0\
-\x65\xa6\xa4\x34\xe9\x7c\x66\xb3\x8f\x39\x13\x78\x51\x21\x8b\xec\
-\xbf\x67\x59\x30\x46\x20\x37\x39\x39\x03\x78\xce\x2b\xeb\x5f\xf8\
-\x28\x57\xfc\x1c\x0b\xfb\x35\xfe\xc1\xff\x00\x0a\x3c\x3d\xab\xda\
-\xad\x9f\xc4\x8f\x16\xf8\xd7\x47\xb6\xd7\x3c\x3f\xe1\x8d\x12\x28\
-\x85\xc4\xd6\xb7\x31\x09\x2d\xe6\xba\x90\xa9\x16\xb1\xba\xb2\x9f\
-\x98\x34\x84\x1f\x96\x36\x00\x9a\x00\xb7\xff\x00\x06\xb8\xbe\x7f\
-\xe0\x89\xbf\x08\xbf\xeb\xb6\xad\xff\x00\xa7\x2b\xaa\xfa\x83\xfe\
-\x0a\x3f\xff\x00\x28\xf3\xf8\xf1\xff\x00\x64\xef\xc4\x1f\xfa\x6c\
-\xb8\xae\x6f\xfe\x09\x57\xf1\xe7\xe2\x27\xed\x3d\xfb\x11\xf8\x3f\
-\xc7\x9f\x14\xbc\x12\x9f\x0f\x7c\x5d\xe2\x49\x2f\x6e\xa4\xd0\x17\
-\x4f\x96\xc0\x69\xf6\xdf\x6a\x94\x5a\x8f\x2a\x5f\xde\x7c\xd0\x08\
-\xdb\x73\x60\xb6\xed\xc0\x00\xc0\x0e\x93\xfe\x0a\x3f\xff\x00\x28\
-\xf3\xf8\xf1\xff\x00\x64\xef\xc4\x1f\xfa\x6c\xb8\xad\x28\xfc\x6b\
-\xd5\x0a\x5b\x1c\x36\x93\xff\x00\x20\xbb\x3f\xfa\xe1\x1f\xfe\x80\
-\x2a\xcd\x56\xd2\x7f\xe4\x15\x69\xff\x00\x5c\x23\xff\x00\xd0\x05\
-\x26\xb9\xad\xd9\xf8\x6b\x45\xbc\xd4\xb5\x2b\xab\x6d\x3f\x4f\xd3\
-\xe0\x92\xea\xea\xea\xe6\x41\x1c\x36\xd1\x46\xa5\xde\x47\x66\xe1\
-\x55\x54\x12\x49\xe0\x01\x9a\x2a\xfc\x6f\xd5\x82\x38\xff\x00\xda\
-\x7f\xe0\xc9\xfd\xa3\xbf\x66\xbf\x88\x3f\x0f\x57\x50\x5d\x21\xbc\
-\x75\xe1\xcb\xfd\x00\x5f\x18\x7c\xe1\x67\xf6\x98\x1e\x1f\x37\x60\
-\x20\xb6\xdd\xf9\xda\x08\xce\x3a\xd7\x07\xf0\xcf\xf6\x32\x6f\x87\
-\xba\x97\xc6\x6b\x93\xe2\x24\xba\x3f\x17\x34\xad\x1f\x4c\x2a\x2c\
-\x8a\xff\x00\x66\x7d\x83\xc3\xd0\x68\xc5\xf9\x7f\xde\x6f\x30\xf9\
-\xd8\xf9\x76\x86\xdb\x93\x8c\x9e\xb2\xcf\xf6\xc7\xf8\x3f\xa8\x45\
-\xac\xc9\x6f\xf1\x6b\xe1\x94\xc9\xe1\xbb\x18\xf5\x3d\x58\xa7\x8a\
-\x2c\x4f\xf6\x65\xab\x85\x29\x3c\xff\x00\xbc\xfd\xdc\x6d\xbd\x30\
-\xcd\x80\x77\x2f\xf7\x86\x6e\x5e\x7e\xd5\x1f\x0b\xf4\xef\x07\xe8\
-\xbe\x22\xb8\xf8\x95\xe0\x08\x3c\x3d\xe2\x48\x6e\x6e\x34\x9d\x55\
-\xfc\x43\x6a\xb6\x3a\x9c\x76\xc9\xbe\xe5\xe0\x9b\xcc\xf2\xe4\x11\
-\x2f\x2e\x55\x8e\xce\xf8\xac\xc6\x78\x77\x82\x7f\xe0\x9e\x9e\x36\
-\xf8\x0d\xa3\x68\x0b\xf0\xa7\xe2\xf5\xb7\x82\xf5\x29\x3c\x11\xe1\
-\xef\x05\xf8\xb2\x4b\xef\x0a\x43\xab\xdb\xeb\x47\x46\xb1\xfb\x15\
-\xb6\xa7\x6c\x8d\x32\x35\xad\xd8\x88\xba\x7c\xcd\x2c\x64\x6c\xca\
-\x92\x99\x6f\x48\xf8\x0f\xfb\x22\x45\xf0\x2f\xe2\xef\x88\x3c\x44\
-\x3c\x45\xa9\x78\x9a\xc7\x5a\xf0\x5e\x81\xe0\xff\x00\x2b\x58\x2d\
-\x73\x7f\x30\xd3\x1a\xfc\xbd\xcd\xcd\xc1\x6f\xdf\x3c\xff\x00\x6d\
-\x39\xf9\x46\xd2\xa7\xb1\x00\x74\xb6\x9f\xb5\xbf\xc2\x7b\xfb\xcf\
-\x0b\xdb\xc3\xf1\x4b\xe1\xbc\xd7\x1e\x38\x52\xde\x1d\x8e\x3f\x13\
-\x59\x33\x6b\xc0\x36\xcf\xf4\x50\x24\xfd\xf7\xcf\xf2\xfc\x99\xf9\
-\x81\x5e\xbc\x57\x73\xac\x6a\xf6\x7e\x1d\xd2\x6e\xb5\x0d\x46\xea\
-\xd7\x4f\xd3\xec\x22\x69\xee\xae\xae\xa6\x58\x20\xb6\x8d\x46\x59\
-\xe4\x91\x88\x54\x50\x01\x25\x98\x80\x00\x39\xa0\x0f\x95\x7e\x04\
-\xff\x00\xc1\x32\xae\xfe\x07\xf8\x9f\xc2\xfa\x5d\xbf\x8d\xb4\x19\
-\xbe\x18\xf8\x16\xf1\x6f\x74\x5d\x36\xdb\xc0\xf6\x16\x7e\x25\x90\
-\x23\x39\xb7\xb4\xbb\xd6\x17\x2f\x35\xbc\x25\x94\xe5\x22\x8e\x59\
-\x3c\xb8\xc3\xc8\x70\xdb\xb8\x8f\x85\xdf\xf0\x46\x9b\xcf\x86\x9e\
-\x2f\xf8\x77\x78\xbe\x3c\xf0\x74\xf6\x5f\x0c\xfc\x6d\x63\xe2\xfb\
-\x29\xed\xbe\x1e\x5a\xda\x6b\xde\x22\x6b\x7b\x86\x95\x86\xad\xaa\
-\x09\x9a\x7b\x99\xd9\x5d\x87\x98\x82\x35\x2e\xdb\xdd\x5f\x00\x0f\
-\x68\xfd\xa1\x7f\xe0\xa5\x7f\x09\xbe\x08\xfe\xc8\x5e\x2a\xf8\xc3\
-\xa5\x78\xdb\xc1\x3e\x38\xd0\xfc\x3e\x5a\xce\xd1\x34\x8f\x12\x5a\
-\x4b\x1e\xab\xa9\x94\x67\x8b\x4e\x49\x91\x9d\x56\x77\x55\x76\xdb\
-\x82\xde\x5a\xbb\x85\x60\xbc\xfa\x37\xec\xe7\xf1\x4e\xf3\xe3\x77\
-\xc0\xad\x03\xc5\x77\x12\x78\x36\xe2\xeb\x5a\xb7\x92\x60\xfe\x16\
-\xd7\x4e\xb5\xa3\x4a\x56\x57\x8c\x79\x17\x9e\x5a\x79\xab\x95\xc3\
-\x30\x4e\x1c\x38\xe7\x6e\x48\x07\x80\xea\xff\x00\xf0\x4c\x9d\x6b\
-\xc7\x5f\x19\x7c\x2f\xad\x78\xcb\xe2\x36\x85\xe2\xcd\x17\xc1\x7e\
-\x21\xb6\xf1\x1e\x95\xa8\x5c\xf8\x1e\xd6\x2f\x1b\xbb\xdb\x5c\xfd\
-\xa2\x0b\x5b\x8d\x71\x64\xdd\x24\x2b\x84\x8d\x98\x42\xb2\x49\x12\
-\x6d\x62\x32\x49\x9b\xe1\x77\xfc\x13\x22\xeb\xe1\x3f\x8b\xf4\x6d\
-\x2f\x4d\xf1\x97\x86\xe3\xf8\x53\xe1\xed\x63\xfb\x6a\xc3\x46\x4f\
-\x02\x58\x2f\x89\x10\x0b\x86\xb9\x4d\x3d\xf5\x9e\x5d\xec\xd6\x56\
-\xc1\xfd\xd0\x99\xa2\xfd\xd1\x97\x19\x34\x78\x93\xf6\xb9\xfd\xa1\
-\xbe\x1e\xfc\x70\xf8\x7b\xe0\xbd\x73\xe1\x3f\xc1\xfb\x9b\xcf\x1f\
-\x6a\xdf\x66\x8e\xdf\x41\xf1\xd5\xf5\xee\xa1\x65\xa6\xc4\x43\x5e\
-\x6a\x6f\x0b\xd8\xc6\x8b\x6f\x6e\x85\x43\x33\xba\x83\x24\x91\xc6\
-\x32\xcc\x05\x7d\x2b\xe3\xdf\x8a\x3e\x17\xf8\x55\x0d\x94\xfe\x28\
-\xf1\x2e\x83\xe1\xab\x5d\x52\xf3\xec\x16\x53\xea\xd7\xf1\x58\xc7\
-\x75\x39\x47\x90\x44\x8d\x23\x2a\x97\x31\xc7\x23\xed\x07\x38\x46\
-\x3d\x01\xa0\x0f\x98\x7e\x22\xff\x00\xc1\x30\xb5\x8f\x8c\x9f\x15\
-\x74\x6b\xef\x18\x7c\x44\xd1\x3c\x49\xe1\xaf\x0f\x78\x92\xdb\xc4\
-\xba\x7d\xdd\xd7\x82\xad\xbf\xe1\x38\xb6\x36\xf7\x8b\x77\x0d\x98\
-\xd7\x84\x81\xfc\x85\x65\x11\xef\xf2\x84\xa6\x11\xb3\x77\xf1\x57\
-\xd0\xbf\xb4\xbf\xc0\x4d\x0f\xf6\xad\xf8\x15\xe2\x9f\x87\xfe\x26\
-\x6b\xc8\x74\x6f\x16\x5a\x9b\x69\xe5\xb2\x2b\x1c\xf6\xac\x1c\x49\
-\x1c\xb1\x6e\x52\xa1\xe3\x91\x11\x94\x30\x2b\xf2\xe0\x82\x32\x2a\
-\x3d\x0b\xf6\xa3\xf8\x63\xe2\x7f\x87\x96\xfe\x2e\xd3\x3e\x23\x78\
-\x0f\x50\xf0\x9d\xd6\xa1\x16\x95\x0e\xb5\x6d\xaf\x5a\xcd\xa7\xc9\
-\x79\x23\x84\x8e\xdb\xce\x57\x28\x25\x67\x65\x50\x84\xee\x24\x8e\
-\x39\xae\x7f\x43\xfd\xb0\xbc\x11\xac\xf8\x8e\xf6\xfa\x0f\x1f\x7c\
-\x29\xb9\xf8\x7f\x0f\x87\xed\x35\x88\x35\xbb\x6f\x15\xc1\x24\xee\
-\xd3\x5f\x49\x64\x19\xe3\x1f\xbb\x5b\x43\x32\x08\x92\x71\x21\xdd\
-\x36\xf8\xf6\x82\xbc\x80\x73\x7f\xb3\x5f\xec\x7b\xe2\x2f\x85\xff\
-\x00\x11\xee\x3c\x4f\xe3\x9f\x16\xf8\x3b\xc5\x57\x71\xe9\x92\xe8\
-\xd6\x76\x7e\x1b\xf0\x15\x97\x85\x6c\xa5\x86\x56\x43\x35\xc5\xda\
-\xc4\xd2\x3c\xf7\x0e\xab\xb3\x87\x48\x95\x0b\x05\x40\x58\x9a\xe5\
-\xfe\x1e\xff\x00\xc1\x2b\x7c\x31\xe1\x8f\xd9\x6b\xe2\x2f\xc2\xcd\
-\x5b\xc4\x5a\xae\xb1\x63\xe3\x8b\xf8\x1e\xcf\x54\xfb\x3c\x6b\x77\
-\xa0\xd8\xe9\xc6\x35\xd0\xad\x23\x0d\xb9\x65\x1a\x7c\x70\xc4\xab\
-\xbc\x15\x90\xef\xdc\xa0\x39\x15\xe8\x9e\x3f\xfd\xbe\x3e\x10\xf8\
-\x23\xe0\xc7\x8f\x3c\x6f\x6b\xf1\x1b\xc0\x7e\x22\xd3\x3e\x1c\xdb\
-\x4b\x26\xaf\x1e\x97\xe2\x4b\x29\xda\x09\xd4\x11\x1d\xa3\x15\x90\
-\xaa\x4d\x34\x81\x62\x40\xd8\xdd\x23\x85\x19\x3c\x57\x5d\xfb\x3a\
-\x7c\x7a\xf0\xcf\xed\x43\xf0\x77\xc3\xfe\x36\xf0\x96\xad\xa5\xea\
-\xfa\x46\xbb\x69\x14\xe5\xac\x2f\xa3\xbc\x4b\x29\x9a\x34\x79\x6d\
-\x5e\x48\xc9\x5f\x36\x16\x7f\x2d\xc7\xf0\xb2\xe3\x14\x01\xf3\x7f\
-\x8c\x7f\xe0\x98\x5e\x26\xf8\xb7\xf0\x5b\xe2\x6f\x87\x7c\x5d\xf1\
-\x13\xc2\x0d\xac\x78\xeb\xc3\x12\x78\x52\xc2\xe7\xc3\x3f\x0f\x6d\
-\x3c\x3d\xa7\x69\x90\xbd\xcc\x37\x12\x5d\xcd\x6f\x0c\x86\x4b\x8b\
-\xa7\x30\x22\x67\xcd\x58\xd5\x32\x15\x01\x39\xad\x6f\xf8\x2b\xcf\
-\x80\xe4\xfd\xa2\x3e\x07\xe8\x3f\x0c\x34\x1b\x2f\x15\x7f\xc2\xc0\
-\xf1\x6f\x88\xac\x6e\x7c\x39\xa8\xe9\x3a\x74\xd2\x41\xa1\x08\xa7\
-\x48\xb5\x0b\xbb\x9b\xc5\x53\x0d\xb4\x6b\xa6\xdc\x5e\x8d\xb2\xba\
-\xb4\x82\x4d\xa8\xae\x78\xae\xdb\xf6\x41\xfd\xbf\x7c\x13\xfb\x4e\
-\x7c\x3a\xf0\x5c\xb7\xde\x23\xf0\x3f\x87\xfe\x20\xf8\xba\xc6\x7b\
-\xef\xf8\x43\x63\xf1\x14\x13\xea\x50\xc7\x1d\xcc\xd0\x02\xb0\xb1\
-\x59\x98\x32\xc4\x1c\x7c\x80\xe1\x8e\x32\x06\x6b\xd2\xa3\xfd\xa2\
-\x3e\x1f\xbf\xc5\xf1\xf0\xf4\x78\xfb\xc1\xbf\xf0\x9e\x48\xbb\xff\
-\x00\xe1\x1a\x5d\x6e\xdf\xfb\x5c\xa8\x5d\xdf\xf1\xeb\xbf\xcd\x38\
-\x50\x5b\x1b\x73\x80\x4f\x4e\x68\x03\xa0\xf0\xb7\x86\x34\xff\x00\
-\x03\xf8\x63\x4b\xd0\xb4\x98\x56\xd3\x49\xd0\xac\xe0\xd3\x2c\x60\
-\x8f\x85\x86\xde\x08\xd6\x28\xd5\x7e\x88\xaa\x07\xd2\xbe\x7d\xf8\
-\xaf\xfb\x18\xfc\x44\xf1\xec\xbe\x36\xf0\xde\x97\xf1\xae\xf7\x47\
-\xf8\x57\xf1\x26\x4b\xc6\xd7\x74\x6b\xbf\x0f\xc7\xa8\xeb\x36\x11\
-\x5d\xc7\xe5\xdd\xda\xe9\xba\x84\x92\x81\x6f\x6f\x2a\x97\x0a\xb2\
-\x43\x29\x87\xcd\x7d\x84\x7c\xa1\x7d\x03\x4f\xfd\xa9\x3c\x2d\xe1\
-\x5f\x86\x5a\xa7\x8a\xfc\x7d\xe3\x4f\x86\x7e\x13\xd1\xf4\xff\x00\
-\x10\xdf\xe8\x83\x51\x5f\x14\x44\xda\x72\xbc\x17\x2f\x14\x71\x49\
-\x3c\xde\x58\x5b\xcc\x2f\xef\x60\x01\x8c\x6e\xac\xa0\xb0\x5c\xd7\
-\x33\xf1\x5b\xf6\xf6\xf0\x6f\x80\x3c\x77\xf0\xca\xcf\x4b\xd7\xbc\
-\x17\xae\x78\x67\xc6\x9e\x25\xd4\x7c\x39\xad\x6b\xe9\xe2\x18\x16\
-\xcf\xc3\x32\x5a\x69\x0f\xa9\x93\x24\x8a\x4c\x7b\x8a\x08\xb2\xae\
-\xeb\xb5\x66\x56\xc9\xdc\x01\x00\xf6\xaf\x0e\x78\x7e\xc7\xc2\x3e\
-\x1f\xd3\xf4\x9d\x2e\xd6\x3b\x1d\x2f\x49\xb5\x8a\xca\xce\xda\x3f\
-\xb9\x6d\x0c\x48\x12\x38\xc7\xb2\xaa\x81\xf8\x55\xea\xf9\xfb\xf6\
-\x80\xff\x00\x82\x97\xfc\x1f\xf8\x0b\xf0\x6b\xc2\xfe\x3a\x6f\x1d\
-\x78\x37\xc4\x1e\x1e\xf1\x77\x88\x2c\xfc\x3f\xa6\xdd\x69\xfe\x21\
-\xb4\x6b\x79\xcc\xb7\x11\x43\x71\x70\x26\xde\x57\xcb\xb4\x49\x3c\
-\xd9\x80\xc9\x45\x03\x3b\x72\x08\xf7\x5f\x0f\xf8\x8b\x4f\xf1\x6e\
-\x83\x61\xab\x69\x37\xf6\x9a\xae\x93\xab\x5a\xc5\x7d\x61\x7d\x69\
-\x28\x9a\xde\xf6\xde\x54\x0f\x14\xd1\xba\x92\xaf\x1b\xa3\x2b\x2b\
-\x02\x41\x0c\x08\x24\x1a\x00\xcf\xf8\x9c\x71\xf0\xcb\xc4\xff\x00\
-\xf6\x05\xbe\xff\x00\xd2\x69\x2b\xe4\xff\x00\x80\xbe\x2d\xb7\x97\
-\xf6\x7f\xf0\x34\x6b\x22\xf9\x9f\xf0\x8d\x69\x68\xca\x78\xc8\xfb\
-\x1c\x20\xf5\xaf\xac\x3e\x27\x7f\xc9\x32\xf1\x47\xfd\x81\x6f\x87\
-\xfe\x4b\x4b\x5f\x1c\xfc\x21\x9a\x3b\xcf\x81\xde\x01\x59\x61\x56\
-\xff\x00\x8a\x67\x4c\xfb\xcb\xd3\xfd\x0e\x1a\xaa\xdc\xdf\x56\xba\
-\xef\xfa\x15\x4f\xe2\xd4\xf4\x0b\x8d\x4a\x12\x76\x6d\x60\xa4\x02\
-\x0d\x4d\x65\x1c\x37\x6d\xb7\xcc\x3b\x78\xe2\xb9\x9f\x2a\xd5\xef\
-\xf6\xab\x4f\x11\xe8\x02\x39\x0b\xf9\x56\x95\xad\xbb\xa4\x5e\x62\
-\xde\xc9\xb5\x7b\x98\xc1\xaf\x2e\x9c\x5c\xa5\xb1\xb4\xa4\x6c\x5d\
-\xc3\x1d\xbb\xf9\x91\xcb\x91\x18\xce\x3b\xfe\x55\x98\xd7\xb3\x6a\
-\x91\x48\xcd\xe6\x43\x10\x3c\xe7\xef\x37\xd2\xb3\x26\xd3\x6f\x2e\
-\xa7\x32\x25\xd7\xee\xd7\x92\x76\xf2\x7d\xba\xd5\xa9\x61\xbb\x6b\
-\x55\xff\x00\x4a\x00\x2b\x0c\x62\x31\x91\x5c\xf5\x69\xb9\xbb\x38\
-\xbb\x1a\x46\x76\x46\xa5\xbb\x26\x9d\xa6\x01\xb4\xb3\x48\x32\x0f\
-\x7a\x86\xfb\x57\x86\x35\x0b\x18\x68\xd9\x79\x39\xae\x5b\x54\xf1\
-\x66\xbf\x79\xe3\xb5\xf0\xde\x87\xe1\x7f\x10\xf8\xc3\x52\xb7\xd3\
-\x46\xa9\x70\xba\x74\xb6\x90\xa5\xac\x2d\x29\x85\x4b\x19\xe6\x8f\
-\x24\xb0\x3c\x2e\x78\x15\x2d\xdf\x87\x7e\x22\xde\xcc\xad\x27\xc1\
-\xaf\x1c\x48\xb8\xcf\xcd\xa8\xe9\x27\x27\xff\x00\x03\x2b\xa2\x38\
-\x0c\x43\x8f\xb9\x1d\x3c\xda\x5f\x9b\x25\xd4\x8a\x7a\xb2\xe7\x89\
-\x2d\xad\x75\xf6\xfd\xe3\x61\xb1\xc9\xaf\x0b\xfd\xa0\xc6\x83\xf0\
-\xdb\x44\x93\x5a\xd5\x35\x4b\x5d\x2e\xcc\x4a\xb0\x2b\xcb\xb8\x9b\
-\x89\x5b\x3b\x63\x8d\x14\x17\x92\x46\x3d\x11\x15\x98\xf6\x06\xbd\
-\x72\x5f\x04\x7c\x40\x99\xdb\x77\xc1\x9f\x1b\x8e\x70\x08\xd4\x74\
-\x9e\x07\xfe\x06\x57\x9b\xfc\x6f\xfd\x9b\x3e\x30\x78\xa7\x5a\xf0\
-\xe7\x89\x3c\x27\xf0\xb7\xc4\x96\xfe\x24\xf0\x9b\xdc\xbd\xad\xb6\
-\xb1\x79\xa5\xc9\x61\x7c\x97\x11\xac\x72\xa3\x32\xdd\x97\x82\x5d\
-\xaa\x0a\x4c\x8a\xc5\x49\x65\x2a\xca\xc4\x57\xce\x67\x5c\x17\xfd\
-\xa0\xbf\x79\x05\xcd\xdd\x4a\x29\xfe\x67\x45\x1c\x77\xb3\x7a\x3f\
-\xcf\xfc\x8e\x6b\xf6\x16\xf1\xf5\xc6\xbf\xf1\x3b\xe2\x74\xb6\xfe\
-\x0f\xf1\x9c\x36\x96\x3f\x0b\x7c\x49\x75\x1d\xc5\xf5\x8a\x58\x7d\
-\xa0\xad\xa8\xda\x91\xc7\x34\x8b\x20\x67\xce\x17\x7a\x28\x1d\xf1\
-\x4f\xf8\x59\xf0\x87\xc3\x3f\x07\xbe\x09\x58\xfc\x5a\xf8\xff\x00\
-\x69\xae\x78\x03\xc2\xb3\x3a\xc7\xa5\xe8\x17\xeb\x1f\xf6\x86\xb6\
-\xf8\xf9\x4b\xf9\x0f\x2a\xc3\x6d\xc7\x32\x39\x51\x8e\x58\xaa\x91\
-\xbb\xd0\x3e\x0d\x78\x33\xe3\xb7\x80\x6e\xee\xb5\xa8\x7e\x0e\xf8\
-\xbb\xc3\x7e\x22\xd4\xac\x65\xd3\xae\xbc\xbd\x67\x45\xd4\xe3\x30\
-\xcb\x81\x22\x07\x69\xd3\x83\x8e\xa5\x73\x5c\x1f\xed\x49\xf0\xab\
-\xf6\xaf\xf8\xe7\xe3\xdb\x8d\x5a\xdf\xe1\x86\xad\xa8\xde\x6a\x03\
-\xca\x6b\xdd\x67\x5e\xd3\x56\xda\xc6\x2c\x60\x08\xed\x23\xb8\x3b\
-\x94\x0f\xf9\x66\x1d\x15\x8f\x24\xe7\x26\xb8\x32\x9e\x0d\xa9\x42\
-\x84\x55\x6c\x3a\x72\x8b\x6d\x7b\xd1\x6a\xcf\xab\xbb\xd5\xf9\x5a\
-\xd7\xf2\xd0\xe8\x96\x61\x79\x3e\x59\x5a\xeb\xb3\x30\xbe\x38\xfc\
-\x6e\xd6\xbe\x3c\x6b\x16\xb7\x13\x25\xad\x96\x89\x63\x10\x4d\x2b\
-\x4b\xb1\xc7\xd8\xec\x60\xfe\x0d\x98\xfb\xc4\x8f\xe3\xef\xdb\x03\
-\x02\xb8\x53\x24\xd0\x8c\x61\xbe\x80\x56\xdf\x83\xbf\xe0\x9e\xbf\
-\x1e\x3e\x1f\xf8\x33\x49\xd1\x34\xff\x00\x87\xbe\x28\x9e\xdb\x4a\
-\xb6\x5b\x75\x79\xf5\x5d\x29\x7c\xcc\x75\x3b\x56\xe7\x0a\x33\x9c\
-\x28\xe0\x0c\x01\xc0\x02\xaf\xaf\xec\x49\xfb\x43\x20\x39\xf8\x67\
-\xae\x9e\xe0\x9d\x5b\x4c\x38\xff\x00\xc9\xaa\x58\xae\x18\xc7\xd6\
-\xaa\xea\x4a\x2d\xbf\x58\xfc\xba\x9b\xd3\xc7\x51\x8c\x52\x4e\xc7\
-\x28\x75\x09\x11\x9b\x76\xed\xdd\xbd\xea\xbd\xdd\xe3\xc8\x39\xcf\
-\xcd\xd4\x1a\xed\xa1\xfd\x89\xff\x00\x68\x45\x4c\x37\xc3\x0d\x69\
-\xbe\xba\xa6\x99\xff\x00\xc9\x55\xc8\x7c\x52\xf8\x4d\xf1\x33\xe0\
-\x96\xa5\xa3\xc1\xe3\x1f\x05\xdf\x78\x78\x6b\xbe\x70\xb2\x96\x7b\
-\xbb\x4b\x85\x98\xc2\xaa\xce\x31\x0c\xae\x41\x01\x81\xe4\x00\x6b\
-\x8a\xb7\x09\xe2\xe3\x4d\xca\x70\xf7\x52\xbb\xd5\x6d\xf7\x9b\xc7\
-\x30\xa4\xdd\xa3\x23\x30\x65\x5f\x75\x73\xff\x00\x19\x64\x0f\xf0\
-\x97\xc4\x98\xff\x00\xa0\x7c\xbc\xfe\x15\xaa\xb3\x6a\x5b\xcf\x99\
-\x6a\x58\x76\x01\x4d\x73\xdf\x15\x1a\xf2\x6f\x85\x1e\x24\xf3\x2d\
-\xd2\x38\xd6\xc6\x43\xc8\x3c\x0e\xff\x00\xce\xb3\xc9\x70\x1e\xcb\
-\x1b\x45\xad\xb9\xe3\xf9\xa2\xab\xd5\x4e\x9b\xbf\x66\x7e\xf2\x78\
-\xa2\xe9\xd7\xc4\xba\x8f\xcc\x78\xba\x94\x63\xfe\x06\x6a\x81\xba\
-\x7c\x7d\xe3\x57\x3c\x4c\x31\xe2\x7d\x4b\xfe\xbe\xa5\xff\x00\xd0\
-\xcd\x52\xaf\xd6\xbd\xa4\xfb\xbf\xbd\x9f\x2b\x64\x38\x5d\x49\xfd\
-\xf3\x55\x35\xaf\x12\x5a\x78\x6e\xc9\xae\xb5\x2d\x42\xcf\x4e\xb5\
-\x52\x15\xa7\xbb\x9d\x21\x89\x49\xe0\x02\xcc\x40\xc9\xed\xeb\x56\
-\x6b\xe4\xdf\xf8\x2c\xad\xa4\x57\xff\x00\xb2\xef\x82\xe0\x9f\xc2\
-\xb1\xf8\xea\x19\xbe\x2b\x78\x46\x37\xf0\xdc\x82\x06\x5f\x10\x29\
-\xd4\x40\x36\x44\x5c\x62\x12\x26\x19\x4c\x4a\x42\x7c\xdf\x31\xdb\
-\x9a\x3d\xad\x4e\xec\x34\x3e\xa4\xf0\xff\x00\x8c\xb4\xdf\x15\xc5\
-\x34\x9a\x4e\xad\xa5\xea\x91\xdb\x90\x25\x36\x57\x91\x5c\x88\xf3\
-\xd3\x26\x36\x3b\x73\xcf\x5a\xbc\x6e\x18\x0c\xee\xaf\xcf\x6f\xd9\
-\xa3\xc2\x9a\x17\x8f\x7f\xe0\xa0\xda\x1c\x7e\x0c\xfd\x9e\xf4\x3f\
-\xd9\x6f\x50\xf8\x33\x15\xd6\xa1\xe3\x88\x22\x93\x4c\xb2\xd4\x3c\
-\x51\xa6\xea\x16\x72\x45\x69\x6f\x1d\xb6\x9c\x3c\xbb\xbb\x41\x32\
-\x09\x4d\xc3\x33\x2c\x52\x5b\x84\x1f\x3b\x11\x55\x3e\x07\x7f\xc1\
-\x61\x3c\x61\xf1\xa3\xc5\xde\x10\xd6\x34\xfb\x5d\x36\xeb\xc3\x3f\
-\x10\x35\x88\xb4\x9b\x2f\x0e\xda\xfc\x38\xf1\x19\xbc\xf0\xf5\xbd\
-\xcc\xcd\x05\xb6\xa7\x2e\xb0\xe9\xf6\x1b\xb5\x46\xf2\xe5\x9a\x15\
-\x58\xe3\x31\xbb\x2a\x4b\x94\xdc\xcb\xda\x4f\xbb\xfb\xc3\x43\xf4\
-\x58\xdc\x4c\x9c\x33\x32\x9f\x43\xd6\x81\x3c\x83\xf8\xab\xf3\x33\
-\xf6\x5d\xf8\xdd\xfb\x43\x7c\x28\xf0\x26\x93\xa6\xc7\xe3\x0f\x87\
-\x7e\x2a\xd5\x3e\x26\x7c\x7f\xf1\x27\x81\xe1\x93\x52\xd0\x6f\x16\
-\x3d\x3e\x48\xa6\xd5\x1e\xe6\xe4\xb8\xba\x66\x78\x77\xdb\x46\xd0\
-\xc0\xbb\x4c\x71\xa7\x97\xbc\xee\xde\x3d\x27\xf6\xc2\xfd\xbd\x7e\
-\x25\x7e\xcb\x97\xda\xbe\x9d\x77\xf1\x13\xe0\x2d\x86\xb7\xe0\xbf\
-\x0d\x45\xab\xb6\x93\x27\x87\xf5\x5d\x63\x56\xf1\xc5\xc2\x5a\xbc\
-\xd7\x07\xec\xb6\x73\x16\xd1\x6d\x19\xd7\xca\x8d\xe7\xf3\x4f\x25\
-\xcb\x6d\x5c\x17\xed\xa7\xdd\xfd\xe2\xe5\x47\xdd\x5f\x68\x90\x9f\
-\xbc\xd5\x1d\xde\xa6\xba\x7d\x94\xd7\x37\x13\xc7\x6f\x6d\x02\x33\
-\xc9\x34\xac\x12\x28\xd5\x46\x59\x99\x8e\x00\x00\x0c\x92\x48\xc5\
-\x7c\x9b\xe1\x0f\xda\xab\xe3\x07\xed\x77\xe2\xfd\x62\xdb\xe0\xe2\
-\xfc\x35\xf0\xa6\x9f\xe0\xdd\x0b\x41\xd4\xb5\x53\xe3\x1b\x1b\xdd\
-\x4a\x6d\x57\x50\xd5\x74\xd4\xd4\xa3\xb0\x8f\xec\xf2\xc2\x2d\xe0\
-\x8e\x19\x62\x0d\x70\x7c\xc6\x66\x3c\x20\x55\x39\xf0\xff\x00\x8d\
-\x7f\x10\x7e\x32\x58\x7e\xd7\x9f\x19\x3c\x49\xad\xea\x5f\x0e\xdb\
-\xc3\xfa\x57\xec\xd4\xde\x27\xbf\xf0\x35\xfe\x97\x26\xb5\xa6\xfd\
-\x9c\xc9\xa8\x6e\xd3\xbc\xdf\x3d\x61\x9d\xcd\xd4\x47\xcd\xb9\xf2\
-\x82\xcf\x6f\xb6\x23\x1a\xe3\x75\x1e\xd6\x7d\xdf\xde\xc3\x95\x1f\
-\xa4\x50\xdf\x7d\xa6\x34\x92\x39\x12\x48\xe4\x50\xe8\xc8\x43\x2b\
-\x02\x32\x08\x23\x83\xc1\x1c\x8a\x90\xdd\x48\x7f\x8d\xab\xe3\x6f\
-\x0b\xfe\xd2\xff\x00\x1a\xbe\x33\x69\xbe\x25\xff\x00\x85\x47\x65\
-\xf0\x97\x41\xd1\xbe\x10\x68\x9a\x44\x5a\x8d\x8e\xbd\xa6\xde\x3b\
-\xf8\x97\x51\x97\x45\xb7\xd4\xa4\xb3\xb6\x30\x4b\x1a\x69\xf6\xb1\
-\xc3\x34\x51\xa4\x85\x66\x3b\x8e\x76\xec\x4c\x1c\xaf\x04\x7e\xda\
-\x9f\x1a\x7f\x6b\xaf\x1a\x78\xe2\x6f\x84\x33\x7c\x31\xf0\xcf\x84\
-\xf4\x0f\x05\xf8\x67\xc6\x36\x07\xc5\x9a\x55\xde\xa1\x79\x39\xd4\
-\xf4\xa6\xbe\x6b\x16\xfb\x3c\xd1\x2a\x8c\xab\x29\x9c\x82\x54\x00\
-\x16\x33\x92\xc0\xf6\x93\xe8\xdf\xde\x3d\x0f\xb7\xbe\xd5\x20\xe7\
-\x71\xf5\xe9\x55\x60\xf1\x2d\xae\xa9\xa8\xdd\x5a\x43\x7f\x67\x73\
-\x79\xa7\xb2\xad\xcc\x11\xcc\x92\x4b\x68\xcc\x32\xa2\x45\x07\x28\
-\x58\x0c\x8c\xe3\x70\x1c\x66\xb8\x7f\xd9\x4f\xe3\x73\x7e\xd3\x1f\
-\xb3\x07\xc3\xaf\x88\xad\xa7\xae\x93\x2f\x8e\xbc\x37\x63\xae\x4b\
-\x64\x8e\x64\x5b\x49\x2e\x20\x59\x1e\x35\x63\xcb\x2a\xb1\x60\x09\
-\xc1\x20\x02\x79\x35\xf2\xff\x00\xfc\x13\xf5\x3c\xcf\xf8\x2c\x0f\
-\xed\xf2\x55\x72\x46\xa1\xe0\x8e\xdd\xbf\xb2\xef\x33\x47\xb5\x9f\
-\x77\xf7\x8a\xc7\xdc\x02\x46\xc5\x1e\x63\x7f\x9c\x57\xe7\x8f\xfc\
-\x14\x1f\xfe\x0a\x57\xf1\x1b\xe1\xe7\xed\xaf\xac\xfc\x1f\xf8\x77\
-\xae\x69\xde\x0d\x5f\x04\xf8\x46\xdf\xc4\x97\xda\x85\xc7\x80\x35\
-\x4f\x17\x5c\x6b\xf7\xf7\x07\x7c\x1a\x78\x8e\xcd\x1b\xec\xd6\xed\
-\x19\x4d\xd3\x91\x90\xec\x40\x39\x18\xac\x7d\x2f\xfe\x0a\x13\xfb\
-\x44\x7e\xd3\xff\x00\xb4\x4f\xc0\x1f\x01\xf8\x27\xfe\x11\x9f\x84\
-\x7a\x9f\xc5\xbf\x85\xf7\xba\xfe\xbd\x6d\xe2\x8f\x0e\x4d\x76\xfe\
-\x1e\xd4\xed\x2f\xaf\x21\x96\x48\xa1\x76\x8e\x56\x0e\xb6\xa8\xb1\
-\xa4\x8d\xb4\x2c\xdb\x8e\xf2\xa3\x2b\xda\x4f\xb8\xec\x8f\xd2\x6f\
-\x31\xbf\xce\x29\x55\xa4\x76\xc2\xa9\x63\xe9\x8c\xd7\xe5\xe7\xc2\
-\x1f\xf8\x2b\x1f\xc6\x8f\xda\x5b\xe0\xef\xec\xff\x00\xe0\xaf\x0f\
-\xcb\xe0\xdf\x0e\x7c\x5e\xf8\xb9\xe3\x2f\x10\x78\x5f\x54\xf1\x45\
-\xc6\x92\xf7\x7a\x5d\x8d\xbe\x8c\xb1\xb3\xdc\x43\x66\x1c\x06\x9a\
-\x65\x9e\x3f\x94\xb6\x01\x89\xb0\x00\x70\x53\x85\xfd\xaa\x7f\x6b\
-\x5f\x8f\x9f\x1b\x3f\xe0\x9c\xff\x00\xb7\x26\x93\xe2\x9f\x18\x78\
-\x77\x45\xd7\x3e\x0b\x78\xa7\x48\xf0\xec\xb7\x1e\x1c\xd3\x5e\xda\
-\x3b\xfd\x3d\xa4\x30\x5d\xc3\x0b\xef\xf3\x62\xfb\x44\x82\x29\x09\
-\x66\x72\xa8\x65\x8b\x95\x72\x68\xf6\x93\xee\x16\x3f\x5c\x9f\xc4\
-\x56\x69\xaa\xc3\x62\xd7\xd6\x62\xfa\xe2\x23\x3c\x56\xbe\x7a\x79\
-\xf2\x46\x3a\xc8\xab\x9c\xb2\x8f\xef\x0f\x97\xdf\xd6\xd7\x98\xdf\
-\xe4\x57\xe4\x3e\x9d\xe0\x1f\x8d\x9a\x6f\xfc\x14\xc3\xf6\x73\xd1\
-\x6c\x7e\x21\x78\x2e\xeb\xe2\x55\xdf\xec\xfb\x23\xdb\x78\x9b\x50\
-\xf0\xd3\x2d\x96\x99\x62\xe6\x57\x86\x31\x65\x1c\xa0\x4b\x2c\x50\
-\xed\x88\x33\x30\x56\x27\x79\x52\x06\xc3\xf7\x37\xfc\x12\x5f\xf6\
-\xbb\xf1\x1f\xed\xbd\xfb\x0f\x78\x77\xc7\x5e\x30\xb7\xd3\x61\xf1\
-\x4f\xdb\xf5\x0d\x1b\x53\x7d\x3e\x23\x0d\xb5\xdc\xb6\x97\x0d\x10\
-\x99\x10\x93\xb3\x7a\x6c\x25\x73\x8d\xdb\xb0\x00\xc0\x07\xb4\x9f\
-\x70\xb1\xf4\x97\x98\xdf\xe7\x14\x6f\x63\xff\x00\xea\x14\x62\x90\
-\x8e\x28\xf6\x93\xee\x16\x32\x3e\x22\xbe\x7e\x1c\x78\x90\x76\xfe\
-\xc8\xbc\x07\x81\xff\x00\x3e\xf2\x57\xae\x7e\xc2\x8b\xb7\xf6\x23\
-\xf8\x39\xff\x00\x62\x3e\x89\xff\x00\xa4\x10\x57\x90\xfc\x44\xff\
-\x00\x92\x75\xe2\x4f\xfb\x04\xde\x7f\xe8\x89\x2b\xd7\xbf\x61\x6f\
-\xf9\x32\x3f\x83\x9f\xf6\x23\xe8\xbf\xfa\x41\x05\x6a\xe4\xdd\x0d\
-\x7b\xfe\x84\xfd\xa3\xd5\x28\xa2\x8a\xe7\x28\x28\xa2\x8a\x00\x2b\
-\xe5\x5f\xf8\x2e\x16\xa3\x71\xa4\xff\x00\xc1\x22\xbf\x68\x89\xad\
-\x66\x78\x26\xff\x00\x84\x1b\x50\x8f\x72\x1e\x76\xbc\x7b\x58\x7e\
-\x2a\x48\xfc\x6b\xea\xaa\xf2\xff\x00\xdb\x3f\xf6\x65\xb2\xfd\xb2\
-\xbf\x65\x7f\x1e\xfc\x2d\xd4\xb5\x4b\xbd\x16\xc3\xc7\x9a\x3c\xda\
-\x3c\xf7\xd6\xb1\xac\x93\x5a\x2c\x83\x05\xd5\x5b\x82\x47\xa1\xa0\
-\x0f\xcb\x7f\xd9\x0f\x48\xd3\xae\xff\x00\xe0\xcd\x4d\x62\xde\x68\
-\x6d\x4f\x99\xf0\xdb\xc5\x77\x66\x36\x0b\xf3\xca\x9a\x8e\xa2\xe9\
-\x26\x3b\xb0\x64\x52\x0f\x5c\xa8\xc7\x22\xb2\xff\x00\xe0\xd6\xaf\
-\xf8\x24\x8f\xc2\x98\xbf\x65\x2f\x07\xfe\xd3\x5e\x37\xb5\xb2\xf1\
-\xb7\xc4\xaf\x17\x35\xd7\xf6\x2b\xea\xe4\x5c\x5b\xf8\x5e\xd6\xd2\
-\xea\x4b\x38\xc4\x11\x49\x95\x37\x1f\xe8\xbb\x84\xc4\x16\x8d\x0a\
-\xa2\x6c\x01\x8b\xe4\x8f\xf8\x32\x27\xe1\x69\xff\x00\x9a\xe3\xe3\
-\xef\xc7\x47\xb4\xff\x00\x1a\x77\xfc\x41\x0d\xf0\xb9\xbf\xe6\xb9\
-\x78\xfb\xff\x00\x04\xf6\x9f\xe3\x40\x1f\xb7\x36\xf2\x24\xe5\x5d\
-\x24\x59\x17\x90\x0a\xb6\x41\xaf\x1e\xff\x00\x82\x90\x1f\xf8\xd7\
-\x9f\xc7\x8f\xfb\x27\x7e\x21\xff\x00\xd3\x65\xc5\x66\xff\x00\xc1\
-\x35\xff\x00\x61\x4d\x27\xfe\x09\xb9\xfb\x20\xf8\x5f\xe0\xfe\x89\
-\xaf\x6a\x1e\x25\xd3\x7c\x2f\x25\xdc\x91\xea\x17\xb6\xe9\x04\xd3\
-\x9b\x8b\x99\x6e\x1b\x72\x27\xca\x30\xd2\x10\x3b\x9c\x73\xcd\x6a\
-\xff\x00\xc1\x44\xad\x27\xd4\xff\x00\x60\x4f\x8e\x56\xb6\xb6\xf3\
-\xdd\x5c\xdc\x7c\x3d\xd7\xe3\x8a\x08\x23\x32\x4b\x33\xb6\x9b\x70\
-\x15\x55\x54\x12\xcc\x4e\x00\x00\x12\x49\x15\xa5\x1f\xe2\x47\xd5\
-\x01\xc1\x69\x5f\xf2\x09\xb3\xff\x00\xaf\x78\xff\x00\xf4\x01\x5c\
-\x6f\xed\x49\xa5\x5e\x6b\xdf\xb2\xf7\xc4\xcb\x1d\x3a\xda\xe2\xf3\
-\x50\xbe\xf0\x8e\xaf\x6f\x6b\x6f\x04\x66\x49\x6e\x25\x7b\x19\x95\
-\x11\x14\x72\xcc\xcc\x40\x0a\x39\x24\x81\x58\xba\x77\xed\x91\xf0\
-\xbe\x2d\x36\xde\x36\xf1\x85\xa0\x64\x82\x35\x61\xf6\x1b\xbe\x0e\
-\xc1\xff\x00\x4c\xaa\xc7\xfc\x36\x5f\xc2\xff\x00\xfa\x1c\x6c\xff\
-\x00\xf0\x06\xef\xff\x00\x8d\x56\xd5\x30\xd5\x9c\xdf\xba\xf7\x7d\
-\x1f\x72\x63\x24\x7c\xd7\xe0\x7f\xd9\x2f\x4b\xd3\x3e\x25\x7e\xc2\
-\x65\xbe\x1a\x58\xc3\xa7\xf8\x4f\xc1\xba\xb4\x7a\xf9\x6d\x09\x7c\
-\xbd\x36\xe0\xe8\x56\x46\x25\xbc\x25\x0e\x24\xfb\x4a\xc8\x54\x4a\
-\x49\xf3\x15\x88\xf9\x85\x70\xff\x00\x04\xff\x00\x66\x1d\x62\x4f\
-\xda\x9f\xe1\x9d\xbe\xb7\xf0\xfe\xf8\xf8\x4f\xc3\xbf\x1c\x7e\x28\
-\xea\xb1\x43\x77\xa3\x93\xa7\x69\xd6\x77\x1a\x6d\xb3\x59\x4e\x11\
-\x97\xcb\x48\x64\x9c\xc8\x62\x6c\x6c\x67\xdc\x57\x26\xbe\xcb\xff\
-\x00\x86\xcb\xf8\x5e\x7f\xe6\x72\xb5\xe7\xaf\xfa\x0d\xdf\x3f\xf9\
-\x0a\x8f\xf8\x6c\xcf\x85\xff\x00\xf4\x38\xd9\xff\x00\xe0\x0d\xdf\
-\xff\x00\x1a\xa9\xfa\xad\x6f\xe5\x7f\x70\xf9\x91\xf1\x97\xc5\x7f\
-\xd9\x36\x6b\x5f\xd8\x77\xf6\xb2\x8b\x47\xf8\x6a\xd1\x78\xa3\x57\
-\xf8\xb9\x3e\xab\xe1\xf5\xb5\xd0\x71\x7d\x71\x6e\x9a\x96\x93\x2c\
-\x37\x16\x9b\x53\x7f\x94\x00\x9d\xd5\xa2\xf9\x72\x24\x61\xd5\x8d\
-\x7d\x4b\xff\x00\x05\x38\xf8\x61\xad\x7c\x5c\xfd\x9e\xe4\xb5\xd0\
-\xf4\x3b\x8f\x17\xdb\xe8\xfe\x2c\xd1\xb5\xfd\x67\xc3\x36\xc9\x1c\
-\x93\x78\xa3\x4a\xb3\xd4\x62\xb8\xbc\xb0\x45\x91\x82\x3b\x49\x12\
-\x92\x11\x98\x07\x28\x10\x9c\x31\xae\xa4\x7e\xd9\x9f\x0b\xc7\xfc\
-\xce\x56\xbf\xf8\x03\x77\xff\x00\xc6\xa9\xbf\xf0\xd9\x5f\x0b\xff\
-\x00\xe8\x70\xb3\xff\x00\xc0\x1b\xbf\xfe\x35\x47\xd5\x6a\xff\x00\
-\x2b\xfb\x83\x99\x1f\x0f\xfe\xd9\x5f\x0c\xb5\x2f\xda\x93\xe1\xaf\
-\xed\x17\xe3\x7f\x87\xbf\x08\xbc\x61\xe1\xcf\x0e\xea\xbf\x0b\x6d\
-\x3c\x33\x6f\xa7\xea\x7e\x14\xfe\xc7\xd4\xfc\x55\xad\xc3\xaa\xfd\
-\xa1\x27\x86\xc3\x1e\x69\xfb\x35\xab\xbc\x42\x72\xaa\x5b\xce\x65\
-\x5c\xaa\x03\x5f\xa2\x9e\x31\xd6\x6d\x7e\x16\xfc\x3f\xd6\x35\x4b\
-\x7d\x1e\xee\xf6\xcf\xc3\xda\x75\xc5\xf2\xe9\x5a\x35\xa0\x7b\x8b\
-\xb5\x8a\x26\x90\xc3\x6f\x0a\x80\x1a\x47\xda\x42\xa8\xea\xc4\x57\
-\x1b\xff\x00\x0d\x9b\xf0\xc3\x76\xef\xf8\x4c\xad\x77\x0e\xff\x00\
-\x62\xbb\xff\x00\xe3\x54\x83\xf6\xcb\xf8\x5e\x3f\xe6\x71\xb4\xf6\
-\xff\x00\x41\xbb\xe3\xff\x00\x21\x51\xf5\x5a\xdf\xca\xfe\xe0\xe6\
-\x47\xca\x9f\xb2\x4f\xed\xa1\xa4\xe8\x5a\xfe\xb3\xf1\x0f\xe2\x37\
-\xc3\xbf\xda\x02\x5f\x8b\x9f\x11\x3c\xa8\x35\x0f\x27\xe1\x66\xb2\
-\xf6\x3e\x17\xd3\x51\xf3\x69\xa2\xda\xc8\x61\x03\xc8\x83\x3b\xe5\
-\x97\x03\xce\x9d\xa4\x90\xf1\xb0\x0e\xef\xfe\x0b\x03\x67\x67\x10\
-\xfd\x9c\x53\x54\xf0\x9d\xd7\x8f\x2c\x6d\xfe\x34\x69\x8f\x71\xa0\
-\x59\xc1\x1d\xd4\xda\xb2\x47\x61\xa8\x31\x48\xe3\x72\xab\x29\x18\
-\xde\x10\x9f\x9f\x66\x39\xc8\x07\xdc\xc7\xed\xa3\xf0\xc8\x7f\xcc\
-\xe9\x6f\xff\x00\x80\x57\x9f\xfc\x6a\xb9\x5f\x88\xbf\x19\x7e\x06\
-\x7c\x59\xd5\x7c\x23\x7d\xaf\x78\x8a\xde\xf2\xeb\xc0\xba\xf4\x5e\
-\x25\xd1\x59\x6d\xef\xa2\xfb\x25\xfc\x71\x4b\x0a\x4a\x42\xc6\x37\
-\x80\x93\xc8\x36\x36\x54\xee\xc9\x19\x00\xd2\xfa\xad\x6f\xe5\x7f\
-\x70\xb9\x91\xf2\xc7\xc4\xdf\x83\x17\xdf\xb4\x37\xc4\x5d\x57\xc7\
-\x5e\x1f\xf8\x55\xe2\x8f\x0d\xfc\x37\xf1\xa7\xc4\x2f\x85\xf6\xb3\
-\xe8\x3a\xa7\x85\xff\x00\xb3\xae\xb5\xa6\xd3\xf5\xa9\x5f\x51\xd5\
-\xee\x34\xf0\x0b\x43\x6e\xb6\xb3\xc5\x0b\x3c\xaa\xbb\xd6\x16\x66\
-\x1b\x54\x35\x5d\xff\x00\x82\x92\xfe\xcf\x5a\xef\x8e\x3e\x28\xfc\
-\x6f\xb5\xd0\xfc\x13\xaa\xea\x5a\x0e\xb9\xf0\xa3\xc2\xba\x3d\xa4\
-\x3a\x76\x94\xcf\x6b\x79\x2a\x78\xb8\xcf\x73\x6d\x1a\xc4\x36\x96\
-\x58\x58\xc8\xea\xbc\x84\x66\x63\x80\x4d\x7d\x82\x7f\x6c\xbf\x85\
-\xe7\xaf\x8c\x6c\xf9\xeb\xfe\x83\x77\xcf\xfe\x42\xa5\x1f\xb6\x6f\
-\xc3\x00\x3f\xe4\x72\xb5\xff\x00\xc0\x1b\xbf\xfe\x35\x4f\xea\xb5\
-\xbf\x95\xfd\xc3\xe6\x47\xcf\xdf\xb6\x5f\xec\xc1\x36\xbb\xfb\x5f\
-\x78\x9e\xdf\xc1\x3e\x02\xb3\x4d\x17\x5d\xfd\x9e\xfc\x55\xe1\xc4\
-\x6d\x3b\x49\x8a\xde\xc2\xe3\x50\xfb\x75\xb9\xd3\xed\x5d\x95\x44\
-\x7e\x68\x06\x46\x88\x13\x95\x1b\x8a\xe3\x9a\xf7\x7f\xd8\x3f\xc4\
-\x56\xfe\x20\xfd\x93\x7e\x1e\xf9\x3e\x1c\xf1\x07\x84\xe5\xd2\xf4\
-\x3b\x1d\x2a\xf7\x4e\xd6\x74\x57\xd2\x2e\xe1\xbb\xb6\xb6\x8a\x19\
-\xc9\x85\xc0\x24\x19\x11\xf6\xc8\x06\x24\x1f\x30\x24\x10\x4d\x9f\
-\xf8\x6c\xcf\x85\xf8\xff\x00\x91\xca\xd3\xff\x00\x00\x6e\xff\x00\
-\xf8\xd5\x29\xfd\xb3\x3e\x18\x31\xc9\xf1\x95\xa9\x3d\xcf\xd8\x6e\
-\xf9\xff\x00\xc8\x54\x7d\x56\xb7\xf2\xbf\xb8\x39\x91\xf1\xcf\xc3\
-\x5f\xd9\x82\xeb\xc1\x7f\xf0\x4d\x0f\xd9\xad\x6c\xfe\x1c\x5d\x58\
-\xf8\xdf\x46\xf8\xb3\xe1\xfd\x77\x56\x58\xb4\x43\x16\xad\x6a\x87\
-\xc4\xb7\x06\xee\xe6\x66\x0b\xe7\x22\x9b\x47\x3b\xdd\xb8\x11\x38\
-\x07\x0b\x8a\xf3\x9f\x03\xfe\xca\x7f\x13\xb4\xdf\x14\xdb\xfc\x37\
-\xf1\x05\xe7\xc6\x3b\xaf\x16\x2f\xc4\x76\xf1\x1b\x1d\x3b\xe1\xbf\
-\x87\xe1\xd0\x2e\x50\x6b\x1f\x6d\x5d\x64\x78\x99\xad\x9a\xe5\x17\
-\xc9\x0a\xed\x19\x98\xdc\x12\xad\x6e\x13\xcb\x61\x5f\xa1\x9f\xf0\
-\xd9\xbf\x0c\x37\x6e\xff\x00\x84\xca\xd7\x27\xbf\xd8\x6e\xff\x00\
-\xf8\xd5\x1f\xf0\xd9\x9f\x0b\xf6\xed\xff\x00\x84\xca\xd3\x1e\x9f\
-\x61\xbb\xff\x00\xe3\x54\x7d\x56\xb7\xf2\xbf\xb8\x5c\xc8\xf8\xaf\
-\xe1\xbf\x84\x2f\xbe\x0e\x7c\x61\xf0\xd7\x8d\x3c\x69\xf0\xef\xc5\
-\x1e\x30\xf0\xd6\x8b\xe3\x4f\x8a\xae\x7c\x3f\x61\xe1\xd1\xab\x6a\
-\xba\x4c\x9a\x8e\xbf\x6f\x25\x9e\xb9\x1e\x9a\xdf\xbf\x9e\xda\x58\
-\x22\x92\x0f\x3a\x14\x71\x18\x9a\x32\x38\x94\x9a\xe5\xff\x00\x65\
-\xef\x83\x96\xff\x00\x17\xfe\x2c\xf8\x4e\x68\x7e\x14\x6a\x5a\x2f\
-\x83\xb4\xef\xda\x87\xc6\x5a\xa5\xe7\x87\xf5\x2d\x19\x7c\xaf\x0f\
-\xc0\x7c\x31\x6e\x20\x37\x30\xa8\x68\xa1\x3f\x69\xd9\x84\x3c\x24\
-\x84\x27\xde\x5c\x57\xd6\x5f\xb4\x36\xab\xfb\x3a\xfe\xd4\x72\xe8\
-\x77\x1e\x2f\xf1\x0d\xd3\x6a\x7e\x19\x69\x8e\x95\xaa\x69\x17\x7a\
-\xbe\x8d\xa9\x58\x2c\xdb\x04\xf1\xc7\x75\x68\x23\x94\x47\x20\x8a\
-\x30\xc9\xb8\xa9\xda\x38\xcf\x35\xd2\x7c\x20\xf8\xd3\xf0\x2b\xe0\
-\x17\xc3\xeb\x3f\x0b\x78\x47\x5c\xd3\xf4\x5d\x0e\xc9\xe5\x95\x20\
-\x5b\x5b\xe9\x5e\x59\x25\x90\xc9\x2c\xb2\xc9\x24\x65\xe5\x96\x47\
-\x66\x67\x91\xd8\xb3\x31\x24\x92\x68\xfa\xb5\x6f\xe5\x7f\x70\x73\
-\x23\xe5\xef\xda\x4b\xe0\x1e\xab\xa4\x2f\xed\x05\xa8\xe9\xbf\x0e\
-\x75\x7b\xed\x0f\x49\xf8\xe1\xe0\x3f\x1a\xda\x69\xfa\x4f\x87\xfc\
-\xe7\xbf\xb0\xb7\xb5\xd3\x1b\x54\xb8\xb1\xb6\x45\xfd\xf9\xfd\xdb\
-\x09\x16\x10\x4b\x14\x21\xb2\x41\xc7\xe8\x37\x86\xb5\x7b\x7d\x7f\
-\xc3\x5a\x66\xa1\x67\x6b\x77\x61\x65\xa8\x5a\x43\x75\x6d\x6b\x75\
-\x6c\x6d\x67\xb6\x89\xe3\x56\x48\xe4\x84\x80\x62\x75\x52\x15\x90\
-\x80\x54\xa9\x5e\xd5\xc0\x7f\xc3\x66\x7c\x30\xff\x00\xa1\xca\xd7\
-\xff\x00\x00\x6e\xf8\xff\x00\xc8\x54\x9f\xf0\xd9\x7f\x0b\xf3\xff\
-\x00\x23\x8d\x9f\xfe\x00\xdd\xff\x00\xf1\xaa\x3e\xab\x5b\xf9\x5f\
-\xdc\x1c\xc8\xec\xfe\x26\x8c\xfc\x33\xf1\x37\xfd\x81\xaf\xbf\xf4\
-\x9a\x4a\xf8\xbf\xe0\x56\xa2\xcd\xf0\x33\xc0\xf2\x4d\x1f\x98\x91\
-\xf8\x6f\x4c\x00\xf4\xff\x00\x97\x38\x6b\xe8\x7f\x88\x1f\xb6\x0f\
-\xc3\x3b\xef\x87\xde\x22\x86\x1f\x17\x5b\x4d\x34\xda\x4d\xe4\x71\
-\xc6\xb6\x37\x7b\xa4\x66\xb7\x90\x2a\x81\xe5\x75\x24\x80\x3d\xc8\
-\xae\x23\xe0\x17\xec\x3d\xf1\x46\xf7\xe0\x0f\x81\x89\xf0\xe4\x6b\
-\x1c\x9e\x1b\xd3\x09\x49\x6f\xe1\x8e\x44\x3f\x63\x8b\x86\x46\x60\
-\xca\xc3\xa1\x04\x02\x0d\x15\xa9\x4e\x34\x6d\x25\x6d\x7f\x42\xa3\
-\x25\x73\x95\x8b\x56\xb5\x64\xfb\xbb\x58\xf4\xe7\x91\x4e\x7d\x4f\
-\xc9\xb1\xc2\xb3\x0a\xf4\xe9\x3f\x60\x9f\x89\xcf\x70\xad\xff\x00\
-\x08\xed\xa2\x2e\xdc\x1c\x6a\x76\xff\x00\xfc\x5d\x21\xfd\x80\xbe\
-\x27\x19\xd7\xfe\x24\x36\xea\x9e\xa7\x53\xb7\xff\x00\xe2\xeb\xce\
-\x71\x91\xa7\x32\x3c\xca\x0b\xa6\x16\xea\x77\xed\xdf\xd3\xd0\xd4\
-\x9f\x6f\x69\xdb\x1b\x88\xf2\xc6\x38\x3d\x6b\xd3\x87\xec\x17\xf1\
-\x3a\x39\xb2\x34\x2b\x59\x10\x74\x53\xa9\xdb\xf1\xff\x00\x8f\x54\
-\x71\xfe\xc2\x9f\x15\xad\xc4\x92\x47\xe1\xdb\x52\xec\x78\x07\x54\
-\xb7\xe4\x7f\xdf\x54\xd5\x36\x1c\xc7\x23\xfb\x26\x5c\xb5\xd7\xed\
-\x6b\xe2\x46\x6e\xa3\xc1\x76\x83\x9e\xb8\xfe\xd0\x96\xbe\x94\xf1\
-\x37\x88\xf4\xff\x00\x07\x78\x73\x50\xd6\x35\x7d\x42\xd3\x4a\xd1\
-\xf4\x9b\x69\x2f\x6f\xaf\x6e\xa5\x11\x41\x67\x04\x6a\x5e\x49\x64\
-\x76\x20\x2a\xaa\x82\x49\x3c\x00\x0d\x78\x4f\xc0\xcf\x84\x3e\x26\
-\xf8\x37\xfb\x5f\xeb\x56\x7e\x29\xb1\x86\xc6\xf2\xfb\xc0\xf6\xd3\
-\x44\x91\xdc\xa4\xe1\x94\x6a\x33\x02\x49\x42\x40\xe7\x15\x27\xfc\
-\x15\x0f\xc3\xda\x87\x89\x3f\x62\xdf\x11\x7d\x92\xce\xe7\x54\xb1\
-\xd2\xf5\x6d\x13\x58\xd7\x74\xf8\x2d\xcd\xc4\xba\x86\x8d\x67\xab\
-\x5a\x5d\x6a\x30\xac\x63\x99\x3f\xd1\x62\x91\x8a\x00\x4b\xaa\x32\
-\x00\x4b\x60\xf7\x55\xd1\x45\x79\x2f\xc8\xce\xe4\xbf\x0f\x7f\xe0\
-\xa5\x5f\x09\xfe\x23\xf8\xcf\x46\xd1\xad\x75\x0f\x14\xe9\x49\xe2\
-\x69\xd2\xd3\xc3\xfa\xb6\xb9\xe1\x6d\x47\x49\xd1\xfc\x47\x34\x83\
-\x31\xc7\x67\x79\x71\x12\x43\x33\xb8\x07\x60\xdc\x0b\xe3\xe5\xdd\
-\x91\x4e\xf8\xc1\xff\x00\x05\x14\xf0\x2f\xc1\x9f\x8c\x3a\xe7\x80\
-\xee\xb4\x0f\x8a\xde\x24\xf1\x1f\x87\x2d\xec\xee\x75\x38\xfc\x2b\
-\xe0\x7b\xfd\x76\x0b\x15\xba\x8b\xcd\x80\x3c\x96\xe8\x55\x59\xd0\
-\x13\x83\x8e\x84\x0c\x90\x45\x70\x1f\xf0\x52\x9f\xda\x47\xe1\xef\
-\xc7\x9f\xd8\x53\xc5\x5e\x1b\xf0\x6f\x8c\xfc\x2f\xe3\x4f\x14\x7c\
-\x4f\xb7\x83\x4e\xf0\x36\x9b\xa3\x6a\x50\xdf\x5f\x5f\x6a\x92\xcd\
-\x1b\xd9\x4d\x14\x28\xc5\xe3\xf2\x18\x2c\xa6\x46\x0a\x21\x58\x89\
-\x24\x62\xb9\x1f\x15\xf8\x67\xe3\xc6\xbb\xff\x00\x05\x0b\xfd\xa9\
-\xae\x7e\x0a\xf8\xfb\xc0\xba\x0e\xbb\xa7\xe8\xde\x0e\xf3\xac\xbc\
-\x41\xe1\xbf\xed\x08\x35\xfb\xcf\xec\xab\x83\x10\x13\xf9\xa9\xf6\
-\x54\x66\x0e\x09\xd8\xe3\xe7\x52\x40\xdb\xce\x20\x7d\x15\xa1\xfe\
-\xdc\x5f\x0d\xfc\x4f\xf0\x9f\x45\xf1\xb5\x8e\xaf\xa8\x4f\xa1\xeb\
-\x9e\x28\xb3\xf0\x5c\x61\xf4\xb9\xa0\xbb\xb3\xd6\x2e\x6e\x92\xd1\
-\x2d\x2e\x6d\xe4\x55\x92\x17\x59\x9d\x55\xc3\xa8\xda\x0e\x79\x14\
-\xdf\x8e\x7f\xb7\x0f\x80\x7e\x00\x78\xd7\xfe\x11\x7d\x4a\x4f\x14\
-\x78\x87\xc5\x6b\x6a\x97\xd3\x68\x5e\x14\xf0\xe5\xe7\x88\x35\x1b\
-\x4b\x77\x38\x49\xe7\x8a\xd6\x36\xf2\x23\x62\x1b\x69\x90\x8d\xdb\
-\x49\x19\xaf\x90\xec\xa6\xd1\xbc\x41\xfb\x0c\x78\x07\xc5\x16\x9a\
-\xc6\xb5\xad\x78\xc3\xc6\x5f\xb4\x77\x85\x35\x6f\x1f\x36\xb1\x69\
-\x1d\x95\xf5\x8f\x89\x86\xbb\x65\x6d\x7d\x65\x25\xb4\x43\x64\x0b\
-\x01\xb7\x8e\x24\x40\x5b\x31\xa2\x3e\xe6\xdf\x9a\xf5\xef\x83\xff\
-\x00\x14\xe1\xf8\x2f\xf1\x8f\xf6\xa1\xf0\xad\xf7\x8b\x7c\x0b\xe0\
-\xef\x8b\xbe\x24\xf1\xbd\xc7\x89\xf4\x2b\x8f\x18\x48\x6d\x74\xed\
-\x63\x49\x96\xce\xd6\x3d\x32\x6c\x79\xb1\x35\xcc\x16\xf1\x46\xd6\
-\xee\xb1\x48\x19\x24\x89\xb3\xb4\x30\xdc\x01\xeb\xda\x7f\xed\xd5\
-\xf0\xbf\x5a\xf8\x15\xff\x00\x0b\x23\x4f\xf1\x04\xd7\xde\x15\x5d\
-\x76\xdb\xc2\xf7\x0f\x1d\x84\xe9\x79\x61\xaa\x4f\x75\x0d\xa2\x5a\
-\x5c\x5b\x48\xab\x34\x32\xac\xd3\xc4\x19\x5d\x41\x55\x70\xdd\x39\
-\xae\x83\xe1\xef\xed\x39\xe0\xbf\x8a\x3f\x1d\x7e\x20\x7c\x35\xd1\
-\xf5\x66\x9b\xc6\x9f\x0c\x5e\xd0\x78\x83\x4e\x92\x06\x8c\xc0\xb7\
-\x51\xf9\x90\xbc\x4c\x7e\x59\x90\x8e\x19\x93\x84\x62\x01\xc6\xe1\
-\x9f\x81\x3e\x29\x7e\xd0\x9e\x21\xf8\xe5\xf0\x47\xe3\x65\xae\xbc\
-\xdf\x07\xf5\xcf\xf8\x47\x3e\x2b\xfc\x37\x80\xf8\xb3\xe1\xd6\x97\
-\x75\x6b\xa6\xf8\x9a\xea\x4d\x4f\x4d\x69\xfc\xd9\x67\xb9\xb8\xf3\
-\xe6\xb6\x0b\x15\xb9\x2a\xf8\x5f\x2f\x1e\x80\x7a\x48\xf8\x55\xae\
-\x6a\x7f\xb5\x8f\xed\x35\xf1\x43\xc0\x76\x62\xfb\xe2\x5f\xc2\x7f\
-\x89\xb6\x97\xda\x6d\x96\xe0\xa3\xc4\x9a\x74\xfe\x1b\xd2\x46\xa5\
-\xa3\xb9\xe3\x9b\x88\xa3\x56\x88\x92\x02\x5c\x43\x03\x1e\x37\x64\
-\xf2\x40\x7d\x89\xf0\x83\xe3\x6f\x87\x7e\x39\xe9\x9e\x20\xbc\xf0\
-\xe5\xcd\xc5\xd5\xbf\x86\x3c\x47\x7f\xe1\x5b\xf3\x35\xbb\x40\x52\
-\xfe\xc9\xd5\x2e\x11\x43\x7d\xe5\x0c\xc3\x0e\x38\x6e\xd5\xf2\xdf\
-\xfc\x15\xd6\x74\xb5\xd6\xfe\x12\xbc\x9c\x2a\xcf\xab\x83\xed\xfe\
-\x8f\x0d\x6f\xff\x00\xc1\x1d\xfe\x20\xe9\x7f\x16\x3f\x67\xcf\x89\
-\xbe\x2a\xd0\xe4\x9a\x4d\x1b\xc4\x9f\x19\x3c\x5d\xa9\xd8\xb4\xd1\
-\x34\x32\x18\x66\x9e\x07\x40\xe8\xd8\x2a\xd8\x23\x2a\x47\x04\x1a\
-\xbf\xff\x00\x05\x0a\xf8\x05\xe2\x4f\xda\x4b\xe2\x97\xc2\x8f\x0d\
-\x78\x52\xc6\x1d\x4b\x57\x58\xf5\xcb\xff\x00\x22\x5b\x94\xb7\x0d\
-\x1c\x70\xda\xa3\x1d\xee\x42\xe4\x19\x13\x8c\xe7\x04\xfa\x51\x2a\
-\x6e\x74\xe7\x15\xd6\x32\xfc\x99\xa5\x39\x25\x34\xdf\x74\x7c\x30\
-\xda\xa2\x30\x62\xb2\x8f\x5f\x72\x2b\x9a\xf8\xcb\x3b\x7f\xc2\x96\
-\xf1\x4e\x76\xb9\x3a\x6c\xbf\x36\x3b\x62\xbe\xaa\x3f\xf0\x47\xaf\
-\x8f\x01\x1b\x67\x84\xf4\xe5\x63\x9c\x7f\xc4\xf6\xd3\xa7\xfd\xf7\
-\x5c\x1f\xed\x3b\xff\x00\x04\xb6\xf8\xdd\xf0\xc3\xf6\x6d\xf1\xb6\
-\xbd\xaa\xf8\x77\x4f\xb7\xd2\xf4\x7d\x1e\x7b\xcb\xc9\x06\xb3\x6a\
-\xfe\x54\x51\xae\xe6\x3b\x43\xe4\x90\xa0\xf0\x3a\xd7\xcb\xe5\xd9\
-\x6d\x55\x8b\xa6\xdc\x5d\xb9\xa2\xff\x00\x14\x7a\xd5\x31\x30\x74\
-\xdd\x9f\x43\xf5\x3f\xc4\xc7\xfe\x2a\x7d\x4b\xfe\xbe\xa5\xfc\x7e\
-\x76\xaa\x25\xb0\x6a\xef\x88\xff\x00\xe4\x65\xd4\x71\xff\x00\x3f\
-\x52\xff\x00\xe8\x66\xbc\x33\xe3\xaf\xed\x5d\xe1\xdf\xd9\xeb\xe2\
-\xbd\xf2\xf8\xab\xc5\xc3\x4c\xf0\xfe\x83\xe0\x1b\xff\x00\x19\x6a\
-\x5a\x44\x7e\x1f\x9a\xea\x73\x6d\x6d\x7b\x6f\x03\xdf\x8b\xa4\x27\
-\xe5\x8f\xce\x11\xfd\x98\x29\x67\x32\x07\x07\x0a\x45\x7d\x41\xe2\
-\x9e\xce\x0e\x45\x71\x3f\x1c\xfe\x04\xe8\xff\x00\xb4\x06\x89\xe1\
-\xdd\x3f\x5a\x9a\xfa\x08\x3c\x35\xe2\x7d\x2f\xc5\x96\xc6\xd1\xd5\
-\x19\xee\xb4\xfb\x81\x71\x0a\xb6\x41\xcc\x65\xc6\x18\x0c\x12\x3a\
-\x11\xd6\xb9\x1f\x84\x9f\xb7\xdf\xc2\x9f\x8d\x9e\x34\xbc\xf0\xfe\
-\x87\xe2\x2b\xe8\x35\x0b\x3d\x2a\x5d\x75\x5b\x59\xd0\xef\xb4\x5b\
-\x6b\xfd\x3a\x22\x82\x5b\xcb\x69\xee\xe2\x8e\x39\xe0\x8c\xba\xef\
-\x91\x18\x85\xc8\x3f\x74\x86\xac\x9f\x87\xbf\xf0\x52\xef\x83\x7f\
-\x14\x65\xb9\x8f\x49\xf1\x26\xac\xad\x1e\x93\x77\xaf\x59\xb6\xa3\
-\xe1\xbd\x4b\x4d\x8f\x5e\xb0\xb5\x87\xcf\xb8\xb8\xd3\xde\xe2\x04\
-\x5b\xc4\x48\xfe\x7f\xdc\x96\x25\x70\x40\xc1\xcd\x00\x77\xde\x3f\
-\xfd\x9e\x74\x4f\x1f\xfc\x72\xf0\x2f\xc4\x66\x9f\x50\xd2\xfc\x59\
-\xe0\x11\x79\x6d\x6b\x77\x61\x22\xc6\x35\x0b\x1b\xb4\x51\x3d\x85\
-\xd2\x90\x44\x96\xe5\x92\x39\x54\x70\xc9\x24\x61\x95\x97\x2e\x1b\
-\x81\xf0\x37\xfc\x13\xfb\xc2\xff\x00\x0f\x7c\x6b\xa5\xdd\x69\xfe\
-\x30\xf8\x9c\xfe\x0c\xf0\xfe\xa6\x75\xbd\x13\xe1\xfc\xde\x23\x91\
-\xbc\x31\xa2\xdf\xef\x69\x04\xd1\x40\x14\x4a\x51\x64\x77\x74\x82\
-\x49\x5e\x14\x66\xc8\x4f\x95\x42\xbb\x47\xff\x00\x82\x93\xfc\x22\
-\xd7\xbe\x13\xaf\x8d\xad\x75\xaf\x11\x49\xe1\xfb\x9b\x9b\x5b\x3d\
-\x36\x4f\xf8\x45\x35\x41\x71\xe2\x09\xae\x61\x33\x44\x9a\x74\x1e\
-\x47\x9b\x7c\x4c\x61\x89\x30\x2b\x2a\xed\x6d\xc4\x0e\x6a\xf5\xd7\
-\xfc\x14\x23\xe1\x3d\x9f\xc2\x4b\x5f\x1a\x49\xe2\x0d\x4f\xfb\x36\
-\xfb\x59\x6f\x0e\xc3\xa7\x2f\x87\xf5\x06\xd7\x5b\x53\x58\xcc\xad\
-\x62\x74\xb1\x09\xbc\x59\xc4\x6a\x64\x28\x62\xe1\x30\xff\x00\x70\
-\x83\x40\x18\xde\x17\xff\x00\x82\x73\xf8\x4b\xc2\x1f\x13\x6d\x7c\
-\x45\x6b\xe2\x6f\x1d\x3d\x9e\x9b\xe3\xc9\xfe\x23\xe9\xda\x0d\xc6\
-\xa1\x14\xda\x5e\x99\xaa\xdc\x47\x76\x97\x4d\x0a\x98\xbc\xc1\x1c\
-\xed\x79\x24\x8c\xa5\xce\x19\x53\x69\x50\x08\x2f\xf8\xb7\xff\x00\
-\x04\xed\xf0\xbf\xc5\x9f\x88\x1e\x36\xd6\xbf\xe1\x34\xf8\xa3\xe1\
-\x6d\x3f\xe2\x65\xa4\x76\x9e\x34\xd0\x7c\x3d\xe2\x03\x61\xa6\xf8\
-\xa3\xcb\xb6\x16\xa8\xd7\x00\x21\x99\x7f\x70\x04\x6c\x22\x91\x15\
-\xd0\x60\x82\x33\x9b\xd6\xff\x00\xf0\x51\xbf\x84\x57\x5f\x0b\xa3\
-\xf1\x5c\x3a\xfe\xb5\x35\xbc\xda\xc4\x9e\x1e\x8f\x48\x8b\xc3\x3a\
-\x8b\xf8\x81\xb5\x38\xe1\x13\xcb\x65\xfd\x96\x21\xfb\x5f\x9c\x90\
-\x11\x2b\x0f\x2c\xaa\xc6\x77\x96\xdb\xcd\x5d\xb5\xfd\xbf\x3e\x14\
-\xdd\xfc\x1e\xba\xf1\xcf\xfc\x24\x3a\x94\x3a\x3d\x8e\xa8\xba\x0c\
-\xf6\x77\x1a\x06\xa1\x0e\xb5\x1e\xa6\xea\x19\x2c\x46\x9a\xd0\x8b\
-\xb6\xb9\x60\x43\x2c\x6b\x11\x2c\xbf\x30\xca\xfc\xc0\x03\x98\xd7\
-\x3f\xe0\x9a\xbe\x16\xb9\xb4\xd2\xd7\x43\xf1\xc7\xc5\x4f\x04\x5c\
-\x47\xe1\xdb\x0f\x09\xeb\x97\x1e\x19\xd7\xc6\x9e\xfe\x2d\xd3\xec\
-\xa0\xf2\x2d\xd2\xf4\x08\xd9\x7c\xd5\x8b\x28\x27\x84\x45\x28\x53\
-\xb4\x36\x02\x81\x3f\xc4\xaf\xf8\x26\xdf\x80\xfc\x75\xac\x5a\x4f\
-\xa4\xea\x5e\x2a\xf0\x2e\x9f\x1f\x80\x66\xf8\x65\x75\xa3\xf8\x76\
-\xf9\x21\xd3\xf5\x2d\x01\xa2\x9d\x21\xb4\x9e\x39\x11\xc9\xf2\x1a\
-\xe1\xe4\x8d\x95\x95\xb7\x81\xb8\xb0\xc8\x3b\x3f\xf0\xf0\xbf\x84\
-\xeb\xf0\xb9\xbc\x5a\xfa\xee\xb1\x1d\xaa\xea\xeb\xe1\xf3\xa4\x3f\
-\x87\x35\x11\xe2\x0f\xed\x26\x8b\xce\x5b\x3f\xec\xaf\x27\xed\xbe\
-\x71\x88\x19\x00\xf2\xb0\x63\x05\xf3\xb4\x16\xae\xc3\xe0\x2f\xed\
-\x25\xe1\x0f\xda\x57\xc3\x9a\x86\xa5\xe1\x1b\xed\x42\xe0\x69\x17\
-\x7f\xd9\xfa\x95\x9e\xa3\xa5\x5d\x69\x3a\x86\x99\x73\xb1\x64\x11\
-\x4f\x6b\x73\x1c\x72\xc6\xc5\x1d\x18\x65\x70\x55\x81\x04\xd0\x07\
-\x9a\xf8\xe3\xfe\x09\xc3\xe1\x1f\x17\xdd\xbc\x96\x3e\x2f\xf8\x9d\
-\xe0\xdb\x6d\x5b\x45\xb2\xf0\xf7\x8a\x2c\xbc\x35\xe2\x16\xd3\xed\
-\xfc\x65\x67\x69\x6e\x2d\x61\x5b\xd5\x08\xc4\x49\xe4\x0f\x29\xa5\
-\x80\xc4\xec\x87\x69\x63\x81\x8e\xf3\xe1\xef\xec\xad\xe1\x3f\x85\
-\xbe\x36\xf1\xbe\xb5\xa1\x43\x3e\x9c\xbe\x3a\xd2\x34\xad\x0e\xe3\
-\x4f\x84\xa2\xd9\xe9\xf6\x9a\x6d\x93\xd9\x5b\x47\x6c\xbb\x72\x98\
-\x85\xf0\x72\x4e\x4a\x83\xeb\x98\x7e\x3e\x7e\xd8\x9e\x03\xfd\x9a\
-\xf5\xcd\x3b\x4a\xf1\x35\xe6\xbd\x71\xac\xea\xb6\xef\x7b\x06\x99\
-\xa0\xf8\x7a\xff\x00\x5e\xbe\x5b\x54\x6d\x8f\x75\x24\x36\x71\x4a\
-\xf1\x5b\xab\x1c\x79\x8e\x00\x27\x21\x77\x10\x40\xd5\xf8\x63\xfb\
-\x4a\x78\x27\xe3\x37\x8b\x8e\x8b\xe1\x7d\x7e\xdf\x57\xbc\x3a\x15\
-\x97\x89\xe2\x92\x38\xa4\x5b\x6b\xbd\x36\xed\xe5\x8e\x1b\x98\xa6\
-\x60\x11\xd4\x49\x0c\x88\xe0\x1d\xd1\xb0\x01\x82\xe4\x64\x02\xdf\
-\xc0\x1f\x83\x1a\x5f\xec\xeb\xf0\x4b\xc1\xff\x00\x0f\x74\x3b\x8b\
-\xc9\xb4\x5f\x05\xe9\x36\xfa\x35\x8c\xb7\x8e\xad\x70\xf0\xc2\x81\
-\x55\x9c\xa8\x00\xb6\x07\x24\x01\xcd\x7e\x68\x7c\x65\xf8\x4f\xab\
-\x78\xcf\xf6\xa0\xf8\x8b\xf1\x23\x44\xf8\x4b\xff\x00\x05\x0c\xf0\
-\x1e\xb9\xf1\x0a\xf2\xda\x4d\x68\x78\x2b\x57\xd2\x74\xdb\x1b\xef\
-\xb2\x43\xf6\x78\x08\x02\x42\xee\xa1\x43\x32\x97\x63\x83\x2b\xe3\
-\x00\xe2\xbe\xe3\xd5\x7f\xe0\xa5\xff\x00\x07\xf4\xbf\x0b\x78\x6f\
-\x58\x5d\x6b\xc4\x9a\x9d\xaf\x8b\x2c\x24\xd5\xb4\xe8\xb4\x8f\x0a\
-\x6a\x9a\x9d\xd1\xd3\x92\x69\x20\x3a\x84\xb0\xdb\xc0\xf2\x43\x68\
-\xcf\x1b\xec\x9a\x40\xab\x22\xa9\x28\x18\x64\x8d\x4d\x5f\xfe\x0a\
-\x01\xf0\xaf\x4c\xf8\x8d\xe1\xef\x0a\x5b\xeb\x9a\xa6\xb9\xad\xf8\
-\xb3\x4a\xb0\xd7\x74\x88\xb4\x2d\x0a\xf7\x55\x8e\xfb\x4f\xbd\x99\
-\xa0\x82\xe8\x49\x04\x6c\xab\x0e\xf5\x21\xdd\x88\x11\x82\xa5\xb1\
-\x90\x08\x07\xc2\xff\x00\x10\x7c\x2b\x7d\xe3\xe9\x7c\x2b\xaa\xaf\
-\xc0\x5f\xf8\x28\x47\x87\xfc\x75\xe1\xad\x02\x3f\x0b\xdc\x78\xd3\
-\x44\xf1\x15\x95\x86\xbd\xe2\x2d\x39\x25\x69\x44\x17\xf3\x2d\xc6\
-\xd9\xfe\x66\x3f\x36\xd0\xdd\x39\x38\x5c\x76\x9e\x1c\xf1\xd5\xd7\
-\x86\x3f\x69\x3f\x87\x3f\x14\xa2\xfd\x95\x7f\x6c\xcb\xdf\x11\x7c\
-\x32\xf0\x94\xfe\x0e\xd3\x86\xa7\x73\xa7\xea\x1f\x6d\xb5\x9a\x49\
-\x24\x79\xae\xa6\x9e\xe5\xa7\x96\x72\xd2\xbf\xcc\x64\x0b\xc8\x1b\
-\x70\x00\x1f\x68\x68\xff\x00\xb5\xef\x80\x75\xff\x00\x07\xf8\x2f\
-\x5d\xb3\xd5\xaf\x26\xb1\xf8\x81\xe2\x39\x3c\x27\xa1\xa8\xb0\x9b\
-\xed\x17\x3a\x94\x46\xe8\x4d\x03\xc5\xb7\x7c\x5e\x59\xb2\xb9\x2e\
-\xce\x02\xa0\x8f\x24\xe0\x8c\xf6\x5e\x3f\xf1\x55\xc7\x82\x3c\x13\
-\xaa\x6a\xf6\xba\x1e\xb1\xe2\x7b\xad\x3e\x0f\x3a\x0d\x23\x49\x11\
-\x9b\xed\x4a\x4c\x80\xb0\xc5\xe6\xba\x46\x19\x89\x1f\x33\xba\xaa\
-\x8c\x92\x70\x28\x03\xf2\x27\xe2\x1f\xc1\xfd\x6f\x42\xf8\x03\xe0\
-\xdf\x00\xf8\x0b\xf6\x44\xfd\xab\x64\x6f\x0b\xf8\xd7\x51\xf1\x9d\
-\xaf\x89\x2e\x75\xbb\x3d\x13\xc4\x7a\x05\xcd\xe2\xc7\xe6\xb6\x9f\
-\x77\x6b\xe6\xa8\xdd\xe5\xaa\x98\xe5\x85\x94\x85\x43\x9d\xcb\x9a\
-\x8f\xf6\x3a\xf8\x4f\xe2\xcf\x86\x3f\x02\x3f\x68\xbf\x87\xbf\x12\
-\x3f\x64\x7f\xda\x67\x59\xf0\xdf\xc7\x8f\x10\xc7\xa8\x3d\xad\xa5\
-\xf5\xb6\xa1\x77\x67\x67\x12\xee\x88\xcb\x7d\x3c\x91\xc9\x35\xdf\
-\x9e\x5a\x46\x90\xa6\x09\x55\x38\xe4\x81\xf6\xa7\xc3\xcf\xf8\x28\
-\x3f\x8d\x6d\x7f\x61\x6f\x8c\x9f\x14\x3c\x6d\xe1\xbf\x0f\xdb\xf8\
-\xc3\xc0\x5e\x38\xd6\x7c\x23\xa6\xe8\x16\x77\x04\xd9\x24\xf0\xdc\
-\x5b\x59\xd9\x5b\x4b\x70\x09\x33\x0f\xb4\x5c\x01\x24\xc8\x17\x72\
-\x82\x51\x46\x05\x76\x5e\x03\xf8\x9f\xf1\x8f\xe0\xc7\xed\x55\xe0\
-\xbf\x87\x3f\x16\xfc\x41\xf0\xef\xc5\xf6\x9f\x13\x34\xfd\x5e\x6d\
-\x1e\xff\x00\xc3\x9a\x14\xfa\x24\xba\x56\xa3\xa7\x42\x97\x33\x59\
-\x32\x4b\x73\x38\x9e\x16\xb6\xf3\x9d\x24\x3b\x24\x06\x02\x1b\x76\
-\x7e\x50\x0f\x93\xfe\x08\x59\x5d\x7c\x10\xf8\xc7\xe0\x3f\x1e\x43\
-\xfb\x35\x7e\xdb\xfe\x26\xf1\x17\xc3\xbf\x09\x5c\x78\x33\x4f\xb8\
-\xd7\xe7\xd2\x6f\x9a\xe2\xc6\x69\x64\x93\xf7\xcd\xe6\x87\x66\x8f\
-\xcc\x28\x98\x21\x55\x15\x17\x04\x28\xaf\xa7\xbf\xe0\x93\xbf\x0f\
-\xec\x7e\x0d\xfe\xcc\xb7\xbe\x10\xd2\xfe\x1d\x7c\x5a\xf8\x73\xa6\
-\xe9\x3a\xf5\xd5\xd4\x16\xbf\x10\x56\xcf\xfb\x42\xf5\xee\xcf\x9f\
-\x24\x91\x9b\x62\x53\xc9\x56\x3b\x06\x46\xec\xfa\xf5\xaf\x48\xf8\
-\xf1\xfb\x6a\x7c\x3d\xfd\x9b\x7c\x6b\xa5\x78\x6f\xc5\x97\xfa\xd2\
-\x78\x83\x5e\xd2\xee\x35\x8d\x33\x4f\xd3\x34\x0b\xdd\x5a\xeb\x50\
-\xb7\x82\x58\xe1\x97\xca\x8e\xd6\x29\x19\x9d\x5e\x45\xf9\x31\x9d\
-\xb9\x6f\xba\x09\xae\x73\xc0\x9f\xf0\x53\x3f\x82\x7f\x12\xbc\x5b\
-\xe1\x1d\x1f\x42\xf1\x6d\xe5\xf3\xf8\xe6\x78\xac\xb4\x8d\x40\x78\
-\x7b\x52\x8f\x4b\x96\xf6\x5d\xdb\x2c\x24\xbc\x68\x04\x30\xde\x12\
-\x8e\x0d\xbc\x8c\xb2\x2b\x29\x56\x01\xb0\xa4\x03\xde\xc7\x4a\x0f\
-\x4a\xf9\xd6\x0f\xf8\x2a\xcf\xc0\x97\xbf\xb7\x86\x6f\x17\xea\x56\
-\x30\x4d\xa9\xdc\xe8\xaf\xa8\xdd\x78\x6b\x52\x8f\x4b\xb5\xbf\xb7\
-\x9e\x58\x1e\xd2\x6b\xcf\x23\xec\xf1\xce\xcf\x0b\xec\x8d\x9c\x33\
-\x82\x98\x07\xcc\x4d\xde\x85\xfb\x3d\xfe\xd6\x3e\x07\xfd\xa8\x57\
-\xc4\x11\xf8\x43\x50\xd5\x64\xbd\xf0\xb4\xf1\x5b\x6a\xfa\x7e\xad\
-\xa2\x5e\xe8\xf7\xf6\x0d\x32\x33\xc2\xcf\x6f\x77\x14\x72\x79\x72\
-\xa2\xb3\x24\x81\x76\xb0\x53\xdc\x10\x00\x3a\xef\x88\x9f\xf2\x4e\
-\xbc\x49\xff\x00\x60\x9b\xcf\xfd\x11\x25\x7a\xf7\xec\x2d\xff\x00\
-\x26\x47\xf0\x73\xfe\xc4\x7d\x17\xff\x00\x48\x20\xaf\x21\xf8\x89\
-\xff\x00\x24\xeb\xc4\x9f\xf6\x09\xbc\xff\x00\xd1\x12\x57\xaf\x7e\
-\xc2\xdf\xf2\x64\x7f\x07\x3f\xec\x47\xd1\x7f\xf4\x82\x0a\xdf\xfe\
-\x5c\x7c\xff\x00\x42\x7e\xd1\xea\x94\x51\x45\x60\x50\x51\x45\x14\
-\x00\x51\x45\x14\x00\xc9\x64\x11\xe2\xb9\xcf\x84\x5f\x18\xbc\x2f\
-\xf1\xe7\xe1\xf5\x8f\x8a\xbc\x1b\xae\x69\xfe\x24\xf0\xde\xa6\x65\
-\x5b\x4d\x46\xc2\x5f\x36\xde\xe0\xc5\x2b\xc3\x26\xd6\x1d\x76\xc9\
-\x1b\xa9\xf7\x53\x5c\x3f\xed\xe1\xf0\xdb\xe2\x07\xc6\x5f\xd9\x23\
-\xc7\x7e\x11\xf8\x5f\xe2\x0d\x1f\xc2\x7e\x35\xf1\x36\x95\x2e\x99\
-\x65\xac\xea\x62\x53\x0e\x98\x93\x61\x26\x98\x08\x94\xbf\x98\x21\
-\x32\x6c\x20\x70\xfb\x4f\x6a\xf8\x2f\xfe\x0d\x29\xf8\x29\xf1\x1b\
-\xe0\xff\x00\xfc\x13\x61\x6f\xbc\x45\xe2\x4d\x13\x5a\xf0\x07\x8b\
-\xb5\x5b\xdd\x4f\xc2\xd6\x30\x89\xbe\xdb\xa2\xc9\x15\xe4\xf6\x77\
-\x91\xb9\x75\x09\xe5\x49\x25\xa8\x95\x42\x1e\x0b\xc8\x4f\x2c\x68\
-\x03\xf5\x4b\x14\x62\x8a\x28\x00\xa2\x8a\x6c\x72\xf9\x9f\xc2\xdf\
-\x8d\x00\x3a\x8a\x6b\x36\xdf\xe1\x26\x90\xcc\x06\x68\x01\xf4\x50\
-\x0e\x69\xac\xfb\x68\x01\xd4\x52\x2b\x65\x68\x27\x02\x80\x16\x8a\
-\x45\x6d\xd4\x85\xf1\xfc\x34\x00\xea\x29\xa2\x50\x45\x20\x9b\xe5\
-\x27\x6b\x70\x71\xc5\x00\x3e\x8a\x6e\xff\x00\x97\x34\xd9\xae\xe3\
-\xb7\x85\xa4\x91\x95\x23\x8c\x6e\x67\x63\xb5\x54\x0e\xa4\x9f\x6a\
-\x00\x92\x8a\x82\xdf\x50\x8a\xf2\xd6\x39\xa1\x92\x39\xa1\x90\x65\
-\x1e\x36\x0c\xac\x3d\x88\xeb\x52\xab\xee\xed\x40\x0e\xa2\x82\x70\
-\x3b\xd2\x2b\x6e\x34\x00\xb4\x53\x59\xf0\x7a\x50\x64\xe7\xee\x9a\
-\x00\x75\x18\xc5\x30\xcd\xed\xed\x43\x4d\xb7\xb3\x7e\x54\x00\xfc\
-\x66\x8a\xab\x7d\xac\x5a\xe9\x91\xa3\xdd\x5c\x43\x6a\x92\x30\x44\
-\x69\xa4\x11\x86\x63\xd0\x0c\xf5\x3e\xd5\x39\x9b\x07\x90\x45\x00\
-\x3f\x14\x8d\xd2\x80\xd9\x14\x8f\xc8\xa0\x0f\x94\x7e\x3c\xdc\x2c\
-\x5f\xb7\xfe\x19\x95\x3f\xe2\xdc\xc4\x72\xce\x17\x3f\xf1\x34\x93\
-\x8a\xd2\x17\xd0\xa1\xf9\x66\x8f\xaf\x1f\x38\xaf\x5e\xf8\xa9\xfb\
-\x31\xfc\x38\xf8\xf1\xab\x5a\x5f\xf8\xd3\xc0\xbe\x14\xf1\x5d\xf5\
-\x8c\x2d\x6f\x6d\x71\xaa\xe9\x50\xdd\x4b\x04\x44\xee\x28\xac\xea\
-\x48\x52\xdc\xe0\x71\x9a\xe6\x47\xfc\x13\xcf\xe0\x39\x3f\xf2\x47\
-\x7e\x1b\xe7\xaf\xfc\x8b\xf6\xdf\xfc\x45\x75\x39\x52\x92\x5c\xd7\
-\xbd\xad\xb7\x6f\x99\x3a\x9e\x37\xe1\x0f\x81\xdf\x0e\xfe\x1e\xf8\
-\xcf\x50\xf1\x27\x87\xfc\x13\xe0\x3d\x03\xc4\x9a\xa8\x3f\x6e\xd5\
-\xb4\xcd\x0e\xce\xce\xfa\xf7\x3f\x7b\xcc\x9e\x38\xc4\x8f\x9e\xf9\
-\x6e\x7b\xe6\xb6\xb4\xff\x00\x0f\x68\xba\x47\x88\xf5\x2d\x62\xd3\
-\x4f\xd1\xed\x75\x8d\x68\x42\x35\x2b\xf8\x20\x8e\x3b\xad\x44\x40\
-\xa5\x20\x13\x48\x30\xf2\x08\xd5\x8a\xa0\x66\x3b\x41\x20\x60\x13\
-\x9f\x4a\xff\x00\x87\x79\xfc\x07\xdb\x9f\xf8\x53\x7f\x0e\x3f\x0f\
-\x0f\x5b\x7f\xf1\x14\x83\xfe\x09\xeb\xf0\x15\xba\x7c\x1d\xf8\x6e\
-\x7d\x3f\xe2\x9f\xb6\xff\x00\xe2\x2a\x6d\x43\xbb\xfb\x97\xf9\x86\
-\xa7\x92\xcb\xf0\xb3\xc1\x77\x12\xdd\xc9\x27\x86\x7c\x27\x24\x9a\
-\x8e\xad\x0f\x88\x2e\xd9\xb4\xcb\x62\x6e\x75\x28\x0a\x18\x6f\xa4\
-\xf9\x72\xf7\x31\x98\xd0\xa4\xed\x99\x10\xa2\x61\xbe\x51\x51\x7c\
-\x50\xf8\x45\xe0\x5f\x8e\x3a\x54\x7a\x7f\x8d\xfc\x23\xe0\xcf\x1a\
-\x58\xc2\xfb\xa2\xb7\xd7\xf4\x8b\x5d\x4e\x38\x4e\x41\x25\x56\x74\
-\x70\xa4\xe0\x74\xc7\x41\x5e\xc0\xdf\xf0\x4f\x4f\x80\xe8\xb9\x3f\
-\x07\x7e\x1b\x8e\x33\xff\x00\x22\xfd\xb7\xff\x00\x11\x50\xdf\xfe\
-\xc0\x9f\xb3\xfe\x97\x07\x9b\x75\xf0\x93\xe1\x8d\xbc\x7b\x82\xef\
-\x97\x42\xb4\x45\xc9\xe8\x32\x57\xa9\xa3\xf7\x1d\xdf\xdc\xbf\xcc\
-\x7a\x9e\x5d\x71\xf0\xe7\xc2\x37\x7e\x0c\xb7\xf0\xe4\x9e\x1d\xf0\
-\xb3\xf8\x76\xce\x58\x6e\x2d\xb4\x93\xa6\xdb\x0b\x0b\x69\x61\x91\
-\x65\x85\xd2\x0d\xbe\x5a\xb4\x72\x22\xba\x30\x50\x55\x91\x58\x60\
-\x80\x6a\xfe\x91\xa1\xe8\xde\x1e\xd6\x35\x4d\x43\x4f\xb1\xd2\x74\
-\xfd\x43\x5c\xba\x5b\xdd\x4e\xea\xd6\x08\xe1\x9b\x52\xb8\x54\x58\
-\x96\x69\xdd\x46\xe9\x5d\x63\x44\x40\xce\x4b\x05\x45\x00\x80\x00\
-\xaf\x47\x3f\xf0\x4f\x5f\x80\xea\x3e\x6f\x83\xbf\x0e\x3f\xf0\x9f\
-\xb6\xff\x00\xe2\x29\x57\xfe\x09\xe3\xf0\x1d\xbf\xe6\x8e\xfc\x37\
-\xff\x00\xc2\x7e\xdb\xff\x00\x88\xa3\xf7\x1d\xdf\xdd\xff\x00\x04\
-\x35\x3c\xcb\xc2\x5e\x13\xf0\xf7\x80\x2c\x6e\x6d\x74\x0d\x2f\x43\
-\xd0\x6d\x2f\x2e\xe5\xd4\x6e\x60\xd3\x6d\x21\xb4\x8e\xe2\xea\x63\
-\xba\x6b\x87\x58\xc0\x0d\x2c\x87\x96\x72\x37\x31\xea\x4f\x5a\xa3\
-\xe1\x89\xe3\x9b\xf6\xf1\xf8\x4b\xb6\x48\xdb\xfe\x24\x5e\x25\xc8\
-\x0c\x09\x03\x6e\x9d\x5e\xb8\x7f\xe0\x9e\x3f\x01\xf1\xff\x00\x24\
-\x77\xe1\xbf\xfe\x13\xf6\xdf\xfc\x45\x6e\xfc\x31\xfd\x91\xbe\x16\
-\x7c\x1c\xf1\x4f\xf6\xe7\x84\x3e\x1e\xf8\x37\xc3\x3a\xca\xc2\xf6\
-\xbf\x6e\xd3\x74\x88\x6d\xae\x04\x4e\x54\xba\x6f\x55\x0d\xb5\x8a\
-\xa9\x23\x3c\xed\x1e\x95\x51\x9d\x28\x5d\xc6\xf7\xb3\x5b\x2e\xaa\
-\xdd\xc4\x7a\x32\x8a\xf0\x6f\xf8\x2a\x28\xc7\xfc\x13\xab\xe3\x6f\
-\xfd\x89\xba\x97\xfe\x88\x6a\xf7\xa5\x5d\xa2\xbc\x1b\xfe\x0a\x8b\
-\xff\x00\x28\xea\xf8\xdb\xff\x00\x62\x6e\xa5\xff\x00\xa2\x1a\xa3\
-\x09\xfc\x68\x7a\xaf\xcc\x25\xb1\x9b\xe2\x31\x8f\x10\xdf\x7f\xd7\
-\xcc\xbf\xfa\x19\xaf\x8a\x7f\xe0\xa4\x7f\xb2\x2f\x8f\xbf\x68\x8f\
-\x17\x78\xf2\xeb\xc2\x7a\x44\x3a\x84\x1a\xe7\xc0\x9d\x73\xc1\x16\
-\x6c\xf7\xd0\xc1\xe6\xea\xb7\x5a\xad\x95\xcc\x30\x61\xd8\x10\x0c\
-\x50\xc8\x77\x9f\x90\x63\x04\x82\x71\x5f\x6a\xf8\x99\xf6\x78\x86\
-\xff\x00\xfe\xbe\x65\xed\xfe\xd9\xaa\x8b\x0b\x4c\x1b\x62\xb3\x79\
-\x7f\x7b\x6a\xe7\x6f\xd6\xb0\x28\xf9\x5b\xf6\xe4\xfd\x8d\x3c\x49\
-\xfb\x5b\xf8\xdb\xc1\x3a\x55\x9d\xc2\xe9\x1a\x0f\xfc\x2b\x7f\x19\
-\x78\x3f\x54\xd6\x37\xab\xff\x00\x63\xcf\xaa\x59\x58\x43\x6a\x44\
-\x5b\x95\xa5\x42\xf0\xc9\xb8\x27\x1b\x54\x8c\x8c\x8a\x4d\x56\x5f\
-\x8f\xdf\x1f\x7c\x09\x79\xe1\xbf\x10\x7c\x27\xf0\x87\xc3\xfd\x3f\
-\x47\xf0\x7e\xaf\xa5\x4f\x31\xd7\xed\x75\xb6\xd7\x35\x09\xb4\xc9\
-\x2d\x2d\xa3\xd2\xf6\x24\x66\xc6\xdc\xc8\xe5\x9e\x49\x8a\xbe\xcc\
-\x44\x53\x04\xb8\xf7\xad\x0b\xe3\x6e\x83\xe2\x3f\x8d\x7e\x24\xf8\
-\x7b\x6b\x25\xe3\x78\x97\xc2\x7a\x5e\x9f\xac\x6a\x31\x49\x6f\xb6\
-\x05\xb7\xbe\x33\x8b\x7d\x92\x67\xe6\x62\x6d\xa5\xdc\x07\x2b\x81\
-\xc9\xc9\x03\xb0\x78\x24\xf3\x36\xb4\x72\xab\xb0\xce\xd2\xa7\xa7\
-\xd3\xf1\xa0\x0f\x8b\x7f\x68\x2f\xd8\x9f\xc6\xde\x37\xfd\x98\xff\
-\x00\x66\x3f\xec\xfb\x3d\x7a\xf3\xc4\x5f\x03\x74\x8b\x5b\x5d\x5b\
-\xc3\x5a\x1f\x8d\x24\xf0\xad\xf5\xf8\x93\x47\x82\xca\xe1\x2d\x75\
-\x38\x48\x11\xcd\x04\x91\x6e\x50\x48\x8e\x55\x32\x21\x65\x0f\xba\
-\xb8\xbd\x3f\xf6\x41\xf8\xd1\xf0\xe7\xe1\xbb\x78\x83\xc1\xfe\x1d\
-\xf1\x66\x89\xa9\xf8\xa3\xc6\xa3\x55\xf1\x16\x89\x07\xc4\xa4\xd5\
-\x3c\x72\xda\x5c\x7a\x57\xd8\xa0\x64\xf1\x06\xa2\x25\x86\x2b\x8f\
-\x34\x0f\x31\x6d\xd5\x0f\xd9\xc4\x71\x2c\xa7\x63\x16\xfd\x06\x96\
-\x26\x84\x28\x91\x59\x49\x19\x1b\x86\xdc\x8a\x47\xb6\x78\xc1\x2d\
-\x1c\x8b\xb7\x03\x25\x78\x19\xe7\xf5\xa0\x0f\xce\x5f\x06\x7e\xc1\
-\xdf\x14\x2d\x3e\x17\xf8\xfa\x6f\x13\x7c\x35\xba\xf1\x46\xad\xa9\
-\xfc\x4e\x4f\x17\xd8\x5b\xdd\x7c\x53\xb8\xff\x00\x84\xb2\x2b\x29\
-\x74\x5b\x7b\x23\x35\x8f\x88\x53\x63\x47\x7d\x1c\x91\x62\x45\x99\
-\x04\x52\x44\x5e\x25\x3b\x76\x38\x9b\x5a\xfd\x85\xbe\x39\x7c\x4a\
-\xf8\x3f\xa6\xde\x6b\x97\x9f\x10\xaf\x23\xf0\x6f\x8d\xed\x7c\x4b\
-\xe1\xcf\x07\xea\xff\x00\x13\xb3\xe2\xb1\x61\xfd\x9b\x71\x67\x77\
-\x6e\xde\x23\xb5\x55\xd9\x31\x7b\x85\x92\x10\xe6\x40\xa2\x17\x8d\
-\xa4\xc4\xb9\x5f\xbd\xfe\x23\x7c\x47\xd1\x7e\x13\xf8\x4a\x5d\x7b\
-\xc4\x57\xeb\xa6\xe9\x29\x77\x69\x62\xd7\x0e\xac\xcb\xe7\xdd\x5c\
-\xc7\x6b\x6e\x98\x50\x4e\x64\x9e\x68\x90\x7b\xb8\xe8\x39\xaa\x7e\
-\x06\xf8\xc3\xa2\xfc\x46\xf8\x8d\xe3\xef\x0b\xe9\x6d\x7d\x26\xb1\
-\xf0\xd7\x52\xb7\xd2\xb5\xe4\x92\xdc\xa4\x70\xcf\x3d\xa4\x57\x68\
-\x11\xbf\x89\x7c\x99\xa3\x24\x8c\x60\x92\x3a\x8a\x00\xf8\x8e\xcf\
-\xfe\x09\xff\x00\xe2\xbb\xdf\x84\xbe\x26\xd7\xae\xbe\x15\xea\x17\
-\xda\xe6\xb5\xe2\xad\x2b\x54\x8f\x40\xf1\x0f\xc5\xcd\x46\xfb\xc5\
-\xd0\x5a\x59\xda\x4f\x6c\x2e\xa0\xf1\x08\x94\xa5\xad\xfa\xb5\xc1\
-\xf2\xe3\x4d\xd1\x7d\x9c\x3c\x6e\xc5\x98\x15\xf7\x5f\xf8\x27\xa7\
-\xc3\x0f\x8a\x9f\x0d\xec\x3c\x64\xde\x3f\xbb\xf1\x94\x1e\x1d\xd4\
-\x2e\x6d\x3f\xe1\x16\xd0\x7c\x5f\xe2\xb8\x7c\x55\xaf\x68\xe9\x1c\
-\x4c\x2e\x4c\xda\x94\x4a\x03\xc7\x23\x34\x62\x38\x59\xa4\x31\x88\
-\xd8\xf9\x84\x38\x55\xfa\x42\x38\xda\x45\x6d\xa8\xcc\x46\x73\x81\
-\xf7\x7e\xbe\x95\x05\xf5\xcf\xd8\xac\x26\x9d\x62\x9a\xe1\xa1\x8d\
-\xa4\x11\x42\xbb\xa4\x94\xa8\x27\x6a\x8c\xf2\xc7\xa0\x19\x19\x3e\
-\x9d\x68\x03\xe3\x5f\xdb\x53\xf6\x3e\xf1\x96\xbb\xfb\x5b\x49\xf1\
-\x43\xc3\x7a\x2f\xc4\x2f\x1b\x69\xba\xe7\x85\xec\xbc\x3b\x77\xa4\
-\xf8\x47\xe2\xa4\xfe\x03\xbe\xd2\xa7\xb4\xb8\x9e\x58\xa7\x67\x57\
-\x58\xee\xad\xe4\x5b\x96\xdc\xac\x43\xc4\xd1\x96\x50\xdb\xc8\xac\
-\xbf\x17\x7f\xc1\x3f\xfe\x22\x78\x07\xf6\x5d\xf8\x57\xa5\xfc\x38\
-\x3a\x76\x87\xe3\xed\x27\x4e\xd5\xbc\x1b\xe2\x23\x16\xb7\x71\x71\
-\x1d\xa6\x8b\xae\xcb\x24\xd7\x92\xc5\x77\x72\x4c\xd7\x32\xd9\x5c\
-\x34\x73\x46\x5c\x82\xe5\x65\x0a\x10\x30\x51\xf4\x7d\xdf\xed\xa5\
-\xf0\xfe\xcf\xf6\x6b\xb7\xf8\xb4\xba\xa5\xec\xde\x13\xb9\x74\xb6\
-\x82\x28\xac\x5d\xf5\x49\xaf\x9e\x7f\xb3\x0d\x35\x6d\x31\xe6\xfd\
-\xbb\xed\x03\xc9\x36\xf8\x0e\x24\x56\x04\x71\x9a\xef\xfc\x6f\xe2\
-\x98\xfc\x05\xe0\xbd\x5b\x5c\xb9\xb1\xd5\xaf\x61\xd2\x2d\x24\xbe\
-\x96\xd3\x4f\xb5\x37\x57\xd2\xac\x68\x59\x92\x38\x57\x99\x25\x20\
-\x11\xb5\x79\x27\x20\x64\xd0\x07\xc5\x7f\xb4\xa7\xec\x11\xe2\x2f\
-\x05\x7e\xd1\xab\xe2\x9f\x87\xfe\x18\xf8\x81\xe2\x8f\x07\xde\xf8\
-\x33\x46\xf0\x85\xae\x8d\xe1\x0f\x8b\x17\x1e\x02\xb8\xf0\xef\xf6\
-\x57\x9f\x14\x02\x4d\x8c\xa9\x73\x68\xf0\xcc\xa4\xf2\x64\x89\xd6\
-\x56\x55\x7f\x34\x8a\xee\xbf\x61\x7f\xd8\xcf\xc5\x1f\xb2\xcf\xc7\
-\x9b\x1b\x9b\xad\x3a\xc6\xcf\x41\xd3\xbe\x10\xe9\x9e\x14\x49\xec\
-\xf5\x39\x2e\xd1\x35\x25\xd6\x6f\x6f\xae\x6d\xa2\x79\xdc\xdc\x3c\
-\x68\x2e\x54\x2c\x92\x7d\xe0\xa3\xa6\x36\xaf\xb7\x78\x97\xf6\xa7\
-\xf0\x2f\x86\x3f\x66\xa8\xfe\x2e\x4d\xad\xc7\x75\xe0\x3b\xbd\x32\
-\xdb\x55\xb2\xbd\xb4\x8c\xdc\x49\xa8\x47\x73\xb0\x5b\xc7\x04\x43\
-\xe6\x92\x79\x5e\x48\xe3\x48\x47\xce\x64\x60\x98\xce\x40\xef\xb4\
-\xe9\xa4\xbb\xb5\x86\x65\x82\xea\xde\x49\x51\x64\x10\xca\x9b\x26\
-\x88\x91\x9d\xac\xbd\x9c\x74\x23\xb1\xc8\xe6\x80\x3e\x25\xfd\x98\
-\xfe\x0f\x35\xef\xfc\x15\x4b\xe2\x77\xf6\x6e\xaf\xa6\xeb\x7f\x0c\
-\x7e\x1a\xcf\x73\xe2\xbd\x12\x2b\x39\x04\xd0\xe9\x3e\x23\xf1\x25\
-\xb5\xb4\x77\xf6\xec\xea\xc5\x04\xb1\x47\x67\x75\x28\x41\xca\x0d\
-\x54\x93\x82\xd8\x3f\x70\x03\xb5\xd4\xf6\xc8\xcd\x61\xf8\x17\xe1\
-\x8f\x87\x7e\x12\xe9\x37\x1a\x7f\x86\x7c\x3b\xa3\xf8\x66\xc6\xfa\
-\xf2\x6d\x46\x7b\x7d\x32\xc2\x3b\x38\xee\x6e\x66\x3b\xa5\x9d\x95\
-\x14\x07\x91\xce\x0b\x31\xe4\xf7\xe9\x5b\x8d\x1c\x81\x95\x5a\x36\
-\x5d\xd9\xc0\x23\x19\xf5\xc7\xad\x00\x7c\x7b\xa7\xfe\xc3\x9e\x2e\
-\xf1\x97\xec\x65\xfb\x41\x78\x0b\x52\x87\x4f\xd1\xfc\x41\xe3\x8f\
-\x89\xfe\x22\xf1\x8f\x85\xe5\xb9\x99\x67\xb7\x70\xd7\xf6\xf7\xda\
-\x6c\xb2\x98\xc9\x31\xac\x92\x5b\x28\x6e\xaf\x18\x24\x95\x38\xc1\
-\xeb\x3c\x19\xa0\xfc\x51\xfd\xa5\x3f\x6b\x8f\x00\xfc\x44\xf8\x89\
-\xf0\xc6\xc7\xe1\x66\x9b\xf0\xaa\xcf\x59\x96\xce\xd4\xf8\xa2\xdf\
-\x5c\xb8\xd6\x35\x4d\x4e\xd9\x6c\xdd\xe2\x6b\x74\x55\x8a\xda\x2b\
-\x73\x71\x86\x93\xe7\x73\x30\xfd\xda\x6d\x24\xfb\xe6\xbb\xe2\xf5\
-\xf0\xff\x00\x8b\xf4\x0d\x1a\x6d\x2f\x5f\xb8\x9b\xc4\x9f\x69\x11\
-\xdd\xda\xe9\xef\x35\x8d\x97\x93\x1a\xb9\xfb\x4c\xc3\xe5\x80\x3e\
-\xed\xb1\x96\xfb\xec\xac\xa3\x90\x6b\x68\xc3\x24\x64\x6e\x8d\xc1\
-\x63\x80\x30\x79\x23\x3c\x0f\xca\x80\x3c\x67\x59\xf8\x49\xe2\x0b\
-\xaf\xf8\x29\x2f\xc3\xef\x88\xd1\x59\xc6\x7c\x29\xe1\xff\x00\x87\
-\xda\xce\x83\x77\x7d\xe7\xa2\xbc\x37\x97\x1a\x95\x84\xd1\xa0\x4c\
-\xef\x21\xa3\x82\x43\xb8\x0c\x0c\x60\x9e\x40\xaf\x13\xf8\x7f\xfb\
-\x20\x7c\x43\xd0\x3f\x61\x2f\x86\x7e\x07\xba\xd1\x61\x8f\xc4\x9e\
-\x1d\xf8\xd1\x0f\x8c\xb5\x1b\x41\x7f\x06\xc8\xb4\xe5\xf1\x6d\xce\
-\xa2\xd3\x6f\xdd\xb1\x98\x5a\xc8\x8d\xb4\x1d\xdc\xed\xc6\x41\x15\
-\xf6\x81\x8d\x96\x4d\xac\xae\x19\x7a\x00\xa7\x3c\x7a\x56\x1f\x8e\
-\x7e\x21\x68\x9f\x0d\xa6\xd0\x20\xd7\x2f\x97\x4f\x93\xc5\x1a\xcc\
-\x3e\x1e\xd2\x63\x74\x62\xf7\xd7\xf3\x24\x8f\x1d\xba\x00\x0f\xcc\
-\x52\x19\x5b\x9e\x30\x8c\x49\xa0\x0f\x91\xec\xbf\x63\xcf\x88\x31\
-\x7e\xc1\x7e\x19\xf0\x3b\x68\x90\xaf\x88\x6c\x3e\x37\x2f\x8c\xae\
-\x6d\x1a\xf6\x0d\x83\x4d\x1e\x30\x9f\x52\x33\x97\xdd\xb0\xb7\xd8\
-\xd9\x1f\x6e\x77\xf2\x17\x1b\x86\x07\xb8\x7c\x36\xf8\x4d\xe2\x2d\
-\x07\xf6\xff\x00\xf8\xdd\xe3\xcb\xeb\x45\x5f\x0c\xf8\xcb\xc3\x9e\
-\x14\xd3\xf4\x9b\xb3\x70\x8e\xd7\x53\x58\xff\x00\x69\xfd\xa5\x4a\
-\x03\xb9\x76\x7d\xa2\x2e\x58\x00\xdb\xb8\xce\x0e\x3d\x90\xc2\xc6\
-\x3d\xfb\x1b\x69\xfe\x22\x3e\x5e\x9e\xb4\xa2\x16\x58\xf7\x6d\x70\
-\xac\x32\x09\x1c\x60\x8e\xbf\x4c\x01\x40\x18\xdf\x11\x3f\xe4\x9d\
-\x78\x93\xfe\xc1\x37\x9f\xfa\x22\x4a\xf5\xef\xd8\x5b\xfe\x4c\x8f\
-\xe0\xe7\xfd\x88\xfa\x2f\xfe\x90\x41\x5e\x43\xf1\x0c\xe7\xe1\xcf\
-\x88\xff\x00\xec\x11\x79\xff\x00\xa2\x24\xaf\x5e\xfd\x85\xbf\xe4\
-\xc8\xfe\x0e\x7f\xd8\x8f\xa2\xff\x00\xe9\x04\x15\xbf\xfc\xb8\xf9\
-\xfe\x84\xfd\xa3\xd5\x28\xa2\x8a\xc0\xa0\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x02\xbe\xa9\xcd\x94\xdf\xf5\xc9\xff\x00\x95\x7c\x43\xff\x00\
-\x06\xde\x9f\xf8\xd3\x17\xc1\xfc\xff\x00\xcf\x6f\x10\x7f\xea\x41\
-\xa9\x57\xdc\x17\xd1\x79\xd0\xb2\x67\x6f\x98\xac\x99\xf4\xcd\x7e\
-\x6c\x7e\xcb\x3f\xf0\x4d\x1f\xdb\x43\xf6\x2e\xf8\x1b\xa3\xfc\x35\
-\xf8\x77\xfb\x45\x7c\x1e\xb7\xf0\x67\x87\x66\xbc\x6d\x32\x3d\x43\
-\xe1\xf4\xd7\x37\x4a\x97\x37\x93\x5d\x36\xf9\x3e\xd0\x37\x1d\xf3\
-\xbf\xd0\x60\x73\x8c\xd0\x07\xe9\x52\xc9\x93\x4e\xdd\xcd\x7e\x54\
-\xff\x00\xc1\x46\x3f\x63\xbf\xf8\x28\x07\xc4\x5f\xd8\x9f\xe2\x06\
-\x96\xff\x00\x1b\x3e\x1e\xf8\xbe\x46\xb2\x86\xea\xdf\x47\xf0\x9f\
-\x82\x6e\x34\xbd\x6e\xfa\x78\x2e\x61\x9e\x25\xb5\xb9\x5b\x9c\xc3\
-\x28\x92\x25\x21\xb0\x7e\xef\x38\x1c\x8f\x7a\xff\x00\x82\x2f\xfe\
-\xce\x7f\xb5\x87\xc0\x8f\x82\x6a\xbf\xb4\xff\x00\xc5\xcb\x6f\x1d\
-\x6a\x37\x56\xe8\xba\x7e\x84\xd6\xa9\x77\x7d\xa1\xf4\x24\xdc\xea\
-\x99\x0d\x73\x21\x5c\xa9\x5c\x38\x53\xcf\x9a\xf9\xe0\x03\xed\xda\
-\xfc\x17\xff\x00\x83\xba\xbc\x35\x73\xf1\x0b\xf6\xdc\xfd\x90\xfc\
-\x1e\x9a\xb6\xad\xa4\xd9\xf8\xb6\x7b\xad\x22\xe6\x6b\x09\x8a\x4a\
-\x89\x71\x7f\x61\x0b\x32\x8c\xe0\xb0\x0e\x48\xcf\x19\xaf\xde\x85\
-\xe9\x5f\x81\x7f\xf0\x78\x0f\x80\x63\xf8\xaf\xfb\x70\x7e\xc8\x5e\
-\x17\x96\xf2\xe7\x4e\x8b\xc4\x93\xdd\xe9\x4f\x77\x6e\x33\x35\xa8\
-\x9f\x50\xb0\x88\xc8\x83\x8f\x99\x77\x64\x7b\x81\x40\x1e\x9d\xe3\
-\x3f\xf8\x34\x43\xc1\xff\x00\x0e\x3c\x1b\xac\xeb\x9e\x1f\xfd\xa7\
-\x3e\x2f\x78\x6b\x56\xd2\x6c\x67\xba\xb7\xd4\xef\xa7\x85\x2d\x2c\
-\x8a\x23\x36\xf9\x9a\x3f\x2d\xc4\x60\x0c\xb1\x0e\xb8\x19\x35\x9f\
-\xff\x00\x04\x64\xfd\xbb\x3e\x26\x7e\xd9\x7f\xf0\x6f\xaf\xed\x29\
-\x17\xc4\x6d\x63\x54\xf1\x16\xa5\xf0\xe7\x44\xd7\x34\x5d\x37\xc4\
-\x37\x92\x34\x97\x97\x96\xcd\xa4\x99\xd6\x39\x66\x24\xb4\x92\xc2\
-\x5c\x8d\xe7\xe6\xd8\xf1\x83\x92\x32\x7e\x41\xff\x00\x82\xc3\xff\
-\x00\xc1\xbd\xbe\x28\xff\x00\x82\x61\xf8\x17\x47\xf8\xa9\xa4\x78\
-\xcb\xc6\x9f\x1b\xfe\x0f\xe9\xf7\xd1\x43\xe3\x3d\x22\xe6\xe5\xf4\
-\xed\x42\xc2\x06\x70\x03\x19\xa3\x32\x2f\x91\x26\x7c\xb3\x2f\x97\
-\x98\x9d\x90\x95\x70\xc7\x6f\xeb\x17\xc1\xbb\x4f\x81\xf0\xff\x00\
-\xc1\xbb\xbe\x31\xbc\xfd\x9e\xb4\x98\x74\x5f\x86\xfa\xbf\xc3\x5d\
-\x76\xf6\x1b\x56\x97\xce\xbc\x4b\xc6\xb3\x98\x5d\x2d\xe4\x84\x96\
-\x7b\x94\x95\x59\x1c\xb1\x38\xf2\xd4\x0c\x22\xa8\x00\x1f\x95\x1f\
-\xf0\x44\xbf\xf8\x21\x37\x80\xff\x00\xe0\xa6\xdf\xb1\x4f\xfc\x2c\
-\xcf\x1a\x7c\x72\xf1\xff\x00\x83\x75\x95\xd7\xef\x34\x81\xa7\xd8\
-\x5f\xdb\xac\x3e\x54\x2b\x09\x57\xfd\xf6\x5b\x27\xcc\x3e\xdc\x57\
-\xe9\xf7\xfc\x13\x23\xfe\x0d\xf7\xf8\x73\xff\x00\x04\xf4\xfd\xaa\
-\x6c\xfe\x28\x78\x5b\xe3\x57\x8e\xfc\x79\xa9\x69\x9a\x75\xd5\x89\
-\xd2\xf5\x2b\xbb\x59\xad\x8a\x5c\x20\x42\xec\x23\x1b\x81\x1d\xbd\
-\xf1\x5f\x9b\x1f\xf0\x41\x2f\xf8\x37\x67\xe0\xff\x00\xfc\x15\x03\
-\xf6\x10\x6f\x89\x9e\x38\xf1\x77\xc4\xcd\x13\x5a\x5f\x12\x5f\x69\
-\x02\xdf\x42\xbf\xb5\x86\xd3\xca\x85\x20\x65\x6d\xb2\x5b\xc8\xdb\
-\x8f\x98\x72\x77\x63\x81\xc5\x7e\xb7\x7f\xc1\x2f\x7f\xe0\x82\x7f\
-\x0a\xbf\xe0\x93\xdf\x16\xbc\x49\xe3\x1f\x00\xf8\xa7\xe2\x1e\xbd\
-\xa8\x78\x9b\x47\x1a\x2d\xcc\x5e\x20\xbd\xb6\x9e\x18\xa2\x13\x24\
-\xdb\x90\x45\x04\x64\x36\xe8\xd4\x64\x92\x31\x9e\x3b\xd0\x07\xe6\
-\x6f\xfc\x15\xeb\xfe\x0d\xb9\xf0\x7f\xec\x25\xfb\x08\xfc\x51\xf8\
-\xdd\xa1\xfc\x66\xf8\xad\xad\x6b\x7e\x18\xfb\x35\xe4\x1a\x7d\xf4\
-\xd0\x2d\xac\xcd\x73\xa8\xc1\x03\x06\x28\xa1\xb0\x04\xec\x46\x08\
-\xe5\x47\x6a\xd6\xff\x00\x82\x42\x7f\xc1\xb7\xde\x0f\xfd\xae\x3f\
-\x63\xcf\x83\xbf\x1e\x35\x8f\x8c\xbf\x15\x34\xcd\x73\x5c\x03\x59\
-\x9b\x4c\xb5\x9a\x06\xb4\x49\x2d\xef\xa4\x55\x45\x2e\xa5\xb6\x91\
-\x0a\xe7\x24\x9c\x93\xf4\xaf\xd1\x0f\xf8\x39\x84\xff\x00\xc6\x8e\
-\x3e\x3b\x0e\xff\x00\x63\xd2\xbb\x7f\xd4\x66\xc6\xb5\x3f\xe0\xdc\
-\x96\xc7\xfc\x11\x4b\xe0\x0e\x7f\xe8\x0d\x77\xff\x00\xa7\x1b\xaa\
-\x00\xfc\x97\xfd\xa2\xbf\x61\xab\x5f\xf8\x29\x8f\xfc\x1d\x2d\xf1\
-\xbf\xe1\x1e\xbd\xe3\x4f\x17\xf8\x47\x43\x92\xce\x3d\x54\x5c\xe8\
-\x93\x8f\x36\x37\x83\x48\xd3\xc8\x5d\xaf\x95\xda\x4b\x9c\xf1\x9e\
-\x95\xd6\x7f\xc1\x50\xff\x00\xe0\x85\xf7\x5f\xf0\x46\x5f\xd8\xdf\
-\x5a\xf8\xfd\xf0\x9b\xf6\x9a\xf8\xb5\xa7\xf8\x9b\xc1\xba\x96\x9c\
-\x61\xb2\xbd\xbe\x5b\x7f\xed\x46\x9e\xee\x2b\x70\x91\x98\x99\x09\
-\x91\x04\xad\x29\x56\x57\x0d\x1c\x72\x02\xa0\x64\xd7\x07\xfb\x47\
-\xfe\xc0\x56\x3f\xf0\x52\xaf\xf8\x3a\x97\xe3\x8f\xc3\x1d\x47\xc6\
-\x1e\x20\xf0\x3d\xbd\xc5\x92\x6a\x5f\xda\x7a\x3a\xab\x5c\x86\x87\
-\x48\xd3\xc8\x8f\xe6\x20\x6d\x6d\xdc\xfd\x3f\x11\xe6\x7f\xb4\x67\
-\xfc\x12\xd7\xc3\x1f\xf0\x48\xcf\xf8\x29\x67\x80\x74\x0f\xda\x98\
-\xf8\xa3\xe2\xf7\xec\xe3\xe3\x4b\x85\x1a\x5f\x89\xe2\xd4\x67\xd3\
-\x63\xb5\x7d\xea\x1f\xed\x51\x86\x7c\xb4\x04\x8f\x36\x35\x91\x77\
-\xc4\xfe\x62\xb6\x41\x8c\x00\x7f\x44\x9f\xf0\x4c\xcf\xda\x27\xc4\
-\x1f\xb5\x7f\xfc\x13\xeb\xe0\xff\x00\xc4\xaf\x17\x5b\x47\x65\xe2\
-\x4f\x18\x78\x5a\xcf\x51\xd4\xc2\xc5\xe4\xc7\x2c\xec\x98\x79\xd5\
-\x7a\x2a\x4b\x8f\x31\x47\x40\xae\x3b\x57\xf3\x87\xff\x00\x05\x3a\
-\xfd\xab\xbe\x2e\x7e\xd3\xff\x00\xb7\xb7\xc5\xaf\xda\xff\x00\xe1\
-\xbd\xed\xef\xfc\x2b\x6f\xd9\xf7\xc7\x3a\x2f\x86\xb4\x89\xd6\xea\
-\x45\x81\x04\x4f\x22\xdb\xc8\x23\x04\x6e\x8a\x59\xad\x9d\xe4\x1c\
-\x63\xed\xd1\xaf\x46\xe3\xf7\x67\xfe\x0b\x63\xfb\x64\x68\xbf\xf0\
-\x4e\xbf\xf8\x24\x57\x8d\x35\xdf\x09\xc9\xa7\xe9\x77\x1a\x96\x89\
-\x1f\x84\x3c\x11\x16\x9a\x63\x8e\x1b\x79\x2e\xe1\xf2\x20\x7b\x60\
-\xbf\x2e\xdb\x7b\x7d\xf3\x20\x50\x57\x10\x2f\x18\xaf\xc5\x8f\xd9\
-\x2f\xe2\xf7\xc6\xbf\x83\xdf\xf0\x47\xef\x17\x7e\xcd\x71\xff\x00\
-\xc1\x3e\xfe\x39\xf8\xca\xc7\xe2\x84\x37\x9a\x85\xef\x8c\xe0\xd3\
-\xb5\x58\x96\xf2\xe2\xe3\x6b\x59\xde\x47\x00\xd2\xe4\x05\x60\x58\
-\xed\xca\x81\x31\x0f\xe5\xee\x05\x77\xf0\x01\xfd\x20\x7c\x20\xfd\
-\xa5\xfc\x31\xf1\x9b\xf6\x5e\xd0\x7e\x2d\x69\x77\x2d\xff\x00\x08\
-\x97\x88\x3c\x3d\x1f\x89\x52\x42\x37\x34\x36\xcd\x07\x9e\xc0\x80\
-\x33\xb9\x06\xe0\x40\xee\xb5\xf8\x8b\xfb\x22\x7e\xcb\x1e\x36\xff\
-\x00\x83\xa9\xbe\x27\x7c\x48\xf8\xc1\xf1\xb3\xe2\x2f\x8d\xbc\x1f\
-\xf0\x13\xc3\x3a\xfc\xba\x27\x83\x7c\x1d\xe1\x9b\xb8\xe1\x20\x84\
-\x12\x73\xe7\x24\x91\x86\x8e\x17\xb7\xf3\x26\x68\x59\xa6\x79\x1c\
-\x2f\x94\xa8\x14\x7a\xa7\xfc\x1b\x37\xf1\xcf\x56\xfd\xa7\x3f\xe0\
-\x93\x9f\x1a\xbf\x66\x5d\x71\xaf\xb4\xdf\x1d\x7c\x34\x8b\x56\xd0\
-\x6d\xac\xae\xc3\x5b\xde\xda\xd9\xea\x10\xce\x23\x47\x47\xc3\x2b\
-\xc5\x77\xf6\xa4\x20\x81\xb0\x79\x6b\xc6\x2b\x5b\xfe\x0c\xe7\xf8\
-\xcb\xa3\x68\x9f\xb2\x6f\xc4\xcf\x82\x7a\xac\xf1\xe9\x3f\x12\xbc\
-\x0f\xe3\x5b\xbb\xcd\x43\x42\xbb\x61\x0d\xe7\x91\x24\x50\xc2\x5c\
-\x44\xd8\x63\xe5\xcd\x6f\x2c\x6f\x80\x76\x10\xbb\xb1\xbd\x72\x01\
-\x9b\xe0\x2f\xf8\x21\x27\xed\x05\xff\x00\x04\x98\xfd\xba\x3e\x1f\
-\xf8\x9f\xf6\x3f\xf1\xc6\xb3\xe2\xcf\x84\xba\xb4\xfb\x3c\x67\xe1\
-\xef\x19\xeb\x90\x5b\xc3\x0c\x0a\xd1\x89\x16\x61\x1a\xa2\xcf\xe6\
-\xab\x48\xd1\x49\x15\xbf\x99\x13\x47\xf3\x64\x1c\xb7\xbb\xff\x00\
-\xc1\x45\xbf\xe0\xdb\x7f\x04\xff\x00\xc1\x40\x7f\x6a\x5f\x14\xfc\
-\x5e\xd6\x3e\x2f\x7c\x50\xf0\xb6\xa1\xaf\x5b\xdb\xac\x9a\x66\x90\
-\xd6\xe2\xce\xdb\xec\xf6\xc9\x0a\xec\x0c\xbb\xbe\x61\x18\x62\x09\
-\xea\xc7\x9c\x74\xf6\xdf\xdb\x8f\xfe\x0b\x5f\xf0\x87\xf6\x08\xfd\
-\xa9\xbe\x1b\x7c\x21\xf1\x44\x7e\x20\xf1\x07\x8b\xbe\x23\x4b\xe4\
-\x8b\x4f\x0e\x43\x1e\xa1\x73\xa2\xb4\x92\x45\x1d\xaf\xda\x60\x0e\
-\x25\xff\x00\x48\x79\x08\x40\x8a\xcc\x7c\xb2\x76\x91\x8a\xfa\xe3\
-\x58\xff\x00\x90\x3d\xdf\xb4\x0f\xfc\x8d\x00\x7f\x2e\x9f\xf0\x41\
-\x3f\xf8\x22\xd6\x87\xff\x00\x05\x6e\xf0\x6f\xc5\x4d\x4b\xc5\x9f\
-\x15\x3e\x24\x78\x5e\x6f\x00\xeb\x36\xba\x6d\xa2\xe9\x17\x11\xb2\
-\xdc\xa4\xa9\x2b\x16\x93\xcd\x0d\xf3\x0f\x2c\x63\x04\x0e\x4f\x5a\
-\xfe\x91\xbf\x62\xdf\xd9\x96\xc7\xf6\x34\xfd\x97\x7c\x17\xf0\xb7\
-\x4c\xd6\x35\x4f\x10\x58\xf8\x27\x4e\x5d\x3a\x1d\x43\x52\x2b\xf6\
-\xab\xa5\x0c\xcd\xba\x4d\xa0\x2e\x7e\x6c\x71\xd8\x0a\xfc\x8f\xff\
-\x00\x83\x2a\x3f\xe4\x98\x7e\xd2\x1f\xf6\x34\xe9\xdf\xfa\x2a\xe6\
-\xbf\x70\x68\x03\xf1\x1f\xfe\x0f\x44\x96\xe9\xbe\x1b\xfe\xce\x36\
-\xb6\xd7\xd7\xba\x7f\xdb\xfc\x4f\xa8\xdb\x49\x2d\xb4\xa6\x37\x0a\
-\xd1\x5b\x2e\x78\x23\xa6\x4f\x5a\xd0\xd5\x3f\xe0\xd1\x0b\x4f\x09\
-\x78\x4e\xe3\x56\xf8\x63\xfb\x4e\x7c\x5f\xf0\xff\x00\x8d\x96\xd3\
-\xcd\xd2\xee\xae\xa5\x54\xb7\x33\x05\xdc\x89\x23\x5b\xb4\x72\x22\
-\x97\x0a\x0b\x2b\x12\xbd\x42\xb6\x31\x54\x7f\xe0\xf3\xce\x7c\x11\
-\xfb\x32\x7f\xd8\xe1\x7b\xff\x00\xa2\xed\x6b\xf6\x7a\xe3\x5d\xb1\
-\xf0\x9f\x82\xc6\xa5\xaa\x5e\x5a\x69\x9a\x6e\x9b\x66\x2e\x6e\xee\
-\xee\xe6\x58\x60\xb5\x89\x13\x73\xbc\x8e\xc4\x2a\xaa\xa8\x24\xb1\
-\x20\x00\x0e\x68\x03\xf2\xd7\xfe\x08\x45\xff\x00\x05\x26\xf8\x89\
-\xfb\x5c\xfe\xc8\x9f\x1d\xfe\x13\xfc\x66\xba\x92\xff\x00\xe2\xd7\
-\xc0\x38\xaf\x34\x8d\x43\x53\x76\x26\xe3\x53\xb7\x68\xee\xa3\x47\
-\x9d\xc0\xda\xd3\x45\x2c\x12\xc6\x5d\x48\x2e\xa2\x36\x20\xb6\xe6\
-\x6f\x27\xff\x00\x83\x40\xfc\x7b\xad\x68\x9f\xf0\x4c\x1f\x8f\x9a\
-\xf5\xbc\x77\x5a\xf6\xad\xa2\xf8\x9e\xea\xf2\xca\xda\x69\x59\xda\
-\xea\x58\xb4\x88\x1e\x38\x41\x27\xf8\x98\x01\xd7\xbd\x71\xbf\xf0\
-\x6e\xe6\x95\x27\xc6\x1f\xda\x67\xfe\x0a\x03\xf1\xa3\x47\x6b\x89\
-\x3c\x0f\xe2\x29\x35\x1b\x2d\x2e\xe7\x6e\x20\xbf\x79\xa7\xbd\xbb\
-\xc8\x3d\xd9\x22\xf2\xdb\x03\xa0\x9c\x67\x19\x15\xb1\xff\x00\x06\
-\x8c\xfc\x70\xd0\xff\x00\x66\x8f\xf8\x25\x0f\xed\x09\xf1\x07\xc5\
-\x0d\x7d\x17\x86\xfc\x1b\xe2\xb9\xb5\x7d\x4e\x4b\x4b\x66\xb9\x9a\
-\x2b\x68\x74\xcb\x67\x91\xd6\x35\xf9\x9b\x6a\x82\xc7\x1d\x81\x3d\
-\xa8\x03\xe4\xaf\xf8\x26\x5f\xec\xeb\xf0\x07\xfe\x0b\x89\xe2\xef\
-\x1d\xf8\xcb\xf6\xba\xfd\xa5\xbc\x61\xa4\x7c\x64\xd4\x35\xd7\x3a\
-\x7f\x87\xc6\xb7\x69\xa4\x44\x2c\xd9\x55\x94\xc0\xf7\xb0\x4d\x1b\
-\xae\xf6\x78\xd6\x08\x4a\x79\x4b\x10\xca\x90\xea\x6b\xf5\x1f\xfe\
-\x08\x8d\xfb\x03\xfe\xd2\x9f\xf0\x4d\x4f\xda\x7f\xe2\x47\xc3\xff\
-\x00\x11\x78\x82\x6f\x1d\x7e\xcb\x77\xd6\xf2\x5e\x78\x2b\x57\xbe\
-\xd6\xa0\xb9\xbc\xb6\xb9\x59\x21\x30\xec\x80\x39\x78\x92\x58\x5a\
-\x51\x22\xa8\x08\x5e\x14\x60\x17\x71\xdd\xe3\xba\x97\xfc\x11\x07\
-\xf6\x2a\xff\x00\x82\xf4\x7c\x3f\xd5\x7e\x38\xfc\x0d\xd7\x7c\x4b\
-\xf0\xef\x50\xd7\xb5\x5b\x98\xf5\x09\x74\xa8\x50\x5b\x7d\xb5\x5f\
-\xf7\x8d\x3e\x9b\x2f\xfa\x92\xf9\x12\x05\x8d\xe2\xdc\x1c\x36\x3e\
-\x63\x5e\x3b\xff\x00\x04\x9c\xd3\xfe\x30\x7f\xc1\x1b\x7f\xe0\xbb\
-\x5a\x6f\xec\x79\x79\xf1\x2a\xe3\xe2\xa7\xc3\x9f\x17\x69\x72\xdc\
-\xbd\xac\x0d\x27\xd9\xb4\xa2\xd6\x72\xde\x45\x75\xf6\x56\x79\x3e\
-\xc5\x38\x30\xe2\x44\x57\x21\xe3\x99\x18\x96\xca\x15\x00\xb3\xff\
-\x00\x05\x75\xff\x00\x83\x6e\xbc\x1b\xfb\x24\xfe\xc7\xbf\x18\xfe\
-\x3b\xe9\x1f\x19\x3e\x2a\xea\x5a\xe6\x86\xaf\xad\xc1\xa6\x5c\x4b\
-\x02\x59\xbc\x97\x17\xb1\xab\x23\x6d\x50\xdb\x40\x99\xba\x10\x78\
-\x1e\xe2\xb9\xef\xf8\x23\xef\xfc\x1b\x7f\xe1\x1f\xdb\xe7\xf6\x07\
-\xf8\x63\xf1\xc3\x5e\xf8\xcd\xf1\x57\x43\xd6\xbc\x50\xf7\xb7\x33\
-\xe9\xf6\x12\xc0\xf6\xb0\x9b\x4d\x4e\xe6\xd9\x76\x99\x14\xb7\x2b\
-\x6e\xac\x72\x4f\x2c\x7b\x71\x5f\xa8\x9f\xf0\x71\x38\xff\x00\x8d\
-\x29\x7c\x7c\xf6\xd0\xad\xff\x00\xf4\xbe\xd6\xb9\xdf\xf8\x36\x18\
-\xed\xff\x00\x82\x17\xfc\x0a\xc9\x0a\x3c\xad\x73\x24\xf4\x1f\xf1\
-\x3e\xd4\x68\x03\xc0\x3f\xe0\xea\x1f\x8e\x7e\x28\xf8\x97\xa4\x7c\
-\x15\xfd\x92\xfe\x1a\xde\xbc\x3e\x3c\xf8\xf1\xe2\x6b\x69\xae\xd1\
-\x27\x30\xe2\xc6\x29\x7c\xb8\x16\x47\x1f\x76\x26\xb9\x65\x90\xb7\
-\x61\x66\xdd\xb2\x2a\x4f\xf8\x34\x9b\xf6\xaf\xd6\x7c\x4d\xfb\x31\
-\x7c\x46\xfd\x9f\xfc\x69\x35\xc2\xf8\xeb\xe0\x4f\x89\x26\xb7\x68\
-\x2e\xa5\x69\x26\x4b\x3b\x89\x64\x06\x3c\xb7\x5f\x2a\xea\x2b\x95\
-\x38\x3c\x07\x8c\x71\x91\x9f\x84\x6e\xbf\xe0\xa2\x1f\x10\x7e\x33\
-\xff\x00\xc1\x7e\x7e\x20\xfe\xd3\xdf\x0f\xff\x00\x67\x7f\x88\xdf\
-\xb4\xdf\x86\x3e\x19\x34\xfe\x12\xf0\xad\xa7\x87\x2d\xef\x24\xb5\
-\xd1\xd5\x22\x6b\x68\x6e\x5a\x68\x2c\xee\x94\x09\x14\xde\xcc\xb1\
-\x95\x04\xb5\xc9\x70\xdf\x2f\x36\xbf\x63\x9f\xdb\x7b\xc6\x5f\xb3\
-\xbf\xfc\x1c\x65\xa3\x7c\x59\xf8\x81\xf0\x2f\xc7\xdf\xb3\x87\x85\
-\xff\x00\x69\x4b\xc9\x34\x1d\x47\x42\xf1\x35\xbd\xd4\x29\x34\xf7\
-\x22\x18\xcd\xd4\x73\x5c\x5b\x5b\x09\x10\x5f\xfd\x9a\x59\x08\x4f\
-\x90\x4a\xf9\x3c\x82\x40\x20\xff\x00\x83\xa1\xfe\x28\xfc\x43\xf8\
-\x59\xff\x00\x05\xcd\xf0\xae\xbb\xf0\xdf\x51\xd7\x6c\xfc\x51\xe1\
-\x8f\x05\xe9\x5a\xee\x9e\x34\xe6\x76\x68\x9e\xd6\x5b\xdb\x87\x93\
-\xcb\x1c\x32\xaa\x44\xcc\xe0\x82\x0a\xab\x02\x08\xcd\x7e\xa8\x78\
-\x93\xfe\x0a\x1d\xa0\xff\x00\xc1\x4b\xbf\xe0\xde\xef\x8b\x1f\x16\
-\x7c\x3b\x22\x69\xfa\x85\xdf\xc3\xdd\x66\xd3\x5b\xd3\xed\xe5\x6d\
-\xfa\x26\xab\x0d\x9b\xf9\xf0\x03\xf7\x80\x04\xab\xa1\xce\x4c\x72\
-\x46\x7b\xd7\xc7\xff\x00\xb7\xec\x4b\x2f\xfc\x1e\x25\xfb\x3a\xc6\
-\xea\xb2\x24\x9e\x1d\xb1\x8e\x45\x61\x90\xea\x61\xd5\x41\x04\x77\
-\x04\x12\x31\xde\xbe\x7b\xfd\xbf\xbc\x11\xae\x7f\xc1\xbd\x7f\xb4\
-\xc7\xc7\x8f\x87\xfa\x6e\x9d\xa9\x5e\x7e\xcd\x3f\xb5\x6f\x83\x35\
-\x5b\x6d\x16\x38\x77\x79\x3a\x26\xa0\xf6\xf2\xac\x51\xa8\x3f\x29\
-\x92\xda\x69\x04\x6c\x38\x2d\x6d\x71\x1b\x64\xb2\x60\x00\x7d\x55\
-\xff\x00\x04\x54\xfd\xb7\xdb\xf6\x10\xff\x00\x83\x62\xfc\x53\xf1\
-\x8f\x50\x46\xd6\x6f\xbc\x23\xa9\xeb\x4f\xa7\xdb\xdd\xc8\xf2\x2d\
-\xe5\xf4\xb7\x31\xc1\x6b\x13\x90\x77\x08\xcc\xd2\xa6\xec\x60\x85\
-\xdc\x78\xeb\x5c\x47\xec\x2b\xff\x00\x04\x0f\xbe\xff\x00\x82\xd3\
-\xfc\x04\xd3\x7f\x68\xff\x00\xda\xdb\xe3\x07\xc5\x3d\x53\xc4\x7f\
-\x13\x7c\xcd\x57\x45\xd1\xf4\x2b\xeb\x6b\x7b\x7d\x1e\xc0\xc8\xcb\
-\x0f\x13\xc3\x3a\x2a\xc8\xaa\x1d\x22\x85\x11\x51\x19\x73\xb9\x8b\
-\x01\xe6\xdf\xb3\x6f\xc0\xdd\x6b\xe3\xcf\xfc\x19\xa5\xe3\xeb\x0d\
-\x06\x0b\xab\xad\x43\x42\xf1\x15\xef\x88\x9a\xde\xdc\x12\xd3\xc1\
-\x67\xa8\x41\x35\xc6\x40\xea\x12\x15\x92\x4c\x7f\xd3\x3f\x6a\xfd\
-\x4e\xff\x00\x83\x79\xff\x00\x69\x4f\x0b\x7e\xd1\x7f\xf0\x49\x2f\
-\x83\x29\xe1\xdd\x52\xc6\xf2\xff\x00\xc1\x7e\x1e\xb6\xf0\xce\xb5\
-\x63\x1c\xc8\xd7\x1a\x6d\xdd\x98\x30\x15\x99\x01\xca\x6f\x54\x59\
-\x57\x76\x37\x24\x8a\xdd\xe8\x03\xc0\xbf\xe0\x94\xdf\xf0\x4c\xbf\
-\xda\x8f\xfe\x09\x61\xfb\x7e\xeb\x9e\x0a\xd2\xfc\x58\xdf\x10\xff\
-\x00\x64\x3d\x4a\xcd\xa6\x82\xeb\xc4\x1a\xba\x2d\xee\x9d\x3b\x46\
-\x5d\x3e\xcf\x6a\xa5\x99\x67\x49\x94\x47\x26\x04\x70\xcb\x1c\x9b\
-\xc6\x1c\x04\x5f\x81\xbc\x55\xfb\x04\xe8\xbf\xf0\x53\x3f\xf8\x39\
-\x0f\xf6\x98\xf8\x6f\xe2\xef\x88\x9e\x29\xf0\x16\x87\xa6\x49\x73\
-\xad\x43\x73\xa5\x5d\xc7\x1b\x34\xb1\x8b\x38\xc2\x62\x5f\x97\x04\
-\x4a\xc7\x81\x9f\x97\xd3\x35\xfb\x25\xe0\xaf\xf8\x2d\x57\xc1\xff\
-\x00\x88\x9f\xf0\x53\x3b\xff\x00\xd9\x67\x41\x5f\x10\x6b\x9e\x34\
-\xd3\xed\x99\xdf\x58\xd2\xe0\x8e\xf7\x45\x49\xe3\x81\xa7\xb8\xb7\
-\x92\x68\xdc\x98\xde\x15\x50\x8e\xcc\xbb\x44\xa4\xc6\x48\x71\x83\
-\xf8\xea\x7f\xe0\x9a\x9e\x0b\xff\x00\x82\xa7\xff\x00\xc1\xcc\xdf\
-\xb4\xe7\xc3\xdf\x1d\xea\xfe\x2a\xd1\x74\x7d\x38\x5d\x6b\x29\x71\
-\xa0\x5c\x43\x05\xc9\x96\x31\x65\x1a\xab\x34\xb1\xc8\x36\x11\x29\
-\x38\xc6\x72\x07\x34\x01\xf5\x15\x97\xfc\x1a\x31\xf0\x6a\x6b\xc8\
-\x56\x1f\xda\x67\xe2\xb4\xb3\x34\x8a\x11\x13\x50\xb1\x67\x76\xc8\
-\xc0\x03\x69\xc9\x3d\xb8\x35\xfb\x4d\x03\x6e\xdd\x5f\x96\x3f\x02\
-\x7f\xe0\xd2\x0f\xd9\xff\x00\xf6\x7e\xf8\xe1\xe0\xdf\x1e\xe9\x3e\
-\x3d\xf8\xc9\x77\xaa\xf8\x27\x5c\xb2\xd7\xec\xa0\xbc\xd5\x2c\x5a\
-\xde\x69\xad\x67\x49\xe3\x59\x02\xda\x2b\x14\x2c\x80\x10\x08\x24\
-\x67\x91\x5f\xa9\xf1\x2e\x0b\x75\xe7\x93\x9a\x00\x7d\x78\x2f\xfc\
-\x15\x17\xfe\x51\xd5\xf1\xb7\xfe\xc4\xdd\x4b\xff\x00\x44\x35\x7b\
-\xd5\x78\x2f\xfc\x15\x10\x7f\xc6\xba\x3e\x36\x77\xff\x00\x8a\x37\
-\x52\xff\x00\xd1\x0d\x5b\xe1\x7f\x8f\x0f\x55\xf9\x8a\x5b\x19\x9e\
-\x27\x1b\xbc\x41\x7c\x3d\x6e\x65\xff\x00\xd0\x8d\x7e\x68\x7f\xc1\
-\x4b\xfe\x2c\xe8\x3a\x8f\xc7\x4f\x89\x76\x32\x6b\xbe\x22\x93\x54\
-\xf8\x7d\xe1\xab\x3b\xc8\x4e\xa1\xf1\x6c\x7c\x3f\xd2\x3c\x23\x71\
-\x25\xac\xf3\x43\x3d\x85\xbc\x59\xb8\xd5\x6e\x24\x6d\x8e\xcc\xd1\
-\x4b\x18\x68\xd2\x21\xc9\x61\x5f\xa6\x5e\x23\xb4\x94\xf8\x82\xfb\
-\xf7\x52\x7f\xc7\xd4\x9f\xc2\x7f\xbc\x6b\x95\xf1\x07\xc2\x1f\x0d\
-\x78\xbb\xc4\xfa\x7e\xb9\xac\x78\x43\xc3\x7a\xc6\xb9\xa4\x23\x47\
-\x61\xa9\x5f\xe9\x16\xf7\x57\x96\x2a\xdf\x79\x62\x9a\x44\x69\x23\
-\x07\x8c\x85\x20\x1a\xc7\x57\xa8\xee\x7e\x5e\x4d\xfb\x40\xf8\xa3\
-\x50\xb7\xf1\x07\x8c\xaf\x3c\x53\xa9\xe8\x32\x78\xcb\xe1\xcf\xc1\
-\xc4\xf1\xc7\x8a\xec\x26\x16\xd7\x9a\x3e\x93\x7b\x3e\xa4\x35\x1b\
-\xf4\x90\x06\xf2\x9b\xe6\x50\x64\x03\xf7\x6b\x33\xbf\x1b\x72\x34\
-\x7f\x6a\xbf\x10\xd9\x7c\x37\xf0\xbf\xc5\xbf\x01\xfc\x13\xf8\xa1\
-\xe2\x8d\x5f\xe1\xb4\x3a\x7f\x81\xaf\xee\x75\x2b\x5f\x19\x4f\xae\
-\xc9\xe1\x5d\x72\xef\xc5\xf0\x5a\xc9\x05\xae\xa3\x23\xc9\x22\x99\
-\xec\x76\x4a\xf0\x19\x1d\x57\x86\xda\x04\xa5\x4f\xe9\xa6\x85\xf0\
-\x8f\xc3\xbe\x16\x49\x97\x4b\xf0\x9f\x87\x74\xc5\xb8\xb1\x8b\x4b\
-\x94\x5a\x69\x10\x40\x25\xb3\x88\x38\x8a\xd9\x82\xa0\xdd\x0c\x7e\
-\x64\x81\x23\x3f\x22\x09\x1b\x6a\x8d\xc7\x35\x74\xcf\x81\x7e\x11\
-\xd0\xfc\x10\xde\x18\xb1\xf0\x3f\x84\x2c\x7c\x32\xd7\x29\x7b\xfd\
-\x8f\x6f\xa0\xda\xc5\xa7\x7d\xa1\x24\x59\x52\x6f\xb3\xac\x62\x3f\
-\x31\x64\x44\x70\xfb\x77\x06\x45\x60\x41\x50\x41\x66\x17\x3e\x0d\
-\xfd\xac\xdb\xc4\x1f\xb0\x37\xc6\x6f\x8b\x5e\x19\xf8\x5f\xe2\xbf\
-\x1f\xff\x00\x66\xea\xdf\x08\x7f\xe1\x30\xbe\x6d\x5b\x5e\xba\xd7\
-\x6e\xb4\x6b\x88\xbc\x45\x15\x8d\xe6\xad\x69\xf6\x96\x76\x8e\x64\
-\xd3\xe6\xb9\x94\xaa\x0d\x85\xa1\x42\x13\xe5\xc1\xde\xf8\x18\x3e\
-\x1b\x78\x07\xfe\x0a\x9d\xf0\xbf\xc2\xbf\x08\xfe\x2e\xeb\xde\x3c\
-\xf0\xe5\xef\xc3\xff\x00\x12\xea\xda\x9e\x99\x37\x8e\xa7\xf1\x35\
-\xac\x32\xb4\xb6\x5e\x45\xe3\x34\x92\x3e\xc9\x67\x1e\x69\x2a\x4e\
-\xd1\xb7\x2a\xa9\x93\xbb\xec\x6f\x8d\x3f\x02\x97\xe3\x07\x84\xf5\
-\x88\x2c\xf5\x0d\x4f\xc1\xbe\x2a\xd4\xb4\xdf\xec\xcb\x5f\x17\x68\
-\xb0\x22\x6b\x7a\x5c\x7e\x72\xce\x16\x39\xc8\xdc\xd0\xf9\xaa\x19\
-\xe0\x63\xe5\xc8\x0b\x86\x07\x71\x35\xe5\x3f\xb2\xff\x00\xec\x03\
-\x79\xf0\x43\xe2\xef\xfc\x27\x9e\x25\xf1\x17\x87\x7c\x49\xe2\x1b\
-\x3d\x32\xf7\x48\xd2\xe0\xf0\xe7\xc3\xfb\x1f\x07\xe9\xba\x7c\x77\
-\x93\xc1\x35\xdd\xc3\x5b\xda\xb3\xf9\xd7\x53\x1b\x68\x55\xa5\x77\
-\x1f\x28\x60\x14\x6e\x34\x59\x85\xce\x2f\xfe\x0b\x65\xf0\xab\xc3\
-\x1f\x10\xbf\x62\xa8\xf5\x1f\x13\xcd\x7d\x6d\x69\xe1\xdf\x18\xf8\
-\x62\x5f\x3e\x0d\x66\xe3\x4d\x86\xde\x1b\x8d\x7b\x4f\xb6\xb8\x79\
-\x4c\x52\x22\xb2\x88\x64\x7c\x33\xe7\xcb\x6c\x3a\x95\x65\x0c\x3c\
-\x3e\xcf\xf6\x60\xf0\xaf\x89\xb5\xdf\xdb\x5b\x5c\xd1\x3c\x65\xe3\
-\xfb\x7b\x1f\x86\xc9\x63\x7d\xe0\xdb\x8d\x0b\xc6\xb7\x91\x43\x04\
-\xd6\x9e\x0b\xb5\x9e\xda\xfd\xa6\x8e\x42\x6f\x64\x3e\x5c\x5f\x3d\
-\xcb\x4c\xac\x8b\xd0\x97\x62\x7f\x48\x3c\x49\xe0\xeb\x2f\x19\x68\
-\x37\x9a\x4e\xb1\xa4\xd9\x6b\x1a\x4e\xa5\x11\x82\xee\xc6\xfe\xd1\
-\x2e\xad\x6e\xa3\x3d\x52\x48\xa4\x05\x1d\x4f\x70\xc0\x8f\x6a\xcf\
-\xd0\xbe\x0f\x78\x6f\xc2\xfa\x56\xa1\xa7\xe9\x7e\x13\xf0\xee\x97\
-\xa7\x6a\xb0\x2d\xad\xed\xa5\x9e\x91\x05\xbd\xbd\xf4\x0b\x08\xb7\
-\x58\xa6\x8d\x10\x2c\x91\xad\xba\xac\x21\x5c\x10\x23\x50\x83\xe5\
-\x18\xa3\x95\x85\xcf\xcb\x1f\x8b\x3f\x1e\x3c\x75\xf1\xcb\xe2\x2d\
-\xd4\xde\x34\xf1\x07\x87\x34\x6b\x3d\x0f\xe1\xdf\x85\xfc\x45\xa0\
-\xcf\xaa\x7c\x65\xbc\xf8\x7a\x22\x17\x9a\x3a\x5c\xde\x6a\xd6\xd0\
-\x5b\x5b\xca\x97\xb2\x7d\xb1\xa6\x8c\xf9\x85\xc4\x7e\x52\x27\x95\
-\xf3\x64\xfe\x94\x7e\xcc\x1e\x30\xd7\x7c\x4d\xfb\x2c\xf8\x03\x5f\
-\xf1\xa6\xa3\xa7\x5c\x78\x86\xf3\xc3\x56\x57\xfa\xd6\xa3\x0c\x32\
-\xd9\xda\xcf\x29\xb7\x57\x92\xe0\x47\x3c\x71\x49\x12\x37\xfa\xcd\
-\xaf\x1c\x6c\x99\x39\x55\xc6\x07\x41\xaf\x7c\x0d\xf0\x8f\x8a\xec\
-\xf4\x4b\x7d\x5b\xc0\xfe\x13\xd5\xad\xfc\x34\x63\x3a\x3c\x57\xda\
-\x1d\xb5\xcc\x7a\x3f\x96\x02\xa7\xd9\x84\x91\xb0\x83\x68\x00\x2f\
-\x96\x17\x00\x71\x8a\xda\xd7\x3c\x37\x0f\x8a\x34\x8b\xcd\x3f\x54\
-\xb0\x83\x54\xd3\xf5\x08\x5e\x0b\xbb\x5b\xcb\x75\x9e\x0b\xa8\xdd\
-\x4a\xbc\x72\x23\x82\xae\x8c\xa7\x05\x58\x10\x79\xc8\xe7\x14\x59\
-\x85\xcf\xcf\x1d\x32\xe6\xd3\x4f\xfd\xa8\x87\xed\x5b\x73\xe1\xf5\
-\x87\xf6\x73\xbf\xd7\xa4\x7b\x54\x69\xe4\x1f\x65\xbc\x9a\x24\xb3\
-\x1f\x10\x5a\xd7\xee\xac\x53\x95\x68\x37\x15\x0e\xb6\xd2\x2d\xd1\
-\xc6\xe6\x35\xf6\x36\x93\xe3\x1f\x8c\xc7\xf6\x80\x36\x37\x1e\x09\
-\xf0\x0d\xbf\xc3\x35\xb9\x97\xcb\xf1\x14\x1e\x2e\x9e\x4d\x61\xe1\
-\x11\x96\x8a\x51\x63\xf6\x41\x1e\xe6\x93\x6a\x90\x2e\x08\x0a\x4b\
-\x06\x6c\x0c\xfa\x3c\xde\x16\xb5\xba\xd0\xdb\x4b\x9b\x4d\xb5\x9b\
-\x49\x92\xd8\xd9\x3d\x8b\xdb\x2b\x5a\xb5\xb9\x5d\x86\x13\x11\x1b\
-\x3c\xb2\x9f\x2e\xcc\x6d\xdb\xc6\x31\x4f\xd2\xfc\x3f\x1e\x87\xa6\
-\x5b\x59\x58\xd8\xc3\x67\x67\x67\x12\xc1\x6f\x6f\x6f\x08\x8a\x1b\
-\x78\xd4\x61\x51\x11\x46\xd5\x50\x00\x00\x00\x00\x1d\x28\xe5\x60\
-\x7c\x73\xf0\xf3\xf6\x75\xd2\xb4\x6f\xf8\x29\xfe\xb1\xe0\xd5\xbe\
-\xbb\x9b\xe1\xef\x82\xf4\x7b\x6f\x8b\xfa\x0f\x85\x9d\x14\x69\xfa\
-\x67\x88\x75\x4b\xdb\xcb\x39\xee\x13\x8c\xf9\x71\x9b\x49\x6e\x22\
-\x8c\xfc\xb1\xcd\x7b\x33\xa8\xc8\x5c\x76\xdf\xf0\x57\xff\x00\x14\
-\x5e\x78\x33\xfe\x09\xb3\xf1\x3f\x56\xb1\xd6\xb5\x2f\x0e\xde\x58\
-\xc3\xa7\x38\xd4\xec\xa4\x64\xba\xb2\x5f\xed\x3b\x40\xf2\x21\x5e\
-\x49\x0a\x4f\x1c\xee\x1c\x60\x82\x41\xfa\x2a\x2f\x06\xd8\xc1\xe2\
-\x69\xb5\xa4\xd1\xec\x57\x5a\xb9\xb5\x8e\xc2\x6d\x49\x6c\xd0\x5e\
-\x4d\x6d\x1b\x3b\xc7\x03\x4d\x8d\xed\x1a\x3c\x92\x32\xa1\x25\x43\
-\x48\xc4\x00\x49\xcf\x0b\xfb\x5d\xfe\xce\x13\x7e\xd5\x5f\xb3\xb7\
-\x88\x3c\x03\xfd\xa9\x37\x87\xff\x00\xb7\x9e\xcd\xff\x00\xb4\x16\
-\xc8\xdd\x18\x3e\xcf\x79\x05\xd6\x3c\xbd\xc9\x9d\xde\x4e\xdc\xee\
-\x18\xdd\x9c\x1c\x62\x8e\x56\x07\xc3\x3f\xb4\x17\xc5\x29\x3f\x66\
-\xbf\x10\x78\xe5\xbf\x66\x1f\x89\x5e\x24\xf8\x93\x1d\xef\xc2\xad\
-\x6f\xc4\xbe\x23\x59\xfc\x61\x27\x89\xd7\x48\xbc\x4b\xab\x35\xb3\
-\xd5\xd1\xa4\x32\x8b\x7b\xa9\x16\x5b\xd3\xe4\xc7\x85\x61\x0e\xe1\
-\x08\xf2\xf0\x7c\xdb\x50\xf1\xf7\x8a\xfe\x1f\x7c\x22\xf8\xb9\x0f\
-\x85\xfc\x69\xe1\x68\xf4\x7d\x5f\xe0\xcf\x89\xf5\xeb\xfb\x7d\x0f\
-\xe3\x1e\xab\xf1\x06\xf2\xee\x78\xad\x23\x6b\x4d\x54\x4b\x25\xaa\
-\x26\x9b\x32\xc8\xcc\xa7\xf7\xb0\x89\xbc\xd2\x12\x22\x61\x3b\x7f\
-\x58\xfc\x37\xf0\xeb\x43\xf0\x3c\xfa\x9b\x78\x73\xc2\xfa\x0f\x86\
-\xd3\x58\xbb\x92\xfa\xf2\x3d\x2b\x4b\x86\xc9\x6e\xe7\x72\x4b\x4b\
-\x28\x89\x17\xcc\x90\xe7\x96\x6c\x93\x8a\xca\xd2\x7e\x00\xf8\x2f\
-\xc3\xfa\x26\xbf\xa6\x69\xfe\x03\xf0\x6e\x9f\xa6\xf8\xab\x7f\xf6\
-\xdd\xa5\xaf\x87\xad\x20\xb7\xd6\xf7\xae\xd7\xfb\x5c\x69\x18\x5b\
-\x8d\xca\x48\x6f\x34\x36\x41\x20\xe4\x13\x4a\xcc\x2e\x7c\x4d\xf1\
-\xd3\xc0\xe3\xf6\x71\xf1\x1f\xc0\x5b\x3f\x0f\xf8\x9b\xc6\xd2\xb7\
-\x8b\xbc\x21\xf1\x03\x5e\xd6\xae\x35\x3f\x12\xde\x5e\xcb\xa9\xde\
-\xaf\x84\x60\x91\x66\x6f\x32\x42\x14\x23\xfc\xe8\x88\x15\x23\x62\
-\x59\x15\x49\xcd\x72\x1f\x08\xbe\x06\x33\x6a\x7f\xb1\x55\x8b\x7c\
-\x43\xf8\xbc\xd1\xfc\x7c\xf0\x6d\xf4\x1e\x3a\x6f\xf8\x4d\x2f\xb3\
-\xad\x43\x6b\xe1\x83\xa9\xc2\x91\xfc\xf8\xb5\xdb\x34\x2a\xa5\xed\
-\xfc\xb9\x0c\x6d\x22\x97\x25\xcb\x57\xe8\xe6\xb1\xf0\xe7\x47\xf1\
-\x04\xd6\x52\x6a\x1e\x1e\xd1\xaf\xe4\xd2\xe1\x9a\xda\xc5\xae\x74\
-\xd8\xa6\x36\x51\x4d\x17\x93\x34\x71\x6e\x53\xe5\xa4\x91\x61\x1d\
-\x57\x01\xd0\x05\x6c\xaf\x14\x96\xdf\x0d\x34\x5b\x37\xd0\x9a\x0f\
-\x0d\xe8\xb6\xed\xe1\x78\xda\x1d\x10\xc5\xa6\xc4\x8d\xa2\x23\x45\
-\xe4\x32\x5a\x10\xb9\xb7\x53\x0f\xee\xc8\x8b\x68\x31\xe5\x0e\x57\
-\x8a\x76\x61\x73\xf2\xdf\xe2\x1f\xc4\x7f\x1b\xf8\x3f\xc3\xd6\x3f\
-\x0a\x6c\xfc\x41\x75\x77\xf0\xe3\x4f\xf8\xd3\xe3\x0f\x07\xcb\x77\
-\xe2\x7f\x88\xf7\x9e\x1b\xdf\x6b\x67\x67\x69\x3e\x97\xa4\xdc\xeb\
-\x68\x92\xdc\xaa\x16\x9e\xe4\xa8\x25\x4c\x9f\x66\x8e\x33\x20\xfe\
-\x2c\x2f\x1b\xf8\x07\x47\xf8\xbf\xf0\xdf\xe1\x1c\xff\x00\x14\x7c\
-\x57\x63\x79\xe1\x1f\x0b\xfe\xd0\x96\xbe\x12\xb0\xd4\x34\x7f\x89\
-\x3a\xae\xa1\x65\xa1\x68\xf3\xe9\x17\x93\x5c\xda\x3e\xb3\x2a\xda\
-\x8b\xa6\x86\xea\x35\x09\x76\xa6\x47\x89\x64\x30\x79\xd9\x0e\xa7\
-\xf5\x77\x51\xf8\x41\xe1\xbd\x67\x40\xd6\x34\x9b\xcf\x08\xf8\x6e\
-\xf3\x48\xf1\x15\xc4\x97\x7a\xbd\x84\xfa\x3d\xbc\x96\x9a\xb4\xd2\
-\x00\x24\x96\xe2\x26\x4d\x93\x3b\x85\x50\xcd\x20\x24\x80\x32\x4e\
-\x38\x8f\x55\xf8\x29\xe1\x5d\x73\xe1\xdf\xfc\x21\xd7\xde\x0c\xf0\
-\xbd\xf7\x83\x96\x25\x81\x3c\x3f\x71\xa2\xdb\xcd\xa4\xac\x68\x72\
-\x88\x2d\x59\x0c\x21\x54\x80\x40\x09\x80\x40\x23\x06\x8b\x30\xb9\
-\xf9\x53\xe2\x6f\x8c\xbf\x12\x35\x4f\x1c\xf8\xcb\xc6\x33\xf8\x9f\
-\xc2\x3e\x1d\xf8\x85\xe1\x9f\x1d\xcf\xa1\xe9\x2f\xa9\x7c\x60\xd4\
-\xe0\xbd\xd3\x6d\xe2\xbf\x48\x2c\x2c\x57\xc2\xf0\x59\xcd\x1d\xe4\
-\x37\x16\xbe\x41\xc8\x59\xa4\xb8\x17\x06\x6f\x35\x0f\xdc\xfb\x13\
-\xf6\x05\xf8\x67\x07\x8a\x7e\x39\x7c\x77\xf1\xf6\xad\xad\x78\xbb\
-\x52\xd7\x34\x3f\x8b\xbe\x2d\xf0\xfe\x99\x6b\x71\xaf\xdd\x3e\x99\
-\xa5\x59\x09\xe2\x06\x18\xed\x37\xf9\x3f\x7b\x24\x33\x21\x65\xc0\
-\x0a\x55\x40\x15\xf4\xb5\xdf\xc2\x0f\x0d\xea\x1e\x3d\xb3\xf1\x55\
-\xc7\x84\xbc\x37\x3f\x8a\x34\xf8\xbe\xcf\x69\xad\xc9\xa3\x5b\x3e\
-\xa5\x69\x16\xdd\xbe\x5c\x77\x25\x3c\xd4\x5d\xbc\x6d\x56\x03\x1d\
-\xab\x43\x45\xf0\x75\x8f\x86\x8d\xe9\xd3\x74\x7b\x0d\x34\xea\x57\
-\x72\xea\x17\x9f\x63\xb3\x48\x3e\xd9\x75\x29\x06\x49\xe4\xd8\x06\
-\xf9\x5c\x80\x5a\x46\xcb\x36\x06\xe2\x71\x45\x98\x5c\xa3\xf1\x10\
-\x63\xe1\xd7\x89\x3f\xec\x13\x79\xff\x00\xa2\x24\xaf\x5e\xfd\x85\
-\xbf\xe4\xc8\xfe\x0e\x7f\xd8\x8f\xa2\xff\x00\xe9\x04\x15\xe4\xbf\
-\x11\x2d\x66\x5f\x87\x3e\x23\xfd\xdc\x9f\xf2\x09\xbc\xfe\x13\xff\
-\x00\x3e\xf2\x57\xad\x7e\xc2\xc7\x1f\xb1\x27\xc1\xcf\xfb\x11\xf4\
-\x51\xff\x00\x92\x10\x56\xff\x00\xf2\xe3\xe7\xfa\x13\xf6\x8f\x54\
-\xa2\x8a\x2b\x9c\xa0\xa2\x8a\x28\x00\xa2\x8a\x28\x00\x23\x34\x01\
-\x81\x45\x14\x00\x8c\x37\x0f\x4a\x45\x8f\x6f\xbd\x3a\x8a\x00\x2b\
-\xe2\xcf\xf8\x29\x7f\xfc\x11\x87\xc3\xff\x00\xf0\x52\xaf\xda\x13\
-\xe0\xdf\xc4\x1d\x63\xc7\x1a\xd7\x85\xee\xfe\x0e\xdd\x9b\xcb\x4b\
-\x3b\x3b\x18\xae\x23\xd4\x58\xdc\xdb\xdc\x62\x46\x72\x0a\x8c\xdb\
-\x85\xe3\x3c\x37\xb7\x3f\x69\xd1\x40\x18\x5f\x12\x7e\x1a\x68\x7f\
-\x18\x7e\x1f\xeb\x7e\x15\xf1\x46\x97\x67\xae\x78\x77\xc4\x96\x53\
-\x69\xba\x9e\x9f\x74\x9b\xa1\xbc\xb7\x95\x0a\x49\x1b\x8f\x42\xa4\
-\x8e\x39\x1d\xb1\x5f\x11\x7e\xc2\xff\x00\xf0\x42\x6b\x2f\xd8\x57\
-\xf6\x66\xf8\xcd\xf0\x7b\x47\xf8\xc1\xe3\x0f\x10\x7c\x3d\xf8\xb5\
-\xa7\xdd\xda\x43\xa6\xea\x36\x10\x67\xc3\x93\x5c\x42\xf0\x49\x73\
-\x03\x29\xf9\x9d\xa2\x68\xc3\x02\x02\xb1\x85\x0e\x01\xce\x7e\xfa\
-\xa2\x80\x3f\x18\x7c\x27\xff\x00\x06\x76\x68\xbe\x03\xd2\x3e\xc1\
-\xa1\xfe\xd4\x3f\x18\x34\x6b\x1d\xe6\x5f\xb3\xd8\x41\x1d\xb4\x3b\
-\xce\x32\xdb\x12\x50\x32\x70\x39\xeb\xc5\x7b\xa7\xec\x13\xff\x00\
-\x06\xea\x2f\xec\x35\xfb\x55\xf8\x5f\xe2\x87\xfc\x34\x4f\xc5\x6f\
-\x1c\xb7\x86\xbe\xd1\x8d\x17\x58\x6c\xd9\xde\x79\xb0\x49\x0f\xcf\
-\xfb\xc6\xfb\xbb\xf7\x0e\x3a\xa8\xaf\xd2\xaa\x28\x03\xc4\x7f\xe0\
-\xa2\x1f\xb1\x56\x9f\xff\x00\x05\x0c\xfd\x8d\xbc\x69\xf0\x73\x56\
-\xd7\xaf\x7c\x35\xa7\xf8\xd2\x3b\x58\xa6\xd4\xac\xe0\x49\xa6\xb7\
-\x10\x5d\xc3\x72\x36\xa3\x90\xa7\x71\x84\x2f\x3d\x03\x13\xd4\x0a\
-\xb3\xfb\x03\x7e\xc7\x56\x1f\xb0\x57\xec\x7f\xe0\x7f\x84\x3a\x5e\
-\xb7\x79\xe2\x1b\x0f\x04\x5a\x4b\x69\x0e\xa3\x77\x0a\xc3\x35\xc8\
-\x7b\x89\x67\xcb\x22\x9c\x0c\x19\x48\xc0\x3d\x00\xaf\x65\xa2\x80\
-\x3e\x2d\xf8\x71\xff\x00\x04\x64\xf0\xff\x00\xc3\x9f\xf8\x2b\xb7\
-\x8b\x3f\x6b\x88\x7c\x71\xad\x5d\x6b\xde\x2c\xb3\x7b\x39\x7c\x3c\
-\xf6\x31\x2d\x9d\xba\xb5\x9d\xbd\xae\x56\x5c\xef\x24\x08\x03\x74\
-\x1f\x7b\x1d\x3a\xfa\x77\xfc\x14\xbf\xfe\x09\xcb\xe0\xbf\xf8\x2a\
-\x0f\xec\xa9\xab\x7c\x2d\xf1\xa3\xc9\x61\x0d\xd4\xf1\x5f\x69\x9a\
-\xbd\xb4\x2b\x25\xde\x89\x79\x13\x65\x67\x84\x37\x19\x2a\x5e\x36\
-\x07\xef\x24\x8e\x38\x24\x11\xf4\x25\x14\x01\xf9\xad\xf1\xb7\xfe\
-\x0d\xd7\x87\xf6\x94\xfd\x9a\x3e\x05\xfc\x26\xf1\xef\xc7\x8f\x1b\
-\xf8\x8f\xc1\xff\x00\x03\x6e\xe5\x96\xda\x19\x74\xbb\x74\x9b\x5a\
-\xb7\x2d\x12\xc1\x04\xee\x1f\x23\xc8\xb7\x47\xb7\x8d\xc7\x21\x25\
-\x3d\xc5\x7e\x90\x58\x69\x71\x69\x5a\x7c\x16\xb6\xb1\xc7\x6f\x6d\
-\x6b\x1a\xc3\x0c\x48\x30\xb1\x22\x80\x14\x01\xe8\x00\x03\x15\x66\
-\x8a\x00\xf8\xc7\xf6\x77\xff\x00\x82\x35\x68\x1f\xb2\xef\xfc\x14\
-\xef\xe2\x27\xed\x21\xe1\x0f\x1c\xeb\x9a\x7a\xfc\x4f\x82\x78\xf5\
-\xbf\x08\x7d\x8a\x23\xa7\x4b\x24\xde\x53\xbc\x82\x4c\xef\x07\xed\
-\x11\x99\x87\x1c\x19\x1d\x73\x83\x5c\x17\xfc\x14\x1b\xfe\x0d\xbe\
-\xf8\x2f\xfb\x73\x7c\x65\x9f\xe2\x66\x93\xad\x78\xb3\xe1\x0f\xc4\
-\xab\xe2\xcf\xa8\xeb\x9e\x12\xb8\x58\x57\x56\x91\x87\x32\xcf\x0b\
-\x0c\x79\x87\xbb\xc6\x50\xbe\x4e\xed\xc7\x04\x7e\x85\xd1\x40\x1f\
-\x9e\x3f\xf0\x4e\x8f\xf8\x36\xe7\xe0\xbf\xec\x09\xf1\xbe\x3f\x8a\
-\x57\xda\xd7\x8a\xfe\x2c\x7c\x4a\xb5\xf9\xac\x75\xaf\x14\xca\x92\
-\xa6\x9b\x26\x36\xf9\xd0\xc4\xa3\xfd\x76\xdf\x94\x49\x23\x39\x51\
-\xf7\x76\x9e\x6b\xf4\x1a\xf2\xc7\xed\x76\x72\x43\xbb\x6f\x98\x8c\
-\x85\x80\xe4\x64\x63\x35\x62\x8a\x00\xf8\xd7\xfe\x09\x05\xff\x00\
-\x04\x73\xf0\xff\x00\xfc\x12\x23\xc3\x7e\x3e\xd3\x74\x1f\x1b\x6b\
-\x7e\x34\x5f\x1f\x6a\x56\xfa\x94\xef\xa8\xd9\xc5\x6c\x6d\x5a\x14\
-\x91\x42\xa8\x8c\x9d\xd9\xf3\x09\x24\xe3\xa0\xaf\xb2\xa8\xa2\x80\
-\x3e\x32\xff\x00\x82\xc5\xff\x00\xc1\x1b\x3c\x3f\xff\x00\x05\x84\
-\xf0\x87\x81\x74\x8d\x7b\xc7\x1a\xe7\x82\x53\xc0\xb7\xd7\x37\xd0\
-\x4b\xa6\xd9\xc5\x70\xd7\x2d\x32\x46\x84\x36\xf2\x36\xed\xf2\xc1\
-\x04\x7a\x9a\xf9\x12\xdb\xfe\x0d\x09\xf0\xce\xb6\xdf\x64\xf1\x57\
-\xed\x37\xf1\xcb\xc4\x5a\x1c\xb8\x17\x3a\x79\xb8\x8e\x35\xb8\x5c\
-\xf2\xa4\xbb\x48\xb8\x23\x23\xee\x9a\xfd\x88\xa2\x80\x3c\x6b\xf6\
-\x76\xfd\x84\x3e\x1d\xfe\xc8\xbf\xb2\xb8\xf8\x3f\xf0\xd3\x45\x8f\
-\xc2\xde\x13\x4b\x2b\x9b\x6f\x90\x99\xee\x27\x96\x74\x2b\x2d\xcc\
-\xd2\x39\xdd\x34\xcc\x4e\x4b\x31\xe8\xaa\xa3\x6a\xaa\xa8\xf1\xcf\
-\xf8\x24\xf7\xfc\x11\xbf\xc2\x9f\xf0\x4a\xef\xd9\xdb\xc6\xdf\x0d\
-\x6c\xbc\x4d\x7d\xf1\x0b\x43\xf1\xd6\xa8\xfa\x85\xf8\xd5\xec\x22\
-\x85\x4a\x49\x6b\x1d\xb4\x90\x14\x52\x43\x23\x22\x1c\xe7\xfb\xc4\
-\x57\xd9\x14\x50\x07\xe4\x07\x8e\x3f\xe0\xd3\xe8\x3e\x1e\xfc\x47\
-\xd7\x75\xaf\xd9\xdf\xf6\x94\xf8\xa1\xf0\x2f\x4a\xf1\x0d\xdf\x9f\
-\x71\xa2\xd8\xb4\xb7\x16\xf0\x47\x92\x44\x49\x24\x57\x10\x48\xca\
-\x99\x21\x3c\xd2\xec\xa3\xab\x37\x5a\xfa\x3f\xfe\x09\x71\xff\x00\
-\x04\x10\xf8\x77\xff\x00\x04\xd6\xf8\xa9\xae\xfc\x4a\xb8\xf1\x57\
-\x8a\x7e\x2b\x7c\x5a\xf1\x14\x12\x5a\x4f\xe2\xaf\x11\xb8\x32\xdb\
-\x43\x21\x53\x20\x86\x3c\xb6\x1d\xf6\x28\x69\x5d\x9d\xc8\x05\x41\
-\x55\x66\x56\xfb\xc2\x8a\x00\xf1\xdf\xdb\xd7\xf6\x3f\xb1\xfd\xbc\
-\x7f\x64\x0f\x1c\x7c\x21\xd5\x35\xab\xbf\x0f\x58\x78\xde\xca\x3b\
-\x39\xb5\x1b\x58\x16\x69\xad\x82\x4f\x1c\xb9\x54\x62\x01\xc9\x8f\
-\x1c\x9e\xf5\xc2\x7e\xcb\x9f\xf0\x4d\xa8\xff\x00\x64\x9f\xf8\x26\
-\x35\xbf\xec\xdb\xe1\x7f\x1f\x6b\x71\x2d\x8e\x8d\xab\x69\x36\x7e\
-\x2b\x36\x71\x0b\xfb\x43\x7f\x73\x75\x39\x9d\x22\xce\xcd\xf1\x1b\
-\xa6\x0b\x93\xfc\x0a\x4f\x7a\xfa\x76\x8a\x00\xf9\x67\xfe\x09\x35\
-\xff\x00\x04\xae\xf0\x9f\xfc\x12\x4b\xf6\x6b\xbd\xf8\x7b\xe1\x5d\
-\x62\xfb\xc4\x8f\xab\x6b\x33\x6b\x7a\x8e\xb1\x7d\x02\x41\x73\x79\
-\x2b\xa4\x71\x22\x95\x4c\x80\x89\x1c\x48\x00\x07\x19\x2c\x78\x2c\
-\x6b\x1f\xfe\x0a\xdf\xff\x00\x04\x83\xf0\xbf\xfc\x15\xab\xc0\x3e\
-\x09\xd3\x75\xbf\x14\xeb\x1e\x09\xd6\xbc\x01\xac\x3e\xad\xa4\x6b\
-\x7a\x65\xba\x4f\x71\x07\x98\x81\x64\x88\x07\x20\x05\x66\x48\x5f\
-\x20\xe4\x18\x56\xbe\xbe\xa2\x80\x3e\x1f\xf8\x83\xff\x00\x04\x51\
-\xd2\x7e\x27\x7f\xc1\x4c\xfe\x17\x7e\xd3\xda\xc7\xc4\x8d\x7e\xe7\
-\xc5\x7f\x0d\x74\x7b\x2d\x28\xe9\xff\x00\xd9\xd0\xad\xbe\xae\xf6\
-\xf1\x4f\x1b\x4f\x23\x67\x28\xd2\x1b\x86\x62\x14\x60\x11\xc5\x7a\
-\x97\xfc\x14\xef\xfe\x09\xa3\xe0\x8f\xf8\x2a\x77\xec\xb9\x7d\xf0\
-\xd3\xc6\xd2\x4d\xa7\x30\xbb\x8b\x51\xd2\x35\xbb\x58\x96\x4b\xcd\
-\x12\xee\x33\xfe\xb6\x20\xdf\x29\x0f\x19\x78\xdd\x4f\x0c\x92\x1e\
-\x84\x2b\x0f\xa3\xa8\xa0\x0f\x9b\x3f\xe0\x98\x1f\xf0\x4d\xcd\x13\
-\xfe\x09\x93\xfb\x21\x5b\xfc\x1f\xd2\xfc\x45\x7d\xe3\x2d\x26\x0d\
-\x42\xf2\xf9\xae\xf5\x2b\x48\xe2\x79\x45\xcb\x02\xd1\xb2\x29\x2a\
-\x54\x63\x1e\xf9\xe6\xbe\x40\xfd\xa0\xff\x00\xe0\xd3\x9f\x82\xfe\
-\x3d\xf8\xa5\xaa\x78\xa3\xe1\x77\x8f\xbe\x23\xfc\x0b\x5d\x7a\x4f\
-\x37\x50\xd2\x3c\x33\x78\x1b\x4d\x62\x49\x2c\x22\x8d\x88\x78\xd4\
-\x92\x48\x4d\xe5\x13\x24\x2a\xaa\xe1\x47\xea\x95\x14\x01\xf1\xf7\
-\xfc\x12\xf3\xfe\x08\x91\xf0\x5f\xfe\x09\x45\x65\xaa\xde\x78\x16\
-\xd7\x54\xd7\xbc\x67\xe2\x04\x30\xea\x5e\x29\xd7\xa6\x59\xf5\x19\
-\xa0\x25\x5b\xec\xf1\xec\x55\x48\xa2\xdc\xa1\x88\x55\xdc\xcd\x82\
-\xcc\xdb\x50\x2f\xcd\x1f\xb5\xaf\xfc\x1a\xd3\xe1\xef\xda\x8b\xf6\
-\xc7\xf1\xf7\xc6\x6b\x5f\x8f\x1f\x11\x3c\x0f\xad\xf8\xf6\xf9\xaf\
-\x2e\x2d\xf4\x5b\x48\xa3\x16\xca\x51\x14\xc4\x24\x0e\xac\xcb\xf2\
-\x03\xcf\xf4\xcd\x7e\xac\x51\x40\x1f\x8e\x52\x7f\xc1\xa3\x91\xc9\
-\x1b\x29\xfd\xad\xbe\x38\x90\xc3\x18\x2d\x91\xf9\x79\xd5\xfa\xf5\
-\xe0\xcf\x0e\x7f\xc2\x21\xe1\x2d\x2f\x4b\xfb\x4c\xd7\x9f\xd9\xb6\
-\x70\xda\x79\xf2\xff\x00\xac\x9b\xcb\x40\x9b\xdb\xdc\xe3\x27\xdc\
-\xd6\x9d\x14\x00\x56\x0f\xc4\xef\x86\xba\x2f\xc6\x3f\x87\xda\xd7\
-\x85\x7c\x49\xa7\xc5\xaa\x78\x7f\xc4\x56\x72\xe9\xfa\x8d\x9c\x8e\
-\xc8\xb7\x30\x48\xa5\x5d\x09\x52\x18\x64\x12\x32\xa4\x11\xd8\x8a\
-\xde\xa2\x8d\x9d\xd0\x1f\x3e\xb7\xfc\x13\x07\xe1\x04\xae\x59\xf4\
-\xff\x00\x1c\x33\x37\x25\x8f\xc4\x3f\x11\x12\xc7\xd4\x9f\xb7\x51\
-\xff\x00\x0e\xbe\xf8\x3b\xff\x00\x40\xdf\x1c\x7f\xe1\xc2\xf1\x17\
-\xff\x00\x27\x57\xd0\x54\x56\xbe\xde\xa7\xf3\x3f\xbc\x2c\x7c\xfb\
-\xff\x00\x0e\xbd\xf8\x3b\xff\x00\x40\xdf\x1c\x7f\xe1\xc2\xf1\x17\
-\xff\x00\x27\x51\xff\x00\x0e\xbe\xf8\x3b\xff\x00\x40\xdf\x1c\x7f\
-\xe1\xc2\xf1\x17\xff\x00\x27\x57\xd0\x54\x51\xed\xea\x7f\x33\xfb\
-\xc2\xc7\xcf\x87\xfe\x09\x7b\xf0\x77\x3f\xf2\x0d\xf1\xb7\xfe\x1c\
-\x2f\x11\x7f\xf2\x75\x20\xff\x00\x82\x5e\xfc\x1e\xff\x00\xa0\x6f\
-\x8d\xbf\xf0\xe1\x78\x8b\xff\x00\x93\xab\xe8\x4a\x28\xf6\xf5\x3f\
-\x99\xfd\xe1\x63\xe7\xdf\xf8\x75\xf7\xc1\xdf\xfa\x06\xf8\xe3\xff\
-\x00\x0e\x17\x88\xbf\xf9\x3a\x8f\xf8\x75\xf7\xc1\xdf\xfa\x06\xf8\
-\xe3\xff\x00\x0e\x17\x88\xbf\xf9\x3a\xbe\x82\xa2\x8f\x6f\x53\xf9\
-\x9f\xde\x16\x3e\x7d\xff\x00\x87\x5e\xfc\x1d\xff\x00\xa0\x6f\x8e\
-\x3f\xf0\xe1\x78\x8b\xff\x00\x93\xa8\xff\x00\x87\x5f\x7c\x1d\xff\
-\x00\xa0\x6f\x8e\x3f\xf0\xe1\x78\x8b\xff\x00\x93\xab\xe8\x2a\x28\
-\xf6\xf5\x3f\x99\xfd\xe1\x63\xe7\xdf\xf8\x75\xf7\xc1\xdf\xfa\x06\
-\xf8\xe3\xff\x00\x0e\x17\x88\xbf\xf9\x3a\x8f\xf8\x75\xef\xc1\xdf\
-\xfa\x06\xf8\xe3\xff\x00\x0e\x17\x88\xbf\xf9\x3a\xbe\x82\xa2\x8f\
-\x6f\x53\xf9\x9f\xde\x16\x3e\x7d\xff\x00\x87\x5f\x7c\x1d\xff\x00\
-\xa0\x6f\x8e\x3f\xf0\xe1\x78\x8b\xff\x00\x93\xa9\x0f\xfc\x12\xf7\
-\xe0\xf6\x7f\xe4\x1b\xe3\x6f\xfc\x38\x5e\x22\xff\x00\xe4\xea\xfa\
-\x0e\x8a\x3d\xbd\x4f\xe6\x7f\x78\x58\xf9\xf4\x7f\xc1\x2f\x7e\x0e\
-\xe3\xfe\x41\xbe\x37\xff\x00\xc3\x85\xe2\x2f\xfe\x4e\xa3\xfe\x1d\
-\x7d\xf0\x77\xfe\x81\xbe\x38\xff\x00\xc3\x85\xe2\x2f\xfe\x4e\xaf\
-\xa0\xa8\xa3\xdb\xd4\xfe\x67\xf7\x85\x8f\x9f\x7f\xe1\xd7\xdf\x07\
-\x7f\xe8\x1b\xe3\x8f\xfc\x38\x5e\x22\xff\x00\xe4\xea\x3f\xe1\xd7\
-\xbf\x07\x7f\xe8\x1b\xe3\x8f\xfc\x38\x5e\x22\xff\x00\xe4\xea\xfa\
-\x0a\x8a\x3d\xbd\x4f\xe6\x7f\x78\x58\xf9\xf7\xfe\x1d\x7d\xf0\x77\
-\xfe\x81\xbe\x38\xff\x00\xc3\x85\xe2\x2f\xfe\x4e\xa3\xfe\x1d\x7d\
-\xf0\x77\xfe\x81\xbe\x38\xff\x00\xc3\x85\xe2\x2f\xfe\x4e\xaf\xa0\
-\xa8\xa3\xdb\xd4\xfe\x67\xf7\x85\x8f\x9f\x7f\xe1\xd7\xbf\x07\x7f\
-\xe8\x1b\xe3\x8f\xfc\x38\x5e\x22\xff\x00\xe4\xea\x0f\xfc\x12\xf7\
-\xe0\xef\xfd\x03\x7c\x6f\xff\x00\x87\x0b\xc4\x5f\xfc\x9d\x5f\x41\
-\x51\x47\xb7\xa9\xfc\xcf\xef\x15\x91\xf3\xc5\xe7\xfc\x12\xcf\xe0\
-\xdd\xf5\xa4\xb0\x4b\xa5\xf8\xd6\x48\x66\x8d\xa3\x91\x1b\xe2\x0f\
-\x88\x8a\xba\xb0\xc1\x07\xfd\x3b\xa1\x1c\x57\xb9\xf8\x2f\xc1\xba\
-\x6f\xc3\xdf\x08\xe9\x3a\x0e\x8f\x6b\x1d\x8e\x8f\xa1\xd9\xc5\xa7\
-\xd8\xdb\x21\x25\x6d\xe0\x89\x16\x38\xd0\x12\x49\x21\x51\x40\xe4\
-\x93\xc5\x6a\x51\x4a\x55\x27\x25\x69\x36\xc6\x14\x51\x45\x66\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x07\
-\xff\xd9\
-\x00\x00\xb9\x5d\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xe1\x10\xda\x45\x78\x69\x66\x00\x00\x4d\x4d\x00\
-\x2a\x00\x00\x00\x08\x00\x04\x01\x3b\x00\x02\x00\x00\x00\x05\x00\
-\x00\x08\x4a\x87\x69\x00\x04\x00\x00\x00\x01\x00\x00\x08\x50\x9c\
-\x9d\x00\x01\x00\x00\x00\x0a\x00\x00\x10\xc8\xea\x1c\x00\x07\x00\
-\x00\x08\x0c\x00\x00\x00\x3e\x00\x00\x00\x00\x1c\xea\x00\x00\x00\
-\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x4b\x61\x72\x6c\x00\x00\x00\x05\x90\
-\x03\x00\x02\x00\x00\x00\x14\x00\x00\x10\x9e\x90\x04\x00\x02\x00\
-\x00\x00\x14\x00\x00\x10\xb2\x92\x91\x00\x02\x00\x00\x00\x03\x32\
-\x37\x00\x00\x92\x92\x00\x02\x00\x00\x00\x03\x32\x37\x00\x00\xea\
-\x1c\x00\x07\x00\x00\x08\x0c\x00\x00\x08\x92\x00\x00\x00\x00\x1c\
-\xea\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x32\x30\x32\x30\x3a\
-\x30\x36\x3a\x30\x33\x20\x32\x31\x3a\x33\x32\x3a\x33\x39\x00\x32\
-\x30\x32\x30\x3a\x30\x36\x3a\x30\x33\x20\x32\x31\x3a\x33\x32\x3a\
-\x33\x39\x00\x00\x00\x4b\x00\x61\x00\x72\x00\x6c\x00\x00\x00\xff\
-\xe1\x0b\x17\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\
-\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x00\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\x69\x6e\x3d\
-\x27\xef\xbb\xbf\x27\x20\x69\x64\x3d\x27\x57\x35\x4d\x30\x4d\x70\
-\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\x7a\x6b\x63\
-\x39\x64\x27\x3f\x3e\x0d\x0a\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\
-\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\
-\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x3e\x3c\x72\x64\x66\x3a\
-\x52\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\
-\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\
-\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x75\x75\x69\x64\x3a\x66\x61\x66\
-\x35\x62\x64\x64\x35\x2d\x62\x61\x33\x64\x2d\x31\x31\x64\x61\x2d\
-\x61\x64\x33\x31\x2d\x64\x33\x33\x64\x37\x35\x31\x38\x32\x66\x31\
-\x62\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x2f\x3e\
-\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\
-\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x75\x75\x69\x64\
-\x3a\x66\x61\x66\x35\x62\x64\x64\x35\x2d\x62\x61\x33\x64\x2d\x31\
-\x31\x64\x61\x2d\x61\x64\x33\x31\x2d\x64\x33\x33\x64\x37\x35\x31\
-\x38\x32\x66\x31\x62\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x3e\
-\x3c\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\x61\x74\x65\x3e\
-\x32\x30\x32\x30\x2d\x30\x36\x2d\x30\x33\x54\x32\x31\x3a\x33\x32\
-\x3a\x33\x39\x2e\x32\x36\x38\x3c\x2f\x78\x6d\x70\x3a\x43\x72\x65\
-\x61\x74\x65\x44\x61\x74\x65\x3e\x3c\x2f\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x3c\x72\x64\x66\x3a\x44\
-\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\
-\x62\x6f\x75\x74\x3d\x22\x75\x75\x69\x64\x3a\x66\x61\x66\x35\x62\
-\x64\x64\x35\x2d\x62\x61\x33\x64\x2d\x31\x31\x64\x61\x2d\x61\x64\
-\x33\x31\x2d\x64\x33\x33\x64\x37\x35\x31\x38\x32\x66\x31\x62\x22\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\
-\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x3e\x3c\x64\x63\
-\x3a\x63\x72\x65\x61\x74\x6f\x72\x3e\x3c\x72\x64\x66\x3a\x53\x65\
-\x71\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\
-\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\
-\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x3c\x72\x64\x66\x3a\x6c\
-\x69\x3e\x4b\x61\x72\x6c\x3c\x2f\x72\x64\x66\x3a\x6c\x69\x3e\x3c\
-\x2f\x72\x64\x66\x3a\x53\x65\x71\x3e\x0d\x0a\x09\x09\x09\x3c\x2f\
-\x64\x63\x3a\x63\x72\x65\x61\x74\x6f\x72\x3e\x3c\x2f\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x3c\x2f\x72\
-\x64\x66\x3a\x52\x44\x46\x3e\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\
-\x74\x61\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\
-\x6e\x64\x3d\x27\x77\x27\x3f\x3e\xff\xdb\x00\x43\x00\x07\x05\x05\
-\x06\x05\x04\x07\x06\x05\x06\x08\x07\x07\x08\x0a\x11\x0b\x0a\x09\
-\x09\x0a\x15\x0f\x10\x0c\x11\x18\x15\x1a\x19\x18\x15\x18\x17\x1b\
-\x1e\x27\x21\x1b\x1d\x25\x1d\x17\x18\x22\x2e\x22\x25\x28\x29\x2b\
-\x2c\x2b\x1a\x20\x2f\x33\x2f\x2a\x32\x27\x2a\x2b\x2a\xff\xdb\x00\
-\x43\x01\x07\x08\x08\x0a\x09\x0a\x14\x0b\x0b\x14\x2a\x1c\x18\x1c\
-\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\
-\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\
-\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\
-\x2a\x2a\xff\xc0\x00\x11\x08\x01\xd8\x01\xa9\x03\x01\x22\x00\x02\
-\x11\x01\x03\x11\x01\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\
-\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\
-\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\
-\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\
-\x11\x05\x12\x21\x31\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\
-\x91\xa1\x08\x23\x42\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\
-\x09\x0a\x16\x17\x18\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\
-\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\
-\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\
-\x77\x78\x79\x7a\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\
-\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\
-\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\
-\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\
-\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\
-\x1f\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\
-\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\
-\x00\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\
-\x01\x02\x77\x00\x01\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\
-\x07\x61\x71\x13\x22\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\
-\x33\x52\xf0\x15\x62\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\
-\x19\x1a\x26\x27\x28\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\
-\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\
-\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\
-\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\
-\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\
-\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\
-\xd8\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\
-\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\
-\x00\x3f\x00\x58\xe4\x61\x56\xb2\x5d\x30\x6a\x20\xa0\x53\x8c\xa8\
-\xa3\x19\x15\xc8\xaa\x1a\xfb\x32\xb3\xc6\x77\x1c\x56\x6e\xa3\x74\
-\xb6\xd1\x92\xce\x05\x59\xd5\xf5\x0f\xb3\x5a\x33\xc6\x09\x20\x74\
-\xaf\x2f\xd4\xf5\xab\xad\x42\x46\x0c\x4a\xa8\x3f\x74\x56\xb1\x77\
-\x33\x94\x6c\x6a\x6a\x5e\x25\x6d\xc5\x61\x6c\x9a\xe7\x27\xb9\x96\
-\xee\x42\xd2\xb6\x79\xa8\x7a\x9e\x69\x92\x4c\xa9\xc2\xf2\x6b\x54\
-\x84\x3d\xd9\x51\x70\x3a\xd5\x36\x5d\xcd\xc9\xe6\xaf\x43\x02\xba\
-\x96\x76\xe7\xdc\xd5\x6b\xa5\x44\x70\x10\xe6\xac\x44\x1e\x48\x26\
-\x90\xc4\x33\xc5\x19\x34\x00\x68\x01\xbe\x50\xa5\xf2\x73\x4f\x06\
-\x9d\x8a\x60\x46\x20\x15\x20\xb7\x1e\xb4\xe1\x4f\x07\xa5\x31\x0d\
-\x5b\x55\x35\x22\xda\xa6\x69\x52\xa4\x14\xc4\x02\xd9\x3e\xb5\x22\
-\xda\xc7\xe9\x4a\xb5\x2a\xd0\x21\x52\xd2\x3e\xe2\xac\xa5\xac\x7e\
-\x9c\x52\xdb\x60\xc8\x37\x55\xf9\xc4\x41\x46\xc2\x09\xf6\xa6\x22\
-\x04\xb5\x8b\xb8\xef\x50\x5f\x34\x16\xf1\x1c\x01\x52\xcd\x38\x8a\
-\x32\x73\x8a\xe7\x2f\xee\xcc\xf2\x11\x9e\x29\x31\xa4\x45\x2c\xfe\
-\x63\x1f\x4a\x89\xa4\xa8\xdd\xb6\xa1\x23\xa8\x15\xee\x47\xf6\x69\
-\x62\x7f\xe4\x6d\x1f\xf8\x2c\xff\x00\xed\xb5\x17\x2c\xf0\xe0\xe7\
-\x3c\x1a\x9a\x3b\x97\x5f\xe2\xaf\x6b\xff\x00\x86\x69\x6f\xfa\x1b\
-\x47\xfe\x0b\x3f\xfb\x6d\x2f\xfc\x33\x4b\x7f\xd0\xda\x3f\xf0\x59\
-\xff\x00\xdb\x69\x0c\xf1\xc8\xef\xc8\xfb\xd5\x6a\x3b\xd5\x23\xad\
-\x7a\xcf\xfc\x33\x53\xff\x00\xd0\xda\x3f\xf0\x59\xff\x00\xdb\x69\
-\xc3\xf6\x6d\x90\x74\xf1\x6a\xff\x00\xe0\xb3\xff\x00\xb7\x50\x2b\
-\x1e\x56\xb3\xab\x1e\x0d\x3c\x30\xed\x5e\xaa\xbf\xb3\x9c\xcb\xd3\
-\xc5\xab\xff\x00\x82\xc3\xff\x00\xc7\xaa\x41\xfb\x3d\x5c\x8f\xf9\
-\x9b\x53\xff\x00\x05\x87\xff\x00\x8f\x50\x16\x3c\xa4\x39\x5e\x8d\
-\x4f\x5b\xa6\x5e\xa6\xbd\x57\xfe\x19\xfa\xeb\xfe\x86\xb8\xbf\xf0\
-\x56\x7f\xf8\xf5\x2f\xfc\x33\xf5\xc9\xff\x00\x99\xae\x2f\xfc\x15\
-\x9f\xfe\x3d\x4e\xe8\x56\x3c\xc1\x2f\xbd\x6a\x65\xbc\x53\xde\xbd\
-\x23\xfe\x19\xf6\xe7\xfe\x86\xb8\xbf\xf0\x56\x7f\xf8\xf5\x1f\xf0\
-\xcf\x97\x23\xa7\x8b\x23\xff\x00\xc1\x59\xff\x00\xe3\xd4\xb4\x0b\
-\x1c\x04\x57\xcc\x87\x28\xe4\x7e\x35\xa3\x6f\xe2\x0b\x88\xb0\x0b\
-\x6e\x15\xd8\x0f\x80\x37\x6b\xd3\xc5\xb1\xff\x00\xe0\xac\xff\x00\
-\xf1\xea\x90\x7c\x06\xbd\x1f\xf3\x36\x43\xff\x00\x82\xb3\xff\x00\
-\xc7\xa8\x15\x8e\x49\xf5\xaf\x38\x6e\x3c\x38\xad\x3d\x23\xc4\x3f\
-\x36\xc9\x1b\x06\xb7\x47\xc0\xbb\xe1\xff\x00\x33\x54\x1f\xf8\x2b\
-\x3f\xfc\x7a\x9e\xbf\x03\xf5\x05\x39\x5f\x15\x5b\x83\xff\x00\x60\
-\xb6\xff\x00\xe3\xf4\x83\x94\x55\xbf\x8a\x45\x0d\xba\xa3\x9b\x57\
-\x82\x25\xe5\xc0\xfc\x6a\xe2\x7c\x1f\xd5\xd1\x70\xbe\x2c\xb7\xc7\
-\xfd\x82\x9b\xff\x00\x8f\xd5\x79\xbe\x09\xea\x73\xb6\x64\xf1\x74\
-\x3f\x86\x96\x7f\xf8\xf5\x02\xe5\x66\x45\xc7\x88\xe2\x5e\x15\xb3\
-\x59\xb3\x78\x89\xdf\xfd\x58\x26\xba\xb8\xbe\x09\xdf\xc5\xff\x00\
-\x33\x35\xab\xff\x00\xbd\xa5\x37\xff\x00\x1f\xab\x2b\xf0\x87\x51\
-\x4f\xbb\xe2\x1b\x0f\xfc\x14\xbf\xff\x00\x24\x50\x1c\xac\xf3\xe9\
-\x35\x2b\xb9\x8f\x00\x8c\xf4\xa6\x6f\xbc\x71\xce\x45\x7a\x2f\xfc\
-\x2a\x4d\x57\xb7\x89\x6c\x87\xd3\x49\x6f\xfe\x3f\x5e\x63\x69\xac\
-\x3d\xce\x9f\x6f\x34\x9b\x55\xe4\x89\x5d\x82\xf4\xc9\x19\xe2\x98\
-\x58\xb6\x05\xcf\x73\x43\x47\x70\xe3\xad\x56\x37\xac\x7b\xd1\xf6\
-\xf2\xbd\x5a\x80\x29\x6a\xba\x64\x92\x46\x59\xeb\x97\x9a\x1d\x8c\
-\x46\x30\x45\x75\xf7\x17\xe2\x48\xd9\x49\xae\x6e\xed\xd7\xcd\x38\
-\x19\xe6\xb3\x91\xd1\x4d\x95\xa1\x1e\x87\x15\x60\xab\x10\x3e\x7a\
-\x85\x19\x49\xc1\x18\xab\x48\x88\xcb\xc9\xe2\xb3\x67\x5c\x59\x0b\
-\x27\xc9\xc9\xcd\x47\x1a\x8d\xd8\x06\xad\xb1\x41\xc2\x8c\xd5\x62\
-\xe1\x5f\x1b\x71\x40\xc5\x11\xa8\x93\xef\xf3\x53\x7f\xc0\xaa\x10\
-\x63\x2f\xc8\xa9\xb3\x1d\x21\xa3\xd6\xc7\x9f\x2f\xad\x3d\x6d\xd8\
-\x7d\xf6\xfc\xaa\xfa\xc7\x4e\xf2\x87\x71\x5c\xa8\xcc\xca\xbb\xb6\
-\x49\x2d\xd9\x02\xe7\x22\xb8\x1d\x4b\x4a\x4b\x16\x95\xdc\x01\x93\
-\x90\x00\xaf\x48\xbe\x9e\x1b\x38\x1a\x49\x58\x00\x07\x7a\xf2\x7f\
-\x14\xf8\x8b\xed\xf7\x0d\x15\xa9\x02\x21\xc1\x61\xde\xba\x69\x5e\
-\xe6\x35\x2d\x63\x02\xe2\x7c\xbb\x05\xf5\xeb\x55\x4f\xeb\x4a\xc7\
-\xff\x00\xaf\x51\x96\xcd\x75\x98\x12\x79\xae\x57\xa9\xa6\x13\x9f\
-\x7a\x01\xa3\x34\xc4\x1f\xce\x9c\x29\xa3\x9a\x75\x00\x38\x77\xa5\
-\x14\xde\xb4\xe5\xa0\x43\xf1\x4e\x02\x9b\x9c\x54\x82\x98\x00\xa9\
-\x07\x4e\x69\xa3\x14\xf5\x14\xc4\x48\xb5\x62\x24\x2d\xd2\xab\x8e\
-\x95\x62\x09\x4c\x67\xa0\x26\x98\x89\x95\x4a\x9f\x4a\x94\x38\x55\
-\xc9\xa8\x8c\xbb\x9b\x27\x8a\xa9\x79\x75\xb5\x76\xad\x2b\x85\x88\
-\x6f\xee\x8c\x87\x6a\x9a\xcb\x60\x49\x35\x69\x14\xc8\xc7\x8c\xd2\
-\xbd\x84\xa3\xe6\x51\x9a\x82\xcc\xe9\x11\x8a\x37\xa0\x06\xbe\xd0\
-\xf1\xac\xb3\xc3\xe0\xad\x52\x4b\x49\x1e\x39\x84\x07\x63\xc7\x2b\
-\x46\xc0\xe4\x74\x75\xe5\x7e\xa3\x91\x5f\x1d\xcb\x1b\xc7\x6f\x26\
-\x53\x8d\x87\x9f\xc2\xbe\xe1\xa4\x33\xca\x2e\xfc\x61\xac\x78\x4a\
-\x27\xb2\x51\x08\x95\x6e\x66\xde\x9a\x8d\xf0\x99\x21\x2a\x91\x14\
-\x85\x6e\x2e\x26\x88\xb0\x70\xe5\xc3\x9d\xc5\x72\x46\xc3\xb4\xe3\
-\x63\x4d\xf1\x27\x88\x26\xd5\x9b\x4e\x93\x52\xd2\xe5\x9c\xea\x53\
-\x45\x24\x66\xcd\x8c\x96\xb1\x22\xb3\x80\x55\x65\xe4\xb0\x00\x29\
-\x38\xe3\x9f\x9a\xbb\xfa\xcb\xd5\xb5\xc1\xa6\x5c\x5b\xda\xc1\x61\
-\x77\xa9\x5e\x5c\x06\x75\xb6\xb4\xf2\xc3\x04\x5c\x6e\x72\x64\x75\
-\x50\x01\x65\x1d\x72\x4b\x70\x0e\x0e\x10\x1c\x2e\x99\xf1\x22\xfe\
-\xfe\xd6\x43\x25\xf6\x93\x6d\x1f\xda\x22\x43\xa9\xcf\x0a\x88\x20\
-\x47\x8e\x56\xf9\xd1\x2e\x5c\x02\x5a\x20\xa3\x74\x88\x72\xe3\x23\
-\x20\x06\x9e\x2f\x14\xea\xb1\xeb\x52\x45\x71\x7f\x65\xac\x49\x0e\
-\xa8\xe9\x0d\xa5\x92\x3c\x32\x79\x47\x4f\x96\x74\xe1\x65\x6d\xe1\
-\xca\x80\xbb\x83\x0c\xee\x23\x27\x6e\xde\xaa\x3f\x18\xe8\xd2\x59\
-\xc3\x2a\xdd\xc4\xb7\x13\x29\x65\xb2\x96\x78\xe2\x9f\xe5\x6d\x8e\
-\x0a\xbb\x0f\xba\xc1\x81\xe7\x1f\x29\xc6\x6a\x66\xf1\x4e\x8a\x6f\
-\xda\xc6\xdb\x53\xb2\xba\xbd\x49\x44\x52\xdb\x43\x77\x11\x92\x22\
-\x5c\x21\x2c\xa5\x81\x18\x62\x01\x1d\x72\x40\x00\x9e\x28\x03\x93\
-\xb2\xf1\x9e\xb5\xa9\x5d\x5a\x59\x69\x9a\x96\x85\x7e\x6e\xee\x62\
-\x88\x6a\x16\xd6\xf2\x3c\x11\x96\x82\xe2\x57\x8c\xa8\x97\xe6\x75\
-\xf2\x13\xf8\xc7\x12\x0c\xa8\xef\xa7\x7b\xe2\xbb\x98\x7c\x33\xa2\
-\xdf\x4b\x77\xa6\xe9\x4f\xa8\x60\x4f\x79\x7c\xa5\xad\xe1\x3e\x5b\
-\x36\x31\xbd\x3e\xf1\x5c\x0c\xb0\xfc\x4f\x07\xa2\xd3\xb5\xad\x2f\
-\x57\x32\x8d\x27\x52\xb3\xbe\x30\xed\xf3\x05\xb4\xeb\x26\xcc\xf2\
-\x33\xb4\x9c\x67\x1c\x55\x64\xf1\x6f\x87\x24\xb1\x6b\xd8\xf5\xfd\
-\x2d\xad\x15\xfc\xb6\x9d\x6f\x63\x31\x87\xc1\x6d\xa5\xb3\x8c\xe0\
-\x13\x8f\x41\x40\x1e\x7f\xa5\x78\xd3\x50\xd3\x7c\x39\x61\x2d\xc5\
-\xed\xba\x48\xeb\x66\x27\x7b\xd9\x1a\x69\x64\x0d\x6c\xac\xdb\x23\
-\x79\x93\x73\x64\x8c\x84\xcb\x1f\xee\x33\x1a\x5d\x4b\xe2\x1e\xaf\
-\xa0\xe9\x57\x4f\x75\xaa\xe9\x97\x97\xb0\xdf\x5e\x47\xf6\x7f\xb2\
-\x24\x64\x24\x4e\x76\xa1\x2d\x72\x98\x2c\x0a\x95\x00\x3b\x95\x39\
-\x0a\xf8\x24\xfa\x2c\x7e\x20\xd1\xa6\xb8\xb8\x82\x1d\x5a\xc6\x49\
-\xad\x5d\x63\x9e\x35\xb9\x42\xd0\xb9\x6d\xa1\x58\x67\x2a\x4b\x7c\
-\xa0\x1e\xfc\x51\x73\xe2\x0d\x1a\xca\x68\xe2\xbc\xd5\xac\x6d\xe4\
-\x92\x4f\x29\x12\x5b\x94\x56\x77\xce\x36\x80\x4f\x27\x3c\x62\x80\
-\x39\x6b\x9f\x16\xeb\x96\x86\xf2\xe5\xd6\xc2\x4b\x51\x35\xe4\x10\
-\x46\xb0\x48\x1e\x33\x0b\x10\x24\x76\xde\x43\x2e\x01\x25\x42\x83\
-\xc6\x73\xda\xa9\x5e\x78\xff\x00\x51\xb5\xd5\xb4\xcb\x4b\x4b\xdd\
-\x17\x55\x82\xe5\x51\x8d\xe5\xbb\x45\x0c\x57\x45\xa5\x64\x68\xe2\
-\x32\x5d\x64\x32\x05\x19\xdb\xe6\x92\x58\x64\x2e\x46\x7b\x25\xf1\
-\x2e\x95\x2f\x88\x97\x44\xb7\xbc\x86\xe2\xfb\x63\xbc\xb1\x43\x2a\
-\xb1\x83\x6e\xde\x1c\x03\x95\x27\x77\x19\x1c\xe0\xd6\x7f\xfc\x2c\
-\x1f\x0b\x17\x4d\xba\xd5\x99\x85\xa4\x96\x27\xb8\x33\xa2\xc7\x13\
-\xc6\x40\x2a\xcc\xc4\x63\x39\xe3\xd7\xa8\xe3\x06\x80\x29\xea\xfa\
-\xde\xa7\x6d\xe2\xe9\x34\xed\x28\xdb\x47\x24\xe6\xd2\x31\x2d\xca\
-\xc9\x2a\xa6\xf5\xba\x24\xec\x12\x28\xcf\xee\x97\xa6\x09\xcf\x24\
-\xf1\x8a\x0d\xe3\x8d\x40\x41\x2b\x4f\x7d\xa3\xd9\xdc\x5b\xd8\x3c\
-\xcb\x69\x3c\x4d\xe6\x5f\xc8\xab\x26\x5a\x2f\xde\x0c\x20\x64\xe9\
-\x87\x23\x91\x9e\xf5\xda\x2e\xaf\xa6\xbe\xa8\x74\xd4\xd4\x2d\x5a\
-\xfc\x27\x98\x6d\x44\xea\x65\x0b\xfd\xed\x99\xce\x39\xeb\x8a\x8c\
-\x6b\xda\x43\x6a\x12\xd8\x0d\x56\xc4\xde\x42\x85\xe4\xb7\x17\x29\
-\xe6\x22\x8e\xa4\xae\x72\x00\xee\x68\x03\x8d\x93\xc6\xba\xed\x97\
-\x8a\xec\x34\x9b\xd5\xd3\x9f\xce\x58\x99\xf6\xaa\x44\xd2\xac\x99\
-\x25\xa3\x0f\x71\xbc\xec\x18\x18\x58\xdf\x71\x56\xfb\xb9\xc0\xcd\
-\xb6\xf8\x9d\x7f\x36\x8d\x2d\xd3\x5f\x69\x08\x23\xb9\x89\x7c\xf6\
-\x48\xbe\x78\xd9\x1c\x90\x91\x2d\xdb\x06\x70\x54\x71\xe6\x6e\xc1\
-\x3f\x21\x20\x03\xdf\xaf\x8a\x34\x17\xb5\x86\xe2\x2d\x6b\x4e\x96\
-\x2b\x87\x31\xc0\xe9\x77\x19\x13\x38\x20\x6d\x53\xbb\x04\xe4\x81\
-\x8f\x52\x2a\x25\xf1\x76\x80\xb1\xc3\xf6\xad\x67\x4f\xb5\x96\x58\
-\x44\xfe\x44\xd7\xb1\x07\x55\x28\x1f\x27\x0c\x41\x01\x4e\x72\x09\
-\x18\xe7\x38\xe6\x80\x38\xe9\x3e\x22\xea\xa3\x52\xd6\xa0\x65\xd2\
-\xad\x16\xcb\xce\xd8\xb7\x93\xc1\x1b\x44\x12\x60\x88\xcc\x0d\xc8\
-\x66\xde\x0e\x40\x65\x88\x65\x94\x6e\x20\x86\xad\x4d\x52\xfb\x50\
-\xd6\xb4\x9f\x09\x49\x65\xa8\xa4\x31\xea\x57\x89\xf6\x97\x8e\x39\
-\x22\xf3\x47\x93\x24\x98\x53\x1c\xc0\xaa\xe5\x3b\x3b\x03\x90\x72\
-\xcb\xc3\x74\x8f\xe2\x4d\x0e\x36\xb7\x59\x35\x9d\x3d\x1a\xe6\x1f\
-\x3e\x00\xd7\x48\x0c\xb1\xe0\x9d\xeb\xcf\xcc\xb8\x04\xe4\x71\x80\
-\x6a\x1b\x2f\x17\xf8\x77\x51\x82\xca\x5b\x3d\x6e\xc1\xd6\xfc\xe2\
-\xd5\x4d\xc2\xab\x4c\x78\xca\xaa\x92\x09\x61\x90\x08\xc6\x46\x79\
-\xa0\x0e\x39\xfc\x75\xae\xc1\xa1\xd8\xde\xdd\xdd\x68\xb0\x4f\x77\
-\x60\x2f\xad\xed\xe4\xb7\x91\x4d\xeb\x10\x31\x6d\x17\xef\x72\x64\
-\xcf\x56\x01\xbf\xd6\x20\xd9\xc1\x26\xe4\xde\x25\xf1\x44\x92\x5c\
-\x35\x9c\xba\x44\x71\x6f\xd4\x16\x21\x2d\xa4\xac\xc8\x2d\xa4\xda\
-\x37\x11\x28\xdd\xb8\x71\xc6\xdc\x75\xe7\xee\xd7\x69\x65\xa9\xd8\
-\x6a\x5e\x6f\xf6\x75\xed\xb5\xdf\x92\xfb\x25\xf2\x25\x57\xf2\xdb\
-\x19\xc1\xc1\xe0\xe3\xb1\xab\x54\x01\x0d\xac\xff\x00\x69\xb3\x86\
-\x7d\xbb\x7c\xd8\xd5\xf6\xe7\x38\xc8\xce\x2b\xe5\x3d\x23\x4f\x9e\
-\x5d\x26\xd1\x97\xa1\x81\x08\xff\x00\xbe\x45\x7d\x65\x5f\x2a\x78\
-\x73\x55\x8b\xfb\x2e\xd2\x26\x70\x0a\x42\x8a\x41\xf6\x02\x93\x76\
-\x1a\x57\x2c\x8d\x2a\x63\xd4\xd3\xbf\xb1\xe4\x3d\x5a\xb6\x63\x2b\
-\x32\xfc\x8f\x9a\x90\xc0\xdd\x8d\x67\xed\x0a\xf6\x67\x39\x26\x8e\
-\xde\xbc\xd5\x6b\x8d\x0a\x41\x19\x65\x8c\x9f\xc2\xbb\x3d\x3f\x4e\
-\x37\x37\xc8\x8d\xc8\x26\xbd\x0a\xdf\xc2\x76\xad\x62\x37\xa8\x27\
-\x1e\x95\xa4\x5a\x91\x2e\xf0\x67\xcd\xd2\xc2\xd0\x48\x55\xd7\x04\
-\x55\x8b\x7d\x84\x7c\xdc\x57\x57\xf1\x03\x41\x5d\x33\x50\x0d\x18\
-\xc2\x9a\xe3\xe3\x72\x38\xe0\xd6\x73\x8d\x99\xd3\x09\x5d\x16\xcc\
-\x90\x81\xb5\x07\x35\x52\x40\xdb\xbe\xed\x5a\x40\x31\x9d\xb4\xe9\
-\x10\xb8\x18\xc5\x42\xd0\xd6\xe5\x32\xbf\xec\x1a\x7f\x95\xed\x56\
-\xb6\x3a\x81\xc6\x69\xdf\x3f\xf7\x07\xe5\x4a\xe3\x3d\x9c\x29\x15\
-\x53\x50\xbe\x8a\xc2\xdd\xa4\x99\xc0\x00\x67\x93\x49\xac\x6b\x36\
-\xfa\x55\xb3\x3c\xae\x01\x02\xbc\x87\xc4\xbe\x27\xb8\xd6\x27\x64\
-\x56\x2b\x08\x3c\x0c\xf5\xac\xe1\x06\xd9\x84\xa5\x62\x4f\x14\xf8\
-\xb2\x5d\x52\x76\x86\xdd\x8a\xc2\x0e\x33\xfd\xea\xe5\x4b\x66\x94\
-\x9c\xb6\x4d\x46\xe7\x26\xbb\x23\x1b\x1c\xed\xdd\x8d\x63\x9a\x4c\
-\xd3\x80\xf5\xa5\x28\x38\xc5\x59\x23\x01\xa5\xdd\x4e\x23\x14\xd0\
-\x28\x00\x06\x9e\x09\xef\x4d\x03\x34\xe1\xd6\x98\x0e\x14\xf0\x70\
-\x29\x94\xf1\x4c\x43\xc0\xcd\x4a\xa9\xed\x4c\x43\xcd\x5b\x50\x36\
-\xd3\x11\x18\x4a\x71\x18\xa7\xb3\x05\x15\x1e\x72\x68\x01\xcb\x52\
-\xad\x30\x74\xa7\xe7\x6a\xe6\x90\x04\xb2\x84\x5e\xbd\x2b\x3a\x46\
-\x2e\xc4\x9a\x96\x67\xde\xde\xc2\x98\x22\x67\xe8\x09\xa8\x6c\xb4\
-\x87\x5b\x4a\x88\xe0\xb5\x68\x9d\x42\x3c\x60\x01\x59\x5f\xd9\xf3\
-\x93\x90\x0d\x3c\x59\x4e\xbd\x8d\x2b\x8e\xc5\x9b\xdb\x94\x92\xce\
-\x60\x14\x73\x1b\x63\xf2\xaf\xb4\x2b\xe2\x66\xb6\x99\xa3\x74\x23\
-\x1b\x94\x8c\xfa\x57\xa9\xaf\xc7\x5f\x18\x9e\xb6\x9a\x20\xff\x00\
-\xb7\x59\xbf\xf8\xf5\x02\xb1\xf4\x35\x63\xea\xda\x4d\xf5\xce\xa5\
-\x6d\xa8\xe8\xfa\x84\x36\x77\x70\xc4\xf0\xb0\xb9\xb6\x33\xc5\x24\
-\x6c\x54\xf2\xa1\xd0\x86\x05\x06\x08\x6e\xed\x90\x72\x31\xe3\x29\
-\xf1\xb3\xc5\xee\x3f\xd4\xe8\x63\xfe\xdd\x26\xff\x00\xe3\xd4\xad\
-\xf1\xab\xc6\x00\x71\x06\x86\x7f\xed\xd2\x6f\xfe\x3d\x4a\xe8\x76\
-\x67\xa8\x41\xe0\x44\x82\xdb\x50\x8f\xfb\x41\x9e\x4b\xf8\x22\x49\
-\x66\x78\x46\xed\xeb\x34\xb3\x3b\xf0\x7f\x89\xa6\x6f\x97\x8c\x7b\
-\xd6\x36\x85\xe1\x5d\x61\xf5\xcb\xa3\xa8\x5a\xbd\x9d\xb0\xbb\x17\
-\x49\x34\xcf\xe6\x12\x52\xe7\xcd\x09\x1e\x2e\x1d\x42\xb0\xdd\x92\
-\x23\x87\x07\x6f\xca\x7a\x0e\x09\xbe\x38\x78\xd0\x1e\x2c\xb4\x43\
-\xff\x00\x6e\xb3\x7f\xf1\xda\x41\xf1\xc7\xc6\xc7\xfe\x5c\x34\x4f\
-\xfc\x06\x9b\xff\x00\x8e\xd1\x74\x1c\xac\xf6\x6d\x07\xc3\x03\x43\
-\x86\xcd\x12\xeb\xcc\x36\xda\x72\x58\xee\x58\x82\x96\xda\x49\xdf\
-\xd4\xe3\x39\xe9\xcd\x64\xe9\x1e\x02\xb9\xb1\xd4\x60\xbd\xd4\x75\
-\xa3\x7f\x2c\x57\x31\x4e\x4b\xc7\x2b\x17\xd9\x1c\xc8\x06\x64\x9a\
-\x42\x32\x66\xcf\x18\x51\xb7\x85\x19\xaf\x33\x5f\x8d\x7e\x37\x6e\
-\x96\x3a\x27\xfe\x02\xcd\xff\x00\xc7\x6a\x51\xf1\x93\xc7\x27\xfe\
-\x5c\x74\x4f\xfc\x05\x9b\xff\x00\x8f\x51\xcc\x87\xca\xcf\x47\x3e\
-\x03\xb9\x68\x52\x29\x35\x58\x36\xd9\xc5\xe5\x69\xc5\x6c\x88\x31\
-\x0f\x3e\x39\x81\x94\xf9\x9f\xbd\x3b\xa1\x8f\x38\xd9\x9f\x9b\xb9\
-\xe2\x4f\xf8\x41\xa6\x9e\xdf\x51\xfb\x7e\xa7\x0c\xb7\x3a\x85\x9d\
-\xd5\xb3\xcb\x1d\xa6\xc5\x43\x33\x03\xb9\x54\xb9\x38\x18\x1c\x67\
-\x9c\x75\xaf\x35\x1f\x18\xbc\x72\x7f\xe5\xcb\x44\xff\x00\xc0\x59\
-\xbf\xf8\xf5\x07\xe3\x17\x8e\x47\xfc\xb9\x68\x9f\xf8\x0b\x37\xff\
-\x00\x1e\xa3\x99\x07\x2b\x3d\x57\x4c\xf0\xb5\xcd\x86\xbb\x15\xe4\
-\xba\x8c\x32\xda\xda\x9b\xaf\xb3\x40\xb6\x9b\x24\x5f\x3e\x41\x23\
-\x6f\x93\x79\x0d\x82\x38\xc2\xaf\xbe\x4f\x34\xdb\x6f\x08\x49\x15\
-\xf9\x9a\x6b\xe8\xa5\x85\x26\xbc\x96\x18\xfe\xcd\x86\x4f\xb4\x9d\
-\xcc\x0b\x6f\x20\xe0\x93\x82\x00\xe0\xe3\xde\xbc\xac\xfc\x64\xf1\
-\xc0\xff\x00\x97\x2d\x13\xff\x00\x01\x26\xff\x00\xe3\xd4\xd3\xf1\
-\x9f\xc7\x03\xfe\x5c\x74\x5f\xfc\x05\x9b\xff\x00\x8f\x51\x74\x1c\
-\xac\xf4\xad\x27\xe1\xff\x00\xf6\x57\x88\x2d\x75\x0f\xed\x0f\x3e\
-\x1b\x72\x24\x10\xbf\x9e\x08\x94\x41\xe4\x97\x50\x27\xf2\x86\x57\
-\x3d\x63\x27\x04\x8c\xf7\x10\x4d\xe0\x8b\xdd\x66\x4d\x4e\x1d\x56\
-\xee\x3b\x7d\x3e\x6b\xbb\x99\xa0\x8a\x28\x3f\x7a\x4c\x90\xb4\x5b\
-\xcc\x81\xf1\xb7\x6b\xb7\xcb\xb4\x1c\x81\xcf\x6a\xf3\xa3\xf1\xa7\
-\xc7\x03\xfe\x5c\x34\x4f\xfc\x05\x9b\xff\x00\x8e\xd3\x4f\xc6\xcf\
-\x1c\x0f\xf9\x87\xe8\xbf\xf8\x0b\x37\xff\x00\x1d\xa2\xe8\x56\x67\
-\xa9\xe8\x9e\x07\x7d\x2e\xf9\x2f\x2e\xaf\x92\xe6\xe0\x19\xcb\xb8\
-\x49\xd8\xc8\x64\x48\xd0\x12\x66\x9a\x56\xc8\x11\x63\xae\x08\x20\
-\x60\x63\x97\x69\x7e\x06\x8f\x4e\xb6\xb6\x89\xee\xd6\x73\x04\xd6\
-\x92\xee\x36\xe0\x64\xc1\x02\xc4\x3f\x88\xe3\x25\x77\x7b\x67\x1c\
-\xf5\xaf\x28\xff\x00\x85\xdd\xe3\x9f\xfa\x07\xe8\x9f\xf8\x0d\x37\
-\xff\x00\x1d\xa3\xfe\x17\x6f\x8e\x71\xff\x00\x20\xed\x17\xff\x00\
-\x01\xa6\xff\x00\xe3\xb4\x5d\x05\x99\xe9\xb1\xfc\x3b\x11\x6b\x36\
-\x97\x89\xa8\x87\x86\x29\x22\x92\x58\x1c\x4e\x03\xb4\x72\x17\x42\
-\x02\x4e\xa9\xc1\x23\xef\xa3\xf2\x33\xed\x50\x27\xc3\x69\x83\x69\
-\xde\x6e\xad\x1c\xa9\x67\x6f\x0d\xa3\xa7\x95\x71\x1a\xcb\x0c\x2e\
-\x5a\x3c\xac\x77\x0a\x0b\xfc\xc7\x25\x83\x0c\x80\x42\xaf\x20\xf9\
-\xcf\xfc\x2e\xef\x1c\xff\x00\xd0\x3b\x44\xff\x00\xc0\x69\xbf\xf8\
-\xed\x27\xfc\x2e\xef\x1c\xff\x00\xd0\x3b\x44\xff\x00\xc0\x69\xbf\
-\xf8\xed\x17\x41\x66\x7b\xa6\x89\xa5\x8d\x17\x47\x86\xc1\x64\x12\
-\x08\x8b\x1d\xe1\x36\xe4\xb3\x16\x3c\x64\xfa\xd6\x85\x7c\xf6\x7e\
-\x37\x78\xe8\x7f\xcc\x37\x44\xff\x00\xc0\x69\xbf\xf8\xed\x03\xe3\
-\x77\x8e\x8f\xfc\xc3\x74\x5f\xfc\x06\x9b\xff\x00\x8e\xd1\x74\x16\
-\x67\xd0\x95\xf0\xdd\xb4\xd2\x45\x1c\x66\x36\x23\x0a\x2b\xd8\x3f\
-\xe1\x77\xf8\xeb\xfe\x81\xba\x2f\xfe\x03\x4d\xff\x00\xc7\x6b\xcc\
-\x20\xd0\xae\x76\xaa\xed\x3c\x0c\x74\xa2\xe8\x76\x67\x5b\xe1\x29\
-\xae\x2e\x10\x19\x5b\x22\xba\xf0\xbc\x57\x29\xe1\xe8\x26\xb3\x40\
-\xac\xa4\x76\xe9\x5d\x5c\x44\x95\x15\xcd\x3d\xcd\xe3\xb1\xa5\xa2\
-\xae\x35\x04\xe2\xbd\x32\xd9\xbf\xd1\xd7\xe9\x5e\x6d\xa3\x67\xfb\
-\x41\x2b\xd2\x2d\xbf\xe3\xdd\x7e\x95\xbd\x1d\x8c\x2b\x6e\x71\x3e\
-\x3f\xd0\x7f\xb4\x6c\xd9\x95\x32\x7a\xe7\x15\xe2\x17\x16\x46\x09\
-\xde\x36\x52\x0a\x9c\x57\xd2\xfa\xda\xee\xb0\x71\xed\x5e\x0b\xae\
-\x5b\x88\xef\xa5\xeb\xf7\x8d\x6b\x25\x71\x53\x97\x43\x9f\xda\x47\
-\x1b\x8d\x3c\x83\xb7\x86\xe6\xa6\xd9\x93\xc7\x34\xe1\x1f\x18\xda\
-\x3f\x1a\xe7\x7a\x1d\x6b\x54\x36\x37\x90\xaf\xde\x1f\x8d\x4d\xe6\
-\x37\xa8\xa8\xbc\xb0\xa3\x95\xfc\xa9\x38\xfe\xe3\x54\x1a\x22\xbf\
-\x88\xf5\xe9\xf5\x9b\xe7\x76\x24\x44\x0f\xca\xb9\xae\x7d\xb3\x9a\
-\xd7\x68\x10\xfd\x6a\x33\x68\x87\xb5\x74\xa4\x91\xe7\xde\xe6\x57\
-\x38\xa6\x91\x5a\xdf\x63\x42\x3b\x03\x4d\x36\x49\x54\x23\x27\x24\
-\x52\xaf\x2c\x2b\x48\xe9\xea\x4f\x14\x7f\x67\x81\xde\x80\x2c\x43\
-\xa4\xc7\x25\xa8\x94\xb0\xe6\xa4\x8b\x40\x59\xe3\x26\x37\xc7\xa5\
-\x40\x23\x9d\x53\x6a\xb9\x02\x9f\x1b\x5d\x41\xf7\x25\x60\x3d\x28\
-\x5b\x97\x29\x26\xb4\x42\xbf\x87\x26\x4c\x61\x86\x2a\x09\x74\x69\
-\xa2\x5d\xd9\x06\xae\xb5\xfd\xe9\x03\xf7\x9d\x3b\x62\xa3\x96\xee\
-\xee\x45\x2a\xcc\x31\xf4\xaa\x32\xd4\xc9\xdb\x86\x20\xd3\x80\x15\
-\x37\xd9\x9f\xbd\x2f\x90\xdf\x5a\x43\x22\x03\x15\x20\x62\x07\x5a\
-\x77\x96\x47\x6a\x42\x84\x1a\x62\x00\x73\xd6\x9c\x0f\x34\x80\x1a\
-\x72\x8a\x00\x91\x79\xeb\x51\xcf\x2e\x7e\x51\x44\x92\x6d\x18\xef\
-\x51\x00\x58\xd4\x49\x96\x90\xb1\xc7\xbc\xd6\xbd\xad\xb0\x0a\x32\
-\x2a\x3b\x2b\x5e\x84\xd6\xac\x50\xe3\xb5\x73\xca\x46\xd1\x88\x47\
-\x02\x0e\xa2\xa5\xf2\x63\xfe\xee\x69\xea\x95\x2a\xc6\x08\xac\xf9\
-\x99\xaf\x2a\x2a\x1b\x68\xcf\xf0\x0a\x3e\xc9\x1f\xf7\x2a\xf2\xc5\
-\xcd\x49\xe5\x52\xe6\x61\xca\x50\x5b\x48\xff\x00\xbb\x52\x0b\x54\
-\x1f\xc2\x2a\xea\x41\xb8\xe0\x0a\xbb\x6d\xa5\x49\x2b\x0e\x0d\x2e\
-\x61\xf2\x99\x0b\x67\xb8\xf0\xbf\xa5\x68\x5a\xe8\x86\x72\x3e\x4f\
-\xd2\xba\x4b\x4d\x03\x00\x16\x15\xb3\x6b\x66\x90\xe0\x05\xa5\xcc\
-\x3b\x1c\xf5\xaf\x86\x54\x28\x2c\x95\x77\xfe\x11\xf8\xc7\xf0\x0f\
-\xca\xba\x68\xe1\xe3\x81\x52\x79\x3e\xd5\x3c\xcc\x2c\x8e\x69\x74\
-\x08\xf1\xca\x8f\xca\x94\xe8\x31\x77\x51\xf9\x57\x45\xe5\x11\xda\
-\xb9\x2f\x14\x78\xd6\x2f\x0e\xea\xd6\x9a\x7c\x56\x2d\x7b\x2c\xcc\
-\x82\x62\xb2\x6c\x10\x07\x6c\x29\x27\x07\x24\xf3\xc7\x1d\x2a\x95\
-\xde\x88\x4e\xcb\x72\x73\xa0\x44\x7f\x84\x53\x4f\x87\xe1\xfe\xe8\
-\xfc\xaa\xff\x00\x8a\x75\x71\xe1\xaf\x0d\x5d\x6a\xcd\x6d\xf6\x91\
-\x6f\xb3\xf7\x5b\xf6\x6e\xdc\xe1\x7a\xe0\xe3\xef\x7a\x55\x6f\x0c\
-\x6b\x57\x3e\x21\xb5\x9a\xe2\xe6\xc2\x0b\x45\x8d\xc2\xa1\x82\xfe\
-\x3b\xa5\x7f\x5e\x53\x81\x8f\x4a\x3d\xeb\x5c\x5a\x5e\xc5\x73\xe1\
-\xe8\x0f\xf0\x0f\xca\x98\xde\x1f\x80\x7f\x00\xfc\xab\xa6\xf2\x71\
-\xd6\x98\x61\x07\xa7\x35\x4b\x9a\xd7\x0d\x0e\x5c\xe8\x56\xe3\xf8\
-\x07\xe5\x47\xf6\x25\xb8\x5f\xb8\x3f\x2a\xe9\x4d\xb0\x34\xc7\xb5\
-\x18\xa5\xcc\xc7\xa1\xcd\x1d\x1e\xdc\x7f\xcb\x31\xf9\x52\x0d\x26\
-\xdc\x7f\xcb\x31\x5d\x03\x5a\xe0\xf3\x51\xb5\xb7\xb5\x1c\xcc\x2c\
-\x8c\x33\xa5\x5b\xff\x00\xcf\x31\xf9\x53\xbf\xb2\xad\xbf\xe7\x98\
-\xad\x9f\xb3\x0a\x43\x6e\x29\x73\x31\xd9\x18\xa7\x4a\xb7\x1f\xf2\
-\xcc\x7e\x54\x2e\x9b\x02\x9f\xf5\x63\xf2\xad\x76\xb7\xa6\xfd\x9a\
-\x8e\x66\x16\x2a\x47\x67\x1a\xaf\xca\xa2\x9c\x61\xc7\x41\x56\x84\
-\x65\x68\x2a\x68\xb8\xac\x58\xd2\x23\x1f\x6d\x4a\xf4\x1b\x71\xfb\
-\x85\xfa\x57\x0b\xa4\xaf\xfa\x6a\x57\xa0\xdb\xa7\xee\x17\xe9\x5d\
-\x74\x76\x39\xab\x6e\x54\xbd\x83\xcf\x85\x97\x1d\x45\x79\x27\x8d\
-\x7c\x3b\x34\x45\xe5\x89\x49\x19\xe7\x02\xbd\xa1\x96\xb3\x75\x2d\
-\x2e\x2b\xd8\x4a\xb2\x8c\x9a\xe9\x30\x4e\xcc\xf9\x89\xc4\xb0\x4c\
-\x43\xe4\x0a\x7f\x98\x3a\xe4\xd7\xaa\x78\x83\xc0\x3e\x61\x67\x85\
-\x3f\x21\x5c\x25\xef\x85\xaf\x2d\x58\x82\xa7\x03\xda\xb0\x94\x19\
-\xd5\x19\xa3\x17\x7e\x7a\x31\x14\xbb\x9b\xfb\xf4\xe7\xb1\x9a\x29\
-\x3e\x6f\xca\x9d\xe5\xbf\xf7\x45\x67\xca\x6e\x99\x47\xad\x34\x9f\
-\x4a\x5c\xe3\xad\x19\x15\xb1\xc0\x20\xe3\xad\x1c\x51\xcd\x06\x80\
-\x1d\xc5\x14\x01\xde\x90\xd3\x01\x78\xc7\x34\x66\x8c\xd2\x75\xed\
-\x40\x0a\x7d\xa9\x33\x49\xf5\xa2\x98\x0e\xc0\x22\x97\x02\x9a\x0d\
-\x38\x73\x40\x84\x2a\xa7\xa8\xa4\xd8\xa7\xb5\x3c\x29\x38\xa9\x16\
-\x22\x68\x02\x0f\x29\x2a\x09\x8a\xa0\xf7\xab\x37\x04\x44\xbd\x79\
-\xac\xd7\x72\xec\x73\x52\xd9\x49\x08\x72\xcd\x57\xec\x6c\xcc\x8c\
-\x09\x1c\x55\x6b\x78\x8c\x92\x01\x8a\xe8\x6d\x22\xf2\xd4\x0c\x56\
-\x12\x91\xb4\x63\x72\x48\x6d\x36\xad\x59\x11\xf1\x4a\x0e\x46\x29\
-\xf8\xae\x76\xcd\xd2\x10\x25\x48\xab\xe9\x42\x8c\xf6\xab\xd6\xd6\
-\x8f\x2b\x0c\x0a\x45\x15\x91\x09\xe9\xcd\x5c\xb7\xb0\x96\x66\x18\
-\x1d\x6b\x72\xc3\x41\x2e\x41\x65\xc5\x74\xb6\x7a\x5c\x50\x28\xf9\
-\x41\x34\xae\x07\x3d\x61\xa0\x31\xc1\x75\xad\xeb\x6d\x35\x21\x03\
-\x0b\xcd\x43\xe2\xbb\x5b\xfb\xaf\x0a\xdf\xda\xe8\x0e\xe9\xa9\x34\
-\x63\xc9\xf2\xa5\x11\xb8\x3b\x87\x46\xc8\xc7\x19\xe7\x35\x85\xf0\
-\xea\x6b\x98\x75\x2d\x53\x4a\xd6\x3f\xb6\x13\x51\x85\x22\x91\xe3\
-\xd4\xaf\xd6\xed\x42\x9c\xe0\xa3\x00\x31\x9c\xf2\x39\xe8\x39\xe2\
-\xaf\x91\xda\xe4\x73\x6b\x63\xaf\x10\xfb\x50\x2d\xbe\x6c\xe2\xbc\
-\xeb\xc7\x90\x6b\xf6\x3e\x24\xbd\xd5\xa5\x3a\xe7\xf6\x04\x71\xc4\
-\x43\xe9\x9a\xa2\xc1\xe5\x70\x03\x9f\x2c\x82\x5b\x9f\x61\xf5\xf4\
-\xf4\x36\xd7\xb4\xb8\xad\x92\x69\x6e\xe3\x45\x91\x43\x28\x27\x9c\
-\x11\x9e\x95\x71\xc3\xd4\x9b\xb4\x15\xc8\x95\x58\xc7\x59\x3b\x15\
-\x7c\x48\xfa\x8d\xa7\x85\x75\x09\xb4\x55\x91\xaf\xd2\x12\x60\x11\
-\xc7\xe6\x31\x6f\x65\xc1\xc9\xf6\xc5\x73\xbf\x0f\xb5\xcd\x47\x52\
-\xbc\xbe\xb3\xd6\xf5\x4b\xd9\xef\xa2\x8d\x1c\xd9\xde\xe9\x89\x68\
-\xf1\x0e\xec\x36\x93\xb8\x1c\x81\xce\x3e\x9c\xd6\xae\xaf\xe2\x1b\
-\x6d\x53\x47\xb9\xb6\xd2\x2e\xe6\x82\xe0\x81\xe5\xcf\x11\x0a\xca\
-\xd9\xc8\xc0\x3d\x47\x18\x23\xd2\xb8\x6b\x0d\x5f\x53\xd2\x75\xcb\
-\xcd\x46\xef\x50\xfe\xd2\xd4\xa7\x89\x60\x6b\x89\x22\x54\x0a\x83\
-\x9d\xa1\x17\x81\xcd\x7a\xd4\x32\x5c\x55\x55\x6e\x5b\x7a\x9c\x55\
-\x33\x0a\x10\x77\xbd\xfd\x0f\x5e\xc7\xad\x79\x2f\x8a\xbc\x19\xac\
-\xcb\xaa\x4e\xda\x4e\xb8\xb7\x6d\x7d\xa9\xa5\xcc\x96\xe6\xda\x30\
-\xd0\xe3\xee\x13\x23\x36\x58\x22\xf0\x17\x80\x7d\x2a\x49\xbc\x47\
-\xaa\xdd\x48\x1a\x6b\xd7\x55\xcf\x45\x38\x1f\xa5\x76\x76\x1a\x74\
-\xa3\xc3\x6b\x74\x72\xf7\x0c\xe2\x7e\x4f\x24\x03\xfe\x15\xd7\x53\
-\x27\x8e\x0e\x0a\x55\xa5\x76\xf4\x56\xee\x63\x4f\x1c\xf1\x32\x6a\
-\x9c\x74\x46\x1e\xb9\xe2\xd9\x12\x1d\x47\x4b\xb9\xd1\xed\xef\x8d\
-\xb9\x89\x54\x5c\xba\x98\xef\x7a\x17\x25\x71\xf2\x10\x47\x19\xc8\
-\xcd\x72\xde\x1f\xd6\x2e\x34\xad\x5f\x55\xd4\x2d\x74\xab\x6d\x32\
-\x3b\xff\x00\x2c\x25\x9c\x4d\xb9\x62\xd8\x08\xcf\x18\x19\x39\xec\
-\x05\x5b\xf1\x04\x8b\x37\x88\x2e\x24\x88\xe5\x64\x21\x87\xe2\x2b\
-\x34\xf0\x6b\xdd\xc3\x64\xb8\x58\xc6\x33\x69\xbd\x36\x7b\x1e\x5e\
-\x27\x30\xae\xa4\xe0\x99\xab\x79\xe2\x6d\x4e\xe1\x5b\x75\xcb\x20\
-\xc7\x44\x18\xaa\xba\x46\xb9\x7c\x97\x18\x17\x6e\xa0\x9e\xe7\x22\
-\xb3\xe5\x6c\x46\x4f\xb5\x41\xa6\xc9\xb1\x8b\x60\x13\xdb\x35\xec\
-\x2c\x3d\x25\x07\x15\x15\x6f\x43\x86\x35\x6a\x3b\xce\x52\x77\x3d\
-\x6b\x4e\xbd\xb9\x96\x31\x1c\xf1\x87\xb8\xcf\xcc\x13\xee\xaa\xfa\
-\x93\x5c\xbf\xc4\x6f\x10\xd9\x41\x1d\xbe\x89\x71\x76\xd6\x76\xf7\
-\x85\xbe\xd5\x70\x11\x8e\x23\x51\xca\x2e\xd0\x79\x62\x40\xcf\x40\
-\x33\x9a\xb3\xe1\xbd\x65\x65\xb6\x16\x57\x92\x88\x21\x8c\x16\x66\
-\x5e\x1a\x5f\x6c\xd5\xdf\x16\x24\x83\xc2\x52\x37\x96\x20\x85\xe4\
-\x5d\x91\x77\xc7\xa9\xfa\xd7\xc8\x62\x32\xe8\x4b\x10\xa9\xb5\xca\
-\xdb\xd3\xfa\xfd\x3f\x13\xe8\x69\x62\x9b\xa3\xce\x9d\xec\x8c\xdf\
-\x85\x37\x96\xd7\x5e\x04\xb1\xb6\x89\xf7\xcd\x03\x4a\x92\xae\x0f\
-\xc8\x77\x96\x03\xfe\xf9\x75\x3c\x7a\xd7\x6a\xd6\xd9\xed\x5e\x77\
-\xe1\x9d\x3e\xee\xc2\xce\x01\xa3\xbb\x22\xf3\x88\x90\x96\x21\x73\
-\x92\x79\xf7\x3d\xeb\x6a\xf7\x5d\xd4\x6e\x3c\x3f\x76\x37\x5c\xc3\
-\xb1\x79\x9e\xcd\x01\x98\x00\xc3\x21\x01\xe0\xb1\x19\x1e\xd9\xcf\
-\x6a\xe5\xc5\xe4\xd3\x82\xbc\x24\x9b\x5b\xfa\x97\x43\x30\x8c\xb4\
-\x92\x6b\xb1\xd3\x9b\x5c\x76\xa8\xcd\xb5\x71\xbf\x0e\xf5\xc7\xfe\
-\xd1\xd5\xf4\xfd\x4f\x51\xbf\x2a\x92\x27\xd9\xad\xf5\x76\xff\x00\
-\x49\x88\x60\xe7\x79\x3e\xb9\x18\x1e\xde\xf5\x9b\xe3\x06\xd6\xb4\
-\xdf\x18\x6a\x1a\x9d\xdb\xeb\x47\x42\x8f\xc8\x74\x6d\x3b\x53\x58\
-\x96\x25\xda\xaa\xc4\xc6\x41\xce\x5b\xfd\xde\xfc\xf3\x5e\x2b\xc3\
-\x54\x5a\xb5\xa1\xe8\x7b\x68\xf7\x3d\x01\xe0\xe7\xa5\x33\xca\x35\
-\xac\xb1\xa4\xb1\xab\xa8\xca\xb0\x04\x7d\x29\x0c\x03\xb0\xae\x53\
-\x63\x20\xc2\x7b\x54\x65\x08\xad\x93\x00\xf4\xa8\xde\xd8\x60\xf1\
-\x4e\xe3\x22\xd1\x97\x7e\xa5\x1a\xd7\xa5\x41\x64\x4d\xba\xf1\xda\
-\xbc\xf3\x45\x5d\xba\xdc\x43\x1d\xeb\xd6\xec\x94\x1b\x54\xe3\xb5\
-\x76\xd0\xd8\xe3\xad\xa3\x32\x1a\xc1\xbd\x2a\x26\xb0\x6f\x4a\xe9\
-\x3c\xa0\x7b\x52\x18\x14\xf6\xae\x93\x9e\xe7\x29\x26\x9e\x58\x61\
-\x97\x22\xb2\xaf\x7c\x37\x05\xc2\x9d\xf1\x0e\x7d\xab\xbe\x6b\x55\
-\x3d\xaa\x26\xb2\x43\xda\x81\xa9\x1e\x3f\x7d\xe0\x1b\x79\x99\xb6\
-\xc6\x39\xf6\xac\xbf\xf8\x56\xe9\xff\x00\x3c\xeb\xd9\xe6\xb1\x45\
-\x6e\x94\xcf\xb1\x27\xa5\x23\x5e\x66\x7c\x56\x26\x4f\x5a\x70\x91\
-\x4f\x7a\xcb\x04\x8e\xf4\xa1\x9b\xd6\xb1\xb8\xec\x6a\x87\x5f\x51\
-\x4a\x08\xeb\x9a\xca\xde\xdf\xde\xa5\x13\x3f\xf7\x8d\x3b\x8a\xc6\
-\xa8\x39\x14\x66\xb3\x05\xcb\xf4\xcd\x28\xbb\x71\xd6\x9d\xc2\xc6\
-\x89\x34\x80\xf3\x9a\xa2\x2e\xda\x9c\x2f\x31\xd7\xa5\x17\x15\x8b\
-\xac\xd9\x34\x80\x1a\xaa\xb7\x83\x23\x35\x72\x3b\xb8\x71\xcd\x17\
-\x0b\x0a\xb1\x9a\x9e\x28\x72\x71\x51\x8b\xa8\x8f\x4c\x54\x8b\x71\
-\x18\x39\xcf\xeb\x4e\xe2\xb3\x2e\x1b\x74\x58\xf7\x1a\xa9\x24\x82\
-\x35\x3e\x95\x23\x5c\xab\x2f\xde\xac\xbb\xb9\x8b\xbe\xd5\xa2\xe1\
-\x62\x29\xa4\x69\xe5\xc0\xe7\xb0\xad\x28\xbc\x3f\x34\xb6\xc6\x5e\
-\x46\x06\x7a\x54\xda\x0e\x92\xd7\x13\x2b\xb0\xe3\x35\xd1\xea\x57\
-\x2b\x14\x22\xce\xdb\xfe\x06\x45\x67\x27\x64\x69\x15\x77\x63\x9c\
-\xb1\xb4\x08\x06\x47\x35\xa6\x8b\x80\x00\xa4\x8a\x2c\x0c\x0a\xb7\
-\x0d\xab\x48\x40\x51\x5c\x92\x77\x67\x54\x55\x88\x95\x0d\x5a\x86\
-\xd2\x49\x58\x00\x0d\x6a\xd9\x68\xa4\xae\xf9\xb0\xa8\x3a\xb3\x70\
-\x05\x6c\x43\x36\x8d\x60\xb9\x96\xe5\x1d\x87\x64\xf9\xab\x5a\x58\
-\x7a\xd5\xbf\x87\x16\xc9\xa9\x56\x9d\x35\x79\xb4\x8c\xfb\x0f\x0f\
-\xc9\x26\x0b\x2f\x15\xaf\x79\x6d\x1e\x8d\xa4\x4f\x70\x17\xf7\xab\
-\x13\x98\xf2\x32\x37\x05\x24\x7f\x2a\x86\x6f\x19\xda\xc2\xbb\x6c\
-\xad\x59\xfd\x0b\x9c\x0a\xcb\xba\xf1\x5d\xcd\xf4\x46\x39\xe1\x8c\
-\xa6\xe0\x42\x01\xc7\xe7\x5e\xce\x1b\x23\xc4\xcd\xde\xaa\xb2\x3c\
-\xba\xd9\xb5\x08\xab\x41\xdd\x98\x7e\x02\xb8\xb6\xb0\xd6\xb4\x99\
-\xb5\x2d\x22\x78\xaf\x35\x68\x64\x31\xea\x92\x5f\xf9\xbf\x68\x20\
-\x6e\x6d\xd1\x83\xf2\x8e\xc3\x3c\xfe\xb5\xea\x13\xeb\x7a\x6d\xa2\
-\x93\x2d\xdc\x7c\x76\x53\x93\xfa\x57\x96\xea\xba\x46\x89\x64\xd6\
-\xd7\xfa\x26\x9c\x2c\xda\x4d\xc9\x23\x86\x62\x0b\x63\xb0\x24\xed\
-\xfc\x2a\x24\x90\xb4\x63\x8e\x7d\x6b\xd2\xc3\x70\xfc\x2a\x45\x4e\
-\xb4\x9d\xfb\x23\x92\xbe\x69\x2a\x7a\x53\x57\xf3\x3a\xbf\x11\xeb\
-\xba\x66\xa8\x3c\xb8\x85\xce\x19\x76\x48\xd1\x39\x8d\x88\x0c\x19\
-\x48\x61\xc8\x21\x80\x20\xd6\x36\x91\x60\xcf\x1d\xf4\x16\x77\xd7\
-\x51\x5c\x6a\x01\x56\x7b\xf9\xee\x8b\x5c\x10\xbd\x00\x7e\xdf\x80\
-\xac\xfe\x59\xbe\x63\xcf\xad\x5f\xb3\x9a\x14\xba\x0b\x70\x8b\x3a\
-\xb7\xcb\xd7\x6e\x3f\x1a\xf6\x3f\xb3\x30\xd0\x86\x91\xbb\x4b\xae\
-\xa7\x97\xf5\xfa\xf3\x9f\xbd\x2d\x3e\xe3\x03\x50\xb4\x7d\x46\xe2\
-\x51\x77\x7d\x7b\x22\x33\x01\x2c\x5f\x68\x3e\x5c\xc5\x70\xa0\xb0\
-\xee\x70\xa3\x9f\x6a\xb6\x08\x00\x63\xb7\x18\xa6\xca\xbb\x6f\x66\
-\x51\x82\x16\x46\x03\x07\x23\x19\xa7\x05\x27\xa7\x5a\xf4\xe9\xd0\
-\xa5\x4e\xf2\x84\x6d\x73\x0a\xf5\x27\x27\x69\x3d\x87\xab\xfc\xdc\
-\x67\x8e\x9c\xd4\x73\x9f\xf4\xa2\x46\x3e\x60\x09\xc5\x59\xb3\x80\
-\x4b\x32\xac\x8d\xb1\x49\xc6\xec\x74\xa4\xd5\xad\xd6\xdf\x50\x58\
-\xe3\x65\x65\x31\xa9\xdc\xbd\xf9\xef\x5a\x29\x2e\x6e\x52\x29\xc5\
-\xb4\xd9\x2d\xa8\x2c\xeb\x6e\xa9\xb9\xdd\x80\x18\xeb\x5e\xbd\xa4\
-\xec\x6d\x1a\x04\x55\xc6\xc4\xd8\xca\x7b\x11\xc1\x15\xe6\xbe\x14\
-\xb7\x37\x7a\xfd\xaa\x3a\xe3\xc9\x7c\xb3\xf7\xf5\x02\xbd\x11\x25\
-\x16\x5a\xc4\x90\x13\xfb\xbb\xaf\xde\x27\xb3\x0e\xa2\xbe\x4b\x3f\
-\x9f\xb4\x94\x68\xad\xd2\xb9\xf4\x39\x5c\x39\x20\xe7\xdf\x43\xca\
-\xfc\x4f\x6a\x96\x3e\x28\xbb\x86\x33\xf2\x86\x0c\x07\xa0\x23\x38\
-\xac\xcc\xe6\xb6\xfc\x71\x81\xe2\xe9\xca\xf3\xb9\x54\xfe\x95\x86\
-\x3d\xab\xe9\x70\xb2\x72\xc3\xd3\x6f\x7b\x23\xc6\xc6\x24\xab\x4a\
-\xc4\x53\x9f\xdd\x9a\x83\x4d\x03\x7b\x64\x13\xdb\x8a\x9a\x71\xf2\
-\x9a\xb7\xe1\x8b\xab\x58\x6e\x1a\x3b\xd8\x83\x44\xed\x9c\x81\xf3\
-\x67\xd0\x7a\x56\x93\x9b\x8c\x5b\x4a\xe4\xd1\x8a\x92\xb3\x76\x37\
-\x74\x8b\x46\x84\xc5\x24\xc8\x02\xab\x6f\x59\x7b\x0c\x73\x82\x3b\
-\x9a\xd7\xf1\x45\xcc\xd7\x9e\x10\x17\x52\xbf\xfa\xc9\x86\xd8\xc7\
-\x45\x1f\xe3\x5b\x56\xf6\x6b\x1e\xd8\xa2\x2a\xb2\xca\xbf\x3e\xc0\
-\x31\x0c\x7d\xff\x00\x13\xeb\x58\xde\x2a\x82\x28\xbc\x32\xf3\x42\
-\x9e\x5c\x12\x4e\x04\x68\x3d\x07\x19\xfc\x6b\xc1\x8d\x78\xd6\xc4\
-\xc1\xf5\xbf\xf5\xfd\x79\x1e\xba\xa4\xe8\xd2\x92\xe9\x63\x9a\xd2\
-\x6f\x26\xb0\x62\x56\x52\x91\x4b\x85\x97\x07\x04\xae\x7b\x57\x4d\
-\x77\xa6\xae\xb1\xa0\x25\x83\x09\x16\x27\x5f\x3a\x24\xb6\x6d\xb2\
-\x47\xce\x55\xcb\xf6\xae\x63\x47\xb6\x5b\xcb\xb4\x86\x47\x01\x58\
-\xf2\xcd\xda\xbb\x3d\x32\xc6\x68\xef\x12\xc9\x65\x2d\x6d\x37\xef\
-\x1f\x23\x0f\xe5\x8e\x9f\x40\x4f\x6a\xe9\xcc\x7d\x9a\x4d\xbf\x53\
-\x93\x04\xa6\xf4\xe8\x79\xee\xb1\xe1\xcb\x7b\x1d\x62\x68\x53\x50\
-\xbe\x9a\x49\x82\x19\x6f\x24\xb8\xdf\x33\x63\x1f\xc5\x8f\xc2\xb7\
-\xa1\xf0\x6e\x9f\xae\x34\x6c\x6f\x2f\x7f\xd2\x08\x96\xea\xd5\x6e\
-\x0f\xd9\xc2\xa9\xe0\xba\xf7\x3c\x0e\xf5\x0f\x8a\xb6\x8f\x17\x5c\
-\x04\xc0\x55\xda\x00\xec\x38\x15\xbd\xa5\x46\x2f\x2d\x63\x82\xda\
-\x52\x92\x4c\x0a\xc8\x03\x1f\xdd\x44\x3a\xee\xf5\xce\x6b\x3a\xd4\
-\x29\xfd\x52\x9b\x4a\xda\x2f\xf3\xd7\xef\x35\x85\x49\x7d\x66\x48\
-\xd8\xbf\xb9\x1a\x8e\x81\x7b\x85\x68\xec\x9a\x22\x91\xc8\xb3\x88\
-\x1a\x66\xe8\x15\x5b\xf8\x41\x3f\x2e\x7d\xeb\x8c\xf8\x61\x73\x69\
-\x67\xe2\xcd\x6a\xc9\xa1\x7d\x25\x9e\x34\x78\xf4\xd6\xb9\xf3\xd1\
-\x40\xe1\x9b\xcc\x27\x96\x24\xf4\xf7\xfc\xbb\x36\xb7\x83\x5e\xb1\
-\x75\xbe\x81\x3f\xb2\x91\x1a\x38\xed\xd8\x71\x26\x38\xdc\x7d\xb8\
-\xe3\xf3\xaf\x2d\xb2\xd2\x6c\xec\x2f\x26\x4d\x3a\xdc\x44\x0b\x63\
-\x96\x24\xe3\xd3\x26\xbc\x4a\x19\x54\x71\x73\x94\x57\xba\x96\xff\
-\x00\xd7\x57\xdf\x55\x63\xbe\xb6\x31\xd0\x8a\x93\xd4\xf6\xbb\x49\
-\xfe\xd7\x1b\xca\xa0\x04\xde\x55\x08\xfe\x20\x3b\xd4\x8e\xb8\x5a\
-\xe0\xac\xe4\xbe\xbb\xd1\xde\xce\xcf\x52\x97\x4f\x91\x97\xe6\x9c\
-\x30\xc4\x31\x82\x0b\x49\x93\xd0\x91\x90\x3d\x3a\xd3\x3c\x05\x7d\
-\xa8\x3d\xee\xb1\x10\xbf\xbc\xd5\x34\x64\x99\x56\xca\xf2\xf6\x4d\
-\xee\xd8\x07\x79\x07\x1f\x30\x27\x18\xed\xc5\x79\x98\xdc\xba\x54\
-\xab\x38\xc3\x63\xaf\x0d\x8b\x55\x29\xa9\x33\xba\xd3\x78\xd6\x23\
-\x23\xd6\xbd\x52\xc4\xb1\xb5\x5f\xa5\x7c\x9d\xaf\xea\x5a\x8d\x9f\
-\x8c\x6f\x75\x6b\x8b\x8d\x67\xfb\x16\x27\x85\x94\xe9\xba\x9a\xc3\
-\xe5\xa8\x55\x0d\xfb\xa2\x09\x6c\xb7\xd3\xbf\x3c\xf1\xf4\x75\x96\
-\xb9\x28\xf1\x45\xad\x9a\x49\xfe\x8b\x25\x81\x98\x29\x03\x93\xb8\
-\x60\xfa\xf4\x35\x14\xf0\xf5\x29\xde\x32\x56\x6b\x50\xab\x56\x32\
-\xd6\x2e\xe7\x5a\x18\x8a\x70\x92\xa0\x5b\x95\x61\xcd\x3b\x70\x3c\
-\x8a\x57\x33\xb1\x38\x61\x4b\xc1\xaa\xf9\xa7\x06\xa5\x74\x16\x12\
-\xe1\x01\xe6\xa0\xda\x2a\x59\x5b\x2b\x55\xb7\x53\xe6\x35\x8a\xd0\
-\xf8\xfa\x5f\x87\x97\xc9\x9d\xad\x9f\xc2\xaa\x49\xe0\x7d\x49\x3e\
-\xea\xe7\xf0\xaf\x4a\xfe\xd8\x97\xba\x8a\x5f\xed\x76\xee\x82\xb6\
-\xfe\xcf\xc4\x0b\xeb\x34\x4f\x2a\x93\xc2\x7a\xa4\x67\xfd\x4e\x6a\
-\xb3\xf8\x7f\x52\x4e\xb6\xed\x5e\xbe\x35\x45\x6f\xbf\x08\xab\xb6\
-\x32\x5a\x5e\x36\xd7\x89\x41\xfa\x56\x35\x70\xf5\xa9\x47\x9a\x48\
-\xb8\x54\xa7\x37\x64\xcf\x0c\x6d\x2a\xf5\x3e\xf5\xbb\xfe\x55\x13\
-\x59\xdc\x2f\xde\x85\xff\x00\x2a\xfa\x1d\xb4\x4b\x37\xeb\x0a\xfe\
-\x55\x03\xf8\x66\xc1\xfa\xc2\x3f\x2a\xe2\xf6\xc7\x47\xb3\x47\xcf\
-\x66\x27\x5e\xa8\xc3\xea\x29\x08\xf5\x15\xef\x72\xf8\x37\x4e\x7e\
-\xb1\x81\xf8\x55\x39\x7c\x05\xa7\xc8\x38\x8d\x7f\x2a\x3d\xb2\x17\
-\xb3\x3c\x3e\xad\x5b\xdb\x3d\xc0\xfd\xdf\x26\xbd\x5a\x6f\x86\xf6\
-\x6c\x4e\x15\x6a\x04\xf8\x7e\x2d\x98\xf9\x15\x5e\xd6\x22\xf6\x6c\
-\xf3\x56\xb1\xb8\x5f\xe0\xa6\x1b\x79\x87\x54\x6a\xf4\x99\x7c\x17\
-\x77\x9f\x96\xaa\xc9\xe1\x0b\xe4\xcf\xee\xc9\xfc\x2a\xd5\x48\xf7\
-\x27\x91\x9e\x7d\xb2\x55\xea\xac\x3f\x0a\xb9\xa7\x58\x3d\xdd\xc2\
-\x82\x0e\x33\x5d\x6f\xfc\x23\x77\x88\xdf\x34\x27\xf2\xab\xf6\xba\
-\x5c\x96\xe3\x22\x02\x5f\xb7\x15\x7c\xd1\xee\x4f\x2b\x20\xc2\x69\
-\x76\x21\x23\x1f\xbd\x61\xc7\xb5\x67\xc7\x0b\x3b\x64\xf2\xcd\xc9\
-\xad\xd8\xf4\x3b\xcb\xcb\x8d\xf2\xa9\x19\xf6\xae\x93\x4d\xf0\x98\
-\x5c\x34\xa2\xb9\x67\x3b\xb3\x78\x46\xc7\x2d\x63\xa2\xcb\x3b\x0f\
-\x94\xe0\xd7\x5b\xa6\xf8\x69\x22\x01\xa4\x1f\xa5\x74\x16\xda\x64\
-\x56\xea\x02\x28\xab\x8b\x0e\x2b\x33\x43\x1f\x51\xd3\x91\xf4\x3b\
-\xb8\x51\x40\x2d\x0b\x01\xc7\x7c\x57\x90\xc5\x70\xc1\x7e\x6e\x7d\
-\x6b\xde\x1a\x20\xc8\xc0\xf4\x23\x15\xe1\xb3\x58\x95\xb8\xba\x8e\
-\x36\x05\xe0\x95\x94\xa0\xea\x40\x3d\x6b\xed\xb8\x66\xa7\xb9\x52\
-\x0f\xc9\x9e\x0e\x6d\x04\xd4\x5b\x39\x3d\x4a\x61\x71\xab\x5e\xcb\
-\x75\x68\xf7\x70\x5a\x85\xc0\x17\x1e\x58\x88\x63\x39\x03\xa9\x39\
-\xae\x87\x52\x88\xea\x1a\x1c\x91\xc4\xeb\x1f\xda\x11\x76\xb4\x87\
-\x03\x92\x31\x9f\xe5\x55\x2e\x34\xab\x2b\xa9\xc4\xd3\xdb\xab\xc8\
-\x3b\x92\x79\xfa\x8e\xf4\xf5\xb7\xb6\x92\x7b\xa1\x3d\xba\xb7\x9c\
-\x15\x65\x07\x3f\x30\x5e\x9c\x76\xc7\xb5\x7b\x70\xc1\xd5\x8b\xa9\
-\x7b\x35\x2b\xfa\xf5\xf2\xf3\x4b\x77\xdd\x3e\x87\x93\x52\x50\x6a\
-\x0e\x37\x5c\xbf\xf0\x3c\xfe\x7f\xd5\xca\x7a\x4c\x26\xc6\x4b\xcb\
-\x16\xb5\x82\x39\x23\x68\xdd\xe5\xb7\x77\x60\x47\x38\x07\x71\x38\
-\xea\x7d\x2b\x72\x0f\xb9\xcd\x3a\x1b\x5d\x1a\xdb\x43\x9a\x1b\x0b\
-\x4f\xb3\x5d\x96\x52\x0a\xb1\x6f\x30\x0e\xa0\x93\x93\x55\x27\x6b\
-\xcf\xb3\x81\xa7\x88\x3c\xd0\xfc\xf9\xfb\xb1\x8f\xc3\xbf\x4a\xdb\
-\x0d\x09\x50\xc3\xf2\xc9\x6c\xde\x8b\xf4\xda\xe6\x78\x86\xaa\xbb\
-\xa7\xf7\x97\x46\x73\xc5\x4d\x6d\x10\x79\x00\x77\x09\xcf\x06\xb1\
-\xf4\x6b\xfb\xbb\xe8\xe7\x7b\xb5\x80\x08\xe4\x31\xa3\x42\x08\x0d\
-\x8e\xa7\x9a\xd8\xb7\x85\xe4\x60\x42\x31\x5c\xf5\x02\xb6\xa7\x52\
-\x35\x69\xf3\xc7\x66\x71\x4e\x0e\x13\xe5\x65\x7b\xd5\xf2\xb5\x5b\
-\x88\xc9\xc8\x59\x0e\x31\xdf\x8a\x33\x80\x31\xc5\x3f\x54\xd8\x35\
-\x79\x44\x79\xc7\xcb\xd4\x60\xfd\xd1\x48\x30\x06\x2b\x54\xfd\xd4\
-\x5d\x6f\x88\x9a\xda\x39\x5d\x81\x8d\xb6\xe0\xf1\x93\xc6\x6a\x7d\
-\x7a\x3b\x88\x6f\x2d\xc5\xd3\x06\x90\xc2\x09\xe3\xb6\xee\x2a\xce\
-\x96\x24\x7c\x44\xb2\x42\x8a\xed\x90\x64\xc6\x01\x1e\xb5\x5b\xc4\
-\x57\x32\x5d\x6a\x10\xcd\x34\xb1\xbb\x18\xb0\x04\x63\x01\x70\x71\
-\x8a\xc6\xed\xd5\x4b\xa1\xad\x14\x94\x1b\xea\x6b\x78\x6a\x4b\x7b\
-\x1d\x7a\x39\xee\xe7\x58\xd1\xa3\x32\x02\x4e\x07\x4a\xda\xd6\xfc\
-\x49\x69\x73\x2c\x2f\xa7\x37\x9b\x24\x44\xfc\xdd\x17\x07\xde\xb8\
-\x02\x5a\x52\xaa\x32\xdd\x87\x7a\xd9\xd2\xec\x24\x31\x3b\x4f\x13\
-\x6d\x5c\x60\x11\x8e\x4f\x4a\xe0\xaf\x83\xa5\x2a\xeb\x11\x51\xea\
-\x95\x8e\x9a\x58\xaa\xbe\xcf\xd8\xc1\x68\x67\x6b\xce\xcf\xaa\x2b\
-\x3c\x7e\x5b\x18\xc1\x3f\x36\x77\x7b\xd5\x1a\xbb\xae\xc2\x6d\xb5\
-\x41\x6f\x22\xed\x92\x24\x0a\xfc\xe6\xa8\x93\xc5\x7a\x30\xb7\xb3\
-\x56\x39\xab\x5f\x9f\x52\x39\x49\xf2\xd8\x7a\x8f\x4a\xaf\xa7\xff\
-\x00\xac\x3f\x5c\xd5\xd4\xbc\xfb\x2a\xb9\xf2\x63\x90\x95\xc0\xde\
-\x33\x8a\xa3\x63\x26\x25\x66\xf5\x3c\x81\xc5\x25\x7d\x4a\x8a\x5c\
-\x87\xab\x68\xb7\x11\xdd\xe8\x82\x35\x95\x62\x81\x48\x59\xa4\x07\
-\xe7\x91\xbd\x05\x56\xf1\xac\xc6\x5f\x0e\x85\x58\xfc\xa8\x23\x98\
-\x22\x29\x18\x38\x02\xb0\x7c\x2f\xa8\x25\x86\xa0\xb3\x34\x7b\xd7\
-\x18\x55\xcf\x01\x8f\x42\x6b\x7b\xc6\xad\x19\xd0\x01\x12\x79\xd3\
-\x19\x87\x99\x20\x1f\x2f\x4e\x82\xbc\x2f\x61\xec\xb1\xd0\xec\xdd\
-\xcf\x5a\x35\xbd\xa6\x19\xf7\x48\xe5\x6c\xe2\x8d\xa6\x54\x0d\xb4\
-\x01\x9d\xc7\x8c\xd7\x7b\x61\x14\xf2\x84\x88\x3b\x2c\xae\x04\x97\
-\x52\xf4\x28\xbd\x94\x1f\xa5\x71\x3a\x7d\xba\xdc\x98\x63\x47\x02\
-\x42\xc0\x2e\x46\x39\xff\x00\x3d\xeb\xd0\x2d\x22\x02\xc3\xec\x30\
-\x9e\x03\x7f\xa5\xdc\x93\xc1\x3d\xc0\x3d\xcf\x6f\x6a\xbc\xd2\x5a\
-\x25\xfd\x7a\xff\x00\x5d\x4c\x70\x0b\x56\xcf\x3f\xd7\xd6\x23\xe2\
-\xcb\xa0\x39\x40\x40\xc8\xe7\x3c\x56\xb6\x9a\xf1\xc1\x24\x56\xed\
-\x3a\xf9\x13\xa0\x33\x3a\x1f\xba\x83\x9d\xa7\xdc\x9e\xb5\x9b\xab\
-\x22\xc9\xe2\xeb\xc5\x8f\x6b\x65\xb0\xa3\x1f\x90\x02\xb4\x34\x1b\
-\x34\x1a\xb1\xb8\xbb\x1b\x2d\xad\x7f\x79\x2e\xfe\x71\x8e\x99\xfc\
-\x6b\xb6\xa3\x4b\x0c\xaf\xd2\x2b\xf2\x39\xf5\xfa\xcb\xb7\x73\xa4\
-\x91\xbc\xc8\xd5\xae\xa2\x29\x11\x89\xfe\xcd\x6e\x06\x02\xa8\x5f\
-\xbc\xdf\xe7\x8a\xf3\x98\x9c\xf9\x92\x90\xa0\x0f\x30\x9c\xe2\xbd\
-\x32\x60\xf2\xd8\xea\x1a\x9d\xc2\x34\x7e\x64\x05\x61\x46\xea\xa8\
-\x07\x52\x3b\x66\xbc\xca\xda\x33\x36\xe3\x11\x05\x8b\x12\x71\xd8\
-\x7f\x4a\xe5\xca\x9a\x70\x9f\x95\xbf\xaf\xeb\xa9\xbe\x60\x9a\x48\
-\xd8\x87\x43\xb7\xf1\x26\x91\x75\x16\xa3\x70\xf6\x96\x00\xab\x4f\
-\x2c\x4f\x87\xe0\x7c\xa8\x09\x07\xf9\x54\xf6\xfe\x1b\x36\x7a\x45\
-\xc5\xad\x96\xa5\xe2\x0f\xb3\x4f\x10\x09\x2c\xf7\xa0\x34\x01\x4e\
-\x46\xc0\x17\xe5\xce\x30\x7d\xaa\x7d\x06\x2b\x61\x1b\x5c\xdd\x6e\
-\xf2\x2d\x80\x63\x11\xe7\xcd\x94\xfd\xd0\x07\x7e\x3a\x56\xc5\xe3\
-\x4e\xd6\x77\x77\x17\x8c\x63\x2d\x13\x79\x56\xe1\xbe\xe2\xe3\xa9\
-\xc7\x53\x5e\x7e\x36\x31\x96\x27\x55\xd9\x7f\xc3\x77\xde\xed\xec\
-\x8e\x9c\x2d\xd5\x05\x6f\xeb\xfa\xec\x79\x9f\xf6\x05\xb6\xa7\xa9\
-\x3b\xdc\x4b\x70\x63\x66\x05\xe0\x12\x1d\x92\x11\x8e\xaa\x3a\x9e\
-\x3d\xab\xb7\xd3\x35\x4d\x4a\xc7\x51\x69\xac\xae\x26\x8a\x58\xd4\
-\x46\xec\xd8\x7c\x2f\xb9\x3c\x01\xed\x5c\xee\x9c\x59\x66\x73\x90\
-\xa8\x58\xe7\x27\x19\x1e\x9c\x73\xf8\x0a\x76\xaa\x9a\x55\xc6\x99\
-\xe5\x6b\x5e\x70\x41\x2b\x14\xb6\x8d\xd8\x79\xae\x78\x55\x48\xd7\
-\x96\x6f\x42\x4e\x05\x7a\xf8\x8a\x70\xa6\xa5\x25\x14\x79\x2a\x72\
-\x9c\xd4\x5b\x67\xa7\xe9\x5f\x12\x75\x15\x48\xd6\xf6\x18\x27\x67\
-\x62\xab\xb7\x31\x96\xc7\xf1\x16\x3f\x28\x15\xd7\x68\x1f\x10\x74\
-\xed\x5a\xfa\x3b\x25\x8e\x54\xb8\x90\x90\x06\x37\x29\xc7\x3f\x78\
-\x7d\x2b\xc0\x3c\x3b\x6b\x75\xa7\xf8\x72\x1b\x6b\xd0\x44\xe1\x9b\
-\x72\xb9\x2c\xd1\x8c\xf0\x84\x9f\x4f\x6a\xed\xfe\x1e\x45\x24\xbe\
-\x2d\x49\x23\x52\xc6\x18\x5d\xbe\x9d\xbf\xad\x79\x75\xb0\x34\x65\
-\x87\x75\x9c\x79\x5d\xaf\x63\xb2\x8e\x22\xaf\xb6\xf6\x7c\xd7\x47\
-\xbd\xa3\x2c\x83\x8a\x7f\x94\x7b\x1a\xc2\xb7\xbc\x91\x0f\xcc\x08\
-\xad\x7b\x7b\xf5\x60\x03\xd7\xcc\x38\xd8\xf6\xae\x48\xd1\x9c\x1e\
-\x2a\x0f\x24\xfa\x55\xe5\x74\x71\xc1\x14\xec\x2f\xa7\xeb\x53\xca\
-\x5a\x67\x89\x4b\xf0\xe6\x65\x5c\xac\xc4\xfe\x15\x4e\x6f\x02\x5d\
-\x44\xa4\xf9\x9c\x7d\x2b\xbc\xba\xd6\xa3\xb5\x8c\x97\x3d\x3d\x6b\
-\xcc\xfc\x5b\xf1\x4c\x43\xe6\x5b\xd8\x7c\xf2\x74\xe0\xf0\x2b\xd1\
-\xfa\xd5\x45\xd4\xe3\xf6\x71\x7b\x23\x1f\x5b\x8d\x74\x35\x26\xe6\
-\x41\xd7\x1f\x5a\xe6\x2c\xfc\x4d\x30\xd5\x15\x90\x11\x18\x3d\x3d\
-\x6b\x32\x7b\x8d\x43\xc4\x17\xde\x65\xc3\xb4\x8c\xc7\xf0\x15\xd7\
-\xf8\x7b\xc1\x87\x2b\x2d\xc0\xf7\xe4\x57\x16\x23\x17\x29\xc7\x95\
-\xb3\xb2\x8d\x0b\x3b\x9d\x8e\x93\xa9\xb5\xf4\x6a\x4a\xe3\x8a\xd7\
-\x5e\x6a\xad\x9d\xac\x56\xb1\x04\x8c\x62\xae\x06\x03\xb5\x79\x27\
-\xa0\x29\x8c\x52\x08\xc0\xa5\xdd\x9a\x55\x6a\x06\x31\xa2\xe7\x8a\
-\x67\x92\x73\x56\x41\x06\xa4\x00\x66\x8b\x08\xaa\x22\x38\xe9\x40\
-\x4e\x79\x51\x56\x49\xc3\x52\x80\x29\xd8\x0a\xa6\x05\x27\x94\x1f\
-\x95\x20\xb6\x8f\x3f\xea\xd7\xf2\xab\x60\x0a\x08\x19\xa5\xa8\x15\
-\xd6\x28\xd0\xe5\x50\x0a\x90\x3e\xda\x78\xda\x69\xac\x94\x00\xf5\
-\x96\x9e\xb2\xf3\x51\x04\xa9\x54\x0c\x73\x4d\x30\x2b\xea\x96\xef\
-\xa8\xe9\x93\xdb\x41\x39\xb7\x92\x45\xda\x24\x1f\xc3\x5e\x31\xab\
-\xd8\x36\x8b\xae\xdc\x59\xf9\x85\xcc\x44\x7e\xf3\x18\xdd\x90\x0e\
-\x7f\x5a\xf7\x20\x17\xb5\x79\x4f\xc4\x5b\x5f\x23\xc5\x02\x60\x3e\
-\x59\xe0\x53\x9f\x71\x91\xfe\x15\xf5\x9c\x39\x88\x92\xac\xe8\xbd\
-\x9a\xbf\xcc\xf2\x73\x1a\x71\x74\xf9\xfa\x9c\xe3\xb2\xcc\x4b\x9c\
-\x2c\x87\xaf\xa1\xaa\x92\x2b\x25\xe0\xca\xe3\x72\xe7\xa6\x33\x52\
-\x63\x2b\x54\xd9\x99\x2f\x90\x16\x25\x48\xe3\x27\xa5\x7d\xea\x47\
-\xce\x5b\x72\xe7\x94\xe3\x96\x1b\x7e\xbc\x54\x77\x72\x49\xfd\x9b\
-\x3a\x40\xd8\xb8\x65\xc4\x6c\x4e\x02\xfa\x9a\xb4\xcc\x2e\x31\xe6\
-\xe4\x49\x8c\x06\xf5\xaa\xd3\x44\x42\xb0\xa8\x94\x79\xe2\xe2\xfa\
-\x93\x1d\xd5\xc9\x74\xd8\x21\xb5\xd3\x2d\xe1\x80\xf0\xa9\xd0\xf7\
-\x3d\xcf\xe7\x5b\xba\x61\xf2\xd4\x49\xf6\xbf\x28\x17\x0a\xe9\xdc\
-\xaf\xad\x73\x56\xac\x45\xb2\xf6\x2a\x48\xab\x11\xce\xeb\xd7\x9a\
-\x87\x46\x2a\x3c\x91\xd1\x23\x27\x16\xa6\xe5\xd4\xd3\xf1\x2a\xc7\
-\x1f\x89\xae\x44\x13\x79\xe8\x4a\x91\x26\x41\xcf\x15\x50\x57\x3a\
-\xf6\x72\xb6\xbf\x6f\x0d\xad\xfd\xec\xa4\x2f\x9d\x38\x9a\x7c\x85\
-\x40\x78\x1f\x89\xe3\x15\x7b\x5c\xb6\xbf\x9a\xde\x14\xb0\x13\x6f\
-\x12\x82\xe2\x29\x44\x6c\x57\x07\xb9\xae\x28\x57\x94\x69\x4a\xf1\
-\x6d\xc3\x4e\xf7\xdb\xb1\xb5\x6a\x71\x9d\x48\xeb\x6b\xfe\x06\xb6\
-\x70\x73\x51\xde\xe0\xbc\x6c\x4e\x4e\x0f\x3f\x8d\x67\x68\x53\xf9\
-\xfa\x7b\x21\x37\x1b\xe2\x91\xa3\x90\x5c\x3e\xf6\x0c\x3a\x8c\xf7\
-\xeb\x5a\x5a\x84\x4d\x1a\xdb\x96\x1c\x15\x38\x20\x57\x55\x1a\x8a\
-\xa4\x14\xd7\x53\x9d\x53\x70\xa8\xe2\xfa\x0c\x8e\x46\x8d\x83\x21\
-\xda\x7d\x45\x58\x4b\xeb\xaf\x37\x7f\x9f\x26\xfc\x83\x9d\xdc\xe4\
-\x55\x40\x73\x53\x40\x63\x0d\x99\x33\x81\xd3\x02\xa9\xc5\x75\x44\
-\x5d\xad\x84\xd5\x4c\xad\x78\xb2\x4c\xfb\xde\x44\x0c\x5b\x76\x73\
-\x55\x8b\x53\xef\x9f\x75\xc2\xb0\x39\x18\xe3\xdb\x9a\x87\x39\xed\
-\xc5\x37\xa4\x52\x36\x7a\xd8\x8e\x5e\x50\xd5\x7b\x2f\xbc\xd5\x2c\
-\x99\xda\x6a\x2b\x2f\xbe\xdf\x5a\xcd\x6c\x6b\x1f\x81\x9d\x47\x87\
-\x02\x3d\xf0\x49\xb0\x22\x61\x87\x63\xd8\x7a\xd6\xf7\x8b\xed\xa4\
-\xb3\xf0\xdd\xaa\x8c\x88\x24\x9b\x74\x68\xc3\xe6\x03\x1d\x4d\x72\
-\x56\x66\x68\xae\x57\xc9\xe5\xc1\x04\x05\x3d\x6b\xa2\xf1\x3e\xb4\
-\xda\xae\x87\x6b\xe7\x16\xf3\x84\x84\x32\x11\x80\xb8\xae\x2a\x94\
-\xe6\xf1\x34\xe4\xb6\xea\x6f\x42\x71\x54\x67\x17\xb9\x95\x63\x28\
-\x12\x23\x6e\x24\x20\xfc\xab\xd1\xf4\x73\x1e\xa7\x0c\x10\xd9\x8c\
-\xd8\x5a\xff\x00\xac\x93\xfe\x7b\x3f\xff\x00\xaf\x93\x5e\x6b\xa6\
-\xe1\x66\x04\x95\x1f\xef\x74\x3f\x5a\xee\x34\xf8\xe4\xd3\xa1\x89\
-\xf4\xa9\xe5\xf2\x59\x94\xc8\xb2\x00\x01\x63\xfd\xd1\xd4\x8a\xe5\
-\xcd\x29\xf3\xc6\xc9\xd9\xf4\xfe\xbb\xf6\x34\xcb\xe7\xca\xdb\x7a\
-\xa3\x99\xbe\x95\xa2\xf1\x85\xec\xf1\xb6\xc7\x8e\x52\xc8\x71\x9c\
-\x1a\xda\xd2\x5c\x5c\x1b\x8b\xbb\xe7\x2c\x01\x0c\xea\x0e\x7c\xe7\
-\xcf\xca\xa0\x0f\xe5\x5c\xad\xf4\xee\xda\xbe\xa1\x2a\x11\xe6\x97\
-\x6d\x81\xfe\xee\xee\xd9\xf6\xab\x5f\x0f\x75\x3d\x42\x79\x6f\x66\
-\xbf\x6f\xb5\xc5\xa6\x5d\x4b\x95\x54\x0a\x17\x80\x01\x1e\xbc\xe7\
-\xae\x6a\xf1\x4d\x42\x9c\x61\x6d\x5a\xfc\x96\xd7\xf3\x15\x2f\x7a\
-\xb3\x97\x44\xce\xe3\x51\x49\x93\x47\xbb\x9b\x50\x97\x17\x12\x42\
-\x76\xc2\x0f\x11\xaf\xa6\x3b\xfb\x9a\xf2\xab\xad\x6a\xf7\xc3\xd6\
-\x0d\xa8\x58\x5a\xdb\x4f\x8c\x86\x37\x1f\x32\xa6\x48\x1f\x74\x11\
-\x93\xcd\x7a\xa6\xb1\x0c\xb1\xf8\x5a\xf2\xf6\xec\xed\xba\xbb\x51\
-\xf2\xff\x00\x70\x76\x51\x5e\x4d\xae\x69\xd7\xb7\xda\x60\xb3\xb3\
-\x36\xc9\x13\xe0\xc9\xe7\x16\xdd\x90\x41\x18\xc6\x47\xaf\x5a\xe2\
-\xc2\x29\xcb\x05\x55\x43\x7b\xdb\x4f\x4e\x9e\x47\x4e\x2a\x51\x8d\
-\x7a\x7c\xdb\x79\xff\x00\x5b\x9e\x9d\x6d\x6d\x6e\xab\x2e\xa4\x8e\
-\x3e\xc5\x67\xb9\xa3\x67\x1c\xcd\x2e\x30\x5b\xe9\xd8\x0a\xe1\x34\
-\x0f\x17\x5f\x78\x89\x2f\x0d\xe5\xe6\x90\x64\x9e\x12\x4d\xac\x4b\
-\x32\xce\xa4\x1c\x05\x1b\xbe\x42\x3a\x9e\x09\x3c\xd4\xc3\x5e\xd7\
-\xcd\x9d\xac\x52\x3d\x9c\x51\xdb\xc6\xdb\x96\x15\x62\x15\xc1\xf9\
-\x59\x41\xeb\xd4\x67\x3d\xfa\x54\x17\x1a\x77\x88\x2f\xb5\x2b\x4d\
-\x6f\xc4\x33\x40\xc2\xd9\x76\x47\x2d\xba\x1f\x9b\x78\xc7\xce\x4f\
-\x43\x8e\xc3\xd6\xa2\x58\x4a\xce\xbc\x26\xef\xba\xfb\xae\x9f\xfc\
-\x17\xe7\xa0\x2c\x4d\x35\x49\xa8\xae\x8f\xef\xb7\xf5\xf2\x2d\xd9\
-\x6f\xb4\x47\xdc\xc4\x3b\x75\x0b\x8c\x8f\xc7\xb7\xe1\x54\x75\x7b\
-\x1b\x3d\x53\x62\x5e\x5b\xab\x22\x12\xca\x03\x30\xe4\x8e\xb9\x07\
-\x27\xa5\x68\x15\xdb\xd4\xf6\xc8\xff\x00\xeb\x56\x6d\xfc\xc6\x36\
-\x00\x75\x7e\x06\x2b\xe8\xdd\x28\x54\xba\x9a\xba\x7d\xcf\x0a\x9c\
-\xe5\xed\x13\x4c\xd2\xb2\xd2\xad\x74\x58\x0d\xb5\x94\x26\x24\x7c\
-\x48\x55\x98\x9f\x9b\x18\x24\x64\x9f\x41\x5e\x95\xf0\x72\xe6\xc1\
-\x35\xeb\xf4\xba\x9e\x35\x9d\xe0\x55\x8a\x36\x3c\xb0\xce\x5b\x1f\
-\x4c\x0a\xf3\xd8\x5a\x49\x22\x45\x7e\x19\x7e\x5e\xd5\xd5\xf8\x1b\
-\x45\x8d\xa4\x93\x55\xc6\xdb\x98\xa4\x29\x1b\x67\xee\xf1\xcf\xf3\
-\xaf\x27\x32\x74\xe8\xe0\xe4\x9e\x8b\xa5\x8f\x43\x05\x19\xd5\xc4\
-\x27\xd7\xcc\xf7\x82\x96\x6f\xfd\xda\x61\xb5\xb7\x3f\x71\xf1\xf8\
-\xd7\x10\x97\x5a\x82\xff\x00\xcb\x50\x7f\x0a\x90\x6a\x57\xe9\xfd\
-\xd3\xf8\xd7\xc3\x7b\x64\x7d\x37\xb1\x67\x6c\x2d\xc2\xfd\xd9\x3f\
-\x5a\x5f\x25\xbf\xe7\xa7\xeb\x5c\x62\xeb\x77\x8b\xd6\x3f\xc8\xd3\
-\xff\x00\xb7\x6e\xbf\xe7\x99\xfc\xe9\xfb\x58\x87\xb3\x91\xf3\xef\
-\x88\xfc\x7b\x7f\xad\xca\xd1\x59\xee\x82\x03\xe8\x7e\x66\xac\xed\
-\x23\xc3\x57\x5a\x9c\xc1\x99\x0e\x09\xe4\x9a\xe9\xbc\x3b\xe0\x7c\
-\xed\x96\xec\x7e\x06\xbd\x0e\xcb\x4d\x82\xca\x10\xb1\x20\x18\xef\
-\x8a\xe6\x95\x5b\xec\x6d\x0a\x49\x6e\x73\x9a\x37\x84\x20\xb0\x45\
-\x2e\xa0\xb7\xd2\xba\x25\x88\x22\x85\x03\x00\x55\xb1\xf4\xa4\x2a\
-\x3b\xd6\x0d\xdc\xdc\xaa\x57\x1d\x29\x7e\xb5\x3b\x27\x1c\x52\x04\
-\xe3\x91\x52\x51\x10\xc6\x69\xe0\x52\xed\x1d\x05\x39\x62\xc1\xa3\
-\x50\x10\x02\x29\xca\x71\x4f\xf2\x8f\x6a\x77\x95\xc7\x34\xc4\x44\
-\xc7\x34\x80\x9a\x7b\x45\xe9\x4a\xb1\x7a\x9a\x60\x30\xb1\x22\x90\
-\x6e\xef\x53\x84\x51\x4a\x13\x3d\xa9\x88\x85\x73\x9a\x7e\x6a\x40\
-\x9c\xd2\x94\x14\x01\x19\xf6\x14\xf1\xd2\x97\x6f\x34\xe5\x14\xec\
-\x2b\x89\xb7\x8e\x95\xe4\xde\x37\x8b\x53\x8b\x54\xff\x00\x89\x97\
-\xcc\xae\xc5\xa2\x2b\xca\x95\xe8\x00\xf4\xc5\x7a\xee\x71\x5c\x7f\
-\xc4\x78\xcb\x78\x7e\x29\x94\x73\x0c\xea\x73\x8e\x80\xe4\x7f\x51\
-\x5e\xee\x49\x88\xf6\x38\xb5\x1b\x7c\x5a\x1c\x18\xea\x7e\xd2\x93\
-\x7d\x8f\x2c\x35\x56\xe9\x08\x28\xeb\x8f\x94\xd6\x9b\x34\x42\x22\
-\x40\x01\xcf\xf3\xaa\x57\x48\x1d\x14\x2f\x18\x23\x91\x5f\xa4\xc5\
-\x9f\x30\x9e\xa3\xc3\x65\x46\x69\x4c\xe6\x35\xcb\xa6\xf5\x03\x8c\
-\x9a\x7c\x88\x15\xca\xa1\x2c\x3d\x71\x8c\xd4\x24\x9d\xa4\x72\x05\
-\x32\x10\xcb\x67\x12\x6e\x0c\x3f\x8f\x24\xe3\x06\xae\xc8\x61\x8b\
-\x1b\x22\x2d\xe8\xcc\x78\xac\xdb\x53\xe5\xcf\x2c\x79\xc8\x3c\xd5\
-\xd8\xe4\x29\xc7\x55\x3d\x41\xa1\xa0\x92\xf7\x8a\x12\x41\xe4\xdc\
-\x5c\x5d\xab\xb1\x96\x72\x0b\x31\xc6\x00\x1d\x00\xf6\xa7\x35\x80\
-\x9a\xca\x35\x96\xee\xe8\xb1\x62\xeb\x22\xcd\xf3\x2e\x7a\x80\x7b\
-\x0f\x6a\xb7\x71\x14\x6d\x6c\xce\x8c\xb9\x1c\x14\x24\xe7\xeb\x4c\
-\x86\x33\xf6\x58\xdf\x23\x04\x74\x07\xa7\x3d\x2b\x2f\x61\x49\xc7\
-\x96\xda\x6b\xf8\xea\xc7\x29\xca\xd7\xb9\x3e\x99\x05\xa6\x9d\x17\
-\x95\x6f\x1f\x98\x84\xee\x6f\x31\xbe\x66\x3d\xc9\x3e\xb5\x5f\x5e\
-\xd4\x16\xd6\x18\x24\x8a\x37\x77\x77\xf2\xd6\x22\xd8\xc1\x3d\x39\
-\x3d\x2a\x58\x63\x57\x73\xb9\x8a\x85\x04\xe4\x0c\xd5\x2d\x66\x19\
-\x2e\x2c\x63\x58\xc0\xb8\x44\x90\x34\xb0\x33\x04\xde\x98\xe8\x1b\
-\xb7\x35\x8d\x68\x3a\x54\x5f\xb1\x5a\xa5\xa5\x97\xe9\xff\x00\x0f\
-\xe8\xc5\x4a\xd2\xaa\x9c\xfa\xee\x1a\x75\xf1\xbe\x86\x42\xd0\x98\
-\x5e\x27\x31\xba\x96\xdd\x82\x3d\xfb\xd5\xe5\xe9\xcd\x67\xe8\x56\
-\x73\x43\x6b\x29\x91\x56\x08\xd9\xcb\x45\x6f\xe6\x6e\xd8\xbe\x99\
-\xfa\xd6\x88\x2c\x8d\xf7\x71\xf5\x14\x61\x9d\x49\x51\x8b\xa9\xbf\
-\xdd\xfe\x5f\x92\xf4\x46\x75\x94\x55\x46\xa3\xb1\x05\xd6\xd0\xc9\
-\x8f\x4e\x69\x3c\xe6\x11\x95\x53\xc1\xeb\x45\xe6\xd3\x22\xec\x24\
-\xf1\xce\x45\x47\xc5\x6b\x3d\x8a\xe8\x88\xe4\x27\x69\xa8\xac\xfe\
-\xfb\x54\x92\x7d\xd3\x8a\x8a\xcc\xfc\xcd\x51\x13\x45\xf0\x33\x66\
-\xc4\xca\xb3\x09\x6d\xd8\x09\x23\x21\x97\xd4\x9f\x61\xde\xae\xf8\
-\xab\x56\xb5\x8b\x4b\xb0\x96\xec\x08\x24\x2e\xc2\x47\xc1\x26\x46\
-\xf7\x00\x55\x5d\x2c\xec\xba\x12\x23\xb4\x72\xaf\x31\xb0\x1c\x67\
-\xde\xab\x78\xa7\x52\xd2\x75\x8b\x6b\x39\x25\xbe\x9a\x35\x86\x56\
-\xf3\x27\x86\x32\x36\xc8\x3f\x0c\xfe\x38\xae\x3c\x4c\xdd\x36\xa5\
-\x1b\x5d\x6d\x7f\xe9\x68\x69\x87\x49\xa6\x9d\xed\xe4\x49\xa7\xde\
-\x47\x3d\xaa\x5d\xda\xb8\x96\x26\x62\xa0\xf2\x32\x47\x5e\x0f\x35\
-\xd9\x78\x7f\x5a\x89\xa5\x55\xbb\x60\xa5\x4e\xe5\x95\xba\xae\x07\
-\xdd\x1e\x82\xb8\x4f\x0e\x2d\xc4\x9a\x5c\x92\x4e\x25\x99\x04\xcc\
-\x20\x96\x51\x82\xd1\x8c\x60\x9f\xd6\xb5\x5e\x62\x0e\x50\xe3\x8e\
-\x82\xad\x53\x58\xba\x09\xcf\xaa\xfe\xbb\x9c\xfe\xd2\x58\x7a\xcd\
-\x43\xa0\xcb\xb8\x5e\x59\xee\x99\x66\x11\x49\x21\x6d\xaf\x8d\xdb\
-\x49\xe8\x71\xde\xa9\xe8\x96\x57\x7a\x35\xd5\xd9\x5d\x54\xcf\x1c\
-\xcf\xba\x58\xfc\x90\x9b\x9c\xe0\xee\xea\x7f\x2e\x95\x66\x36\xf9\
-\x89\x34\xb1\xb0\xf3\x2e\x49\xc6\x77\x91\x9f\x4c\x0c\x57\x44\xb0\
-\xf4\xe7\x38\xca\x5b\xad\xb5\x7f\x96\xc2\x55\x26\xa1\x2b\x3d\xcb\
-\xf7\x97\x57\x97\x4d\xe6\xdd\x4f\x2c\xd9\xe8\x5d\x89\x1f\x85\x56\
-\x5d\xb8\x25\x81\x3e\x82\x9d\x6a\xa5\xed\x17\x6e\x76\xe7\x1d\x73\
-\xfe\x45\x49\x20\x88\x44\xd1\xb1\xd8\xea\xdc\x12\x3a\xfa\x8a\xd3\
-\x95\x47\x44\x72\xbb\xdf\x52\x8d\xd4\x9f\x26\x14\x6d\x2e\xc0\x10\
-\x3d\x32\x2b\x7a\xec\x6d\xf0\xf8\x31\x5d\x8d\x8f\x3a\x86\xb6\x03\
-\x95\x20\x7d\xe3\x58\xf7\x56\x72\x09\x2d\x9d\x06\xf8\x9a\x41\x87\
-\x07\xf9\xfa\x57\x4b\xe2\xc8\x2d\xf6\xe9\x4f\x6c\x89\x10\x91\x0a\
-\xc8\x00\xe4\x90\x47\x53\xdf\xbf\x35\xcf\x52\x69\x54\x84\x3b\xb7\
-\xf8\x6a\x76\xc2\x3c\xd4\x9c\x93\xd9\x18\x66\x52\xd8\xc1\x04\x63\
-\x9a\x8a\x2b\x51\x3d\xf4\x3c\xab\x1f\x31\x4e\x49\xfb\xa0\x64\x9c\
-\xfe\x55\x32\x01\x18\xf5\x90\x31\xdc\x3f\x91\xa8\x54\x37\x9a\xff\
-\x00\x2e\xf3\x20\x3b\x48\xe7\x68\xc7\x5f\xe7\x5b\x7a\x1c\xb0\xf7\
-\x64\x68\x27\x96\x89\x22\xc6\xdb\x8b\x36\xf2\xca\x72\x7a\xf1\xfc\
-\x8d\x7a\x3f\x82\x51\x3f\xe1\x1b\x8d\x95\xc1\x2d\x23\x16\xc1\xe8\
-\x73\x5e\x6d\x80\x8f\x18\x44\xda\x24\x84\x10\x07\x4c\x0e\x07\xe3\
-\x5e\xa3\xe1\xab\x08\x6c\x34\x0b\x65\x85\x02\x19\x10\x3b\x91\xfc\
-\x4c\x7b\x9a\xf9\xbc\xfe\x49\x61\x92\xee\xcf\x6f\x28\x8b\x75\x5b\
-\xf2\x35\xc9\x23\xbd\x34\xb3\x7a\xd3\x5b\x83\xd6\x9a\x58\x8e\xb5\
-\xf0\xd7\x3e\x9e\xc3\xb7\xb5\x1b\x9a\x9b\x9a\x4d\xd4\xae\x3b\x19\
-\xea\x88\xbf\x74\x60\x7b\x54\xa1\xbe\x5a\x72\xc6\x00\xe9\x4b\xb3\
-\x9e\x9c\x56\x45\x11\xef\xc7\x4a\x78\x2a\xd4\xe3\x18\xc7\x22\x9b\
-\xb3\xd2\x98\x06\x79\xe9\x47\x06\x97\x69\xee\x29\x71\x81\xd2\x81\
-\x15\xae\x6e\x6d\xac\x60\x7b\x8b\xb9\xa3\x82\x18\xc6\x5e\x49\x5c\
-\x2a\xa8\xf7\x27\x81\x4c\xbd\xd6\x34\xed\x32\x14\x97\x53\xbe\xb6\
-\xb3\x8d\xce\x11\xee\x26\x58\xc3\x1f\x40\x49\xe6\xb0\x7e\x22\x69\
-\x56\xd7\xbe\x08\xd4\xa7\xbb\x8b\xcd\x6b\x4b\x69\x65\x84\x33\x1d\
-\xaa\xfb\x08\xdd\xb7\xa1\x23\x27\x04\x8e\x3b\x56\x86\xaf\x7b\x6d\
-\xa7\x59\xdb\x32\xdb\x2d\xde\xa5\x3c\x66\x0b\x38\x02\x82\xf2\x96\
-\x00\xb2\xe7\xb2\x7c\xaa\x58\xf4\x01\x41\x3d\xaa\x92\x15\xcb\xf7\
-\x3a\xc6\x9f\x61\x66\x97\x77\xb7\xf6\xd6\xd6\xd2\x10\x12\x69\xa6\
-\x54\x46\xc8\xc8\xc3\x13\x83\x91\xcd\x3e\x3b\xa5\xb9\x86\x39\xad\
-\xa4\x59\x61\x91\x43\xa4\x88\xc1\x95\x94\x8c\x82\x08\xea\x08\xef\
-\x5c\x86\x8f\xa4\x9d\x1b\xc5\x1e\x1f\xd3\x2f\x24\x59\x1a\xdf\x48\
-\x9d\x61\x6c\x61\x4c\xbb\xe3\xdf\xb3\xfe\x02\x7f\x2a\xa3\xa1\x4b\
-\x7c\xd7\x3a\x7e\x99\xa5\xea\x0d\x63\xa7\xdd\xdc\xea\x92\x23\x43\
-\x12\x39\x31\x25\xc2\xf9\x7b\x0b\x82\x00\xf9\x8f\x62\x30\x4f\x19\
-\xc1\x15\xca\x4f\x31\xe8\x40\x9c\x66\x90\x92\x79\xcd\x71\xda\x56\
-\xa5\xad\x0b\x4d\x1a\xfe\xef\x55\x37\x02\xe7\x50\x7b\x19\x6d\xfe\
-\xcf\x1a\xa3\x2a\x99\x13\x7f\x03\x70\x72\x63\x04\xe0\xed\xe7\x1b\
-\x45\x41\x6b\x7f\xaf\xdc\xe9\xfa\x75\xf7\xf6\xdb\x21\xbd\xd5\x26\
-\xb1\x68\xbe\xcb\x11\x44\x8c\x49\x2a\x86\x1c\x67\x78\xd8\x30\x73\
-\xb7\xa6\x54\xf3\x93\x94\x7c\xc7\x70\x38\xa6\x58\xdf\xc3\xa8\xd9\
-\xad\xcd\x94\x9e\x64\x2c\xcc\xaa\xdb\x48\xc9\x56\x2a\x7a\xf6\xc8\
-\x3c\xf7\xea\x38\xae\x4e\x7d\x4f\x52\x83\x47\xd7\x34\xf1\x74\xd7\
-\x77\xf1\xdf\x2e\x9d\x65\x3b\xa2\xab\xb1\x96\x38\xd9\x4b\x05\x01\
-\x72\xbe\x63\x1c\x80\x38\x4a\xb7\x75\x1d\xdf\x86\xae\x2c\x63\x13\
-\x5e\x5b\xf8\x7e\xda\x2b\x7b\x74\x36\x49\x0b\x6d\x7d\xfb\x31\x30\
-\x75\x2e\x55\xb2\x80\x18\xf9\xfb\xc4\xe3\x83\x47\x28\x5c\xea\x43\
-\xb0\x3c\xd3\xf3\xb8\x54\xbb\x15\xbb\x56\x3b\x6b\x6e\x92\x32\xae\
-\x85\xab\x3e\xd2\x46\xe5\x89\x30\x7d\xc6\x5e\x81\xb3\x51\x01\xef\
-\xd2\xa4\xc0\xac\x63\xaf\x5c\x63\x8f\x0e\xeb\x18\xff\x00\x72\x2f\
-\xfe\x39\x40\xd7\xae\x40\xff\x00\x91\x6f\x57\x3f\x84\x1f\xfc\x76\
-\x9d\x85\x73\x6b\x68\xe9\x5c\x67\xc4\x28\x35\x59\xf4\xd2\x96\x68\
-\x86\xc5\x50\xbc\xec\x48\xce\x41\xe2\xb6\xc6\xb9\x78\x7a\x78\x63\
-\x58\x3f\xf0\x2b\x6f\xfe\x3d\x5c\x7e\xa9\xe3\x0b\xed\x57\x56\xd6\
-\x74\x0b\xff\x00\x0f\x6a\x16\xb6\x30\x2a\x66\xed\x0a\x66\x0c\xa2\
-\xb6\x25\xc1\x65\x20\x92\x0f\xca\xd9\xc7\x6e\xb5\xd3\x86\xaf\x2c\
-\x35\x45\x56\x29\x36\xbb\xec\x38\xd1\x85\x79\xc6\x94\xdb\x4a\x4d\
-\x27\x6d\xfe\x47\x02\xcc\xc7\x93\xc9\xef\x4d\xc0\x92\x22\x41\xe0\
-\x75\xf6\xa9\x1f\x3b\x8e\xee\x0d\x44\xc0\xa9\xde\x9f\x7b\xb8\x3d\
-\x0d\x7e\xa7\x86\xab\xed\xa8\xc2\xaf\x74\x9e\x9a\xaf\xbc\xf9\x5c\
-\x66\x1f\xea\xd8\x99\xd1\xd7\xdd\x6d\x6a\xac\xf4\x7d\x57\x42\x4f\
-\x31\x6e\x06\xe8\xc8\x5e\xd8\x27\x81\x48\xa1\x81\xe3\x3f\x85\x56\
-\xb5\x1b\x99\x95\x86\xdf\x9b\xa0\x3d\x2a\xd3\x48\x0a\xaa\xa3\x31\
-\xc7\x5c\xf6\x35\xd4\x70\x35\x67\x62\xbe\xf6\x5b\xfc\x6e\xc9\x65\
-\xe8\x46\x6a\xcb\xa1\x4e\x24\x52\xa7\xd0\x8a\xa7\x21\xd9\x77\x1b\
-\xe7\xbf\x7e\xf5\xa1\x75\x29\x9f\x6b\x9e\x4e\x30\x7d\xa8\x61\x2d\
-\xd1\x52\xe3\x2f\x1b\x12\x72\x47\x43\x4e\xb1\x3b\xb4\xec\x12\x33\
-\xb8\xf1\xdc\x1f\x5f\xa1\xa7\x79\x59\x85\xdd\xb8\x00\x71\x91\xf7\
-\x8f\xa5\x55\xb1\xff\x00\x56\xdd\xb0\xd4\x0d\xfc\x25\xe8\x4e\x3c\
-\xce\x39\xdb\x55\x2e\x58\x08\x5f\x77\x39\x15\x6e\x3c\x16\x6c\xf1\
-\xf2\x9f\xc6\xab\xdc\xc6\x4c\x0d\xb7\x1f\x4a\x09\x8f\xc4\x3a\xd0\
-\xee\xb0\x52\xa3\x85\xe0\x92\x6a\x63\x29\x3c\x37\x22\xab\x58\xed\
-\x36\x63\x3d\x72\x40\x14\xf6\x3c\xf1\x4d\x93\x28\xae\x66\x17\x10\
-\x79\xa5\x5a\x13\x92\x3a\xa9\xeb\x4f\x1a\x75\xee\xf5\x41\x6b\x31\
-\x66\x19\x03\x61\xe4\x54\x45\xb1\xd3\xad\x5a\xb1\xbb\xb8\x28\xd9\
-\x9e\x4e\x1b\x03\xe6\x35\xc3\x8d\xac\xb0\xf8\x79\xd7\x6a\xfc\xa9\
-\xbb\x23\xbb\x01\x83\x9e\x3b\x13\x4f\x0d\x19\x25\xcc\xd2\xbb\xd9\
-\x5f\xfa\xdb\xae\xc4\x7f\xd9\x73\x16\xdb\x39\x10\x9e\xe1\xba\x8a\
-\x58\x2c\xed\xed\xb2\x54\x17\x6c\xf5\x63\xc5\x5a\x9a\x47\x99\xb7\
-\xca\xec\xec\x7a\xb3\x1c\x93\x50\x48\xdb\x57\xde\xba\x28\xda\x50\
-\x52\x4b\x7e\xe7\x9f\x51\x4e\x13\x95\x36\xf6\x76\xd3\x55\xa7\x67\
-\xd5\x09\x2c\xe5\x57\x03\x8f\x61\x54\x92\xe5\xa5\x99\x41\x27\xe5\
-\x18\xfd\x7f\xfa\xf5\x24\xee\x02\x1c\x75\xaa\x56\x61\xa4\xb9\xc0\
-\xea\x73\x5d\x09\x1a\x53\x82\xe5\x6c\xda\xb5\x98\xb3\x05\x90\xe5\
-\x7d\x0f\x6a\xb0\x22\x12\xae\x61\x3f\xf0\x16\xac\xf8\x8e\xc7\x19\
-\xfa\x13\x56\xf7\x62\x42\x11\xbc\xc4\x53\x9c\x8f\x4a\x52\x5a\x9c\
-\xb2\x56\x77\x43\x15\x1d\x26\x08\xea\x54\xf5\xe6\x9f\x6e\x40\x82\
-\x77\x61\x92\x59\xf1\xc5\x48\xb7\x05\x62\x67\x6c\x31\x63\x90\x08\
-\xe8\x3d\xa9\xd1\xc4\x8d\x63\x2b\xa8\x0a\xaa\x7f\xbd\xce\x49\xfd\
-\x6b\x3d\x99\x7c\xde\xe5\x86\xc0\xb9\xb7\x23\x95\xe3\x9c\xd4\xc2\
-\x45\x31\xc3\xf2\xab\x05\xc3\x12\xeb\xcf\xe6\x3b\x53\x8a\xe2\x18\
-\xd0\x30\x38\x1c\x8e\x94\xab\x14\x2d\x1e\xe6\x94\x46\x3b\x60\x67\
-\x1f\x5f\x6a\x96\x65\x72\x78\xae\x2d\x64\xd4\xed\x2d\xe6\x22\x1b\
-\x72\xe3\xcd\x24\xf6\x07\x27\xfc\x2a\xd6\xb4\xe2\x65\x16\xeb\x70\
-\xa6\xda\x2c\xbd\xab\x17\x04\xec\x27\xee\x9f\x42\x2b\x9d\x75\x79\
-\xf5\x28\x6d\xe4\x25\xd1\x41\x6f\xdd\x9f\xbc\x3f\xc8\xad\x4d\x7e\
-\xc2\x2b\x4b\x84\x8e\xdd\x10\x28\x41\x8d\x8d\xb8\x13\x8c\xd6\x12\
-\x84\x55\x58\xdd\xff\x00\x5f\xe6\x75\xc7\xdd\xa7\xca\x34\x4f\x0b\
-\x2e\x57\x73\x49\xb7\xee\x22\xf4\xc7\xbd\x41\x01\x6b\xad\x5d\x63\
-\x92\x4d\x91\x7d\xe9\x64\x4e\x49\xcd\x4c\x93\x7f\xc4\xbe\x25\xc0\
-\x01\x97\xae\x31\xcd\x47\xa6\x86\x5d\x49\xb1\x80\xbb\x02\x67\xdc\
-\x8c\xd5\xbd\x99\x8c\x62\x95\xd9\xa3\x34\x8b\xe6\x02\xce\xa7\xc9\
-\x01\x01\xe9\x90\x7f\xce\x71\x5e\xb9\x6a\x9e\x5d\x9c\x08\xbc\x85\
-\x8d\x47\xe9\x5e\x45\x31\x37\x11\x2d\xac\x11\x6e\xba\x9d\x86\xd5\
-\x00\x63\x3c\x64\xfb\x57\xaa\x69\x9b\xed\xf4\xcb\x68\x65\x51\x1b\
-\xc7\x18\x56\x50\x72\x01\x02\xbe\x47\x88\x6c\xa9\xd3\xd7\x5b\xb3\
-\xde\xc9\xae\xdc\xf4\x2e\xb5\x31\x81\xa5\x2f\x9a\x40\xdc\xf3\x5f\
-\x1a\x7d\x20\x0c\x8e\xb4\xb4\xbb\xa8\xdd\x48\x64\x59\x03\x9a\x68\
-\x90\xf6\xe9\x4c\x1b\xb6\xfc\xdd\x29\xc3\x9a\x80\x25\x04\x63\x9a\
-\x36\x83\xd2\xa3\xc9\x14\x87\x76\x33\x9a\x2e\x04\xc1\x37\x53\xbc\
-\x9c\x77\xa8\x96\x4c\x2f\xbd\x02\x46\x6a\x77\x02\x0d\x47\x46\xd3\
-\xb5\x68\xd1\x35\x4d\x3e\xd6\xf5\x63\x24\xa2\xdc\xc2\xb2\x05\x3e\
-\xdb\x81\xc5\x50\x6f\x0a\xe8\x52\x43\x14\x13\x68\x7a\x6b\xc3\x0e\
-\xef\x2a\x36\xb4\x8c\xac\x79\x39\x38\x18\xc0\xc9\xeb\x8a\xd6\xde\
-\x47\x53\x4a\xcd\xef\x4e\xec\x56\x46\x7b\x78\x7f\x46\x93\x4f\x8e\
-\xc2\x6d\x1e\xc1\xec\xe2\x62\xf1\xdb\xb5\xb2\x18\xd1\x8e\x79\x0b\
-\x8c\x03\xc9\xe7\xdc\xd5\xc1\xa7\x5a\x2b\xc1\x22\x5b\x42\xad\x6e\
-\x86\x38\x48\x40\x0c\x4a\x71\x95\x5f\x41\xf2\x8e\x07\xa0\xf4\xa0\
-\xcc\x43\x01\x8a\x93\xce\x23\x8c\x51\x70\xb1\x0c\x7a\x7d\x92\xc7\
-\x1c\x69\x6b\x08\x48\xa4\x32\xc6\xa2\x31\x84\x72\x49\x2c\x07\x63\
-\x92\x79\xf7\x34\xe5\xd3\x2c\xa3\x8e\x38\xd2\xd2\x05\x8e\x29\x0c\
-\xb1\xa0\x8c\x00\x8e\x49\x25\x80\xc7\x04\x96\x27\x3d\x79\x3e\xb5\
-\x22\xb9\xdd\xf7\x6a\x50\x59\x8f\xb5\x3b\x81\x9f\x2e\x85\x67\x36\
-\xa9\x6f\x7e\x53\x64\x90\x48\xd2\xed\x45\x50\x24\x91\x93\x66\xf6\
-\xe3\x25\x82\xfc\xa0\xe7\xa1\xfa\x62\x69\x34\x4d\x2a\xe3\x52\x4d\
-\x42\x7d\x36\xce\x4b\xd8\xf1\xb2\xe5\xe0\x43\x22\xe3\xa6\x18\x8c\
-\x8c\x55\xc2\xac\x78\x5a\x5d\x8c\x0d\x3b\xb1\x00\x5e\x68\x28\x73\
-\xc5\x3d\x57\x9e\x68\x65\xf9\xa8\x01\x57\xfd\xae\x69\x4e\x33\xc0\
-\xa4\xdb\x48\x4e\x3a\x0a\x04\x3f\x18\x15\x95\xe2\x08\xef\x66\xd1\
-\x6e\x63\xd2\xe2\x49\x2e\x24\x5d\xa1\x5f\x18\x20\xf0\x7f\x4a\xd3\
-\x0c\x69\xca\x09\xe4\xd6\xb4\xe5\xc9\x25\x2b\x5e\xc2\x77\xb6\x8e\
-\xc7\xce\xd7\x56\xf3\x59\xdf\xcf\x6f\x72\xa0\x4d\x0c\x85\x1d\x73\
-\x90\x08\xa8\x4c\x8a\x4e\x1b\xe4\xf4\xf4\x35\xbf\xe3\x9b\x7f\xb2\
-\xf8\xd6\xfc\x63\x02\x42\xb2\x0f\xc5\x47\xf5\xae\x7f\x61\x90\x1f\
-\x97\x23\xbd\x7e\xaf\x84\x71\x96\x1e\x0e\x2a\xca\xcb\xf2\x3e\x57\
-\x14\xe5\x2a\xd2\x94\xdd\xdb\x6e\xef\xab\x2b\xe0\xc7\x74\xea\x41\
-\x19\x00\xf3\x52\x10\x57\xe6\x5e\xbd\xc7\xad\x40\xca\x63\xbc\xe4\
-\x92\x08\xe3\x3d\xaa\xc4\x63\x7a\x96\x27\x18\xed\xeb\x5d\x9d\x0e\
-\x69\x11\x5d\xca\x1e\x15\x60\x7a\x30\xc8\xee\x2a\xd2\x49\x9c\x6f\
-\xe4\x63\x8f\x63\x55\x2e\xd1\x5a\x12\x40\xe4\x77\xa9\x22\x73\xf6\
-\x75\xc1\xea\x05\x02\x92\xba\x45\x90\x55\x94\x87\x66\x21\x47\xca\
-\x01\xef\x54\x6d\x06\xd9\x66\x4f\x43\x91\x9a\xb3\x1b\xe5\xb0\xc3\
-\x63\x7a\xd5\x64\xf9\x35\x07\x5e\xa0\x8e\x0f\xad\x08\x4b\x66\x5a\
-\x24\xe4\x6d\xa6\xbb\x00\xac\x4e\x08\xc7\x23\xb5\x03\x92\x6a\x32\
-\x40\x93\x63\xfd\xc6\x1d\x7d\x29\x92\xb7\x17\x4f\x95\x56\x06\xca\
-\x21\xf9\xba\x11\x52\x3b\x64\xf0\x3f\xfa\xd5\x5a\xc0\x03\x14\xa0\
-\xf6\x6e\xb5\x39\xe3\xa5\x26\x39\x2f\x79\x8d\x35\x2d\x89\xc2\x30\
-\xff\x00\x6f\xfa\x1a\x84\x9c\xb1\xc0\xc5\x5c\xb6\x89\x22\x46\x06\
-\x55\x2e\xdb\x5c\x28\xe7\x1d\x78\xcd\x70\xe6\x2a\xf8\x2a\xcb\xfb\
-\xb2\xfc\x99\xea\xe4\xed\x47\x31\xc3\xbf\xef\xc3\xff\x00\x4a\x44\
-\xae\x76\xa6\x6a\xb3\x12\xd5\x3c\xe4\x00\x31\xcf\xd6\xaa\xb9\xe2\
-\xbb\x69\x6b\x04\xfc\x8f\x1a\xa4\x6d\x52\x4b\xcd\x90\x5c\x37\x07\
-\x35\x5a\xc5\xb1\x71\x9d\xdb\x78\x3c\x8a\x7d\xc3\x54\x36\x6a\x5e\
-\x43\x8f\x42\x6b\x64\x6f\x15\xee\x33\x62\x10\xb2\x05\x03\xef\x93\
-\x8a\xb1\x8c\x2b\x6d\xe1\x99\xb6\xf1\xe9\x55\x22\x57\x8c\x23\x81\
-\xf4\xab\x91\x10\x76\x6f\x19\x19\x2c\x69\x33\x86\x7b\x8c\x97\x0a\
-\xec\xa3\xf8\x46\x01\xa9\xc7\xfc\x79\xb9\x3f\x9f\x1d\xcd\x57\x61\
-\xfb\xb6\x6f\xef\x35\x4f\x22\x9f\xb2\x2e\x06\x09\x2b\xc7\x73\x59\
-\xb1\x74\x2d\x38\x2b\xb0\x27\xf7\x00\x6c\x1e\xa6\x98\xb2\x11\x33\
-\x99\x0e\x0b\x0c\x14\x0b\xdf\x1e\x94\x92\xb6\xc9\x14\x95\xe1\x86\
-\x09\x1d\xb8\xe6\x95\x91\x04\x7e\x72\x3e\xf1\x8f\x9b\xb3\x00\x7f\
-\x9d\x47\x53\x3d\xd1\x49\x1d\xa2\xd5\xa4\x92\x05\xc0\x85\x06\x73\
-\xd7\xfc\xf3\x57\xa5\x22\xea\x31\x29\x43\xb9\xdb\x82\xdc\x00\x00\
-\xc5\x52\x49\x81\xd4\x26\x05\x0a\x96\x21\x4e\xd1\xce\x40\xe9\x5a\
-\x0f\xca\x00\x3f\x4a\x52\x5a\xdc\xe8\xa9\x2b\x10\x34\x8d\x1d\x98\
-\x8d\xf1\x85\x1c\x71\x4e\x86\x58\xd6\x19\x56\x10\xf2\xdc\x34\x9b\
-\x91\x57\x90\xa0\x0c\x64\xd5\x4b\xe0\xcb\x01\x24\xf1\x8a\x9f\x45\
-\x67\xb7\x88\x79\x5f\x2b\xb0\x05\xf3\xdd\x4e\x6a\x64\xb4\xb8\x47\
-\xe1\xb9\xbf\xe1\xb8\x47\xf6\xad\x92\x87\x2e\xd2\x48\x1d\x89\x18\
-\xc9\xc5\x7a\x71\x43\x5c\x0f\x84\x61\x59\x7c\x47\x11\x23\x3e\x5a\
-\x33\x0f\x6e\x31\xfd\x6b\xd0\xcf\x07\x9a\xf8\x1e\x21\x97\x36\x22\
-\x31\xec\x8f\xa9\xca\x55\xa8\x37\xdd\x91\x82\x54\xd2\x10\x59\xb3\
-\x4f\x20\x93\xc0\xa7\x0c\x0a\xf9\xa6\x7b\x24\x39\x20\xd2\xf3\x52\
-\x1c\x7a\x52\x67\xda\x90\x08\x47\xad\x1b\x87\x61\x51\x82\xc4\x66\
-\x94\x1f\x98\x54\x0c\x79\x01\xba\x0c\x54\x6c\xbe\x86\xa4\x67\xc0\
-\xa8\xf2\x0f\x34\x00\xaa\x2a\x45\x65\x07\x04\x54\x67\x68\xe4\x52\
-\x2c\x83\x3c\xd2\x02\x76\x0a\xde\xd5\x09\x88\xef\xe3\xa5\x2f\x98\
-\xad\xc1\xa4\x2c\x01\xf9\x4f\x34\xee\x03\xc2\x9c\xf4\xa7\x80\x48\
-\xe4\x53\x16\x46\xce\x0d\x48\x1c\x77\xa6\x84\x26\x09\x3e\x94\xe5\
-\x04\x37\x5a\x42\x72\xde\x82\x90\xe7\x3c\x1a\xa0\x27\x07\x1d\xe9\
-\x79\xea\x6a\x00\xd8\x38\x3c\xd4\x81\xbd\x28\x10\xed\xc7\x34\xe0\
-\xd9\xeb\x4d\x5c\x31\xf7\xa5\x2b\xb7\xa5\x31\x0e\xdf\x4e\x0e\xa6\
-\x98\x14\x11\xcd\x48\xb1\xad\x30\x05\x75\xa2\x49\x00\x42\x17\x83\
-\x41\x84\x2f\x43\xcd\x35\xa3\xcf\x7a\x77\x68\x2c\x78\x8f\x8d\x2c\
-\xf5\x3b\x7d\x78\x4f\xac\x48\x92\xc9\x70\x09\x42\x9d\x02\x83\xc0\
-\xfd\x6b\x9d\x61\xb8\x73\x91\xf4\xaf\x4a\xf8\xab\x6b\x8b\x6b\x0b\
-\x91\xfc\x32\x32\x1f\xc4\x67\xfa\x57\x9c\x23\x05\x62\x59\x37\x01\
-\xdb\x35\xfa\x8e\x53\x5d\xd7\xc1\xc2\x6d\x7f\x48\xf9\x7c\x6d\x3f\
-\x67\x55\xa4\x51\x9d\x98\x4a\x9b\x8f\x20\xe0\x1f\x5a\x9f\x00\xa8\
-\x06\x9b\x78\x77\x46\xac\x3a\x6e\xa5\x5f\x98\xd7\xae\xb6\x38\xde\
-\xc3\x65\x66\x58\x58\x30\xdc\x31\xd4\x75\x14\xdb\x46\xcc\x4a\x73\
-\xc0\xa9\x89\x52\x76\x30\xdb\x9e\x01\x3d\x2a\xb5\xb0\xc2\x32\x7a\
-\x35\x02\xfb\x25\xbf\x2c\xca\xeb\xe5\xf0\xf9\xf9\x4d\x56\x2e\xc9\
-\xa9\x01\x22\xa8\x6c\x11\xd7\x20\xd5\xd7\x75\x55\x45\x55\x09\xb8\
-\x7a\xf5\xaa\x57\x23\x6d\xcc\x2f\x8e\x8d\x48\x51\xec\xcb\x6c\xa5\
-\x14\x64\x11\xf5\xa8\xa4\x41\x22\x10\xdd\xea\x79\x25\x37\x32\x02\
-\x7e\xf0\xa8\xd8\xd0\x4a\x28\xd8\x83\x1b\xcd\x19\xce\x41\x19\xc8\
-\xab\x8c\xd5\x52\xdf\x8b\xa9\x72\x73\xc6\x7f\x5a\xb2\x79\xa4\x69\
-\x3f\x88\x07\x5a\xb9\x1b\xc0\xca\x7c\x94\x6d\xfe\x60\xdc\xcc\x7b\
-\x63\x80\x3f\x5a\xa6\x06\x4d\x4b\x69\xf7\xa4\xff\x00\x79\x6b\x9b\
-\x1a\xaf\x84\xaa\xbf\xba\xff\x00\x23\xb7\x2d\xd3\x1d\x45\xff\x00\
-\x7e\x3f\x9a\x2c\x4f\xf7\x45\x55\x7e\x95\x72\x70\x3c\xbc\x93\x82\
-\x3a\x0c\x75\xaa\x52\x1c\x2d\x6f\x86\x77\xa3\x17\xe4\xbf\x23\x83\
-\x10\xad\x88\x9a\xf3\x7f\x99\x4e\x63\x9c\xf7\xa8\xed\x58\xab\x9c\
-\x7a\x1c\xd3\xa6\x3d\x69\x96\xe7\xe6\x35\xba\xdc\xd1\x7c\x26\xad\
-\xac\x98\x20\x76\x1c\xf3\x57\x54\x6e\x0b\xb7\x3d\x94\x7d\x4d\x67\
-\xda\xb8\x0e\x32\x3f\x3a\xbe\x72\xaa\x00\x20\x85\xe4\xe3\xd6\x9b\
-\x3c\xfa\x8b\x51\xaf\x94\xdc\xbd\x95\x80\xa9\x66\x0f\xba\xde\x34\
-\xe3\x71\x2d\x9e\xd8\x1d\x6a\x26\x5e\x88\x3e\xf0\x3c\x8f\x5a\xb4\
-\x40\xdd\x03\x31\xc8\x0c\x54\x8c\xfa\x8a\xcd\xee\x0b\x61\x42\x82\
-\xcf\xbb\x18\x27\xaf\x5a\x4d\xe0\x05\xf2\xbe\x53\xd0\xe4\x70\x47\
-\xaf\x5a\xaf\x68\x53\x6b\x29\x25\x76\xb1\x04\xe7\xad\x58\x45\x59\
-\x5a\x6d\xae\xfe\x58\x00\xb2\x81\xd3\xa7\x35\x0f\x72\x5a\xb6\xe2\
-\xd8\xb4\x63\xcf\x9b\xca\xdc\x4c\x84\x11\x8e\xe7\x38\xfc\x6a\x61\
-\x9d\xaa\x1f\x96\x3d\x71\x51\x5a\xc6\x23\xb5\x93\x2f\xca\x92\x40\
-\x3f\xde\xcf\x71\x53\xf1\x8f\xe7\x9a\x87\xb9\x35\x5d\xd9\x4e\xfe\
-\x2f\x32\x06\x04\xe0\x60\x9c\xd5\xfd\x3e\x14\xb6\xb0\x40\x14\xee\
-\x65\x05\x89\x39\xe6\xa9\xdc\x3a\xc8\xae\xa3\xb8\x0a\x33\xdf\x24\
-\x56\x90\xc0\x8c\x6e\x1b\x54\x0c\xe4\xf0\x2a\x64\xf4\x34\x8f\xc0\
-\x91\xd1\x78\x26\x58\xe3\xd6\x24\x2e\xca\x1d\xa2\x22\x30\x7b\x9c\
-\xf3\x5b\x9a\x44\xf3\xea\x3e\x27\xd4\x6e\x6e\x64\x0b\xf6\x60\x20\
-\x48\x23\x62\xca\x07\x52\xd9\xe9\xd7\xb7\xd6\xb9\x4d\x06\x79\xa3\
-\x7b\xb6\xd2\x74\xd3\xa8\x4e\xf1\x85\x59\xd4\x61\x63\xf6\x24\xe2\
-\xbb\x9d\x02\xc7\xfb\x27\x47\x86\xd9\xe3\x45\x97\x1b\xa5\x29\xfc\
-\x4c\x7a\x9c\xf7\xaf\x8c\xce\x25\x1a\x72\xa9\x3e\xb2\x49\x2d\xaf\
-\xdd\xff\x00\x91\xf4\xd9\x7a\x72\x84\x23\xd1\x6a\x69\x07\x3b\xba\
-\x51\xb9\x7b\x8a\x04\xe0\x9e\x94\xe6\x91\x08\xe0\x64\xd7\xc8\x33\
-\xde\x23\xf9\x73\xd6\x9d\xf2\xfa\xd2\x00\x09\xe9\x4f\xd9\xed\x48\
-\x0a\xf9\x03\x9e\xd4\xde\x37\x64\x53\x77\x13\xc6\x3e\x86\x9a\x49\
-\x07\x91\xcd\x66\x51\x20\x6c\x9c\xf6\xa4\x32\x26\xd2\x31\x4c\x42\
-\x7e\x94\x16\xf9\xb9\x14\xc4\x2a\x91\x83\x8e\x68\x56\xe7\x04\x52\
-\x16\x1d\x3a\x1a\x41\x95\x3c\x50\x04\x99\xc2\xf4\xc5\x35\x58\x06\
-\xe4\x53\xb2\x48\xf9\x86\x2a\x39\x03\x15\xf9\x69\x58\x64\xcb\x70\
-\xa0\xfc\xc2\xa5\x59\x51\x8d\x53\x45\x38\xf9\x85\x4d\xb0\x15\x05\
-\x7a\xd5\x21\x12\xb3\xe4\xe0\x0e\x29\x54\x7b\xe2\xa2\x52\xe3\x82\
-\x30\x29\xe9\x1b\x03\x92\x69\x81\x21\x3c\xf5\xa3\x73\x7f\x0d\x28\
-\x5c\x1e\x79\xa6\x9c\x8e\x9d\x29\x88\x52\xe5\x48\x23\xad\x4a\x26\
-\x27\xa8\xa8\x8e\x38\x3d\x6a\x78\xc8\x34\x08\x37\xe7\xa0\xa5\x0e\
-\x45\x2f\x50\x40\xc5\x0c\x0e\xde\x3a\xd3\x11\x1b\x4c\x7a\xd3\xc3\
-\xe4\x53\x19\x78\xf9\x85\x18\x25\x70\xa2\xa9\x01\xc0\x7c\x48\xd1\
-\x6e\x26\xb5\x93\x54\x37\x6c\xd0\xc2\x14\x2d\xbe\x38\x19\x38\x27\
-\xf5\xaf\x35\x35\xed\xde\x32\x58\xbf\xe1\x13\xbe\x5b\x99\x15\x37\
-\x44\x42\x6e\x38\xcb\x76\x15\xe2\x1d\x40\xaf\xd1\x38\x7e\xb4\xea\
-\x61\x6d\x2e\x8e\xc8\xf9\xec\xc2\x0a\x35\x2e\xba\x95\x6e\xfe\x48\
-\x8f\x19\x19\xcf\x1d\xaa\x48\x70\x50\x11\xdc\x53\xa7\x52\xf0\xb0\
-\x07\x19\x15\x0d\xae\x7c\xb0\x2b\xe8\xcf\x37\xa1\x61\xa2\x25\x70\
-\xc3\x83\x55\xe1\x46\x8a\xe1\xd0\xe7\xa6\x45\x4c\x1b\x6b\xe4\xfd\
-\xdf\x43\xd2\x98\xd2\x49\x15\xe9\xc3\xb2\xe5\x72\x00\x34\x09\x6c\
-\x48\x40\x91\x76\xb0\xc8\xed\x55\x6e\xc3\x46\xa8\x41\xca\x86\xe8\
-\x7b\x55\xa5\x63\xf7\x98\xe4\xfb\xf3\x51\x5d\x10\xd6\xce\xaf\x80\
-\xc3\x90\x7d\x45\x01\x1d\xc9\x15\xb6\x80\x41\xc1\xed\x8a\x96\x32\
-\xbc\x33\x8e\x33\xc8\x15\x5e\x03\xbe\x30\x4e\x32\x05\x3d\xa5\xf9\
-\xff\x00\x78\x71\x9e\x84\xf4\xa4\xc9\xb6\xa4\x41\x44\x5a\x94\x88\
-\x08\x6c\xae\x72\xbd\x3b\x70\x2a\x43\xd7\x8a\x84\xe1\x75\x21\x8e\
-\xea\x7b\xfb\x54\xf8\xc0\xcf\x73\x41\x52\xdc\x4e\x9d\x6b\x4e\x35\
-\x95\x61\x72\xdb\x12\x14\x54\x45\x00\x0f\xde\x31\x39\xcd\x66\x7d\
-\x6a\x6b\x67\x25\xa4\x52\x49\x18\x5c\x67\xb7\xcc\x2b\x0c\x52\xbe\
-\x1e\x6b\xc9\xfe\x47\x46\x0b\x4c\x55\x27\xfd\xe5\xf9\xa2\xcc\xc3\
-\x31\xf1\xda\xa8\xc9\xef\x57\xe6\x1f\xba\xac\xf9\x7a\x53\xc1\xbb\
-\xe1\xa9\xbf\x25\xf9\x18\xe3\x15\xb1\x95\x57\xf7\xa5\xf9\xb2\x94\
-\xc7\x93\x8e\x94\xcb\x66\x2a\xf9\x1e\x94\xe9\x7b\xd3\x6d\xcf\xcc\
-\x7e\x95\xd8\xb7\x2b\xec\x9a\x56\xa5\x43\x82\xdd\x2a\xf0\x6c\x01\
-\xdc\x63\x71\xaa\x16\xa8\x1d\xc0\x3d\x3b\xd5\xe4\x18\x4d\x9d\x9b\
-\xa9\xf4\x14\x33\xcf\xa9\xb8\x84\x96\xc3\x77\x27\x3f\xa5\x3b\x26\
-\x6b\xe5\x42\x78\x85\x32\x7d\xc9\xa0\x95\x76\x54\x88\x12\x77\x1e\
-\x0d\x4f\xa7\xcf\xe4\xdf\xdd\x49\x1a\x8d\xcc\x02\xe0\x8e\x9e\xff\
-\x00\xa5\x67\x2b\xf4\x12\xb2\x57\x23\x85\x4a\xcd\x30\xdb\x80\x1c\
-\x75\xf7\x1e\x94\x2c\x9e\x43\xcc\x08\xe5\x87\x1f\x4a\x4b\x36\x1e\
-\x7c\xb7\x32\x61\xb7\xb3\x1e\x4f\x5a\x7c\xaf\x1c\xac\x1a\x16\x07\
-\x39\x18\x61\x53\xd4\x1a\x57\xb1\x2d\xae\xe6\x8f\x2c\x06\xf2\xdb\
-\xb2\x0f\x6e\xbf\xe1\x53\xc8\x3b\xb7\xe5\xe9\x55\xad\xe7\x7b\x68\
-\x3c\xd4\xda\xfb\xf0\xa3\xd0\x1a\xb0\xde\x69\x8f\x6c\xac\x0b\x7f\
-\x17\x18\xa8\x7b\x99\xcb\x7b\x99\xb3\xb4\xd2\xce\xb1\x43\x85\xf3\
-\x18\x0c\xfb\x8e\x6b\x52\x3b\x10\xa0\x19\xa5\x92\x62\x3a\x07\x6e\
-\x07\xe1\x50\xc5\x0a\xb5\xc4\x38\xc6\xe1\xb9\xb9\xfc\x05\x68\x98\
-\xc9\x98\xaa\x64\xf6\xc7\xad\x67\x29\x1b\x49\xda\xc9\x1d\x6f\x81\
-\x6f\xa0\x6b\x5b\x9b\x74\x38\x92\x37\xdc\xc3\x1d\x88\xff\x00\xeb\
-\x57\x5a\x1f\x77\x20\xd7\x0d\x6b\xa8\xa6\x8f\xa1\x5a\xa5\xba\x47\
-\x25\xe5\xcb\x95\x44\xcf\x53\xbb\xbe\x39\xef\x5d\x9c\x31\x30\x8c\
-\x6e\x60\x5b\x1c\xe3\xa1\x35\xf9\xbe\x6f\x4e\x5f\x58\x95\x5b\x59\
-\x49\xbb\x7c\xba\xfa\x1f\x65\x81\x92\xf6\x4a\x1d\x52\x5f\x88\xe3\
-\x2e\x0d\x05\xb8\xf9\x45\x2f\x96\x0f\x26\x93\x69\x27\x8e\x05\x78\
-\xa7\xa0\x39\x77\x75\xa7\x6e\x6a\x6f\xe3\xcd\x1f\x35\x20\x23\x69\
-\x17\xf8\x4d\x20\x07\x6e\x5b\xad\x47\x85\x2c\x31\xd2\x9f\x9e\x70\
-\xa7\x22\xa4\x09\x0e\x36\x0c\xf5\xa6\xe1\x73\x90\xd4\x16\xc0\xe7\
-\x9a\x5f\x2c\x3a\xfa\x53\x02\x35\x01\xa4\xc8\xe6\xa4\x27\xe6\xf9\
-\x45\x22\xc7\xb7\xa1\x14\x8e\x0a\x50\x21\xc5\x5d\x8f\xcc\x2b\x37\
-\x59\xd5\x64\xd3\x6e\xac\x2c\xad\x2d\xa3\xb8\xbb\xbf\x77\x58\x84\
-\xd3\xf9\x51\x8d\xab\xb8\xe5\x82\xb1\xce\x3a\x00\xa7\x3e\xd8\xad\
-\x02\x49\xe5\x89\xfc\x2b\x9b\xf1\x76\x97\x2e\xac\xfa\x7c\x73\xd8\
-\x4b\xab\x69\x48\xce\xd7\x56\x50\xca\xb1\xbb\xbe\x07\x96\xf9\x66\
-\x50\x54\x7c\xd9\x5d\xc3\x92\xbc\x1c\x71\x51\xb5\xf5\x13\xbd\xb4\
-\x16\x0f\x15\x49\x79\x0d\x94\x76\x3a\x7a\xbe\xa1\x77\x24\xe9\xe4\
-\xc9\x73\xb6\x15\x10\xb6\xd7\x7f\x30\x29\x25\x77\x60\x29\x0b\xce\
-\x47\x03\x9c\x5e\xd3\x3c\x4f\x65\x2e\x9b\x24\xfa\x9c\x90\x69\x93\
-\x41\x34\x90\x4f\x14\xf3\xa8\x0a\xf1\x9f\x9b\x0c\x71\xb9\x79\x07\
-\x38\x1c\x11\xd2\xb9\xed\x37\x48\xd6\x74\x99\xb4\x9b\xff\x00\xb0\
-\xcb\x73\x15\x9f\xda\xad\xd6\xc4\x4f\x1b\x4d\x0d\xbc\x85\x4c\x43\
-\x73\x30\x56\x2b\xe5\x80\x7e\x63\xc1\xe0\x9c\x73\x3d\x8f\x87\xef\
-\x57\x5a\xd3\x35\x1b\xdb\x34\xf9\xaf\xee\xef\x67\x8c\xb2\xb7\xd9\
-\xbc\xc4\xdb\x18\xeb\xcb\x0c\x0c\x95\xc8\x07\x38\x38\xe6\xad\xa8\
-\x93\x76\x74\xf0\x6b\xba\x55\xd5\xd4\x16\xd0\xea\x96\x52\x4f\x70\
-\x9e\x64\x11\x25\xc2\x16\x95\x79\xf9\x94\x67\x24\x70\x79\x1e\x87\
-\xd2\x9f\xff\x00\x09\x0e\x8a\x97\x22\xd4\xea\xb6\x26\x72\x1c\x88\
-\xbe\xd2\x9b\xb0\xbb\x83\x1c\x67\x3c\x6d\x6c\xfa\x6d\x3e\x86\xb9\
-\x98\x7c\x3b\x73\x06\x8e\xb1\xc5\x63\x1c\x72\xff\x00\xc2\x44\x6f\
-\xc8\x52\x83\xf7\x5f\x69\x2c\x1f\x39\xeb\xe5\xe3\x8e\xb8\xe3\x1d\
-\xaa\x18\x7c\x37\x70\x74\x58\xed\xe7\xd3\x61\x69\x0f\x88\x5a\xfe\
-\x55\x6d\x87\x74\x66\x66\x21\xcf\xa9\xd9\x8f\x7c\x71\xed\x4a\xd1\
-\x0b\xb3\xb2\xb7\xd5\xac\x6f\x6c\x5a\xf2\xc6\xee\xde\xe6\xd4\x67\
-\x33\x43\x28\x74\x18\xeb\xc8\x38\xe2\xb2\xf4\x9f\x13\xda\x4d\xa3\
-\xd9\xdd\xeb\x77\xb6\x5a\x7c\x9a\x81\x69\x2d\x21\x9a\x51\x1b\x3c\
-\x45\xbf\x77\xc3\x1c\x96\x2a\x54\x9c\x77\x35\x89\xab\x5b\x5c\x2d\
-\xde\xaf\xa7\x08\xcc\x2b\xe2\x2b\xe8\x61\x8d\xd0\x8c\x98\x44\x2a\
-\x27\x6e\x3a\x1d\xa8\xe3\x9c\x72\x45\x5d\xd7\x6d\x2f\xe3\xd5\xad\
-\xee\x3c\x37\x69\x79\x15\xda\xc3\x1c\x02\x74\x68\x3e\xca\xd1\x87\
-\xc8\x49\x55\xdb\x7e\x07\xcc\x73\x18\x0d\x86\xe0\x9e\x82\xac\x82\
-\xec\xeb\x95\x06\xee\x2a\x55\x5c\x7d\xda\xa1\x72\x66\x96\x09\x23\
-\x86\x69\x2d\x9d\x86\x16\x58\xc2\x96\x53\xea\x03\x02\x3f\x31\x59\
-\x63\x46\xd4\xdb\x97\xf1\x3e\xaa\x7d\x82\x5b\x2f\xf2\x86\xa5\x0c\
-\xe9\x4a\xaa\xb7\x5a\x77\xcb\x8e\x95\xcb\x9d\x06\x63\x8f\x33\x5d\
-\xd5\xdf\xfe\xdb\xaa\xff\x00\xe8\x2a\x28\xff\x00\x84\x7a\x06\x1f\
-\xbd\xd4\xb5\x77\x3f\xf6\x12\x99\x7f\xf4\x16\x15\x56\x42\x3a\x46\
-\xda\xdd\xe8\xc8\x5e\x01\xae\x78\x78\x57\x4c\x2b\x97\x97\x52\x93\
-\xfd\xfd\x56\xe5\xbf\x9c\x94\x87\xc2\x7a\x19\xfb\xf6\xae\xff\x00\
-\xf5\xd2\xe2\x47\xfe\x6d\x4d\x58\x5a\x95\xbc\x6f\x7b\xa0\xbd\x9c\
-\xb6\x7a\x95\xcc\x2d\x7d\x0c\x42\x78\x2d\x5a\x4d\xae\xfb\x89\x50\
-\x40\xee\x32\x0e\x71\xe9\x5e\x40\xe3\x61\x2b\xe8\x6b\xd2\xf5\xdf\
-\x87\xfe\x1d\x8a\x49\x75\xb4\xd3\xe3\x92\xe2\xd6\xdf\x11\xc0\xe0\
-\x98\x89\x04\x9d\xc5\x47\x25\xb9\xc7\x27\x1c\x0a\xf3\x59\xff\x00\
-\xd7\x3f\x18\xc9\xc9\xaf\xaa\xe1\xda\xd5\x7e\xb0\xe9\x36\xf9\x6d\
-\x7b\x5b\x4b\xa7\xdf\xe7\xb1\x8e\x3e\x85\x27\x97\x7b\x5b\x2e\x75\
-\x34\xaf\x7d\x6c\xd6\xd6\xb6\xda\x6f\x72\x09\x51\x5a\x33\xb8\xf6\
-\xe2\xab\x5b\x93\xb7\x07\xb1\xab\x4d\xd0\xe2\xab\x45\xff\x00\x1f\
-\x12\x64\x6d\xe7\xa0\xaf\xba\x47\xca\xad\x8b\x04\x64\x60\xd5\x39\
-\x7f\x75\x79\x19\xec\x45\x5c\xaa\x97\x4c\x0c\xa9\x95\xda\x73\xc1\
-\xf5\xa6\x11\x2d\x03\xda\x9b\x79\x0a\xb5\xb9\x00\xe5\x82\xe4\xe2\
-\x84\xfb\xb4\xe1\xb3\x2c\x25\x6d\x8a\x41\xe7\xdf\xd2\x91\x2b\x72\
-\x1b\x42\x3e\xcc\x3d\xb8\xa9\xb0\x58\x72\x32\x3e\x95\x52\xd4\xe5\
-\x0a\xf6\xdc\x6a\xe3\x06\x60\x02\x92\x31\xcf\x14\x15\x2d\xca\x2f\
-\x19\x8b\x51\x8f\x6e\x48\x6e\x82\xae\x03\xb8\xfb\x0a\xad\x70\xee\
-\x6e\xa2\x12\x00\x19\x7a\x15\x1d\x6a\xc8\xfb\xb8\xe9\x40\x4b\xa0\
-\xe3\x8c\xf0\x7f\x3a\x9e\x1f\x2a\x32\x07\xce\xd2\x48\xbc\xf4\x01\
-\x70\x78\xfa\xd5\x6a\xb3\x04\xc5\x84\x91\x6c\x5e\x14\x1d\xf8\xf9\
-\xb8\x3d\x33\xf8\xd6\x75\xd5\xe9\x49\x79\x32\xf0\xd7\x55\xe0\xfc\
-\xd7\xe6\x59\x94\x66\x13\x59\xf3\x80\xa9\x90\x73\x9a\xd1\x95\x48\
-\x83\x3d\x98\x7a\xd6\x74\xa0\x6d\x39\x24\x7a\x56\x58\x07\x7c\x25\
-\x27\xfd\xd5\xf9\x21\xe6\x2a\xd9\x85\x75\xfd\xf9\x7f\xe9\x4c\xcd\
-\x98\xf5\xa2\xd5\x49\x27\x1d\x87\x34\xb2\xf0\x0f\x14\x96\xc4\xe0\
-\xe0\xe3\x8e\x6b\xb9\x6e\x4f\xd9\x34\x22\x67\x88\x0f\x46\x19\xc5\
-\x69\x21\x2f\xf2\xa6\x3e\x63\xf9\x0a\xce\xb7\x75\x19\x0d\xd4\x8c\
-\x03\x5a\x0b\x84\x0e\xc9\x90\x30\x15\x5b\xb7\x34\xd9\xc1\x53\x70\
-\x2a\x16\x64\x68\xce\x54\x93\xc9\xeb\x53\x46\x04\x12\x5c\xb1\x55\
-\x2c\x50\x11\x91\xed\x51\x2a\x83\x32\x8f\xba\x08\x3b\x46\x6a\x49\
-\x58\x34\x8f\x18\xcb\x11\x09\xcf\xb7\xa5\x66\xc8\xf2\x21\xb7\x25\
-\xac\x80\x3c\x02\xa4\x93\xf8\xd2\xcf\x2a\x49\x6e\xaa\x18\x28\xc6\
-\x47\x1c\xe7\xfa\xd0\xd2\xad\xbd\xa2\x8c\x64\xed\x0a\x3d\xf8\xaa\
-\xbb\x3f\x74\xa1\xce\x49\x2b\xc6\x79\xe4\xd4\xdb\x53\x4b\x5d\xdc\
-\xd6\xb2\x58\xa1\xb5\x1e\x62\x92\x43\xe0\x28\x3c\x9a\x74\xe7\xa9\
-\x23\x02\x95\x55\x91\x1e\x36\x01\xc2\xe0\x87\xa8\xa6\x77\x78\x8e\
-\xde\x2a\x3a\x98\x35\x76\x16\xd7\x51\xc7\x3a\xbb\x06\x93\xe4\xdb\
-\xb5\x57\x3d\xc9\xa9\x9c\xdc\x5c\xe7\x03\xec\xc9\xd4\x73\x96\x3f\
-\xe1\x54\x74\xad\xeb\x23\x19\x06\x55\x89\x0a\xc7\xd4\x73\x5a\xc0\
-\x64\x81\xea\x6b\x39\xe8\xee\x6e\xfe\x34\x8e\xeb\xc3\x1a\x1c\x36\
-\x5a\x4c\x12\xcd\x6d\x12\xdc\xba\xee\x69\x07\xcc\xc7\x3e\xa4\xf7\
-\xfa\x57\x41\xdb\x8a\xaf\x6c\x76\x5a\xc4\x83\xf8\x50\x0f\xd2\x9c\
-\xce\xca\x73\x9c\xd7\xe5\x18\xba\xf3\xad\x5a\x53\x93\xea\x7d\xdd\
-\x1a\x71\xa7\x05\x14\x59\xe4\x0e\x69\xd8\xe8\x0d\x56\x5b\x92\x3a\
-\x8c\xd4\xbe\x66\xe4\xe7\x8a\xe4\x36\x25\x00\x66\x9d\x81\xeb\x55\
-\x98\x90\x3e\xf6\x29\xbe\x61\xfe\xfd\x20\x29\xac\xdb\x81\xa5\x13\
-\x32\x2e\x71\x91\x55\xe2\xdb\xbf\x93\x4f\x2a\x0b\x61\x4f\x19\xe9\
-\x52\x80\xb1\x14\xc1\x8f\x22\xac\xf9\x88\x46\xdc\xe3\x8a\xaa\xa0\
-\x6d\xc0\xe0\xd3\x7c\xa7\x3c\x93\x54\x22\x62\x3a\x95\x7a\x58\xd8\
-\x8e\x58\xe4\x54\x27\x76\x39\xa8\x9f\x79\x1d\xe8\x19\xa8\x92\x20\
-\x5e\x71\x4d\xdc\xac\xdc\x0a\xa0\x8c\xdb\x32\x6a\x75\x94\x80\x31\
-\x51\x7d\x47\x62\xc3\x6d\x38\xe7\x15\x2a\x2a\x85\xcf\x5a\xa8\x19\
-\x5d\xb1\x9e\x94\x7d\xa5\xa3\x6c\x75\x15\x69\x12\x5a\x68\xb2\x3a\
-\xe2\xa3\x61\xb0\xe3\x34\x24\xbb\x86\x4d\x27\x9c\xa5\xbe\x6a\xab\
-\x08\x96\x35\x25\x47\x19\xa4\x76\x90\x70\x06\x29\xa2\xe0\x83\x84\
-\x1c\x50\xee\xcc\xdd\x69\x88\x11\x9b\xf8\xf9\xa7\x99\x3d\x05\x30\
-\xa9\xfe\xf5\x29\x0a\x17\x93\x9a\x62\x23\x2e\x49\xc6\xea\x55\x19\
-\xeb\x9f\x63\x42\x84\xcf\x4e\x69\xf9\xdb\xd6\x98\x12\x28\x40\xbe\
-\xf4\x85\xbb\x53\x42\xbb\xfd\xde\x05\x39\xe3\x18\xc1\xeb\x4d\x08\
-\x7f\x96\x92\x21\x56\xe7\xd6\xbc\x73\xc7\x56\x8b\x69\xe2\xa9\x82\
-\x0c\x2c\x88\xae\x07\xe9\xfd\x2b\xd8\x52\x22\x14\xed\x3d\x45\x79\
-\x17\x8e\xed\x75\x18\xf5\xb1\x36\xa5\xb3\x6c\x9b\x96\x1d\xa7\xf8\
-\x47\xff\x00\xae\xbe\x97\x87\xdd\xb1\x2f\x5e\x87\x9f\x8f\x57\xa5\
-\xb1\xcb\x9a\xac\x46\xcb\xbe\x3b\x8a\xb6\x0a\x8f\xbd\x55\xa7\x01\
-\x6e\x11\xcf\x19\xe2\xbe\xf9\x33\xc0\x44\x99\xaa\xd7\x80\x94\x07\
-\x23\x8a\xb0\x3a\x64\xd4\x57\x08\x1e\x16\xc8\xe8\x32\x0d\x50\x47\
-\x71\xf1\x72\x80\xfb\x52\xb8\xdc\x8c\x08\xcf\x1d\x29\x96\xe7\xf7\
-\x2b\x53\x10\xe7\x88\xce\x09\xe7\xa5\x21\x6c\xca\x16\x47\x63\x38\
-\x3c\x60\xf4\xad\x24\x9b\x11\xec\xe8\x5b\xda\xb3\xe1\x62\x66\x7d\
-\xe0\x03\x9e\x71\x56\x88\xdc\xa0\x8e\xa3\xa5\x03\x9a\xbb\x23\xbe\
-\x19\x68\x5c\xb7\x39\x18\xe3\xb5\x4c\xe1\x43\x0d\x8c\x49\xee\x31\
-\xd2\xab\x5d\xca\x8d\x0a\xf5\x12\x06\xe4\x62\xa7\x51\x92\x4d\x01\
-\x2d\x90\xef\xad\x59\xb6\x81\xb7\x19\x0b\x28\x12\x2b\x2a\x82\x79\
-\x38\xc1\x3f\xe4\xd5\x6e\xa7\xd2\xad\xdb\x4b\x12\x6e\x06\x32\x66\
-\x58\xd8\x29\x27\x81\x9e\xa7\xeb\x8f\xe7\x53\x51\x5e\x0d\x0a\x9b\
-\xb4\xd3\xf3\x2c\x48\x73\x0e\x31\xda\xb3\x26\xef\x5a\xac\x41\xb6\
-\x2a\x40\xc8\xe4\x10\x2b\x2e\xe0\xf0\x70\x2b\x97\x2c\x77\xc1\x51\
-\x7f\xdd\x8f\xe4\x8e\x8c\xd9\x5b\x34\xc4\x2f\xfa\x79\x3f\xfd\x29\
-\x99\x93\x1e\xb4\x5a\x8c\xe7\x9e\xd4\x93\x77\xa5\xb6\x6c\x03\xef\
-\x5e\x82\xdc\xcb\xec\x17\xa3\xe7\x19\xad\x28\xbe\x5d\xa1\xff\x00\
-\xd5\xae\x19\xb8\xcd\x52\xb6\x03\x6b\x3b\x0c\x80\x31\x56\xfa\x63\
-\x7f\x1b\xb0\x4e\x3b\x0a\xa6\x70\x54\xdc\x95\xbf\x7f\x3a\xf0\xb9\
-\x51\xc8\x03\x1d\xe9\xba\x68\x2c\xb3\x92\x4e\xfc\x9c\xb3\x1e\xbe\
-\xd4\x85\x49\xb8\x0d\x10\x03\x38\x24\x13\xc0\xab\x16\xf1\xa1\x69\
-\x9a\x33\x85\x32\x12\x70\x73\x59\xb2\x1e\x91\x29\x4a\x09\xb5\x43\
-\xd0\x21\xc1\xef\xd2\x91\x22\xf3\x64\x8c\x07\xe7\xcc\xce\x71\xe8\
-\x29\x64\x77\x17\x53\x46\x07\xca\x46\x0e\x3b\xf1\x45\xa8\x31\x49\
-\x6c\xcf\xbb\xab\x31\xf5\xc7\x4a\x46\xaa\xf6\xb9\xb0\x01\x9a\x38\
-\xb2\xc0\x3c\x79\xdc\xb5\x0a\x1d\xd8\x4f\x56\xc7\x4f\x7a\xbb\x3a\
-\xac\x42\x3c\x28\xdd\xb7\xae\x33\xd7\x9e\x6b\x26\xe2\x53\x6b\x32\
-\x4c\x46\xe5\xdd\x92\x2b\x28\xea\x73\xc1\x73\x34\x58\x8b\x0f\x34\
-\x28\x3a\x06\x67\xc0\x18\xc0\xc9\xad\x05\xb7\x6b\x99\xa3\x8a\x27\
-\x28\x64\x70\xa1\xbd\x0d\x52\xd3\xc0\x70\xd3\x2a\xe1\x70\x00\x39\
-\xeb\x5b\x1a\x4a\x99\x35\x8b\x65\x51\x91\xbf\x38\x1d\xab\x9f\x11\
-\x2e\x4a\x72\x92\xe8\x99\xd1\x49\x73\xd6\x8c\x7c\xce\xfa\xcd\x24\
-\x82\xd6\x38\xd9\xda\x56\x45\x00\xb9\x18\xdd\xef\x53\xfc\xc7\xe9\
-\x51\xc6\x4f\xbd\x4e\xbc\x8c\xf5\xaf\xc9\x66\xdc\xa4\xe4\xfa\x9f\
-\x7b\x1d\x15\x85\x0a\x36\xe7\xbd\x39\x4a\x95\xc6\x79\xa6\x02\xc4\
-\xe0\x53\xb6\x0c\x75\xc1\xa8\xb1\x40\x54\xb3\x74\xcd\x2f\x97\x42\
-\x82\x3b\xe4\x54\x98\x34\x80\xe6\xee\x6f\x7e\xc3\x6a\xb3\x35\xb4\
-\x97\x0e\xf3\x45\x0c\x70\xc3\xb4\x33\xbc\x92\x2c\x6a\x06\xe2\x07\
-\xde\x61\xd4\x8a\xb6\xb1\xf8\x81\x58\x91\xe1\x0d\x4f\x9f\xfa\x78\
-\xb3\xff\x00\xe3\xf5\x06\xaf\x6e\xf1\xc7\xa7\x33\x10\x47\xf6\xb6\
-\x9f\xd3\xfe\xbe\xe2\xaf\x4f\xad\xe9\x53\x8c\xa3\x76\x63\x52\x6e\
-\x2e\xc8\xf3\x7d\xbe\x22\xed\xe1\x1d\x4f\xff\x00\x02\x2c\xff\x00\
-\xf8\xfd\x38\x7f\xc2\x47\x8c\x37\x84\xb5\x3f\xc2\xe2\xcf\xff\x00\
-\x8f\xd7\xa3\x56\x0f\x8b\xb5\x8b\xbd\x17\x49\x82\x6b\x02\x8b\x2c\
-\xd7\x51\xc0\x59\xec\xe4\xba\xda\x1b\x39\x22\x28\xc8\x66\x3c\x74\
-\x06\xb5\xf6\x30\x33\xf6\xb2\x39\x52\x9e\x21\x3f\xf3\x29\xea\xb8\
-\xf4\xfb\x45\x9f\xff\x00\x1f\xa7\x6c\xd7\xc0\xff\x00\x91\x4b\x55\
-\xff\x00\xc0\x8b\x3f\xfe\x3f\x57\x6d\xbe\x26\x58\x40\x74\xdb\x3d\
-\x54\x2b\xdf\xde\x24\x64\x1b\x79\x22\x45\x6f\x31\xca\x44\x56\x37\
-\x93\x7f\xcf\x80\x70\x03\x6c\xdd\xf3\x91\x82\x6a\xdd\x87\x8f\x7e\
-\xd7\x63\x6f\x34\xba\x06\xa1\x0c\xb3\x5b\x49\x76\xd1\xf9\xb6\xfb\
-\x63\x89\x38\x2c\x5d\xa5\x0a\x01\x24\x01\x9c\x1e\xe4\x00\x09\xa3\
-\xd8\xc0\x3d\xac\x8c\x60\x9e\x20\xef\xe1\x2d\x53\x1f\xf5\xf1\x67\
-\xff\x00\xc7\xe9\x76\xf8\x80\x1e\x3c\x23\xaa\x7f\xe0\x45\x9f\xff\
-\x00\x1f\xad\xcd\x33\xc7\xb6\x7a\xd4\x70\xff\x00\x64\x69\xd7\x97\
-\xb2\xc8\xee\xaf\x15\xbc\xb6\xef\xe5\x04\xd9\x97\x32\x09\x7c\xb2\
-\x3f\x78\xbf\x75\x98\xf2\x78\xe0\xe2\xb5\xa7\x8f\x8c\xc9\x0c\xf7\
-\xda\x5d\xdd\x88\x96\x3b\xaf\x2e\xd0\xac\x72\xc9\x3b\xc5\x3c\x50\
-\xa8\x57\x59\x30\x0b\x3c\xa1\x76\x91\xd4\x93\xb8\x2a\xe5\x97\xb0\
-\x80\x7b\x59\x19\x84\x78\x87\x39\x1e\x11\xd5\x07\xfd\xbc\x59\xff\
-\x00\xf1\xfa\x55\x1a\xfe\x30\xfe\x10\xd5\x3f\x0b\x8b\x3f\xfe\x3f\
-\x5b\x33\xf8\xfa\xde\xdd\x8c\x4f\xa2\xea\xa6\xea\x35\x9d\xee\x2d\
-\x42\xc2\x5e\xdd\x61\x58\x99\xd9\x8f\x99\xb4\x8d\xb3\xc6\x46\xd6\
-\x6c\xe7\xd7\x8a\xb3\xe2\x1d\x72\xfb\x4d\xba\xd3\x65\xb5\x30\xc5\
-\xa6\xcc\x73\x71\x75\x35\xb4\x92\xa8\xcb\x2e\xd4\x25\x18\x18\x41\
-\x52\xc7\xcc\x60\xca\xb8\xe7\x1c\x65\xfb\x18\x8b\xda\x48\xe7\xb1\
-\xaf\x0e\x9e\x12\xd5\xb1\xff\x00\x5f\x16\x7f\xfc\x7e\x9d\x9d\x77\
-\xfe\x85\x0d\x57\x3f\xf5\xf1\x67\xff\x00\xc7\xeb\x52\xe3\xe2\x36\
-\x99\x67\x6b\x25\xd5\xf5\x8d\xf5\xa5\xb8\x56\x30\x4d\x37\x92\xa9\
-\x71\xb6\x54\x84\x85\x3e\x67\xcb\x87\x91\x46\x64\xd8\x30\x49\xce\
-\x01\x22\xb7\xfc\x2d\x9f\x0d\xff\x00\xa0\xfe\xf1\xbf\xd2\xcf\xcd\
-\xfb\xfb\x7f\xdc\xfe\xf0\xc7\x93\xfb\xdf\xde\x7c\xc0\xff\x00\xaa\
-\xf3\x38\x19\xee\x32\xfd\x94\x43\xda\x48\xa7\x9d\x7f\xbf\x84\x75\
-\x5f\xfc\x08\xb3\xff\x00\xe3\xf4\x99\xf1\x07\x6f\x09\x6a\xbf\xf8\
-\x11\x67\xff\x00\xc7\xeb\x7f\x4d\xf1\x54\xba\xaf\x8a\x21\xb1\x82\
-\xc2\x68\x2c\x25\xb3\x9e\xe2\x3b\x99\xc2\x7f\xa4\x6c\x92\x34\x0c\
-\x9b\x5c\x90\xa4\x39\x3f\x32\xa9\xfb\xb5\xd2\xd3\xf6\x71\x0f\x69\
-\x23\xcf\x8b\xeb\xe7\xa7\x84\xb5\x61\xff\x00\x6f\x16\x7f\xfc\x7e\
-\xa0\x5d\x46\xf6\x1d\x4e\x2b\x0d\x4b\x48\xbe\xd3\xa5\x9e\x19\x26\
-\x89\xae\x1e\x07\x57\x54\x64\x0d\xfe\xae\x46\xc1\xfd\xe2\xf5\xc5\
-\x7a\x45\x71\x7e\x2c\xe7\xc6\xfa\x20\xe9\xff\x00\x12\xeb\xef\xfd\
-\x19\x6b\x53\x2a\x71\x4a\xe3\x8c\xdb\x76\x22\x12\xb4\x8d\xc1\x18\
-\x15\x21\x67\x55\x19\xf9\xaa\x30\x8d\x19\x25\x40\xc5\x3a\x39\x58\
-\x9e\x46\x45\x60\x6c\x3d\x6e\x5d\x80\xda\xa4\x54\x89\x21\x1f\xeb\
-\x07\x34\xd1\xcb\x64\xf0\x33\xd2\x96\x46\x0c\xdf\x29\xaa\x11\x37\
-\x9c\x00\xf9\x78\xae\x07\xe2\x7b\xc3\x25\x9d\x99\xde\xbe\x6a\xc8\
-\x7e\x5e\xf8\x22\xb6\xb5\xbd\x61\xe6\x49\xb4\x9f\x0f\xb3\xcb\xab\
-\x95\xc0\x68\xc2\x94\xb5\x27\xa3\x48\xcc\x08\x03\xfd\x9c\x12\x7b\
-\x0e\xf5\xc4\xdc\x78\x73\x56\x8f\xc2\x13\xea\x7e\x2c\xba\x6b\x9d\
-\x64\xbe\x76\xfc\xbb\x62\x40\x70\x07\xca\x00\xe7\x93\xf8\x8a\xf5\
-\xb2\x99\x46\x18\xb8\x4a\x4c\xe5\xc4\xa7\x2a\x6d\x23\x94\xda\x48\
-\x3c\x71\x55\x6e\x53\x6b\x21\x04\xe0\x1e\x95\x68\x93\x8e\x0d\x47\
-\x78\x47\xd9\xc6\x06\x0f\x53\x5f\xa5\x26\x7c\xdf\x51\x73\x9e\x9d\
-\x28\x64\x26\x32\x7a\x0c\x53\x50\xf4\xa7\x17\xc1\xf9\xd4\xb2\xfa\
-\x0e\xb5\x64\xf5\x20\xb5\x3f\xb8\xe7\xb1\xc5\x4a\x79\x53\xd7\xa5\
-\x45\x6c\x03\x6e\xc7\x4c\xe7\x06\xa7\xc5\x03\x7b\x94\xd3\x06\xf4\
-\x85\xc8\xc8\xe7\x35\x74\x70\x2a\xac\xa0\x8b\xc8\xdb\xb1\x15\x6c\
-\x1a\x06\xca\x57\xf1\x92\x9b\xd5\x73\x8e\xa7\xd2\xac\xc6\xf9\x89\
-\x40\x3d\x46\x4d\x25\xde\xf8\xe1\x75\x7c\x30\x3d\xfb\x8a\x6c\x3f\
-\xea\x97\xdc\x0a\x04\xf5\x89\x2f\xb5\x4f\x6d\x14\x8f\x29\x2a\x3e\
-\x52\x8c\xa0\x92\x39\x38\xce\x05\x41\x56\xad\x9e\x10\xc0\xb0\x2d\
-\x22\xa3\xed\x53\xd3\x38\xeb\xf8\x0c\xfe\x94\xde\xc6\x77\x68\xb7\
-\x8c\xc4\x7e\x95\x97\x73\xde\xb5\x07\xfa\x93\xf4\xac\xcb\x91\x96\
-\x22\xb8\x32\x9f\xf7\x0a\x1f\xe0\x8f\xe4\x8e\xfc\xeb\x4c\xdf\x15\
-\xff\x00\x5f\x27\xff\x00\xa5\x33\x26\x6e\xf4\xeb\x52\x36\xb6\x46\
-\x72\x38\xf6\xa4\xb8\xa7\x5a\x9c\x2b\x71\x92\x47\x1e\xd5\xe9\x2d\
-\xce\x6f\xb0\x6a\x5a\x46\x59\x46\x5c\x01\xb8\x71\x56\x83\x85\xdd\
-\x22\x80\xc4\x36\x46\xe1\x9c\xd5\x4b\x4e\x24\xcf\x60\x32\x6a\xf2\
-\x23\x0e\x70\xbf\xbb\x5d\xfd\x69\xb3\xcf\x9e\xe3\xe1\x05\xee\xb3\
-\xb7\x07\x68\xc8\x14\xcb\x55\x58\xa0\x77\x2e\x70\xee\xc4\xf3\xd3\
-\x9a\x7c\x24\xb4\xcc\xc7\xa8\x0a\x0f\xe5\x4c\x11\xa8\xd2\x9f\x71\
-\xc6\x41\x23\xeb\x9e\x95\x0c\x97\xd8\x85\x59\x06\xf6\x2e\x09\x07\
-\x90\x7f\x8b\xd0\xd4\x96\x8b\xe6\x30\xc8\xc9\x28\x48\xf6\xc9\x35\
-\x1c\xa8\x11\xd7\x8e\xaa\x48\x1d\xbe\x95\x73\x49\xda\xae\x4b\x8d\
-\xec\xa8\x3e\x52\x78\x3d\xff\x00\xad\x4b\x65\x4b\x48\xb2\xdc\x2c\
-\xf3\xc4\x8c\xfc\x95\x5c\x1e\x7a\x76\xcd\x41\x7d\x1a\xb4\x0f\xbc\
-\x64\x2a\xe4\x7f\x2a\x21\xb9\x6f\xb4\xdc\xa6\xc4\x55\x2f\x9e\x29\
-\x2e\x5c\x46\x37\x38\xdd\x97\x50\x07\xeb\x51\xb1\x9c\x57\xbe\x68\
-\x6f\xdd\x0c\x40\x1c\xaa\xa0\x0a\x00\xe8\x3d\x2b\x4b\x41\x92\x38\
-\x75\x88\x1e\x63\x80\xc4\xa2\x8c\x77\x22\xb2\xe1\xd8\xec\xb1\x82\
-\xab\xbb\xbe\x7a\x7b\xd5\x8f\x0d\x5b\x4f\x79\xa9\x79\xd2\x4a\x4c\
-\x36\xcd\x94\xf4\x7e\xa3\x35\xe7\x63\xdc\x63\x86\x9b\x93\xb2\xb3\
-\x3a\x70\x31\x94\xb1\x11\xb7\x73\xd1\x05\xc6\x0e\x30\x40\xa7\x89\
-\x31\xde\xa8\xac\x80\x80\x33\xc8\xf5\xab\x31\xc8\xbf\xc4\x41\xaf\
-\xcb\x19\xf7\x68\xb5\x1b\x64\x67\x3c\xd2\x33\xfc\xdc\xd4\x22\x70\
-\x1b\x00\xf1\x41\x21\x94\x9d\xc3\x35\x23\x25\x59\x79\xe7\xad\x3f\
-\xcd\x6a\xae\xaf\xc0\xc0\x06\xa4\xcb\x7f\x79\x7f\x3a\x06\x67\x6b\
-\x04\x79\x76\x01\x49\xc7\xf6\xb6\x9f\xff\x00\xa5\x90\xd7\xa6\x57\
-\x98\xeb\x1b\x82\x69\xfc\x8c\x7f\x6b\x69\xfc\x7f\xdb\xdc\x55\xe9\
-\xd5\xd3\x87\xf8\x4e\x6a\xdf\x10\x55\x49\xe1\xb2\xd4\x65\x58\xa5\
-\x29\x34\x96\x73\x24\xbb\x16\x4e\x63\x70\x32\xa4\x80\x7d\x0e\x70\
-\x6a\xdd\x71\xba\x87\x87\xf5\x2b\xef\x14\x3b\x66\xee\x0d\x3a\xe2\
-\xfa\x39\x2e\x1e\xd6\xf0\xc0\xcf\x12\xda\xb2\x8f\x99\x18\x3e\x3c\
-\xdd\x9c\x0e\x7f\x0c\xd7\x41\x89\xb5\x1f\x85\x74\xa8\x6f\x52\xee\
-\xde\x3b\x9b\x79\x52\x43\x26\x20\xbd\x9a\x34\x72\x5d\x9c\xef\x45\
-\x70\xae\x37\x33\x70\xc0\x80\x0e\x31\x8e\x29\xb0\xf8\x4b\x46\x82\
-\xde\x68\x12\xda\x43\x1c\xd1\x49\x0b\x2b\xdc\xca\xdb\x63\x72\x0b\
-\x2a\xe5\x8e\xd1\x90\x08\x0b\x8c\x76\xc5\x72\x6d\xa5\x78\xa4\xe9\
-\x97\x29\x71\x0e\xaf\x36\xaa\xda\x60\x8e\xce\xee\x0d\x49\x52\x18\
-\x64\xfb\x3e\xd2\xae\x9e\x68\x0d\x21\x93\x71\xdf\xb1\x87\xcc\xbf\
-\x30\xc7\x12\xdc\x68\x3e\x25\xb3\xf1\x8a\x36\x9f\x3e\xa1\x36\x97\
-\x12\xa8\x80\xbd\xd3\xc8\xa5\x3c\xb2\x19\x24\x67\xb9\x07\x25\xcb\
-\x1d\xfe\x54\x8c\x01\x5c\x37\x18\x50\x0e\x92\x3f\x07\x68\xf1\x34\
-\x6f\x1a\x5e\x2c\xb1\xc8\x64\xf3\xc6\xa3\x71\xe6\xb1\x21\x41\x0d\
-\x26\xfd\xcc\xa7\xcb\x4f\x95\x89\x1f\x28\xe2\x94\xf8\x3b\x43\x3e\
-\x6e\x6d\x65\x3e\x6f\x9d\xd6\xea\x53\xb3\xcd\x74\x91\xf6\x7c\xdf\
-\xbb\xf9\xe3\x46\x1b\x71\xb4\x8c\xae\x32\x6b\x8a\xb2\xd2\x7c\x61\
-\x1e\x9f\x1a\xcf\x6b\xab\x3b\xad\xfa\xcc\x90\x9b\xe2\xab\xb3\x60\
-\x0c\x1d\xfe\xda\xf2\x05\xcf\x23\x0e\xe3\xa9\x31\x1c\xe2\x9f\xfd\
-\x8b\xe3\x11\x2e\xaf\xf6\xa9\x75\x79\x04\xdb\xbc\xb1\x6b\x22\x85\
-\x91\xbc\xe5\x65\x28\x5a\xf5\x4a\xa8\x40\x54\xaa\x08\x32\x18\xf3\
-\x90\x28\x03\xb5\x83\xc2\x9a\x3d\xba\x10\x96\xd2\x39\x30\xcd\x0b\
-\x49\x2d\xcc\xb2\x3b\xa4\xc5\x3c\xcd\xce\xcc\x59\x89\xf2\xd0\x64\
-\x92\x40\x50\x01\x02\xa4\xd4\x3c\x37\xa6\x6a\x8d\x01\xbc\x86\x56\
-\x10\x2e\xc0\xb1\xdc\xc9\x1a\xba\xe4\x1d\xb2\x2a\xb0\x12\x2f\x1f\
-\x75\xc1\x1c\x9e\x39\x39\xe7\x7c\x4f\xa7\x78\x92\xf3\xc3\x3a\x34\
-\x7a\x6a\xdc\xc3\x2c\x6a\x3e\xd9\x6f\x6d\x70\xcd\x28\x6f\x2f\x03\
-\xf7\x9f\x68\x84\xb0\x07\x39\x26\x43\x93\x82\x43\x75\xaa\x77\xba\
-\x37\x8c\xe4\xb1\xb8\xb6\x82\xfa\xe5\x84\x50\x79\xd1\x4e\x65\x09\
-\x24\xf2\x38\x88\x3c\x78\x59\x46\x08\xc5\xc1\x03\x7a\xa8\x32\xc7\
-\xb5\xc6\xcd\xc0\x03\x77\x4e\xf0\x26\x95\x69\x69\x24\x77\x5e\x7d\
-\xd4\xb2\x17\xcc\xad\x73\x28\xf2\xc3\x4a\x25\xfd\xd0\xde\x7c\xa3\
-\xb9\x50\xe5\x36\x92\x51\x4f\x50\x2a\xc5\xc7\x87\x74\x6b\x28\x23\
-\xbc\xba\xb8\xbc\xb7\x4b\x14\x2c\xd7\x32\x6a\xd7\x0a\x76\x02\x5f\
-\xf7\xb2\x19\x32\xea\x09\x27\x0e\x48\x00\x9c\x60\x13\x5c\xf6\x8d\
-\xe1\xad\x7a\xee\x38\xa2\xd6\x6f\xb5\x7b\x68\x96\xd6\xe1\x50\x8b\
-\xb6\x89\xe2\x91\x9c\x6c\x27\x6d\xc4\xa5\xf6\xa9\x62\x0b\x3b\x76\
-\xcf\x41\x8d\x0d\x16\xf3\x55\xbc\xf0\x5d\xce\xb5\x71\x60\x75\x6b\
-\xdb\xb2\xb3\xdb\xe9\xe2\x75\x11\x9d\x81\x55\x02\x33\x7c\xaa\xac\
-\xc8\x64\xdd\xd7\xe7\xf5\x00\x50\x04\x96\x4d\xe0\xbd\x1e\xf2\xdf\
-\x54\xb6\xd5\xac\xa2\x7b\xf5\x91\x2d\x1e\x5d\x54\xbc\x72\x2b\x3a\
-\x97\x58\x55\x9c\xa8\x1b\xc2\xf0\x83\x00\xf1\xc5\x75\x75\xe7\x72\
-\x69\x5a\xdc\x76\xf6\x57\x9a\x56\x9f\xac\xda\x6b\x20\x5c\x07\x90\
-\xb5\x90\x80\xbc\xd2\x2c\x8e\x65\x53\x24\x8c\x23\x2c\xa0\x81\x19\
-\x2e\x14\x11\x92\x79\x3e\x89\x40\x05\x71\x3e\x30\x05\xbc\x6b\xa1\
-\xe0\xe3\xfe\x25\xf7\xdf\xfa\x32\xd6\xbb\x6a\xe3\x7c\x54\x14\xf8\
-\xe7\x43\xdf\xd3\xfb\x3a\xfb\xff\x00\x46\x5a\xd4\xcf\xe1\x65\x47\
-\xe2\x29\x89\x4c\x5c\x30\x3c\xf7\xa9\x13\x91\x95\x38\xa9\x5d\x10\
-\xfb\xfd\x6b\x12\xef\x58\x32\x5e\xbd\x8e\x85\x00\xbf\xbc\x4f\x96\
-\x46\xdd\x88\x2d\xcf\xfd\x34\x71\xdf\xfd\x91\x96\xfa\x75\xae\x53\
-\xa2\xe6\x8d\xed\xf4\x1a\x7d\xa9\x9e\xfa\x64\x8a\x31\xc6\xe6\x3d\
-\x4f\x60\x3d\x49\xec\x07\x26\xb2\xb1\xa9\x6b\xa7\x03\xce\xd2\xb4\
-\xf2\x39\x23\xe5\xb9\x9c\x7f\xed\x21\xff\x00\x8f\x7f\xba\x6a\xe5\
-\x8e\x82\x22\xba\x17\xda\x94\xdf\x6f\xbf\x03\xe5\x91\xd7\x6a\x43\
-\xed\x1a\x74\x5f\xaf\x24\xf7\x26\xb5\x56\x36\x1d\x18\x73\xeb\x54\
-\x05\x5b\x0b\x4b\x6d\x3e\xdd\x6d\x2c\x60\x48\x22\x1c\x84\x41\x8c\
-\x9e\xe4\xfa\x9f\x52\x79\x35\x8f\xe3\x33\x72\x74\x59\x22\xb5\xb6\
-\x33\x19\x01\x57\xe7\xee\x8f\x5a\xe8\xca\xed\x61\xca\xe4\x75\x35\
-\x0d\xdc\x22\x7b\x39\x3c\xc2\x02\xed\x20\x92\x6b\xa7\x0b\x53\xd9\
-\xd6\x8c\xed\x7b\x33\x2a\x91\xe6\x8b\x47\x83\x74\x5a\x8a\x76\x1f\
-\x67\x60\xe7\x07\xb7\xbd\x58\x99\x42\x4d\x22\x0e\x42\xb9\x19\x1f\
-\x5a\xad\x72\x33\x09\xaf\xd5\x22\xee\xae\x7c\xc3\x56\x90\x43\xcc\
-\x60\x9f\x4a\x97\x78\xe1\x30\x07\xb9\xa8\x6d\xff\x00\xd5\x2f\xd2\
-\xa6\x0c\x07\x03\xa9\xe2\xac\xcd\xa2\xbc\x6b\xb2\x79\x53\x70\x3c\
-\xf5\x07\x35\x65\x57\x3d\xf8\x1e\xb5\x5d\x10\x45\x73\x20\x3c\x6e\
-\x19\x03\x15\x36\x09\x1c\x1c\x1e\xc4\x53\x09\x6e\x43\x70\x31\x71\
-\x17\x42\x33\x53\x67\x2d\xc5\x41\x75\x33\x11\x1a\xbc\x6a\x08\x6c\
-\xef\x07\xad\x4e\xa0\x6d\x00\x1e\x48\xcd\x31\xf4\x21\xb8\x7d\xb0\
-\xb8\x70\x48\x3d\x0f\xa5\x2d\xa8\xcc\x28\x73\x9c\x0c\x53\xe5\x4d\
-\xd1\x32\x8e\xb8\xa8\xac\xff\x00\xe3\xdc\x50\x1f\x64\xb0\x69\xf0\
-\x23\x35\xc0\xda\xa4\x8c\x11\xf9\x83\x8a\x66\x78\xa9\x61\xdb\xb3\
-\x99\x30\x77\x7d\xce\x79\xc0\xeb\x4c\xcd\xbb\x1a\x2b\x8f\x27\xde\
-\xb2\xee\xbe\xf3\x56\xa4\x7f\xea\xb3\x59\x97\x63\x2c\xd8\xaf\x3b\
-\x29\xff\x00\x71\xa5\xfe\x15\xf9\x1d\xd9\xd7\xfc\x8d\xb1\x0f\xfb\
-\xf2\xfc\xcc\x79\xfa\xd3\xed\x58\xaa\xb0\xfe\xf0\xa6\xdc\x75\x34\
-\xfb\x61\xfb\xb2\x7e\x9d\xeb\xd3\x5b\x9c\xef\xe0\x34\xad\x86\xee\
-\x07\x1e\xa7\xda\xae\x2b\x96\x0e\x4b\xed\x0f\x80\x47\xae\x2a\x9d\
-\xaf\x71\x8e\xbd\x4f\xa0\xab\xaa\x54\x46\x19\xb0\xa3\x76\x41\x15\
-\x52\x38\x27\xb9\x2d\xb8\x2d\x72\xfc\x67\xa6\x70\x7a\x71\x4d\x9b\
-\x23\x4f\x91\x46\x06\x24\x23\xf0\xcd\x36\x36\xf2\x44\x9b\x95\x98\
-\x83\x83\xce\x39\xf6\xa4\x7d\xa7\x4e\x8a\x3e\x77\x48\xe0\x67\x3e\
-\xfc\xd6\x6f\x72\x6d\xa8\x97\xb1\xaf\x99\x13\x37\x21\x87\xad\x1b\
-\x31\x67\x24\xe1\x48\x07\x00\xb6\x7b\x66\x92\xfd\x7e\x64\x8f\x01\
-\x47\x04\x7b\x54\xf1\x26\x34\xb9\x40\x3c\x9c\x90\x0f\x42\x07\xff\
-\x00\x58\x52\xbe\x83\x7a\x21\xab\xb1\x67\x46\x8c\xf9\x6a\x63\xfb\
-\xbe\xb9\xa2\x29\x4b\x5f\x44\x1c\x9d\x8a\x49\x3f\xca\x96\xe1\xa3\
-\x9e\xd9\x25\x8f\xef\x46\x47\x00\x76\xef\x50\xc7\x2a\x2d\xd3\xa9\
-\x46\x90\xed\xe8\xa3\xde\xa5\x84\x75\x4c\xbd\x2d\xbc\x12\x6a\x48\
-\xb3\x44\xea\x0a\x12\x76\xb7\x0d\xe9\x5d\x3f\x86\xf9\x59\x56\x36\
-\x00\xa8\x00\x2f\xa0\xae\x72\xce\x32\xaa\xf2\x4c\x33\x23\x63\x1c\
-\xfd\xd1\xe9\x5d\x1e\x83\x12\xac\x2d\x28\xe1\x9d\xb9\x35\xe1\x67\
-\x52\x51\xc1\xca\xfe\x47\xa1\x95\xab\xe2\x15\xba\x1b\x85\x82\x8f\
-\x9b\xe6\x6a\x95\x33\xb7\x01\x70\x6a\xae\x7f\x79\xd8\xd4\xe2\x55\
-\x5c\x12\x4d\x7e\x70\xcf\xb0\x45\x80\xc4\x1c\x10\x73\xec\x28\x12\
-\x28\x3f\x30\xe2\x91\x67\xdd\xf7\x68\xdc\x33\xf3\x63\x15\x03\x1c\
-\x64\xc8\xf9\x7a\x7d\x69\x30\x7d\x4f\xe7\x4c\xc8\x57\xc9\xc6\x3d\
-\x05\x49\xe6\x47\xeb\x48\x64\x7a\xbc\x67\xcb\xb0\x62\xd9\xc6\xad\
-\xa7\xe0\x0f\xfa\xfc\x8a\xbb\xfd\x4f\x52\xfe\xce\x92\xc5\x7c\xaf\
-\x33\xed\x77\x4b\x6f\x9d\xd8\xd9\x95\x63\xbb\xa7\x3f\x77\xa7\xbd\
-\x70\x1a\x9b\x0f\xb3\xd8\x0d\xa4\x67\x56\xd3\xf1\xff\x00\x81\x90\
-\xd7\x79\xad\x68\xe3\x59\xb7\x82\x3f\xb6\x5c\xd9\x49\x6f\x3a\xcf\
-\x14\xf6\xdb\x0b\xab\x00\x47\x47\x56\x52\x30\x4f\x51\x5d\x58\x7f\
-\x80\xe6\xad\xf1\x10\xdc\x78\xa7\x4a\xb3\xd4\x1a\xca\xee\x4b\x98\
-\x25\x52\xa3\x74\xb6\x53\x2c\x6c\x4b\x2a\x0d\xb2\x14\xd8\xdc\xba\
-\xe7\x04\xe0\x64\x9c\x00\x48\x63\x78\xbf\x44\x5d\x43\xec\x5f\x6b\
-\x76\x94\x4b\xe4\xb9\x5b\x79\x1a\x38\xdf\x79\x8c\x07\x70\xbb\x53\
-\x2e\x0a\x8d\xc4\x64\x82\x06\x48\xac\x89\x3e\x1d\x58\x8b\xbb\xfd\
-\x44\xdc\xcd\x7d\x7f\x77\x6b\x24\x2c\xd7\x49\x02\xf9\x85\xd0\x29\
-\x2d\x24\x71\x07\xc7\x00\xe3\x24\x2f\xf0\x80\x00\x14\xe8\xbe\x1c\
-\x69\x66\xeb\x4b\xbe\xb9\x7f\x32\xfa\xca\x38\x96\x59\x5a\xda\xde\
-\x5f\xb4\x3a\xb1\x72\xc4\xc9\x1b\x32\x96\x66\x62\x4a\x15\x3f\x37\
-\xb0\xc7\x41\x89\xa9\x65\xe3\x1d\x1b\x51\x9a\xda\x2b\x19\x2e\xe6\
-\x6b\x92\x7c\xa2\xba\x7d\xc6\xd2\x06\x32\xc5\xb6\x60\x2f\xcc\x06\
-\xe2\x40\xce\x46\x72\x0e\x27\xbc\xf1\x26\x9b\xa7\xdf\x9b\x3b\xd7\
-\xb8\x86\x40\x8c\xe1\xda\xce\x6f\x29\x82\xa1\x72\x16\x4d\xbb\x18\
-\x85\x56\x3b\x41\x27\x83\xc7\x15\x48\x78\x32\xcc\x7f\x63\x28\xbc\
-\xba\x11\xe8\xe1\x7e\xce\x9b\x61\x24\x90\x7a\x97\x31\xef\x5c\xe0\
-\x02\x11\x94\x11\xc1\x04\x12\x0c\x1a\x8f\x80\x74\xbd\x4f\xc4\xb2\
-\x6b\x77\x13\xdc\x0b\x87\x47\x4d\xaa\x90\xfc\xbb\xa1\x30\x9c\x39\
-\x8c\xc8\x06\xd6\x27\x6e\xed\xbb\xb9\xc6\x73\x40\x16\x93\xc6\xda\
-\x14\x96\xfe\x74\x73\xdd\x36\x64\x08\xb1\x8b\x09\xcc\xad\x95\xdc\
-\x18\x47\xb3\x79\x4d\xa0\x9d\xe0\x6d\xe3\xad\x45\x6f\xe3\x4b\x47\
-\xd2\xfc\x35\x75\x77\x69\x77\x1c\x9e\x21\x89\x1e\x18\xed\xe0\x79\
-\xd6\x26\x68\xbc\xcc\x33\x2a\xf0\x00\xe3\x38\xf5\x38\x00\x31\x12\
-\x5c\xf8\x46\xde\x6b\xa8\xee\xed\x75\x1b\xeb\x1b\xa8\xd2\x38\xd6\
-\x7b\x73\x19\x60\xaa\xac\xbb\x70\xe8\xc3\x90\xdc\xf1\xd4\x0c\x62\
-\xa5\x5f\x0b\xdb\x45\xa6\x68\x76\x56\xb7\x57\x56\xeb\xa2\x18\xfe\
-\xcd\x2a\x14\x2e\xc1\x22\x31\x6d\x6d\xca\x41\x05\x18\x83\x80\x0f\
-\xa1\x14\x01\x4b\x49\xf1\xfe\x91\xa9\x68\x71\x5f\xcd\xf6\x8b\x69\
-\x5a\x18\xa4\x7b\x6f\xb2\xcc\xee\x4c\x9c\x01\x18\x09\x99\xb9\x04\
-\x65\x01\xe9\xda\xae\x5e\xf8\xbb\x4c\xb2\xd3\x2c\x6f\xf1\x79\x71\
-\x6f\x7d\x30\x86\x23\x6d\x67\x24\x8c\x18\xe7\x86\x40\xbb\x94\x82\
-\x08\x20\x8c\x82\x31\x8c\xd5\x1b\xbf\x87\xda\x45\xee\x8d\x6d\xa6\
-\xce\xf3\x3c\x56\xb6\xd1\x5b\x44\xd2\x2c\x52\x10\x23\x39\x56\x2a\
-\xe8\x51\x8f\x50\x72\xa4\x73\xd3\x3c\xd5\xd1\xe1\x4b\x54\xf0\xed\
-\x9e\x93\x6d\x73\x35\xaa\xd9\x4a\xb2\xc3\x3d\xb4\x50\x46\xca\xc1\
-\x8b\x67\x60\x8f\xcb\xe7\x27\x20\x26\x39\xf5\xe6\x80\x1a\xde\x35\
-\xd1\x16\x19\x26\xf3\x2f\x5a\xde\x29\x1e\x39\x2e\x13\x4d\xb8\x68\
-\x90\xa1\xc3\x93\x20\x8f\x68\x55\x20\x82\xd9\xc0\xc1\xe7\x83\x4a\
-\xfe\x34\xd0\xa3\xb8\xb9\x85\xee\xa6\x0f\x6b\xe6\x09\x0f\xd9\x26\
-\xda\x5a\x36\x0a\xca\xad\xb3\x0e\xc0\x91\xf2\xa9\x2c\x7b\x0a\xa1\
-\xab\xfc\x3a\xd2\x75\xad\x3a\xde\xca\xea\x7b\x91\x15\xbb\x4e\xc3\
-\xe4\x86\x42\x7c\xe7\xde\xdf\xeb\x23\x6d\xa4\x1e\x8c\xbb\x58\x0e\
-\xf5\x7a\xe7\xc2\x36\x97\x16\xaf\x0a\xdd\x5c\xc5\xbe\x6b\x89\x4b\
-\x05\x89\xf9\x98\x9d\xe3\x6b\xa3\x29\x5c\x31\x18\x20\xf0\x7b\xd0\
-\x04\x37\x7e\x38\xd3\xec\x6e\x92\x39\xe1\xbc\x65\x97\xc8\x11\xac\
-\x56\x53\xb4\xca\x65\x32\x00\x5e\x2f\x2c\x14\x1f\xbb\x38\xea\x4f\
-\x3c\x0e\x33\x22\xf8\xd3\x49\x8c\x44\xb7\x97\x1b\x25\x91\x98\x1f\
-\x22\x19\xa5\x48\x87\x9a\xd1\x06\x91\xc4\x60\x46\xa5\x94\x8d\xcf\
-\xb4\x64\x36\x09\x03\x35\x04\x3e\x03\xb1\xb6\xb5\x48\xed\x6f\xef\
-\xa1\x92\x35\xb7\x58\xe7\x43\x16\xe8\xfc\x96\x91\x94\xaa\x94\xd8\
-\x3f\xd6\xb0\xdb\xb7\x68\x18\x0a\x17\x14\xe3\xe0\x7b\x30\xc4\x43\
-\xa8\x5f\xc3\x0c\xbc\x5d\x40\x8d\x19\x5b\xa5\xf3\x5e\x50\xaf\x94\
-\x24\x0c\xca\xe3\x28\x54\x90\x70\x49\xc0\xc0\x06\x86\x9b\xe2\x7d\
-\x2b\x57\xbf\x92\xce\xc2\xe2\x47\x99\x04\x87\xe7\xb7\x92\x35\x7f\
-\x2d\xc2\x3e\xc6\x65\x0a\xfb\x58\x85\x3b\x49\xc1\x20\x1a\xe6\x7c\
-\x73\xa8\x5a\xe9\xbe\x2f\xd1\x27\xbd\x94\x44\x9f\xd9\xf7\xca\x38\
-\x25\x9d\x8c\x96\xb8\x55\x03\x96\x27\xd0\x73\x5d\x3d\x87\x87\xad\
-\x34\xeb\x9b\x69\xa0\x92\x66\x6b\x74\xb9\x44\x0e\xc0\x82\x27\x95\
-\x65\x7c\xe0\x76\x64\x00\x7b\x67\x39\xeb\x58\x3e\x2a\x8d\x1f\xc7\
-\x5a\x09\x75\x04\xae\x9f\x7c\x54\x91\x9c\x1f\x32\xd4\x64\x7e\x04\
-\xd4\xcf\xe1\x65\x47\x73\x09\xe0\xbf\xd6\xb6\x9b\x93\x36\x9b\xa7\
-\xb1\xe6\xdd\x1b\x13\xcc\x3f\xdb\x60\x7f\x76\x0f\xa2\xf3\xee\x39\
-\x15\xb5\x6b\x6b\x6b\x63\x67\x1d\xbd\x9d\xb2\xc1\x0c\x63\x09\x1c\
-\x6b\xb4\x2d\x4a\xa4\x86\xc7\x18\xab\x00\xa9\x18\xcf\x3f\x4a\xe6\
-\x3a\x0a\x8c\xc5\xdb\x18\xc0\xa9\x0a\xa8\xc0\xef\x53\x98\xe3\x0d\
-\x93\xf9\x54\x3b\xa2\x12\xfc\xa0\xfb\x9a\x04\x38\x85\x71\xca\x80\
-\x3d\xea\xb5\xf5\x92\x5f\x69\xf2\xda\x33\x1f\x2e\x45\xc3\x60\xe0\
-\xfe\x75\x70\xc6\x8d\xd1\xfa\xd3\x25\x8c\x24\x2c\xca\xdb\x88\x1c\
-\x62\xb5\xa7\x27\x19\x26\xb7\x26\x5a\xab\x33\xc2\xb5\xbb\x11\xa6\
-\xeb\x57\x56\x8b\x9d\xb1\x3e\x17\x3e\x95\x99\x2e\x3c\xb6\xfa\x56\
-\xdf\x8a\x0d\xd4\x9a\xfc\xd3\x5f\x43\xe4\xc9\x27\x21\x73\xdb\xa0\
-\x3f\xa5\x62\xc8\x3e\x43\x9f\x4a\xfd\x4b\x0b\x27\x2a\x51\x6d\xeb\
-\x63\xe6\xab\x24\xa6\xec\x43\x6c\x7f\x76\x3d\x8d\x4a\xc3\x35\x0d\
-\xa9\xc0\x3e\xc6\xa7\xae\xb3\x07\xb9\x56\x33\xe6\x5e\xb1\x6e\x38\
-\xab\x80\x94\x53\xb7\x19\xc7\x19\xaa\x69\xc5\xe3\x67\x9a\xb7\xbc\
-\x2a\xe4\x8e\x94\x04\x8a\xf7\x44\x3c\x23\x39\x57\xdc\x30\x31\x56\
-\x63\xdf\xe4\x8d\xfc\xed\xc8\xeb\xd2\xa2\xb9\x06\x58\x01\x1c\x85\
-\xe4\x62\x9e\x0e\xe2\x08\x27\x18\xa0\x4f\x64\x3b\x6e\xe4\x6c\x9d\
-\xbc\x1c\x1a\x82\xd3\x0b\x06\x7d\x09\x15\x63\x71\xe7\x28\x5d\x42\
-\x9e\x9d\xaa\xad\xa1\xdf\x19\xec\x37\x53\x0e\x84\xfd\x79\x35\x2c\
-\x0a\xe6\x65\x60\x32\x01\xc1\x3e\x99\x14\xcc\x54\xb0\x88\xd9\x42\
-\xbb\x90\x77\x64\x00\xbd\x4f\x6a\x64\x36\x69\xc5\x8f\xb3\x8e\x39\
-\xcf\x27\xb5\x65\xde\x7d\xf6\xad\x4b\x70\x0c\x20\x90\x48\xf6\xac\
-\xbb\xd1\xf3\x37\x7a\xf3\x72\x9f\xf7\x3a\x6b\xc8\xee\xce\xbf\xe4\
-\x69\x59\xff\x00\x78\xc6\x9c\xf2\x6a\x5b\x54\x26\x26\x6c\xe0\x02\
-\x3f\x1a\x8e\xe3\xa9\xa7\x5b\x9f\x96\xbd\x48\xee\x73\xbf\x80\xd2\
-\xb6\x61\x9d\xa4\x77\xab\xca\x40\x90\x6e\x03\xe5\x5e\xe7\x80\x6a\
-\xa5\xab\x2b\x02\xa4\x7b\xd5\x91\xf7\x02\x8e\xe7\x2c\x69\xc8\xe0\
-\x96\xe4\x8f\x1b\xc7\x34\x84\xe4\x88\xa4\xcb\x29\xea\x70\x69\xb2\
-\xa6\x1d\xd9\x86\x55\x1c\x48\xa3\x1e\xb4\xdd\xe4\x5a\xce\xc4\x7e\
-\xec\xe7\x38\xeb\x9e\xd4\xa8\xec\xb1\x11\x29\xde\xc6\x3c\x01\x9e\
-\xff\x00\xfe\xaa\xcc\x2c\x17\x0d\xe6\xcc\x5b\x07\xf7\x44\x12\x73\
-\xd4\x56\x85\xa4\x06\x4d\x1c\x38\x3f\xbb\xc1\x5c\x93\xd4\xfd\x2b\
-\x29\x5c\x5b\xc7\x98\xbe\x66\x61\xd7\x3f\xa5\x59\xb5\xb8\x51\xa6\
-\xba\x31\x3e\x62\xae\x57\x3d\x39\xa9\x92\x7d\x04\xf6\x19\xbb\xca\
-\xb5\x84\xf3\xb1\x72\x18\x81\x53\x69\xc8\x3c\xe3\x33\x7f\x10\x00\
-\x0a\xad\x3a\x94\x86\x20\x01\xcb\x2e\x18\x13\x53\x45\x33\x05\xf2\
-\x52\x26\x7d\x8d\x80\x7a\x50\xf6\x16\xf1\x76\x35\x3e\xf1\x27\x8f\
-\xc2\xb5\x74\x19\x64\x7b\x76\x52\xc8\x15\x1c\x8c\x83\x5c\xda\x7d\
-\xa6\x4b\x7f\x99\xc4\x51\xf4\xe9\x93\x5d\x4e\x8d\x14\x30\x69\xf1\
-\xa4\x58\x74\x23\x3b\xbb\x93\x5f\x39\x9f\x4d\x47\x09\x66\xb7\x67\
-\xab\x94\x53\x7e\xda\xf7\x34\xe4\x32\x6e\x00\x74\xf5\x02\xa7\x89\
-\xd7\x01\x19\x41\x3e\xf5\x16\x76\xa7\x18\xc5\x46\x92\x27\x3b\xba\
-\xfa\xd7\xe7\xec\xfa\xc4\x6a\x63\x2b\x80\x00\x1e\xb5\x16\x71\xd7\
-\x06\xa2\x4b\x8f\x97\x1b\xb1\x4d\x12\x4a\x78\x4e\x9f\x4a\x81\x93\
-\x12\x03\x0f\xf0\xa7\x79\x8b\xfd\xca\x39\x75\xdb\x8e\x7d\x69\x3c\
-\x86\xfe\xf1\xfc\xa9\x00\xfd\x54\x1f\x2f\x4e\xc6\x70\x35\x6d\x3f\
-\xaf\xfd\x7d\xc5\x5e\xa1\x5e\x6b\xab\xc6\x56\xd6\xc5\xba\x83\xab\
-\x69\xfd\x7f\xeb\xf2\x1a\xf4\xaa\xe9\xc3\xfc\x07\x3d\x6f\x88\x8a\
-\xe6\x56\x86\xd6\x59\x63\x8d\xa5\x78\xd0\xb2\xc6\xbd\x5c\x81\x9c\
-\x0f\xad\x79\xae\xaf\xf1\x22\xef\x4c\xf0\xdd\xbe\xa1\x06\xb1\xa2\
-\x6a\x37\x12\x09\x1d\xa2\xb6\xb7\x50\xaa\x55\x15\x8c\x25\x9e\xe9\
-\x71\x26\x5b\x18\x01\x9c\xe7\x88\xf8\x35\xe9\xf4\x57\x41\x89\xca\
-\xe9\x5a\xf6\xad\x73\xe2\x0f\x2e\xec\xd9\x1b\x09\xae\xee\xed\x62\
-\x8e\x28\x5d\x65\x43\x0b\x1c\x33\x39\x72\x0e\x40\x20\x80\xa3\x9c\
-\x1c\xf6\xae\x6e\x2f\x1a\x6a\x9a\x6f\xf6\xba\x43\x75\x67\xaa\x3c\
-\x17\x1a\x83\x0b\x3e\x4d\xc5\xaa\xa4\xec\x12\x49\x18\xc8\x07\x94\
-\x07\x18\x21\x06\x31\xf3\x0c\x1c\x7a\x75\x50\xd5\xf5\xbd\x37\x40\
-\xb1\x17\x9a\xd5\xec\x36\x56\xc6\x45\x88\x4b\x33\x60\x6e\x63\x80\
-\x3f\xcf\x40\x09\x3c\x02\x68\x03\x93\xb6\xf1\x2d\xfe\xb3\xf0\xf6\
-\xe7\x51\x96\x58\x52\x74\xbc\x8e\x24\x9e\xca\x68\xf6\xc8\xbe\x6c\
-\x7c\xfe\xea\x59\x42\x9f\x98\xa9\x5d\xe7\xa6\x78\xce\x2b\x23\x51\
-\xf1\xce\xa9\x16\xb3\x2d\xcd\xbd\xe5\x95\xc3\x5a\xda\xde\x07\xd3\
-\x60\x04\x35\x99\x5b\x88\x63\x57\xb8\xdd\x28\x56\xc2\x96\x71\x9f\
-\x2c\x00\x1f\x9c\x12\xc3\xb9\xd3\xfc\x59\xa2\xea\x57\x17\x30\x41\
-\xa8\xdb\x2c\xf6\xa6\x43\x24\x2f\x3a\x07\x08\x87\x06\x4c\x03\x9d\
-\x9f\xed\x74\xa9\x64\xf1\x16\x99\xfd\x86\xfa\xbd\x9d\xd4\x57\xf6\
-\x48\x40\xf3\x6c\xe4\x59\x43\x1d\xc1\x70\x08\x38\xe0\x9f\x5a\x00\
-\xe2\xa0\xf1\xd6\xbf\x77\xa4\x3d\xec\x1f\xd9\x3b\x6d\x2c\x6e\x6f\
-\xa6\x70\xa2\x51\x72\xb1\x30\xf9\x53\xca\x9d\xd6\x32\x41\x23\x25\
-\xdf\x04\x74\x39\xc0\xad\xa8\xf8\x97\x5c\x5d\x3b\x57\x46\xd5\xec\
-\xa5\xbe\xb4\x3a\x88\x4f\x2a\x17\x8d\xad\x96\x34\x66\x4d\xc8\xb2\
-\xe0\x92\xa0\x15\x2c\x38\xe0\xf3\xdf\xd0\x86\xbd\xa3\xb5\xd5\xdd\
-\xb0\xd5\x6c\x4c\xf6\x48\x64\xba\x88\x5c\xa6\xe8\x14\x75\x67\x19\
-\xca\x81\xea\x71\x50\x37\x8b\x7c\x38\x96\x70\xdd\xbe\xbf\xa5\xad\
-\xb4\xe5\x96\x19\x8d\xec\x61\x24\x2a\x40\x60\xad\x9c\x1c\x12\x33\
-\x8e\x99\x14\x01\xc0\xdd\x78\xb3\x57\xf0\x9d\xac\xf6\x51\x3d\xbc\
-\xad\x15\xef\x92\xd7\xb7\xb3\x33\x46\x48\xb4\xb7\x90\x2e\x6e\x6e\
-\x97\x69\x63\x2b\x63\x12\x1c\x04\x27\x6b\x12\xc6\xb5\x60\xf1\x45\
-\xee\xa7\xe3\x7d\x26\xd2\x4b\xfb\x3b\x60\x2f\x64\x49\x74\xa8\x98\
-\x9b\x84\x5f\xb2\x48\xc1\xa4\x60\xf8\x74\x27\x0c\xbf\x20\x1f\x74\
-\x82\x71\x5d\xac\x1a\xa6\x9f\x75\x7d\x71\x65\x6b\x7d\x6d\x35\xdd\
-\xb6\x3c\xf8\x23\x99\x5a\x48\xb3\xd3\x72\x83\x95\xfc\x6a\xdd\x00\
-\x79\xd2\x78\x9f\x59\x83\x5e\xd4\xac\x34\xdb\xbb\x0d\x42\xe0\xde\
-\x5c\x88\xb4\xd9\x03\xb5\xc4\x6a\x91\x97\x57\x2d\xbf\x88\xcb\x28\
-\x8c\x0d\xa0\x02\xe0\xee\x3f\x76\xba\xef\x0e\x6b\x0f\xaf\x69\xf2\
-\xea\x2a\x14\x59\xcd\x3b\x0b\x32\x14\x86\x68\x97\x0b\xb9\xb3\xd4\
-\x96\x0e\x46\x30\x36\x95\xfa\x9d\x66\x1b\x94\xa9\xce\x08\xc7\x07\
-\x1f\xad\x43\x65\x67\x6f\xa7\x58\xc1\x67\x65\x18\x8a\xde\xde\x35\
-\x8a\x24\x04\x9d\xaa\xa3\x00\x73\xed\x40\x13\xd7\x19\xe2\xa2\x07\
-\x8e\x74\x3c\xff\x00\xd0\x3a\xfb\xff\x00\x46\x5a\xd7\x67\x5c\x5f\
-\x8b\x1b\x6f\x8d\xb4\x4c\x0c\xff\x00\xc4\xba\xfb\xff\x00\x46\x5a\
-\xd4\xcf\xe1\x65\x47\xe2\x24\x50\xa5\xc6\x39\x1e\xb4\xfc\x88\xf2\
-\x42\xe6\xab\xc4\x37\x2f\xcc\x48\x6e\xc3\x35\x32\x33\x20\xf9\x81\
-\x20\xfb\x57\x29\xd0\x49\xe7\x86\x1b\x98\x63\xda\xa3\x91\xb2\x32\
-\x89\xf8\xd3\x59\xd8\x37\x0b\x80\x7d\x69\xc9\x2a\x48\x0a\x30\x20\
-\xfb\x53\x10\x13\x98\xf9\xe3\xe9\x4e\x89\x97\x69\x1f\x7b\xea\x2a\
-\xb9\x55\x59\x46\xd6\x6f\xc6\xa0\xd4\xb5\x5b\x5d\x3e\x30\x64\x6c\
-\x83\xdd\x6b\x5a\x70\x94\xdd\xa2\x88\x94\x94\x55\xd9\xe7\x5f\x11\
-\xe4\xb7\x6d\x72\x21\x01\x56\x74\x8c\x87\x00\xfd\xde\x78\xae\x31\
-\xcf\xcb\x5a\xfe\x27\xf1\x1d\x85\xdf\x88\xe4\xb6\x81\x19\xae\x18\
-\xe0\xa8\x88\x82\x46\x32\x32\x71\xe9\x58\xd8\xcb\x10\x78\xf5\xaf\
-\xbf\xca\x6b\x5e\x2e\x85\xbe\x0b\x6b\x75\xad\xf7\xd3\xa5\x9e\x87\
-\x97\x8e\xc3\xc2\x34\xa9\xe2\x23\x2b\xb9\x5e\xea\xcf\x4b\x3d\x35\
-\xd9\xdd\x59\xe8\x41\x6e\x7f\x78\xc3\xde\xac\x9e\x95\x55\x06\xdb\
-\x86\x02\xac\xf6\xaf\x74\xf2\x19\x58\x9c\x5e\x7b\x9a\xb5\xdb\x9a\
-\xac\xc4\x8b\xa4\x3e\xbe\x95\x63\x9e\xf4\xc4\xc8\x67\x91\xa2\x51\
-\xb7\xee\x16\xc9\x15\x65\x36\x8d\xac\x06\x57\xb8\xaa\x97\x60\x94\
-\x5c\x7a\xd5\x88\x4e\x15\x47\x6c\x73\x40\xde\xc5\x85\x5f\x31\x59\
-\x81\x0a\x81\x49\x3f\xe1\x59\xf6\x7f\x75\xfb\x0d\xdc\x55\xe6\xdb\
-\x82\x23\x23\x69\x3c\xf3\x54\xed\x7f\xe5\xa2\xe3\x90\xd4\x12\xbe\
-\x16\x59\xa9\x2d\xe2\x67\x99\x0a\x8e\x15\xc6\x79\xf5\x38\xa8\xc6\
-\x6a\x7b\x49\x92\x29\x94\x49\x1e\xfc\xba\x91\xce\x39\x07\xf9\x53\
-\xe8\x4e\xbd\x0d\x2b\x61\xb6\xdf\x0c\x3b\xe2\xb2\xef\xc9\xf3\x18\
-\x7a\x74\xad\x48\x1b\xcc\x8c\xb9\xe0\xb3\x64\xe3\xa5\x65\xea\x1f\
-\xeb\x5a\xbc\xdc\xa7\xfd\xd6\x3f\x3f\xcd\x9d\xf9\xd7\xfc\x8c\xaa\
-\x3f\x4f\xc9\x18\x97\x1d\xe9\xf6\xff\x00\x76\xa3\xb8\x3c\xd4\x90\
-\x74\xaf\x56\x3b\x9c\xef\xe0\x34\xad\x93\x71\x07\x3d\x0f\x23\xda\
-\xaf\xa3\xe5\x97\x00\x12\xcc\x30\x31\xd0\x0a\xcf\xb6\x05\xa5\x03\
-\x38\xcd\x5f\x8c\x0f\x30\x7a\x93\xc9\xf4\x14\xe4\x70\x4f\x71\x85\
-\x5e\x4f\x91\x47\xca\x49\x63\x81\xe9\xda\x91\x13\xcb\x65\x93\x01\
-\xc2\xa6\xef\xa9\xa9\x14\x33\x08\x95\x3e\x5d\xc5\x8e\x41\xe9\x47\
-\x96\x05\x9c\x52\x02\x4e\xd2\x55\x87\xaf\x3c\xd4\x31\x10\xbb\x01\
-\x1b\x80\x3a\xfc\xc2\xa4\x80\x48\x06\x7e\x50\x3e\x41\xcf\x6a\x8a\
-\x44\xdc\xe9\x18\xe3\x0c\x15\xb1\xde\xae\x32\xc5\x1d\xf3\xb1\x5c\
-\x6d\x50\x47\x39\xc5\x48\x3b\x58\x9e\x7b\x7f\x3d\x82\xb7\x55\x39\
-\xcf\x6a\x8a\xdc\xff\x00\xa3\x8d\xa3\x0c\x78\xe2\xac\xa4\xb1\xed\
-\x32\x67\xe5\x0a\x7a\xfd\x2a\xae\x9f\xcd\xbe\xe1\x91\xb5\x98\x01\
-\xe9\xcd\x41\x36\xb4\x2e\x5d\xc1\x6d\x91\xf6\xe0\x62\xba\xeb\x68\
-\xe3\xfb\x3a\x24\x4a\x23\x50\x38\x1d\x2b\x8c\x91\x9c\x63\xcb\x6d\
-\xaf\xeb\x5d\x0e\x9b\xaa\xa4\xc8\x91\x4b\x26\x26\x1c\x67\xb1\xaf\
-\x98\xcf\xe8\xd4\xa9\x4a\x2e\x1b\x2d\xcf\x67\x27\xa9\x08\xb6\xa5\
-\xbb\x35\xe4\x8f\x3f\x29\x18\xf7\xcd\x46\x2d\xfc\xae\x55\xf2\x0f\
-\xad\x08\xe4\xbb\x2b\xb0\x63\xec\x7a\x54\xe1\x0a\xc3\x82\xe0\x8f\
-\x7a\xf8\x56\xac\x7d\x3d\xc6\x16\xca\xed\x03\x27\xd7\x15\x2e\xe9\
-\x50\x2e\x06\x7d\x70\x29\x23\x5e\x32\x8c\x54\x7a\x53\xcb\x11\xc1\
-\xe0\xfa\x83\x50\x50\xbe\x76\xdf\xbc\x0f\x34\xdf\x38\xff\x00\x93\
-\x4a\xce\xae\x30\x4f\x4a\x6e\x57\xd3\xf4\xa4\x06\x86\xba\x5f\x16\
-\x00\x30\x29\xfd\xad\xa7\xf0\x0f\xfd\x3d\xc5\x5e\x95\x5e\x77\xa9\
-\xe9\xd2\xde\x58\xaa\xc1\x3c\x76\xf3\xc5\x71\x05\xc4\x52\xc9\x19\
-\x91\x43\x45\x2a\x48\x01\x50\xca\x48\x25\x31\xd4\x75\xa9\xce\xb5\
-\xe2\xe2\xb9\x4d\x53\x42\x6e\x7a\x7f\x65\x4d\xff\x00\xc9\x35\xb5\
-\x1a\x91\x8c\x6c\xcc\xaa\xc2\x52\x95\xd1\xde\xd1\x5c\x20\xd5\xfc\
-\x60\x7f\xe6\x25\xa2\x7f\xe0\xa6\x6f\xfe\x49\xa9\x17\x53\xf1\x73\
-\x2e\x4e\xab\xa1\x8f\x6f\xec\x99\xbf\xf9\x26\xb6\xf6\xd0\xee\x65\
-\xec\xe5\xd8\xed\xeb\x37\x5f\xd2\xdf\x59\xd1\xde\xce\x1b\x85\xb6\
-\x97\xcd\x8a\x68\xe5\x78\xfc\xc5\x56\x8e\x45\x91\x72\xb9\x19\x19\
-\x40\x08\xc8\xe3\xbd\x73\x67\x51\xf1\x70\x5c\x9d\x5b\x43\xc7\xfd\
-\x82\x66\xff\x00\xe4\x9a\x72\xdf\x78\xbd\x87\x1a\xa6\x8a\x73\xd3\
-\xfe\x25\x13\x7f\xf2\x4d\x1e\xd6\x1d\xc3\xd9\xcb\xb1\x3d\xef\x81\
-\x53\x50\xd3\x66\xb5\xb9\xbe\x01\xa7\xb8\xb9\x9e\x49\x22\x84\xa6\
-\x4c\xc8\x57\x03\xe6\xc8\xc6\x47\x7e\x40\xc7\x1d\x69\xf6\x1e\x0d\
-\x7b\x6f\x0d\xdf\xe9\xb3\xdf\x2c\x93\xdf\x4e\x27\x96\xe5\x56\x76\
-\xdc\x40\x40\x33\xe7\x4d\x23\x13\x88\xc0\xfb\xc0\x60\x0e\x38\xe6\
-\x01\x73\xe3\x1f\xfa\x0b\x68\x60\xfa\x7f\x64\xcd\xff\x00\xc9\x34\
-\x1b\xbf\x18\x0f\xbd\xab\x68\x63\xfe\xe1\x33\x7f\xf2\x4d\x3f\x69\
-\x0e\xe2\xf6\x72\xec\x24\xde\x05\x9e\x74\x68\x65\xd4\xe0\xfb\x3c\
-\x06\x67\xb1\x55\xb2\xc3\x46\xf2\x4a\x25\xcc\xad\xbf\x12\x0d\xca\
-\x32\x00\x4c\x8c\xe4\xe7\x9a\xa9\x73\xe0\xdd\x6d\xf5\xf5\xb9\x8a\
-\xfe\xcb\xcc\xbc\xb7\xbd\x17\xf7\x46\xc3\xf7\x40\xc8\x2d\x63\x54\
-\x48\x8c\xbb\x81\x29\x01\x3b\x8b\x30\xca\x9c\x8e\x40\xab\x3f\x6f\
-\xf1\x6f\xfd\x05\xb4\x5c\xff\x00\xd8\x22\x6f\xfe\x49\xa5\xfb\x6f\
-\x8c\x38\xff\x00\x89\xa6\x89\xff\x00\x82\x89\xbf\xf9\x26\x8f\x69\
-\x0e\xe1\xec\xe4\x6a\x68\x3e\x1d\xb8\xd1\x75\x4b\xd9\xcd\xfa\xc9\
-\x69\x38\x55\x8e\xd6\x38\xe4\x50\x98\xe3\x73\x6e\x91\x97\x79\x1d\
-\x4a\x2a\x06\x39\x24\x13\x8c\x6f\xd7\x1b\xf6\xcf\x18\x7f\xd0\x53\
-\x45\xc7\xaf\xf6\x44\xdf\xfc\x93\x4c\x93\x51\xf1\x6a\x00\x7f\xb5\
-\xb4\x43\x9f\xfa\x84\x4d\xff\x00\xc9\x34\x7b\x48\x77\x0f\x67\x23\
-\xb5\xa2\xb8\xc5\xbd\xf1\x73\x2e\x7f\xb5\xb4\x41\xff\x00\x70\x89\
-\xbf\xf9\x26\x83\x7b\xe2\xf0\x09\xfe\xd5\xd1\x0e\x3f\xea\x11\x37\
-\xff\x00\x24\xd1\xed\x21\xdc\x3d\x9c\x8e\xce\xb8\xbf\x16\x06\x3e\
-\x38\xd0\xf6\xf5\xfe\xce\xbe\xff\x00\xd1\x96\xb5\x10\xd5\x7c\x5c\
-\x4e\x0e\xa7\xa2\x8f\xfb\x84\x4d\xff\x00\xc9\x34\xc5\xb5\xd5\xaf\
-\x75\xcb\x7d\x4b\x59\xbf\xb1\xb8\xfb\x2d\xb4\xd0\x45\x15\xa5\x93\
-\xc1\xfe\xb1\xa2\x62\x49\x69\x5f\x38\xf2\x80\xc0\x03\xa9\xa9\x95\
-\x48\xb5\x64\x54\x61\x24\xc9\x7c\x99\x37\x86\xc6\x4f\xb5\x3f\x7c\
-\xea\x31\xb7\xb5\x5a\x10\x49\xb7\x72\x60\x1f\xad\x34\x09\x14\x72\
-\x03\x67\xad\x60\x6c\x57\x59\x33\xf7\xc0\xfc\x29\xf1\xb2\xb3\x1e\
-\x4a\x2f\xb8\xa7\x3b\x43\x6f\x19\x79\x36\xaa\x28\x2c\xce\xc4\x00\
-\xa3\xb9\x26\xb0\xdb\x52\xb9\xd5\xe6\x68\xbc\x3d\x02\xbc\x63\x19\
-\xd4\xa7\x52\x20\x1f\xee\x01\x83\x2f\xe1\x85\xff\x00\x6b\xb5\x52\
-\x42\x65\x5f\x15\x6b\x77\x3a\x0c\x26\xe0\x3c\x26\x06\x3b\x70\xdf\
-\x78\x9f\x40\x3b\x9f\x61\x5c\x02\xdf\x6a\x3a\xc6\xf8\x8c\xad\x65\
-\x6c\xfd\xdc\x66\x53\xed\x8e\x8a\x3d\xce\x4f\xd2\xbd\x42\xd7\xc3\
-\x36\xb6\xd7\x0d\x77\x76\xd2\x6a\x17\xce\x36\xb5\xcc\xe0\x12\x07\
-\xa2\x8e\x88\x3d\x94\x0f\x7c\xd7\x35\xe2\x3f\x0b\x34\x33\x9b\xdd\
-\x36\x3f\x97\xac\x89\x9e\x9e\xe0\x57\xbf\x97\x56\xa4\xff\x00\x77\
-\x3d\x3f\x53\xcd\xc5\x53\x9d\xb9\xe3\xa9\xc2\xc9\xa2\x43\x6b\x77\
-\xe7\xdb\x46\x16\x40\xa5\x59\x9b\x96\xfc\x4f\x53\xf5\xac\xc9\x63\
-\x78\x5f\x6b\x8c\x1f\xe7\x5d\x40\x98\x3a\x9e\xfd\x87\xa8\xff\x00\
-\xeb\x54\x17\x36\x50\x5c\xc5\xd4\x82\x06\x70\x3b\x7b\x8a\xfa\x9c\
-\x37\xb3\xa1\x37\x25\x14\x9b\xb5\xfe\x5b\x7e\x67\x9b\x3a\xf5\x6a\
-\x52\x8d\x29\x49\xb8\xc5\xb6\x97\x6b\xda\xff\x00\x92\x39\x5d\xc4\
-\x5c\x8c\x8e\xd5\x65\x5b\x03\xa0\x3c\x54\x57\x96\xd2\x5a\xdd\xae\
-\xfe\x87\xa1\xf5\x14\xe0\x78\xaf\x62\x2d\x35\x74\x73\x49\x10\x48\
-\x71\x74\xb8\xe3\x9a\xb7\x9c\xd5\x59\x48\x33\x26\x47\x4a\xb0\x2a\
-\x89\x64\x57\x44\xf9\x55\x2c\x7f\xea\xd4\xfb\x54\x77\x3c\xc2\xde\
-\xd4\xf8\xbf\xd4\xa1\x3e\x94\x0b\xa0\xad\x94\xcb\x27\x5e\xe3\xd6\
-\xa1\xb2\x19\x95\xdc\xbf\x19\xe5\x7b\xd4\xef\xca\x9f\xa5\x57\xb3\
-\xff\x00\x96\x99\x07\xa8\xe7\xd2\x81\xf4\x65\xc2\x3b\x53\xe2\x1f\
-\x38\x72\xd8\xd8\x41\xc6\x33\x9e\x7a\x53\x2a\x5b\x79\x8c\x33\x2e\
-\x15\x5b\xe6\x18\xc8\xe8\x73\x41\x0e\xfd\x0d\x4b\x71\x88\xd9\x46\
-\x70\x0d\x65\xea\x1c\x48\xd5\xab\x6a\x0f\x94\x73\x9c\x67\x92\x6b\
-\x2f\x51\x1f\x39\x20\x67\xd7\x8e\x95\xe7\x65\x7f\xee\xcb\xd6\x5f\
-\xfa\x53\x3b\xf3\x9f\xf9\x18\x4b\xd2\x1f\xfa\x44\x4c\x2b\x8e\xa6\
-\xa5\xb7\x04\xe0\x0e\xf5\x14\xfd\x4d\x49\x6f\xd3\xf1\xaf\x52\x3b\
-\x9c\xcf\xe0\x2f\xc0\xcc\xad\xc7\x5e\x95\xa5\x13\x84\x90\x0c\x67\
-\x68\xc1\x3f\xe1\x54\x2d\x86\xe3\x93\xc8\x1d\x2a\xec\x44\xc4\xec\
-\x10\x6e\xda\x7a\x8e\xe6\xaa\x47\x0c\xf7\x16\x27\x27\xec\xf1\x46\
-\x01\x6d\xd9\x3f\xfe\xba\x49\x83\x7d\x9d\x63\x07\x03\x71\x07\x8f\
-\xc6\x9f\x0c\x43\xc9\x38\xce\x5e\x3c\x82\x3b\x62\xa3\x99\xb1\x22\
-\x36\x7e\x56\x01\xb1\xef\xde\xb3\x17\x52\x38\x17\x7d\xe8\x62\xf9\
-\x50\x32\x07\xad\x5b\x9e\x32\x6e\x51\x99\xb0\x8d\xc1\xf7\xf4\xa8\
-\xac\x99\x0d\xd3\x17\x00\x29\x07\x69\xf4\xa9\xa5\x65\x9e\xea\x24\
-\x0e\x02\x29\xdc\x4d\x49\x12\x6e\xe5\x87\x0a\xd1\x30\xe0\x71\x81\
-\x91\xde\xa0\xb1\xe2\xdf\x19\xce\x18\xff\x00\x3a\x6d\xcd\xc2\xc7\
-\x13\x10\x41\x20\xf4\xcd\x45\x6d\x33\x25\xb2\xef\x50\xbd\x49\x3e\
-\xb5\xc9\x88\xc4\xd3\xc3\xc7\x9a\x6f\x7d\x97\x56\xfb\x25\xd4\xed\
-\xc2\xe0\x2b\xe3\x3d\xca\x4b\x6d\x5b\x7a\x24\xbb\xb7\xd1\x7f\x4b\
-\x52\xd4\x8c\x37\x65\xb2\x6a\xa1\x95\xe2\x61\xe5\xbf\x24\xe7\x22\
-\xa3\x69\xcc\x92\x6d\x42\x73\xda\xb4\xf4\xdd\x2d\xe4\x99\x3c\xc0\
-\x40\x3d\xf1\x5e\x4b\xa9\x88\x52\x95\x5c\x4b\x51\x83\xda\x3a\x69\
-\xea\xfb\xfa\x69\xea\x7a\xf5\x69\xe0\x61\x46\x14\x30\x89\xca\xa2\
-\x6f\x9a\x7a\xa4\xfb\x72\xc6\xfa\x2f\x36\x93\x76\x4f\x4b\xb4\x6a\
-\xe8\x0d\x73\x2d\xca\x12\xfd\x7e\xf2\xe7\x3c\x57\x56\x21\xcf\xde\
-\x15\x9d\x6b\x62\xb6\x90\xa8\x52\x17\xd0\xf7\xab\xf0\x89\x14\x64\
-\xb6\xe1\xdf\x9a\xf8\xcc\xc3\x11\x1a\xf5\x2f\x05\xa2\x3d\x3c\x35\
-\x29\x53\x85\x98\xfd\x8a\x18\x00\x08\xc1\xe4\x62\xa6\x64\x52\x40\
-\x51\xc5\x44\x8d\x96\xcf\x4a\xb2\x8b\xd5\x98\x93\x8a\xf3\x0e\xb1\
-\x9e\x42\xed\x39\x41\x9a\x67\x95\xec\x2a\xca\x32\x4b\x9e\x3f\x31\
-\x4b\xe5\xaf\xf7\x29\x01\x66\x4d\xc2\x63\x92\x58\x74\x00\x76\xab\
-\x31\x80\xab\x9d\x98\xf7\x15\x55\x5c\x06\x1b\x5b\x9e\xf5\x61\x4b\
-\xb1\x25\x89\x0b\xfa\x1a\x94\x51\x22\x3e\x3a\xe7\xf2\xa7\x6d\xc8\
-\xe3\x9f\xc2\xa3\x8a\xe2\x25\xca\xf5\x19\xe6\xa6\x13\x46\x4f\x43\
-\x83\xd8\x53\x10\xd1\x2c\x6a\x40\x64\x25\xbd\xa9\xfe\x76\xcc\x70\
-\x40\xf6\xa1\x62\x40\xdb\xdb\x2a\x3d\x0d\x26\xc4\x2c\x59\x58\x30\
-\xf4\x14\xc0\x94\xca\x0f\x27\x77\xe3\x48\x97\x00\xb6\x57\x9c\x54\
-\x3e\x4b\xc8\xd9\x5c\x6d\xf4\x35\x9f\xaa\xea\xd6\x9e\x1e\xd3\xe5\
-\xbc\xbf\x2f\xb5\x48\x55\x8e\x35\x2e\xf2\x31\xe8\xaa\xa3\x92\x4f\
-\xff\x00\x5c\xf0\x09\xa6\x84\x6a\xb3\xc9\x29\xea\x13\xf0\xa7\xa9\
-\x62\xdb\x49\x38\x1e\xa2\xb0\x5f\xc5\x16\x9f\xd8\xfa\x6d\xfc\x30\
-\x5c\x4a\x75\x35\x8c\xda\xdb\x22\xaf\x9b\x21\x75\xde\x07\x2c\x14\
-\x61\x72\x49\x2d\x81\x83\xcd\x5b\xd2\x75\xb8\x75\x88\x66\x78\xa3\
-\x9a\x09\xad\xa6\x30\x5c\x5b\x4e\x14\x49\x13\x8e\x70\x76\x92\x08\
-\x20\x82\x08\x24\x10\x69\xd9\x8a\xe8\xd7\x12\x15\x6e\x9c\x52\x48\
-\xf1\xb8\xc2\x91\xba\xab\x4b\x3e\xd1\x9c\xe3\xda\x9a\x24\x8f\x68\
-\xc0\x04\x9a\x00\xb8\xa5\x63\x8c\x02\x32\x69\x15\xd5\x41\x66\x04\
-\x0f\xad\x57\xde\xc0\x02\xdd\x3d\xaa\x86\x8f\xac\x7f\x6c\x5b\xdc\
-\x5c\x47\x17\x97\x6f\x1d\xc4\x90\xc3\x26\xec\xf9\xc1\x0e\xd2\xd8\
-\xc0\xc7\xcc\x18\x77\xe0\x67\xbd\x00\x6a\x32\xab\x36\xfc\x75\xe9\
-\xcd\x42\xef\xb7\x95\xe4\xfb\x8a\x60\xdd\x73\x27\x5f\x94\x54\x3a\
-\x9e\xa9\x61\xa3\x2c\x66\xed\x8e\xf9\x5b\x6c\x50\xc6\x0b\xc9\x2b\
-\x7a\x2a\x8e\x58\xd2\x5a\xec\x3d\x8b\x76\xa6\x69\xb2\x77\x71\x54\
-\x2f\x35\xf8\x6d\x6e\xa4\xb1\xd3\xe0\x7d\x4b\x52\x5f\xbd\x04\x2c\
-\x02\xc7\xef\x23\x9f\x95\x07\xd7\x93\xd8\x1a\x86\x3b\x3d\x5b\x5b\
-\x5f\xf8\x98\xc9\x26\x91\x60\xc7\x3f\x65\xb7\x93\xfd\x22\x51\xe8\
-\xf2\x0e\x10\x1f\x44\xe7\xfd\xae\xd5\xb5\x69\x6d\x61\xa6\xda\xad\
-\xad\x8d\xbc\x70\x40\x33\x84\x8c\x63\x9e\xe7\xeb\xef\x5a\x25\x6d\
-\xc8\x7a\x98\xd1\xf8\x7e\x5d\x5a\x5f\x3f\xc4\x77\x0b\x78\xaa\x41\
-\x5b\x28\x86\xdb\x68\xfe\xa3\xac\x87\xdd\xb8\xf4\x51\x5b\x4c\x82\
-\x38\xfe\x51\xc0\xe0\x0f\x4a\x71\x20\x7f\xaa\x25\x68\x32\x31\xc2\
-\x05\xc9\x3e\x82\xa8\x9b\x15\xd5\xfc\xc9\x0a\xb1\xda\xab\xdf\x15\
-\x37\x90\xac\x85\x46\x18\x1f\x5a\x30\x47\xde\xc7\xe1\x51\xca\xef\
-\xd1\x06\x45\x52\x76\x13\x47\x17\xe2\x6f\x08\x91\xbe\xfb\x4e\x4c\
-\x48\x39\x64\x1d\xfe\x95\xc6\xac\xa0\x92\x8e\x9f\x30\xea\x3a\x10\
-\x7d\xab\xd9\x0f\xcc\xbb\x4e\x31\xdf\x8a\xe5\xbc\x49\xe1\x18\xef\
-\x61\x33\x5a\xe2\x29\xd7\x9f\x97\x80\xff\x00\x5a\xfa\x2c\x0e\x64\
-\xb4\xa7\x5b\xef\x3c\xbc\x4e\x12\xfe\xf4\x0f\x3b\xbb\x86\x1b\xbc\
-\x12\xa3\x3f\xcf\xe9\xef\x58\xd7\x36\xcd\x6e\xe7\x07\x72\x76\x38\
-\xad\xa7\x57\xb6\x91\xa1\xb8\x42\x92\x03\x82\x1b\xbf\xf9\xf5\xa8\
-\x5f\x6c\x84\x86\xe9\xd0\x92\x3f\x9d\x7d\x55\x1a\x8e\x3b\x6c\x79\
-\x0d\xf4\x67\x3d\x37\xfa\xc4\x20\xf7\xab\x00\xe4\xe6\x8d\x46\xdc\
-\x42\xe1\xe3\x39\x4c\xf4\x23\xa5\x34\x1c\xd7\xa5\x19\x29\x2b\xa1\
-\x3d\x86\x5c\x9c\x46\x71\x52\xdb\xf3\x02\x93\x51\xce\x47\x92\x46\
-\x29\x60\x39\x85\x71\xe9\x54\x2e\x84\xc4\x8d\xa7\x22\xa1\xb4\x1c\
-\xcb\x81\xd0\x8e\x7d\x2a\x56\xce\x08\xa8\x6d\x32\x66\x99\x40\x3e\
-\xbc\x50\x2e\x8c\xb4\x0d\x49\x0a\x16\x63\xb5\x4b\xb6\x40\x50\x3d\
-\x73\xc5\x46\x29\xe9\x23\xa3\x8f\x2c\x91\x92\x3a\x50\x46\xa6\xbd\
-\xb3\x65\x0f\x61\x9e\x95\x9b\xa9\x9f\x98\x80\x7e\xa2\xb4\xad\x87\
-\x0f\xc7\x7a\xcc\xd4\x70\x24\x6c\x8c\xf1\x5e\x6e\x57\xfc\x0f\xfb\
-\x7a\x7f\xfa\x5c\x8f\x47\x38\xff\x00\x7e\xbf\xf7\x69\xff\x00\xe9\
-\xb8\x98\x33\xf5\x35\x34\x1d\x05\x43\x3f\xde\xa9\x60\xe9\x8a\xf5\
-\x63\xb9\xcb\x2f\x80\xd5\x83\x02\x31\x8f\xa9\xab\x6a\x7c\xb5\x38\
-\x19\xc0\xce\x3d\x49\x1d\x6a\x85\xb3\x6d\xe7\xa8\xab\xea\x48\x8d\
-\xc8\xce\x02\x1c\x0f\xa8\xa7\x23\x86\x5b\x91\x19\x19\xf6\xa2\x12\
-\x81\x17\x6e\x7d\x73\x4c\x70\x23\x72\x99\x3f\x22\xe3\x14\x08\xb7\
-\xb3\x16\x24\x2e\xec\x63\xdf\x14\xe7\x51\xf3\x33\x75\x60\x0f\xd3\
-\xb5\x40\xc8\x0b\xb0\x8c\x0c\x60\x73\xf5\xe9\x56\x05\x84\x7b\x50\
-\xfc\xc8\x18\x73\x83\x4c\x8e\x32\xce\x19\xce\x51\x41\xc9\xcd\x4b\
-\x2d\xc3\x33\x00\x3a\x7a\xfb\x57\x99\x5f\x18\xf9\xdd\x1c\x3a\xe6\
-\x9f\x5e\xd1\xf5\x7f\xa2\xd7\xd1\x6a\x7b\x18\x7c\xbd\x2a\x6b\x11\
-\x8b\x97\x25\x37\xb7\xf3\x4b\xfc\x2b\xb7\xf7\x9e\x8b\xcd\xe8\x40\
-\xe9\x15\xbb\x12\xb9\x91\xc7\x4d\xc7\x81\x4e\xb7\x59\x6f\x9f\x6a\
-\x1f\xa9\xa7\x59\xe9\xf2\xde\xcd\xf7\x4e\x33\xc7\xbd\x75\x1a\x5e\
-\x8d\xf6\x65\x0e\xd1\x80\xde\xa0\x74\xaf\x2a\xb5\x4a\x58\x3b\xd4\
-\xa9\x2e\x7a\x8f\xab\xfc\x92\xe8\xbc\xbe\xfb\xb3\xb6\x55\xaa\x62\
-\xe2\xa8\xd2\x8f\x25\x25\xf6\x57\xe6\xdf\xda\x97\x9b\xf9\x24\xb4\
-\x29\x68\x3a\x5e\x2e\x4b\xcd\x1e\xe4\x1c\x64\xf7\x35\xd4\xac\x4a\
-\xac\x02\xae\x00\xe8\x6a\x24\x8f\x6e\x14\x1c\x93\xe9\x52\x80\x7a\
-\x29\x66\x3f\xca\xbe\x4f\x1b\x8e\xa9\x89\x95\xe4\x77\x61\xf0\xf1\
-\xa2\xac\x8b\x5c\x6d\xc2\xb9\x0c\x3d\x45\x4e\xac\xcf\x18\x3e\x9d\
-\x6a\xb8\xf3\x02\x0c\x1f\xaf\x15\x24\x5b\x82\x93\xb7\x73\x57\x96\
-\xd9\xd7\x62\x54\x6c\xe0\x6c\x60\x7e\x95\x6d\x17\x7a\x1c\x8e\x9e\
-\x86\xa0\x8d\xa4\x65\xc1\x00\x13\xef\x4e\x58\x4b\x1f\x99\x88\x3f\
-\x4a\x90\x25\xfb\x38\x18\x65\xdc\x08\xf5\xa7\xe5\xbd\x7f\x4a\x62\
-\x1f\x29\x39\x61\x9f\x7a\x5f\x3e\x4f\xef\x2f\xe5\x48\x0b\x0b\x6a\
-\x23\x3b\xb3\x85\x1d\x8f\x7a\x59\x12\x59\x54\x18\xdb\x72\x8e\xc0\
-\xd4\xac\x3f\x76\xc4\x03\x9e\xf9\xa4\x56\xca\xae\xc6\x00\x0e\xa0\
-\x2e\x29\x0c\xae\x03\x42\x09\x6d\xc3\x03\xbd\x3a\x1b\xa6\x90\xe7\
-\x6e\x07\xb1\xab\x65\x54\x93\xc0\x6c\xf2\x77\x1a\x55\x8a\x35\x8c\
-\xba\xc5\xf8\xa9\xa6\x03\x3c\xc7\x7e\x06\xee\x3d\x69\xeb\x29\x41\
-\x81\x8c\xfd\x29\xe6\x22\xcb\xbb\x90\x3d\x08\xa8\xfc\xb2\xbc\x92\
-\xaa\x7d\x71\x40\x80\xce\xf1\xe5\x8f\xcc\x7e\x95\x9f\xac\x6a\x0b\
-\x6d\xa4\xce\xd2\xc7\x34\x86\x44\x28\xa2\x08\x1e\x56\x24\x83\x8f\
-\x95\x01\x38\xf7\xe9\x57\x14\x33\x48\x41\x0a\x7f\x1a\x69\xc8\x6c\
-\x6d\x18\xf6\xa7\x7b\x01\xc6\x69\xf2\xdc\x5b\xe8\x7e\x10\xbd\xfb\
-\x15\xeb\x8d\x21\x56\x0b\xc8\x4d\x94\xab\x2c\x7b\xad\xfc\xb2\x42\
-\x15\xdc\xe0\x31\x00\x95\x07\xf4\x35\x1d\xde\x93\x71\xab\x6a\x89\
-\x7b\x71\xa7\x5c\x1b\x3b\xfd\x76\x39\x4c\x52\x44\xca\xde\x42\x5a\
-\x34\x45\xa4\x5e\x0a\xab\x30\xc6\x18\x0c\x82\x01\x1c\xe2\xbb\x74\
-\xce\xe1\xbc\x61\x6a\xc9\x45\x74\x1b\x4b\x0f\xc2\xab\x9f\xb1\x3c\
-\xa7\x9f\x4d\xe1\xe8\x60\xd3\xf5\x79\x2d\x34\x86\x49\xed\xf5\x54\
-\x6d\x3c\xc7\x19\xcc\x31\xee\x89\x8f\x94\x3f\x85\x49\x32\x13\xb7\
-\x00\xf3\x9e\x94\x5e\xf8\x7f\xed\x36\x9a\xe5\xd8\xd3\x2e\x0d\xef\
-\xf6\xcc\x6d\x6b\x3a\xab\x89\x52\x3d\xd0\xee\x68\xd8\x72\xa3\x1b\
-\xf2\x57\x1d\x0e\x7a\x57\xa1\x79\x4a\x07\x62\x7b\xe4\xe2\xa5\x89\
-\x86\x3f\xba\x71\xd3\x39\xa6\xa6\xc5\xca\x8e\x12\x78\x8f\x86\xee\
-\xb5\xe8\xb4\x5b\x25\xb2\x8e\xe6\x0b\x48\xec\x63\x8e\x3d\x91\x1b\
-\x99\x1a\x48\xcb\x28\x1c\x64\x7e\xec\xb6\x3b\x01\x9a\x6f\x89\x3c\
-\x3d\x6f\xa7\xe9\xba\x65\xbd\xad\xab\xdf\xc9\x61\x6a\xd1\x41\x69\
-\x3e\x99\x25\xe4\x13\x9c\x0e\xa5\x46\x23\x72\x54\x7c\xe4\xf0\x19\
-\xb8\x22\xbb\x47\x89\x6e\x27\x46\x9e\xd9\x24\xf2\x9f\x7c\x6c\xc9\
-\x9d\x8d\x82\x32\x0f\x63\x82\x79\xf7\x35\x6e\x2d\xa4\xe1\x94\xaf\
-\x3d\x69\xdc\x2c\x41\x14\x4e\x96\xd1\x0d\x9e\x5c\x85\x41\x68\xf3\
-\x9d\xa7\xb8\xcf\x7a\xaf\xa7\x68\xd6\xba\x7c\xb3\xdc\x42\x85\xee\
-\xa6\x39\x96\xe2\x56\x2f\x23\x7a\x0d\xc7\xb0\xec\x07\x02\xb5\x3c\
-\xd5\x12\x00\x24\xe7\xd0\x50\x24\x08\xe7\x2c\xa7\xea\x0d\x25\xa0\
-\xde\xa4\x7e\x6b\x1c\x67\x07\x1e\xd4\xf5\x70\x5b\xe7\x4e\x3e\xb4\
-\xe7\xba\xe0\x01\xb7\xfe\x02\x29\xa6\x4f\x33\x1b\x94\x67\xd0\x55\
-\x08\x41\x34\x4a\xd8\x27\xf4\xa4\xdf\xf3\x67\x80\xb4\xe6\x85\x5b\
-\x90\x83\x3d\xf8\xa8\x84\x0f\xbf\xd1\x7d\xa8\x10\x8e\xc0\x9e\x08\
-\xc7\xbd\x22\x01\x9e\x87\xf3\xa7\x4d\x06\xfc\x73\xc0\xf7\xa4\x3b\
-\xb2\xaa\x80\x11\xdf\x9a\xa0\x1a\xce\x4b\x61\x17\x8e\xf9\xe2\x9c\
-\xc4\x10\x14\xe4\x31\xe9\x81\x9a\x7c\x9b\x15\x57\x1f\x29\x3e\xb5\
-\x0b\xb4\x81\x76\xab\xfe\x20\x55\xa6\x4d\x8e\x7f\xc4\xde\x14\x4d\
-\x5a\x03\x2c\x6d\xe5\xdc\xa0\xf9\x49\x1c\x1f\x6a\xf3\x1b\x88\xa6\
-\xb2\x99\xe1\xb9\x8d\x92\x44\x38\x20\x8a\xf6\xe4\x0a\x33\xe6\xb9\
-\x66\x23\xbd\x62\x78\x87\xc3\xd0\x6b\x36\x6c\x8a\xa8\x92\x8e\x52\
-\x4c\x72\x2b\xde\xcb\xf3\x37\x4a\xd4\xea\x6d\xf9\x1e\x66\x2b\x06\
-\xaa\x7b\xf0\xdc\xf2\x47\x8f\xcd\x8f\x0d\x8c\x7a\x7a\x55\x39\x6d\
-\x4a\x12\x50\x7e\x15\xad\x7d\xa7\x5e\x69\x97\x46\x0b\xb4\x29\xb7\
-\xee\x9e\xc7\xe9\x51\x2e\x02\xe0\xfc\xc7\xb6\x3b\x7b\x8a\xfa\xfa\
-\x75\x6c\xb9\xa2\xf4\x3c\x47\x74\xec\xcc\x29\xc6\x62\x3c\xe2\x9d\
-\x6e\x42\xc0\x17\x1f\x8d\x5c\xbe\xb5\x56\x89\x8c\x67\x2d\xd4\xe3\
-\xa1\xaa\x30\x1f\xdd\xf3\x5d\xd0\x9a\x9a\xd0\x7f\x64\x99\x89\xda\
-\x79\xa8\xad\x58\x09\xe5\x2d\xd4\x8e\x2a\x55\x23\x07\x35\x0c\x00\
-\x2d\xcc\xb9\xe7\x8a\xb0\xe8\xcb\x79\xa9\x21\xff\x00\x58\x46\xf0\
-\x99\x04\x64\xd4\x7b\x87\x96\xa0\x00\x3a\xf3\x4e\x48\xfc\xc6\xc6\
-\xe0\xa0\x02\xc4\x9f\x6a\x66\x6c\xd8\xb3\xc8\x56\x07\xa8\x38\x35\
-\x99\xa9\xff\x00\xac\x35\xab\x66\x77\x09\x1b\xa8\x38\x3f\xce\xb2\
-\xb5\x4e\x18\xd7\x9b\x96\x7f\x0a\x5f\xe3\xa9\xff\x00\xa5\xc8\xf4\
-\x73\x8f\xf7\xc8\xff\x00\xd7\xba\x5f\xfa\x6a\x06\x0c\xc7\xe6\xa9\
-\xad\xcf\x4a\x82\x6f\xbd\xf8\xd5\x8b\x7c\x6d\x1e\xa7\xb5\x7a\x71\
-\xdc\xe6\x97\xc0\x5f\xb6\x1f\x38\xe3\x23\xd2\xae\xaa\xfe\xe5\xd8\
-\x1e\x4a\xf2\x3d\x06\x6a\xa5\xb7\x00\xb7\xb6\x2a\xea\x26\xe8\xdf\
-\x0d\x83\x8e\x07\xaf\x3d\x29\x55\xa9\x0a\x71\x73\x9b\xb2\x5d\x4e\
-\x48\x52\xa9\x5a\xaa\xa7\x4d\x37\x27\xa2\x4b\x76\x23\x9d\xbb\x9b\
-\xa1\x18\x61\x48\xee\xa0\xb3\x30\xc0\x7e\x42\xf7\xa6\x49\x3a\x89\
-\x36\xa7\xcc\xea\x3a\xfa\x54\x2c\xfb\xd9\x54\x82\x49\xe7\x26\xbc\
-\x87\x3a\xd8\xdf\x82\xf0\xa7\xdf\x69\x4b\xd3\xf9\x57\x9e\xfd\xad\
-\xb9\xed\xaa\x58\x7c\xb5\x5e\xad\xaa\x56\xed\xbc\x23\xeb\xfc\xcf\
-\xc9\x7b\xab\xab\x7a\xa0\x9a\x66\x00\x9f\x6f\xba\x3b\x54\xda\x6d\
-\x9b\xdd\x4a\x63\xfb\xcf\x8f\x94\x67\x15\x36\x99\x66\x6e\x6e\xde\
-\x3c\xe0\x60\x65\xfd\x2b\xad\xb2\xd3\x20\xb4\xda\x06\x49\x03\x96\
-\x3c\xe6\xb8\xb1\x98\xca\x58\x08\x7b\x1a\x4a\xdf\xd7\xf5\x7e\xac\
-\x9a\x71\xad\x8d\x9f\xb6\xad\x2b\xb7\xd5\xff\x00\x5f\x77\x44\x3f\
-\x4f\xb1\x6b\x3b\x55\x59\x42\x06\xee\x6a\xf0\x53\x80\xc4\x71\xea\
-\x29\x99\x1c\x85\xc3\x0e\xc7\xad\x48\x3e\x65\xdb\xb7\x3f\x43\xc5\
-\x7c\x6d\x6a\xd2\xab\x37\x39\x6e\xcf\x66\x10\x50\x8a\x48\x7d\xbe\
-\xd3\xc9\x39\xe7\x83\x57\x1a\x10\xea\x14\x70\x6a\x94\x08\xdb\xca\
-\x95\x6d\xbf\x4a\xd0\x55\x6d\x9f\x2a\xf2\x07\x53\x5c\x52\x66\xc8\
-\x6a\x46\x47\x03\xb5\x2a\x46\xc3\xa1\x00\x93\xda\x9f\x04\x52\x6e\
-\x25\xc2\x7b\xe3\xbd\x4a\xcb\x17\x45\x52\x08\xf4\x35\x93\x28\x87\
-\xcb\x99\x5b\x21\xb7\x63\xda\xa7\x89\xe4\x65\x3b\xf1\xcf\xb5\x2c\
-\x6b\x81\xf3\x16\xfc\xea\x6f\x28\x28\xe1\x89\xfa\xd4\x81\x0a\x43\
-\xf3\xe7\xe5\x35\x2f\x96\x7f\xb8\x29\x4a\x64\xfc\xb8\xc8\xeb\x4b\
-\xf3\x7b\xfe\x54\x86\x4b\xf6\x79\x25\x6c\x1f\xbd\xea\x6a\xc4\x70\
-\x18\xc6\x1c\x84\x1e\xb8\xa6\x94\xf3\x80\x20\xed\x51\xd7\x1d\xea\
-\x74\x8d\x59\x7e\x57\x3c\x7a\x9a\x68\x40\x23\x55\x6e\x65\x05\x47\
-\xa7\x7a\x79\x40\x5b\x2a\xec\x06\x3a\xe2\x9b\xb5\x99\x89\x55\x0c\
-\x07\x07\x26\xa4\x0a\xad\x1e\x1b\xe4\x23\xd0\xd3\x11\x12\x60\xb3\
-\x28\x70\xff\x00\x43\x52\xf9\x6b\xb7\xe6\x07\x07\xb5\x32\x24\x8d\
-\x5b\x8c\x1e\x69\xee\x54\x03\xb1\xb2\x7d\x05\x00\x42\x61\x89\x49\
-\x28\x70\x7d\x31\x4d\x70\xfc\x0d\xc0\xfa\x8a\xb0\xaa\xca\x9f\xdd\
-\x3d\xe9\x9f\x28\x25\x8a\x8e\xbc\x9a\x2c\x03\x12\x35\x66\xcb\xb8\
-\x38\xed\x4f\xf3\x5d\x88\x08\x3f\x21\x52\xa4\x23\x1b\x89\x52\x9e\
-\xd4\xe5\x4c\xb1\xda\x42\x8a\x60\x54\x74\x77\xca\xbe\x79\xf4\xa9\
-\x22\x8d\xc6\x42\xa9\x03\xd5\xaa\x5d\xca\x1b\xe5\x62\xed\xfc\xaa\
-\x51\x18\x99\x46\xe2\x40\x1d\x79\xa7\x61\x15\x5d\x64\x51\x84\x65\
-\x04\xd4\x62\x29\x64\x90\x6d\xdc\xd8\xab\xa1\xa3\xde\x54\x76\xa1\
-\x95\xf9\x31\x39\x5c\xf4\x00\x53\x02\x02\xae\xb2\x0c\xa0\x06\xa7\
-\x40\xcc\xdf\xbd\x00\x0f\x41\x4b\x18\x7e\x37\x65\xcf\xa8\x1d\x29\
-\xde\x50\x1c\xef\xf9\xbb\x0a\x62\x22\x9e\x18\xc2\x16\x3b\x86\x3d\
-\x05\x16\xec\xaa\x41\x44\x63\xc7\x26\xa5\xd8\xc5\x8e\xfc\x9f\xa7\
-\x6a\x89\x59\xdd\x98\x44\xcc\xa3\xd0\xaf\x14\xc4\x3c\xdd\x33\x31\
-\x58\xd1\x80\xcf\x7a\x68\x7c\xf2\x4f\x43\xc8\x1d\xea\x24\x59\x46\
-\xec\xe0\xb9\xe9\xc5\x28\x8e\x4c\x7c\xab\x96\xf5\x06\x80\x2c\x18\
-\xe3\x95\xb2\x0e\xdf\x6c\xd4\x51\xdb\x0f\x30\xa9\xc9\x1d\x73\x9a\
-\x64\x91\xb7\x97\xb9\xce\xcf\xa0\xcd\x3a\x16\x7d\x98\x5e\x17\xae\
-\x48\xa6\x04\xbf\x65\x56\x90\x15\xcd\x32\x68\x54\x64\x33\xb0\x6e\
-\xd5\x2a\xcc\xff\x00\x74\xba\xe7\xd0\x52\x13\x99\x37\x0e\xc3\xb8\
-\xeb\x4c\x0a\x5e\x46\x1b\x79\x38\x1d\xb9\xa4\x0c\xe2\x4c\x93\x81\
-\xf5\xab\x81\xbe\x46\xc6\x33\xe8\x45\x53\x79\xda\x4c\x2b\x46\xb8\
-\x3e\x84\x55\x26\x2b\x19\xda\xee\x91\x67\xab\xc0\x23\xb8\x50\xc7\
-\x19\x0c\xbd\x54\xd7\x97\xea\xfa\x2d\xd6\x91\x33\x09\x91\x9a\x1c\
-\xfc\xae\x07\x6a\xf5\xff\x00\x2d\x8a\xe2\x25\x55\x3d\xc9\x6a\xa3\
-\x79\xa5\xa5\xe5\xbb\xa5\xc2\x9d\xac\x08\x20\x67\x9a\xf5\xf0\x39\
-\x8c\xf0\xef\x95\xeb\x13\x87\x13\x84\x8d\x65\x75\xa3\x3c\x6d\xd9\
-\x59\x79\xe0\x77\xf7\xff\x00\xeb\xd5\x59\xe1\x8d\xff\x00\xd5\xe0\
-\x63\xbf\xf8\xd7\x4d\xe2\x1f\x0c\xcb\xa6\xca\x64\xb6\x0f\x2c\x18\
-\xcf\x2b\xc8\xae\x71\xd4\xab\x7d\xde\x95\xf6\x34\x2b\xc6\xa4\x54\
-\xe9\xbd\x0f\x06\x54\xe5\x4d\xf2\xc8\xa2\xca\x54\x90\x46\x3e\xb5\
-\x04\x03\xfd\x29\xb3\xcf\x15\xa1\x28\x12\x0c\x63\x07\xb1\xf4\xac\
-\xd5\xdd\x1d\xd3\xa9\xaf\x4a\x15\x14\x81\x6c\x5c\x07\x9a\x99\x24\
-\xd8\xd9\x2a\x18\x77\x06\xab\x06\xab\x30\x1f\xde\x8e\x14\xf0\x78\
-\x6e\x95\xa9\x9b\x36\xac\xfa\xbf\x6f\x41\x8f\xad\x66\x6a\xff\x00\
-\x7b\x8a\xd1\xb3\xca\xe4\x31\xe4\x0c\x1a\xcf\xd5\x86\x57\x23\xa7\
-\xad\x79\x79\x76\x90\x9f\xf8\xe7\xff\x00\xa5\xb3\xd2\xcd\xbf\xde\
-\x29\xbf\xfa\x77\x4b\xff\x00\x4d\xc5\x1c\xe4\xdf\x7e\xa7\x83\x85\
-\x15\x5e\x4c\xb4\xa1\x54\x12\x49\xc0\x00\x75\xad\x48\x61\x4b\x55\
-\x5f\xb4\x61\xa5\xc7\x11\x8e\xdf\x5a\xe9\xad\x8c\x85\x06\xa3\xbc\
-\x9e\xd1\x5b\xbf\xf2\x5d\xdb\xd1\x17\x87\xc0\xd4\xc4\xc1\xca\xea\
-\x30\x5b\xc9\xec\xbf\xcd\xf6\x4a\xed\xf6\x2d\x5a\x46\x7c\xad\xcd\
-\xc2\xe7\xbf\x7a\xb2\x70\x60\x66\x53\xb4\x02\x3a\xf7\xaa\xeb\x21\
-\x97\x05\xbd\x38\xc5\x59\x0a\xcd\x09\x00\x75\x23\x8f\x5a\xc1\x61\
-\xa7\x56\x4a\xae\x29\xdd\xad\xa3\xf6\x63\xfe\x6f\xcd\xed\xd1\x22\
-\x6a\x63\xa9\xd0\x8b\xa1\x81\x4d\x27\xa3\x9b\xf8\xa5\xe5\xfd\xd8\
-\xff\x00\x75\x6f\xf6\x9b\xd9\x60\xda\xde\x06\x95\x84\xbc\x7c\xd9\
-\xcd\x6d\x5a\xfd\x99\xcf\x9a\x65\x8f\x11\xaf\x21\xba\x9a\x64\xbe\
-\x14\x69\x17\xcd\x52\x15\x8e\x09\x50\x7a\x56\xcd\x8e\x8e\x0a\x14\
-\x9e\x00\x4e\x39\x24\x0c\x9a\xf2\xea\xe7\x34\xe2\xdc\x1a\x2a\x38\
-\x17\x2f\x78\x93\xc3\xd1\xa6\x2e\x2e\x18\x8d\xac\xe3\x69\xc7\x06\
-\xba\x18\xe7\x60\xa4\x2a\x6e\x1e\xc6\xaa\x5a\xdb\x98\x63\x08\x23\
-\xc8\x1e\xd5\x6e\x2d\xcc\xc7\xe5\x0b\xb7\xb7\x3c\xd7\xcb\x63\x31\
-\x3f\x58\xac\xea\x1e\xb5\x0a\x5e\xca\x0a\x04\xb1\x08\xcc\x47\x31\
-\x6d\x6e\xdc\xd4\xe9\x96\x1c\x00\xbd\x8d\x44\x32\x17\x03\x23\x26\
-\xac\xc2\x15\xd0\x6d\xe4\xe7\x92\x2b\xcf\x72\x3a\x6c\x49\x19\xd8\
-\xbf\x22\x92\x3a\x1e\x6a\xc2\x3b\xf9\x7c\x0c\x01\xd4\xe6\x9e\x9e\
-\x48\xc2\xb7\xa7\x43\x53\x2f\xcb\x9d\xaa\xa7\x8f\x4e\xb5\x8b\x18\
-\x88\xae\x63\xdc\x84\x1f\x53\x9e\xb4\xf8\xe3\x62\x0e\x46\x7b\xf5\
-\xa4\x40\x18\xe4\x65\x2a\x64\x48\xc8\xc6\x58\xbf\xb9\xa8\x60\x46\
-\xac\x00\xc9\x5e\x3a\x75\xa9\x40\x42\xa0\x82\xdc\xfe\x34\xab\x17\
-\x98\x30\x43\x7d\x49\xe2\x9b\x1d\xb9\x46\x63\x81\xc7\x6a\x43\x00\
-\xe0\x1c\x79\x6d\xf5\x2b\x49\xe6\x7b\x7e\x86\xa6\x0b\xd8\xf2\x3b\
-\x60\x62\x8f\x2d\x7f\xe7\x9d\x21\x16\x63\x3b\xba\xc9\x81\x8f\xb8\
-\x06\x28\xd8\x7a\xab\xe0\xfa\x55\x58\x89\x8f\x86\x4f\x35\x88\xc8\
-\x70\x3a\x55\x84\xc9\x6e\x48\x2b\xdc\x1a\x60\x4a\xcc\x12\x30\xce\
-\x5b\x3d\x81\xef\x4b\x1b\xbc\xc4\x14\xc1\x23\x92\x00\xc5\x57\x67\
-\x8f\xf8\x46\x08\x3d\x33\x48\xb3\xbb\x36\xd2\x4a\x0f\x5a\x62\x2d\
-\xb1\x67\x27\x76\xdc\xf7\xe9\xc5\x32\x38\xbc\x96\x2c\xcd\xc1\xe8\
-\x09\xa6\x41\xb7\x61\x2a\x73\x8e\xa5\xfb\xd2\x79\x9b\x1c\xfc\xf9\
-\xcf\x40\x3a\x0a\x60\x58\x56\x76\x5f\x91\xc6\x0f\x7c\x66\x83\x83\
-\x85\x71\xf8\x81\xd6\xa0\x86\x77\xde\x41\x2c\xdf\x8f\x14\xf2\xe5\
-\xdb\x90\x4e\x3b\x67\x14\xc4\x3d\x63\x0b\x21\x50\x5b\xdc\x63\xa5\
-\x3c\xba\x44\x84\x28\xe3\xe9\x9c\xd3\x0e\x5a\x3f\xdd\xa9\x53\xeb\
-\xd6\x91\x5f\x6f\xce\xdb\x64\x61\xc6\x06\x45\x00\x3b\xcc\x56\x8f\
-\xe5\xca\x81\xd4\x85\xc5\x3d\x24\x1d\x3f\x42\x2a\x31\x2b\x33\x72\
-\x88\x13\xb8\xc5\x24\x8d\xb2\x65\x71\x95\x07\xa8\x14\xc0\x99\xc8\
-\x24\x66\x3c\xfb\x74\xa9\x23\x89\xc8\x0d\x91\x83\xdb\x3d\x2a\xac\
-\x92\xab\x70\x0b\x75\xf5\xa9\xd4\x29\x00\x97\x24\x7a\x6e\xa0\x09\
-\x1a\x42\x8c\x15\x51\x86\x3a\x9a\x97\xed\x31\x85\x38\x2a\x1b\x1d\
-\x18\xe2\xab\xb4\xce\x83\x87\xc8\x1d\xa8\x49\x95\xf0\x64\x51\xcf\
-\xaa\xd3\x10\xe5\x62\x58\x80\xfd\x4f\x3e\x94\xf6\x98\x46\x84\x7d\
-\xec\x76\x06\x98\xef\x12\xa9\x60\xb9\xed\x80\x98\xa6\x46\xd0\xb8\
-\xf9\xa2\x0b\xee\x3a\xd3\x10\xe8\xe7\x2b\xf2\x91\x8c\xf4\xf5\xa7\
-\xab\x23\x39\xcf\x5f\xad\x42\xf2\xae\xe0\xb1\x8d\xc4\x77\x06\x91\
-\x9b\x76\x49\x42\xbe\xb9\xef\x40\x12\x4a\x8c\x9f\x30\x7c\x0c\xfd\
-\xdc\x71\x4f\x8e\x28\xdf\x9c\xe0\xf7\x3d\x2a\x3c\x8f\x2f\x9e\x7f\
-\x1a\x78\x23\xcb\xe7\xe6\x3e\x94\xc0\x7b\x5b\xc7\x18\xdc\x58\x1f\
-\x4a\x45\xca\xa9\x38\x04\x54\x6d\x73\xd2\x3f\x2b\x6f\xd4\x66\x98\
-\x66\x91\x9f\x68\x62\xa0\x77\x03\x14\x01\x61\x8a\x95\xcb\x00\x33\
-\xea\x3a\x54\x29\x6f\x1f\x99\x9d\xdc\x1e\xc0\x52\x97\x71\xfc\x45\
-\xbd\x70\x69\xa0\x23\x1e\x57\xaf\x7c\xd3\x01\x12\xdd\x51\xc8\x51\
-\x80\x0f\xbf\x34\x92\xa9\x2b\x84\x40\xd9\xf7\xe6\x90\x1d\xac\x7e\
-\x56\x00\x9a\x46\xdc\x5b\xf7\x48\x73\xee\x45\x3b\x85\x8a\x97\x76\
-\x4b\x2d\xb9\x47\x0d\xcf\x04\x66\xb8\x3f\x11\x78\x49\x2d\x55\xae\
-\x2d\x56\x4d\xa4\xf2\x85\x4f\xf9\x3f\x4a\xf4\x62\xad\xbb\x0d\x21\
-\x53\x8e\x41\xc8\xaa\xd7\x2a\xad\x09\x4b\x82\x0a\x13\xdd\xb3\x5d\
-\xd8\x4c\x6c\xf0\xd3\xbc\x76\xec\x73\x57\xc3\xc6\xb4\x6c\xcf\x10\
-\xb9\xb7\xf2\xf3\xd0\x30\x3d\x31\xfe\x71\x54\x0d\xb6\x64\xcb\x2e\
-\x58\xf4\x38\xaf\x48\xf1\x06\x81\x07\xcd\x71\x66\xa3\x3d\xd7\xb1\
-\x3e\xa3\xde\xb9\x09\xec\x7e\x72\xfe\x9d\xfb\x7f\xfa\xeb\xed\xf0\
-\xd8\xa8\x62\x21\xcf\x06\x7c\xf5\x5a\x73\xa3\x2e\x59\x18\x4d\x13\
-\x44\xd8\x6e\x9d\x8d\x3d\x54\xbb\xaa\xa9\xc1\x27\x1c\x9a\xb9\x25\
-\xb1\x07\x91\x9f\x63\x50\x18\x5a\x06\xde\xe3\x2a\x06\x6b\xd1\xfa\
-\xc2\x8c\x6f\x2f\xf8\x71\x52\xa6\xeb\x4d\x42\x3d\x7f\x0e\xef\xe4\
-\x6a\x5a\x1f\x90\xf3\x90\x57\x35\x56\xfe\x27\x98\x00\xac\x00\x1e\
-\xbd\xa9\xc9\x32\xa4\x3b\x8f\x1c\x70\x07\x6a\x8d\x96\x5b\xc6\xc0\
-\xdc\xc1\xb9\xda\x39\x27\xeb\x5f\x3b\x43\x19\x5e\x32\x9d\x0a\x71\
-\xb3\xe6\x97\xbc\xf6\x5a\xb7\xd9\x5d\xfe\x1d\xdf\x43\xea\xf1\x98\
-\x0c\x25\xa9\x62\xeb\x4d\xca\x2a\x10\xf7\x55\x94\x9d\x92\x57\x7a\
-\xbe\x55\x7d\x1b\x6a\xfd\x93\xdd\x62\xdc\x4e\x2d\x4b\x47\x60\x33\
-\x2f\xf1\xce\x47\x4f\x61\x50\xda\xce\xee\xc1\x26\xe4\xe7\x96\xef\
-\x5d\x75\xb7\x86\x92\x6b\x16\x95\x59\xbc\xcd\xbc\xa1\x5f\xd4\x54\
-\xb6\x5e\x12\x8a\xee\x33\xb1\x8c\x72\x29\xfb\xcc\xbc\x1a\xba\x35\
-\x68\xe1\x5c\xaa\x73\x5e\x5d\x5b\xdd\xfa\xf9\x76\x4b\x4e\xc7\x9d\
-\x89\xad\x5b\x16\xa3\x09\x2b\x45\x7c\x31\x5b\x2f\x4f\x3e\xed\xea\
-\xfa\xb3\x1e\x34\x09\xf2\x75\xe9\xde\xb4\x11\x71\x22\x63\x38\xf3\
-\x06\x01\xef\x5d\x14\x3e\x09\xce\xc5\x95\xb7\x20\xe3\xe5\x6c\x13\
-\x52\x8f\x06\x35\xac\xeb\x22\x96\x91\x14\xe4\x02\xfd\x2b\x45\x9e\
-\x61\xa7\x0f\x7b\x46\x70\x7f\x66\xd4\x53\xba\xd8\xa8\x0c\x67\x2c\
-\xd1\x90\xc3\xd0\xe6\xa5\xb7\xf9\xdf\x92\xd9\xec\x4d\x5b\x4d\x36\
-\xe7\xcd\x28\xa0\x1c\x9e\xb8\xe9\x5a\x43\x4e\xfb\x36\x37\xae\x06\
-\x30\x49\xaf\x8a\x94\xee\x7d\x02\x44\x16\xd6\xcc\x15\x73\x8e\x7b\
-\x83\x57\x92\xcf\x2c\x42\x2f\xfc\x0b\x35\x24\x30\x18\xe4\xdf\x12\
-\x12\x9e\xb8\xc5\x5c\x60\xcb\xf2\xb2\x03\x91\xc3\x76\xac\x1b\x2c\
-\xa4\xb6\xb8\x1f\x37\x38\xf4\x22\xac\x24\x58\xe3\x81\xc7\x39\x5e\
-\xb5\x34\x29\x80\x43\x22\x8e\xc0\xad\x4f\x0b\xb2\x48\x55\x8f\x1f\
-\xed\x77\xa4\xc0\xa8\x2d\xbe\x6f\x93\x66\x7d\xc9\xa9\x5a\x56\x50\
-\x14\x47\x93\xdc\xab\x0e\x2a\xc9\xd8\xce\x4a\xba\x8c\x0e\x94\x08\
-\xc6\xe0\x47\x52\x33\xc7\x7a\x86\x32\x94\x8f\x20\x01\x42\xb1\x6e\
-\xe3\x1d\x29\xe1\x9b\x1f\x3a\x90\xc7\xb8\x06\xaf\x2a\xaa\xab\x09\
-\x79\x3e\x98\xeb\x54\xee\xa3\x32\x3a\x94\x01\x7d\x72\x6a\x00\x45\
-\x6c\xf5\x91\xc8\xfa\x74\xa9\x19\x7a\x14\x95\x87\x1e\xb4\xe8\xd3\
-\x6c\x79\xd9\x9f\x53\x4d\x74\x59\x33\xf3\xc8\x18\x77\x38\xa4\x03\
-\xd7\xe6\xff\x00\x96\x9f\x37\x6e\x3a\xd2\x6c\x9b\xd4\x7e\xb5\x1a\
-\xa6\x4e\x16\x51\x9f\x71\xd2\xa4\xf2\x64\xff\x00\x9e\xc9\xf9\x1a\
-\x00\x58\x99\x5a\x12\x20\x1f\xbc\x53\x81\xe6\x1a\x7c\xb3\xfc\xaa\
-\x23\x8d\x77\x67\x04\xd4\x60\xba\xcc\xcb\xe5\x46\x42\xf5\x60\xd8\
-\xcd\x34\x4b\xe6\x0d\xbe\x48\x04\x1f\x97\x71\xc0\x34\x86\x4a\xa8\
-\x36\x37\xef\xb7\x30\xea\x06\x0e\x29\xcd\x20\x58\x0e\xe6\xf9\xb1\
-\xd6\xa3\x8e\x35\x69\x38\xc6\xe0\x39\x44\xce\x05\x3e\x49\xc0\x52\
-\xa8\x5b\x70\xec\x69\x88\x48\x00\x30\xe4\xb1\xc7\xa0\x5f\xf0\xa9\
-\x9d\x89\x87\xe5\x8b\xf0\x65\x3c\xd5\x47\x9c\xa4\x60\x60\x90\x4f\
-\xf1\x63\xfc\x29\xa2\xe6\x79\x8f\x96\x8c\xc0\x0f\x7e\x28\xb8\x58\
-\xb3\x0e\x23\x24\x8f\xdd\x7b\x0a\xaf\xa2\x68\xb7\x3e\x22\xbe\xd6\
-\xa4\x93\x5e\xd4\x6c\xd2\xd2\xf9\x6d\xe2\x8a\xd9\x2d\xca\x85\xfb\
-\x3c\x32\x64\xef\x89\x8e\x77\x48\xdd\xfd\x29\xe3\x7b\xa9\xdc\x57\
-\x1f\xad\x69\x78\x07\x89\x3c\x49\x9f\xfa\x0b\x2f\x5f\xfa\xf4\xb6\
-\xad\xa8\xd9\xcb\x53\x2a\xb7\x51\xd0\x70\xf0\x2c\xa0\x60\x78\xaf\
-\x5c\xc7\xa6\xcb\x3f\xfe\x47\xa0\x78\x16\x60\x72\x3c\x59\xae\x7f\
-\xdf\x16\x7f\xfc\x8f\x5d\x6d\x79\x06\x8b\x67\x77\xa5\xf8\x5b\x4f\
-\x9f\xc1\xfa\x15\xd6\x9d\xaa\x5b\x68\xd1\xc5\xaa\x3b\xe9\xf2\x5a\
-\xf9\x92\x7e\xec\x1f\x95\xa3\x3e\x74\xab\x89\x58\x32\xa4\x98\xc1\
-\x1c\xef\x0a\xdd\x7c\x91\xec\x73\xf3\x4b\xb9\xda\x2f\x81\xe6\x5c\
-\xed\xf1\x66\xb7\xcf\xfb\x16\x7f\xfc\x8f\x48\xde\x07\x99\x8e\x5b\
-\xc5\x9a\xe1\xff\x00\x80\x59\xff\x00\xf2\x3d\x72\x7e\x47\x88\xaf\
-\x66\xb4\xd6\xf5\x17\xd4\x6e\x67\xb0\xb2\xba\x36\xc2\x3b\x21\xb9\
-\x1c\xc8\x8a\x09\xf3\x6c\xd5\x83\xed\x62\x49\x48\xb2\x56\x3f\x95\
-\x5b\x2c\x1a\xfd\xb7\x88\xbc\x53\x6f\xa0\x97\xbd\x87\x52\x92\xe6\
-\x6b\x4b\x85\xb5\x64\xd3\x5e\x46\x33\x2c\xbf\xbb\x2f\x88\x13\x6e\
-\x50\x8c\x16\x44\x07\x07\x8c\xe6\x8e\x58\xf6\x0e\x69\x77\x37\x3f\
-\xe1\x04\x97\xfe\x86\xbd\x6f\xfe\xf8\xb3\xff\x00\xe4\x7a\x72\xf8\
-\x1e\x75\xfb\xbe\x2c\xd6\xff\x00\xef\x8b\x3f\xfe\x47\xac\xbf\x0e\
-\xda\xea\x96\x5e\x2c\xb7\xfb\x4d\xc6\xad\x05\x9c\xd3\x6a\x84\x5a\
-\x8b\x7c\xdb\xb3\x1b\xd9\x5d\x4b\x9f\x2c\x94\xca\x30\x65\x62\xcb\
-\xbb\x00\x02\x41\x20\xa6\xab\x6d\xa9\xd9\xdd\x5f\xd9\xda\xda\xde\
-\xb5\xad\x8c\x93\x6a\x96\xb2\xdb\xc5\x9c\xbc\x83\x0b\x18\x25\x1c\
-\x12\x24\x79\xdf\x01\x1c\x80\xa9\x85\x39\x00\x9c\xb1\xec\x1c\xd2\
-\xee\x6b\x8f\x05\xdc\x2e\x71\xe2\xcd\x6f\x9f\xfa\x67\x67\xff\x00\
-\xc8\xf4\xd1\xe0\x99\xc7\x4f\x16\x6b\x7f\x8c\x76\x7f\xfc\x8f\x5c\
-\xe5\x8d\xf7\x89\xca\x41\xaa\x5c\xc1\x7c\xf7\x10\x20\x49\x25\x36\
-\x6c\xd2\x3c\x1f\x6d\x88\xb8\xdb\xe4\xc6\x4b\x18\x77\xe0\x08\xd5\
-\x88\x1c\x0c\xf3\x52\x6a\x1a\xff\x00\x8b\xe6\xbf\xb4\x97\x4e\x4b\
-\xb8\x2c\xe4\x9e\x53\x17\x9d\x63\x2a\xf9\x80\x4d\x85\x59\x50\x5b\
-\x48\xea\xbb\x36\xe3\x26\x22\x77\x13\xb8\xe3\xe5\x39\x63\xd8\x39\
-\x9f\x73\xa2\xff\x00\x84\x36\xeb\x18\xff\x00\x84\xb7\x5b\xc7\xfd\
-\x73\xb3\xff\x00\xe4\x7a\x51\xe0\xfb\xb1\xd3\xc5\xda\xdf\xfd\xfa\
-\xb2\xff\x00\xe4\x7a\x83\x44\xd4\x75\x59\xac\xfc\x40\x6f\x27\xbf\
-\x63\x0b\x3b\x5a\xdc\x4d\x60\xe1\x55\x70\xd8\x11\xc5\xe4\xa3\xb1\
-\x5c\x0c\xaf\xef\x33\xf2\xe1\xc9\x24\x0c\x0b\x63\xe2\x6b\xa8\x86\
-\xad\x1c\xda\xac\x57\x96\xba\x6c\xa7\x32\x5a\x29\x37\x6e\xb3\x12\
-\xb1\x90\xd0\x46\x76\x91\xd8\x46\x8f\xe8\x7b\x93\x96\x3d\x85\xcc\
-\xfb\x9d\x2f\xfc\x21\xb7\x23\xa7\x8b\x35\xa1\xf4\x8a\xcb\xff\x00\
-\x91\xe9\x0f\x83\x2e\x5b\xef\x78\xb7\x5b\x3f\xf6\xce\xcf\xff\x00\
-\x91\xeb\x25\xf5\x2f\x14\x1b\xeb\xb6\xb7\x9b\x51\x79\xe0\x37\x12\
-\x4b\x67\x26\x9c\x16\xdd\x52\x39\x01\x89\x61\x90\xa0\xde\xd2\x20\
-\xda\x7e\x77\xfb\xe4\xe1\x08\x00\x35\xf5\x1f\x18\xdd\xc2\xf1\xc7\
-\xf6\xab\x42\x66\xb7\x71\x22\xd9\x29\x65\x8a\xe2\x78\x7e\x50\x19\
-\x48\x26\x18\xcc\xe1\xb8\xe3\x0a\xcd\x47\x2c\x7b\x07\x33\xee\x6c\
-\x8f\x06\xdd\x05\xc7\xfc\x25\xba\xde\x3d\x3c\xbb\x3f\xfe\x47\xa4\
-\xff\x00\x84\x2e\xe4\x74\xf1\x6e\xb6\x3f\xed\x9d\x9f\xff\x00\x23\
-\xd6\xaf\x87\xcd\xff\x00\xf6\x74\x91\xea\x92\xcb\x3c\xd0\xdc\xcb\
-\x1a\xcd\x34\x6a\x8f\x2a\x07\x21\x18\x85\x01\x79\x5c\x72\x00\x06\
-\xb5\x28\xe5\x5d\x83\x99\xf7\x38\x7f\x0b\x5d\xdc\xea\x3e\x13\xd2\
-\x2f\x6e\xdb\xcc\x9e\xe6\xc6\x19\x65\x90\x28\x1b\x9d\xa3\x04\x9c\
-\x0e\x07\x27\xa0\xad\x7e\x00\x0a\xc8\x5c\x9f\xe2\xc7\x4a\xc3\xf0\
-\x40\xdd\xe0\x3d\x04\x06\xda\x7f\xb3\x2d\xfa\x1f\xfa\x64\xb5\xa7\
-\x23\xf9\x72\x8f\x98\xe3\xbd\x72\xbd\xce\xa5\xb0\x4a\xdb\x37\xac\
-\x0a\x4b\x1f\x7a\x20\x89\xb7\x03\xbd\x98\x81\xca\xf6\xa9\x5e\x65\
-\x4e\x72\x09\xc6\x31\x8a\x4f\x35\x55\x0e\x23\x28\x7f\xbc\x3b\xd0\
-\x03\x5f\x8e\x70\x41\xc7\x4f\x4a\x6b\x00\x54\x65\x01\xfa\x1e\x69\
-\xfb\xcf\x40\x1b\xea\x47\x5a\x8d\xb7\xc6\xc3\x21\x8f\xb8\xa6\x03\
-\x64\x99\xcf\x02\x30\xa0\x8c\x1c\x9a\xae\xcd\x85\xc0\xc2\x83\xea\
-\xb9\xa9\xc8\x32\x47\x97\x50\x00\xe4\xee\xe2\x85\x64\xda\xa4\xc6\
-\xa4\x76\x3b\xb3\x8a\x00\xa4\xd6\x32\xca\xbb\x08\x46\x8c\xf5\xf9\
-\x71\x9f\xc2\xb9\xbd\x63\xc2\x72\x48\x4b\x59\xa8\x53\x83\xf2\x9c\
-\x00\x7f\xc2\xbb\x13\x20\x46\x3b\x38\xfe\xe8\xc1\x34\xf5\x08\xd0\
-\x91\x38\x50\xc7\xa5\x75\xe1\xb1\x55\x30\xf3\xe6\x83\x31\xad\x46\
-\x35\x63\xcb\x23\xc6\xa5\xb2\x78\xa5\x65\x94\x05\x2b\xc3\x12\x3e\
-\xe9\xfe\xb5\x5d\xa0\x25\xb6\x32\x81\xfe\xf0\xe9\x5e\x91\xaf\x68\
-\x11\x5f\x29\x68\x17\x6b\xaf\x01\xd7\x1c\xfb\x1a\xe4\x57\x4c\x74\
-\xbc\x11\xce\x98\xf9\xb0\x72\x78\x23\xd0\x7a\xd7\xd8\xd1\xc6\xd2\
-\xc4\xd1\x6d\xf6\xd7\xbf\xc8\xf9\xf9\x50\xad\x86\xac\x9c\x7f\xe0\
-\x7c\xff\x00\x53\x8c\xbd\xd2\xef\x46\xbf\x69\x73\x04\x8b\x1d\xb3\
-\x11\x6e\xcb\xb4\xb6\x49\xdc\x79\xed\xce\x30\x0e\x7a\xd7\x7d\x17\
-\x87\x3f\xb3\xec\x63\x99\x91\x99\x99\x72\x4a\x83\xf2\x9e\xa3\x07\
-\xd3\xb5\x4d\xab\x68\x17\x4b\xa6\x5c\xc1\x05\xa8\x3f\x27\x99\x01\
-\x3f\xc6\xca\xc1\xd0\x7f\xdf\x40\x0f\xa5\x75\x9a\x02\xa3\x69\x30\
-\x4f\x6a\xe6\x6b\x6b\x94\x59\xa3\xde\x41\xf9\x58\x02\x3f\x9d\x78\
-\x98\x8c\x57\x24\xf9\xf9\xaf\xd6\xde\xbf\xa9\xec\x52\x8a\x70\x70\
-\x8c\x79\x7b\xfc\xba\x7a\x7e\x3e\x6c\xc5\xb4\xd1\x5c\x47\x15\xc4\
-\x05\x82\xb0\x27\x60\x1d\x33\xd6\xb5\x22\xb3\x31\xae\xd7\x54\x2d\
-\xf4\x1c\xfe\x95\xa5\x34\x8c\x30\x88\x36\x05\x3c\xe2\x91\x19\x2e\
-\x1b\xe6\x43\x8e\xf8\xaf\x16\xb5\x79\xd5\x95\xe4\x76\x42\x9a\x82\
-\xb2\x29\xb5\xae\xee\x70\xcc\x00\xcf\x07\xa5\x1e\x41\x89\x36\x05\
-\xce\xe1\xc6\xe5\xab\xb2\x5a\xec\x25\xe2\x61\x8c\x74\x26\x9c\xbb\
-\xb6\x80\xca\x31\xd0\x90\x73\x8a\xc2\xe6\x85\x03\x03\x42\xa0\x4a\
-\x4e\x4f\x46\x18\xa9\x23\x73\x32\x81\xb0\x90\x3f\xbc\x33\x9a\xb2\
-\xf1\x64\xfe\xeb\x07\x8e\x72\x29\x89\x1b\x44\xa4\x4a\x41\x39\xe0\
-\x28\xa5\x71\x90\xc9\x14\x4f\xf2\xb0\xda\x4f\x4c\x3f\x1f\x95\x32\
-\x3b\x79\x88\x21\x10\x6c\x1f\xed\x0a\xb8\xc8\x15\x0c\x87\xe5\xc7\
-\x72\xb4\xe8\xff\x00\x7b\x1e\x61\x24\x67\xa9\x18\x06\x90\x14\xc0\
-\x79\x13\x67\xcd\x91\xfe\xcf\x4a\x44\x32\x22\x94\x90\x60\xfa\x9e\
-\x6a\xfe\x5b\x1b\x09\x70\xe3\xd4\x75\xfd\x2a\x19\x14\x33\x0f\x37\
-\x83\xd3\x92\x79\xa4\x05\x64\x68\x91\x7c\xa1\x22\x93\x8e\x46\x71\
-\x52\x00\x13\xe6\x07\x00\x0e\x30\x06\x05\x58\x11\x26\x49\x0d\x1a\
-\x9c\x71\x50\xb2\xa7\x3e\x61\x24\xfa\x8a\x90\x1b\xb2\x4d\xde\x67\
-\x98\x3d\x78\x39\xa6\xee\x93\xcc\xd8\x44\x84\x1e\x43\x28\xc8\xa7\
-\x2e\xd8\x9b\x6b\x30\xc1\xf6\x39\xc5\x0c\x4a\xb6\x62\x91\xf9\x3d\
-\x07\x35\x23\x1a\xf2\x79\x7f\x7c\xb0\x27\xb1\xc7\xf8\x52\x47\x28\
-\x0c\x49\xcb\x03\x52\xc6\xbc\x7c\xc8\x4e\x4f\x21\x85\x48\xc9\x6e\
-\xa7\xef\x14\xcf\x62\x69\x01\x02\xb1\x91\x83\x42\x8a\xb8\xeb\x9a\
-\x7e\x64\xfe\xea\x7e\x54\x1f\x2a\x39\x39\x65\x23\xd7\xd6\x9b\x9b\
-\x7f\x51\xff\x00\x7d\x50\x05\x31\x22\xba\x7c\xf2\x05\xc0\x19\x1b\
-\x73\xcf\xe1\x4b\x3c\x88\xea\x85\x62\x52\x47\x05\xb6\xed\x35\x5d\
-\xd2\xe0\x1e\x0b\x38\x27\x27\x19\x8f\x15\x20\x9d\xc9\x0c\xc8\xbb\
-\x71\x8c\x17\xdd\xfc\xea\x4a\x1c\x84\x48\x08\xfb\x98\xe7\x70\x3c\
-\x9a\x94\x4b\xf7\x8a\x29\x4f\x71\xd4\xd4\x2b\x20\xf9\x84\x4d\x90\
-\x7b\x15\xa5\x64\x7e\x0a\x27\x3f\xef\x62\x80\x25\x81\x77\x12\xd2\
-\x7c\xd8\xea\x49\xa9\xd9\xd3\x69\x66\x46\x51\xdf\x06\xab\xc7\x0c\
-\xca\xa0\xa8\x5c\x9f\xbd\x82\x4f\xf3\xa9\x83\x94\x07\x28\x1b\xea\
-\x3f\xc2\xa9\x22\x59\x62\xdd\xa3\x68\xf7\x24\x44\x8f\xef\x03\x57\
-\x3c\x11\xb3\xed\x5e\x26\xf2\xc9\x2b\xfd\xac\xb8\x27\xfe\xbc\xed\
-\xab\x29\x84\x81\x77\x26\x77\xe7\xb1\xfe\x86\xb4\xbc\x05\x9f\x37\
-\xc4\x99\xce\x7f\xb5\x57\xa8\xc7\xfc\xb9\xdb\x57\x45\x1f\x88\xc6\
-\xaf\xc2\x37\xfe\x13\xc8\xe3\xf1\x55\xe6\x97\x73\x0d\x9a\x5b\x59\
-\x48\xeb\x3c\xab\x7d\xba\x68\x11\x20\xf3\x4c\xd2\x43\xb3\xe4\x8b\
-\xf8\x37\xee\x3f\x31\x51\x8e\x6b\x52\x2f\x18\xe8\x92\x47\x33\x35\
-\xd4\x90\x79\x11\x4b\x34\xab\x73\x6b\x2c\x0d\x1a\x46\x15\x9c\xb2\
-\xba\x82\x30\x1d\x4f\x23\x90\x72\x32\x33\x51\xdf\xf8\x37\x4c\xd4\
-\xa3\xba\x4b\xa3\x39\x5b\xa9\xe4\x9e\x5c\x38\x19\xf3\x21\xf2\x5d\
-\x3a\x7d\xd2\xbc\xe3\xd4\x03\x9e\x06\x29\x5a\xfc\x39\xd1\xed\x74\
-\xe8\xac\xc3\xc8\x52\x3b\xb1\x75\xba\x3b\x7b\x6b\x72\xf8\x5d\xa6\
-\x36\x10\xc4\x8a\xc8\x46\x41\xc8\xcf\xbf\x03\x1d\x67\x31\x72\x1f\
-\x19\xe9\x45\x62\x17\x53\x14\x92\x49\xa5\x8b\x10\xc1\x34\x8b\x18\
-\x49\x9a\x1c\xc8\xde\x58\xf2\xf2\xca\x46\x5f\x03\x21\x80\x2c\x06\
-\x6a\xd2\xf8\xab\x45\x72\x81\x6f\x97\x73\xc0\x93\xaa\xec\x6c\x94\
-\x79\x3c\xb5\x38\xc6\x73\xbf\xe5\xc7\x50\x7a\x8a\xc8\xba\xf8\x6f\
-\xa2\xdd\x5f\xc1\x78\xe5\xcc\xd1\x4d\x2c\xa4\xc9\x6f\x6f\x36\xff\
-\x00\x32\x77\x9c\xaf\xef\x62\x6d\xa0\x34\x8f\x82\x9b\x4e\x0f\x24\
-\x90\x08\xb9\x17\x82\x74\xc8\x75\x25\xbd\x59\x2e\x77\x8b\xd7\xbc\
-\xda\x5d\x4a\xe5\xb0\x7c\xbc\x6d\xfb\x81\xd4\x38\x1d\x77\x0c\xe7\
-\x1c\x50\x05\x9d\x43\xc5\x7a\x3e\x95\xa9\x0b\x1b\xe9\xe6\x8e\x53\
-\x8c\xb0\xb5\x95\xa2\x4c\x82\x46\xe9\x15\x4a\x2f\x0a\x4f\xcc\x46\
-\x00\xcf\x4a\xae\x7c\x73\xa1\x0b\x74\x94\xcd\x78\x19\xe4\xf2\xd6\
-\x0f\xec\xeb\x8f\x39\x8e\xdd\xfc\x45\xe5\xef\xc6\xde\x73\x8c\x60\
-\x1e\x78\x35\x91\xab\xf8\x2e\xf7\x55\xf1\xc3\xea\x52\x25\x89\xb0\
-\x9a\x2f\x22\x67\x62\x86\x6f\x24\xc6\x55\xd0\x06\x84\xb8\xce\xe2\
-\x32\x93\x20\x00\xe7\x69\x39\xdd\xa3\xa0\xf8\x13\x4c\xf0\xfc\xb0\
-\x49\x69\x23\xb3\xc3\x2b\x48\xa4\x5b\x5b\x41\x92\x50\xa6\x18\x43\
-\x12\x06\xe0\x9e\x4f\x3e\xfd\xa8\x02\xd9\xf1\x96\x82\x26\xd8\x2f\
-\x59\x97\xcb\x12\x79\xa9\x04\x8d\x16\x0c\x7e\x68\x1e\x60\x5d\x9b\
-\x8c\x78\x60\x99\xdc\x41\x07\x1c\xd2\x2f\x8c\xb4\x86\x10\x11\xfd\
-\xa1\xb2\xe1\x4b\x45\x21\xd2\xee\x42\x3f\x5c\x00\xde\x5e\x32\x76\
-\x9c\x0c\xe5\xb2\x30\x0e\x46\x72\x62\xf8\x5f\xa1\x43\x74\x93\xc4\
-\xd2\x06\x5b\x55\xb6\x62\xd6\xf6\xce\xec\x16\x11\x08\x6f\x31\xa2\
-\x32\x29\xda\x07\xdd\x65\x19\x19\xc7\x27\x37\xa7\xf0\x36\x9b\x71\
-\xe2\x2b\x1d\x66\x49\xa7\x37\x16\x29\x1a\x44\xa6\x38\x5b\x84\xce\
-\x3e\x73\x19\x91\x47\x27\x21\x58\x29\xf4\xc9\x34\x00\xba\x77\x8f\
-\x34\x3d\x46\xce\xc2\x74\x7b\xb8\x7e\xdd\x14\x52\xa2\x4d\x65\x2a\
-\xf9\x6b\x21\xc2\x19\x18\x29\x54\x0c\xc0\x85\x62\x76\xb1\x07\x69\
-\x3d\x6a\x7d\x37\xc5\x76\x5a\xbe\xbc\xda\x76\x9e\x92\xc9\x1a\xdb\
-\xb4\xff\x00\x68\x78\x64\x8d\x5f\x0e\x17\xe4\xdc\xa0\x3a\x9c\xe7\
-\x7a\x92\x38\xac\xa8\xfe\x19\x69\x11\xcf\xa6\x4c\xd7\x13\x4f\x26\
-\x9b\x14\x50\x42\xd7\x16\xd6\xb2\x93\x14\x4c\x4c\x69\x96\x84\x95\
-\xdb\x92\x37\x2e\xd6\x23\xa9\x24\x02\x35\x74\x7f\x0a\xc3\xa2\xdd\
-\xac\xf0\xea\x17\x97\x02\x2b\x73\x6b\x6f\x15\xc1\x8c\xa5\xbc\x59\
-\x04\x22\xed\x45\x24\x0c\x00\x0b\x12\x71\xde\x80\x21\x4f\x1e\x68\
-\x12\xe4\x47\x3d\xe3\xb6\x10\xa2\xae\x9d\x70\x5a\x60\xe1\xca\x98\
-\xc7\x97\x99\x01\x11\xb9\x05\x32\x30\x8c\x7a\x0c\xd4\xcd\xe3\x2d\
-\x0a\x3b\xa9\x20\x9a\xf1\xe1\x31\xab\xb3\x49\x35\xb4\xb1\xc4\x36\
-\x21\x91\xd7\xcc\x65\x0b\xb9\x54\x12\x53\x3b\x86\xd6\xc8\xe0\xe3\
-\x9b\xf0\xc7\x80\x35\x1d\x3a\xdd\xe3\xbe\xbb\x8b\x4e\x78\xe4\x8e\
-\x6b\x79\x74\xc3\x0b\xba\xca\x11\xd1\xdc\x96\xb7\x5d\xc1\x95\xf1\
-\x89\x04\xad\xdf\x76\x79\xad\xb9\xfc\x0f\x67\x76\xd3\x25\xe6\xa3\
-\xa8\x4f\x6b\x27\x9a\xc2\xd5\x9a\x35\x44\x92\x58\xd9\x24\x95\x4a\
-\xa0\x7d\xc4\x3c\x87\xef\x6d\x05\xc9\x00\x71\x80\x06\x45\xe3\xfd\
-\x28\xc9\x79\xe7\xc7\x7b\x0a\x5b\xca\xb1\xa2\x9b\x0b\x83\x33\xfe\
-\xef\x7b\x31\x87\xcb\xde\xaa\x01\xfb\xc4\x63\x91\xcf\x22\xba\x68\
-\xe4\x49\xa2\x49\x61\x75\x92\x37\x50\xc8\xea\x72\x18\x1e\x84\x1e\
-\xe2\xb9\x1b\xff\x00\x86\xda\x76\xaa\x1a\x4d\x53\x50\xbb\xbd\xbb\
-\x69\x7c\xd3\x75\x75\x05\xac\xad\xf7\x02\x6d\xd8\xd0\x98\xc0\xc0\
-\x5e\x42\x67\xe5\xeb\xc9\xcf\x59\x6d\x02\x5a\xda\xc5\x6f\x10\x02\
-\x38\x50\x22\x80\xa1\x40\x00\x60\x70\x00\x03\xe8\x00\x14\x01\xc2\
-\x78\x2c\xab\xf8\x0f\x40\x42\x58\x7f\xc4\xb6\xdf\xff\x00\x45\x2d\
-\x6d\x2b\xa4\x63\x6e\x09\x6c\xf0\x33\x5c\xf7\x84\xd9\x5b\xc0\x9e\
-\x1f\x52\x58\x1f\xec\xdb\x7e\x76\xff\x00\xd3\x25\xad\x58\x9d\x16\
-\x43\x85\x91\xf0\x3a\x9a\xe3\x7b\x9d\x6b\x62\xe3\xcc\xb2\x70\x7a\
-\xf6\x18\xa8\x94\x3a\x4a\x02\x28\x2b\xdf\x34\x9b\x51\xfe\x70\x48\
-\xf4\xe3\x9a\x43\x28\xdd\xb1\x58\x92\x38\x27\x1d\x68\x19\x60\xce\
-\xaa\x09\x97\x60\xf5\xcd\x41\x25\xc2\x95\x1e\x50\x0c\x1b\xa6\x18\
-\xf1\x51\x30\x52\x7a\x37\x5e\x6a\x09\xa4\x51\x30\x29\x94\xc1\xc0\
-\xf9\x09\x06\x80\x2f\xa4\xb8\x5f\x9d\x81\x1d\x3a\xf6\xa8\xdf\x64\
-\xab\xfd\xd1\xd8\x81\x50\xc9\x8c\x81\xe6\x02\x0f\x1f\x77\x14\xa1\
-\x0f\x43\xd1\x7a\x30\x19\xa0\x07\x04\x8d\xc1\x1e\x5e\x47\xa8\x6c\
-\x66\x86\x9a\x05\xc2\xbe\xd5\x6e\xd9\x63\xc5\x64\x49\xe2\xbf\x0e\
-\x5b\x4a\xf0\xdc\xeb\xba\x64\x52\x46\xc5\x24\x8e\x4b\xb4\x57\x56\
-\x07\x04\x11\x91\x82\x0d\x41\x2f\x8b\xfc\x31\xe6\x21\x4f\x10\x69\
-\x43\xdc\x5e\xc6\x7f\xf6\x6a\x7a\x8b\x43\x77\xcb\x57\xe9\xc6\x7a\
-\x10\x3a\xfe\x55\x9f\xa8\x69\x71\xde\x6c\x27\x3b\xa2\x39\xde\x71\
-\xd6\xaa\x7f\xc2\x5f\xe1\x42\xc5\x9f\xc4\x5a\x60\xef\x8f\xb6\x46\
-\x73\xf9\x1a\x23\xf1\xaf\x86\x49\x61\xfd\xbd\xa5\x85\x3d\xcd\xec\
-\x7c\xfe\xb5\xa4\x27\x38\x3b\xc7\x42\x65\x18\xcb\x73\x6e\x28\xd0\
-\xc0\xb8\x6d\xec\xa3\x04\x93\x8c\xd6\x3f\x86\x49\x82\x3b\xfd\x30\
-\xa9\x26\xc2\xed\xd6\x20\x0f\xfc\xb2\x7c\x48\x9f\x80\x0f\xb7\xfe\
-\x01\x48\xbe\x2d\xf0\x9b\x06\x07\xc4\x1a\x5a\x8f\x5f\xb7\x45\xcf\
-\xe4\xd5\x85\x3f\x8a\x34\x0b\x7f\x16\xc5\x71\x6b\xaf\x69\x6d\x05\
-\xe5\xb1\x82\x76\xfb\x52\x61\x5a\x36\xdd\x19\x27\x3c\x02\x1e\x41\
-\xf5\xc5\x4e\xac\x7a\x23\xb1\x96\x20\xc0\x9d\xce\x1f\xa6\xd6\x23\
-\x9a\x64\x36\xdb\x18\x17\x90\xa9\x6e\xa3\xaf\xeb\x58\xd2\xf8\xb3\
-\xc3\x27\xfe\x66\x0d\x2c\xf3\xfc\x3a\x84\x7f\xe3\x52\xaf\x8c\xbc\
-\x36\xab\xc7\x88\xb4\xbd\xde\x86\xfe\x2c\x7e\x79\xa8\xb3\x2a\xe8\
-\xdf\x28\x55\x46\xd7\x24\x1e\xf9\xaa\xb2\xef\x42\xa5\x4e\xe1\x9e\
-\xdd\xab\x28\xf8\xcf\xc3\x52\x36\x1f\xc4\x3a\x68\xc7\xfd\x3e\xc5\
-\x8f\xe7\x4d\xff\x00\x84\xb7\xc3\x6b\x9c\xf8\x97\x49\x70\x7d\x6e\
-\xe3\xe3\xff\x00\x1e\xa2\xcc\x77\x46\xd6\x49\x52\x77\x03\xc7\xdd\
-\x3c\x53\x62\x39\x53\xe6\x47\x8f\x7d\xd5\x92\xbe\x2e\xf0\xc8\x8b\
-\xfe\x46\x0d\x20\x92\x7a\x1b\xd8\xff\x00\xf8\xaa\xb7\x67\xa8\x58\
-\xea\x36\xed\x36\x99\x77\x6f\x77\x6e\x1b\x63\xbd\xb4\xc2\x45\x0d\
-\x80\x71\x95\x24\x67\x91\xf9\xd2\xd4\x2e\x8b\x0d\x89\xd8\xc7\x21\
-\x28\xb9\xe3\x18\xe6\x9e\x40\x44\xda\x25\x72\xa3\xa0\x07\xa5\x46\
-\x2d\xa1\x97\x92\xc5\x78\xe3\x8f\xfe\xb5\x3e\x28\xca\x29\xcb\x03\
-\x9e\x3a\x29\xa4\x31\x64\x2e\x18\x38\x53\x27\x1c\x64\x71\xfa\x53\
-\xa3\x92\x49\x10\xef\x5d\x98\xe9\x91\x4c\x58\xd5\x5b\x6a\x33\xee\
-\xf7\x04\x7f\x5a\x91\x95\xf3\xf3\x15\xda\x3a\xe0\xe6\x90\x11\x92\
-\x15\xf6\xb0\x2f\xbb\xa1\x07\x34\xc6\xde\xa4\xf9\x52\x63\xd8\x8a\
-\x09\x31\xb6\xf0\xca\x50\xff\x00\xb3\xff\x00\xd7\xa9\x43\x89\x00\
-\xda\x18\x13\xe8\x45\x48\xca\xec\xb2\x9f\x99\xb6\x65\xb8\xcb\x0c\
-\xd4\x91\xdb\x84\x1c\x92\x8c\x07\x25\x07\x06\xac\x15\x77\xc6\x06\
-\xd1\xee\x08\xa6\x48\xb2\x89\x01\x12\x6e\x04\x60\x80\x73\x48\x08\
-\xc4\xed\xb4\xe3\x32\x0f\x4e\xa6\x9e\xb9\x93\x38\x88\x2a\xfa\x91\
-\xcd\x35\xbf\x74\x03\xb2\x29\xec\x72\xb5\x22\x12\xc7\xfd\x58\x07\
-\xd4\x67\x9a\x40\x34\x05\xc6\x43\x03\xc7\x4c\x53\x77\x0f\xee\xb7\
-\xfd\xf2\x29\xee\xbb\x8f\x04\xa9\xf7\x1c\x53\xb6\xbf\xaa\xd0\x06\
-\x5c\xb2\x86\x50\x80\xfc\xbd\xf0\x0f\xf8\xd2\x79\x70\xbd\xbb\x27\
-\x92\x18\x9e\xf9\xeb\x51\xb3\xa1\x4c\x2b\x90\xfe\xe7\x9c\x50\x3c\
-\xd2\xa5\xe2\x75\x66\x03\xa3\x2e\x48\xa8\x2c\x54\xb4\xc2\x8c\xac\
-\x6b\x8f\x46\xa2\xdc\x47\x16\xff\x00\x31\x5a\x4d\x9c\x0c\x64\xfe\
-\x99\xa9\x60\x66\x94\x29\x96\x22\xce\x06\x49\x5e\x9f\x91\xab\x0a\
-\x9c\x19\x7c\xb6\x5e\x3b\x00\x0d\x5a\x44\xb2\xba\x89\x08\x07\xce\
-\x0a\x09\xe8\xd1\xed\xa3\xec\xc0\x48\x58\xb1\x62\x7a\x15\xe7\x35\
-\x34\x73\x46\x72\x59\xd5\x47\xfd\x34\x1b\x8d\x39\xae\x86\xc6\xda\
-\x41\x3f\xde\xe3\x8a\x62\x21\x6f\x36\x32\xb8\x83\xe4\xfe\xf2\xe6\
-\xb5\x3e\x1f\xb6\xe6\xf1\x21\x23\x1f\xf1\x36\x1c\x7f\xdb\xa5\xb5\
-\x65\x16\xfb\x41\x08\xac\xe5\xbd\x45\x3b\xc2\x5e\x23\xd0\xb4\x3b\
-\xcf\x11\x5a\xeb\x1a\xde\x9d\x61\x39\xd4\xd5\xd6\x3b\xbb\xb4\x8d\
-\x99\x4d\xa5\xb8\xdd\x86\x20\xe3\x20\x8c\xfb\x1a\xde\x8f\xc4\x63\
-\x57\xe1\x3d\x0e\xb9\x0f\x18\x43\x7d\x7b\xe2\x1d\x16\xca\xc4\x49\
-\x22\xc9\x15\xcb\xc9\x0a\xea\xb3\xd8\x2b\x6d\xf2\xb0\x4b\xc2\x0b\
-\x12\x37\x1c\x02\x31\xc9\xad\x0f\xf8\x4f\x3c\x21\xff\x00\x43\x56\
-\x89\xff\x00\x83\x18\x7f\xf8\xaa\x3f\xe1\x3c\xf0\x87\xfd\x0d\x5a\
-\x27\xfe\x0c\x61\xff\x00\xe2\xab\xac\xe6\x39\xa9\x7c\x77\xaa\xf9\
-\x97\x2b\x6b\x36\x93\x3c\xaa\x1c\x35\x9a\xc6\xfe\x65\x83\x09\xd2\
-\x35\x13\x90\xfc\x96\x0e\x4f\x44\xe4\x71\xb8\x64\xd6\xee\xbf\xad\
-\xde\xe8\xbf\xd9\x76\xf7\x5a\xae\x93\xa7\xb5\xc2\xbf\x9f\xa8\xdf\
-\x40\xc2\xdc\xba\xed\xc4\x6a\x86\x55\xda\xcd\xb8\x91\x97\x3c\x23\
-\x75\xab\x1f\xf0\x9e\x78\x43\xfe\x86\xad\x13\xff\x00\x06\x30\xff\
-\x00\xf1\x54\x7f\xc2\x79\xe1\x0f\xfa\x1a\xb4\x4f\xfc\x18\xc3\xff\
-\x00\xc5\x50\x07\x39\x7b\xf1\x12\x58\x61\x9a\x08\xae\xf4\x88\x6f\
-\xed\xcd\xe7\xda\x23\xb8\x95\x57\xc8\x11\x5d\x2c\x51\xee\x0d\x22\
-\x80\x59\x18\x90\x19\x94\x39\xc6\x19\x41\xcd\x41\x1f\x8d\xb5\x44\
-\xba\x9e\x49\xb5\xbd\x21\x6d\xe6\xb4\xb3\x9e\x11\x71\x68\x62\x10\
-\x24\xa7\x0f\x70\xdf\xbe\x24\xc6\x0f\x1d\x71\x96\x4f\x9c\x0e\x5b\
-\xaa\xff\x00\x84\xf3\xc2\x1f\xf4\x35\x68\x9f\xf8\x31\x87\xff\x00\
-\x8a\xa3\xfe\x13\xcf\x08\x7f\xd0\xd5\xa2\x7f\xe0\xc6\x1f\xfe\x2a\
-\x80\x39\xaf\xf8\x4c\xbc\x43\x3d\xb3\xcd\x62\xfa\x44\xa9\x6d\x03\
-\x4c\xd2\xf9\x12\x14\xbc\x51\x70\xd1\x06\x8c\x89\x3e\x45\x65\x5c\
-\x83\xf3\xfb\x6e\x07\x35\xad\x77\xe2\x2d\x4f\x4f\xf0\xa6\xab\x73\
-\x79\x73\xa5\xad\xf6\x9f\x75\xf6\x7f\x3e\x45\xf2\x20\x71\x94\x39\
-\xdb\x24\xa0\x06\xda\xe4\x05\x32\x00\x58\x0f\x98\x03\xc5\xff\x00\
-\xf8\x4f\x3c\x21\xff\x00\x43\x56\x89\xff\x00\x83\x18\x7f\xf8\xaa\
-\x3f\xe1\x3c\xf0\x87\xfd\x0d\x5a\x27\xfe\x0c\x61\xff\x00\xe2\xa8\
-\x03\x94\x5f\x1f\x6b\x57\xba\xec\x3a\x6d\x80\xb1\x5f\xb4\x5b\x46\
-\x61\x79\x63\x8d\x1e\x62\xf6\xe2\x4f\x39\x23\x6b\x91\x21\x50\xc7\
-\x1b\x15\x1c\x1d\xad\xfb\xce\xb8\xa7\x63\xe2\xfd\x5e\xe6\xda\x07\
-\xbc\xf1\x06\x97\x7d\x14\xfa\x65\x9d\xc2\x45\x6f\x09\x85\xa5\x91\
-\xa7\x29\x26\xd7\x49\xb3\x95\xc0\x0e\x07\x1d\x06\xd5\xe4\x1e\xdf\
-\xfe\x13\xcf\x08\x7f\xd0\xd5\xa2\x7f\xe0\xc6\x1f\xfe\x2a\x8f\xf8\
-\x4f\x3c\x21\xff\x00\x43\x56\x89\xff\x00\x83\x18\x7f\xf8\xaa\x00\
-\xe6\xae\xbc\x6d\xae\xd9\x58\x4b\x79\x38\xd3\x5a\x39\x92\xe5\xa0\
-\x55\x85\x97\xc8\x10\xdd\xc5\x06\x5d\x9a\x50\xaf\x95\x90\xbf\x26\
-\x30\xbb\x70\x5b\x19\x61\x2f\x87\xfc\x6b\xa8\x5f\xeb\x5a\x3d\xa5\
-\xf6\xa3\xa2\xcc\x97\xf1\x48\xfe\x5d\x8e\xc9\x24\x62\x1a\x50\x3e\
-\xed\xc3\xec\x1b\x51\x49\x2a\x24\x5d\xc1\xd4\xb2\xe0\x13\xab\xa9\
-\x78\xab\xc0\xda\xbd\x8b\x5a\x5f\x78\xa3\x47\x68\x99\x95\xff\x00\
-\x77\xab\x24\x4c\xac\xac\x19\x48\x74\x70\xca\x41\x00\xe4\x11\x4b\
-\xa7\x78\xaf\xc0\xfa\x55\x92\xda\xd9\x78\xa3\x47\x58\x95\x99\xb3\
-\x26\xac\x92\x3b\x12\x72\x4b\x3b\x39\x66\x24\x9e\xa4\x93\x40\x1d\
-\x4d\x15\x81\xff\x00\x09\xe7\x84\x3f\xe8\x6a\xd1\x3f\xf0\x63\x0f\
-\xff\x00\x15\x47\xfc\x27\x9e\x10\xff\x00\xa1\xab\x44\xff\x00\xc1\
-\x8c\x3f\xfc\x55\x00\x71\x9e\x10\x96\xd9\x3c\x19\xa1\x79\x80\x83\
-\xfd\x9d\x6f\x9c\xe4\x0f\xf5\x6b\x5d\x46\xf4\x58\xd7\x60\x1b\x71\
-\xd9\x8d\x73\x3e\x13\x92\x23\xe0\x5d\x08\xec\x2e\x46\x9d\x6e\x08\
-\x40\x73\xfe\xad\x6b\x75\x76\x15\x5d\xf0\xc8\xab\xdf\xf7\x63\x9a\
-\xe3\x7b\x9d\x6b\x60\x99\xe6\x97\x81\x95\x1d\x98\x1e\x94\xb1\x2c\
-\xab\x92\x4b\x6e\x1e\xa4\x73\x4a\xed\x6e\x31\xb3\xef\x67\x85\x20\
-\xad\x45\xe6\x33\x2e\x6e\x17\x90\x7e\xf0\xed\x48\x64\xee\xcc\x15\
-\x49\x75\x0d\xdc\x30\x02\xa0\xbb\x91\x03\x02\xae\x37\x63\xa2\x9e\
-\x3f\xad\x4a\xe4\x4c\xd8\x2c\xb8\x5e\xa7\x15\x4a\x59\x1e\x39\x32\
-\x85\x09\x3d\x07\x39\x22\x81\x88\xe9\x34\xd1\x0f\x32\x52\xbc\xf0\
-\x01\xe9\x53\xac\x72\x79\x38\x0e\xbb\x87\x70\xc3\x35\x0b\x89\x1d\
-\x00\xdc\x54\xf6\x05\x4f\x35\x34\x13\x4c\x22\x3b\xa3\x52\xa3\x8e\
-\x07\x3f\xca\x80\x34\xbe\x1f\x9c\xf8\x48\x93\xd7\xfb\x47\x50\xff\
-\x00\xd2\xc9\xaa\x48\x3c\x65\x67\x2c\xf0\x99\x6c\xaf\x2d\xb4\xfb\
-\x87\x64\xb7\xd4\xe6\x11\x8b\x79\x4a\x86\x3c\x61\xcb\xa8\x21\x58\
-\x86\x65\x55\x38\xe0\xf2\x33\x1f\xc3\xe3\x9f\x08\xe4\x74\x3a\x8d\
-\xff\x00\xfe\x96\x4d\x55\x9b\xc1\x77\xb3\x58\x47\xa5\xdc\x6b\x31\
-\xb6\x95\x6c\x92\x0b\x58\x56\xcc\xac\xaa\x4a\x32\x27\x99\x26\xf2\
-\x1c\x20\x73\xc0\x55\x24\xaa\xe4\xf5\xcf\x62\xd8\xe3\x7b\x9a\xc3\
-\xc5\x9a\x19\x8e\xe2\x76\xd5\x6c\x52\xce\x00\x85\xaf\x1a\xf2\x1f\
-\x28\x96\x66\x5c\x67\x76\x41\xca\x11\xc8\x19\x3c\x0c\xe0\xe1\x3f\
-\xe1\x2e\xd0\x56\xde\x4b\x99\xf5\x6b\x08\x2d\x15\xd5\x52\xea\x4b\
-\xd8\x44\x72\xe5\x43\x02\xa4\x3f\xfb\x5d\xf0\x7d\x38\xc1\x3c\xe7\
-\x8a\x3c\x25\x7e\xb0\xc5\x71\xa3\x09\xae\x65\x02\xd6\x1f\x2a\xd8\
-\xf9\x4d\x1a\xc2\x93\x8d\xe0\x89\xa2\x27\x26\x50\x30\xb2\x21\x1e\
-\xac\x32\xa6\xee\x81\xe1\x09\x6d\xe4\xd3\xf5\x0b\xe3\x0c\x13\x44\
-\x12\x46\xb3\x8e\x2f\x96\x22\x2d\x56\x0d\x80\xef\x6e\x80\x67\xab\
-\x75\xc6\x4f\x52\xc4\x74\x7a\x86\xb3\xa5\xe9\x36\x69\x77\xaa\x6a\
-\x56\x96\x56\xd2\x30\x54\x9a\xe6\x75\x8d\x18\x90\x48\x01\x98\x80\
-\x49\x00\x9f\xc2\xa3\x3e\x21\xd1\x45\xcd\xd5\xb9\xd5\xec\x04\xf6\
-\x63\x75\xcc\x5f\x69\x4d\xd0\x0c\x81\x97\x19\xca\xf2\x47\x5f\x5a\
-\xcc\x1e\x19\xbc\xb4\xd2\xf4\x38\xb4\xad\x46\x08\xaf\x34\x8b\x51\
-\x6a\x26\xb9\xb4\x32\xc7\x2a\x6c\x55\x63\xb0\x48\xa4\x12\x51\x48\
-\x3b\xb8\xe4\x73\x9a\xa3\x3f\x80\xe5\xba\x8d\xed\xae\x35\x28\x1a\
-\xce\x3f\x3b\xec\xb1\xad\x96\x1d\x3c\xd9\x44\x8f\xe6\x36\xf2\x1f\
-\xa6\x38\x0b\xd7\x27\x26\x80\x37\xed\xbc\x49\xa1\xde\xde\x45\x69\
-\x67\xac\xe9\xf7\x17\x33\x2e\xe8\xa1\x8a\xe9\x19\xdc\x6d\xdd\x90\
-\xa0\xe4\x8d\xa4\x1e\x3b\x73\x4c\x5f\x15\x78\x79\xec\x8d\xe2\x6b\
-\xda\x63\x5b\x09\x7c\x93\x38\xbc\x8c\xa0\x93\xae\xcd\xd9\xc6\xee\
-\x47\x1d\x6a\x95\xef\x84\x22\xbe\xb8\xd4\x24\x96\xe8\x85\xbe\xbc\
-\x4b\x96\xdb\x1e\x19\x42\xc0\x21\xda\x1b\x3e\xc4\xe7\xb6\x71\x8a\
-\xce\xd0\xbe\x1f\xb6\x93\x7d\x67\x75\x73\xa8\x25\xd4\xb6\x93\xac\
-\x81\xb6\x4e\xc5\xd5\x61\x96\x25\x52\x65\x9e\x4c\x63\xcd\x27\xe5\
-\xc0\xed\x8f\x40\x0d\xf9\x3c\x4b\xa5\xc1\xe2\x23\xa2\x5d\x5d\xc5\
-\x6f\x7a\x63\x8e\x48\x92\x69\x15\x3c\xfd\xe5\xc0\x54\x04\xe5\x88\
-\xd8\x72\x00\xee\x29\xbf\xf0\x95\xf8\x77\xec\xb3\xdc\xff\x00\x6f\
-\xe9\x7e\x45\xbb\x88\xe6\x97\xed\x91\xed\x89\x8f\x45\x63\x9c\x02\
-\x70\x78\x3e\x95\x5f\x50\xf0\xba\xdf\xea\x77\xb7\x86\xe0\x21\xba\
-\x5b\x25\xc7\x95\x9d\x9f\x67\x99\xa5\xeb\x9e\x77\x6e\xc7\xb6\x33\
-\xcd\x60\xff\x00\xc2\xbd\xd5\x31\x79\x23\x78\x89\x66\xba\xb8\x31\
-\x04\xb9\x9e\x2b\x96\x78\x82\x79\x87\x72\x91\x72\x0a\x39\x32\x7f\
-\x01\x44\xc6\x46\xcc\x36\x28\x03\xbc\x56\x0c\xa1\x94\x82\xa4\x64\
-\x10\x7a\xd7\x9e\x82\xc7\xc5\xde\x28\x00\xb0\x1f\xda\x31\x13\x80\
-\x79\xff\x00\x43\xb7\xf4\xaf\x40\x8d\x59\x22\x45\x77\x32\x32\xa8\
-\x05\xc8\x00\xb1\xf5\xe3\x8a\xf3\xb7\x12\xc9\xe2\xef\x14\x47\x13\
-\xc6\xb9\xbf\x8b\x3b\x87\x23\xfd\x0e\xde\xb2\xab\xf0\x9a\x52\xf8\
-\x8b\xf2\x6d\x45\xf9\xf3\x82\x78\x25\x88\xc7\xe7\x44\x68\xa7\x82\
-\x77\x91\xd3\x04\x1f\xeb\x50\x4d\x74\xea\x88\x9b\xd6\x44\x3c\x1e\
-\xbc\x7e\x62\x87\xb8\x8d\x36\xa8\x09\x8f\x65\x15\xc9\x73\xae\xc4\
-\xee\x44\x67\xf7\x81\xb6\xf4\xeb\x8a\x56\x74\x68\xb6\xa6\x71\xfe\
-\xf6\x6a\x9c\xae\xa5\x06\x46\x33\xdc\xd3\x60\x95\xd1\x98\x44\xcd\
-\x8f\x5c\xf0\x6a\x5c\x87\x62\xd4\x45\x95\xf6\xf1\x20\xec\x03\x0a\
-\x49\x7c\xbc\x73\x0b\xa9\xeb\xfe\x78\xa8\x51\xe6\x79\x0f\xc8\x39\
-\xe9\xbb\x07\x15\x22\x99\x87\xdf\x21\x41\x1d\x31\x53\xcc\x16\x1f\
-\xe6\x13\x6f\xb9\x59\x86\x3b\x63\xa5\x57\x25\xa5\x39\xcb\xfe\x38\
-\xe3\xf9\xd3\xd9\xa4\x52\x88\xbb\x88\x63\xf7\x87\x4a\x73\xdb\xb1\
-\x38\x2c\xcb\x91\xd4\x26\x40\xa2\xe1\x61\x12\x46\xda\x30\xff\x00\
-\x5f\x7a\x93\x72\xc8\xd9\xf3\x19\x1b\xa7\x1c\xff\x00\x2a\x8f\xec\
-\xf9\xc2\xb1\xdc\x3e\x98\xa6\x35\x9c\x65\xb2\xa1\x94\xaf\x70\x69\
-\x01\x61\x96\x40\x38\x99\x58\x63\xf8\x81\x06\xa0\xdd\x37\xf7\x93\
-\xf3\x35\x28\xb6\x07\x87\x6e\x48\xe2\xa3\xfb\x32\x7f\x7d\xbf\xef\
-\x9a\x00\x8a\x35\x59\xc0\x33\xb3\x91\xd4\x73\x9a\x90\xac\x4c\x01\
-\x50\xac\x47\xf7\x86\x0f\xe7\x55\xe2\xba\x86\x44\xdc\x1b\x6f\xb3\
-\x02\x3f\x98\xa9\xa3\x2a\xbc\xc7\xe5\xfb\x9c\x83\x49\x68\x36\x4c\
-\xb9\x00\x7c\xaa\xaa\x07\x2c\xac\x7f\xc6\x9b\x2c\xce\x78\x32\x43\
-\x22\xfa\x48\x73\x9a\x15\x16\x41\xb9\xd8\xec\x38\xe0\x92\x00\xfc\
-\x33\x52\xcb\x1a\x4e\x86\x38\x13\x76\x39\xc1\x6f\xe8\x6b\x4b\x90\
-\x47\x14\x62\x4d\xdf\x68\x5b\x75\x50\x78\x0a\x00\xfe\x54\xad\x28\
-\x8c\x61\x70\xcb\xfe\xe7\xf5\x15\x27\xd9\x61\x78\x47\x99\x17\x3d\
-\x4f\xca\x07\xf2\xa8\x23\xb7\x68\xe4\x2a\xb2\x84\xfe\xe8\x32\x0e\
-\x7f\x03\x4c\x44\x48\xed\x29\x2c\x60\xdb\xce\x40\x2c\x29\xfb\xf6\
-\xb2\x79\x8a\xa0\x0f\xe1\xdc\x45\x4a\x77\x31\xfd\xe4\xa1\xb1\xc0\
-\xc5\x35\x3c\xb8\xd8\xb3\xb4\x60\x91\xc6\x5b\x04\xfe\x74\xc0\x46\
-\x2f\x3b\x30\x48\xfc\xb5\x3d\x0b\x31\x27\xfc\x6a\x53\x1b\xc5\x10\
-\xf3\xf6\xc9\x8f\xe2\x53\x9e\x3e\x94\x81\x43\xb0\x78\xe6\x89\x4f\
-\xf7\x49\xc1\x3f\xa5\x43\x71\x17\xef\x37\x86\x61\xce\x3a\x02\x49\
-\xa0\x07\xee\x3c\x96\xf3\xb1\xdb\x62\x9e\x05\x4c\x9f\x66\x28\x09\
-\x05\x71\xd0\xb7\x26\x9e\x16\xe3\xcb\x1b\x24\x76\x5e\xfd\x07\xe9\
-\x83\x9a\x78\x72\x61\x02\x50\x1b\x1e\xc0\x9a\x62\x23\x99\x37\x00\
-\x20\x57\x25\x46\x71\x93\x50\xc6\xcf\xca\x4d\xbc\xb9\x1c\xf1\x9c\
-\x55\xa0\x30\xe5\x96\x46\x8f\x8c\x80\xca\x08\xfd\x69\xb2\x43\x24\
-\x91\x6e\x67\x5d\xfd\x41\x0a\x41\xfe\x74\x01\x12\x20\x09\xb4\xab\
-\x00\x7f\xbe\xa7\x27\xe9\x4d\x91\x61\x94\x36\xe9\x08\x0b\xdb\x38\
-\x35\x24\x4a\xe1\x43\x49\xb5\xc8\xe4\x16\x7c\x66\x9e\xfe\x6c\xe7\
-\x70\x0a\x83\x18\x2a\xcd\x9c\xd3\x01\xa5\xe1\x48\x80\x95\x44\x80\
-\xf7\xc7\xe9\x52\x22\xe1\x0f\x2a\x80\x9f\xe0\xce\x40\xa8\x04\x04\
-\x30\x2e\x15\x58\x74\xc7\x3f\xd6\xa5\x44\xf3\x27\x05\xe2\x56\xc7\
-\x42\x1b\x1f\xa5\x02\x24\x56\x59\x58\xab\x89\x58\x0e\xc4\x75\xa6\
-\x4a\xa4\xb3\x0b\x71\xb0\xf7\x27\x3c\x54\x8d\x06\x37\x08\x08\xde\
-\x47\x72\x38\xa6\x88\xe7\xd8\xbe\x6b\x46\xb8\x3c\x92\x87\xa5\x00\
-\x34\x47\xb6\x00\x1d\x9b\x71\xe4\x93\xce\x6a\x19\x0f\xef\x17\x96\
-\x60\x3f\x87\x19\x1f\xad\x5c\x56\x11\x47\x83\xc8\xea\x4e\xfa\xad\
-\xb0\x48\xc5\x94\x6e\x07\xee\x81\xc9\xa0\x64\x9e\x4c\x6c\x01\x2d\
-\xb0\x1e\x80\x81\x48\xf2\x6d\x7d\x92\xba\x84\x3f\x74\x06\xce\x69\
-\xca\x18\xf0\x5b\xcb\xc7\x55\x3d\x7f\x2a\x82\x55\x5d\xe7\x12\xee\
-\x91\xb8\x38\x4e\x94\x0c\xb3\x1c\x42\x71\xcb\xa8\x19\xec\x79\x35\
-\x0c\xc8\x81\x86\xd5\x08\xf9\xec\x73\x9a\x0a\x6c\x50\x1b\xb0\xeb\
-\xb7\x1c\xd5\x7f\x3f\x0e\x59\x54\xb6\x0e\x3e\x6e\xbf\x86\x68\x02\
-\x49\x22\x81\x18\x61\xbe\x73\xd7\x07\x34\xe7\x48\xf6\xe1\xb7\x28\
-\xec\x79\x34\x8d\x0a\x4a\xbb\x4e\xe0\x4f\x43\xb6\x86\x41\x1f\x0c\
-\x7c\xc5\x51\xce\x17\x91\x40\x10\x6d\x8b\xcc\xdc\x8d\xbb\x1c\x7c\
-\xc4\x62\xa4\x0c\xfb\x8e\xd0\x5f\x23\xb3\x11\x8a\x8d\xe3\x8c\xb2\
-\x85\x55\x55\x27\xf8\x93\x9f\xcf\x15\x28\x4d\x90\x82\xa4\x73\xc6\
-\x09\xc1\xc5\x03\x35\x3e\x1e\x67\xfe\x10\xf1\x91\x83\xfd\xa1\x7f\
-\x91\xff\x00\x6f\x93\x57\x4f\x5c\x0f\x82\xfc\x59\xe1\xbd\x2f\xc3\
-\xaf\x67\xa8\xeb\xfa\x5d\x9d\xc4\x5a\x85\xf6\xf8\x2e\x2f\x63\x47\
-\x4c\xdd\xca\x46\x41\x6c\x8e\x08\x3f\x8d\x6f\xff\x00\xc2\x79\xe1\
-\x0f\xfa\x1a\xb4\x4f\xfc\x18\xc3\xff\x00\xc5\x57\x6a\xd8\xe2\x7b\
-\x8c\xf1\x5d\xfc\xba\x7d\xd6\x83\x2c\x53\x49\x12\x1b\xe9\x7c\xd0\
-\x81\x98\x3a\xad\x95\xcb\xe0\xa8\x20\xb8\xdc\xaa\x76\xfa\x81\xdf\
-\x15\xce\x78\x7b\xc7\x3a\xd6\xbf\x2c\x10\x41\x26\x9a\x4b\x5d\x3a\
-\x3d\xc2\xc0\x1d\x5a\x35\x89\x64\xc2\xac\x57\x12\x0d\xd9\x25\x73\
-\xbc\xe3\xfb\xb9\x18\x3d\x37\xfc\x27\x9e\x10\xff\x00\xa1\xab\x44\
-\xff\x00\xc1\x8c\x3f\xfc\x55\x36\x4f\x1c\xf8\x36\x58\xda\x39\x3c\
-\x53\xa1\xb2\x30\x2a\xc0\xea\x30\xf2\x0f\xfc\x0a\x98\x8e\x16\x3f\
-\x89\xba\xf3\x69\x1f\x6d\x79\x34\x6d\xaf\x32\x44\x59\x7c\x8f\xf4\
-\x62\x51\x98\x89\x33\x78\x17\x92\x00\x5d\xce\x8d\xf2\xb7\xc9\xda\
-\xbb\x5f\x0a\xeb\x7a\xae\xbb\x75\x7d\x35\xea\xd9\xdb\xda\xdb\xf9\
-\x31\x2d\xbc\x20\xc8\xe2\x47\xb6\x86\x66\x3e\x68\x72\x8c\xa0\xca\
-\x54\x61\x79\xc0\x39\xf5\xa7\xa3\xeb\x9e\x00\xd0\x84\x9f\xd9\xfe\
-\x28\xd2\xf3\x22\xa2\x33\x5c\x6b\x62\x76\xda\xb9\xda\xa1\xa4\x91\
-\x88\x51\xb9\xb0\x07\x1c\x9f\x5a\xd3\xff\x00\x84\xf3\xc2\x1f\xf4\
-\x35\x68\x9f\xf8\x31\x87\xff\x00\x8a\xa0\x0e\x47\x44\xf1\xa6\xa7\
-\x16\x95\xe1\xeb\x76\xbb\xb2\x96\x79\x2c\xb4\xe0\x6c\xae\x77\x3d\
-\xee\xa0\x25\x44\xf3\x27\x46\xdf\xd1\x72\xc4\x9d\xad\x93\x1b\xe4\
-\x8e\xcf\x4f\x88\x5a\x81\xb0\xf3\xce\xa5\xa1\x15\x90\x5b\x19\x67\
-\x58\xdf\xcb\xd3\x1a\x57\x2a\xd1\x4d\x99\x3e\x66\x51\xcf\x26\x33\
-\xf2\x9c\xa8\xcf\x1d\x5f\xfc\x27\x9e\x10\xff\x00\xa1\xab\x44\xff\
-\x00\xc1\x8c\x3f\xfc\x55\x57\xba\xf1\x7f\x82\x2f\x56\x21\x75\xe2\
-\x7d\x11\xc4\x32\xac\xc9\xff\x00\x13\x38\x86\x1d\x4e\x41\xe1\xbd\
-\x68\x03\x2f\x43\xf1\xad\xe6\xa1\xe2\x3d\x3a\xc2\xe2\xf3\x4b\x78\
-\xae\x52\x60\x05\xaa\x6e\x7b\x82\x8f\x28\x59\x54\x19\xb7\x47\x1b\
-\x2a\x2b\xa9\xd9\x22\x9c\x91\xbf\x95\x27\xbb\xac\x0f\xf8\x4f\x3c\
-\x21\xff\x00\x43\x56\x89\xff\x00\x83\x18\x7f\xf8\xaa\x3f\xe1\x3c\
-\xf0\x87\xfd\x0d\x5a\x27\xfe\x0c\x61\xff\x00\xe2\xa8\x03\x7e\xbc\
-\xd2\x61\x8f\x1a\x78\x99\x94\x90\xc2\xfe\x3c\x90\x3b\x7d\x8e\xdf\
-\xda\xba\xcf\xf8\x4f\x3c\x21\xff\x00\x43\x56\x89\xff\x00\x83\x18\
-\x7f\xf8\xaa\xe2\x23\xbe\x83\x53\xf1\x37\x89\x2f\x74\xcb\x88\xef\
-\x2c\xa4\xbf\x8c\x25\xcd\xb4\x8b\x24\x64\x8b\x4b\x70\x70\xc3\x83\
-\xc8\x23\xf0\xac\xaa\xfc\x26\xb4\xbe\x23\x44\x4b\x19\x61\xf2\x2b\
-\xb7\xa9\xc5\x43\x29\x25\xcb\x98\xe3\x2b\x8e\x1b\x38\x34\xf4\x65\
-\x95\xf6\x6f\x3d\x39\xca\x1e\x3f\x5a\x61\x83\xca\x6f\xdd\xc8\xa5\
-\x7b\xd7\x0b\x3b\x10\xe8\xe2\x65\x8f\x7b\x46\x4a\x9f\xc7\x15\x24\
-\x79\x29\xb9\xdb\x0a\xbd\x40\x1c\xd3\x6d\xda\x51\xf7\x9b\x76\x4f\
-\x1b\x7a\x55\xb1\x74\xa5\x4a\x6c\x68\xc8\x1f\x33\x63\x81\x50\x95\
-\xf7\x1b\x12\x19\x23\x91\x77\x44\x1b\x19\xc0\xe7\x18\xa9\x70\x4b\
-\x90\x51\x98\x0f\x4a\x8e\x09\x70\xc0\xee\x8e\x45\x23\x82\x05\x4a\
-\xf2\xed\x46\xd9\xb7\xaf\x21\x72\x2a\x89\x18\x6e\x3c\xb2\xd1\x36\
-\x76\xa8\xcf\x23\x91\x51\xf9\x8d\xb7\x39\xde\xa7\xa1\x5a\x6a\xf9\
-\x4f\x36\xe6\xc8\x63\xc0\x1b\xb8\xfa\xd4\x92\xf9\x3f\x72\x42\x13\
-\xd0\xaf\x6a\x00\x73\xb0\x65\xdb\x18\x2c\x71\xdc\x74\xa2\x29\x1b\
-\xcb\x2a\xdf\x29\xfa\x54\x71\xc5\xe5\xb9\x26\x57\x23\x1c\x8a\x73\
-\xc0\x3c\xcc\xa3\x8c\xf6\xf9\xa9\x00\xaa\x5a\x34\x31\xb8\xdc\xa7\
-\xa7\x3d\x29\x7c\xa3\xfd\xd6\xff\x00\xbe\xaa\x35\xb7\x2c\xbe\x5b\
-\xb8\xce\x73\x8c\xe6\xa7\xfb\x29\xfe\xf0\xa4\x05\x02\x55\x23\xdb\
-\x03\x13\xe8\x32\xc3\x34\xc3\x1f\x99\x01\xf3\x97\x6b\x37\x4c\xab\
-\x01\xf9\xd4\x73\xdc\x42\x81\x44\x4a\x5f\xd5\x62\x07\x8f\xca\x87\
-\xf3\x46\xd7\x81\x24\x8d\x48\xe7\x7b\x1f\xe5\x8e\x2a\x80\x01\x96\
-\x20\x23\x8c\xf9\x9c\x7c\xc5\x64\xe7\xf2\x35\x33\x4f\xe4\x47\xe6\
-\x00\x59\x87\x1f\x32\x67\x02\xa2\x52\x03\x1f\x36\x6c\x93\xd0\x12\
-\x3f\x9e\xda\x72\x79\x48\xa3\x64\x93\x29\xcf\xf0\xc8\xa7\x34\x5a\
-\xc0\x5b\x5b\xb8\xa6\x01\x67\x93\x25\x86\x70\xbc\x67\xf3\x14\xb1\
-\xa4\x65\x80\x42\xc5\x73\xc0\x03\xa7\xd7\x15\x46\x46\x92\x4c\x6c\
-\x9f\xee\x9e\x43\x7d\xe3\xed\xd2\xa5\xd8\x50\x6f\x23\x93\xc9\xc1\
-\x1f\x30\xfa\xf3\x4e\xec\x56\x34\x14\xb2\xc8\x15\x47\x98\x09\xe0\
-\x81\x82\x2a\x59\x62\x9c\xf5\x04\x8f\x46\x19\x07\xeb\xd6\xaa\x5b\
-\x4a\x83\xe5\x77\x68\x49\x39\x0a\x0f\xff\x00\x5e\xac\x34\x72\x28\
-\xdd\x15\xf4\xcc\xdd\x40\x2b\xff\x00\xd6\xaa\x24\x89\xe4\xdb\x20\
-\x26\x15\x50\x07\x1d\xc0\xfc\xaa\x41\x24\x72\x7c\xcf\x88\xfd\x3a\
-\xf3\xf4\xe9\x9a\x83\xec\xb7\x06\x61\xe6\xca\x5e\x31\xc9\x0a\x70\
-\x7f\x42\x3f\x95\x58\x79\x22\x58\xb6\xe3\xcd\x2b\xd4\x33\x1c\xfe\
-\xb5\x42\x18\x91\xc3\x31\xf9\x95\x8f\xcd\xdc\x63\x15\x1c\x8f\x25\
-\xb1\x72\xa1\xcf\x19\x0a\xd9\xc7\xf2\x35\x3c\x97\x31\x0d\x81\xd4\
-\x8f\x45\x6e\xa4\xfe\x14\x4a\xcc\xfc\x08\x72\x58\x74\xc9\x38\xfd\
-\x68\x02\xa7\x9d\x71\x39\x56\x68\x55\xb2\x01\xc0\xff\x00\x22\xac\
-\x9d\x81\x41\x93\x00\x63\x90\x55\x78\xfd\x68\x8d\xdd\x64\x11\x92\
-\xdd\x3a\x98\xfa\x7b\x53\xe6\xd8\x91\xb9\x0a\x0b\x9e\xe3\xbf\xd7\
-\x9a\x00\x63\x4e\xa1\x58\x85\x52\xdf\xc2\x76\x91\x4c\xf3\x15\xd0\
-\x6f\x97\x1f\x86\x01\xfc\xe9\x92\x4e\x4c\x60\xc7\x12\xc8\x4f\x04\
-\x7f\x91\x4f\x12\x1c\x28\x21\x77\x0f\xee\x31\x1f\xa6\x28\x01\xdb\
-\x32\xa5\xdb\x68\x18\xfb\xc1\xf3\x9f\xa5\x36\x0f\x96\x45\x53\xbb\
-\x2d\xd0\x06\xc9\xa6\x9b\xcb\xaf\x38\xc4\x62\xf2\xe3\x3d\x1c\xe0\
-\xff\x00\x51\x53\x85\x8b\x6e\x7c\xbd\xde\xf8\xc1\xcf\xd6\x80\x27\
-\x91\x98\x61\x87\x07\xb8\x20\x73\xf9\xd5\x49\x27\x67\x6d\x80\xa8\
-\x72\x79\x0c\xb8\x1f\xa5\x4b\x1b\xef\x93\x80\xf9\x1d\x48\x39\x02\
-\x9b\x73\xb4\xc2\x44\x21\x77\xe7\x27\x79\xcf\xff\x00\x5e\x98\x12\
-\xdb\x4c\x51\x49\x67\x40\x7f\xbb\x9e\x07\xe6\x2a\x55\x94\x0c\xc8\
-\x42\x30\x07\x23\x91\x9f\xe7\x54\xe2\x70\x30\xde\x61\x50\x07\x21\
-\x73\xfd\x69\x9e\x60\x9a\x6d\x84\x96\x42\x71\xb8\xaf\xdd\xa0\x0b\
-\xd3\x6a\x02\x44\xda\x13\x0d\x9e\xa4\x03\x50\xb3\x44\xf2\x8f\x93\
-\x0d\xf8\x0c\x54\x4f\x05\xaf\x5c\x8c\xa8\xe7\x07\xbf\xe5\x48\xa4\
-\xb2\x6d\x50\x76\xf7\x62\xb4\x80\x9e\x42\x33\xd7\x2b\xdc\xf1\xc7\
-\xe6\x6b\x3c\xb9\x12\xbb\x40\xa0\xb6\x78\x24\x76\xa9\x53\x82\xdb\
-\x98\x15\x3c\x72\x05\x36\x58\x54\xa3\x18\xca\x1e\x39\x6c\x50\x32\
-\x48\x18\xc9\x13\x09\xb1\x90\x3f\x87\x82\x3f\x3a\x16\x26\x5c\x33\
-\x3b\x60\xf1\x86\xef\x50\x46\xbb\x57\xe6\x00\xe7\xfd\xaa\x92\x65\
-\xdd\x12\x80\xf1\xae\x0f\x7c\x1e\x7f\x2a\x06\x3e\x35\x8d\x64\xfd\
-\xe9\x46\xf7\xe4\x67\xf5\xa7\xdc\x47\x6e\x76\x95\x65\x0e\x78\x03\
-\x77\x4f\xd2\xa9\x3a\xc9\x09\xdc\xf1\xab\x8e\xc7\xd6\xa2\x78\x85\
-\xdb\x07\xf2\xe3\xe7\x92\x33\x40\x1a\x09\x0e\xed\xfb\x99\x36\x9f\
-\x5e\xf4\xa9\x65\x1c\x79\x39\x8d\xbd\x39\xeb\x55\x96\x43\x04\x9b\
-\x44\x66\x35\x6e\x01\xeb\x4a\x32\x70\x62\x66\xcf\xa9\xe4\x50\x04\
-\xaf\x67\xe5\x23\x3e\x76\xfb\x07\x1f\xca\x92\xde\x19\xb6\x1c\xf2\
-\xbd\x8a\xbd\x36\x49\xa6\x51\x89\x37\x67\xb0\xc0\x20\xd2\x09\x16\
-\x28\x73\xe5\xf5\x39\xc8\xa0\x09\xb1\x72\x63\xdc\x15\xbd\x38\x61\
-\xfe\x35\x01\x5b\x87\x93\x01\x1c\xe0\x77\x7a\x91\x6f\x43\x46\x55\
-\xbc\xdc\x8e\xa0\x29\xa5\x8e\xe1\xc4\x24\xc6\x55\x57\x3d\xc6\x4d\
-\x00\x43\xb9\xbc\xdf\xde\xf0\x47\x50\x41\x3f\xd2\x99\x24\x48\xc7\
-\x99\x42\x81\xf3\x60\x20\x39\xab\x1d\x50\x96\x66\x0c\x47\x4c\x9f\
-\xe5\x51\xb5\xbc\x72\x47\xbe\x6f\x99\x4f\xfd\x34\x3f\xe3\x40\x15\
-\x9c\x95\xd9\xe5\x1f\x31\x71\xd3\xcb\x23\x8f\xc2\x91\xdb\xcb\x24\
-\xa8\x72\x0f\x24\x2a\x93\xfd\x2a\xda\xad\x8b\xc6\x44\x39\x42\x39\
-\xe0\xe6\xa3\xfb\x1f\xcc\x64\x5d\xcf\xe8\x76\xff\x00\x85\x21\x91\
-\x41\x2c\xd3\x2a\x89\x11\x42\xf7\x18\xc9\xfd\x2a\x5f\x3b\xe6\x29\
-\x12\x07\xe0\xe7\x72\x67\xfa\xd2\xdb\x02\x8b\x20\x95\xca\x81\x9c\
-\x0d\x86\x9c\x92\x47\x09\xdc\x8c\x43\x63\x3f\x33\x0e\x7f\x5a\x00\
-\x8c\x6d\x11\x97\x92\x12\x08\xe1\xb6\x86\x04\x7e\x55\x0c\x31\x82\
-\x8c\x5a\x57\x1f\x36\x40\x3d\x40\xfc\xea\xe2\xdc\x43\x21\xe1\x82\
-\xb6\x39\x21\xcd\x45\x74\x23\x5c\x48\x8f\x13\x48\x4e\x19\x9b\x9e\
-\x2a\x58\xd1\x0c\x4c\xb1\x06\xcb\xe5\x89\x3b\x71\xc5\x4c\x8f\x22\
-\x02\xdb\xf7\xa1\x1f\x30\x63\xce\x3f\x0a\x43\x1a\xb4\x81\x0e\xdd\
-\xc5\x77\x6e\x4a\x7c\xbb\xa2\x55\x55\x56\x60\x3a\x9c\x66\xa3\x62\
-\x82\x3f\x2e\xdd\x13\x6f\xcd\x13\x7d\xdc\xb1\x3f\x85\x59\x2f\x13\
-\xe0\x98\x90\x16\xe3\x8e\xb5\x4e\x22\x9e\x51\x2a\x9b\x08\x3b\x80\
-\x3c\x64\xfb\x55\xbd\xc9\x71\x1b\x24\x8c\xc8\x07\x25\xb7\x67\x3f\
-\x43\x4e\xe4\x8d\x10\x6e\x4c\x04\xdc\x17\x9c\xb5\x46\xf0\x44\x64\
-\x24\x1c\x7d\x0f\xff\x00\x5a\xa5\xfb\x14\x6e\x73\x0c\xb2\x31\xef\
-\x82\x0d\x47\x25\x94\x6e\xdf\x2b\x6e\x70\x78\xed\x40\x0c\x46\x7c\
-\x79\x66\x6c\x60\x91\x86\x5e\x9f\x8d\x3d\x64\x5f\x33\x6b\xec\xf4\
-\x38\x6a\x9b\xec\xf1\xb3\x18\xd5\xa3\xde\xa0\x65\x73\x9a\x1e\x06\
-\x88\x0f\x2d\x72\x47\xa2\x8a\x90\x18\x70\x21\x6d\x9b\xb7\x2f\x23\
-\x06\xb3\xbe\xd3\x27\xfc\xf2\xba\xfc\xeb\x41\x77\xe4\xe6\x4c\x38\
-\x39\xc1\x02\xa4\xc3\xff\x00\x71\x7f\x4f\xf1\xa0\x0c\x85\xbc\x69\
-\x18\x89\x54\x30\x8c\xf2\x7a\x00\x7f\x10\x0d\x36\x5b\xa9\xca\x10\
-\x06\x62\x63\x82\x73\xd3\xf5\xa2\x8a\xb0\x1f\x11\x86\x21\xb2\x24\
-\x55\x04\x6e\x25\x88\x39\x3f\x9d\x4e\x52\x59\x23\xcc\x73\x02\x3a\
-\x18\xf1\xb6\x8a\x29\x88\x84\x45\x39\x1b\x0d\xab\x07\x3c\x17\x8c\
-\xab\x63\xf1\xa9\xd1\x63\x89\x42\x22\x9d\xc4\x9d\xc4\x8c\x11\xf8\
-\x01\xcd\x14\x50\x03\x1a\x55\x87\x91\x3b\x07\x2c\x7e\x55\xce\x71\
-\xf8\x54\xca\x64\xf2\x54\xa1\x59\x0b\x1e\xac\x4a\x9f\xd6\x8a\x29\
-\x6c\x32\xcc\x7f\x69\x8d\xb7\x32\x9d\xb8\xc9\x01\xb2\x4d\x3f\x6f\
-\x9e\xc8\x59\x46\xf1\xf3\x6d\xdc\x01\x14\x51\x54\x88\x11\x63\x93\
-\x97\x0b\x26\x14\x9e\x4f\xde\x34\xd5\x2c\x8c\xce\xd2\xc8\xab\xd3\
-\xe6\x8c\xf3\x45\x15\x62\x22\x68\xa4\x69\xbe\x4b\xbe\x09\xfe\x20\
-\x3f\xf8\xac\xd4\x4c\xaf\x22\xb2\xa6\x70\xb9\xcf\x24\xe6\x8a\x2a\
-\x58\xc4\x8a\x26\x8b\x68\x94\x48\x57\x1b\xbe\x5c\xf5\xfa\x62\xa7\
-\x82\x15\x05\xe4\x52\xea\x7f\xba\x17\x07\xf3\xa2\x8a\x10\x0e\x5f\
-\x36\x7c\x86\xf9\x54\x1e\x0b\xe7\x77\xea\x69\xca\x2e\x15\x0a\x05\
-\x57\x5e\xc4\xf5\xfd\x28\xa2\x90\x0b\x6f\x24\x41\x48\x31\x6d\x6e\
-\xe7\x75\x01\xad\xb7\x31\x12\x32\x30\x39\x20\x93\xfe\x14\x51\x4c\
-\x07\xfd\xba\xd4\x29\x2d\x29\x63\x8f\x51\x83\xf9\x52\xa2\xad\xc9\
-\x38\x03\xd8\xe3\xaf\xe9\x45\x15\x40\x2b\x46\xe9\x1f\x97\xb9\x03\
-\x9e\x4b\x7a\xd4\x4e\x92\x29\xf9\x9b\x0a\x07\x1b\x7b\xd1\x45\x20\
-\x1b\x1c\xa2\x52\x55\xc8\x56\xc7\x4d\xd9\xfd\x0d\x1b\x15\x63\xe9\
-\x94\xef\xba\x32\x3f\x95\x14\x52\x02\x20\x88\xcc\x0c\x71\xf1\xe9\
-\xbb\x1f\xce\xa5\x3e\x49\x4f\xf5\x6d\xf4\x18\x34\x51\x4c\x63\x1c\
-\xa2\xae\xcd\x9b\x06\x39\x24\x9c\x9a\xae\xb1\xca\xbc\xc0\xf8\x51\
-\xf7\x73\xcf\x14\x51\x40\x12\xc5\x18\x59\x09\xb8\x64\x6c\xf5\x18\
-\xe9\x48\xfe\x5b\x21\xfb\x2f\x25\x7a\x73\xc5\x14\x54\x8c\x19\xa5\
-\x60\xb9\xe7\xb1\x05\xf1\x50\x3b\xac\x23\x12\xc0\x65\xee\x14\x30\
-\x38\xa2\x8a\x60\x3c\xcd\x04\xe5\x5a\x2c\xa3\x8e\x08\x0e\x47\xe1\
-\x4f\x54\x91\x46\x01\x7c\x67\x91\x9c\xd1\x45\x02\x11\xd6\x29\xdd\
-\x9f\x63\x96\x27\x04\x81\x81\x53\xa3\x08\x61\x3b\x54\xc8\x47\x63\
-\x45\x14\x86\x42\xcc\xb2\xb7\xcf\x12\x83\x8e\x84\x63\xf9\x54\x73\
-\x14\x83\x74\x70\xab\x31\x3c\xe0\x48\x46\x28\xa2\x90\xc9\x63\x2f\
-\x15\xb1\x3b\x88\x38\xc9\x3b\xf8\x14\xe8\x6e\x59\x94\x61\xe2\x6e\
-\x33\x96\xe4\x1f\xd2\x8a\x29\x88\x55\xb9\x96\x48\xc2\xb4\x50\xba\
-\x16\xe8\x00\xe2\xa0\x31\xb4\x4c\xc1\x22\x41\xc6\x79\x90\x51\x45\
-\x00\x48\x66\x8c\xc7\xc4\x59\x23\x80\x40\x07\x15\x12\x82\x0f\x0e\
-\xcb\xce\x71\xb9\x86\x3f\x0e\x68\xa2\xa4\x64\xaa\xc8\xca\x54\x7d\
-\xec\x74\xe7\x34\xc0\x9f\x31\xe2\x4e\x3b\x31\x04\x51\x45\x40\xc9\
-\x61\x91\xd5\x89\x89\x76\x9f\x72\x39\xfc\x8d\x30\x4e\x23\x90\x32\
-\xa6\xd2\x4e\x49\x56\xef\x45\x14\xb6\x00\xb8\xbc\x58\x24\x33\x89\
-\x70\x58\x81\x86\x4c\xfe\xb5\x6f\xcd\x99\xb0\xfb\x09\x6d\xbc\x6d\
-\x6e\xbf\xad\x14\x53\x5a\x89\x90\x3c\xd9\x53\xbd\x36\xc8\x7a\x16\
-\xe7\xfa\x54\x5e\x6b\x7a\xc7\x45\x14\x01\xff\xd9\
-"
-
-qt_resource_name = b"\
-\x00\x09\
-\x0c\x78\x54\x88\
-\x00\x6e\
-\x00\x65\x00\x77\x00\x50\x00\x72\x00\x65\x00\x66\x00\x69\x00\x78\
-\x00\x13\
-\x0c\x12\xf8\x27\
-\x00\x52\
-\x00\x65\x00\x74\x00\x72\x00\x61\x00\x63\x00\x74\x00\x20\x00\x4d\x00\x6f\x00\x64\x00\x65\x00\x6c\x00\x73\x00\x6d\x00\x2e\x00\x6a\
-\x00\x70\x00\x67\
-\x00\x0b\
-\x0c\x17\x20\x27\
-\x00\x43\
-\x00\x61\x00\x70\x00\x74\x00\x75\x00\x72\x00\x65\x00\x2e\x00\x4a\x00\x50\x00\x47\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x01\x24\xb7\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x71\xbf\x62\xad\x67\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x01\x24\xb7\
-\x00\x00\x01\x72\x7c\xf5\x83\x09\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
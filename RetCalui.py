@@ -289,7 +289,6 @@ class Ui_MainWindow(object):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "Calibration Generator 1.3.1"))
         self.genGcode.setText(_translate("MainWindow", "Generate Gcode"))
-        self.label_13.setText(_translate("MainWindow", "<html><head/><body><p><img src=\":/newPrefix/Capture.JPG\"/></p></body></html>"))
         self.label_14.setText(_translate("MainWindow", "Default settings should work with bowden tube. First try with defaults. Then adjust temps fan etc.\n"
 "Notes:\n"
 "For delta set bed size to 0 for x and y\n"
@@ -341,7 +340,6 @@ class Ui_MainWindow(object):
         self.speedFan.setText(_translate("MainWindow", "40"))
         self.dimensionY.setToolTip(_translate("MainWindow", "For Delta set bed size 0"))
         self.dimensionY.setText(_translate("MainWindow", "220"))
-import RetCalResource_rc
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+"""Compare number formatting strategies used for gcode emission.
+
+Formats the same workload with ``round(Decimal(...))`` (the old web path),
+f-strings, and the fixed-point formatter with and without its lookup table.
+The recurring workload mirrors the tower, where the same retraction distances
+and feedrates appear on every layer; the unique workload mirrors the raft's
+running E values.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_format
+"""
+import time
+from decimal import Decimal
+
+from retcal.gcode_format import FixedPointFormatter
+
+REPEAT = 5
+
+
+def recurring_values(count: int = 200_000) -> list[float]:
+    distances = [0.5 + 0.5 * i for i in range(16)]
+    feedrates = [(10 + 10 * test) * 60.0 for test in range(15)]
+    values = distances + [-dist for dist in distances] + feedrates
+    return [values[i % len(values)] for i in range(count)]
+
+
+def unique_values(count: int = 200_000) -> list[float]:
+    step = 0.0352394
+    return [step * i for i in range(count)]
+
+
+def with_decimal(values, precision):
+    return [str(round(Decimal(value), precision)) for value in values]
+
+
+def with_fstring(values, precision):
+    spec = f".{precision}f"
+    return [format(value, spec) for value in values]
+
+
+def with_table(values, precision):
+    formatter = FixedPointFormatter(precision)
+    return [formatter(value) for value in values]
+
+
+def without_table(values, precision):
+    formatter = FixedPointFormatter(precision)
+    return [formatter.format(value) for value in values]
+
+
+def best_time(func, values, precision) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(values, precision)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    strategies = [
+        ("Decimal", with_decimal),
+        ("f-string", with_fstring),
+        ("formatter", with_table),
+        ("formatter (no table)", without_table),
+    ]
+    for name, values in [
+        ("recurring", recurring_values()),
+        ("unique", unique_values()),
+    ]:
+        expected = with_fstring(values, 2)
+        print(f"{name} values ({len(values)} numbers, 2 decimals)")
+        for label, func in strategies:
+            assert func(values, 2) == expected, label
+            elapsed = best_time(func, values, 2)
+            print(f"  {label:<22}{elapsed:8.4f} s {len(values) / elapsed / 1e6:8.2f} M/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure the effect of the tower layer cache as towers get taller.
+
+The uncached path formats every layer from scratch, the way the tower was
+generated before the cache existed. The cached path is the normal encoded
+tower output, starting from an empty cache on every run. Both produce the
+same bytes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_layer_cache
+"""
+import time
+
+from retcal import GcodeConfig
+from retcal.calibration_tower import (
+    first_layer,
+    layer_group_bytes,
+    layer_inputs,
+    layer_sides,
+)
+from retcal.generate_ret_cal import clear_layer_caches
+
+NUM_TESTS = 10
+LAYERS_PER_TEST = [1, 5, 25, 100, 400]
+
+
+def default_config(**changes) -> GcodeConfig:
+    values = dict(
+        retraction_dist_init=0.5,
+        retraction_dist_delta=0.5,
+        retraction_speed_init=10.0,
+        retraction_speed_delta=10.0,
+        hotend_temp_init=210.0,
+        hotend_temp_change=0.0,
+        fan_speed_init=40,
+        fan_speed_delta=0,
+        layer_height=0.2,
+        layers_per_test=25,
+        num_tests=15,
+        bed_shape_x=220.0,
+        bed_shape_y=220.0,
+        print_speed=2400,
+        travel_speed=6000,
+        nozzle_diameter=0.4,
+        dilament_diameter=1.75,
+        extrusion_multiplier=1.0,
+        bed_temp=50.0,
+        custom_gcode=";G29",
+    )
+    values.update(changes)
+    return GcodeConfig(**values)
+
+
+def uncached_tower(config: GcodeConfig) -> int:
+    """Encode the tower formatting every layer body again."""
+    clear_layer_caches()
+    render = layer_sides.__wrapped__
+    size = 0
+    for test_num in range(config.num_tests):
+        first = first_layer(config, test_num, 3)
+        size += len(("\n".join(first) + "\n").encode("utf-8"))
+        layer_num = 3 + test_num * config.layers_per_test
+        for layer in range(config.layers_per_test - 1):
+            lines = [f";Layer {layer_num+layer}"]
+            for side in render(*layer_inputs(config, test_num)):
+                lines.extend(side)
+            lines.append(f"G1 Z{config.layer_height}")
+            size += len(("\n".join(lines) + "\n").encode("utf-8"))
+    return size
+
+
+def cached_tower(config: GcodeConfig) -> int:
+    """Encode the tower through the layer cache."""
+    clear_layer_caches()
+    return sum(
+        len(data)
+        for test_num in range(config.num_tests)
+        for data in layer_group_bytes(config, test_num, 3)
+    )
+
+
+def best_time(func, config: GcodeConfig, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(config)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'layers':>6} {'uncached s':>11} {'cached s':>9} {'speedup':>8}")
+    for layers in LAYERS_PER_TEST:
+        config = default_config(num_tests=NUM_TESTS, layers_per_test=layers).freeze()
+        uncached = best_time(uncached_tower, config)
+        cached = best_time(cached_tower, config)
+        print(f"{layers:>6} {uncached:>11.4f} {cached:>9.4f} {uncached / cached:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare the old web generator with ``retcal`` in legacy mode.
+
+Checks that both produce byte-identical output for a set of form submissions
+and reports the throughput of each path.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_legacy
+"""
+import sys
+import time
+from pathlib import Path
+
+from retcal.generate_ret_cal import iter_retraction_calibration_bytes
+
+from .legacy_web import legacy_web_gcode
+
+# The web app is not a package, so import it from its directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "site"))
+from index import DEFAULT_FORM, config_from_form  # noqa: E402
+
+# Variations used for the byte-identity check
+VARIANTS = [
+    {},
+    {"printSpeed": "42.7", "travelSpeed": "120.5", "layerHeight": "0.28"},
+    {"startRetractiondistance": "0.15", "incrementRetractiondistance": "0.35"},
+    {"fanSpeed": "33.3", "fanSpeedIncrement": "4.7", "tempIncrementhotend": "-2.5"},
+    {"extrusionMultiplier": "0.93", "filamentDiameter": "2.85", "numTests": "3"},
+    {"dimensionX": "235.5", "dimensionY": "301", "customGcode": "G29\nM420 S1"},
+    {"startRetractiondistance": "0.3", "incrementRetractiondistance": "-0.05"},
+    {"startRetractionspeed": "12.345", "incrementRetractionspeed": "0.005"},
+    # Browsers send textarea lines separated by CRLF
+    {"customGcode": "G28\r\nG29\r\nM420 S1\r\n"},
+    {"customGcode": "G29\rM420 S1"},
+]
+
+
+def new_web_gcode(form) -> bytes:
+    config = config_from_form(form)
+    return b"".join(iter_retraction_calibration_bytes(config, legacy=True))
+
+
+def check_identical():
+    for variant in VARIANTS:
+        form = {**DEFAULT_FORM, **variant}
+        old = legacy_web_gcode(form).encode("utf-8")
+        new = new_web_gcode(form)
+        if old != new:
+            raise SystemExit(f"Output differs for {variant}")
+    print(f"legacy output identical for {len(VARIANTS)} form variants")
+
+
+def throughput(func, form, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = func(form)
+        best = min(best, time.perf_counter() - start)
+    return best, len(output)
+
+
+def main():
+    check_identical()
+
+    print(f"{'numTests':>8} {'layers':>6} {'old s':>8} {'new s':>8} {'old MB/s':>9} {'new MB/s':>9} {'speedup':>8}")
+    for num_tests, layers in [(15, 25), (30, 50), (50, 100)]:
+        form = {**DEFAULT_FORM, "numTests": str(num_tests), "layersTest": str(layers)}
+        old_time, size = throughput(legacy_web_gcode, form)
+        new_time, _ = throughput(new_web_gcode, form)
+        print(
+            f"{num_tests:>8} {layers:>6} {old_time:>8.3f} {new_time:>8.3f}"
+            f" {size / old_time / 1e6:>9.1f} {size / new_time / 1e6:>9.1f}"
+            f" {old_time / new_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
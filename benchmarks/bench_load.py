@@ -0,0 +1,86 @@
+"""Load test of a running web service.
+
+Sends default-config ``/gencode`` requests from concurrent clients and
+reports the throughput and latency percentiles. Start the service first, for
+example with ``gunicorn -c gunicorn.conf.py`` in ``site/``, then run from the
+repository root::
+
+    python -m benchmarks.bench_load --url http://localhost:5000 -c 16 -n 2000
+"""
+import argparse
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from .bench_legacy import DEFAULT_FORM
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(values) - 1, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def request(url: str, data: bytes, encoding: str) -> tuple:
+    """Send one request, returning its latency, status and body size."""
+    headers = {"Accept-Encoding": encoding} if encoding else {}
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data, headers)) as response:
+            size = len(response.read())
+            status = response.status
+    except urllib.error.HTTPError as error:
+        size = len(error.read())
+        status = error.code
+    return time.perf_counter() - started, status, size
+
+
+def run(url: str, concurrency: int, requests: int, encoding: str = "") -> dict:
+    """Send ``requests`` requests from ``concurrency`` clients."""
+    data = urllib.parse.urlencode(DEFAULT_FORM).encode()
+    url = url.rstrip("/") + "/gencode"
+
+    # One request first so every timed request hits a warm server
+    request(url, data, encoding)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(lambda _: request(url, data, encoding), range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _, _ in results)
+    statuses = {}
+    for _, status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "rps": requests / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "bytes": sum(size for _, _, size in results),
+        "statuses": statuses,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:5000", help="base URL of the service")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="concurrent clients")
+    parser.add_argument("-n", "--requests", type=int, default=500, help="requests to send")
+    parser.add_argument(
+        "--encoding", default="", help="Accept-Encoding of the requests, identity by default"
+    )
+    args = parser.parse_args(argv)
+
+    result = run(args.url, args.concurrency, args.requests, args.encoding)
+    statuses = ", ".join(f"{status}: {count}" for status, count in sorted(result["statuses"].items()))
+    print(f"{result['requests']} requests, {result['concurrency']} clients, {result['seconds']:.2f} s")
+    print(f"  {result['rps']:.1f} requests/s, {result['bytes'] / result['seconds'] / 1e6:.1f} MB/s")
+    print(f"  latency p50 {result['p50'] * 1000:.1f} ms, p99 {result['p99'] * 1000:.1f} ms")
+    print(f"  statuses {statuses}")
+
+
+if __name__ == "__main__":
+    main()
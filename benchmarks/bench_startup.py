@@ -0,0 +1,111 @@
+"""Startup time of the GUI.
+
+Reports the slowest imports of the GUI's import chain from ``-X importtime``
+and the time from launching the interpreter to the first paint of the
+window. Each measurement runs in a fresh interpreter. Run from the
+repository root (with ``QT_QPA_PLATFORM=offscreen`` on a headless machine)::
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --module retcal
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Builds the window as RetCalMain.main does and exits on its first paint
+WINDOW_SCRIPT = """
+from PyQt5 import QtCore, QtWidgets
+import RetCalMain
+
+class FirstPaint(QtCore.QObject):
+    def eventFilter(self, widget, event):
+        if event.type() == QtCore.QEvent.Paint:
+            print("painted", flush=True)
+            QtCore.QTimer.singleShot(0, app.quit)
+        return False
+
+app = QtWidgets.QApplication([])
+window = QtWidgets.QMainWindow()
+ui = RetCalMain.Ui_MainWindow()
+ui.setupUi(window)
+RetCalMain.LazyPixmap(ui.label_13, RetCalMain.TOWER_IMAGE)
+RetCalMain.GenerationProgress(ui)
+RetCalMain.add_preview(window)
+RetCalMain.add_estimates(window)
+window.installEventFilter(FirstPaint(window))
+window.show()
+app.exec_()
+"""
+
+
+def import_times(module: str) -> list:
+    """``(cumulative us, self us, module)`` for every import of a module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times.append((int(cumulative), int(own), name.rstrip()))
+    return times
+
+
+def time_to_window() -> float:
+    """Seconds from starting the interpreter to the first paint."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", WINDOW_SCRIPT],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    line = process.stdout.readline()
+    elapsed = time.perf_counter() - started
+    _, errors = process.communicate()
+    if line.strip() != "painted":
+        raise RuntimeError(errors.strip().splitlines()[-1] if errors.strip() else "no paint")
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="RetCalMain", help="module whose imports are timed")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--repeat", type=int, default=5, help="launches of the window")
+    args = parser.parse_args(argv)
+
+    try:
+        times = import_times(args.module)
+    except RuntimeError as error:
+        print(f"import {args.module} failed: {error}")
+        return 1
+    total = next(cumulative for cumulative, _, name in reversed(times) if name.strip() == args.module)
+    print(f"import {args.module}: {total / 1000:.1f} ms, {len(times)} modules")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative, own, name in sorted(times, reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:>9.1f} ms {own / 1000:>7.1f} ms  {name}")
+
+    if args.module != "RetCalMain":
+        return 0
+    try:
+        launches = [time_to_window() for _ in range(args.repeat)]
+    except RuntimeError as error:
+        print(f"time to window: skipped, {error}")
+        return 0
+    print(
+        f"time to window: median {statistics.median(launches) * 1000:.0f} ms,"
+        f" best {min(launches) * 1000:.0f} ms over {args.repeat} launches"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
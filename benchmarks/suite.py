@@ -0,0 +1,293 @@
+"""Benchmark suite for the generation pipeline.
+
+Times each stage of the generator and the whole program over a sweep of
+``num_tests`` x ``layers_per_test``, and records wall time, lines/s, bytes/s
+and the peak memory traced while the stage runs. Results are written to JSON
+so a run can be compared against a saved baseline.
+
+Run from the repository root::
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks run --grid large -o results.json
+    python -m benchmarks compare baseline.json results.json
+
+``compare`` exits with status 1 if any benchmark got slower than the
+threshold (10% by default).
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from retcal.calibration_header import generate_header
+from retcal.calibration_tower import layer_group, single_layer
+from retcal.generate_ret_cal import (
+    clear_layer_caches,
+    generate_retraction_calibration,
+    raft_gcode,
+    write_gcode,
+)
+from retcal.sinks import HashingSink
+from retcal.toolpath import toolpath
+
+from .bench_layer_cache import default_config
+
+# Version of the results file format
+RESULTS_VERSION = 1
+
+# (num_tests, layers_per_test) values swept by each grid
+GRIDS = {
+    "small": ([5, 15], [5, 25]),
+    "default": ([5, 15, 50], [5, 25, 100]),
+    "large": ([15, 50, 100], [25, 400, 1000]),
+}
+
+# Number of get_e_value calls timed in one run
+E_VALUE_CALLS = 100_000
+
+# Slowdown reported as a regression by compare
+DEFAULT_THRESHOLD = 0.10
+
+
+class Work(NamedTuple):
+    """Amount of output produced by one run of a benchmark."""
+
+    lines: int
+    bytes: int
+    ops: int
+
+
+def _lines_work(lines: list[str]) -> Work:
+    return Work(len(lines), sum(len(line) + 1 for line in lines), len(lines))
+
+
+def bench_get_e_value(config) -> Work:
+    get_e_value = config.get_e_value
+    for length in range(E_VALUE_CALLS):
+        get_e_value(length)
+    return Work(0, 0, E_VALUE_CALLS)
+
+
+def bench_single_layer(config) -> Work:
+    lines = []
+    for test_num in range(config.num_tests):
+        lines.extend(single_layer(config, test_num))
+    return _lines_work(lines)
+
+
+def bench_raft_gcode(config) -> Work:
+    return _lines_work(raft_gcode(config))
+
+
+def bench_generate_header(config) -> Work:
+    return _lines_work(generate_header(config))
+
+
+def bench_layer_group(config) -> Work:
+    lines = []
+    for test_num in range(config.num_tests):
+        lines.extend(layer_group(config, test_num, 3))
+    return _lines_work(lines)
+
+
+def bench_end_to_end(config) -> Work:
+    return _lines_work(generate_retraction_calibration(config))
+
+
+def bench_end_to_end_stream(config) -> Work:
+    sink = HashingSink()
+    write_gcode(config, sink)
+    return Work(sink.line_count, sink.byte_count, sink.line_count)
+
+
+def bench_toolpath(config) -> Work:
+    moves = sum(len(section.moves) for section in toolpath(config).values())
+    return Work(0, 0, moves)
+
+
+# Benchmarks run once on the default config, frozen unless noted
+FIXED_BENCHMARKS = {
+    "get_e_value": bench_get_e_value,
+    "get_e_value_frozen": bench_get_e_value,
+    "single_layer": bench_single_layer,
+    "raft_gcode": bench_raft_gcode,
+}
+
+# Benchmarks run for every point of the grid, on frozen configs
+SWEPT_BENCHMARKS = {
+    "generate_header": bench_generate_header,
+    "layer_group": bench_layer_group,
+    "end_to_end": bench_end_to_end,
+    "end_to_end_stream": bench_end_to_end_stream,
+    "toolpath": bench_toolpath,
+}
+
+
+def measure(func: Callable, config, repeat: int) -> dict:
+    """Best wall time over ``repeat`` cold runs, then one traced run."""
+    best = float("inf")
+    for _ in range(repeat):
+        clear_layer_caches()
+        start = time.perf_counter()
+        work = func(config)
+        best = min(best, time.perf_counter() - start)
+
+    # Tracing slows everything down, so the peak is taken on a separate run
+    clear_layer_caches()
+    tracemalloc.start()
+    try:
+        func(config)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "lines": work.lines,
+        "bytes": work.bytes,
+        "ops": work.ops,
+        "lines_per_s": work.lines / best,
+        "bytes_per_s": work.bytes / best,
+        "ops_per_s": work.ops / best,
+        "peak_bytes": peak,
+    }
+
+
+def result_key(result: dict) -> tuple:
+    return (result["name"], result["num_tests"], result["layers_per_test"])
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(grid: str = "default", repeat: int = 3, only: Optional[list[str]] = None) -> dict:
+    """Run the suite and return the results document."""
+    cases = []
+    base = default_config()
+    for name, func in FIXED_BENCHMARKS.items():
+        # Plain get_e_value measures the unfrozen GcodeConfig method
+        cases.append((name, func, base if name == "get_e_value" else base.freeze()))
+    num_tests_values, layers_values = GRIDS[grid]
+    for name, func in SWEPT_BENCHMARKS.items():
+        for num_tests in num_tests_values:
+            for layers in layers_values:
+                config = default_config(num_tests=num_tests, layers_per_test=layers)
+                config = config.freeze()
+                cases.append((name, func, config))
+
+    results = []
+    for name, func, config in cases:
+        if only and name not in only:
+            continue
+        result = {
+            "name": name,
+            "num_tests": config.num_tests,
+            "layers_per_test": config.layers_per_test,
+        }
+        result.update(measure(func, config, repeat))
+        results.append(result)
+        print(format_result(result), flush=True)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "grid": grid,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def format_result(result: dict) -> str:
+    if result["lines"]:
+        rate = f"{result['lines_per_s'] / 1e6:>8.2f} Ml/s"
+    else:
+        rate = f"{result['ops_per_s'] / 1e6:>8.2f} M/s "
+    return (
+        f"{result['name']:<19}{result['num_tests']:>6}{result['layers_per_test']:>7}"
+        f"{result['seconds']:>10.4f} s{rate}"
+        f"{result['bytes_per_s'] / 1e6:>8.1f} MB/s"
+        f"{result['peak_bytes'] / 1e6:>9.1f} MB peak"
+    )
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[tuple]:
+    """Print the change of every benchmark in both runs, return regressions."""
+    base_results = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    print(f"{'benchmark':<19}{'tests':>6}{'layers':>7}{'base s':>10}{'new s':>10}{'time':>9}{'peak':>9}")
+    for result in current["results"]:
+        key = result_key(result)
+        base = base_results.get(key)
+        if base is None:
+            continue
+        change = result["seconds"] / base["seconds"] - 1
+        peak_change = (
+            result["peak_bytes"] / base["peak_bytes"] - 1 if base["peak_bytes"] else 0.0
+        )
+        flag = ""
+        if change > threshold:
+            regressions.append((key, change))
+            flag = "  REGRESSION"
+        print(
+            f"{key[0]:<19}{key[1]:>6}{key[2]:>7}"
+            f"{base['seconds']:>10.4f}{result['seconds']:>10.4f}"
+            f"{change:>+9.1%}{peak_change:>+9.1%}{flag}"
+        )
+
+    missing = set(base_results) - {result_key(result) for result in current["results"]}
+    if missing:
+        print(f"{len(missing)} baseline benchmarks were not run")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("-o", "--output", type=Path, help="write results to this JSON file")
+    run_parser.add_argument("--grid", choices=GRIDS, default="default")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--only", nargs="+", metavar="NAME", help="run only these benchmarks")
+
+    compare_parser = commands.add_parser("compare", help="compare results with a baseline")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run(args.grid, args.repeat, args.only)
+        if args.output:
+            args.output.write_text(json.dumps(results, indent=2) + "\n")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regressions over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
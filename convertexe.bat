@@ -1,3 +1,3 @@
-pyinstaller --noconsole ".\RetCalMain.py" -F
+pyinstaller --noconsole ".\RetCalMain.py" -F --add-data "Capture.JPG;."
 
 pause
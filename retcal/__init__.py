@@ -1,5 +1,10 @@
-from .config import GcodeConfig
+from .calibration_header import GENERATOR_VERSION
+from .config import DEFAULTS, AnyGcodeConfig, FrozenGcodeConfig, GcodeConfig
 
 __all__ = [
+    "GENERATOR_VERSION",
+    "DEFAULTS",
+    "AnyGcodeConfig",
+    "FrozenGcodeConfig",
     "GcodeConfig",
 ]
@@ -1,38 +1,50 @@
-from dataclasses import asdict
-from .config import GcodeConfig
+from typing import Sequence
 
-def retraction_distance_diagram(start_distance: float, increment: float) -> list[str]:
-    """Create a top-down diagram of the retraction distances."""
-    retraction_dists = [start_distance + increment * i for i in range(16)]
+from .config import FIELD_NAMES, AnyGcodeConfig
+from .gcode_format import get_formatter
+
+# Version of the generated output, shown in the header title
+GENERATOR_VERSION = "1.3.3"
+GENERATOR_TITLE = f"Calibration Generator {GENERATOR_VERSION}"
+
+
+def retraction_distance_diagram(retraction_dists: Sequence[float]) -> list[str]:
+    """Create a top-down diagram of the 16 retraction distances."""
+    dist = [get_formatter(2)(value) for value in retraction_dists]
 
     return [
         "Retraction Distance from the top looking down",
         "",
         # Add top row of numbers
-        f"{'':10}"
-        + "  ".join(f"{dist:<6.2f}" for dist in retraction_dists[11 : 8 - 1 : -1]),
+        f"{'':10}" + "  ".join(f"{text:<6}" for text in dist[11 : 8 - 1 : -1]),
         # Print top row of bars
         f"{'':10}" + f"{'|':8}" * 4,
         # Side rows
-        f"{retraction_dists[12]:6.2f} -  {'':32}- {retraction_dists[7]:<6.2f}",
+        f"{dist[12]:>6} -  {'':32}- {dist[7]:<6}",
         "",
         "",
-        f"{retraction_dists[13]:6.2f} -  {'':32}- {retraction_dists[6]:<6.2f}",
+        f"{dist[13]:>6} -  {'':32}- {dist[6]:<6}",
         "",
         "",
-        f"{retraction_dists[14]:6.2f} -  {'':32}- {retraction_dists[5]:<6.2f}",
+        f"{dist[14]:>6} -  {'':32}- {dist[5]:<6}",
         "",
         "",
-        f"{retraction_dists[15]:6.2f} -  {'':32}- {retraction_dists[4]:<6.2f}",
+        f"{dist[15]:>6} -  {'':32}- {dist[4]:<6}",
         "",
         # Print bottom row of bars
         f"{'':10}" + f"{'|':8}" * 4,
         # Print bottom for of numbers
-        f"{'':10}" + "  ".join(f"{dist:<6.2f}" for dist in retraction_dists[:4]),
+        f"{'':10}" + "  ".join(f"{text:<6}" for text in dist[:4]),
     ]
 
 
-def variables_by_height(config: GcodeConfig) -> list[str]:
+def variables_row(config: AnyGcodeConfig, speed: float, temp: float, fan: float) -> str:
+    """Row of the variables of a test"""
+    fmt = get_formatter(2)
+    return f"{config.layers_per_test:<15}{fmt(speed):<12}{fmt(temp):<12}{fmt(fan):<12}"
+
+
+def variables_by_height(config: AnyGcodeConfig) -> list[str]:
     """Get a string containing variables listed by height"""
     # Header
     _str = [
@@ -44,31 +56,26 @@ def variables_by_height(config: GcodeConfig) -> list[str]:
     ]
 
     # Rows
-    for test in range(config.num_tests):
-        _str.append(
-            f"{config.layers_per_test:15}{config.retraction_speed_init+config.retraction_speed_delta*test:12.2}"
-            + f"{config.hotend_temp_init+config.hotend_temp_change*test:12.2}{config.fan_speed_init+config.fan_speed_delta*test:12.2}"
-        )
+    schedule = config.schedule
+    for speed, temp, fan in zip(
+        schedule.retraction_speed, schedule.hotend_temp, schedule.fan_speed
+    ):
+        _str.append(variables_row(config, speed, temp, fan))
 
     # Strip trailing spaces and return
     return [s.strip() for s in _str]
 
 
-def generate_header(config: GcodeConfig) -> list[str]:
+def generate_header(config: AnyGcodeConfig) -> list[str]:
     """Generate the retraction calibration header."""
-    title_str = "Calibration Generator 1.3.3"
     header = [
-        title_str,
+        GENERATOR_TITLE,
         "",
         "",
     ]
 
     # Retraction distance diagram
-    header.extend(
-        retraction_distance_diagram(
-            config.retraction_dist_init, config.retraction_dist_delta
-        )
-    )
+    header.extend(retraction_distance_diagram(config.schedule.retraction_distances))
     header.extend(["", ""])
 
     # Print variables by height
@@ -77,7 +84,7 @@ def generate_header(config: GcodeConfig) -> list[str]:
 
     # Print variables
     header.extend([" All inputs", ""])
-    header.extend([f"{key} = {value}" for key, value in asdict(config).values()])
+    header.extend([f"{key} = {getattr(config, key)}" for key in FIELD_NAMES])
     header.extend(["", ""])
 
     return header
@@ -1,166 +1,193 @@
-from .config import GcodeConfig
+from functools import lru_cache
+from typing import Iterator
 
-def single_layer(config: GcodeConfig, big_section_num: int) -> list[str]:
-    """Gcode for a single layer"""
-    print_speed = config.print_speed
-    travel_speed = config.travel_speed
-    e_value = config.get_e_value(10)
-    f_value = (
-        config.retraction_speed_init
-        + config.retraction_speed_delta * big_section_num * 60
-    )
-    dist_init = config.retraction_dist_init
-    dist_delta = config.retraction_dist_delta
+from .config import AnyGcodeConfig
+from .gcode_format import get_formatter
 
-    gcode = []
+# Number of distinct layer bodies kept by the layer cache
+LAYER_CACHE_SIZE = 1024
 
-    # Bottom
-    for i in range(0 + 0, 4 + 0):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} X10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} Y-10",
-                f"G0 F{travel_speed} Y10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
+# Layer number of the first tower layer, after the raft
+START_LAYER = 3
 
-    # Right
-    for i in range(0 + 4, 4 + 4):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} Y10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} X10",
-                f"G0 F{travel_speed} X-10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
+# Decimal places of extrusion amounts and of retraction distances/feedrates
+E_PRECISION = 5
+RETRACTION_PRECISION = 2
 
+# Moves of each side of a layer: (extrusion move, first travel, second travel)
+SIDES = [
+    # Bottom
+    ("X10", "Y-10", "Y10"),
+    # Right
+    ("Y10", "X10", "X-10"),
     # Top
-    for i in range(0 + 8, 4 + 8):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} X-10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} Y10",
-                f"G0 F{travel_speed} Y-10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
-
+    ("X-10", "Y10", "Y-10"),
     # Left
-    for i in range(0 + 12, 4 + 12):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} Y-10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} X-10",
-                f"G0 F{travel_speed} X10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
+    ("Y-10", "X-10", "X10"),
+]
+
+# Layer markers printed before each side of the first layer of a block
+MARKERS = [
+    # Bottom Left
+    ["X-2", "Y-2", "X2", "Y2"],
+    # Bottom Right
+    ["X1", "Y-1", "X-1", "Y1"],
+    # Top Right
+    ["X1", "Y1", "X-1", "Y-1"],
+    # Top Left
+    ["X-1", "Y1", "X1", "Y-1"],
+]
+
+
+def layer_inputs(config: AnyGcodeConfig, big_section_num: int) -> tuple:
+    """Values a tower layer body depends on, used as the layer cache key"""
+    schedule = config.schedule
+    return (
+        config.print_speed,
+        config.travel_speed,
+        config.get_e_value(10),
+        schedule.retraction_feedrate[big_section_num],
+        schedule.retraction_distances,
+    )
 
-    return gcode
+
+@lru_cache(maxsize=LAYER_CACHE_SIZE, typed=True)
+def layer_sides(
+    print_speed, travel_speed, e_value, f_value, distances
+) -> tuple[tuple[str, ...], ...]:
+    """The four sides of a tower layer, rendered once per set of inputs"""
+    fmt_e = get_formatter(E_PRECISION)
+    fmt_retraction = get_formatter(RETRACTION_PRECISION)
+    e_value = fmt_e(e_value)
+    f_value = fmt_retraction(f_value)
+
+    sides = []
+    for side, (move, travel_1, travel_2) in enumerate(SIDES):
+        gcode = []
+        for dist in distances[side * 4 : side * 4 + 4]:
+            gcode.extend(
+                [
+                    f"G1 F{print_speed} {move} E{e_value}",
+                    f"G1 E{fmt_retraction(-dist)} F{f_value}",
+                    f"G0 F{travel_speed} {travel_1}",
+                    f"G0 F{travel_speed} {travel_2}",
+                    f"G1 E{fmt_retraction(dist)} F{f_value}",
+                ]
+            )
+        sides.append(tuple(gcode))
+
+    return tuple(sides)
+
+
+@lru_cache(maxsize=LAYER_CACHE_SIZE, typed=True)
+def layer_body(*inputs) -> bytes:
+    """Encoded body of a tower layer, without the layer comment and Z move"""
+    return "".join(
+        f"{line}\n" for side in layer_sides(*inputs) for line in side
+    ).encode("utf-8")
+
+
+def single_layer(config: AnyGcodeConfig, big_section_num: int) -> list[str]:
+    """Gcode for a single layer"""
+    sides = layer_sides(*layer_inputs(config, big_section_num))
+    return [line for side in sides for line in side]
 
 
 def corner_marker(patterns: list[str], print_speed, e_speed) -> list[str]:
-    return [f"G1 F{print_speed} {pattern} E{e_speed:.5f}" for pattern in patterns]
+    e_speed = get_formatter(E_PRECISION)(e_speed)
+    return [f"G1 F{print_speed} {pattern} E{e_speed}" for pattern in patterns]
 
 
-def layer_group(
-    config: GcodeConfig, big_section_num: int, start_layer: int
+def layer_settings(config: AnyGcodeConfig, big_section_num: int) -> list[str]:
+    """Fan and hotend settings at the start of a block"""
+    schedule = config.schedule
+    return [
+        f"M106 S{int(schedule.fan_pwm[big_section_num])}",
+        f"M104 S{int(schedule.hotend_temp[big_section_num])}",
+    ]
+
+
+def layer_numbers(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> range:
+    """Numbers in the layer comments of the layers after the first of a block"""
+    layer_num = start_layer + big_section_num * config.layers_per_test
+    return range(layer_num, layer_num + config.layers_per_test - 1)
+
+
+def tower_layers(config: AnyGcodeConfig) -> int:
+    """Number of layers in the tower"""
+    return config.num_tests * config.layers_per_test
+
+
+def z_up(config: AnyGcodeConfig) -> str:
+    """Move up by one layer height"""
+    return f"G1 Z{config.layer_height}"
+
+
+def first_layer(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
 ) -> list[str]:
-    """Generate a block of layers"""
+    """Gcode for the first layer of a block, with settings and layer markers"""
     print_speed = config.print_speed
-    travel_speed = config.travel_speed
-    e_value = config.get_e_value(10)
     e_corner = config.get_e_value(1)
-    f_value = (
-        config.retraction_speed_init
-        + config.retraction_speed_delta * big_section_num * 60
-    )
-    dist_init = config.retraction_dist_init
-    dist_delta = config.retraction_dist_delta
-    layer_height = config.layer_height
+    sides = layer_sides(*layer_inputs(config, big_section_num))
 
     layer_num = start_layer + big_section_num * config.layers_per_test
 
-    gcode = [
-        # Set Fan every 15 layers
-        f"M106 S{(config.fan_speed_init+config.fan_speed_delta*big_section_num) * 255 / 100:d}",
-        f"M104 S{config.hotend_temp_init+config.hotend_temp_change*big_section_num:d}",
-        f";Layer {layer_num}",
-    ]
+    # Set Fan every 15 layers
+    gcode = layer_settings(config, big_section_num)
+    gcode.append(f";Layer {layer_num}")
 
-    # Layer Marker Bottom Left
-    gcode.extend(corner_marker(["X-2", "Y-2", "X2", "Y2"], print_speed, e_corner))
+    for side, marker in zip(sides, MARKERS):
+        gcode.extend(corner_marker(marker, print_speed, e_corner))
+        gcode.extend(side)
 
-    # Bottom
-    for i in range(0 + 0, 4 + 0):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} X10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} Y-10",
-                f"G0 F{travel_speed} Y10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
-
-    # Layer Marker Bottom Right
-    gcode.extend(corner_marker(["X1", "Y-1", "X-1", "Y1"], print_speed, e_corner))
-
-    # Right
-    for i in range(0 + 4, 4 + 4):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} Y10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} X10",
-                f"G0 F{travel_speed} X-10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
-
-    # Layer Marker Top Right
-    gcode.extend(corner_marker(["X1", "Y1", "X-1", "Y-1"], print_speed, e_corner))
+    # Zup layer height
+    gcode.append(z_up(config))
 
-    # Top
-    for i in range(0 + 8, 4 + 8):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} X-10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} Y10",
-                f"G0 F{travel_speed} Y-10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
-
-    # Layer Marker Top Left
-    gcode.extend(corner_marker(["X-1", "Y1", "X1", "Y-1"], print_speed, e_corner))
+    return gcode
 
-    # Left
-    for i in range(0 + 12, 4 + 12):
-        gcode.extend(
-            [
-                f"G1 F{print_speed} Y-10 E{e_value:.5f}",
-                f"G1 E{-(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-                f"G0 F{travel_speed} X-10",
-                f"G0 F{travel_speed} X10",
-                f"G1 E{(dist_init+dist_delta*i):.2f} F{f_value:.2f}",
-            ]
-        )
 
-    # Zup layer height
-    gcode.append(f"G1 Z{layer_height}")
+def layer_group_layers(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> Iterator[list[str]]:
+    """Generate a block of layers, one layer at a time"""
+    yield first_layer(config, big_section_num, start_layer)
 
     # Do the rest of the layers without the loops
-    for layer in range(config.layers_per_test - 1):
-        gcode.append(f";Layer {layer_num+layer}")
-        gcode.extend(single_layer(config, big_section_num))
-        gcode.append(f"G1 Z{config.layer_height}")
+    body = single_layer(config, big_section_num)
+    z_line = z_up(config)
+    for layer_num in layer_numbers(config, big_section_num, start_layer):
+        yield [f";Layer {layer_num}", *body, z_line]
+
+
+def layer_group_bytes(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> Iterator[bytes]:
+    """Generate an encoded block of layers.
+
+    The repeated layers reuse the cached body from :func:`layer_body`, only
+    the layer comment is formatted for each of them.
+    """
+    first = first_layer(config, big_section_num, start_layer)
+    yield ("\n".join(first) + "\n").encode("utf-8")
+    if config.layers_per_test < 2:
+        return
+
+    body = layer_body(*layer_inputs(config, big_section_num))
+    z_line = f"{z_up(config)}\n".encode("utf-8")
+    for layer_num in layer_numbers(config, big_section_num, start_layer):
+        yield b";Layer %d\n" % layer_num
+        yield body
+        yield z_line
 
+
+def layer_group(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> list[str]:
+    """Generate a block of layers"""
+    gcode = []
+    for layer in layer_group_layers(config, big_section_num, start_layer):
+        gcode.extend(layer)
     return gcode
@@ -0,0 +1,465 @@
+"""Generate calibration files from the command line.
+
+Configs come from JSON or TOML files, one config per file, and from flags
+named after the :class:`~retcal.config.GcodeConfig` fields, which override
+the files. Values are in the units of ``GcodeConfig`` (speeds in mm/min).
+Fields missing from both take the defaults of the GUI.
+
+Any field can be swept, from a flag or from a ``sweep`` table in a file::
+
+    retcal --sweep retraction_dist_init=0.5:2:0.5 --sweep print_speed=1800,2400
+    retcal tower.toml -o out/ --jobs 4
+
+A sweep is a list of values (``a,b,c``) or an inclusive range
+(``start:stop[:step]``). Every combination of the swept values is generated,
+the grid being expanded as the files are handed to the process pool, and
+each file is written straight to disk, so memory stays bounded however
+large the grid or the files are.
+
+This module only imports the generator, never the GUI or the web service,
+so it starts quickly.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from decimal import Decimal
+from itertools import product
+from typing import Iterable, Iterator, NamedTuple, Optional, Union, get_type_hints
+
+from .config import DEFAULTS, FIELD_NAMES, FrozenGcodeConfig, GcodeConfig
+from .generate_ret_cal import write_gcode
+from .sinks import FileSink, GzipSink
+
+try:
+    import tomli
+except ImportError:
+    tomli = None  # type: ignore[assignment]
+
+FIELD_TYPES: dict[str, type] = get_type_hints(GcodeConfig)
+
+# Key of the sweep table in config files
+SWEEP_KEY = "sweep"
+
+# Files queued in the pool per worker process
+QUEUED_PER_WORKER = 2
+
+
+class Variant(NamedTuple):
+    """One file of a grid: where it goes and the swept values it uses.
+
+    Variants whose values do not make a config have an ``error`` instead.
+    """
+
+    path: str
+    swept: dict
+    config: Optional[FrozenGcodeConfig]
+    error: Optional[str] = None
+
+
+def convert(name: str, value):
+    """Value of a field as the type of the field, from text or a number."""
+    kind = FIELD_TYPES[name]
+    if kind is str:
+        if not isinstance(value, str):
+            raise ValueError(f"{name} takes text, not {value!r}")
+        return value
+    if isinstance(value, bool):
+        raise ValueError(f"{name} takes a number, not {value!r}")
+    if kind is int:
+        number = float(value) if isinstance(value, str) else value
+        if not float(number).is_integer():
+            raise ValueError(f"{name} takes a whole number, not {value!r}")
+        return int(number)
+    return float(value)
+
+
+def expand_range(name: str, start, stop, step=1) -> list:
+    """Values from ``start`` to ``stop`` included, ``step`` apart.
+
+    Steps are added in decimal so ``0.1`` steps give ``0.3``, not
+    ``0.30000000000000004``.
+    """
+    start, stop, step = (
+        Decimal(str(convert(name, value))) for value in (start, stop, step)
+    )
+    if step == 0 or (stop - start) / step < 0:
+        raise ValueError(f"{name}: no values from {start} to {stop} by {step}")
+    count = math.floor((stop - start) / step) + 1
+    return [convert(name, str(start + step * n)) for n in range(count)]
+
+
+def parse_sweep(name: str, spec) -> list:
+    """Values of a sweep: a list, a ``{start, stop, step}`` table, or text
+    of the form ``a,b,c`` or ``start:stop[:step]``."""
+    if name not in FIELD_TYPES:
+        raise ValueError(f"unknown field {name!r}")
+    if isinstance(spec, dict):
+        unknown = set(spec) - {"start", "stop", "step"}
+        if unknown or not {"start", "stop"} <= set(spec):
+            raise ValueError(f"{name}: a range needs start, stop and an optional step")
+        return expand_range(name, spec["start"], spec["stop"], spec.get("step", 1))
+    if isinstance(spec, list):
+        values = [convert(name, value) for value in spec]
+    elif FIELD_TYPES[name] is not str and ":" in str(spec):
+        bounds = str(spec).split(":")
+        if len(bounds) not in (2, 3):
+            raise ValueError(f"{name}: a range is start:stop[:step], not {spec!r}")
+        return expand_range(name, *bounds)
+    else:
+        values = [convert(name, value) for value in str(spec).split(",")]
+    if not values:
+        raise ValueError(f"{name}: empty sweep")
+    return values
+
+
+def load_file(path: str) -> dict:
+    """Fields and sweeps of a JSON or TOML config file."""
+    if path.endswith(".toml"):
+        if tomli is None:
+            raise ValueError(f"{path}: TOML files need the tomli package")
+        with open(path, "rb") as file:
+            data = tomli.load(file)
+    else:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a table of fields")
+    return data
+
+
+class Grid:
+    """Base config and swept fields of the files generated from one config.
+
+    The variants are the cartesian product of the swept values, produced
+    one at a time.
+    """
+
+    def __init__(self, name: str, values: dict, sweeps: dict):
+        self.name = name
+        self.values = values
+        self.sweeps = sweeps
+
+    def __len__(self) -> int:
+        return math.prod(len(values) for values in self.sweeps.values())
+
+    def variants(
+        self, directory: str, template: Optional[str], compress: bool
+    ) -> Iterator[Variant]:
+        if template is None:
+            width = len(str(len(self) - 1))
+            template = "{name}" if not self.sweeps else "{name}-{index:0%dd}" % width
+        suffix = ".gcode.gz" if compress else ".gcode"
+        names = list(self.sweeps)
+        for index, combination in enumerate(product(*self.sweeps.values())):
+            swept = dict(zip(names, combination))
+            values = {**self.values, **swept}
+            try:
+                file_name = template.format(name=self.name, index=index, **values)
+            except (KeyError, IndexError, ValueError) as error:
+                yield Variant(
+                    f"{self.name} #{index}", swept, None, f"bad file name: {error!r}"
+                )
+                continue
+            path = os.path.join(directory, file_name + suffix)
+            try:
+                config = GcodeConfig(**values).freeze()
+            except (ArithmeticError, ValueError) as error:
+                yield Variant(path, swept, None, f"bad config: {error}")
+                continue
+            yield Variant(path, swept, config)
+
+
+def unique_paths(variants: Iterable[Variant]) -> Iterator[Variant]:
+    """Give variants that would overwrite an earlier file a numbered path.
+
+    Happens with a file name template that leaves out the swept fields, or
+    config files of the same name in different directories.
+    """
+    seen = set()
+    for variant in variants:
+        path = variant.path
+        if path in seen:
+            stem, suffix = _split_suffix(path)
+            number = 2
+            while f"{stem}-{number}{suffix}" in seen:
+                number += 1
+            path = f"{stem}-{number}{suffix}"
+            print(
+                f"retcal: {variant.path} is used twice, writing {path}", file=sys.stderr
+            )
+            variant = variant._replace(path=path)
+        seen.add(path)
+        yield variant
+
+
+def _split_suffix(path: str) -> tuple:
+    for suffix in (".gcode.gz", ".gcode"):
+        if path.endswith(suffix):
+            return path[: -len(suffix)], suffix
+    return path, ""
+
+
+def check_template(template: str):
+    """Raise ValueError if a file name template does not format."""
+    try:
+        template.format(name="calibration", index=0, **DEFAULTS)
+    except (KeyError, IndexError, ValueError) as error:
+        raise ValueError(f"bad file name template {template!r}: {error!r}")
+
+
+def build_grids(args) -> list:
+    """One grid per config file, or one from the defaults without files."""
+    flags = {
+        name: getattr(args, name)
+        for name in FIELD_NAMES
+        if getattr(args, name) is not None
+    }
+    flag_sweeps = dict(args.sweep)
+
+    sources = [
+        (os.path.splitext(os.path.basename(path))[0], load_file(path))
+        for path in args.configs
+    ]
+    if not sources:
+        sources = [("calibration", {})]
+
+    grids = []
+    for name, data in sources:
+        data = dict(data)
+        file_sweeps = data.pop(SWEEP_KEY, {})
+        unknown = set(data) - set(FIELD_NAMES)
+        if unknown:
+            raise ValueError(f"{name}: unknown fields {', '.join(sorted(unknown))}")
+        values = dict(DEFAULTS)
+        values.update((key, convert(key, value)) for key, value in data.items())
+        values.update(flags)
+        # Flags replace the values and sweeps of the files
+        sweeps = {
+            key: parse_sweep(key, spec)
+            for key, spec in file_sweeps.items()
+            if key not in flags
+        }
+        sweeps.update(flag_sweeps)
+        for key in sweeps:
+            values.pop(key, None)
+        grids.append(Grid(name, values, sweeps))
+    return grids
+
+
+def generate_file(
+    config: FrozenGcodeConfig, path: str, legacy: bool, compress: bool
+) -> int:
+    """Write the file of a config, returning its size before compression.
+
+    Runs in a pool process. The file is written next to its destination and
+    moved there once complete, so an interrupted run leaves no partial files.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        sink: Union[FileSink, GzipSink] = FileSink(temp_path)
+        if compress:
+            sink = GzipSink(sink)
+        with sink:
+            size = write_gcode(config, sink, legacy=legacy)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return size
+
+
+def _report(variant: Variant, size: Optional[int] = None):
+    """Print a line with the path of a file, its size and its swept values."""
+    columns = [variant.path]
+    if size is not None:
+        columns.append(str(size))
+    columns.extend(f"{name}={value}" for name, value in variant.swept.items())
+    print("\t".join(columns), flush=True)
+
+
+def _failed(variant: Variant, error) -> int:
+    print(f"{variant.path}: {error}", file=sys.stderr)
+    return 1
+
+
+def run(variants: Iterator[Variant], jobs: int, legacy: bool, compress: bool) -> int:
+    """Generate the variants, returning the number that failed."""
+    failed = 0
+    if jobs == 1:
+        for variant in variants:
+            if variant.config is None:
+                failed += _failed(variant, variant.error)
+                continue
+            try:
+                size = generate_file(variant.config, variant.path, legacy, compress)
+            except Exception as error:
+                failed += _failed(variant, error)
+            else:
+                _report(variant, size)
+        return failed
+
+    # Keep a few files queued per process, so the grid is only expanded as
+    # fast as it is generated
+    limit = jobs * QUEUED_PER_WORKER
+    pending: dict[Future, Variant] = {}
+    with ProcessPoolExecutor(jobs) as pool:
+        try:
+            for variant in variants:
+                if variant.config is None:
+                    failed += _failed(variant, variant.error)
+                    continue
+                if len(pending) >= limit:
+                    failed += _collect(pending, FIRST_COMPLETED)
+                future = pool.submit(
+                    generate_file, variant.config, variant.path, legacy, compress
+                )
+                pending[future] = variant
+            while pending:
+                failed += _collect(pending, FIRST_COMPLETED)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+    return failed
+
+
+def _collect(pending: dict[Future, Variant], return_when) -> int:
+    done, _ = wait(pending, return_when=return_when)
+    failed = 0
+    for future in done:
+        variant = pending.pop(future)
+        try:
+            size = future.result()
+        except Exception as error:
+            failed += _failed(variant, error)
+        else:
+            _report(variant, size)
+    return failed
+
+
+def _sweep_flag(text: str) -> tuple:
+    name, sep, spec = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected FIELD=VALUES, not {text!r}")
+    try:
+        return name, parse_sweep(name, spec)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+def _field_flag(name: str):
+    def parse(text: str):
+        try:
+            return convert(name, text)
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(str(error))
+
+    parse.__name__ = FIELD_TYPES[name].__name__
+    return parse
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="retcal",
+        usage="%(prog)s [options] [CONFIG ...]",
+        description="Generate retraction calibration gcode.",
+        epilog="Sweeps are FIELD=a,b,c or FIELD=start:stop[:step], stop included.",
+    )
+    parser.add_argument(
+        "configs", nargs="*", metavar="CONFIG", help="JSON or TOML config files"
+    )
+    parser.add_argument(
+        "-o", "--output", default=".", help="directory of the files (default: .)"
+    )
+    parser.add_argument(
+        "--name",
+        help="file name template, with {name} (the config file), {index} and the fields"
+        " (default: {name}, with -{index} for sweeps)",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="append",
+        default=[],
+        type=_sweep_flag,
+        metavar="FIELD=VALUES",
+        help="generate a file for each value of a field, may be repeated",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processes generating files (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--gzip", action="store_true", help="write gzip compressed files"
+    )
+    parser.add_argument(
+        "--legacy", action="store_true", help="use the web generator's format"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="list the files without writing them"
+    )
+
+    group = parser.add_argument_group("config fields")
+    for name in FIELD_NAMES:
+        group.add_argument(
+            "--" + name.replace("_", "-"),
+            dest=name,
+            type=_field_flag(name),
+            help=f"default: {DEFAULTS[name]}",
+        )
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        if args.name is not None:
+            check_template(args.name)
+        grids = build_grids(args)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    total = sum(len(grid) for grid in grids)
+
+    def variants():
+        for grid in grids:
+            yield from grid.variants(args.output, args.name, args.gzip)
+
+    try:
+        if args.dry_run:
+            failed = 0
+            for variant in unique_paths(variants()):
+                if variant.config is None:
+                    failed += _failed(variant, variant.error)
+                else:
+                    _report(variant)
+            return 1 if failed else 0
+        os.makedirs(args.output, exist_ok=True)
+        failed = run(
+            unique_paths(variants()), min(args.jobs, total), args.legacy, args.gzip
+        )
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # The reader of the listing went away, as with head
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    if failed:
+        print(f"retcal: {failed} of {total} files failed", file=sys.stderr)
+        return 1
+    return 0
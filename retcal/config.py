@@ -1,4 +1,9 @@
-from dataclasses import dataclass
+import hashlib
+import json
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+from .schedule import ParameterSchedule
 
 @dataclass
 class GcodeConfig:
@@ -36,3 +41,181 @@ class GcodeConfig:
         return (area * extrusion_length * 4) / (
             3.14159 * self.dilament_diameter ** 2 / self.extrusion_multiplier
         )
+
+    @property
+    def schedule(self) -> ParameterSchedule:
+        """Per-test parameters of the tower.
+
+        Built on every access; freeze the config to keep it around.
+        """
+        return ParameterSchedule(self)
+
+    def freeze(self) -> "FrozenGcodeConfig":
+        """Get an immutable, hashable copy of the config."""
+        return FrozenGcodeConfig(**asdict(self))
+
+
+FIELD_NAMES = tuple(field.name for field in fields(GcodeConfig))
+
+# Defaults of the GUI and web forms and of the command line, in GcodeConfig
+# units
+DEFAULTS = {
+    "retraction_dist_init": 0.5,
+    "retraction_dist_delta": 0.5,
+    "retraction_speed_init": 10.0,
+    "retraction_speed_delta": 10.0,
+    "hotend_temp_init": 210.0,
+    "hotend_temp_change": 0.0,
+    "fan_speed_init": 40,
+    "fan_speed_delta": 0,
+    "layer_height": 0.2,
+    "layers_per_test": 25,
+    "num_tests": 15,
+    "bed_shape_x": 220.0,
+    "bed_shape_y": 220.0,
+    "print_speed": 2400,
+    "travel_speed": 6000,
+    "nozzle_diameter": 0.4,
+    "dilament_diameter": 1.75,
+    "extrusion_multiplier": 1.0,
+    "bed_temp": 50.0,
+    "custom_gcode": ";G29",
+}
+
+# Largest number of E values memoized per frozen config
+E_VALUES_SIZE = 64
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenGcodeConfig:
+    """Immutable :class:`GcodeConfig` that can be used as a cache key.
+
+    Equality and hashing go through the canonical form of the config, so
+    ``2400`` and ``2400.0`` (which format differently) are different keys.
+    Derived values are computed once and kept on the instance.
+    """
+
+    __slots__ = FIELD_NAMES + (
+        "_canonical",
+        "_area",
+        "_e_denominator",
+        "_e_values",
+        "_schedule",
+    )
+
+    retraction_dist_init: float
+    retraction_dist_delta: float
+    retraction_speed_init: float
+    retraction_speed_delta: float
+    hotend_temp_init: float
+    hotend_temp_change: float
+    fan_speed_init: int
+    fan_speed_delta: int
+    layer_height: float
+    layers_per_test: int
+    num_tests: int
+    bed_shape_x: float
+    bed_shape_y: float
+    print_speed: int
+    travel_speed: int
+    nozzle_diameter: float
+    dilament_diameter: float
+    extrusion_multiplier: float
+    bed_temp: float
+    custom_gcode: str
+
+    # Derived values, set in __post_init__. Declared for type checkers only,
+    # as the dataclass would take annotations in the class body for fields
+    if TYPE_CHECKING:
+        _canonical: str
+        _area: float
+        _e_denominator: float
+        _e_values: Dict[float, float]
+        _schedule: Optional[ParameterSchedule]
+
+    def __post_init__(self):
+        area = (
+            self.nozzle_diameter - self.layer_height
+        ) * self.layer_height + 3.14159 * (self.layer_height / 2) ** 2
+        canonical = json.dumps(
+            {name: getattr(self, name) for name in FIELD_NAMES},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        object.__setattr__(self, "_canonical", canonical)
+        object.__setattr__(self, "_area", area)
+        object.__setattr__(
+            self,
+            "_e_denominator",
+            3.14159 * self.dilament_diameter ** 2 / self.extrusion_multiplier,
+        )
+        object.__setattr__(self, "_e_values", {})
+        object.__setattr__(self, "_schedule", None)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenGcodeConfig):
+            return NotImplemented
+        return self._canonical == other._canonical
+
+    def __hash__(self):
+        return hash(self._canonical)
+
+    def __reduce__(self):
+        # Slots and frozen setattr keep the default pickling from working
+        return (type(self), tuple(getattr(self, name) for name in FIELD_NAMES))
+
+    @property
+    def canonical(self) -> str:
+        """Canonical JSON form of the config."""
+        return self._canonical
+
+    def canonical_hash(self) -> str:
+        """SHA-256 of the canonical form, stable across processes."""
+        return hashlib.sha256(self._canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def extrusion_area(self) -> float:
+        """Cross-sectional area of an extruded line in mm^2."""
+        return self._area
+
+    @property
+    def e_per_mm(self) -> float:
+        """Filament length fed per mm of extruded line."""
+        return self.get_e_value(1)
+
+    def get_e_value(self, extrusion_length):
+        """Generate an E value for an extrusion length.
+
+        Same formula as :meth:`GcodeConfig.get_e_value`, with the area and
+        the results memoized. The generator only asks for a few lengths, the
+        memo is emptied if callers ask for more.
+        """
+        try:
+            return self._e_values[extrusion_length]
+        except KeyError:
+            value = (self._area * extrusion_length * 4) / self._e_denominator
+            if len(self._e_values) >= E_VALUES_SIZE:
+                self._e_values.clear()
+            self._e_values[extrusion_length] = value
+            return value
+
+    @property
+    def schedule(self) -> ParameterSchedule:
+        """Per-test parameters of the tower, built on first use."""
+        schedule = self._schedule
+        if schedule is None:
+            schedule = ParameterSchedule(self)
+            object.__setattr__(self, "_schedule", schedule)
+        return schedule
+
+    def freeze(self) -> "FrozenGcodeConfig":
+        """The config is already frozen."""
+        return self
+
+    def thaw(self) -> GcodeConfig:
+        """Get a mutable copy of the config."""
+        return GcodeConfig(**asdict(self))
+
+
+# Either kind of config, for functions that freeze what they are given
+AnyGcodeConfig = Union[GcodeConfig, FrozenGcodeConfig]
@@ -0,0 +1,128 @@
+"""Print time, filament use and file size of a config, without generating it.
+
+Every move of the calibration print is known from the config: the raft is a
+fixed zigzag and every tower layer the same square of sides, markers and
+retractions. So the time and filament follow from a handful of products and
+one sum over the tests, and the size comes from :func:`~retcal.predict.predict_size`.
+
+The time is the length of each move over its feedrate. Acceleration,
+heating and homing are left out, so printers take somewhat longer.
+"""
+import math
+from typing import NamedTuple
+
+from .calibration_tower import MARKERS, SIDES
+from .config import AnyGcodeConfig
+from .predict import predict_size
+
+# Density of PLA in g/cm^3, to weigh the filament
+PLA_DENSITY = 1.24
+
+# Raft: lines of each of its two layers, their length and the step between them
+RAFT_LINES = 60
+RAFT_LINE_LENGTH = 60
+RAFT_STEP = 1
+
+# Length of the tower moves of a layer: extruded sides and travel after each
+SIDE_LENGTH = 10
+SIDES_LENGTH = SIDE_LENGTH * 4 * len(SIDES)
+TRAVEL_LENGTH = SIDE_LENGTH * 2 * 4 * len(SIDES)
+MARKERS_LENGTH = sum(abs(int(move[1:])) for marker in MARKERS for move in marker)
+
+# Feedrate and length of the filament primed by the start gcode
+PRIME_FEEDRATE = 200
+PRIME_LENGTH = 1
+# Height of the first move of the raft, at the priming feedrate
+RAFT_LIFT = 2
+# Height the end gcode lifts the nozzle by
+END_LIFT = 5
+
+
+class Estimate(NamedTuple):
+    seconds: float
+    filament_mm: float
+    filament_g: float
+    lines: int
+    bytes: int
+
+
+def _minutes(length: float, feedrate: float) -> float:
+    return length / feedrate
+
+
+def print_minutes(config: AnyGcodeConfig) -> float:
+    """Time of every move at its feedrate, in minutes.
+
+    Raises ValueError if a feedrate of the print is not positive.
+    """
+    frozen = config.freeze()
+    layer_height = frozen.layer_height
+    travel_speed = frozen.travel_speed
+    print_speed = frozen.print_speed
+    raft_speed = print_speed // 2
+    feedrates = frozen.schedule.retraction_feedrate
+    if raft_speed <= 0 or travel_speed <= 0 or (len(feedrates) and min(feedrates) <= 0):
+        raise ValueError("The print, travel and retraction speeds must be positive")
+
+    # Prime, lift, and travel from home to the corner of the raft
+    x = frozen.bed_shape_x / 2 - 30
+    y = frozen.bed_shape_y / 2 - 30
+    minutes = _minutes(PRIME_LENGTH + RAFT_LIFT, PRIME_FEEDRATE)
+    minutes += _minutes(math.sqrt(x * x + y * y + (RAFT_LIFT - layer_height) ** 2), travel_speed)
+
+    # Two raft layers, the move up between them and the move to the tower
+    raft_length = RAFT_LINES * RAFT_LINE_LENGTH
+    minutes += 2 * (_minutes(raft_length, raft_speed) + _minutes(RAFT_LINES * RAFT_STEP, travel_speed))
+    minutes += _minutes(2 * layer_height, travel_speed)
+    minutes += _minutes(math.hypot(RAFT_LINES * RAFT_STEP, layer_height), travel_speed)
+    corner = RAFT_LINE_LENGTH - 5
+    minutes += _minutes(math.sqrt(corner * corner + 25 + layer_height * layer_height), travel_speed)
+
+    # Tower: the retractions and the move up of a layer go at the feedrate of
+    # the test, the rest of the layer does not change between tests
+    layers = frozen.layers_per_test
+    tests = frozen.num_tests
+    layer = _minutes(SIDES_LENGTH, print_speed) + _minutes(TRAVEL_LENGTH, travel_speed)
+    minutes += tests * layers * layer + tests * _minutes(MARKERS_LENGTH, print_speed)
+    retracted = 2 * sum(frozen.schedule.retraction_distances) + layer_height
+    minutes += layers * sum(retracted / feedrate for feedrate in feedrates)
+
+    # The end lifts at the last feedrate used
+    last = feedrates[-1] if tests > 0 and layers > 0 else travel_speed
+    return minutes + _minutes(END_LIFT, last)
+
+
+def filament_length(config: AnyGcodeConfig) -> float:
+    """Length of filament extruded, in mm. Retractions are undone."""
+    frozen = config.freeze()
+    # The raft feeds a line's worth of filament for the travel after every
+    # other line too, extruded with the next line, and none for the last one
+    raft = (3 * RAFT_LINES - 1) * frozen.get_e_value(RAFT_LINE_LENGTH)
+    tests = frozen.num_tests
+    tower = tests * frozen.layers_per_test * 4 * len(SIDES) * frozen.get_e_value(SIDE_LENGTH)
+    markers = tests * sum(len(marker) for marker in MARKERS) * frozen.get_e_value(1)
+    return PRIME_LENGTH + raft + tower + markers
+
+
+def filament_mass(config: AnyGcodeConfig, length: float, density: float = PLA_DENSITY) -> float:
+    """Mass in g of a length of filament in mm."""
+    radius = config.dilament_diameter / 2
+    return length * math.pi * radius * radius / 1000 * density
+
+
+def estimate(config: AnyGcodeConfig, legacy: bool = False) -> Estimate:
+    """Print time, filament and size of the gcode of a config.
+
+    Raises ValueError if a feedrate is not positive, and ArithmeticError if
+    the filament diameter is 0.
+    """
+    frozen = config.freeze()
+    length = filament_length(frozen)
+    size = predict_size(frozen, legacy)
+    return Estimate(
+        print_minutes(frozen) * 60,
+        length,
+        filament_mass(frozen, length),
+        size.lines,
+        size.bytes,
+    )
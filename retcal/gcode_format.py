@@ -0,0 +1,78 @@
+"""Fixed-point number formatting for gcode.
+
+Values are rounded half to even on their exact binary value, which gives the
+same text as ``format(value, ".Nf")`` and as ``round(Decimal(value), N)``.
+Formatted values are kept in a lookup table, so the small set of numbers that
+recur on almost every line (retraction distances, feedrates, E values) is
+formatted once. Numbers already held as scaled integers (a count of
+``10**-precision`` units) can be formatted without going through a float.
+"""
+from functools import lru_cache
+from typing import Iterable
+
+# Largest number of entries kept in a formatter's lookup table
+TABLE_SIZE = 4096
+
+
+class FixedPointFormatter:
+    """Format numbers with a fixed number of decimal places."""
+
+    __slots__ = ("precision", "spec", "table", "table_size")
+
+    def __init__(self, precision: int, table_size: int = TABLE_SIZE):
+        if precision < 0:
+            raise ValueError("precision must not be negative")
+        self.precision = precision
+        self.spec = f".{precision}f"
+        self.table: dict[float, str] = {}
+        self.table_size = table_size
+
+    def __call__(self, value: float) -> str:
+        """Format a value, going through the lookup table."""
+        # 0.0 and -0.0 share a table key but not their text
+        if value:
+            try:
+                return self.table[value]
+            except KeyError:
+                pass
+
+        text = format(value, self.spec)
+        if value:
+            if len(self.table) >= self.table_size:
+                self.table.clear()
+            self.table[value] = text
+        return text
+
+    def preload(self, values: Iterable[float]):
+        """Add recurring values to the lookup table."""
+        for value in values:
+            self(value)
+
+    def scaled(self, value: float) -> int:
+        """Exact value in units of ``10**-precision``, rounded half to even."""
+        numerator, denominator = value.as_integer_ratio()
+        units, remainder = divmod(abs(numerator) * 10 ** self.precision, denominator)
+        if 2 * remainder > denominator or (
+            2 * remainder == denominator and units & 1
+        ):
+            units += 1
+        return -units if numerator < 0 else units
+
+    def format_scaled(self, units: int, negative: bool = False) -> str:
+        """Format a number given in units of ``10**-precision``."""
+        sign = "-" if negative or units < 0 else ""
+        units = abs(units)
+        if not self.precision:
+            return f"{sign}{units}"
+        whole, fraction = divmod(units, 10 ** self.precision)
+        return f"{sign}{whole}.{fraction:0{self.precision}d}"
+
+    def format(self, value: float) -> str:
+        """Format a one-off value without touching the lookup table."""
+        return format(value, self.spec)
+
+
+@lru_cache(maxsize=None)
+def get_formatter(precision: int) -> FixedPointFormatter:
+    """Shared formatter for a precision."""
+    return FixedPointFormatter(precision)
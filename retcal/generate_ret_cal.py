@@ -1,6 +1,49 @@
-from .config import GcodeConfig
+from functools import lru_cache, partial
+from typing import Callable, Iterator, Optional
+
+from .config import AnyGcodeConfig
+from .gcode_format import get_formatter
+from .sinks import GcodeSink
+from .stats import GenerationStats
 from .calibration_header import generate_header
-from .calibration_tower import layer_group
+from .calibration_tower import (
+    E_PRECISION,
+    START_LAYER,
+    layer_body,
+    layer_group_bytes,
+    layer_group_layers,
+    layer_sides,
+    tower_layers,
+)
+from .legacy import (
+    legacy_header,
+    legacy_layer_body,
+    legacy_layer_group_bytes,
+    legacy_layer_group_layers,
+    legacy_layer_sides,
+    legacy_raft_gcode,
+    legacy_start_gcode,
+)
+
+# Target size of the byte chunks produced by iter_retraction_calibration_bytes
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Number of distinct rafts kept by the raft cache
+RAFT_CACHE_SIZE = 64
+
+# Switch to relative movements before the tower
+RELATIVE_MOVES = ["M83", "G91"]
+
+# Called with the number of tower layers done and the total
+Progress = Callable[[int, int], None]
+
+# Tower layer caches, by name
+LAYER_CACHES = {
+    "layer_sides": layer_sides,
+    "layer_body": layer_body,
+    "legacy_layer_sides": legacy_layer_sides,
+    "legacy_layer_body": legacy_layer_body,
+}
 
 def start_gcode(config) -> list[str]:
     """Gcode to start a print"""
@@ -23,22 +66,43 @@ def start_gcode(config) -> list[str]:
     ]
 
 
+def raft_inputs(config) -> tuple:
+    """Values the raft depends on, used as the raft cache key"""
+    return (
+        config.bed_shape_x,
+        config.bed_shape_y,
+        config.layer_height,
+        config.travel_speed,
+        config.print_speed,
+        config.get_e_value(60),
+    )
+
+
 def raft_gcode(config) -> list[str]:
     """Generate raft Gcode"""
-    xpos = config.bed_shape_x / 2 - 30
-    ypos = config.bed_shape_y / 2 - 30
-    zpos = config.layer_height
+    return list(raft_lines(*raft_inputs(config)))
+
+
+@lru_cache(maxsize=RAFT_CACHE_SIZE, typed=True)
+def raft_lines(
+    bed_shape_x, bed_shape_y, layer_height, travel_speed, print_speed, e_raft
+) -> tuple[str, ...]:
+    """The raft, rendered once per set of inputs"""
+    xpos = bed_shape_x / 2 - 30
+    ypos = bed_shape_y / 2 - 30
+    zpos = layer_height
     epos = 0
 
     gcode = [
         "; Start Movement",
         ";",
         "G1 Z2",
-        f"G1 F{config.travel_speed} X{xpos} Y{ypos} Z{zpos}",
+        f"G1 F{travel_speed} X{xpos} Y{ypos} Z{zpos}",
         ";",
     ]
     # Overextruding Raft
-    e_raft = config.get_e_value(60)
+    fmt_e = get_formatter(E_PRECISION)
+    fmt_z = get_formatter(2)
 
     remx = xpos
     remy = ypos
@@ -47,23 +111,23 @@ def raft_gcode(config) -> list[str]:
     gcode.append("; Layer 1")
     for _ in range(30):
         epos += e_raft
-        gcode.append(f"G1 F{config.print_speed//2} X{xpos+60} Y{ypos} E{epos:.5f}")
+        gcode.append(f"G1 F{print_speed//2} X{xpos+60} Y{ypos} E{fmt_e.format(epos)}")
         xpos += 60
         epos += e_raft
-        gcode.append(f"G0 F{config.travel_speed} X{xpos} Y{ypos+1}")
+        gcode.append(f"G0 F{travel_speed} X{xpos} Y{ypos+1}")
         ypos += 1
-        gcode.append(f"G1 F{config.print_speed//2} X{xpos-60} Y{ypos} E{epos:.5f}")
+        gcode.append(f"G1 F{print_speed//2} X{xpos-60} Y{ypos} E{fmt_e.format(epos)}")
         xpos -= 60
         epos += e_raft
-        gcode.append(f"G0 F{config.travel_speed} X{xpos} Y{ypos+1}")
+        gcode.append(f"G0 F{travel_speed} X{xpos} Y{ypos+1}")
         ypos += 1
 
     # Bring back to raft origin
     gcode.append(
-        f"G0 F{config.travel_speed} X{xpos} Y{ypos} Z{config.layer_height*3:.2f}"
+        f"G0 F{travel_speed} X{xpos} Y{ypos} Z{fmt_z(layer_height*3)}"
     )
     gcode.append(
-        f"G0 F{config.travel_speed} X{remx} Y{remy} Z{config.layer_height+config.layer_height}"
+        f"G0 F{travel_speed} X{remx} Y{remy} Z{layer_height+layer_height}"
     )
     xpos = remx
     ypos = remy
@@ -72,53 +136,227 @@ def raft_gcode(config) -> list[str]:
     gcode.append(";Layer 2")
     for _ in range(30):
         epos += e_raft
-        gcode.append(f"G1 F{config.print_speed//2} X{xpos} Y{ypos+60} E{epos:.5f}")
+        gcode.append(f"G1 F{print_speed//2} X{xpos} Y{ypos+60} E{fmt_e.format(epos)}")
         ypos += 60
         epos += e_raft
-        gcode.append(f"G0 F{config.travel_speed} X{xpos+1} Y{ypos}")
+        gcode.append(f"G0 F{travel_speed} X{xpos+1} Y{ypos}")
         xpos += 1
-        gcode.append(f"G1 F{config.print_speed//2} X{xpos} Y{ypos-60} E{epos:.5f}")
+        gcode.append(f"G1 F{print_speed//2} X{xpos} Y{ypos-60} E{fmt_e.format(epos)}")
         ypos -= 60
         epos += e_raft
-        gcode.append(f"G0 F{config.travel_speed} X{xpos+1} Y{ypos}")
+        gcode.append(f"G0 F{travel_speed} X{xpos+1} Y{ypos}")
         xpos += 1
 
     # Bring back to Calibration Starting Position
     gcode.append(
-        f"G0 F{config.travel_speed} X{remx+5} Y{remy+5} Z{config.layer_height*3:.2f}"
+        f"G0 F{travel_speed} X{remx+5} Y{remy+5} Z{fmt_z(layer_height*3)}"
     )
 
-    return gcode
+    return tuple(gcode)
 
 
+def end_gcode() -> list[str]:
+    """Gcode to end a print"""
+    return [
+        "G1 Z5",  # Raise 5mm
+        "G90",  # Absolute Position
+        "G28 X0 Y0",  # Home X Y
+        "M84",  # Turn off Steppers
+        "M107",  # Turn off Fan
+        "M104 S0",  # Turn off Hotend
+        "M140 S0",  # Turn off Bed
+    ]
+
+
+def fixed_sections(
+    config: AnyGcodeConfig, legacy: bool = False
+) -> dict[str, Callable[[], list[str]]]:
+    """Functions producing the lines of the sections around the tower.
 
-def generate_retraction_calibration(config: GcodeConfig) -> list[str]:
-    """Get the full set of gcode for the retraction calibration test."""
-    gcode = [f";{line}" for line in generate_header(config)]
+    Keyed by section name: ``"header"``, ``"start"``, ``"raft"`` and
+    ``"end"``. None of them grows with the height of the tower.
+    """
+    if legacy:
+        return {
+            "header": partial(legacy_header, config),
+            "start": partial(legacy_start_gcode, config),
+            "raft": partial(legacy_raft_gcode, config),
+            "end": end_gcode,
+        }
+    return {
+        "header": lambda: [f";{line}" for line in generate_header(config)],
+        "start": partial(start_gcode, config),
+        "raft": partial(raft_gcode, config),
+        "end": end_gcode,
+    }
+
+
+def gcode_sections(
+    config: AnyGcodeConfig, legacy: bool = False, progress: Optional[Progress] = None
+) -> Iterator[tuple[str, list[str]]]:
+    """Yield the retraction calibration test as ``(section, lines)`` pairs.
+
+    Sections are produced lazily in print order: ``"header"``, ``"start"``,
+    ``"raft"``, ``"tower"`` (once for the relative movement switch, then once
+    per layer) and ``"end"``. At most one layer is held in memory at a time.
+    The config is frozen first so derived values are only computed once.
+
+    With ``legacy`` set the output matches the original web generator byte
+    for byte (see :mod:`retcal.legacy`). ``progress`` is called after each
+    tower layer with the layers done so far and the total.
+    """
+    frozen = config.freeze()
+    layers = legacy_layer_group_layers if legacy else layer_group_layers
+    fixed = fixed_sections(frozen, legacy)
+
+    yield "header", fixed["header"]()
 
     # Print out starting gcode
-    gcode.extend(start_gcode(config))
+    yield "start", fixed["start"]()
 
     # Write raft gcode to file
-    gcode.extend(raft_gcode(config))
+    yield "raft", fixed["raft"]()
 
     # Relative Movements
-    gcode.extend(["M83", "G91"])
+    yield "tower", RELATIVE_MOVES
 
     # Tower
-    for test_num in range(config.num_tests):
-        gcode.extend(layer_group(config, test_num, 3))
+    total = tower_layers(frozen)
+    done = 0
+    for test_num in range(frozen.num_tests):
+        for layer in layers(frozen, test_num, START_LAYER):
+            yield "tower", layer
+            if progress is not None:
+                done += 1
+                progress(done, total)
 
     # Ending Gcode
-    end_gcode = [
-        "G1 Z5",  # Raise 5mm
-        "G90",  # Absolute Position
-        "G28 X0 Y0",  # Home X Y
-        "M84",  # Turn off Steppers
-        "M107",  # Turn off Fan
-        "M104 S0",  # Turn off Hotend
-        "M140 S0",  # Turn off Bed
-    ]
-    gcode.extend(end_gcode)
+    yield "end", fixed["end"]()
+
+
+def encoded_sections(
+    config: AnyGcodeConfig, legacy: bool = False, progress: Optional[Progress] = None
+) -> Iterator[tuple[str, bytes]]:
+    """Yield the retraction calibration test as ``(section, data)`` pairs.
+
+    Same order as :func:`gcode_sections`, but already UTF-8 encoded. Tower
+    layers after the first of each block are served from the layer cache,
+    so only their layer comment is formatted.
+    """
+    frozen = config.freeze()
+    layers = legacy_layer_group_bytes if legacy else layer_group_bytes
+    fixed = fixed_sections(frozen, legacy)
+
+    yield "header", _encode(fixed["header"]())
+    yield "start", _encode(fixed["start"]())
+    yield "raft", _encode(fixed["raft"]())
+    yield "tower", _encode(RELATIVE_MOVES)
+
+    total = tower_layers(frozen)
+    for test_num in range(frozen.num_tests):
+        done = test_num * frozen.layers_per_test
+        for index, data in enumerate(layers(frozen, test_num, START_LAYER)):
+            yield "tower", data
+            if progress is not None:
+                # The first layer of a block comes whole, the others in three
+                # parts: the layer comment, the body and the Z move
+                progress(done + (index + 3) // 3, total)
+
+    yield "end", _encode(fixed["end"]())
+
+
+def clear_layer_caches():
+    """Drop every cached tower layer, and the cached rafts."""
+    for cached in LAYER_CACHES.values():
+        cached.cache_clear()
+    raft_lines.cache_clear()
+
+
+def _encode(lines: list[str]) -> bytes:
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def iter_retraction_calibration(
+    config: AnyGcodeConfig,
+    legacy: bool = False,
+    stats: Optional[GenerationStats] = None,
+    progress: Optional[Progress] = None,
+) -> Iterator[str]:
+    """Iterate over the lines of the retraction calibration test.
+
+    If ``stats`` is given it is filled in while the lines are generated.
+    ``progress`` is passed on to :func:`gcode_sections`.
+    """
+    sections = gcode_sections(config, legacy, progress)
+    if stats is not None:
+        sections = stats.track(sections, LAYER_CACHES)
+    for _, lines in sections:
+        yield from lines
+
+
+def iter_retraction_calibration_bytes(
+    config: AnyGcodeConfig,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    legacy: bool = False,
+    stats: Optional[GenerationStats] = None,
+    progress: Optional[Progress] = None,
+) -> Iterator[bytes]:
+    """Iterate over the encoded retraction calibration test.
+
+    Lines are newline terminated, UTF-8 encoded and batched into chunks of
+    roughly ``chunk_size`` bytes so they can be written straight to a file or
+    socket. If ``stats`` is given it is filled in while the chunks are
+    generated. ``progress`` is passed on to :func:`encoded_sections`.
+    """
+    sections = encoded_sections(config, legacy, progress)
+    if stats is not None:
+        sections = stats.track(sections, LAYER_CACHES)
+    chunk = []
+    size = 0
+    for _, data in sections:
+        chunk.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield b"".join(chunk)
+
+
+def write_gcode(
+    config: AnyGcodeConfig,
+    *sinks: GcodeSink,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    legacy: bool = False,
+    stats: Optional[GenerationStats] = None,
+    progress: Optional[Progress] = None,
+) -> int:
+    """Generate the retraction calibration test into one or more sinks.
+
+    Each chunk is generated once and handed to every sink. The sinks are
+    not closed. Returns the number of bytes written.
+    """
+    size = 0
+    chunks = iter_retraction_calibration_bytes(
+        config, chunk_size, legacy, stats, progress
+    )
+    for chunk in chunks:
+        for sink in sinks:
+            sink.write(chunk)
+        size += len(chunk)
+    return size
+
+
+def generate_retraction_calibration(
+    config: AnyGcodeConfig,
+    legacy: bool = False,
+    stats: Optional[GenerationStats] = None,
+) -> list[str]:
+    """Get the full set of gcode for the retraction calibration test.
 
-    return gcode
+    Pass a :class:`~retcal.stats.GenerationStats` as ``stats`` to have it
+    filled in with the timings and counters of the generation.
+    """
+    return list(iter_retraction_calibration(config, legacy, stats))
@@ -0,0 +1,352 @@
+"""Gcode in the exact format of the original web generator.
+
+The web service used to carry its own hand-unrolled copy of the generator.
+These functions reproduce its output byte for byte (including the 1.25x raft
+over-extrusion, the reversed variables table and the ``Decimal`` rounding) so
+printers keep receiving the same files, but every distinct number is only
+formatted once per block instead of once per line, through the fixed-point
+formatter rather than ``Decimal``.
+"""
+import math
+from decimal import Decimal
+from functools import lru_cache
+from typing import Iterator
+
+from .calibration_header import GENERATOR_TITLE
+from .config import AnyGcodeConfig
+from .gcode_format import get_formatter
+from .calibration_tower import LAYER_CACHE_SIZE, MARKERS, SIDES
+
+# Raft extrusion multiplier used by the web generator
+RAFT_OVER_EXTRUSION = 1.25
+
+
+def _round(value: float, places: int) -> str:
+    """Round a float the way the web generator did.
+
+    ``round(Decimal(value), places)`` rounds the exact binary value half to
+    even, which is what the fixed-point formatter does as well.
+    """
+    return get_formatter(places)(value)
+
+
+def _per_second(feedrate: float) -> float:
+    """Recover the mm/s speed entered in the form from a mm/min feedrate.
+
+    ``feedrate / 60`` does not always round-trip, so pick the neighbouring
+    float with the shortest representation that multiplies back exactly.
+    """
+    speed = feedrate / 60
+    candidates = [
+        value
+        for value in (
+            math.nextafter(speed, -math.inf),
+            speed,
+            math.nextafter(speed, math.inf),
+        )
+        if value * 60 == feedrate
+    ]
+    return min(candidates, key=lambda value: len(repr(value)), default=speed)
+
+
+def legacy_header_row(
+    config: AnyGcodeConfig, speed: float, temp: float, fan: float
+) -> str:
+    """Row of the variables of a test in the web generator's header."""
+    return (
+        f";{config.layers_per_test} layers"
+        + f"      {_round(speed, 2)}"
+        + f"      {_round(temp, 2)}"
+        + f"      {_round(fan, 2)}"
+    )
+
+
+def legacy_header(config: AnyGcodeConfig) -> list[str]:
+    """Header block of the web generator."""
+    schedule = config.schedule
+    dist = [_round(value, 2) for value in schedule.retraction_distances]
+    bars = ";\t\t|\t\t|\t\t|\t\t|"
+    gap = " " * 31
+
+    header = [
+        f";{GENERATOR_TITLE}",
+        ";",
+        ";",
+        ";Retraction Distance from the top looking down",
+        ";",
+        f";       {dist[11]}    {dist[10]}    {dist[9]}    {dist[8]}",
+        bars,
+        ";",
+        f";{dist[12]}-{gap}-{dist[7]}",
+        ";",
+        ";",
+        f";{dist[13]}-{gap}-{dist[6]}",
+        ";",
+        ";",
+        f";{dist[14]}-{gap}-{dist[5]}",
+        ";",
+        ";",
+        f";{dist[15]}-{gap}-{dist[4]}",
+        ";",
+        bars,
+        f";       {dist[0]}    {dist[1]}    {dist[2]}    {dist[3]}",
+        ";",
+        ";",
+        ";Variables by Height",
+        ";",
+        ";Height         Retraction  Nozzle      Fan",
+        ";               Speed       Temp        Speed",
+        ";",
+    ]
+
+    # Rows are listed from the top of the tower down
+    for test in range(config.num_tests - 1, -1, -1):
+        header.append(
+            legacy_header_row(
+                config,
+                schedule.retraction_speed[test],
+                schedule.hotend_temp[test],
+                schedule.fan_speed[test],
+            )
+        )
+
+    header.extend(
+        [
+            ";",
+            ";",
+            ";All inputs",
+            ";",
+            f";Dimension X \t\t\t\t\t{int(config.bed_shape_x)}",
+            f";Dimension Y \t\t\t\t\t{int(config.bed_shape_y)}",
+            f";Starting Retraction Distance\t{float(config.retraction_dist_init)}",
+            f";Increment Retraction \t\t\t{float(config.retraction_dist_delta)}",
+            f";Start Retraction Speed \t\t{float(config.retraction_speed_init)}",
+            f";Retraction Speed Increment \t{float(config.retraction_speed_delta)}",
+            f";Print Speed \t\t\t\t\t{_per_second(config.print_speed)}",
+            f";Starting Temp \t\t\t\t\t{int(config.hotend_temp_init)}",
+            f";Increment Temp \t\t\t\t{int(config.hotend_temp_change)}",
+            f";Bed Temp \t\t\t\t\t\t{int(config.bed_temp)}",
+            f";Fan Speed \t\t\t\t\t\t{int(config.fan_speed_init)}",
+            f";Fan Speed Increment \t\t\t{int(config.fan_speed_delta)}",
+            f";Nozzle Diameter \t\t\t\t{float(config.nozzle_diameter)}",
+            f";Layer Height \t\t\t\t\t{float(config.layer_height)}",
+            f";Filament Diameter \t\t\t\t{float(config.dilament_diameter)}",
+            f";Extrusion Multiplier \t\t\t{float(config.extrusion_multiplier)}",
+            f";Layers Per Test                {float(config.layers_per_test)}",
+            f";Number of Tests                {float(config.num_tests)}",
+            ";",
+            ";",
+        ]
+    )
+
+    return header
+
+
+def legacy_start_gcode(config: AnyGcodeConfig) -> list[str]:
+    """Start gcode of the web generator."""
+    return [
+        ";Start Gcode",
+        f"M140 S{int(config.bed_temp)}",
+        "M105",
+        f"M190 S{int(config.bed_temp)}",
+        f"M104 S{int(config.hotend_temp_init)}",
+        "M105",
+        f"M109 S{int(config.hotend_temp_init)}",
+        "M82",
+        "G28",
+        "G92 E0",
+        "G1 F200 E1",
+        "G92 E0",
+        f"{config.custom_gcode}",
+        ";",
+        ";",
+    ]
+
+
+def legacy_raft_gcode(config: AnyGcodeConfig) -> list[str]:
+    """Over-extruded two layer raft of the web generator."""
+    lh = float(config.layer_height)
+    xpos = config.bed_shape_x / 2 - 30
+    ypos = config.bed_shape_y / 2 - 30
+    travel = f"G0 F{int(config.travel_speed)}"
+    extrude = f"G1 F{int(config.print_speed / 2)}"
+    fmt_e = get_formatter(5)
+
+    gcode = [
+        ";Start Movement",
+        ";",
+        "G1 Z2",
+        f"G1 F{int(config.travel_speed)} X{xpos} Y{ypos} Z{lh}",
+        ";",
+    ]
+
+    # Overextruding Raft
+    e_increase = config.get_e_value(60) * RAFT_OVER_EXTRUSION
+    e_value = e_increase
+
+    remx = xpos
+    remy = ypos
+
+    # Horizontal
+    gcode.append(";Layer 1")
+    for _ in range(30):
+        gcode.append(f"{extrude} X{xpos+60} Y{ypos} E{fmt_e.format(e_value)}")
+        xpos = xpos + 60
+        e_value = e_value + e_increase
+        gcode.append(f"{travel} X{xpos} Y{ypos+1}")
+        ypos = ypos + 1
+        gcode.append(f"{extrude} X{xpos-60} Y{ypos} E{fmt_e.format(e_value)}")
+        xpos = xpos - 60
+        e_value = e_value + e_increase
+        gcode.append(f"{travel} X{xpos} Y{ypos+1}")
+        ypos = ypos + 1
+
+    # Bring back to raft origin
+    gcode.append(f"{travel} X{xpos} Y{ypos} Z{_round(lh*3, 2)}")
+    gcode.append(f"{travel} X{remx} Y{remy} Z{lh+lh}")
+    xpos = remx
+    ypos = remy
+
+    # Vertical
+    gcode.append(";Layer 2")
+    for _ in range(30):
+        gcode.append(f"{extrude} X{xpos} Y{ypos+60} E{fmt_e.format(e_value)}")
+        ypos = ypos + 60
+        e_value = e_value + e_increase
+        gcode.append(f"{travel} X{xpos+1} Y{ypos}")
+        xpos = xpos + 1
+        gcode.append(f"{extrude} X{xpos} Y{ypos-60} E{fmt_e.format(e_value)}")
+        ypos = ypos - 60
+        e_value = e_value + e_increase
+        gcode.append(f"{travel} X{xpos+1} Y{ypos}")
+        xpos = xpos + 1
+
+    # Bring back to Calibration Starting Position
+    gcode.append(f"{travel} X{remx+5} Y{remy+5} Z{_round(lh*3, 2)}")
+
+    return gcode
+
+
+def legacy_layer_inputs(config: AnyGcodeConfig, big_section_num: int) -> tuple:
+    """Values a web generator layer body depends on, used as the cache key"""
+    schedule = config.schedule
+    return (
+        int(config.print_speed),
+        int(config.travel_speed),
+        config.get_e_value(10),
+        schedule.retraction_feedrate[big_section_num],
+        schedule.retraction_distances,
+    )
+
+
+@lru_cache(maxsize=LAYER_CACHE_SIZE, typed=True)
+def legacy_layer_sides(
+    print_speed, travel_speed, e_value, f_value, distances
+) -> tuple[tuple[str, ...], ...]:
+    """The four sides of a tower layer, each followed by its closing move."""
+    e_value = _round(e_value, 5)
+    f_value = _round(f_value, 2)
+
+    sides = []
+    for side, (move, travel_1, travel_2) in enumerate(SIDES):
+        extrude = f"G1 F{print_speed} {move} E{e_value}"
+        gcode = []
+        for value in distances[side * 4 : side * 4 + 4]:
+            dist = _round(value, 2)
+            gcode.extend(
+                [
+                    extrude,
+                    f"G1 E{_round(-value, 2)} F{f_value}",
+                    f"G0 F{travel_speed} {travel_1}",
+                    f"G0 F{travel_speed} {travel_2}",
+                    f"G1 E{dist} F{f_value}",
+                ]
+            )
+        gcode.append(extrude)
+        sides.append(tuple(gcode))
+
+    return tuple(sides)
+
+
+@lru_cache(maxsize=LAYER_CACHE_SIZE, typed=True)
+def legacy_layer_body(*inputs) -> bytes:
+    """Encoded body of a web generator layer"""
+    return "".join(
+        f"{line}\n" for side in legacy_layer_sides(*inputs) for line in side
+    ).encode("utf-8")
+
+
+def legacy_layer_settings(config: AnyGcodeConfig, big_section_num: int) -> list[str]:
+    """Fan and hotend settings at the start of a block of the web generator"""
+    schedule = config.schedule
+    # The fan value is scaled in Decimal arithmetic before rounding
+    fan = Decimal(schedule.fan_speed[big_section_num])
+    temp = schedule.hotend_temp[big_section_num]
+    return [
+        f"M106 S{round(fan * 255 / 100, 0)}",
+        f"M104 S{_round(temp, 0)}",
+    ]
+
+
+def legacy_layer_numbers(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> range:
+    """Numbers in the layer comments of the layers after the first of a block"""
+    layer = start_layer + big_section_num * config.layers_per_test
+    return range(layer + 1, layer + config.layers_per_test)
+
+
+def legacy_z_up(config: AnyGcodeConfig) -> str:
+    """Move up by one layer height, as written by the web generator"""
+    return f"G1 Z{float(config.layer_height)}"
+
+
+def legacy_first_layer(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> list[str]:
+    """First layer of a block of the web generator, with the layer markers"""
+    print_speed = int(config.print_speed)
+    e_corner = _round(config.get_e_value(1), 5)
+    sides = legacy_layer_sides(*legacy_layer_inputs(config, big_section_num))
+
+    gcode = legacy_layer_settings(config, big_section_num)
+    gcode.append(f";Layer {start_layer + big_section_num * config.layers_per_test}")
+    for side, marker in zip(sides, MARKERS):
+        gcode.extend(
+            f"G1 F{print_speed} {pattern} E{e_corner}" for pattern in marker
+        )
+        gcode.extend(side)
+    gcode.append(legacy_z_up(config))
+
+    return gcode
+
+
+def legacy_layer_group_layers(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> Iterator[list[str]]:
+    """Generate a block of layers of the web generator, one layer at a time"""
+    yield legacy_first_layer(config, big_section_num, start_layer)
+
+    # The rest of the layers repeat the same body
+    sides = legacy_layer_sides(*legacy_layer_inputs(config, big_section_num))
+    body = [line for side in sides for line in side]
+    z_line = legacy_z_up(config)
+    for layer_num in legacy_layer_numbers(config, big_section_num, start_layer):
+        yield [f";Layer {layer_num}", *body, z_line]
+
+
+def legacy_layer_group_bytes(
+    config: AnyGcodeConfig, big_section_num: int, start_layer: int
+) -> Iterator[bytes]:
+    """Generate an encoded block of layers of the web generator"""
+    first = legacy_first_layer(config, big_section_num, start_layer)
+    yield ("\n".join(first) + "\n").encode("utf-8")
+    if config.layers_per_test < 2:
+        return
+
+    body = legacy_layer_body(*legacy_layer_inputs(config, big_section_num))
+    z_line = f"{legacy_z_up(config)}\n".encode("utf-8")
+    for layer_num in legacy_layer_numbers(config, big_section_num, start_layer):
+        yield b";Layer %d\n" % layer_num
+        yield body
+        yield z_line
@@ -0,0 +1,296 @@
+"""Exact size of the generated gcode, without generating it.
+
+The tower is the same few layers repeated: every layer after the first of a
+block is the block's layer body between a layer comment and a Z move, and
+the body of a block only differs from the others in its retraction feedrate.
+So the line count follows from the number of tests and layers alone, and the
+byte count only needs the width of a handful of numbers per test. The
+sections around the tower are small and are rendered to be measured.
+
+The exact byte count still takes time in proportion to the number of tests.
+:func:`predict_bound` bounds it in constant time instead: the numbers that
+change from test to test change linearly, so none of them is wider than at
+the first or the last test.
+"""
+import dataclasses
+import re
+from typing import Callable, NamedTuple
+
+from .calibration_tower import (
+    RETRACTION_PRECISION,
+    START_LAYER,
+    first_layer,
+    layer_body,
+    layer_inputs,
+    layer_numbers,
+    layer_settings,
+    z_up,
+)
+from .calibration_header import variables_row
+from .config import AnyGcodeConfig, FrozenGcodeConfig
+from .gcode_format import get_formatter
+from .generate_ret_cal import RELATIVE_MOVES, fixed_sections
+from .legacy import (
+    legacy_first_layer,
+    legacy_header_row,
+    legacy_layer_body,
+    legacy_layer_inputs,
+    legacy_layer_numbers,
+    legacy_layer_settings,
+    legacy_z_up,
+)
+
+
+class OutputSize(NamedTuple):
+    lines: int
+    bytes: int
+
+
+class _Tower(NamedTuple):
+    first_layer: Callable
+    layer_inputs: Callable
+    layer_body: Callable
+    layer_settings: Callable
+    layer_numbers: Callable
+    z_up: Callable
+    # Line of a test in the header, and how the header writes num_tests
+    header_row: Callable
+    num_tests_text: Callable
+
+
+_TOWERS = {
+    False: _Tower(
+        first_layer,
+        layer_inputs,
+        layer_body,
+        layer_settings,
+        layer_numbers,
+        z_up,
+        lambda *values: ";" + variables_row(*values).strip(),
+        str,
+    ),
+    True: _Tower(
+        legacy_first_layer,
+        legacy_layer_inputs,
+        legacy_layer_body,
+        legacy_layer_settings,
+        legacy_layer_numbers,
+        legacy_z_up,
+        legacy_header_row,
+        lambda num_tests: str(float(num_tests)),
+    ),
+}
+
+# Length of ";Layer \n" around the layer number
+_LAYER_COMMENT = len(";Layer \n")
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _size(lines: list[str]) -> OutputSize:
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    return OutputSize(data.count(b"\n"), len(data))
+
+
+def _digits(numbers: range) -> int:
+    """Total number of digits of a range of non-negative integers."""
+    total = 0
+    low, high = numbers.start, numbers.stop
+    while low < high:
+        width = len(str(low))
+        bound = min(high, 10 ** width)
+        total += (bound - low) * width
+        low = bound
+    return total
+
+
+def predict_lines(config: AnyGcodeConfig, legacy: bool = False) -> int:
+    """Number of lines of the generated gcode.
+
+    Takes the same time for any number of tests and layers, so it is safe to
+    call on untrusted configs.
+    """
+    frozen = config.freeze()
+    num_tests = frozen.num_tests
+
+    # Measure a single test tower; the header has one more row per test and
+    # every block has as many lines as the first
+    lines = 0
+    if num_tests > 1:
+        lines = num_tests - 1
+        frozen = dataclasses.replace(frozen, num_tests=1)
+    for section in fixed_sections(frozen, legacy).values():
+        lines += _size(section()).lines
+    lines += len(RELATIVE_MOVES)
+
+    if num_tests > 0:
+        tower = _TOWERS[legacy]
+        first = len(tower.first_layer(frozen, 0, START_LAYER))
+        body = tower.layer_body(*tower.layer_inputs(frozen, 0)).count(b"\n")
+        repeated = len(tower.layer_numbers(frozen, 0, START_LAYER))
+        lines += num_tests * (first + repeated * (body + 2))
+
+    return lines
+
+
+def predict_size(config: AnyGcodeConfig, legacy: bool = False) -> OutputSize:
+    """Number of lines and bytes of the generated gcode.
+
+    The work grows with the number of tests but not with the number of
+    layers. Check :func:`predict_lines` first for untrusted configs.
+    """
+    frozen = config.freeze()
+    lines = 0
+    size = 0
+    for section in fixed_sections(frozen, legacy).values():
+        section_size = _size(section())
+        lines += section_size.lines
+        size += section_size.bytes
+    section_size = _size(RELATIVE_MOVES)
+    lines += section_size.lines
+    size += section_size.bytes
+
+    tower = _TOWERS[legacy]
+    # Bodies only differ in their feedrate, so their size depends on its width.
+    # Both formats write it with the same precision.
+    format_feedrate = get_formatter(RETRACTION_PRECISION)
+    body_sizes: dict[int, OutputSize] = {}
+    z_line = len(tower.z_up(frozen)) + 1
+    first_extra = None
+
+    for test_num in range(frozen.num_tests):
+        inputs = tower.layer_inputs(frozen, test_num)
+        width = len(format_feedrate(inputs[3]))
+        body = body_sizes.get(width)
+        if body is None:
+            body = body_sizes[width] = _size_of_body(tower.layer_body(*inputs))
+
+        settings = _size(tower.layer_settings(frozen, test_num))
+        first_num = START_LAYER + test_num * frozen.layers_per_test
+        first_comment = _LAYER_COMMENT + len(str(first_num))
+
+        if first_extra is None:
+            # Markers and Z move of the first layer, the same in every block
+            first = _size(tower.first_layer(frozen, test_num, START_LAYER))
+            first_extra = OutputSize(
+                first.lines - body.lines - settings.lines - 1,
+                first.bytes - body.bytes - settings.bytes - first_comment,
+            )
+
+        numbers = tower.layer_numbers(frozen, test_num, START_LAYER)
+        repeated = len(numbers)
+        lines += (
+            first_extra.lines + body.lines + settings.lines + 1
+            + repeated * (body.lines + 2)
+        )
+        size += (
+            first_extra.bytes + body.bytes + settings.bytes + first_comment
+            + repeated * (body.bytes + z_line + _LAYER_COMMENT)
+            + _digits(numbers)
+        )
+
+    return OutputSize(lines, size)
+
+
+def _size_of_body(body: bytes) -> OutputSize:
+    return OutputSize(body.count(b"\n"), len(body))
+
+
+def predict_bound(config: AnyGcodeConfig, legacy: bool = False) -> OutputSize:
+    """Number of lines of the generated gcode and an upper bound on its bytes.
+
+    Takes the same time for any number of tests and layers, like
+    :func:`predict_lines`. Every test is counted with each of its numbers as
+    wide as at the widest of the first and last tests, and every layer
+    number as wide as the last.
+    """
+    frozen = config.freeze()
+    num_tests = frozen.num_tests
+    if num_tests < 2:
+        return predict_size(frozen, legacy)
+
+    tower = _TOWERS[legacy]
+    first = dataclasses.replace(frozen, num_tests=1)
+    last = _single_test(frozen, num_tests - 1)
+
+    # The sections around the tower of the first test alone, with the rows
+    # of the other tests and the wider test count in the header
+    sections = fixed_sections(first, legacy).values()
+    size = sum(_size(section()).bytes for section in sections)
+    size += _size(RELATIVE_MOVES).bytes
+    size += len(tower.num_tests_text(num_tests)) - len(tower.num_tests_text(1))
+    row = _widest(_header_row(tower, first), _header_row(tower, last))
+    size += (num_tests - 1) * (row + 1)
+
+    # Layers of a test, with the layer numbers left out
+    body = _widest(
+        tower.layer_body(*tower.layer_inputs(first, 0)).decode("utf-8"),
+        tower.layer_body(*tower.layer_inputs(last, 0)).decode("utf-8"),
+    )
+    settings = _widest(
+        "\n".join(tower.layer_settings(first, 0)) + "\n",
+        "\n".join(tower.layer_settings(last, 0)) + "\n",
+    )
+    first_layer_size = _size(tower.first_layer(first, 0, START_LAYER)).bytes
+    first_num = len(str(START_LAYER))
+    first_extra = (
+        first_layer_size
+        - len(tower.layer_body(*tower.layer_inputs(first, 0)))
+        - _size(tower.layer_settings(first, 0)).bytes
+        - _LAYER_COMMENT
+        - first_num
+    )
+    repeated = max(frozen.layers_per_test - 1, 0)
+    z_line = len(tower.z_up(frozen)) + 1
+    size += num_tests * (
+        first_extra + settings + body + _LAYER_COMMENT
+        + repeated * (body + z_line + _LAYER_COMMENT)
+    )
+
+    # Layer numbers, none wider than the top of the tower
+    widest_number = len(str(START_LAYER + num_tests * frozen.layers_per_test))
+    size += num_tests * (1 + repeated) * widest_number
+
+    return OutputSize(predict_lines(frozen, legacy), size)
+
+
+def _single_test(config: FrozenGcodeConfig, test_num: int) -> FrozenGcodeConfig:
+    """Config whose only test has the values of a test of ``config``.
+
+    The values are computed as the schedule does, so they are the same. The
+    fields holding them change, so only the tower and the header row of the
+    config match those of the test.
+    """
+    return dataclasses.replace(
+        config,
+        num_tests=1,
+        retraction_speed_init=config.retraction_speed_init
+        + config.retraction_speed_delta * test_num,
+        hotend_temp_init=config.hotend_temp_init + config.hotend_temp_change * test_num,
+        fan_speed_init=config.fan_speed_init + config.fan_speed_delta * test_num,
+    )
+
+
+def _header_row(tower: _Tower, config: FrozenGcodeConfig) -> str:
+    schedule = config.schedule
+    return tower.header_row(
+        config,
+        schedule.retraction_speed[0],
+        schedule.hotend_temp[0],
+        schedule.fan_speed[0],
+    )
+
+
+def _widest(text: str, other: str) -> int:
+    """Bytes of ``text`` with every number as wide as the wider of it and
+    the number in the same place in ``other``."""
+    layout = _NUMBER.sub("", text)
+    numbers = _NUMBER.findall(text)
+    other_numbers = _NUMBER.findall(other)
+    if layout != _NUMBER.sub("", other) or len(numbers) != len(other_numbers):
+        # Not the same lines with other numbers, both are an upper bound
+        return len(text.encode("utf-8")) + len(other.encode("utf-8"))
+    return len(layout.encode("utf-8")) + sum(
+        max(len(number), len(other_number))
+        for number, other_number in zip(numbers, other_numbers)
+    )
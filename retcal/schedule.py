@@ -0,0 +1,61 @@
+from array import array
+
+# Number of retraction moves in each layer of the tower
+NUM_RETRACTIONS = 16
+
+
+class ParameterSchedule:
+    """Per-test parameters of a calibration tower.
+
+    Each column is an array of doubles with one entry per test, computed once
+    so the header and the tower emitters read the same values instead of
+    redoing the arithmetic. The retraction distances are the same for every
+    test and are kept once, in print order.
+    """
+
+    __slots__ = (
+        "retraction_speed",
+        "retraction_feedrate",
+        "hotend_temp",
+        "fan_speed",
+        "fan_pwm",
+        "retraction_distances",
+    )
+
+    def __init__(self, config):
+        tests = range(config.num_tests)
+
+        # Retraction speed in mm/s and as a feedrate in mm/min
+        self.retraction_speed = array(
+            "d",
+            (
+                config.retraction_speed_init + config.retraction_speed_delta * test
+                for test in tests
+            ),
+        )
+        self.retraction_feedrate = array(
+            "d", (speed * 60 for speed in self.retraction_speed)
+        )
+
+        self.hotend_temp = array(
+            "d",
+            (
+                config.hotend_temp_init + config.hotend_temp_change * test
+                for test in tests
+            ),
+        )
+
+        # Fan speed in percent and as an M106 PWM value
+        self.fan_speed = array(
+            "d",
+            (config.fan_speed_init + config.fan_speed_delta * test for test in tests),
+        )
+        self.fan_pwm = array("d", (speed * 255 / 100 for speed in self.fan_speed))
+
+        self.retraction_distances = tuple(
+            config.retraction_dist_init + config.retraction_dist_delta * i
+            for i in range(NUM_RETRACTIONS)
+        )
+
+    def __len__(self) -> int:
+        return len(self.retraction_speed)
@@ -0,0 +1,171 @@
+"""Destinations for encoded gcode.
+
+Every sink takes the byte chunks produced by
+:func:`~retcal.generate_ret_cal.iter_retraction_calibration_bytes` as they
+are generated, so output can be fanned out to several destinations (a file,
+a hash, a compressor, an HTTP response) without building the program first.
+Sinks are context managers that close themselves on exit.
+"""
+import hashlib
+import os
+import zlib
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator, Optional, Protocol, Union
+
+# Buffer size used for file writes
+FILE_BUFFER_SIZE = 1024 * 1024
+
+
+class GcodeSink(Protocol):
+    """Anything that accepts encoded gcode."""
+
+    def write(self, data: bytes) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class _Sink(ABC):
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FileSink(_Sink):
+    """Write to a file through a large buffer.
+
+    ``file`` is either a path, which is opened and closed by the sink, or an
+    open binary file, which is left open.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike, BinaryIO],
+        buffer_size: int = FILE_BUFFER_SIZE,
+    ):
+        if isinstance(file, (str, os.PathLike)):
+            self.file = open(file, "wb", buffering=buffer_size)
+            self._owned = True
+        else:
+            self.file = file
+            self._owned = False
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def close(self) -> None:
+        if self._owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+class MemorySink(_Sink):
+    """Keep the chunks in memory."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+class GzipSink(_Sink):
+    """Gzip compress the data into another sink."""
+
+    def __init__(self, target: GcodeSink, compresslevel: int = 6):
+        self.target = target
+        self._compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)
+        self._closed = False
+
+    def write(self, data: bytes) -> None:
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self.target.write(compressed)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.target.write(self._compressor.flush())
+            self.target.close()
+
+
+class HashingSink(_Sink):
+    """Count bytes and lines and take the SHA-256 of the data.
+
+    The data is passed on unchanged to ``target`` if one is given.
+    """
+
+    def __init__(self, target: Optional[GcodeSink] = None):
+        self.target = target
+        self.sha256 = hashlib.sha256()
+        self.byte_count = 0
+        self.line_count = 0
+
+    def write(self, data: bytes) -> None:
+        self.sha256.update(data)
+        self.byte_count += len(data)
+        self.line_count += data.count(b"\n")
+        if self.target is not None:
+            self.target.write(data)
+
+    def hexdigest(self) -> str:
+        return self.sha256.hexdigest()
+
+    def close(self) -> None:
+        if self.target is not None:
+            self.target.close()
+
+
+class TeeSink(_Sink):
+    """Write the same chunks to several sinks."""
+
+    def __init__(self, *sinks: GcodeSink):
+        self.sinks = sinks
+
+    def write(self, data: bytes) -> None:
+        for sink in self.sinks:
+            sink.write(data)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+class WsgiIterable:
+    """WSGI response body that streams chunks and copies them to sinks.
+
+    The WSGI server pulls chunks from ``chunks``; every chunk is also written
+    to ``sinks`` (e.g. a :class:`HashingSink`), which are closed once the
+    response has been sent or abandoned.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], *sinks: GcodeSink):
+        self.chunks = chunks
+        self.sinks = sinks
+
+    def __iter__(self) -> Iterator[bytes]:
+        for data in self.chunks:
+            for sink in self.sinks:
+                sink.write(data)
+            yield data
+
+    def close(self) -> None:
+        close = getattr(self.chunks, "close", None)
+        if close is not None:
+            close()
+        for sink in self.sinks:
+            sink.close()
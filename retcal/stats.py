@@ -0,0 +1,188 @@
+"""Opt-in instrumentation of gcode generation.
+
+Pass a :class:`GenerationStats` to one of the generation functions in
+:mod:`retcal.generate_ret_cal` and it is filled in as the program is
+generated::
+
+    stats = GenerationStats(trace_memory=True)
+    write_gcode(config, sink, stats=stats)
+    print(stats.summary())
+
+Time spent generating each section is recorded under the section name. Time
+spent between sections by whoever consumes them (joining the lines, writing
+chunks to a file or socket) is recorded as the ``"output"`` stage.
+"""
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Mapping, Optional, Protocol, TypeVar, Union
+
+# Stage that collects the time spent outside the generators
+OUTPUT_STAGE = "output"
+
+Section = tuple[str, Union[list[str], bytes]]
+# Sections of either kind pass through :meth:`GenerationStats.track` unchanged
+SectionT = TypeVar("SectionT", bound=Section)
+
+
+class CachedFunction(Protocol):
+    """An ``lru_cache`` wrapped function, as far as the stats need it."""
+
+    def cache_info(self) -> Any:
+        ...
+
+
+@dataclass
+class StageStats:
+    seconds: float = 0.0
+    lines: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of lookups served from the cache, None without lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+@dataclass
+class GenerationStats:
+    """Timings and counters of one generation.
+
+    Tracing memory uses :mod:`tracemalloc`, which slows generation down and
+    measures the whole process, so the peak also includes anything else
+    allocating at the same time.
+    """
+
+    trace_memory: bool = False
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    caches: dict[str, CacheStats] = field(default_factory=dict)
+    seconds: float = 0.0
+    peak_bytes: Optional[int] = None
+
+    @property
+    def lines(self) -> int:
+        return sum(stage.lines for stage in self.stages.values())
+
+    @property
+    def bytes(self) -> int:
+        return sum(stage.bytes for stage in self.stages.values())
+
+    def track(
+        self,
+        sections: Iterator[SectionT],
+        caches: Optional[Mapping[str, CachedFunction]] = None,
+    ) -> Iterator[SectionT]:
+        """Pass ``(section, data)`` pairs through, recording each of them.
+
+        ``caches`` maps names to ``lru_cache`` wrapped functions whose hits
+        and misses during the generation are counted.
+        """
+        caches = caches or {}
+        cache_start = {name: cached.cache_info() for name, cached in caches.items()}
+        owns_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                owns_tracing = True
+
+        clock = time.perf_counter
+        started = clock()
+        generating = 0.0
+        try:
+            while True:
+                start = clock()
+                try:
+                    item = next(sections)
+                except StopIteration:
+                    break
+                section, data = item
+                elapsed = clock() - start
+                generating += elapsed
+
+                stage = self.stages.get(section)
+                if stage is None:
+                    stage = self.stages[section] = StageStats()
+                stage.seconds += elapsed
+                if isinstance(data, bytes):
+                    stage.lines += data.count(b"\n")
+                    stage.bytes += len(data)
+                else:
+                    stage.lines += len(data)
+                    stage.bytes += len(data) + sum(
+                        len(line.encode("utf-8")) for line in data
+                    )
+
+                yield item
+        finally:
+            total = clock() - started
+            self.seconds += total
+            output = self.stages.setdefault(OUTPUT_STAGE, StageStats())
+            output.seconds += total - generating
+
+            for name, cached in caches.items():
+                info = cached.cache_info()
+                cache = self.caches.setdefault(name, CacheStats())
+                cache.hits += info.hits - cache_start[name].hits
+                cache.misses += info.misses - cache_start[name].misses
+
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_bytes = max(self.peak_bytes or 0, peak)
+                if owns_tracing:
+                    tracemalloc.stop()
+
+    def as_dict(self) -> dict:
+        """Plain data form of the stats, e.g. for JSON logs."""
+        return {
+            "seconds": self.seconds,
+            "lines": self.lines,
+            "bytes": self.bytes,
+            "peak_bytes": self.peak_bytes,
+            "stages": {
+                name: {"seconds": s.seconds, "lines": s.lines, "bytes": s.bytes}
+                for name, s in self.stages.items()
+            },
+            "caches": {
+                name: {"hits": c.hits, "misses": c.misses, "hit_rate": c.hit_rate}
+                for name, c in self.caches.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """One line description of the stats."""
+        parts = [
+            f"{self.lines} lines, {_size(self.bytes)} in {self.seconds * 1000:.1f} ms"
+        ]
+        parts.append(
+            ", ".join(
+                f"{name} {stage.seconds * 1000:.1f} ms"
+                for name, stage in self.stages.items()
+            )
+        )
+        rates = [
+            f"{name} {cache.hit_rate:.0%} hits"
+            for name, cache in self.caches.items()
+            if cache.hit_rate is not None
+        ]
+        if rates:
+            parts.append(", ".join(rates))
+        if self.peak_bytes is not None:
+            parts.append(f"peak {_size(self.peak_bytes)}")
+        return "; ".join(parts)
+
+
+def _size(size: Union[int, float]) -> str:
+    for unit in ("B", "kB", "MB"):
+        if size < 1000:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1000
+    return f"{size:.1f} GB"
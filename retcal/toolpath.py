@@ -0,0 +1,137 @@
+"""Toolpath of the calibration print, for previews.
+
+The moves are read back from the generated gcode by a small interpreter of
+the commands the generator uses (``G0``/``G1`` with ``G90``/``G91``). Every
+tower layer repeats the same moves one layer height higher, so only the raft
+and the first two layers of the tower are interpreted: the top view draws
+their moves and the side view stacks the tower layers from their extent,
+whatever the height of the tower.
+"""
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .calibration_tower import START_LAYER, layer_group_layers, tower_layers
+from .config import AnyGcodeConfig
+from .generate_ret_cal import RELATIVE_MOVES, raft_gcode
+
+
+class Move(NamedTuple):
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    z: float
+    extruding: bool
+
+
+class LayerStack(NamedTuple):
+    """Layers of the same X extent, ``layers`` of them ``dz`` apart from ``z``."""
+
+    z: float
+    dz: float
+    layers: int
+    x_min: float
+    x_max: float
+
+    @property
+    def top(self) -> float:
+        return self.z + (self.layers - 1) * self.dz
+
+
+@dataclass(frozen=True)
+class SectionPath:
+    """Moves of a section seen from above and its layers seen from the side.
+
+    Equal for configs that print the section the same way, so it can key a
+    cache of the rendered section.
+    """
+
+    name: str
+    moves: tuple[Move, ...]
+    layers: tuple[LayerStack, ...]
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """``(x_min, y_min, x_max, y_max)`` of the moves."""
+        xs = [x for move in self.moves for x in (move.x0, move.x1)]
+        ys = [y for move in self.moves for y in (move.y0, move.y1)]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def z_max(self) -> float:
+        return max(stack.top for stack in self.layers)
+
+
+class Position(NamedTuple):
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+    relative: bool = False
+
+
+def trace(lines: list[str], position: Position = Position()) -> tuple[list[Move], Position]:
+    """Moves in the XY plane of some gcode, and the position after it."""
+    x, y, z, relative = position
+    moves = []
+    for line in lines:
+        words = line.split()
+        if not words:
+            continue
+        command = words[0]
+        if command == "G90":
+            relative = False
+        elif command == "G91":
+            relative = True
+        elif command in ("G0", "G1"):
+            values = {word[0]: float(word[1:]) for word in words[1:]}
+            if relative:
+                nx = x + values.get("X", 0.0)
+                ny = y + values.get("Y", 0.0)
+                z += values.get("Z", 0.0)
+            else:
+                nx = values.get("X", x)
+                ny = values.get("Y", y)
+                z = values.get("Z", z)
+            if (nx, ny) != (x, y):
+                moves.append(Move(x, y, nx, ny, z, "E" in values))
+            x, y = nx, ny
+    return moves, Position(x, y, z, relative)
+
+
+def _stack(moves: list[Move], z: float, dz: float = 0.0, layers: int = 1) -> LayerStack:
+    xs = [x for move in moves if move.extruding for x in (move.x0, move.x1)]
+    return LayerStack(z, dz, layers, min(xs), max(xs))
+
+
+def toolpath(config: AnyGcodeConfig) -> dict[str, SectionPath]:
+    """Toolpath of the ``"raft"`` and ``"tower"`` sections."""
+    frozen = config.freeze()
+
+    # The raft is printed in absolute coordinates from the homed position,
+    # the travel from there is left out
+    raft_moves, position = trace(raft_gcode(frozen))
+    start = next(n for n, move in enumerate(raft_moves) if move.extruding)
+    raft_moves = raft_moves[start:]
+    heights = sorted({move.z for move in raft_moves if move.extruding})
+    raft = SectionPath(
+        "raft",
+        tuple(raft_moves),
+        tuple(_stack([m for m in raft_moves if m.z == z], z) for z in heights),
+    )
+
+    # The first layer of a block has the layer markers, the others only the
+    # sides. Both end by moving up one layer height.
+    _, position = trace(RELATIVE_MOVES, position)
+    layers = layer_group_layers(frozen, 0, START_LAYER)
+    base = position.z
+    first_moves, position = trace(next(layers), position)
+    layer_height = position.z - base
+    moves = list(first_moves)
+    second = next(layers, None)
+    if second is not None:
+        second_moves, _ = trace(second, position)
+        moves.extend(move._replace(z=base) for move in second_moves)
+    tower = SectionPath(
+        "tower",
+        tuple(dict.fromkeys(moves)),
+        (_stack(moves, base, layer_height, tower_layers(frozen)),),
+    )
+    return {"raft": raft, "tower": tower}
@@ -0,0 +1,118 @@
+"""Admission control for generation requests.
+
+Every request is costed from the predicted size of its file. Requests over
+the per-request ceiling are refused outright, and the others share a budget
+of cost in flight: a request that does not fit waits in a short, bounded
+queue and is turned away once the queue is full or its wait times out.
+
+Each worker process keeps its own queue, so the app gives each one its
+share of the configured budget and queue, keeping the total across workers
+within them.
+"""
+import math
+import threading
+import time
+from typing import Optional
+
+from retcal.predict import OutputSize
+
+# Cost of a line in bytes, for the work done per line beyond its bytes
+LINE_WEIGHT = 8
+
+
+class Rejected(Exception):
+    """A request refused by admission control."""
+
+    def __init__(self, status: int, message: str, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.retry_after = retry_after
+
+
+class CostModel:
+    """Cost of a request and the per-request ceiling."""
+
+    def __init__(self, max_lines: int, max_bytes: int, line_weight: int = LINE_WEIGHT):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.line_weight = line_weight
+
+    @property
+    def max_cost(self) -> int:
+        return self.max_bytes + self.line_weight * self.max_lines
+
+    def check_lines(self, lines: int):
+        """Refuse a request by its line count, which is cheap to predict."""
+        if lines > self.max_lines:
+            raise Rejected(413, f"The file would have more than {self.max_lines} lines")
+
+    def cost(self, size: OutputSize) -> int:
+        """Cost of generating a file, refusing it if it is too large."""
+        self.check_lines(size.lines)
+        if size.bytes > self.max_bytes:
+            raise Rejected(413, f"The file would be larger than {self.max_bytes} bytes")
+        return size.bytes + self.line_weight * size.lines
+
+
+class Ticket:
+    """Admitted cost, returned to the budget by :meth:`release`."""
+
+    def __init__(self, queue: "AdmissionQueue", cost: int):
+        self._queue = queue
+        self.cost = cost
+
+    def release(self):
+        if self._queue is not None:
+            self._queue._release(self.cost)
+            self._queue = None
+
+
+class AdmissionQueue:
+    """Budget of cost in flight with a bounded queue of waiting requests.
+
+    A waiting request is admitted as soon as it fits, so small requests are
+    not held up behind a large one waiting for room.
+    """
+
+    def __init__(self, capacity: int, max_waiting: int, timeout: float):
+        self.capacity = capacity
+        self.max_waiting = max_waiting
+        self.timeout = timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def admit(self, cost: int) -> Ticket:
+        """Wait until the cost fits in the budget.
+
+        Raises :class:`Rejected` with a 429 status if the queue is full or
+        the wait times out.
+        """
+        # A request larger than the whole budget runs on its own
+        cost = min(cost, self.capacity)
+        retry_after = max(1, math.ceil(self.timeout))
+        with self._condition:
+            if self.in_flight + cost <= self.capacity:
+                self.in_flight += cost
+                return Ticket(self, cost)
+            if self.waiting >= self.max_waiting:
+                raise Rejected(429, "Too many files are being generated, try again shortly", retry_after)
+
+            self.waiting += 1
+            deadline = time.monotonic() + self.timeout
+            try:
+                while self.in_flight + cost > self.capacity:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Rejected(429, "Timed out waiting to generate the file, try again shortly", retry_after)
+                    self._condition.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.in_flight += cost
+            return Ticket(self, cost)
+
+    def _release(self, cost: int):
+        with self._condition:
+            self.in_flight -= cost
+            self._condition.notify_all()
@@ -0,0 +1,199 @@
+"""Batches of configs generated in parallel and streamed as a ZIP archive.
+
+Each distinct config is generated once, in the process pool unless it is
+cached, and added to the archive as soon as it is finished, so the archive
+is sent while the rest of the batch is still being generated. Configs that
+repeat an earlier one only get a line in the archive's manifest, pointing at
+the shared file.
+
+The pool writes each file to a temporary file, which is copied into the
+archive a slice at a time and removed, so the batch only holds one file in
+memory at a time, and only a file small enough to be cached. Only a few
+files per pool process are generated ahead of the archive, so the finished
+ones waiting to be sent do not pile up on disk.
+"""
+import json
+import os
+import re
+import tempfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Iterator
+
+from retcal import FrozenGcodeConfig
+from retcal.generate_ret_cal import write_gcode
+from retcal.predict import OutputSize
+from retcal.sinks import FileSink
+
+from compression import GZIP_LEVEL
+from gcode_cache import GcodeCache, cache_key
+from pool import LazyPool
+
+MANIFEST = "manifest.json"
+
+# Files generated ahead of the archive, per pool process
+QUEUED_PER_WORKER = 2
+
+# Size of the slices of a file handed to the archive, and so of the chunks
+# streamed while a large file is compressed
+ENTRY_CHUNK_SIZE = 1024 * 1024
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def generate_file(config: FrozenGcodeConfig, legacy: bool) -> str:
+    """Generate the file of a config into a temporary file, returning its
+    path. Runs in a pool process."""
+    fd, path = tempfile.mkstemp(prefix="retcal-batch-", suffix=".gcode")
+    os.close(fd)
+    try:
+        with FileSink(path) as sink:
+            write_gcode(config, sink, legacy=legacy)
+    except BaseException:
+        _unlink(path)
+        raise
+    return path
+
+
+def held_cost(size: OutputSize, cost: int, cache: GcodeCache) -> int:
+    """Admission cost of a file of a batch, from its size and full cost.
+
+    Files small enough to be cached are read whole, larger ones are copied
+    a slice at a time. Files are added one at a time, so a batch costs as
+    much as its costliest file.
+    """
+    if size.bytes <= cache.max_entry_bytes:
+        return cost
+    return min(cost, ENTRY_CHUNK_SIZE)
+
+
+def file_name(name: str, taken) -> str:
+    """Name of an archive entry, made safe and distinct from ``taken``."""
+    base = _UNSAFE.sub("_", name).lstrip(".") or "calibration"
+    candidate = f"{base}.gcode"
+    n = 2
+    while candidate in taken:
+        candidate = f"{base}-{n}.gcode"
+        n += 1
+    return candidate
+
+
+class _ChunkWriter:
+    """Unseekable file collecting what the archive writes."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class Batch:
+    """The distinct configs of a batch and the archive manifest.
+
+    ``items`` are ``(name, config)`` pairs in request order.
+    """
+
+    def __init__(self, items: list, legacy: bool):
+        self.legacy = legacy
+        self.configs = {}
+        self.files = {}
+        self.manifest = []
+        for index, (name, config) in enumerate(items):
+            key = cache_key(config, legacy)
+            if key not in self.files:
+                self.configs[key] = config
+                self.files[key] = file_name(name, self.files.values())
+            self.manifest.append(
+                {"index": index, "name": name, "file": self.files[key], "key": key}
+            )
+
+    def stream(self, pool: LazyPool, cache: GcodeCache) -> Iterator[bytes]:
+        """Generate the batch, yielding the ZIP archive as it is written."""
+        out = _ChunkWriter()
+        archive = zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=GZIP_LEVEL)
+        futures = {}
+        try:
+            # Cached files are added while the pool generates the others
+            limit = pool.workers * QUEUED_PER_WORKER
+            for key, config in self.configs.items():
+                data = cache.get(key)
+                if data is not None:
+                    yield from self._write_entry(archive, out, self.files[key], data)
+                    del data
+                    continue
+                if len(futures) >= limit:
+                    yield from self._add_done(archive, out, futures, cache)
+                futures[pool.submit(generate_file, config, self.legacy)] = key
+            while futures:
+                yield from self._add_done(archive, out, futures, cache)
+
+            archive.writestr(MANIFEST, json.dumps({"files": self.manifest}, indent=2))
+            archive.close()
+            yield out.take()
+        finally:
+            # Stop the files not started yet if the client went away, and
+            # remove those finished meanwhile
+            for future in futures:
+                if not future.cancel():
+                    future.add_done_callback(_discard)
+
+    def _add_done(self, archive, out, futures: dict, cache: GcodeCache):
+        """Add the files of the first generations to finish."""
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            key = futures.pop(future)
+            path = future.result()
+            try:
+                yield from self._add_file(archive, out, self.files[key], key, path, cache)
+            finally:
+                _unlink(path)
+
+    def _add_file(self, archive, out, name: str, key: str, path: str, cache: GcodeCache):
+        """Add a generated file, caching it if it is small enough."""
+        if os.path.getsize(path) <= cache.max_entry_bytes:
+            with open(path, "rb") as file:
+                data = file.read()
+            cache.put(key, data)
+            yield from self._write_entry(archive, out, name, data)
+            return
+        with open(path, "rb") as file:
+            slices = iter(lambda: file.read(ENTRY_CHUNK_SIZE), b"")
+            yield from self._write_slices(archive, out, name, slices, os.path.getsize(path))
+
+    def _write_entry(self, archive: zipfile.ZipFile, out: _ChunkWriter, name: str, data: bytes):
+        slices = (data[start:start + ENTRY_CHUNK_SIZE] for start in range(0, len(data), ENTRY_CHUNK_SIZE))
+        yield from self._write_slices(archive, out, name, slices, len(data))
+
+    def _write_slices(self, archive: zipfile.ZipFile, out: _ChunkWriter, name: str, slices, size: int):
+        with archive.open(name, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as entry:
+            for data in slices:
+                entry.write(data)
+                chunk = out.take()
+                if chunk:
+                    yield chunk
+        chunk = out.take()
+        if chunk:
+            yield chunk
+
+
+def _discard(future: Future):
+    """Remove the file of a generation nobody is waiting for."""
+    if not future.cancelled() and future.exception() is None:
+        _unlink(future.result())
+
+
+def _unlink(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,62 @@
+"""Content-Encoding negotiation and streaming compression of responses.
+
+Brotli is offered when the ``brotli`` package is installed, gzip always.
+"""
+import zlib
+from typing import Iterable, Iterator, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Supported encodings, preferred first
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encodings) -> Optional[str]:
+    """Pick a content encoding from a parsed ``Accept-Encoding`` header.
+
+    Returns None for the identity encoding.
+    """
+    best = None
+    best_quality = 0
+    for encoding in ENCODINGS:
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best = encoding
+            best_quality = quality
+    return best
+
+
+class _GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def compressor(encoding: str):
+    """Incremental compressor with ``process`` and ``finish`` methods."""
+    if encoding == "gzip":
+        return _GzipCompressor()
+    if encoding == "br" and brotli is not None:
+        return brotli.Compressor(quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress chunks as they are produced."""
+    compress = compressor(encoding)
+    for chunk in chunks:
+        data = compress.process(chunk)
+        if data:
+            yield data
+    yield compress.finish()
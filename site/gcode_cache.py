@@ -0,0 +1,220 @@
+"""Cache of finished gcode files, keyed by the config that produced them.
+
+Entries live in a size-bounded in-memory LRU and, if a directory is given,
+in a second tier on disk that is shared by every worker process using the
+same directory. Entries are optionally stored gzip compressed.
+"""
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional
+
+from retcal import GENERATOR_VERSION, FrozenGcodeConfig
+
+# Bump when the generated output changes without a new GENERATOR_VERSION, so
+# old entries are not served
+CACHE_VERSION = 1
+
+# Defaults for the size bounds of the tiers
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRY_BYTES = 16 * 1024 * 1024
+
+
+def cache_key(config: FrozenGcodeConfig, legacy: bool) -> str:
+    """Key of the output of a config.
+
+    The key only changes when the output does, so it doubles as the strong
+    ETag of the generated file.
+    """
+    mode = "legacy" if legacy else "standard"
+    return f"{GENERATOR_VERSION}.{CACHE_VERSION}-{mode}-{config.canonical_hash()}"
+
+
+class GcodeCache:
+    """Two tier LRU cache of generated gcode.
+
+    ``max_bytes`` bounds the memory tier and ``disk_max_bytes`` the disk
+    tier, which is only used if ``directory`` is set. Files larger than
+    ``max_entry_bytes`` are not cached. Sizes are counted as stored, so with
+    ``compress`` set many more files fit.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
+        compress: bool = True,
+        max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+        self.compress = compress
+        self.max_entry_bytes = max_entry_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Stored size of the memory tier in bytes."""
+        return self._size
+
+    def get(self, key: str, gzip: bool = False) -> Optional[bytes]:
+        """Get the gcode of a key, or None if it is not cached.
+
+        With ``gzip`` set the gcode is returned gzip compressed, which costs
+        nothing when the cache stores compressed entries.
+        """
+        stored = self._get_memory(key)
+        if stored is None and self.directory:
+            stored = self._get_disk(key)
+            if stored is not None:
+                self._put_memory(key, stored)
+
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        if gzip:
+            return stored if self.compress else _gzip(stored)
+        return self._decode(stored)
+
+    def put(self, key: str, data: bytes):
+        """Cache the gcode of a key."""
+        if len(data) > self.max_entry_bytes:
+            return
+        stored = self._encode(data)
+        self._put_memory(key, stored)
+        if self.directory:
+            self._put_disk(key, stored)
+
+    def fill(self, key: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass chunks through and cache them once all have been consumed.
+
+        Nothing is cached if the consumer stops early or the output grows
+        past ``max_entry_bytes``.
+        """
+        parts = []
+        size = 0
+        for chunk in chunks:
+            if parts is not None:
+                size += len(chunk)
+                if size > self.max_entry_bytes:
+                    parts = None
+                else:
+                    parts.append(chunk)
+            yield chunk
+
+        if parts is not None:
+            self.put(key, b"".join(parts))
+
+    def clear(self):
+        """Empty the memory tier."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _encode(self, data: bytes) -> bytes:
+        return _gzip(data) if self.compress else data
+
+    def _decode(self, stored: bytes) -> bytes:
+        if not self.compress:
+            return stored
+        return zlib.decompress(stored, 31)
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None:
+                self._entries.move_to_end(key)
+            return stored
+
+    def _put_memory(self, key: str, stored: bytes):
+        if len(stored) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = stored
+            self._size += len(stored)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _path(self, key: str) -> str:
+        suffix = ".gcode.gz" if self.compress else ".gcode"
+        return os.path.join(self.directory, key + suffix)
+
+    def _get_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                stored = file.read()
+        except FileNotFoundError:
+            return None
+        # The modification time orders the disk tier for eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return stored
+
+    def _put_disk(self, key: str, stored: bytes):
+        # Write to a temporary file and rename it so other processes never
+        # see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(stored)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        if self.disk_max_bytes is not None:
+            self._trim_disk()
+
+    def _trim_disk(self):
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith((".gcode", ".gcode.gz")):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def _gzip(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
@@ -0,0 +1,21 @@
+"""gunicorn settings of the web app, overridable from the environment."""
+import multiprocessing
+import os
+
+wsgi_app = "wsgi:app"
+bind = os.environ.get("RETCAL_BIND", "0.0.0.0:5000")
+
+# Import the app and warm its caches in the master before forking
+preload_app = True
+
+workers = int(os.environ.get("RETCAL_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# The app splits its admission budget between the workers
+os.environ["RETCAL_WORKERS"] = str(workers)
+threads = int(os.environ.get("RETCAL_THREADS", 4))
+worker_class = "gthread"
+
+# Large towers stream for a while
+timeout = int(os.environ.get("RETCAL_WORKER_TIMEOUT", 120))
+keepalive = 5
+
+accesslog = "-"
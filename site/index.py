@@ -1,498 +1,440 @@
-from flask import Flask, render_template, request, Response
+from flask import Blueprint, Flask, render_template, request, Response, abort, current_app, g, jsonify, send_file, url_for
+from itertools import chain
+import json
+import os
 import tempfile
-from decimal import *
-
-app = Flask(__name__)
-
-@app.route('/')
+import time
+
+from retcal import DEFAULTS, GcodeConfig
+from retcal.generate_ret_cal import LAYER_CACHES, iter_retraction_calibration_bytes
+from retcal.predict import predict_bound, predict_size
+from retcal.sinks import WsgiIterable
+from retcal.stats import GenerationStats
+
+from admission import AdmissionQueue, CostModel, Rejected, Ticket
+from batch import Batch, held_cost
+from compression import compress_stream, negotiate
+from gcode_cache import GcodeCache, cache_key
+from jobs import DONE, JobRunner, JobStore
+from metrics import CONTENT_TYPE, ServiceMetrics, counted
+from pool import LazyPool
+from singleflight import SingleFlight
+
+bp = Blueprint("calibration", __name__)
+
+
+def _flag(value: str) -> bool:
+    return value != "0"
+
+
+# Settings of the app: (environment variable, parser, default)
+SETTINGS = {
+    # Size of the batches written to the response stream
+    "CHUNK_SIZE": ("RETCAL_CHUNK_SIZE", int, 64 * 1024),
+    # Log the timings and counters of every generated file
+    "LOG_STATS": ("RETCAL_LOG_STATS", _flag, False),
+    # Time one generation in this many by stage for /metrics, 0 for none
+    "METRICS_SAMPLE": ("RETCAL_METRICS_SAMPLE", int, 100),
+    # Finished files, shared between workers through CACHE_DIR if it is set
+    "CACHE_BYTES": ("RETCAL_CACHE_BYTES", int, 64 * 1024 * 1024),
+    "CACHE_DIR": ("RETCAL_CACHE_DIR", str, None),
+    "CACHE_DISK_BYTES": ("RETCAL_CACHE_DISK_BYTES", int, 1024 * 1024 * 1024),
+    "CACHE_COMPRESS": ("RETCAL_CACHE_COMPRESS", _flag, True),
+    # Lifetime of GET responses in shared caches, in seconds
+    "CACHE_MAX_AGE": ("RETCAL_CACHE_MAX_AGE", int, 24 * 60 * 60),
+    # Largest file generated for a request
+    "MAX_LINES": ("RETCAL_MAX_LINES", int, 5_000_000),
+    "MAX_BYTES": ("RETCAL_MAX_BYTES", int, 128 * 1024 * 1024),
+    # Most tests of a file sent with a Content-Length, as the exact size
+    # takes time in proportion to the tests
+    "CONTENT_LENGTH_TESTS": ("RETCAL_CONTENT_LENGTH_TESTS", int, 1000),
+    # Cost of the files generated at the same time (twice the largest file by
+    # default), and of the requests waiting for room, shared by the workers
+    "MAX_INFLIGHT_COST": ("RETCAL_MAX_INFLIGHT_COST", int, None),
+    "MAX_WAITING": ("RETCAL_MAX_WAITING", int, 16),
+    "QUEUE_TIMEOUT": ("RETCAL_QUEUE_TIMEOUT", float, 5.0),
+    # Worker processes serving the app, set by the gunicorn settings
+    "WORKERS": ("RETCAL_WORKERS", int, 1),
+    # Chunks kept by a shared generation for its slower readers
+    "FLIGHT_BACKLOG": ("RETCAL_FLIGHT_BACKLOG", int, 16),
+    # Processes generating background jobs and batches, per worker
+    "POOL_WORKERS": ("RETCAL_POOL_WORKERS", int, 2),
+    # Background jobs: where they are kept and for how long in seconds, and
+    # the jobs pending per worker
+    "JOBS_DIR": ("RETCAL_JOBS_DIR", str, os.path.join(tempfile.gettempdir(), "retcal-jobs")),
+    "JOB_RETENTION": ("RETCAL_JOB_RETENTION", float, 60 * 60),
+    "MAX_JOBS": ("RETCAL_MAX_JOBS", int, 16),
+    # Largest file generated by a job
+    "JOB_MAX_LINES": ("RETCAL_JOB_MAX_LINES", int, 100_000_000),
+    "JOB_MAX_BYTES": ("RETCAL_JOB_MAX_BYTES", int, 4 * 1024 * 1024 * 1024),
+    # Most configs in a batch
+    "MAX_BATCH": ("RETCAL_MAX_BATCH", int, 64),
+}
+
+DOWNLOAD_HEADERS = {"Content-disposition": "attachment; filename=calibration.gcode"}
+BATCH_HEADERS = {"Content-disposition": "attachment; filename=calibration.zip"}
+
+
+
+def form_from_values(values: dict) -> dict:
+    """Web form of GcodeConfig field values, the inverse of config_from_form."""
+    return {
+        "dimensionX": str(values["bed_shape_x"]),
+        "dimensionY": str(values["bed_shape_y"]),
+        "nozzleDiameter": str(values["nozzle_diameter"]),
+        "layerHeight": str(values["layer_height"]),
+        "startRetractiondistance": str(values["retraction_dist_init"]),
+        "filamentDiameter": str(values["dilament_diameter"]),
+        "incrementRetractiondistance": str(values["retraction_dist_delta"]),
+        "extrusionMultiplier": str(values["extrusion_multiplier"]),
+        "startRetractionspeed": str(values["retraction_speed_init"]),
+        "travelSpeed": str(values["travel_speed"] / 60),
+        "incrementRetractionspeed": str(values["retraction_speed_delta"]),
+        "printSpeed": str(values["print_speed"] / 60),
+        "tempStarthotend": str(values["hotend_temp_init"]),
+        "tempIncrementhotend": str(values["hotend_temp_change"]),
+        "numTests": str(values["num_tests"]),
+        "layersTest": str(values["layers_per_test"]),
+        "bedTemp": str(values["bed_temp"]),
+        "fanSpeed": str(values["fan_speed_init"]),
+        "fanSpeedIncrement": str(values["fan_speed_delta"]),
+        "customGcode": values["custom_gcode"],
+    }
+
+
+# Values of the form as first shown on the page
+DEFAULT_FORM = form_from_values(DEFAULTS)
+
+
+def settings_from_env(environ=os.environ) -> dict:
+    """Read the settings of the app from environment variables."""
+    settings = {}
+    for name, (variable, parse, default) in SETTINGS.items():
+        value = environ.get(variable)
+        settings[name] = default if value in (None, "") else parse(value)
+    return settings
+
+
+class Services:
+    """State shared by the requests of an app."""
+
+    def __init__(self, config):
+        self.cache = GcodeCache(
+            max_bytes=config["CACHE_BYTES"],
+            directory=config["CACHE_DIR"],
+            disk_max_bytes=config["CACHE_DISK_BYTES"],
+            compress=config["CACHE_COMPRESS"],
+        )
+        # Generations in progress, joined by identical requests
+        self.flights = SingleFlight(config["FLIGHT_BACKLOG"])
+        self.cost_model = CostModel(
+            max_lines=config["MAX_LINES"], max_bytes=config["MAX_BYTES"]
+        )
+        # Each worker gets its share of the budget and of the queue
+        workers = max(1, config["WORKERS"])
+        capacity = config["MAX_INFLIGHT_COST"] or 2 * self.cost_model.max_cost
+        self.admission = AdmissionQueue(
+            capacity=max(1, capacity // workers),
+            max_waiting=max(1, -(-config["MAX_WAITING"] // workers)),
+            timeout=config["QUEUE_TIMEOUT"],
+        )
+        self.job_cost_model = CostModel(
+            max_lines=config["JOB_MAX_LINES"], max_bytes=config["JOB_MAX_BYTES"]
+        )
+        self.pool = LazyPool(config["POOL_WORKERS"])
+        self.jobs = JobRunner(
+            JobStore(config["JOBS_DIR"], config["JOB_RETENTION"]),
+            self.pool,
+            max_pending=config["MAX_JOBS"],
+        )
+        self.metrics = ServiceMetrics(self, LAYER_CACHES, config["METRICS_SAMPLE"])
+
+
+def create_app(settings=None) -> Flask:
+    """Create the web app.
+
+    Settings are read from the environment (see ``SETTINGS``) and can be
+    overridden with ``settings``.
+    """
+    app = Flask(__name__)
+    app.config.update(settings_from_env())
+    if settings:
+        app.config.update(settings)
+    app.extensions["retcal"] = Services(app.config)
+    app.register_blueprint(bp)
+    return app
+
+
+def warm_up(app: Flask):
+    """Generate the file of the default form into the caches.
+
+    Run before forking workers, so they all start with it cached and share
+    the warmed layer caches and number formatters copy-on-write.
+    """
+    services = app.extensions["retcal"]
+    config = config_from_form(DEFAULT_FORM)
+    predict_bound(config, legacy=True)
+    predict_size(config, legacy=True)
+    data = b"".join(iter_retraction_calibration_bytes(config, legacy=True))
+    services.cache.put(cache_key(config, legacy=True), data)
+
+
+def _count(value) -> int:
+    """A whole number of layers or tests.
+
+    The old generator printed the count as entered in the header but used its
+    integer part, which a GcodeConfig cannot reproduce, so fractions are
+    refused rather than printed differently.
+    """
+    count = float(value)
+    if not count.is_integer():
+        raise ValueError(f"Expected a whole number, not {value!r}")
+    return int(count)
+
+
+def _newlines(text: str) -> str:
+    """Text with the line ends the old generator wrote.
+
+    Textareas are sent with CRLF line ends, which the old generator turned
+    into LF by reading its temporary file back with universal newlines.
+    """
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def config_from_form(form):
+    """Build a frozen GcodeConfig from the values of the web form.
+
+    Speeds are entered in mm/s and converted to mm/min the same way the old
+    generator did, so ``legacy=True`` output is unchanged.
+    """
+    return GcodeConfig(
+        # Start Gcode Retraction Distance
+        retraction_dist_init=float(form['startRetractiondistance']),
+        retraction_dist_delta=float(form['incrementRetractiondistance']),
+        # Variables by Height
+        retraction_speed_init=float(form['startRetractionspeed']),
+        retraction_speed_delta=float(form['incrementRetractionspeed']),
+        hotend_temp_init=float(form['tempStarthotend']),
+        hotend_temp_change=float(form['tempIncrementhotend']),
+        fan_speed_init=float(form['fanSpeed']),
+        fan_speed_delta=float(form['fanSpeedIncrement']),
+        layer_height=float(form['layerHeight']),
+        layers_per_test=_count(form['layersTest']),
+        num_tests=_count(form['numTests']),
+        # Printer parameters
+        bed_shape_x=float(form['dimensionX']),
+        bed_shape_y=float(form['dimensionY']),
+        print_speed=float(form['printSpeed']) * 60,
+        travel_speed=int(float(form['travelSpeed'])) * 60,
+        nozzle_diameter=float(form['nozzleDiameter']),
+        dilament_diameter=float(form['filamentDiameter']),
+        extrusion_multiplier=float(form['extrusionMultiplier']),
+        bed_temp=float(form['bedTemp']),
+        # Custom Gcode
+        custom_gcode=_newlines(str(form['customGcode'])),
+    ).freeze()
+
+
+@bp.before_app_request
+def start_timer():
+    g.started = time.perf_counter()
+
+
+@bp.after_app_request
+def count_request(response):
+    metrics = current_app.extensions["retcal"].metrics
+    endpoint = request.endpoint or "none"
+    metrics.requests.inc(endpoint, response.status_code)
+    started = g.get("started")
+    if started is not None:
+        metrics.request_seconds.observe(time.perf_counter() - started, endpoint)
+    return response
+
+
+@bp.app_errorhandler(Rejected)
+def rejected(error):
+    current_app.extensions["retcal"].metrics.rejected.inc(error.status)
+    headers = {}
+    if error.retry_after is not None:
+        headers["Retry-After"] = str(error.retry_after)
+    return Response(error.message + "\n", status=error.status, mimetype="text/plain", headers=headers)
+
+
+@bp.route('/')
 def hello():
     return render_template('index.html')
-    
-
-@app.route('/gencode', methods=('GET', 'POST') )    
-def gencode():  
-    
-    bedTemp	= 	request.form['bedTemp']
-    dimensionX	= 	request.form['dimensionX']
-    dimensionY	= 	request.form['dimensionY']
-    extrusionMultiplier	= 	request.form['extrusionMultiplier']
-    fanSpeed	= 	request.form['fanSpeed']
-    fanSpeedIncrement	= 	request.form['fanSpeedIncrement']
-    filamentDiameter	= 	request.form['filamentDiameter']
-    incrementRetractiondistance	= 	request.form['incrementRetractiondistance']
-    incrementRetractionspeed	= 	request.form['incrementRetractionspeed']
-    layerHeight	= 	request.form['layerHeight']
-    layersTest	= 	request.form['layersTest']
-    nozzleDiameter	= 	request.form['nozzleDiameter']
-    numTests	= 	request.form['numTests']
-    printSpeed	= 	request.form['printSpeed']
-    startRetractiondistance	= 	request.form['startRetractiondistance']
-    startRetractionspeed	= 	request.form['startRetractionspeed']
-    tempIncrementhotend	= 	request.form['tempIncrementhotend']
-    tempStarthotend	= 	request.form['tempStarthotend']
-    travelSpeed	= 	request.form['travelSpeed']
-    customGcode	= 	request.form['customGcode']
-
-    file = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
-    srd = float(startRetractiondistance)
-    ird = float(incrementRetractiondistance)
-        
-    file.write(f';Calibration Generator 1.3.3\n')
-    file.write(f";\n")
-    file.write(f";\n")
-    file.write(f";Retraction Distance from the top looking down\n")
-    file.write(f";\n")
-    file.write(f';       {round(Decimal(srd+ird*11),2)}    {round(Decimal(srd+ird*10),2)}    {round(Decimal(srd+ird*9),2)}    {round(Decimal(srd+ird*8),2)}\n')
-    file.write(f";		|		|		|		|\n")
-    file.write(f";\n")
-    file.write(f";{round(Decimal(srd+ird*12),2)}-                               -{round(Decimal(srd+ird*7),2)}\n")
-    file.write(f";\n")
-    file.write(f";\n")
-    file.write(f";{round(Decimal(srd+ird*13),2)}-                               -{round(Decimal(srd+ird*6),2)}\n")
-    file.write(f";\n")
-    file.write(f";\n")
-    file.write(f";{round(Decimal(srd+ird*14),2)}-                               -{round(Decimal(srd+ird*5),2)}\n")
-    file.write(f";\n")
-    file.write(f";\n")
-    file.write(f";{round(Decimal(srd+ird*15),2)}-                               -{round(Decimal(srd+ird*4),2)}\n")
-    file.write(f";\n")
-    file.write(f";		|		|		|		|\n")
-    file.write(f";       {round(Decimal(srd+ird*0),2)}    {round(Decimal(srd+ird*1),2)}    {round(Decimal(srd+ird*2),2)}    {round(Decimal(srd+ird*3),2)}\n")
-    file.write(f";\n")
-    file.write(f";\n")
-    
-    srs = float(startRetractionspeed)
-    irs = float(incrementRetractionspeed)
-    tsh = float(tempStarthotend)
-    tih = float(tempIncrementhotend)
-    fs = float(fanSpeed)
-    fsi = float(fanSpeedIncrement)
-    lh = float(layerHeight)
-    ts = float(travelSpeed)
-    lt = float(layersTest)
-    nt = float(numTests)
-
-
-    file.write(f";Variables by Height\n")
-    file.write(f";\n")
-    file.write(f";Height         Retraction  Nozzle      Fan\n")
-    file.write(f";               Speed       Temp        Speed\n")
-    file.write(f";\n")
-
-    cnt = int(nt-1)
-    
-    for loopx in range(int(nt)):
-        file.write(f";{int(lt)} layers      {round(Decimal(srs+irs*cnt),2)}      {round(Decimal(tsh+tih*cnt),2)}      {round(Decimal(fs+fsi*cnt),2)}\n")
-        cnt = cnt-1
-
-    dx = float(dimensionX)
-    dy = float(dimensionY)
-    ps = float(printSpeed)
-    nd = float(nozzleDiameter)
-    fd = float(filamentDiameter)
-    em = float(extrusionMultiplier)
-    tb = float(bedTemp)    
-    
-    #Custom Gcode
-    sgcode = str(customGcode)
-
-
-    file.write(f";\n")
-    file.write(f";\n")
-    file.write(f";All inputs\n")
-    file.write(f";\n")
-    file.write(f";Dimension X 					{int(dx)}\n")
-    file.write(f";Dimension Y 					{int(dy)}\n")
-    file.write(f";Starting Retraction Distance	{srd}\n")
-    file.write(f";Increment Retraction 			{ird}\n")
-    file.write(f";Start Retraction Speed 		{srs}\n")
-    file.write(f";Retraction Speed Increment 	{irs}\n")
-    file.write(f";Print Speed 					{ps}\n")
-    file.write(f";Starting Temp 					{int(tsh)}\n")
-    file.write(f";Increment Temp 				{int(tih)}\n")
-    file.write(f";Bed Temp 						{int(tb)}\n")
-    file.write(f";Fan Speed 						{int(fs)}\n")
-    file.write(f";Fan Speed Increment 			{int(fsi)}\n")
-    file.write(f";Nozzle Diameter 				{nd}\n")
-    file.write(f";Layer Height 					{lh}\n")
-    file.write(f";Filament Diameter 				{fd}\n")
-    file.write(f";Extrusion Multiplier 			{em}\n")
-    file.write(f";Layers Per Test                {lt}\n")
-    file.write(f";Number of Tests                {nt}\n")
-    file.write(f";\n")
-    file.write(f";\n")    
-    
-
-    # Generate E Value  https://3dprinting.stackexchange.com/questions/10171/how-is-e-value-calculated-in-slic3r 
-
-    def eValue ( extrusionLength ):
-
-        diameterNozzle = float(nozzleDiameter)
-        heightLayer = float(layerHeight)
-        diameterFilament = float(filamentDiameter)
-        multiplierExtrusion = float(extrusionMultiplier)
-
-        area = (diameterNozzle - heightLayer) * heightLayer + 3.14159 * (heightLayer/2)**2
-        eValueresult = (area * extrusionLength * 4)/(3.14159 * diameterFilament**2/multiplierExtrusion)
-        return eValueresult
-    
-    #start Gcode
-    file.write(f";Start Gcode\n")
-    file.write(f"M140 S{int(tb)}\n")
-    file.write(f"M105\n")
-    file.write(f"M190 S{int(tb)}\n")
-    file.write(f"M104 S{int(tsh)}\n")
-    file.write(f"M105\n")
-    file.write(f"M109 S{int(tsh)}\n")
-    file.write(f"M82\n")
-    file.write(f"G28\n")
-    file.write(f"G92 E0\n")
-    file.write(f"G1 F200 E1\n")
-    file.write(f"G92 E0\n")
-
-    file.write(f"{sgcode}\n")
-
-    file.write(f";\n")
-    file.write(f";\n")
-
-    xpos = dx/2-30
-    ypos = dy/2-30
-    zpos = lh
-    epos = 0
-    
-
-
-    #Start Movement        
-    file.write(f";Start Movement\n")
-    file.write(f";\n")
-    file.write(f"G1 Z2\n")
-    file.write(f"G1 F{int(ts)*60} X{xpos} Y{ypos} Z{zpos}\n")
-    file.write(f";\n")
-    eValueresult = eValue(60)
-
-    #Overextruding Raft
-    evalueincrease = eValueresult*1.25
-    eValueresult = evalueincrease
-
-
-    remx = xpos
-    remy = ypos
-
-    file.write(f";Layer 1\n")
-
-    #Horizontal
-
-    for loopx in range(30):
-        file.write(f"G1 F{int(ps*60/2)} X{xpos+60} Y{ypos} E{round(Decimal(eValueresult),5)}\n")
-        xpos = xpos + 60
-        eValueresult = eValueresult + evalueincrease
-        file.write(f"G0 F{int(ts)*60} X{xpos} Y{ypos+1}\n")
-        ypos = ypos + 1
-        file.write(f"G1 F{int(ps*60/2)} X{xpos-60} Y{ypos} E{round(Decimal(eValueresult),5)}\n")
-        xpos = xpos - 60
-        eValueresult = eValueresult + evalueincrease
-        file.write(f"G0 F{int(ts)*60} X{xpos} Y{ypos+1}\n")
-        ypos = ypos + 1
-
-    #Bring back to raft origin
-
-    file.write(f"G0 F{int(ts)*60} X{xpos} Y{ypos} Z{round(Decimal(lh*3),2)}\n")
-    file.write(f"G0 F{int(ts)*60} X{remx} Y{remy} Z{lh+lh}\n")
-    xpos = remx
-    ypos = remy
-
-    file.write(f";Layer 2\n")
-
-    #Vertical
-
-    for loopx in range(30):
-        file.write(f"G1 F{int(ps*60/2)} X{xpos} Y{ypos+60} E{round(Decimal(eValueresult),5)}\n")
-        ypos = ypos + 60
-        eValueresult = eValueresult + evalueincrease
-        file.write(f"G0 F{int(ts)*60} X{xpos+1} Y{ypos}\n")
-        xpos = xpos + 1
-        file.write(f"G1 F{int(ps*60/2)} X{xpos} Y{ypos-60} E{round(Decimal(eValueresult),5)}\n")
-        ypos = ypos - 60
-        eValueresult = eValueresult + evalueincrease
-        file.write(f"G0 F{int(ts)*60} X{xpos+1} Y{ypos}\n")
-        xpos = xpos + 1    
-
-    #Bring back to Calibration Starting Position
-
-    file.write(f"G0 F{int(ts)*60} X{remx+5} Y{remy+5} Z{round(Decimal(lh*3),2)}\n")
-
-    #Relative Movements
-
-    file.write(f"M83\n")
-    file.write(f"G91\n")
-
-    #Start Calibration
-
-    eValueresult = eValue(10)
-    corenermarker = eValue(1)
-
-    loopbigcount = 0
-    loopsmallcount = 0
-
-    layer = 3
-
-    cnt = int(nt)
-    lt = lt - 1
-
-    for loopbig in range(int(cnt)):
-
-    #set Fan every 15 layers
-        file.write(f"M106 S{(round(Decimal((fs+fsi*loopbigcount)) * 255 / 100,0))  }\n")
-        file.write(f"M104 S{round(Decimal(tsh+tih*loopbigcount),0)}\n")
-
-        file.write(f";Layer {layer}\n")
-
-        #Layer Marker Bottom Left
-        file.write(f"G1 F{int(ps*60)} X-2 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-2 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} X2 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y2 E{round(Decimal(corenermarker),5)}\n")
-
-
-        #Begin 
-
-        #Bottom
-        file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*0),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*0),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*1),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*1),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*2),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*2),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*3),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*3),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-
-        #Layer Marker Bottom Right
-        file.write(f"G1 F{int(ps*60)} X1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} X-1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y1 E{round(Decimal(corenermarker),5)}\n")
-
-        #Right
-        file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*4),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*4),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*5),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*5),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*6),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*6),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*7),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*7),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-
-        #Layer Marker Top Right
-        file.write(f"G1 F{int(ps*60)} X1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} X-1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-1 E{round(Decimal(corenermarker),5)}\n")
-
-        #Top
-        file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*8),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*8),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*9),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*9),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*10),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*10),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*11),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} Y10\n")
-        file.write(f"G0 F{int(ts)*60} Y-10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*11),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-
-        #Layer Marker Top Left
-        file.write(f"G1 F{int(ps*60)} X-1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} X1 E{round(Decimal(corenermarker),5)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-1 E{round(Decimal(corenermarker),5)}\n")
-
-        #Left
-        file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*12),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*12),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*13),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*13),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*14),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*14),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*15),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G0 F{int(ts)*60} X-10\n")
-        file.write(f"G0 F{int(ts)*60} X10\n")
-        file.write(f"G1 E{round(Decimal(srd+ird*15),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-        file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-
-        #Zup layer height
-        file.write(f"G1 Z{lh}\n")
-             
-#       loopbigcount = loopbigcount +1
-        layer = layer + 1
-
-
-        for loopsmall in range(int(lt)):
-
-            file.write(f";Layer {layer}\n")
-            #Bottom
-            file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*0),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*0),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*1),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*1),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*2),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*2),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*3),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*3),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X10 E{round(Decimal(eValueresult),5)}\n")
-
-            #Right
-            file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*4),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*4),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*5),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*5),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*6),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*6),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*7),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*7),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y10 E{round(Decimal(eValueresult),5)}\n")
-
-            #Top
-            file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*8),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*8),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*9),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*9),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*10),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*10),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*11),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} Y10\n")
-            file.write(f"G0 F{int(ts)*60} Y-10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*11),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} X-10 E{round(Decimal(eValueresult),5)}\n")
-
-            #Left
-            file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*12),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*12),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*13),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*13),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*14),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*14),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*15),2) * -1} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G0 F{int(ts)*60} X-10\n")
-            file.write(f"G0 F{int(ts)*60} X10\n")
-            file.write(f"G1 E{round(Decimal(srd+ird*15),2)} F{round(Decimal((srs+irs*loopbigcount) * 60),2)}\n")
-            file.write(f"G1 F{int(ps*60)} Y-10 E{round(Decimal(eValueresult),5)}\n")
-
-            file.write(f"G1 Z{lh}\n")
-            layer = layer + 1
-
-        loopbigcount = loopbigcount +1
-
-
-    #End Game
-
-    #Raise 5mm
-    file.write(f"G1 Z5\n")    
-    #Absolute Position
-    file.write(f"G90\n")
-    #Home X Y
-    file.write(f"G28 X0 Y0\n")
-    #Turn off Steppers
-    file.write(f"M84\n")
-    #Turn off Fan
-    file.write(f"M107\n")
-    #Turn off Hotend
-    file.write(f"M104 S0\n")
-    #Turn off Bed
-    file.write(f"M140 S0\n")
-
-    file.seek(0)
-    return Response( file, mimetype="text/plain", headers={"Content-disposition": "attachment; filename=calibration.gcode"})
-
 
 
+@bp.route('/metrics')
+def metrics():
+    return Response(current_app.extensions["retcal"].metrics.render(), content_type=CONTENT_TYPE)
+
+
+@bp.route('/gencode', methods=('GET', 'POST') )
+def gencode():
+    services = current_app.extensions["retcal"]
+    settings = current_app.config
+    logger = current_app.logger
+    metrics = services.metrics
+
+    # GET takes the form fields as query parameters
+    try:
+        config = config_from_form(request.values)
+    except ValueError:
+        abort(400)
+
+    # The output is fully determined by the config, so the cache key is a
+    # strong validator. Every encoding is a separate representation.
+    key = cache_key(config, legacy=True)
+    encoding = negotiate(request.accept_encodings)
+    etag = f"{key}+{encoding}" if encoding else key
+    validators = {"ETag": f'"{etag}"', "Vary": "Accept-Encoding"}
+    if request.method == "GET":
+        validators["Cache-Control"] = f"public, max-age={settings['CACHE_MAX_AGE']}"
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=validators)
+    headers = dict(DOWNLOAD_HEADERS, **validators)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    cached = services.cache.get(key, gzip=encoding == "gzip")
+    if cached is not None:
+        if encoding == "br":
+            cached = b"".join(compress_stream([cached], encoding))
+        metrics.response_bytes.observe(len(cached), encoding or "identity")
+        return Response(cached, mimetype="text/plain", headers=headers)
+
+    # Reject oversized files before generating anything, from a bound on
+    # their size that is cheap for any config
+    cost = services.cost_model.cost(predict_bound(config, legacy=True))
+    if not encoding and config.num_tests <= settings["CONTENT_LENGTH_TESTS"]:
+        headers["Content-Length"] = str(predict_size(config, legacy=True).bytes)
+
+    def generate(admit: bool = True):
+        # The admitted cost stays in flight until the generation has ended
+        ticket = services.admission.admit(cost) if admit else Ticket(None, 0)
+        started = time.perf_counter()
+        sampled = metrics.sample()
+        stats = GenerationStats() if settings["LOG_STATS"] or sampled else None
+
+        def ended():
+            ticket.release()
+            metrics.generation_seconds.observe(time.perf_counter() - started)
+            if sampled:
+                metrics.observe_stats(stats)
+            if settings["LOG_STATS"]:
+                logger.info("gencode %s", json.dumps(stats.as_dict()))
+
+        # Produce the first batch before responding so errors still fail the
+        # request instead of cutting the stream short
+        try:
+            stream = iter_retraction_calibration_bytes(
+                config, settings["CHUNK_SIZE"], legacy=True, stats=stats
+            )
+            first = next(stream, b"")
+        except BaseException:
+            ticket.release()
+            raise
+        stream = counted(chain([first], stream), lambda size: metrics.generated_bytes.inc(amount=size))
+        return services.cache.fill(key, stream), ended
+
+    def resume():
+        # A reader that fell behind has already started its response: the
+        # first generation may have cached the file by now, otherwise it
+        # generates again without waiting for admission
+        data = services.cache.get(key)
+        if data is None:
+            return generate(admit=False)
+        size = settings["CHUNK_SIZE"]
+        return (data[start:start + size] for start in range(0, len(data), size)), None
+
+    # Identical requests share one generation
+    reader = services.flights.run(key, generate, resume)
+    chunks = compress_stream(reader, encoding) if encoding else reader
+    chunks = counted(chunks, lambda size: metrics.response_bytes.observe(size, encoding or "identity"))
+    response = Response( WsgiIterable(chunks), mimetype="text/plain", headers=headers)
+    response.call_on_close(reader.close)
+    return response
+
+
+@bp.route('/batch', methods=('POST',))
+def batch():
+    services = current_app.extensions["retcal"]
+    max_batch = current_app.config["MAX_BATCH"]
+
+    # {"configs": [{"name": ..., <form fields>}, ...]}, fields missing from a
+    # config take the values of the default form
+    body = request.get_json(silent=True)
+    configs = body.get("configs") if isinstance(body, dict) else None
+    if not isinstance(configs, list) or not configs:
+        abort(400)
+    if len(configs) > max_batch:
+        raise Rejected(413, f"A batch can have at most {max_batch} configs")
+    items = []
+    for index, form in enumerate(configs):
+        if not isinstance(form, dict):
+            abort(400)
+        try:
+            config = config_from_form({**DEFAULT_FORM, **form})
+        except (TypeError, ValueError):
+            abort(400)
+        items.append((str(form.get("name", f"calibration-{index + 1}")), config))
+
+    batch = Batch(items, legacy=True)
+    # Every file must be within the limits, but the batch only holds one of
+    # them in memory at a time
+    cost = 0
+    for config in batch.configs.values():
+        size = predict_bound(config, legacy=True)
+        cost = max(cost, held_cost(size, services.cost_model.cost(size), services.cache))
+    ticket = services.admission.admit(cost)
+
+    response = Response(
+        WsgiIterable(batch.stream(services.pool, services.cache)),
+        mimetype="application/zip", headers=BATCH_HEADERS,
+    )
+    response.call_on_close(ticket.release)
+    return response
+
+
+@bp.route('/jobs', methods=('POST',))
+def create_job():
+    services = current_app.extensions["retcal"]
+    try:
+        config = config_from_form(request.values)
+    except ValueError:
+        abort(400)
+
+    # Only the cheap bound here, the job works out the exact size
+    services.job_cost_model.cost(predict_bound(config, legacy=True))
+    job_id = services.jobs.submit(config, legacy=True)
+    status = url_for(".job_status", job_id=job_id)
+    return jsonify(id=job_id, status=status), 202, {"Location": status}
+
+
+@bp.route('/jobs/<job_id>')
+def job_status(job_id):
+    status = current_app.extensions["retcal"].jobs.store.read(job_id)
+    if status is None:
+        abort(404)
+    if status["state"] == DONE:
+        status["result"] = url_for(".job_result", job_id=job_id)
+    return jsonify(status)
+
+
+@bp.route('/jobs/<job_id>/result')
+def job_result(job_id):
+    store = current_app.extensions["retcal"].jobs.store
+    status = store.read(job_id)
+    if status is None:
+        abort(404)
+    if status["state"] != DONE:
+        return jsonify(status), 409
+    try:
+        return send_file(
+            store.result_path(job_id), mimetype="text/plain", as_attachment=True,
+            download_name="calibration.gcode", conditional=True,
+        )
+    except FileNotFoundError:
+        # Expired since its status was read
+        abort(404)
@@ -0,0 +1,213 @@
+"""Background generation jobs for files too large to stream in one request.
+
+Jobs run in a process pool and live in a directory shared by every worker
+process using it: each job has a JSON status file, rewritten by the process
+generating it as the tower grows, and its file once finished. Jobs are
+removed once they have not been updated for the retention period: reading
+an expired job removes it, and reads sweep the directory every so often.
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from typing import Optional
+
+from retcal import FrozenGcodeConfig
+from retcal.calibration_tower import tower_layers
+from retcal.generate_ret_cal import write_gcode
+from retcal.predict import predict_size
+from retcal.sinks import FileSink
+
+from admission import Rejected
+from pool import LazyPool
+
+# Default retention of finished jobs
+DEFAULT_RETENTION = 60 * 60
+
+# Least time between two progress updates of a job, in seconds
+PROGRESS_INTERVAL = 0.5
+
+# Least time between two sweeps of the expired jobs on reads, in seconds
+SWEEP_INTERVAL = 60
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_JOB_ID = re.compile(r"[0-9a-f]{32}\Z")
+
+
+class JobStore:
+    """Status and files of the jobs in a directory."""
+
+    def __init__(self, directory: str, retention: float = DEFAULT_RETENTION):
+        self.directory = directory
+        self.retention = retention
+        self._next_sweep = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def status_path(self, job_id: str) -> str:
+        return os.path.join(self.directory, job_id + ".json")
+
+    def result_path(self, job_id: str) -> str:
+        return os.path.join(self.directory, job_id + ".gcode")
+
+    def create(self, config: FrozenGcodeConfig) -> str:
+        """Record a new queued job, returning its id."""
+        job_id = uuid.uuid4().hex
+        self.write(job_id, {
+            "id": job_id,
+            "state": QUEUED,
+            "layers_done": 0,
+            "layers_total": tower_layers(config),
+            "created": time.time(),
+        })
+        return job_id
+
+    def read(self, job_id: str) -> Optional[dict]:
+        """Status of a job, or None if it does not exist or has expired."""
+        if not _JOB_ID.match(job_id):
+            return None
+        self._sweep()
+        try:
+            with open(self.status_path(job_id), encoding="utf-8") as file:
+                if os.fstat(file.fileno()).st_mtime >= time.time() - self.retention:
+                    return json.load(file)
+        except FileNotFoundError:
+            return None
+        self.remove(job_id)
+        return None
+
+    def write(self, job_id: str, status: dict):
+        # Replace the status file whole so readers never see a partial one
+        _write_atomic(self.directory, self.status_path(job_id), json.dumps(status).encode("utf-8"))
+
+    def remove(self, job_id: str):
+        """Remove the status and the file of a job."""
+        _unlink(self.result_path(job_id))
+        _unlink(self.status_path(job_id))
+
+    def expire(self):
+        """Remove the jobs not updated for the retention period."""
+        cutoff = time.time() - self.retention
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def _sweep(self):
+        # Expire the other jobs too, without scanning on every read
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._next_sweep = now + SWEEP_INTERVAL
+            self.expire()
+
+
+class ProgressWriter:
+    """Progress callback updating the status of a job, at most every
+    ``PROGRESS_INTERVAL`` seconds."""
+
+    def __init__(self, store: JobStore, status: dict):
+        self.store = store
+        self.status = status
+        self._last = 0.0
+
+    def __call__(self, done: int, total: int):
+        now = time.monotonic()
+        if done < total and now - self._last < PROGRESS_INTERVAL:
+            return
+        self._last = now
+        self.status.update(layers_done=done, layers_total=total)
+        self.store.write(self.status["id"], self.status)
+
+
+def run_job(directory: str, retention: float, job_id: str, config: FrozenGcodeConfig, legacy: bool):
+    """Generate the file of a job. Runs in a pool process.
+
+    The exact size of the file is worked out here rather than in the
+    request, as it takes time in proportion to the tests.
+    """
+    store = JobStore(directory, retention)
+    status = store.read(job_id)
+    if status is None:
+        # Expired before it started
+        return
+    status.update(state=RUNNING, bytes_total=predict_size(config, legacy).bytes)
+    store.write(job_id, status)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        with FileSink(temp_path) as sink:
+            size = write_gcode(config, sink, legacy=legacy, progress=ProgressWriter(store, status))
+        os.replace(temp_path, store.result_path(job_id))
+    except Exception as error:
+        _unlink(temp_path)
+        status.update(state=FAILED, error=str(error))
+    else:
+        status.update(state=DONE, bytes=size)
+    status["finished"] = time.time()
+    store.write(job_id, status)
+
+
+class JobRunner:
+    """Submits jobs to a process pool, bounding the jobs pending per process."""
+
+    def __init__(self, store: JobStore, pool: LazyPool, max_pending: int = 16):
+        self.store = store
+        self.pool = pool
+        self.max_pending = max_pending
+        self.pending = 0
+        self._lock = threading.Lock()
+
+    def submit(self, config: FrozenGcodeConfig, legacy: bool) -> str:
+        """Queue the generation of a config, returning the job id.
+
+        Raises :class:`~admission.Rejected` with a 429 status if too many jobs
+        are pending.
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise Rejected(429, "Too many jobs are pending, try again later", 60)
+            self.pending += 1
+
+        self.store.expire()
+        try:
+            job_id = self.store.create(config)
+            future = self.pool.submit(
+                run_job, self.store.directory, self.store.retention, job_id, config, legacy
+            )
+        except BaseException:
+            self._done(None)
+            raise
+        future.add_done_callback(self._done)
+        return job_id
+
+    def _done(self, _future):
+        with self._lock:
+            self.pending -= 1
+
+
+def _write_atomic(directory: str, path: str, data: bytes):
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        _unlink(temp_path)
+        raise
+
+
+def _unlink(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,229 @@
+"""Metrics of the web service in the Prometheus text format.
+
+Counters and histograms are updated by the requests; values that are already
+kept elsewhere (cache counters, queue depth) are read from callbacks when the
+metrics are scraped, so they cost nothing per request. Metrics are per
+process: each worker reports its own.
+"""
+import bisect
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets, in seconds and bytes
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = tuple(1024 * 4 ** n for n in range(10))
+
+
+def _labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples()
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        ...
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values = {}
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_labels(self.labels, labels)} {_number(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float], labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+        # Per label values: count of each bucket (not cumulative), then sum
+        self._values = {}
+
+    def observe(self, value: float, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = [(labels, list(counts)) for labels, counts in self._values.items()]
+        names = self.labels + ("le",)
+        for labels, counts in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels(names, labels + (_number(bound),))} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {_number(counts[-1])}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {cumulative}"
+
+
+class Gauge(Metric):
+    """Value read from a callback when the metrics are scraped.
+
+    The callback returns the value, or a dict of label values to values.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, read: Callable, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self.read = read
+
+    def samples(self) -> Iterable[str]:
+        values = self.read()
+        if not isinstance(values, dict):
+            values = {(): values}
+        for labels, value in values.items():
+            yield f"{self.name}{_labels(self.labels, labels)} {_number(value)}"
+
+
+class CounterFunc(Gauge):
+    """Counter read from a callback when the metrics are scraped."""
+
+    kind = "counter"
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def add(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = [line for metric in self.metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+def counted(chunks: Iterable[bytes], done: Callable[[int], None]) -> Iterable[bytes]:
+    """Pass chunks through, then call ``done`` with their total size."""
+    size = 0
+    try:
+        for chunk in chunks:
+            size += len(chunk)
+            yield chunk
+    finally:
+        done(size)
+
+
+class ServiceMetrics:
+    """Metrics of the web app, reading the state of its services.
+
+    Stage timings need a :class:`~retcal.stats.GenerationStats`, which slows
+    a generation down, so only one generation in ``sample_every`` is timed by
+    stage (none with 0).
+    """
+
+    def __init__(self, services, layer_caches: dict, sample_every: int = 100):
+        self.sample_every = sample_every
+        self._generations = itertools.count()
+        registry = self.registry = Registry()
+
+        self.requests = registry.add(Counter(
+            "retcal_requests_total", "Requests by endpoint and status.", ("endpoint", "status")))
+        self.request_seconds = registry.add(Histogram(
+            "retcal_request_seconds", "Time to the start of the response by endpoint.",
+            TIME_BUCKETS, ("endpoint",)))
+        self.response_bytes = registry.add(Histogram(
+            "retcal_response_bytes", "Size of the gcode files sent by content encoding.",
+            SIZE_BUCKETS, ("encoding",)))
+        self.rejected = registry.add(Counter(
+            "retcal_rejected_total", "Requests refused by admission control by status.", ("status",)))
+
+        self.generation_seconds = registry.add(Histogram(
+            "retcal_generation_seconds", "Time from admission to the end of a generation.",
+            TIME_BUCKETS))
+        self.stage_seconds = registry.add(Histogram(
+            "retcal_generation_stage_seconds", "Time spent in each stage of sampled generations.",
+            TIME_BUCKETS, ("stage",)))
+        self.generated_bytes = registry.add(Counter(
+            "retcal_generated_bytes_total", "Bytes of gcode generated."))
+
+        cache = services.cache
+        registry.add(CounterFunc(
+            "retcal_cache_hits_total", "Files served from the file cache.", lambda: cache.hits))
+        registry.add(CounterFunc(
+            "retcal_cache_misses_total", "File cache lookups that missed.", lambda: cache.misses))
+        registry.add(Gauge(
+            "retcal_cache_bytes", "Stored size of the file cache in memory.", lambda: cache.size))
+        registry.add(CounterFunc(
+            "retcal_layer_cache_hits_total", "Tower layers served from the layer caches.",
+            lambda: {(name,): cached.cache_info().hits for name, cached in layer_caches.items()},
+            ("cache",)))
+        registry.add(CounterFunc(
+            "retcal_layer_cache_misses_total", "Tower layers generated by the layer caches.",
+            lambda: {(name,): cached.cache_info().misses for name, cached in layer_caches.items()},
+            ("cache",)))
+
+        admission = services.admission
+        registry.add(Gauge(
+            "retcal_queue_waiting", "Requests waiting for admission.", lambda: admission.waiting))
+        registry.add(Gauge(
+            "retcal_queue_in_flight_cost", "Cost of the admitted generations.",
+            lambda: admission.in_flight))
+        registry.add(Gauge(
+            "retcal_generations_in_progress", "Generations being streamed, coalesced by config.",
+            lambda: len(services.flights)))
+        registry.add(Gauge(
+            "retcal_jobs_pending", "Background jobs queued or running.",
+            lambda: services.jobs.pending))
+
+    def sample(self) -> bool:
+        """Whether to time the next generation by stage."""
+        if not self.sample_every:
+            return False
+        return next(self._generations) % self.sample_every == 0
+
+    def observe_stats(self, stats):
+        for name, stage in stats.stages.items():
+            self.stage_seconds.observe(stage.seconds, name)
+
+    def render(self) -> str:
+        return self.registry.render()
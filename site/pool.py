@@ -0,0 +1,31 @@
+"""Process pool shared by the background jobs and batches of a worker."""
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+DEFAULT_WORKERS = 2
+
+
+class LazyPool:
+    """Process pool started by its first task.
+
+    The pool is created in the worker process that uses it rather than
+    inherited from a preloading master.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers = workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers)
+            pool = self._pool
+        return pool.submit(fn, *args)
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
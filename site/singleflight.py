@@ -0,0 +1,266 @@
+"""Coalescing of identical concurrent generations.
+
+The first request for a key starts the generation; requests for the same key
+that arrive while it is running attach to it and stream the same chunks from
+a shared buffer. Whichever reader needs the next chunk first pulls it from
+the generator, so a slow or departed client does not hold the others up.
+The generation is abandoned once every reader has left.
+
+The buffer only keeps the last few chunks, so memory per generation stays
+bounded whatever the size of the file. Requests only join a generation that
+has not dropped its first chunk yet, later ones start their own. A reader
+that falls behind the buffer moves to a new generation of the same key and
+skips the bytes it has already sent, the output being the same every time.
+That generation is started by a separate function, as the reader has already
+begun its response and must not fail where a new request could.
+"""
+import threading
+from collections import deque
+from typing import Callable, Iterator, Optional
+
+# Chunks kept for the readers behind the fastest one
+DEFAULT_BACKLOG = 16
+
+# Returned by the function starting a generation: the chunks, and a function
+# called once the generation has ended, finished or not
+Generation = tuple[Iterator[bytes], Optional[Callable[[], None]]]
+
+
+class FellBehind(Exception):
+    """The chunk a reader needs has been dropped from the backlog."""
+
+
+class Flight:
+    """A generation in progress and its last ``backlog`` chunks."""
+
+    def __init__(self, on_end: Callable[[], None], backlog: int = DEFAULT_BACKLOG):
+        self.chunks = deque(maxlen=backlog)
+        # Index of the first chunk in the backlog, and of the next one
+        self.first = 0
+        self.produced = 0
+        self.readers = 0
+        self._on_end = [on_end]
+        self._source = None
+        self._started = False
+        self._producing = False
+        self._done = False
+        self._error = None
+        self._condition = threading.Condition()
+
+    def start(self, generation: Generation):
+        chunks, on_end = generation
+        with self._condition:
+            self._source = chunks
+            if on_end is not None:
+                self._on_end.append(on_end)
+            self._started = True
+            self._condition.notify_all()
+
+    def fail(self, error: BaseException):
+        """Fail a flight that could not be started."""
+        with self._condition:
+            self._error = error
+            self._started = True
+            self._done = True
+            self._condition.notify_all()
+        self._end()
+
+    def join(self) -> bool:
+        """Add a reader, unless the flight has failed or been abandoned, or
+        has dropped its first chunk."""
+        with self._condition:
+            if self._done and self._error is not None or self.first > 0:
+                return False
+            self.readers += 1
+            return True
+
+    def wait_started(self):
+        """Wait for the leader to start the generation, raising its error."""
+        with self._condition:
+            while not self._started:
+                self._condition.wait()
+            if self._source is None:
+                raise self._error
+
+    def chunk(self, index: int) -> Optional[bytes]:
+        """Get a chunk, producing it if no other reader is. None at the end.
+
+        Raises :class:`FellBehind` if the chunk has been dropped.
+        """
+        while True:
+            with self._condition:
+                while index >= self.produced and self._producing and not self._done:
+                    self._condition.wait()
+                if index < self.first:
+                    raise FellBehind(index)
+                if index < self.produced:
+                    return self.chunks[index - self.first]
+                if self._done:
+                    if self._error is not None:
+                        raise self._error
+                    return None
+                self._producing = True
+
+            chunk = self._produce()
+            if chunk is not None:
+                return chunk
+
+    def _produce(self) -> Optional[bytes]:
+        # Runs without the lock, other readers wait for the chunk
+        try:
+            chunk = next(self._source)
+        except StopIteration:
+            self._finish(None)
+            return None
+        except BaseException as error:
+            self._finish(error)
+            raise
+        with self._condition:
+            self.chunks.append(chunk)
+            self.produced += 1
+            self.first = self.produced - len(self.chunks)
+            self._producing = False
+            self._condition.notify_all()
+        return chunk
+
+    def _finish(self, error: Optional[BaseException]):
+        with self._condition:
+            self._error = error
+            self._done = True
+            self._producing = False
+            self._condition.notify_all()
+        self._end()
+
+    def leave(self):
+        """Remove a reader, abandoning the generation if it was the last."""
+        with self._condition:
+            self.readers -= 1
+            abandoned = self.readers == 0 and not self._done
+            if abandoned:
+                self._error = RuntimeError("Generation abandoned")
+                self._done = True
+        if abandoned:
+            close = getattr(self._source, "close", None)
+            if close is not None:
+                close()
+            self._end()
+
+    def _end(self):
+        for on_end in self._on_end:
+            on_end()
+        self._on_end = []
+
+
+class Reader:
+    """Iterator over the chunks of a flight, from the first one.
+
+    ``rejoin`` returns another joined flight of the same key, used when the
+    reader falls behind the backlog of its flight.
+    """
+
+    def __init__(self, flight: Flight, rejoin: Callable[[], Flight]):
+        self._flight = flight
+        self._rejoin = rejoin
+        self._index = 0
+        # Bytes sent so far, and still to skip in a rejoined flight
+        self._offset = 0
+        self._skip = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        while self._flight is not None:
+            try:
+                chunk = self._flight.chunk(self._index)
+            except FellBehind:
+                self._catch_up()
+                continue
+            except BaseException:
+                self.close()
+                raise
+            if chunk is None:
+                self.close()
+                break
+            self._index += 1
+            if self._skip:
+                skipped = min(self._skip, len(chunk))
+                self._skip -= skipped
+                chunk = chunk[skipped:]
+                if not chunk:
+                    continue
+            self._offset += len(chunk)
+            return chunk
+        raise StopIteration
+
+    def _catch_up(self):
+        self.close()
+        self._flight = self._rejoin()
+        self._index = 0
+        self._skip = self._offset
+
+    def close(self):
+        if self._flight is not None:
+            self._flight.leave()
+            self._flight = None
+
+
+class SingleFlight:
+    """Registry of the generations in progress, by key."""
+
+    def __init__(self, backlog: int = DEFAULT_BACKLOG):
+        self.backlog = backlog
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def run(
+        self,
+        key: str,
+        generate: Callable[[], Generation],
+        resume: Optional[Callable[[], Generation]] = None,
+    ) -> "Reader":
+        """Stream the generation of a key, starting it if none is running.
+
+        ``generate`` is only called by the first request for the key. Errors
+        it raises are raised by every request waiting for it to start, before
+        any of them has begun streaming. ``resume``, ``generate`` by default,
+        starts the generation for a reader that fell behind when no other
+        one is running. The returned reader must be closed.
+        """
+        flight = self._join(key, generate)
+        return Reader(flight, lambda: self._join(key, resume or generate))
+
+    def _join(self, key: str, generate: Callable[[], Generation]) -> Flight:
+        """Join the flight of a key, or start one, and wait for its start."""
+        with self._lock:
+            # Joining under the registry lock keeps the flight from being
+            # abandoned before this reader is counted
+            flight = self._flights.get(key)
+            leader = flight is None or not flight.join()
+            if leader:
+                flight = Flight(lambda: self._remove(key, flight), self.backlog)
+                flight.join()
+                self._flights[key] = flight
+
+        try:
+            if leader:
+                try:
+                    generation = generate()
+                except BaseException as error:
+                    flight.fail(error)
+                    raise
+                flight.start(generation)
+            else:
+                flight.wait_started()
+        except BaseException:
+            flight.leave()
+            raise
+        return flight
+
+    def _remove(self, key: str, flight: Flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
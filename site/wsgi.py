@@ -0,0 +1,11 @@
+"""Production entry point of the web app.
+
+Loaded once by the gunicorn master (``preload_app``), so the caches warmed
+here are shared copy-on-write by every forked worker::
+
+    gunicorn -c gunicorn.conf.py
+"""
+from index import create_app, warm_up
+
+app = create_app()
+warm_up(app)
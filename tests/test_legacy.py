@@ -0,0 +1,54 @@
+"""Legacy output is byte-identical to the old web generator."""
+import random
+
+import pytest
+
+from benchmarks.bench_legacy import VARIANTS
+from benchmarks.legacy_web import legacy_web_gcode
+from index import DEFAULT_FORM, config_from_form
+from retcal.generate_ret_cal import iter_retraction_calibration_bytes
+
+# Form values that change the rounding or the width of the numbers
+CHOICES = {
+    "dimensionX": ["220", "235.5", "180", "301"],
+    "dimensionY": ["220", "301", "199.9"],
+    "nozzleDiameter": ["0.4", "0.25", "0.6", "0.8"],
+    "layerHeight": ["0.2", "0.28", "0.12", "0.3"],
+    "startRetractiondistance": ["0.5", "0.15", "0.3", "2"],
+    "incrementRetractiondistance": ["0.5", "0.35", "-0.05", "0.123"],
+    "filamentDiameter": ["1.75", "2.85"],
+    "extrusionMultiplier": ["1.0", "0.93", "1.07"],
+    "startRetractionspeed": ["10", "12.345", "45"],
+    "incrementRetractionspeed": ["10", "0.005", "2.5", "0"],
+    "travelSpeed": ["100", "120.5", "150"],
+    "printSpeed": ["40", "42.7", "60"],
+    "tempStarthotend": ["210", "195.5", "240"],
+    "tempIncrementhotend": ["0", "-2.5", "5"],
+    "numTests": ["1", "3", "15"],
+    "layersTest": ["1", "5", "25"],
+    "bedTemp": ["50", "0", "65.5"],
+    "fanSpeed": ["40", "33.3", "100"],
+    "fanSpeedIncrement": ["0", "4.7", "-5"],
+    # Browsers send textarea lines separated by CRLF
+    "customGcode": [";G29", "", "G28\r\nG29\r\nM420 S1\r\n", "G29\rM420 S1", "G29\nM420 S1"],
+}
+
+FORMS = 40
+
+
+def random_forms(seed: int, count: int) -> list:
+    rng = random.Random(seed)
+    return [
+        {**DEFAULT_FORM, **{name: rng.choice(values) for name, values in CHOICES.items()}}
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "form",
+    [{**DEFAULT_FORM, **variant} for variant in VARIANTS] + random_forms(0, FORMS),
+)
+def test_legacy_output_matches_the_web_generator(form):
+    old = legacy_web_gcode(form).encode("utf-8")
+    new = b"".join(iter_retraction_calibration_bytes(config_from_form(form), legacy=True))
+    assert new == old
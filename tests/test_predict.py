@@ -0,0 +1,60 @@
+"""The predicted sizes match the generated gcode."""
+import random
+
+import pytest
+
+from retcal import DEFAULTS, GcodeConfig
+from retcal.generate_ret_cal import iter_retraction_calibration_bytes
+from retcal.predict import predict_bound, predict_lines, predict_size
+
+# Values that change the width or rounding of the formatted numbers
+CHOICES = {
+    "retraction_dist_init": [0.5, 0.15, 0.3, 1.0, 0.05, 2.0],
+    "retraction_dist_delta": [0.5, 0.35, -0.05, 0.1, 0.0, 0.123],
+    "retraction_speed_init": [10.0, 12.345, 5.0, 99.5, 1.0],
+    "retraction_speed_delta": [10.0, 0.005, 2.5, 30.0, 0.0, 7.77],
+    "hotend_temp_init": [210.0, 195.5, 250.0],
+    "hotend_temp_change": [0.0, -2.5, 5.0, -10.0],
+    "fan_speed_init": [40, 0, 100, 33.3],
+    "fan_speed_delta": [0, 5, 4.7, -3],
+    "layer_height": [0.2, 0.28, 0.1, 0.12],
+    "layers_per_test": [0, 1, 2, 5, 7, 25],
+    "num_tests": [0, 1, 2, 3, 15],
+    "print_speed": [2400, 2400.0, 2562.0000000000005, 600],
+    "travel_speed": [6000, 7200, 300],
+    "custom_gcode": [";G29", "G29\nM420 S1", "", "M117 héllo\r\nG29\n"],
+}
+
+CONFIGS = 200
+
+
+def random_configs(seed: int, count: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        values = dict(DEFAULTS)
+        values.update((name, rng.choice(choices)) for name, choices in CHOICES.items())
+        yield GcodeConfig(**values)
+
+
+@pytest.mark.parametrize("legacy", [False, True], ids=["current", "legacy"])
+def test_prediction_matches_output(legacy):
+    for config in random_configs(1, CONFIGS):
+        data = b"".join(iter_retraction_calibration_bytes(config, legacy=legacy))
+        lines = data.count(b"\n")
+        assert predict_size(config, legacy) == (lines, len(data)), config
+        assert predict_lines(config, legacy) == lines, config
+
+
+@pytest.mark.parametrize("legacy", [False, True], ids=["current", "legacy"])
+def test_bound_is_above_the_size(legacy):
+    for config in random_configs(2, CONFIGS):
+        size = predict_size(config, legacy)
+        bound = predict_bound(config, legacy)
+        assert bound.lines == size.lines, config
+        assert size.bytes <= bound.bytes <= size.bytes * 1.05 + 100, config
+
+
+def test_bound_does_not_grow_with_the_tests():
+    # Far too many tests to size exactly, or to build the schedule of
+    config = GcodeConfig(**dict(DEFAULTS, num_tests=10**9, layers_per_test=1))
+    assert predict_bound(config, legacy=True).lines == predict_lines(config, legacy=True)
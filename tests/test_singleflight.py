@@ -0,0 +1,85 @@
+"""Identical generations are shared, and readers survive falling behind."""
+from singleflight import SingleFlight
+
+CHUNKS = [bytes([i]) * 10 for i in range(8)]
+EXPECTED = b"".join(CHUNKS)
+
+
+class Source:
+    """Starts generations of CHUNKS, counting them and their ends."""
+
+    def __init__(self):
+        self.started = 0
+        self.ended = 0
+        self.closed = 0
+
+    def generate(self):
+        self.started += 1
+        return self._chunks(), self._end
+
+    def _chunks(self):
+        try:
+            yield from CHUNKS
+        except GeneratorExit:
+            self.closed += 1
+            raise
+
+    def _end(self):
+        self.ended += 1
+
+
+def test_identical_requests_share_a_generation():
+    flights = SingleFlight(backlog=len(CHUNKS))
+    source = Source()
+    first = flights.run("key", source.generate)
+    second = flights.run("key", source.generate)
+
+    # Interleaved, so each reader gets some chunks produced by the other
+    data = [b"", b""]
+    for _ in range(len(CHUNKS) + 1):
+        for i, reader in enumerate((first, second)):
+            data[i] += next(reader, b"")
+
+    assert data == [EXPECTED, EXPECTED]
+    assert (source.started, source.ended) == (1, 1)
+    assert len(flights) == 0
+
+
+def test_reader_behind_the_backlog_resumes():
+    flights = SingleFlight(backlog=2)
+    source = Source()
+    resumed = []
+
+    def resume():
+        # As from the cache: the whole file in one chunk
+        resumed.append(True)
+        return iter([EXPECTED]), None
+
+    fast = flights.run("key", source.generate, resume)
+    slow = flights.run("key", source.generate, resume)
+    head = next(slow)
+    assert b"".join(fast) == EXPECTED
+
+    assert head + b"".join(slow) == EXPECTED
+    assert source.started == 1
+    assert resumed == [True]
+    assert len(flights) == 0
+
+
+def test_generation_is_abandoned_by_its_last_reader():
+    flights = SingleFlight()
+    source = Source()
+    readers = [flights.run("key", source.generate) for _ in range(2)]
+    for reader in readers:
+        next(reader)
+
+    readers[0].close()
+    assert (source.closed, source.ended) == (0, 0)
+    readers[1].close()
+    assert (source.closed, source.ended) == (1, 1)
+    assert len(flights) == 0
+
+    # The next request starts over
+    reader = flights.run("key", source.generate)
+    assert b"".join(reader) == EXPECTED
+    assert source.started == 2
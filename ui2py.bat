@@ -1,5 +1,3 @@
 pyuic5 -x ".\RetCalui.ui" -o ".\RetCalui.py"
 
-pyrcc5 -o RetCalResource_rc.py RetCalResource.qrc
-
 pause